@@ -96,19 +96,28 @@ Item {
         }
 
         onClicked: {
+            // Wynik logowania przychodzi sygnałem loginSuccess / loginFailure (logowanie w wątku roboczym)
             let result = backendBridge.login(usernameField.text, passwordField.text);
-            if (result.startsWith("success")) {
-                console.log("Logowanie zakonczone sukcesem:", result);
-                errorMessage.visible = false;
-                errorMessage.text = "";
-            } else {
+            if (result.startsWith("error")) {
                 console.error("Blad logowania:", result);
                 errorMessage.visible = true;
                 errorMessage.text = result.substring(6); // Usuń "error:" z wyniku
+            } else {
+                errorMessage.visible = false;
+                errorMessage.text = "";
             }
         }
     }
 
+    Connections {
+        target: backendBridge
+        function onLoginFailure(message) {
+            console.error("Blad logowania:", message);
+            errorMessage.visible = true;
+            errorMessage.text = message;
+        }
+    }
+
     Button {
         id: exitButton
         text: qsTr("Wyjdź z aplikacji")
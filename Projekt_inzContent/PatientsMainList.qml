@@ -650,7 +650,8 @@ Rectangle {
                 ListView {
                     id: patientsListView
                     anchors.fill: parent
-                    model: patientsModel
+                    // Model po stronie Pythona - zmiany pojedynczych wierszy zamiast przebudowy listy
+                    model: backendBridge.patientsModel
 
                     delegate: Item {
                         width: patientsListView.width
@@ -781,30 +782,6 @@ Rectangle {
                     }
                 }
             }
-
-            ListModel {
-                id: patientsModel
-            }
-
-            Connections {
-                target: backendBridge
-                function onPatientsListChanged(patients) {
-                    patientsModel.clear();
-                    for (let i = 0; i < patients.length; i++) {
-                        let patient = patients[i];
-                        for (let key in patient) {
-                            if (patient[key] === undefined || patient[key] === null) {
-                                patient[key] = "Brak danych";
-                            }
-                        }
-                        // Upewnij się, że pole is_active jest dodane do modelu
-                        if (!('is_active' in patient)) {
-                            patient['is_active'] = "Brak danych";
-                        }
-                        patientsModel.append(patient);
-                    }
-                }
-            }
         }
     }
 
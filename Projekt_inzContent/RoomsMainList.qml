@@ -666,7 +666,8 @@ Rectangle {
                 ListView {
                     id: roomsListView
                     anchors.fill: parent
-                    model: roomsModel
+                    // Model po stronie Pythona - zmiany pojedynczych wierszy zamiast przebudowy listy
+                    model: bridgeRoom.roomsModel
 
                     delegate: Item {
                         width: roomsListView.width
@@ -734,27 +735,6 @@ Rectangle {
                     }
                 }
             }
-
-            ListModel {
-                id: roomsModel
-            }
-
-            // Obsługa sygnału zmiany listy pokoi
-            Connections {
-                target: bridgeRoom
-                function onRoomListChanged(rooms) {
-                    roomsModel.clear();
-                    for (let i = 0; i < rooms.length; i++) {
-                        let room = rooms[i];
-                        for (let key in room) {
-                            if (room[key] === undefined || room[key] === null) {
-                                room[key] = "Brak danych";
-                            }
-                        }
-                        roomsModel.append(room);
-                    }
-                }
-            }
         }
     }
 
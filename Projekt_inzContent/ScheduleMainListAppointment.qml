@@ -638,7 +638,8 @@ Rectangle {
                 ListView {
                     id: appointmentsListView
                     anchors.fill: parent
-                    model: appointmentsModel
+                    // Model po stronie Pythona - zmiany pojedynczych wierszy zamiast przebudowy listy
+                    model: bridgeRoom.appointmentsModel
 
                     delegate: Item {
                         width: appointmentsListView.width
@@ -772,26 +773,6 @@ Rectangle {
                     }
                 }
             }
-
-            ListModel {
-                id: appointmentsModel
-            }
-
-            Connections {
-                target: bridgeRoom
-                function onAppointmentsListChanged(appointments) {
-                    appointmentsModel.clear();
-                    for (let i = 0; i < appointments.length; i++) {
-                        let appointment = appointments[i];
-                        for (let key in appointment) {
-                            if (appointment[key] === undefined || appointment[key] === null) {
-                                appointment[key] = "Brak danych";
-                            }
-                        }
-                        appointmentsModel.append(appointment);
-                    }
-                }
-            }
         }
     }
 
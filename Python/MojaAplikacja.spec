@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('app.qml', '.')],
-    hiddenimports=[],
+    hiddenimports=['services.admin_service', 'services.dashboard_service', 'services.employee_service', 'services.patients_service', 'services.room_service', 'services.search_service', 'services.validation_service'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -5,6 +5,72 @@
 
 import os
 
+# Profile połączeń SQLite (parametry PRAGMA ustawiane przez ConnectionManager)
+# journal_mode   - WAL: czytelnicy i zapisujący nie blokują się nawzajem
+# synchronous    - NORMAL: w trybie WAL bezpieczne i znacznie szybsze od FULL
+# cache_size     - wartość ujemna = rozmiar w KiB (-20000 ~ 20 MB na połączenie)
+# mmap_size      - rozmiar mapowania pliku bazy w pamięci (bajty), 0 = wyłączone
+# busy_timeout   - czas oczekiwania na zwolnienie blokady (ms)
+# cached_statements - rozmiar pamięci podręcznej instrukcji sqlite3 i skompilowanych filtrów
+# read_pool_size - liczba połączeń tylko do odczytu w puli, 0 = odczyt przez połączenie wątku
+CONNECTION_PROFILES = {
+    "production": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -20000,
+        "mmap_size": 268435456,
+        "busy_timeout": 5000,
+        "temp_store": "MEMORY",
+        "cached_statements": 256,
+        "read_pool_size": 4,
+    },
+    "test": {
+        "journal_mode": "MEMORY",
+        "synchronous": "OFF",
+        "cache_size": -2000,
+        "mmap_size": 0,
+        "busy_timeout": 1000,
+        "temp_store": "MEMORY",
+        "cached_statements": 128,
+        "read_pool_size": 0,
+    },
+}
+
+# Zmienne środowiskowe nadpisujące pojedyncze parametry profilu, np. DB_CACHE_SIZE=-64000
+CONNECTION_PROFILE_OVERRIDES = {
+    "DB_JOURNAL_MODE": ("journal_mode", str),
+    "DB_SYNCHRONOUS": ("synchronous", str),
+    "DB_CACHE_SIZE": ("cache_size", int),
+    "DB_MMAP_SIZE": ("mmap_size", int),
+    "DB_BUSY_TIMEOUT": ("busy_timeout", int),
+    "DB_CACHED_STATEMENTS": ("cached_statements", int),
+    "DB_READ_POOL_SIZE": ("read_pool_size", int),
+}
+
+# Dozwolone wartości parametrów tekstowych (trafiają bezpośrednio do instrukcji PRAGMA)
+CONNECTION_PROFILE_CHOICES = {
+    "journal_mode": ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"),
+    "synchronous": ("OFF", "NORMAL", "FULL", "EXTRA"),
+}
+
+# Tryb profilowania (APP_PROFILE=1): czas instrukcji SQL, przypisanie do metod serwisów i slotów mostków,
+# liczba zapytań na wywołanie slotu; raport JSON/CSV zapisywany przy zamykaniu aplikacji
+# output_dir       - katalog raportów
+# top_n            - liczba najwolniejszych slotów w podsumowaniu
+# summary_interval - co ile sekund (najwcześniej) wypisywać podsumowanie na konsolę, 0 = wyłączone
+PROFILING_DEFAULTS = {
+    "enabled": False,
+    "output_dir": os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiling"),
+    "top_n": 10,
+    "summary_interval": 30.0,
+}
+
+PROFILING_OVERRIDES = {
+    "APP_PROFILE_DIR": ("output_dir", str),
+    "APP_PROFILE_TOP": ("top_n", int),
+    "APP_PROFILE_INTERVAL": ("summary_interval", float),
+}
+
 class Config:
     @staticmethod
     def get_database_path():
@@ -27,7 +93,51 @@ class Config:
         env = os.getenv("APP_ENV", "production")
         db_path = Config.get_database_path()
         print("-------------------------------------------------------------")
-        return f"|ŚRODOWISKO|: {env} |UŻYWANA BAZA DANYCH|: {db_path}"   
-    
+        return f"|ŚRODOWISKO|: {env} |UŻYWANA BAZA DANYCH|: {db_path}"
+
+    @staticmethod
+    def get_connection_profile():
+        """
+        Zwraca profil połączeń SQLite dla aktualnego środowiska.
 
+        Profil można wybrać zmienną `DB_PROFILE` (domyślnie zgodny z `APP_ENV`),
+        a pojedyncze parametry nadpisać zmiennymi z `CONNECTION_PROFILE_OVERRIDES`.
+        """
+        env = os.getenv("APP_ENV", "production")
+        profile_name = os.getenv("DB_PROFILE", env)
+        if profile_name not in CONNECTION_PROFILES:
+            raise ValueError(f"Nieznany profil połączeń bazy danych: {profile_name}")
+
+        profile = dict(CONNECTION_PROFILES[profile_name])
+        for variable, (key, value_type) in CONNECTION_PROFILE_OVERRIDES.items():
+            value = os.getenv(variable)
+            if value is not None:
+                try:
+                    profile[key] = value_type(value)
+                except ValueError as e:
+                    raise ValueError(f"Nieprawidłowa wartość zmiennej {variable}: {value}") from e
+
+        for key, choices in CONNECTION_PROFILE_CHOICES.items():
+            profile[key] = str(profile[key]).upper()
+            if profile[key] not in choices:
+                raise ValueError(f"Nieprawidłowa wartość parametru {key}: {profile[key]}")
+        return profile
 
+    @staticmethod
+    def get_profiling_settings():
+        """
+        Zwraca ustawienia trybu profilowania.
+
+        Profilowanie włącza zmienna `APP_PROFILE` (1 / true / yes / on), a pozostałe parametry
+        można nadpisać zmiennymi z `PROFILING_OVERRIDES`, np. APP_PROFILE_TOP=20.
+        """
+        settings = dict(PROFILING_DEFAULTS)
+        settings["enabled"] = os.getenv("APP_PROFILE", "").strip().lower() in ("1", "true", "yes", "on")
+        for variable, (key, value_type) in PROFILING_OVERRIDES.items():
+            value = os.getenv(variable)
+            if value is not None:
+                try:
+                    settings[key] = value_type(value)
+                except ValueError as e:
+                    raise ValueError(f"Nieprawidłowa wartość zmiennej {variable}: {value}") from e
+        return settings
@@ -184,3 +184,29 @@ class AppointmentsController:
 
         except ValueError as ve:
             raise ValueError(f"Błąd danych wejściowych: {ve}") from ve
+
+
+
+    def add_many(self, appointments: list) -> list:
+        """
+        Dodaje wiele wizyt w jednej transakcji (zob. `Appointments.add_many`).
+
+        :return: Lista wyników wierszy {"index", "success", "error", "id"}.
+        """
+        return self.appointments_model.add_many(appointments)
+
+    def update_many(self, updates: list) -> list:
+        """
+        Aktualizuje wiele wizyt w jednej transakcji (zob. `Appointments.update_many`).
+
+        :return: Lista wyników wierszy {"index", "success", "error", "id"}.
+        """
+        return self.appointments_model.update_many(updates)
+
+    def delete_many(self, appointment_ids: list) -> list:
+        """
+        Usuwa wiele wizyt w jednej transakcji (zob. `Appointments.delete_many`).
+
+        :return: Lista wyników wierszy {"index", "success", "error", "id"}.
+        """
+        return self.appointments_model.delete_many(appointment_ids)
@@ -265,4 +265,36 @@ class AssignedPatientsController:
         except ValueError as e:
             raise e  # Bezpośrednie przekazanie ValueError
         except Exception as e:
-            raise RuntimeError(f"Błąd podczas usuwania rekordu: {e}") from e
\ No newline at end of file
+            raise RuntimeError(f"Błąd podczas usuwania rekordu: {e}") from e
+
+
+
+    def get_employee_ids_by_assignment_ids(self, assignment_ids: list) -> set:
+        """
+        Pobiera ID pracowników przypisań o podanych ID.
+        """
+        return self.assigned_patients_model.get_employee_ids_by_assignment_ids(assignment_ids)
+
+    def add_many(self, records: list) -> list:
+        """
+        Dodaje wiele przypisań pacjentów w jednej transakcji (zob. `AssignedPatients.add_many`).
+
+        :return: Lista wyników wierszy {"index", "success", "error", "id"}.
+        """
+        return self.assigned_patients_model.add_many(records)
+
+    def update_many(self, updates: list) -> list:
+        """
+        Aktualizuje wiele przypisań pacjentów w jednej transakcji (zob. `AssignedPatients.update_many`).
+
+        :return: Lista wyników wierszy {"index", "success", "error", "id"}.
+        """
+        return self.assigned_patients_model.update_many(updates)
+
+    def delete_many(self, assignment_ids: list) -> list:
+        """
+        Usuwa wiele przypisań pacjentów w jednej transakcji (zob. `AssignedPatients.delete_many`).
+
+        :return: Lista wyników wierszy {"index", "success", "error", "id"}.
+        """
+        return self.assigned_patients_model.delete_many(assignment_ids)
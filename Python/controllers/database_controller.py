@@ -1,26 +1,113 @@
 # database_controller.py
 
 import sqlite3
+from contextlib import contextmanager
 from config import Config
+from database.connection_manager import ConnectionManager
+from database.filter_cache import FilterCache
+from database.id_sets import IdSetBinder
+from database.permission_engine import PermissionEngine
+from database.profiler import get_profiler
+from database.reference_cache import ReferenceCache
+from database.room_availability import RoomAvailabilityIndex
+from database.schema_catalog import SchemaCatalog
 
 class DatabaseController:
     def __init__(self):
         self.database_path = Config.get_database_path()
-        self.connection = None
+        self.connection_profile = Config.get_connection_profile()
+        self.schema_catalog = SchemaCatalog(self)
+        self.connection_manager = ConnectionManager(
+            self.database_path, self.connection_profile, self._on_connect, self._on_read_connect
+        )
+        self.filter_cache = FilterCache(self, max_size=self.connection_profile["cached_statements"])
+        self.room_availability = RoomAvailabilityIndex(self)
+        self.reference_cache = ReferenceCache(self)
+        self.id_sets = IdSetBinder(self)
+        self.permission_engine = PermissionEngine(self)
+        self.profiler = get_profiler()  # None, jeśli tryb profilowania jest wyłączony
+        self._connected = False
+
+    @property
+    def connection(self):
+        """
+        Połączenie z bazą danych dla bieżącego wątku (każdy wątek otrzymuje własne połączenie).
+        Zwraca None, jeśli nie wywołano `connect_to_database`.
+        """
+        if not self._connected:
+            return None
+        return self.connection_manager.get_connection()
 
     def connect_to_database(self):
         try:
-            if not self.connection:
-                self.connection = sqlite3.connect(self.database_path)
-                self.connection.row_factory = sqlite3.Row
-
-                # Włączenie obsługi kluczy obcych
-                self.connection.execute("PRAGMA foreign_keys = ON;")
-
-            print(f"Połączono z bazą danych: {self.database_path}")
+            if not self._connected:
+                # Ścieżka bazy mogła zostać zmieniona po utworzeniu kontrolera
+                if self.connection_manager.database_path != self.database_path:
+                    self.connection_manager = ConnectionManager(
+                        self.database_path, self.connection_profile, self._on_connect, self._on_read_connect
+                    )
+                self.connection_manager.get_connection()
+                self._connected = True
+
+            print(f"Połączono z bazą danych: {self.database_path} (journal_mode={self.connection_manager.journal_mode})")
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas łączenia z bazą danych: {e}") from e
 
+    def _on_connect(self, connection):
+        # Instrukcje DDL na dowolnym połączeniu unieważniają katalog schematu
+        connection.set_authorizer(self.schema_catalog.on_authorize)
+        if self.profiler is not None:
+            self.profiler.attach(connection)
+
+    def _on_read_connect(self, connection):
+        if self.profiler is not None:
+            self.profiler.attach(connection)
+
+    def read_connection(self):
+        """
+        Zwraca menedżer kontekstu wypożyczający połączenie tylko do odczytu z puli.
+
+        Przykład:
+            with db_controller.read_connection() as connection:
+                rows = connection.execute("SELECT ...").fetchall()
+        """
+        self.ensure_connection()
+        return self.connection_manager.read_connection()
+
+    @contextmanager
+    def unit_of_work(self):
+        """
+        Wykonuje zapisy bloku `with` w jednej transakcji (połączenie bieżącego wątku).
+
+        `commit()` modeli jest odkładane do końca zewnętrznego bloku, a wyjątek cofa wszystkie
+        zmiany bloku. Bloki można zagnieżdżać - wyjątek w bloku wewnętrznym cofa tylko jego zmiany.
+
+        Przykład:
+            with db_controller.unit_of_work():
+                for appointment_id in appointment_ids:
+                    appointments.update_appointment(appointment_id, appointment_status="Odwołana")
+
+        :raises RuntimeError: Jeśli brak połączenia z bazą danych.
+        """
+        self.ensure_connection()
+        connection = self.connection
+        outermost = not connection.in_unit_of_work
+        if outermost:
+            self.reference_cache.begin_deferred()
+        try:
+            with connection.savepoint():
+                yield connection
+        except BaseException:
+            # Pamięć podręczna mogła zostać wypełniona niezatwierdzonymi danymi
+            if outermost:
+                self.reference_cache.end_deferred(committed=False)
+                self.reference_cache.invalidate()
+                self.room_availability.invalidate()
+            raise
+        if outermost:
+            # Tabele słownikowe wczytane przed zatwierdzeniem (pula odczytu) zawierały dane sprzed zapisu
+            self.reference_cache.end_deferred()
+
 
     def table_exists(self, table_name: str) -> bool:
         """
@@ -39,69 +126,50 @@ class DatabaseController:
         if self.connection is None:
             raise RuntimeError("Brak połączenia z bazą danych.")
 
-    def build_filters(self, filters=None, sort_by=None):
+    def build_filters(self, filters=None, sort_by=None, table_name=None):
         """
         Tworzy zapytanie SQL na podstawie filtrów i sortowania.
 
         metoda może pobierać wszystkie rekordy, jeśli nie przekażesz żadnych filtrów (filters=None) i zostawisz sortowanie 
         również jako None (sort_by=None). Wynika to z tego, że w implementacji funkcji build_filters
 
+        Tekst warunku jest kompilowany raz dla każdego kształtu filtrów (kolumny, operatory, liczba wartości)
+        i sortowania, a następnie pobierany z `filter_cache`.
+
         :param filters: Lista filtrów, np. [{"column": "service_price", "operator": ">", "value": 100}]
         :param sort_by: Lista sortowania, np. [("service_price", "ASC"), ("service_type", "DESC")]
+        :param table_name: Tabela, której kolumny są dozwolone w filtrach i sortowaniu (opcjonalnie).
         :return: Krotka (query_string, values), gdzie query_string to zapytanie SQL, a values to lista parametrów.
         """
-        query_string = "1=1"  # Domyślne zapytanie
-        values = []
-
-        # Obsługa filtrów
-        if filters:
-            conditions = []
-            for filter_item in filters:
-                column = filter_item["column"]
-                operator = filter_item["operator"]
-                value = filter_item.get("value")
-
-                # Obsługa różnych operatorów
-                if operator.upper() == "BETWEEN" and isinstance(value, tuple) and len(value) == 2:
-                    conditions.append(f"{column} BETWEEN ? AND ?")
-                    values.extend(value)
-                elif operator.upper() in ["=", ">", "<", ">=", "<="]:
-                    conditions.append(f"{column} {operator} ?")
-                    values.append(value)
-                elif operator.upper() == "LIKE":
-                    # Dodajemy dokładniejsze dopasowanie wzorca
-                    if not value.startswith("%") and not value.endswith("%"):
-                        value = f"%{value}%"
-                    conditions.append(f"{column} LIKE ?")
-                    values.append(value)
-                elif operator.upper() == "IN" and isinstance(value, (list, tuple)):
-                    placeholders = ", ".join("?" for _ in value)
-                    conditions.append(f"{column} IN ({placeholders})")
-                    values.extend(value)
-                elif operator.upper() == "IS NULL":
-                    conditions.append(f"{column} IS NULL")
-                elif operator.upper() == "IS NOT NULL":
-                    conditions.append(f"{column} IS NOT NULL")
-                else:
-                    raise ValueError(f"Nieobsługiwany operator: {operator}")
-
-            query_string += " AND " + " AND ".join(conditions)
-
-        # Obsługa sortowania
-        if sort_by:
-            sort_clauses = []
-            for column, direction in sort_by:
-                if direction.upper() not in ["ASC", "DESC"]:
-                    raise ValueError(f"Nieobsługiwany kierunek sortowania: {direction}")
-                sort_clauses.append(f"{column} {direction.upper()}")
-            query_string += " ORDER BY " + ", ".join(sort_clauses)
-
-        return query_string, values
+        compiled = self.filter_cache.get(filters, sort_by, table_name)
+        return compiled.sql, compiled.bind(filters)
+
+    def select_filtered(self, table_name, filters=None, sort_by=None):
+        """
+        Pobiera rekordy z tabeli z opcjonalnymi filtrami i sortowaniem (`build_filters`).
+
+        Dla tego samego kształtu filtrów tekst zapytania jest zawsze identyczny,
+        więc sqlite3 używa ponownie przygotowanej instrukcji.
+
+        :return: Lista rekordów jako słowniki.
+        :raises ValueError: Przy nieprawidłowej kolumnie, operatorze lub kierunku sortowania.
+        :raises sqlite3.Error: W przypadku błędu bazy danych.
+        """
+        self.ensure_connection()
+        query_conditions, values = self.build_filters(filters, sort_by, table_name)
+        cursor = self.connection.execute(f"SELECT * FROM {table_name} WHERE {query_conditions}", values)
+        return [dict(row) for row in cursor.fetchall()]
 
     def close_connection(self):
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        """
+        Zamyka wszystkie połączenia kontrolera (połączenia wątków i pulę tylko do odczytu).
+        """
+        if self._connected:
+            self.connection_manager.close_all()
+            self.schema_catalog.invalidate()
+            self.room_availability.invalidate()
+            self.reference_cache.invalidate()
+            self._connected = False
 
 
 
@@ -228,4 +228,30 @@ class EmployeeServicesController:
         except ValueError as validation_error:
             raise ValueError(f"Błąd walidacji: {validation_error}") from validation_error
         except sqlite3.Error as db_error:
-            raise RuntimeError(f"Błąd bazy danych podczas aktualizacji przypisania pracownika do usługi: {db_error}") from db_error
\ No newline at end of file
+            raise RuntimeError(f"Błąd bazy danych podczas aktualizacji przypisania pracownika do usługi: {db_error}") from db_error
+
+
+
+    def add_many(self, records: list) -> list:
+        """
+        Dodaje wiele przypisań usług w jednej transakcji (zob. `EmployeeServices.add_many`).
+
+        :return: Lista wyników wierszy {"index", "success", "error", "id"}.
+        """
+        return self.employee_services_model.add_many(records)
+
+    def update_many(self, updates: list) -> list:
+        """
+        Aktualizuje wiele przypisań usług w jednej transakcji (zob. `EmployeeServices.update_many`).
+
+        :return: Lista wyników wierszy {"index", "success", "error", "id"}.
+        """
+        return self.employee_services_model.update_many(updates)
+
+    def delete_many(self, employee_service_ids: list) -> list:
+        """
+        Usuwa wiele przypisań usług w jednej transakcji (zob. `EmployeeServices.delete_many`).
+
+        :return: Lista wyników wierszy {"index", "success", "error", "id"}.
+        """
+        return self.employee_services_model.delete_many(employee_service_ids)
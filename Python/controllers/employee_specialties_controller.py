@@ -220,4 +220,30 @@ class EmployeeSpecialtiesController:
         except ValueError as ve:
             return {"success": False, "message": str(ve)}
         except RuntimeError:
-            return {"success": False, "message": "Błąd podczas aktualizacji przypisania pracownika do specjalności."}
\ No newline at end of file
+            return {"success": False, "message": "Błąd podczas aktualizacji przypisania pracownika do specjalności."}
+
+
+
+    def add_many(self, records: list) -> list:
+        """
+        Dodaje wiele przypisań specjalności w jednej transakcji (zob. `EmployeeSpecialties.add_many`).
+
+        :return: Lista wyników wierszy {"index", "success", "error", "id"}.
+        """
+        return self.employee_specialties_model.add_many(records)
+
+    def update_many(self, updates: list) -> list:
+        """
+        Aktualizuje wiele przypisań specjalności w jednej transakcji (zob. `EmployeeSpecialties.update_many`).
+
+        :return: Lista wyników wierszy {"index", "success", "error", "id"}.
+        """
+        return self.employee_specialties_model.update_many(updates)
+
+    def delete_many(self, employee_specialty_ids: list) -> list:
+        """
+        Usuwa wiele przypisań specjalności w jednej transakcji (zob. `EmployeeSpecialties.delete_many`).
+
+        :return: Lista wyników wierszy {"index", "success", "error", "id"}.
+        """
+        return self.employee_specialties_model.delete_many(employee_specialty_ids)
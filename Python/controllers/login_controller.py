@@ -1,6 +1,7 @@
 import bcrypt
 from datetime import datetime
 from models.users_accounts import UsersAccounts
+from services.session_service import load_role_permissions
 
 
 class LoginController:
@@ -69,12 +70,4 @@ class LoginController:
         Returns:
             list: Lista uprawnień.
         """
-        query = """
-        SELECT sp.permission_name
-        FROM role_permissions rp
-        JOIN system_permissions sp ON rp.permission_id = sp.permission_id
-        WHERE rp.role_id = ?
-        """
-        cursor = self.db_controller.connection.execute(query, (role_id,))
-        permissions = [row[0] for row in cursor.fetchall()]
-        return permissions
+        return load_role_permissions(self.db_controller.connection, role_id)
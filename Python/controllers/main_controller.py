@@ -1,27 +1,20 @@
+import importlib
 from controllers.database_controller import DatabaseController
-from controllers.users_accounts_controller import UsersAccountsController
-from controllers.roles_controller import RolesController
-from controllers.role_permissions_controller import RolePermissionsController
-from controllers.permissions_controller import PermissionsController
-from controllers.employees_controller import EmployeesController
-from controllers.patients_controller import PatientController
-from controllers.rooms_controller import RoomsController
-from controllers.room_types_controller import RoomTypesController
-from controllers.room_reservations_controller import RoomReservationsController
-from controllers.internal_meetings_controller import InternalMeetingsController
-from controllers.appointments_controller import AppointmentsController
-from controllers.services_controller import ServicesController
 from controllers.login_controller import LoginController
-from controllers.assigned_patients_controller import AssignedPatientsController
-from controllers.diagnoses_controller import DiagnosesController
-from controllers.employee_services_controller import EmployeeServicesController
-from controllers.employee_specialties_controller import EmployeeSpecialtiesController
-from controllers.form_types_controller import FormTypesController
-from controllers.meeting_participants_controller import MeetingParticipantsController
-from controllers.meeting_types_controller import MeetingTypesController
-from controllers.patient_forms_controller import PatientFormsController
-from controllers.prescriptions_controller import PrescriptionsController
-from controllers.specialties_controller import SpecialtiesController
+from controllers.schema_initializer import migrate_schema
+from services.session_service import SessionService
+
+# Serwisy importowane i tworzone dopiero przy pierwszym użyciu (`get_service`): nazwa -> (moduł, klasa).
+# Serwisy nie przechowują stanu poza kontrolerem, więc jedna instancja służy wszystkim wywołaniom.
+SERVICE_CLASSES = {
+    "admin": ("services.admin_service", "AdminService"),
+    "dashboard": ("services.dashboard_service", "DashboardService"),
+    "employee": ("services.employee_service", "EmployeeService"),
+    "patients": ("services.patients_service", "PatientsService"),
+    "room": ("services.room_service", "RoomService"),
+    "search": ("services.search_service", "SearchService"),
+    "validation": ("services.validation_service", "ValidationService"),
+}
 
 
 class MainController:
@@ -36,50 +29,57 @@ class MainController:
         """
         self.db_controller = DatabaseController()
         self.controllers = {}  # Słownik do przechowywania dynamicznie tworzonych kontrolerów
+        self.services = {}  # Serwisy tworzone leniwie przez get_service
         self.logged_in_user = None  # Przechowuje dane zalogowanego użytkownika
+        self.session_service = SessionService(self.db_controller)  # Konteksty sesji - jedna instancja na proces (także dla BridgeWorker)
 
     def get_controller(self, controller_class):
         """
         Zwraca instancję kontrolera, tworząc ją tylko wtedy, gdy jest potrzebna.
         """
-        if controller_class not in self.controllers:
-            self.controllers[controller_class] = controller_class(self.db_controller)
+        controller = self.controllers.get(controller_class)
+        if controller is None:
+            # setdefault - kontroler jest współdzielony przez wątek GUI i wątek roboczy mostków
+            controller = self.controllers.setdefault(controller_class, controller_class(self.db_controller))
             #print(f"Kontroler {controller_class.__name__} został zainicjalizowany.")
-        return self.controllers[controller_class]
+        return controller
+
+    def get_service(self, service_name):
+        """
+        Zwraca instancję serwisu `service_name` (klucz `SERVICE_CLASSES`), importując moduł
+        i tworząc serwis dopiero przy pierwszym użyciu.
+
+        :raises KeyError: Dla nieznanej nazwy serwisu.
+        """
+        service = self.services.get(service_name)
+        if service is None:
+            module_name, class_name = SERVICE_CLASSES[service_name]
+            service_class = getattr(importlib.import_module(module_name), class_name)
+            # setdefault - przy równoległym pierwszym użyciu z dwóch wątków zostaje jedna instancja
+            service = self.services.setdefault(service_name, service_class(self))
+        return service
 
-    def initialize_critical_tables(self):
+    def initialize_critical_tables(self, startup_timer=None):
         """
         Tworzy tabele krytyczne, które muszą być dostępne od razu po starcie aplikacji.
+        Aktualna baza (wersja w `PRAGMA user_version`) pomija wszystkie instrukcje DDL.
+
+        :param startup_timer: Opcjonalny `StartupTimer` - etapy inicjalizacji są w nim oznaczane.
         """
-        critical_controllers = [
-            AppointmentsController,
-            AssignedPatientsController,
-            DiagnosesController,
-            EmployeeServicesController,
-            EmployeeSpecialtiesController,
-            EmployeesController,
-            FormTypesController,
-            InternalMeetingsController,
-            MeetingParticipantsController,
-            MeetingTypesController,
-            PatientFormsController,
-            PatientController,
-            PermissionsController,
-            PrescriptionsController,
-            RolePermissionsController,
-            RolesController,
-            RoomReservationsController,
-            RoomTypesController,
-            RoomsController,
-            ServicesController,
-            SpecialtiesController,
-            UsersAccountsController
-        ]
-
-        for controller_class in critical_controllers:
-            controller = self.get_controller(controller_class)
-            controller.create_table()
-            #print(f"Tabela dla kontrolera {controller_class.__name__} została utworzona.")
+        # Tabele, kolumny czasu start_ts / end_ts z wyzwalaczami i indeksy (controllers/schema_initializer.py)
+        migration_report = migrate_schema(self.db_controller, self.get_controller)
+        for step in migration_report["applied"]:
+            print(f"Migracja schematu do wersji {step['version']} ({step['description']}): {step['report']}")
+        if startup_timer is not None:
+            startup_timer.mark("Migracje schematu")
+
+        # Katalog schematu (kolumny, typy, CHECK, klucze obce) wczytywany raz - modele nie odpytują PRAGMA
+        self.db_controller.schema_catalog.load()
+
+        # Uprawnienia ról (role_permissions) kompilowane do masek bitowych - sloty nie odpytują bazy
+        self.db_controller.permission_engine.load()
+        if startup_timer is not None:
+            startup_timer.mark("Katalog schematu i uprawnienia")
 
     def perform_table_operation(self, controller_class, operation, *args, **kwargs):
         """
@@ -93,13 +93,18 @@ class MainController:
 
         return method(*args, **kwargs)
 
-    def initialize_application(self):
+    def initialize_application(self, startup_timer=None):
         """
         Inicjalizuje aplikację, w tym bazę danych i krytyczne tabele.
+
+        :param startup_timer: Opcjonalny `StartupTimer` - etapy inicjalizacji są w nim oznaczane.
         """
         print("Inicjalizacja aplikacji...")
         self.db_controller.connect_to_database()
-        self.initialize_critical_tables()
+        if startup_timer is not None:
+            startup_timer.mark("Połączenie z bazą danych")
+
+        self.initialize_critical_tables(startup_timer)
         print("Aplikacja została pomyślnie zainicjalizowana.")
 
     def shutdown_application(self):
@@ -107,13 +112,18 @@ class MainController:
         Zamyka połączenie z bazą danych i zwalnia zasoby.
         """
         print("Zamykanie aplikacji...")
+        # Tryb profilowania (APP_PROFILE=1) - zapis raportu zapytań i slotów
+        if self.db_controller.profiler is not None:
+            self.db_controller.profiler.print_summary()
+            self.db_controller.profiler.write_report()
         self.db_controller.close_connection()
         print("Aplikacja została zamknięta.")
 
     def login_user(self, username, password):
         """
         Loguje użytkownika na podstawie username i hasła.
-        Pobiera również przypisane role i uprawnienia.
+        Pobiera również przypisane role i uprawnienia oraz tworzy kontekst sesji
+        (`session_service.get_session(user_id)`) odczytywany później przez mostki.
 
         Args:
             username (str): Nazwa użytkownika.
@@ -127,6 +137,7 @@ class MainController:
 
         if user:
             self.logged_in_user = user
+            self.session_service.start_session(user)
             print(f"Zalogowano pomyślnie: {user['username']} ({user['role_name']})")
             print(f"Zalogowany użytkownik: {user}")
             return user
@@ -55,6 +55,7 @@ class MeetingTypesController:
             query = "INSERT INTO meeting_types (meeting_type) VALUES (?)"
             cursor = self.db_controller.connection.execute(query, (meeting_type_name,))
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("meeting_types")
             return {"meeting_type_id": cursor.lastrowid}
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas dodawania typu spotkania: {e}") from e
@@ -95,3 +95,45 @@ class PatientFormsController:
             self.patient_forms_model.delete_form(form_id)
         except sqlite3.Error as db_error:
             raise RuntimeError("Błąd bazy danych podczas usuwania formularza.") from db_error
+
+    def get_form_content(self, form_id):
+        """
+        Pobiera całą treść formularza na podstawie `form_id`.
+
+        Args:
+            form_id (int): ID formularza.
+
+        Returns:
+            str | bytes | None: Treść formularza lub None, jeśli formularz nie ma treści.
+        """
+        try:
+            return self.patient_forms_model.get_form_content(form_id)
+        except sqlite3.Error as db_error:
+            raise RuntimeError("Błąd bazy danych podczas pobierania treści formularza.") from db_error
+
+    def open_form_content(self, form_id):
+        """
+        Otwiera strumień treści formularza czytany fragmentami (do zamknięcia po odczycie).
+
+        Args:
+            form_id (int): ID formularza.
+
+        Returns:
+            FormContentReader | None: Strumień bajtów lub None, jeśli formularz nie ma treści.
+        """
+        try:
+            return self.patient_forms_model.open_form_content(form_id)
+        except sqlite3.Error as db_error:
+            raise RuntimeError("Błąd bazy danych podczas otwierania treści formularza.") from db_error
+
+    def get_content_statistics(self):
+        """
+        Pobiera statystyki rozmiaru i kompresji treści formularzy.
+
+        Returns:
+            dict: Liczba formularzy z treścią, rozmiary przed i po kompresji oraz współczynnik kompresji.
+        """
+        try:
+            return self.patient_forms_model.get_content_statistics()
+        except sqlite3.Error as db_error:
+            raise RuntimeError("Błąd bazy danych podczas pobierania statystyk treści formularzy.") from db_error
@@ -230,6 +230,16 @@ class PatientController:
             print(f"Błąd podczas pobierania szczegółów pacjentów: {e}")
             raise
 
+    def get_patients_page(self, fk_employee_id=None, after_patient_id=0, limit=None, search_text=None):
+        """
+        Pobiera stronę pacjentów (paginacja po `patient_id`), opcjonalnie tylko przypisanych do pracownika.
+        """
+        try:
+            return self.model.get_patients_page(fk_employee_id, after_patient_id, limit, search_text)
+        except Exception as e:
+            print(f"Błąd podczas pobierania strony pacjentów: {e}")
+            raise
+
     def get_patient_ids_and_names(self):
         """
         Pobiera wszystkie rekordy z kolumn `patient_id`, `first_name`, i `last_name` z modelu.
@@ -29,7 +29,7 @@ class RoomReservationsController:
         except sqlite3.Error as db_error:
             raise RuntimeError("Błąd bazy danych podczas tworzenia tabeli `room_reservations`.") from db_error
 
-    def add_reservation(self, fk_room_id, reservation_date, reservation_time):
+    def add_reservation(self, fk_room_id, reservation_date, reservation_time, check_conflicts=False):
         """
         Dodaje nową rezerwację do tabeli `room_reservations`.
 
@@ -39,13 +39,17 @@ class RoomReservationsController:
             fk_meeting_id (int | None): ID spotkania.
             reservation_date (str): Data rezerwacji.
             reservation_time (str): Czas rezerwacji.
+            check_conflicts (bool): Czy sprawdzić kolizje z innymi rezerwacjami pokoju w transakcji zapisu.
 
         Returns:
             int: ID nowo dodanej rezerwacji.
+
+        Raises:
+            ValueError: Jeśli `check_conflicts` i rezerwacja nachodzi na inną rezerwację pokoju.
         """
         try:
             return self.room_reservations_model.add_reservation(
-                fk_room_id, reservation_date, reservation_time
+                fk_room_id, reservation_date, reservation_time, check_conflicts
             )
         except sqlite3.Error as db_error:
             raise RuntimeError("Błąd bazy danych podczas dodawania rezerwacji.") from db_error
@@ -66,7 +70,8 @@ class RoomReservationsController:
         except sqlite3.Error as db_error:
             raise RuntimeError("Błąd bazy danych podczas pobierania rezerwacji.") from db_error
 
-    def update_reservation(self, reservation_id: int, fk_room_id: int = None, reservation_date: str = None, reservation_time: str = None) -> bool:
+    def update_reservation(self, reservation_id: int, fk_room_id: int = None, reservation_date: str = None, reservation_time: str = None,
+                           check_conflicts: bool = False) -> bool:
         """
         Wywołuje metodę modelu do aktualizacji rezerwacji.
 
@@ -74,11 +79,13 @@ class RoomReservationsController:
         :param fk_room_id: Nowe ID pokoju (opcjonalnie).
         :param reservation_date: Nowa data rezerwacji (opcjonalnie, format YYYY-MM-DD).
         :param reservation_time: Nowy czas rezerwacji (opcjonalnie, format HH:MM-HH:MM).
+        :param check_conflicts: Czy sprawdzić kolizje z innymi rezerwacjami pokoju w transakcji zapisu.
         :return: True, jeśli aktualizacja się powiodła, False w przypadku błędu.
+        :raises ValueError: Jeśli `check_conflicts` i rezerwacja nachodzi na inną rezerwację pokoju.
         """
         try:
             self.room_reservations_model.update_reservation(
-                reservation_id, fk_room_id, reservation_date, reservation_time
+                reservation_id, fk_room_id, reservation_date, reservation_time, check_conflicts
             )
             return True  # Aktualizacja zakończona sukcesem
 
@@ -0,0 +1,148 @@
+# schema_initializer.py
+
+import importlib
+import sqlite3
+import time
+from database.appointment_stats import CASCADE_DELETE_TRIGGERS, AppointmentStatsManager
+from database.form_content import FormContentStore
+from database.indexes import IndexManager
+from database.search_index import SearchIndexManager
+from database.time_columns import TimeColumnsManager
+
+# Kontrolery tabel, które muszą być dostępne od razu po starcie aplikacji: (moduł, klasa).
+# Moduły kontrolerów (i ich modeli) importowane są dopiero w kroku tworzenia tabel - baza w aktualnej
+# wersji schematu (`PRAGMA user_version`) nie importuje ich przy starcie.
+CRITICAL_CONTROLLERS = (
+    ("controllers.appointments_controller", "AppointmentsController"),
+    ("controllers.assigned_patients_controller", "AssignedPatientsController"),
+    ("controllers.diagnoses_controller", "DiagnosesController"),
+    ("controllers.employee_services_controller", "EmployeeServicesController"),
+    ("controllers.employee_specialties_controller", "EmployeeSpecialtiesController"),
+    ("controllers.employees_controller", "EmployeesController"),
+    ("controllers.form_types_controller", "FormTypesController"),
+    ("controllers.internal_meetings_controller", "InternalMeetingsController"),
+    ("controllers.meeting_participants_controller", "MeetingParticipantsController"),
+    ("controllers.meeting_types_controller", "MeetingTypesController"),
+    ("controllers.patient_forms_controller", "PatientFormsController"),
+    ("controllers.patients_controller", "PatientController"),
+    ("controllers.permissions_controller", "PermissionsController"),
+    ("controllers.prescriptions_controller", "PrescriptionsController"),
+    ("controllers.role_permissions_controller", "RolePermissionsController"),
+    ("controllers.roles_controller", "RolesController"),
+    ("controllers.room_reservations_controller", "RoomReservationsController"),
+    ("controllers.room_types_controller", "RoomTypesController"),
+    ("controllers.rooms_controller", "RoomsController"),
+    ("controllers.services_controller", "ServicesController"),
+    ("controllers.specialties_controller", "SpecialtiesController"),
+    ("controllers.users_accounts_controller", "UsersAccountsController"),
+)
+
+
+def _create_tables(db_controller, get_controller) -> dict:
+    created = []
+    for module_name, class_name in CRITICAL_CONTROLLERS:
+        controller_class = getattr(importlib.import_module(module_name), class_name)
+        get_controller(controller_class).create_table()
+        created.append(controller_class.__name__)
+    return {"controllers": created}
+
+
+def _apply_time_columns(db_controller, _get_controller) -> dict:
+    # Kolumny start_ts / end_ts (minuty od epoki) i wyzwalacze - przed indeksami, które z nich korzystają
+    return TimeColumnsManager(db_controller).apply()
+
+
+def _apply_indexes(db_controller, _get_controller) -> dict:
+    # Indeksy na kolumnach FK i złożonych kluczach wyszukiwania (database/indexes.py)
+    return IndexManager(db_controller).apply_indexes()
+
+
+def _apply_search_indexes(db_controller, _get_controller) -> dict:
+    # Indeksy pełnotekstowe FTS5 z wyzwalaczami (database/search_index.py)
+    return SearchIndexManager(db_controller).apply()
+
+
+def _apply_appointment_stats(db_controller, _get_controller) -> dict:
+    # Liczniki wizyt pracowników utrzymywane przez wyzwalacze (database/appointment_stats.py)
+    return AppointmentStatsManager(db_controller).apply()
+
+
+def _apply_form_content(db_controller, _get_controller) -> dict:
+    # Skompresowana treść formularzy poza `patient_forms` (database/form_content.py)
+    return FormContentStore(db_controller).apply()
+
+
+def _refresh_appointment_stats_triggers(db_controller, _get_controller) -> dict:
+    # Wyzwalacze liczników odporne na zmianę klucza przypisania (ON UPDATE CASCADE) i ponowne zliczenie wizyt
+    return AppointmentStatsManager(db_controller).refresh_triggers()
+
+
+def _refresh_assignment_delete_triggers(db_controller, _get_controller) -> dict:
+    # Wyzwalacze usuwania przypisań zgodne z ON DELETE CASCADE (wizyty odejmowane przed usunięciem)
+    return AppointmentStatsManager(db_controller).refresh_triggers(CASCADE_DELETE_TRIGGERS)
+
+
+# Kolejne kroki migracji schematu: (wersja, opis, funkcja(db_controller, get_controller) -> raport).
+# Po każdym kroku numer wersji zapisywany jest w `PRAGMA user_version`, więc aktualna baza
+# pomija wszystkie sprawdzenia i instrukcje DDL. Zmiana schematu (nowa tabela, kolumna, wyzwalacz,
+# definicja indeksu) wymaga dopisania kroku z kolejnym numerem - istniejących kroków nie zmieniamy.
+SCHEMA_MIGRATIONS = (
+    (1, "Tabele krytyczne", _create_tables),
+    (2, "Kolumny czasu start_ts / end_ts", _apply_time_columns),
+    (3, "Indeksy", _apply_indexes),
+    (4, "Indeksy pełnotekstowe FTS5", _apply_search_indexes),
+    (5, "Liczniki wizyt pracowników", _apply_appointment_stats),
+    (6, "Skompresowana treść formularzy pacjentów", _apply_form_content),
+    (7, "Poprawione wyzwalacze liczników wizyt", _refresh_appointment_stats_triggers),
+    (8, "Wyzwalacze liczników przy kaskadowym usuwaniu przypisań", _refresh_assignment_delete_triggers),
+)
+SCHEMA_VERSION = SCHEMA_MIGRATIONS[-1][0]
+
+
+def get_schema_version(db_controller) -> int:
+    """
+    Zwraca wersję schematu zapisaną w bazie (`PRAGMA user_version`, 0 - baza bez migracji).
+    """
+    db_controller.ensure_connection()
+    return db_controller.connection.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate_schema(db_controller, get_controller=None) -> dict:
+    """
+    Doprowadza schemat bazy do wersji `SCHEMA_VERSION`, wykonując brakujące kroki `SCHEMA_MIGRATIONS`.
+    Wspólne dla startu aplikacji (`MainController.initialize_critical_tables`) i szablonów baz testowych.
+
+    :param get_controller: Funkcja zwracająca instancję kontrolera dla klasy (np. `MainController.get_controller`);
+        domyślnie tworzony jest nowy kontroler.
+    :return: Słownik {"from_version", "version", "applied": [{"version", "description", "report", "seconds"}]}.
+    :raises RuntimeError: W przypadku błędu bazy danych podczas migracji.
+    """
+    def create_controller(controller_class):
+        return controller_class(db_controller)
+
+    get_controller = get_controller or create_controller
+
+    try:
+        from_version = get_schema_version(db_controller)
+        applied = []
+        if from_version > SCHEMA_VERSION:
+            print(f"Baza danych ma nowszy schemat (wersja {from_version}) niż aplikacja ({SCHEMA_VERSION}).")
+
+        for version, description, step in SCHEMA_MIGRATIONS:
+            if version <= from_version:
+                continue
+            start = time.perf_counter()
+            report = step(db_controller, get_controller)
+            # PRAGMA nie przyjmuje parametrów - wersja jest liczbą z SCHEMA_MIGRATIONS
+            db_controller.connection.execute(f"PRAGMA user_version = {int(version)}")
+            db_controller.connection.commit()
+            applied.append({
+                "version": version,
+                "description": description,
+                "report": report,
+                "seconds": time.perf_counter() - start,
+            })
+    except sqlite3.Error as e:
+        raise RuntimeError(f"Błąd podczas migracji schematu bazy danych: {e}") from e
+
+    return {"from_version": from_version, "version": max(from_version, SCHEMA_VERSION), "applied": applied}
@@ -0,0 +1,337 @@
+# appointment_series.py
+
+import json
+import sqlite3
+from datetime import date, timedelta
+from database.room_availability import (
+    DAY_END_MINUTE,
+    DAY_START_MINUTE,
+    RoomSchedule,
+    format_time_range,
+    parse_minutes,
+)
+from database.time_columns import MINUTES_PER_DAY, epoch_minutes
+
+# Największa liczba terminów jednej serii (10 lat cotygodniowych wizyt)
+MAX_OCCURRENCES = 520
+
+# Parametry serii przyjmowane przez `AppointmentSeriesScheduler.schedule` (np. z obiektu JSON mostka)
+SERIES_PARAMETERS = (
+    "assignment_id", "service_id", "start_date", "weekdays", "start_time", "count", "end_date", "room_id",
+    "room_type_id", "duration_minutes", "interval_weeks", "suggestions", "skip_conflicts", "appointment_status", "notes",
+)
+
+# Rezerwacje i wizyty mieszczą się w jednym dniu, więc każdy przedział nachodzący na termin
+# zaczyna się nie wcześniej niż dobę przed nim - dolna granica zakresu indeksu `start_ts`
+MAX_INTERVAL_MINUTES = MINUTES_PER_DAY
+
+# Zajęte przedziały pokoi i pracownika w oknach czasu (terminach serii lub całych dniach).
+# Okna przekazywane są jako tablica JSON [[indeks, start_ts, end_ts], ...] - jedno zapytanie dla całej serii.
+BUSY_INTERVALS_QUERY = f"""
+    WITH series_window AS (
+        SELECT json_extract(value, '$[0]') AS window_index,
+               json_extract(value, '$[1]') AS start_ts,
+               json_extract(value, '$[2]') AS end_ts
+        FROM json_each(:windows)
+    )
+    SELECT w.window_index, 'room' AS kind, r.fk_room_id AS room_id, r.reservation_id AS record_id,
+           r.start_ts, r.end_ts
+    FROM series_window w
+    JOIN room_reservations r
+        ON r.start_ts > w.start_ts - {MAX_INTERVAL_MINUTES} AND r.start_ts < w.end_ts AND r.end_ts > w.start_ts
+    WHERE r.fk_room_id IN (SELECT value FROM json_each(:room_ids))
+    UNION ALL
+    SELECT w.window_index, 'appointment', NULL, a.appointment_id, a.start_ts, a.end_ts
+    FROM series_window w
+    JOIN appointments a
+        ON a.start_ts > w.start_ts - {MAX_INTERVAL_MINUTES} AND a.start_ts < w.end_ts AND a.end_ts > w.start_ts
+    JOIN assigned_patients ap ON ap.assignment_id = a.fk_assignment_id
+    WHERE ap.fk_employee_id = :employee_id AND a.appointment_status != 'Odwołana'
+    UNION ALL
+    SELECT w.window_index, 'meeting', NULL, m.meeting_id, r.start_ts, r.end_ts
+    FROM series_window w
+    JOIN room_reservations r
+        ON r.start_ts > w.start_ts - {MAX_INTERVAL_MINUTES} AND r.start_ts < w.end_ts AND r.end_ts > w.start_ts
+    JOIN internal_meetings m ON m.fk_reservation_id = r.reservation_id
+    JOIN meeting_participants mp ON mp.fk_meeting_id = m.meeting_id
+    WHERE mp.fk_employee_id = :employee_id AND m.internal_meeting_status != 'Odwołana'
+"""
+
+
+def build_occurrences(start_date: str, weekdays, start_time: str, duration_minutes: int,
+                      count: int = None, end_date: str = None, interval_weeks: int = 1) -> list:
+    """
+    Wyznacza terminy serii wizyt według wzorca dni tygodnia.
+
+    Przykład (12 wizyt w poniedziałki i czwartki o 10:00):
+        build_occurrences("2025-03-03", [0, 3], "10:00", 50, count=12)
+
+    :param start_date: Pierwszy dzień serii (YYYY-MM-DD).
+    :param weekdays: Dni tygodnia (0 - poniedziałek, 6 - niedziela).
+    :param start_time: Godzina rozpoczęcia (HH:MM).
+    :param duration_minutes: Czas trwania wizyty w minutach.
+    :param count: Liczba terminów (albo `end_date`).
+    :param end_date: Ostatni dzień serii włącznie (YYYY-MM-DD).
+    :param interval_weeks: Co ile tygodni powtarzać wzorzec.
+    :return: Lista krotek (data, początek, koniec) - początek i koniec w minutach od północy.
+    :raises ValueError: Jeśli parametry serii są nieprawidłowe.
+    """
+    weekdays = sorted(set(weekdays or []))
+    if not weekdays or any(not isinstance(day, int) or not 0 <= day <= 6 for day in weekdays):
+        raise ValueError("Dni tygodnia muszą być liczbami od 0 (poniedziałek) do 6 (niedziela).")
+    if (count is None) == (end_date is None):
+        raise ValueError("Należy podać liczbę terminów albo datę zakończenia serii.")
+    if count is not None and not 0 < count <= MAX_OCCURRENCES:
+        raise ValueError(f"Liczba terminów musi być z zakresu 1-{MAX_OCCURRENCES}.")
+    if not isinstance(interval_weeks, int) or interval_weeks < 1:
+        raise ValueError("Odstęp między tygodniami musi być dodatnią liczbą całkowitą.")
+
+    start = parse_minutes(start_time)
+    end = start + duration_minutes
+    if duration_minutes <= 0 or end > MINUTES_PER_DAY:
+        raise ValueError("Wizyta musi trwać co najmniej minutę i zakończyć się tego samego dnia.")
+
+    first_day = date.fromisoformat(start_date)
+    last_day = date.fromisoformat(end_date) if end_date is not None else None
+    if last_day is not None and last_day < first_day:
+        raise ValueError(f"Nieprawidłowy zakres dat: {start_date} - {end_date}.")
+
+    occurrences = []
+    week_start = first_day - timedelta(days=first_day.weekday())
+    while True:
+        for weekday in weekdays:
+            day = week_start + timedelta(days=weekday)
+            if day < first_day:
+                continue
+            if last_day is not None and day > last_day:
+                return occurrences
+            occurrences.append((day.isoformat(), start, end))
+            if len(occurrences) == count:
+                return occurrences
+            if len(occurrences) > MAX_OCCURRENCES:
+                raise ValueError(f"Seria przekracza {MAX_OCCURRENCES} terminów.")
+        week_start += timedelta(weeks=interval_weeks)
+
+
+class AppointmentSeriesScheduler:
+    """
+    Planowanie serii wizyt (np. 12-tygodniowej terapii) w jednym kroku zamiast osobnej
+    rezerwacji i wizyty dla każdego terminu.
+
+    Konflikty wszystkich terminów (rezerwacje pokoju, wizyty i spotkania pracownika) sprawdzane są
+    jednym zapytaniem `BUSY_INTERVALS_QUERY` po indeksach `start_ts`. Dla terminów z konfliktem
+    proponowane są wolne godziny tego samego dnia (drugie zapytanie dla wszystkich takich dni).
+    Rezerwacje i wizyty serii zapisywane są `executemany` w jednej jednostce pracy - seria
+    zapisuje się w całości albo wcale.
+    """
+
+    def __init__(self, db_controller):
+        """
+        Inicjalizuje planowanie serii z kontrolerem bazy danych.
+        """
+        self.db_controller = db_controller
+
+    def plan(self, assignment_id: int, service_id: int, start_date: str, weekdays, start_time: str,
+             count: int = None, end_date: str = None, room_id: int = None, room_type_id: int = None,
+             duration_minutes: int = None, interval_weeks: int = 1, suggestions: int = 3) -> dict:
+        """
+        Wyznacza terminy serii i sprawdza ich konflikty bez zapisu do bazy.
+
+        Pokój podawany jest wprost (`room_id`) albo jako typ (`room_type_id`) - wtedy dla każdego terminu
+        wybierany jest wolny pokój tego typu, w pierwszej kolejności pokój wolny w największej liczbie terminów.
+
+        :param duration_minutes: Czas trwania wizyty (domyślnie `services.duration_minutes`).
+        :param suggestions: Liczba proponowanych terminów zastępczych dla terminu z konfliktem.
+        :return: Słownik {"employee_id", "duration_minutes", "occurrences"}; każdy termin to słownik
+            {"index", "reservation_date", "reservation_time", "room_id", "conflicts", "alternatives"},
+            gdzie `room_id` jest None, a `conflicts` niepusta dla terminów z konfliktem.
+        :raises ValueError: Jeśli parametry serii są nieprawidłowe lub przypisanie, usługa albo pokój nie istnieją.
+        """
+        try:
+            with self.db_controller.read_connection() as connection:
+                return self._plan(
+                    connection, assignment_id, service_id, start_date, weekdays, start_time, count, end_date,
+                    room_id, room_type_id, duration_minutes, interval_weeks, suggestions,
+                )
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Błąd podczas planowania serii wizyt: {e}") from e
+
+    def schedule(self, assignment_id: int, service_id: int, start_date: str, weekdays, start_time: str,
+                 count: int = None, end_date: str = None, room_id: int = None, room_type_id: int = None,
+                 duration_minutes: int = None, interval_weeks: int = 1, suggestions: int = 3,
+                 skip_conflicts: bool = False, appointment_status: str = "Zaplanowana", notes: str = None) -> dict:
+        """
+        Planuje serię (jak `plan`) i zapisuje rezerwacje oraz wizyty wszystkich terminów w jednej transakcji.
+
+        :param skip_conflicts: Czy zapisać terminy bez konfliktu, gdy część terminów ma konflikt
+            (domyślnie seria z konfliktem nie jest zapisywana wcale).
+        :return: Słownik {"scheduled", "conflicts"} - zapisane terminy (z `reservation_id` i `appointment_id`)
+            oraz terminy z konfliktem (z `conflicts` i `alternatives`).
+        :raises ValueError: Jeśli parametry serii są nieprawidłowe.
+        :raises RuntimeError: W przypadku błędu bazy danych (żaden termin nie zostaje zapisany).
+        """
+        # Sprawdzenie i zapis w tej samej transakcji - równoległy zapis innego połączenia kończy ją błędem
+        try:
+            with self.db_controller.unit_of_work() as connection:
+                plan = self._plan(
+                    connection, assignment_id, service_id, start_date, weekdays, start_time, count, end_date,
+                    room_id, room_type_id, duration_minutes, interval_weeks, suggestions,
+                )
+                conflicts = [occurrence for occurrence in plan["occurrences"] if occurrence["conflicts"]]
+                free = [occurrence for occurrence in plan["occurrences"] if not occurrence["conflicts"]]
+                if conflicts and not skip_conflicts:
+                    return {"scheduled": [], "conflicts": conflicts}
+
+                self._insert(connection, free, assignment_id, service_id, appointment_status, notes)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Błąd podczas zapisu serii wizyt: {e}") from e
+
+        # `room_availability` jest wspólny dla wątku GUI i wątku roboczego (jeden MainController),
+        # więc unieważnienie obejmuje oba wątki; zapisy innych procesów wykrywa PRAGMA data_version
+        for reservation_date in {occurrence["reservation_date"] for occurrence in free}:
+            self.db_controller.room_availability.invalidate(reservation_date)
+        return {"scheduled": free, "conflicts": conflicts}
+
+    def _plan(self, connection, assignment_id, service_id, start_date, weekdays, start_time, count, end_date,
+              room_id, room_type_id, duration_minutes, interval_weeks, suggestions):
+        employee_id, service_duration = self._load_assignment_and_service(connection, assignment_id, service_id)
+        duration_minutes = duration_minutes or service_duration
+        room_ids = self._load_room_ids(connection, room_id, room_type_id)
+        occurrences = build_occurrences(
+            start_date, weekdays, start_time, duration_minutes, count, end_date, interval_weeks
+        )
+
+        windows = [
+            (index, epoch_minutes(day) + start, epoch_minutes(day) + end)
+            for index, (day, start, end) in enumerate(occurrences)
+        ]
+        room_conflicts = {}  # {indeks terminu: {room_id: [reservation_id]}}
+        employee_conflicts = {}  # {indeks terminu: [{"type", "id"}]}
+        for row in self._busy_intervals(connection, windows, room_ids, employee_id):
+            if row["kind"] == "room":
+                room_conflicts.setdefault(row["window_index"], {}).setdefault(row["room_id"], []).append(row["record_id"])
+            else:
+                employee_conflicts.setdefault(row["window_index"], []).append({"type": row["kind"], "id": row["record_id"]})
+
+        # Pokoje wolne w największej liczbie terminów wybierane są w pierwszej kolejności
+        busy_counts = {candidate: 0 for candidate in room_ids}
+        for rooms in room_conflicts.values():
+            for candidate in rooms:
+                busy_counts[candidate] += 1
+        preferred_rooms = sorted(room_ids, key=lambda candidate: busy_counts[candidate])
+
+        result = []
+        for index, (day, start, end) in enumerate(occurrences):
+            busy_rooms = room_conflicts.get(index, {})
+            free_room = next((candidate for candidate in preferred_rooms if candidate not in busy_rooms), None)
+            conflicts = list(employee_conflicts.get(index, []))
+            if free_room is None:
+                conflicts.extend(
+                    {"type": "room", "id": reservation_id}
+                    for reservation_ids in busy_rooms.values() for reservation_id in reservation_ids
+                )
+            result.append({
+                "index": index,
+                "reservation_date": day,
+                "reservation_time": format_time_range(start, end),
+                "room_id": None if conflicts else free_room,
+                "conflicts": conflicts,
+                "alternatives": [],
+            })
+
+        self._suggest_alternatives(connection, result, occurrences, room_ids, employee_id, duration_minutes, suggestions)
+        return {"employee_id": employee_id, "duration_minutes": duration_minutes, "occurrences": result}
+
+    @staticmethod
+    def _load_assignment_and_service(connection, assignment_id, service_id):
+        row = connection.execute(
+            """
+            SELECT
+                (SELECT fk_employee_id FROM assigned_patients WHERE assignment_id = ?) AS employee_id,
+                (SELECT duration_minutes FROM services WHERE service_id = ?) AS duration_minutes
+            """,
+            (assignment_id, service_id),
+        ).fetchone()
+        if row["employee_id"] is None:
+            raise ValueError(f"Przypisanie o ID {assignment_id} nie istnieje w systemie.")
+        if row["duration_minutes"] is None:
+            raise ValueError(f"Usługa o ID {service_id} nie istnieje w systemie.")
+        return row["employee_id"], row["duration_minutes"]
+
+    @staticmethod
+    def _load_room_ids(connection, room_id, room_type_id):
+        if (room_id is None) == (room_type_id is None):
+            raise ValueError("Należy podać pokój albo typ pokoju.")
+        if room_id is not None:
+            query, params = "SELECT room_id FROM rooms WHERE room_id = ?", (room_id,)
+        else:
+            query, params = "SELECT room_id FROM rooms WHERE fk_room_type_id = ? ORDER BY room_number", (room_type_id,)
+        room_ids = [row[0] for row in connection.execute(query, params).fetchall()]
+        if not room_ids:
+            raise ValueError(
+                f"Pokój o ID {room_id} nie istnieje w systemie." if room_id is not None
+                else f"Brak pokoi typu o ID {room_type_id}."
+            )
+        return room_ids
+
+    @staticmethod
+    def _busy_intervals(connection, windows, room_ids, employee_id):
+        params = {"windows": json.dumps(windows), "room_ids": json.dumps(room_ids), "employee_id": employee_id}
+        return connection.execute(BUSY_INTERVALS_QUERY, params).fetchall()
+
+    def _suggest_alternatives(self, connection, result, occurrences, room_ids, employee_id, duration, suggestions):
+        conflicting = [occurrence for occurrence in result if occurrence["conflicts"]]
+        if not conflicting or suggestions <= 0:
+            return
+
+        # Zajętość pokoi i pracownika w całych dniach terminów z konfliktem - jedno zapytanie
+        days = sorted({occurrence["reservation_date"] for occurrence in conflicting})
+        windows = [(index, epoch_minutes(day), epoch_minutes(day) + MINUTES_PER_DAY) for index, day in enumerate(days)]
+        room_busy = {}  # {(dzień, room_id): [(początek, koniec, id)]}
+        employee_busy = {}  # {dzień: [(początek, koniec, id)]}
+        for row in self._busy_intervals(connection, windows, room_ids, employee_id):
+            day = days[row["window_index"]]
+            day_start = epoch_minutes(day)
+            interval = (max(row["start_ts"] - day_start, 0), min(row["end_ts"] - day_start, MINUTES_PER_DAY), row["record_id"])
+            if row["kind"] == "room":
+                room_busy.setdefault((day, row["room_id"]), []).append(interval)
+            else:
+                employee_busy.setdefault(day, []).append(interval)
+
+        for occurrence in conflicting:
+            day = occurrence["reservation_date"]
+            requested = occurrences[occurrence["index"]][1]
+            candidates = []
+            for candidate_room in room_ids:
+                schedule = RoomSchedule(room_busy.get((day, candidate_room), []) + employee_busy.get(day, []))
+                for slot_start, slot_end in schedule.free_slots(DAY_START_MINUTE, DAY_END_MINUTE):
+                    if slot_end - slot_start < duration:
+                        continue
+                    # Najbliższy żądanej godzinie początek w wolnym przedziale
+                    start = min(max(requested, slot_start), slot_end - duration)
+                    candidates.append((abs(start - requested), start, candidate_room))
+            occurrence["alternatives"] = [
+                {"reservation_date": day, "reservation_time": format_time_range(start, start + duration), "room_id": candidate_room}
+                for _, start, candidate_room in sorted(candidates)[:suggestions]
+            ]
+
+    @staticmethod
+    def _insert(connection, occurrences, assignment_id, service_id, appointment_status, notes):
+        if not occurrences:
+            return
+
+        # Zapis wiersz po wierszu - ID każdego rekordu pochodzi z jego własnego `lastrowid`
+        # (różnica last_insert_rowid() po executemany zakłada kolejne ID, czego SQLite nie gwarantuje)
+        for occurrence in occurrences:
+            occurrence["reservation_id"] = connection.execute(
+                "INSERT INTO room_reservations (fk_room_id, reservation_date, reservation_time) VALUES (?, ?, ?)",
+                (occurrence["room_id"], occurrence["reservation_date"], occurrence["reservation_time"]),
+            ).lastrowid
+            occurrence["appointment_id"] = connection.execute(
+                """
+                INSERT INTO appointments (fk_assignment_id, fk_service_id, fk_reservation_id, appointment_date, appointment_status, notes)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (assignment_id, service_id, occurrence["reservation_id"],
+                 f"{occurrence['reservation_date']} {occurrence['reservation_time']}", appointment_status, notes),
+            ).lastrowid
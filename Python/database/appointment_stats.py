@@ -0,0 +1,358 @@
+# appointment_stats.py
+
+import argparse
+import sqlite3
+import sys
+from controllers.database_controller import DatabaseController
+
+# Liczba wizyt pracownika w danym dniu (appointment_day = 'YYYY-MM-DD' z appointment_date)
+DAILY_STATS_TABLE = "employee_daily_appointment_stats"
+# Liczba przypisanych pacjentów i wszystkich wizyt pracownika
+TOTAL_STATS_TABLE = "employee_appointment_stats"
+
+STATS_TABLES_SQL = {
+    DAILY_STATS_TABLE: f"""CREATE TABLE IF NOT EXISTS {DAILY_STATS_TABLE} (
+    fk_employee_id INTEGER NOT NULL,
+    appointment_day TEXT NOT NULL,
+    appointment_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (fk_employee_id, appointment_day)
+) WITHOUT ROWID""",
+    TOTAL_STATS_TABLE: f"""CREATE TABLE IF NOT EXISTS {TOTAL_STATS_TABLE} (
+    fk_employee_id INTEGER PRIMARY KEY,
+    assignment_count INTEGER NOT NULL DEFAULT 0,
+    appointment_count INTEGER NOT NULL DEFAULT 0
+)""",
+}
+
+
+def _employee_of(row: str) -> str:
+    return f"(SELECT fk_employee_id FROM assigned_patients WHERE assignment_id = {row}.fk_assignment_id)"
+
+
+def _add_appointment_sql(row: str) -> str:
+    # Dodanie wizyty `row` (NEW) do liczników pracownika, do którego należy przypisanie
+    return f"""
+    INSERT INTO {DAILY_STATS_TABLE} (fk_employee_id, appointment_day, appointment_count)
+    SELECT fk_employee_id, substr({row}.appointment_date, 1, 10), 1
+    FROM assigned_patients WHERE assignment_id = {row}.fk_assignment_id
+    ON CONFLICT (fk_employee_id, appointment_day) DO UPDATE SET appointment_count = appointment_count + 1;
+    INSERT INTO {TOTAL_STATS_TABLE} (fk_employee_id, assignment_count, appointment_count)
+    SELECT fk_employee_id, 0, 1
+    FROM assigned_patients WHERE assignment_id = {row}.fk_assignment_id
+    ON CONFLICT (fk_employee_id) DO UPDATE SET appointment_count = appointment_count + 1;"""
+
+
+def _remove_appointment_sql(row: str) -> str:
+    # Odjęcie wizyty `row` (OLD) - wiersze dni bez wizyt są usuwane
+    return f"""
+    UPDATE {DAILY_STATS_TABLE} SET appointment_count = appointment_count - 1
+    WHERE fk_employee_id = {_employee_of(row)} AND appointment_day = substr({row}.appointment_date, 1, 10);
+    DELETE FROM {DAILY_STATS_TABLE}
+    WHERE fk_employee_id = {_employee_of(row)} AND appointment_day = substr({row}.appointment_date, 1, 10)
+      AND appointment_count <= 0;
+    UPDATE {TOTAL_STATS_TABLE} SET appointment_count = appointment_count - 1
+    WHERE fk_employee_id = {_employee_of(row)};"""
+
+
+def _add_assignment_sql(row: str, appointments_of: str = None) -> str:
+    # Dodanie przypisania `row` (NEW) wraz z wizytami, które już na nie wskazują
+    # (`appointments_of` - warunek wyboru tych wizyt, domyślnie po `row`.assignment_id)
+    appointments_of = appointments_of or f"fk_assignment_id = {row}.assignment_id"
+    return f"""
+    INSERT INTO {TOTAL_STATS_TABLE} (fk_employee_id, assignment_count, appointment_count)
+    SELECT {row}.fk_employee_id, 1, COUNT(*) FROM appointments WHERE {appointments_of}
+    ON CONFLICT (fk_employee_id) DO UPDATE SET
+        assignment_count = assignment_count + 1,
+        appointment_count = appointment_count + excluded.appointment_count;
+    INSERT INTO {DAILY_STATS_TABLE} (fk_employee_id, appointment_day, appointment_count)
+    SELECT {row}.fk_employee_id, substr(appointment_date, 1, 10), COUNT(*)
+    FROM appointments WHERE {appointments_of}
+    GROUP BY substr(appointment_date, 1, 10)
+    ON CONFLICT (fk_employee_id, appointment_day) DO UPDATE SET
+        appointment_count = appointment_count + excluded.appointment_count;"""
+
+
+def _remove_assignment_days_sql(row: str, appointments_of: str) -> str:
+    # Odjęcie wizyt przypisania `row` (OLD) od wierszy dni pracownika - dni bez wizyt są usuwane
+    return f"""
+    UPDATE {DAILY_STATS_TABLE} SET appointment_count = appointment_count - (
+        SELECT COUNT(*) FROM appointments
+        WHERE {appointments_of}
+          AND substr(appointment_date, 1, 10) = {DAILY_STATS_TABLE}.appointment_day
+    )
+    WHERE fk_employee_id = {row}.fk_employee_id AND appointment_day IN (
+        SELECT substr(appointment_date, 1, 10) FROM appointments WHERE {appointments_of}
+    );
+    DELETE FROM {DAILY_STATS_TABLE} WHERE fk_employee_id = {row}.fk_employee_id AND appointment_count <= 0;"""
+
+
+def _remove_assignment_sql(row: str, appointments_of: str = None) -> str:
+    # Odjęcie przypisania `row` (OLD) wraz z wizytami, które na nie wskazują
+    # (`appointments_of` - warunek wyboru tych wizyt, domyślnie po `row`.assignment_id)
+    appointments_of = appointments_of or f"fk_assignment_id = {row}.assignment_id"
+    return _remove_assignment_days_sql(row, appointments_of) + f"""
+    UPDATE {TOTAL_STATS_TABLE} SET
+        assignment_count = assignment_count - 1,
+        appointment_count = appointment_count - (
+            SELECT COUNT(*) FROM appointments WHERE {appointments_of}
+        )
+    WHERE fk_employee_id = {row}.fk_employee_id;"""
+
+
+def _remove_assignment_appointments_sql(row: str) -> str:
+    # Odjęcie wizyt przypisania `row` (OLD) bez samego przypisania - przed jego usunięciem
+    appointments_of = f"fk_assignment_id = {row}.assignment_id"
+    return _remove_assignment_days_sql(row, appointments_of) + f"""
+    UPDATE {TOTAL_STATS_TABLE} SET appointment_count = appointment_count - (
+        SELECT COUNT(*) FROM appointments WHERE {appointments_of}
+    )
+    WHERE fk_employee_id = {row}.fk_employee_id;"""
+
+
+# Zmiana klucza przypisania (assignment_id) przenosi wizyty przez ON UPDATE CASCADE, zanim wykona się
+# wyzwalacz przypisania. Wizyty przeniesione kaskadą wskazują na przypisanie, którego stary klucz już
+# nie istnieje - pomija je wyzwalacz wizyt, a wyzwalacz przypisania liczy wizyty pod starym i nowym kluczem.
+APPOINTMENT_UPDATE_CONDITION = """WHEN OLD.fk_assignment_id IS NEW.fk_assignment_id
+    OR EXISTS (SELECT 1 FROM assigned_patients WHERE assignment_id = OLD.fk_assignment_id)"""
+MOVED_APPOINTMENTS = "fk_assignment_id IN (OLD.assignment_id, NEW.assignment_id)"
+
+# Usunięcie przypisania z ON DELETE CASCADE (DDL modeli) usuwa jego wizyty, gdy przypisania już nie ma -
+# wyzwalacz wizyt nie znajduje wtedy pracownika, a wyzwalacz AFTER DELETE przypisania nie widzi wizyt.
+# Wizyty przypisania odejmuje więc wyzwalacz BEFORE DELETE (po OLD.fk_employee_id), a AFTER DELETE
+# zmniejsza tylko liczbę przypisań. Przy RESTRICT / NO ACTION (schemat v2) usunięcie przypisania
+# z wizytami kończy się błędem i zmiany wyzwalacza BEFORE są wycofywane razem z instrukcją.
+
+# Wyzwalacze zmienione po pierwszej wersji liczników - odtwarzane przez `refresh_triggers`
+REVISED_TRIGGERS = ("appointments_stats_on_update", "assigned_patients_stats_on_update")
+# Wyzwalacze usuwania przypisań zgodne z ON DELETE CASCADE - odtwarzane przez `refresh_triggers`
+CASCADE_DELETE_TRIGGERS = ("assigned_patients_stats_before_delete", "assigned_patients_stats_on_delete")
+
+
+def get_trigger_sql() -> dict:
+    """
+    Zwraca instrukcje tworzące wyzwalacze utrzymujące liczniki wizyt pracowników.
+
+    :return: Słownik {nazwa_wyzwalacza: instrukcja CREATE TRIGGER}.
+    """
+    triggers = {
+        "appointments_stats_on_insert": ("AFTER INSERT ON appointments", _add_appointment_sql("NEW")),
+        "appointments_stats_on_delete": ("AFTER DELETE ON appointments", _remove_appointment_sql("OLD")),
+        "appointments_stats_on_update": (
+            f"AFTER UPDATE OF fk_assignment_id, appointment_date ON appointments\n{APPOINTMENT_UPDATE_CONDITION}",
+            _remove_appointment_sql("OLD") + _add_appointment_sql("NEW"),
+        ),
+        "assigned_patients_stats_on_insert": ("AFTER INSERT ON assigned_patients", _add_assignment_sql("NEW")),
+        "assigned_patients_stats_before_delete": (
+            "BEFORE DELETE ON assigned_patients", _remove_assignment_appointments_sql("OLD"),
+        ),
+        "assigned_patients_stats_on_delete": (
+            "AFTER DELETE ON assigned_patients",
+            f"""
+    UPDATE {TOTAL_STATS_TABLE} SET assignment_count = assignment_count - 1
+    WHERE fk_employee_id = OLD.fk_employee_id;""",
+        ),
+        "assigned_patients_stats_on_update": (
+            "AFTER UPDATE OF assignment_id, fk_employee_id ON assigned_patients",
+            _remove_assignment_sql("OLD", MOVED_APPOINTMENTS) + _add_assignment_sql("NEW", MOVED_APPOINTMENTS),
+        ),
+    }
+    return {
+        trigger_name: f"CREATE TRIGGER IF NOT EXISTS {trigger_name}\n{event}\nBEGIN{body}\nEND"
+        for trigger_name, (event, body) in triggers.items()
+    }
+
+
+class AppointmentStatsManager:
+    """
+    Klasa odpowiedzialna za liczniki wizyt pracowników (`employee_daily_appointment_stats`
+    i `employee_appointment_stats`).
+
+    Liczniki dashboardu ("dzisiejsze wizyty", "przypisane wizyty") są odczytem jednego wiersza
+    po kluczu głównym, zamiast zliczania wszystkich wizyt pracownika przy każdym odświeżeniu.
+    Liczniki są utrzymywane przez wyzwalacze na `appointments` i `assigned_patients` - także przy
+    usuwaniu kaskadowym (ON DELETE CASCADE w DDL modeli). Zmian zapisanych z pominięciem wyzwalaczy
+    (dane sprzed migracji, baza bez wyzwalaczy liczników) nie widzą - takie liczniki odtwarza `rebuild` (`python -m database.appointment_stats`).
+    """
+
+    def __init__(self, db_controller):
+        """
+        Inicjalizuje menedżera liczników wizyt z kontrolerem bazy danych.
+        """
+        self.db_controller = db_controller
+
+    def get_existing_triggers(self) -> set:
+        """
+        Pobiera nazwy wyzwalaczy istniejących w bazie.
+        """
+        cursor = self.db_controller.connection.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+        return {row[0] for row in cursor.fetchall()}
+
+    def _rebuild(self) -> dict:
+        connection = self.db_controller.connection
+        connection.execute(f"DELETE FROM {DAILY_STATS_TABLE}")
+        connection.execute(f"DELETE FROM {TOTAL_STATS_TABLE}")
+        employees = connection.execute(f"""
+            INSERT INTO {TOTAL_STATS_TABLE} (fk_employee_id, assignment_count, appointment_count)
+            SELECT ap.fk_employee_id, COUNT(DISTINCT ap.assignment_id), COUNT(a.appointment_id)
+            FROM assigned_patients ap
+            LEFT JOIN appointments a ON a.fk_assignment_id = ap.assignment_id
+            GROUP BY ap.fk_employee_id
+        """).rowcount
+        days = connection.execute(f"""
+            INSERT INTO {DAILY_STATS_TABLE} (fk_employee_id, appointment_day, appointment_count)
+            SELECT ap.fk_employee_id, substr(a.appointment_date, 1, 10), COUNT(*)
+            FROM assigned_patients ap
+            JOIN appointments a ON a.fk_assignment_id = ap.assignment_id
+            GROUP BY ap.fk_employee_id, substr(a.appointment_date, 1, 10)
+        """).rowcount
+        return {"employees": employees, "days": days}
+
+    def rebuild(self) -> dict:
+        """
+        Odtwarza liczniki na podstawie wszystkich przypisań i wizyt.
+
+        :return: Słownik {"employees": liczba pracowników, "days": liczba wierszy dni}.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        try:
+            self.db_controller.ensure_connection()
+            with self.db_controller.connection:
+                return self._rebuild()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Błąd podczas odbudowy liczników wizyt: {e}") from e
+
+    def apply(self) -> dict:
+        """
+        Tworzy brakujące tabele liczników i wyzwalacze, a po ich utworzeniu zlicza istniejące wizyty.
+        Bez tabel `appointments` lub `assigned_patients` migracja nic nie zmienia.
+
+        :return: Słownik z listami `created_tables`, `created_triggers`, flagą `skipped`
+            i słownikiem `rebuilt` (wynik `rebuild`, pusty bez zmian).
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        report = {"created_tables": [], "created_triggers": [], "rebuilt": {}, "skipped": False}
+        try:
+            self.db_controller.ensure_connection()
+            connection = self.db_controller.connection
+            catalog = self.db_controller.schema_catalog
+            if not (catalog.has_table("appointments") and catalog.has_table("assigned_patients")):
+                report["skipped"] = True
+                return report
+
+            existing_triggers = self.get_existing_triggers()
+            with connection:
+                for table_name, table_sql in STATS_TABLES_SQL.items():
+                    if not catalog.has_table(table_name):
+                        connection.execute(table_sql)
+                        report["created_tables"].append(table_name)
+
+                for trigger_name, trigger_sql in get_trigger_sql().items():
+                    if trigger_name not in existing_triggers:
+                        connection.execute(trigger_sql)
+                        report["created_triggers"].append(trigger_name)
+
+                # Wizyty zapisane przed utworzeniem tabel lub wyzwalaczy
+                if report["created_tables"] or report["created_triggers"]:
+                    report["rebuilt"] = self._rebuild()
+
+            return report
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Błąd podczas migracji liczników wizyt: {e}") from e
+
+    def refresh_triggers(self, trigger_names=REVISED_TRIGGERS) -> dict:
+        """
+        Odtwarza wskazane wyzwalacze w bieżącej wersji (`get_trigger_sql`) i odbudowuje liczniki,
+        które mogły zostać zafałszowane przez poprzednią wersję wyzwalaczy.
+        Bez tabel liczników (baza sprzed migracji liczników) nic nie zmienia.
+
+        :return: Słownik z listą `replaced_triggers`, słownikiem `rebuilt` i flagą `skipped`.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        report = {"replaced_triggers": [], "rebuilt": {}, "skipped": False}
+        try:
+            self.db_controller.ensure_connection()
+            connection = self.db_controller.connection
+            catalog = self.db_controller.schema_catalog
+            if not all(catalog.has_table(table_name) for table_name in STATS_TABLES_SQL):
+                report["skipped"] = True
+                return report
+
+            trigger_sql = get_trigger_sql()
+            with connection:
+                for trigger_name in trigger_names:
+                    connection.execute(f"DROP TRIGGER IF EXISTS {trigger_name}")
+                    connection.execute(trigger_sql[trigger_name])
+                    report["replaced_triggers"].append(trigger_name)
+                report["rebuilt"] = self._rebuild()
+            return report
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Błąd podczas odtwarzania wyzwalaczy liczników wizyt: {e}") from e
+
+    def get_daily_count(self, employee_id: int, appointment_day: str) -> int:
+        """
+        Zwraca liczbę wizyt pracownika w danym dniu (`YYYY-MM-DD`).
+
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        try:
+            with self.db_controller.read_connection() as connection:
+                row = connection.execute(
+                    f"SELECT appointment_count FROM {DAILY_STATS_TABLE} WHERE fk_employee_id = ? AND appointment_day = ?",
+                    (employee_id, appointment_day),
+                ).fetchone()
+            return row[0] if row else 0
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Błąd podczas pobierania liczby wizyt: {e}") from e
+
+    def get_totals(self, employee_id: int) -> dict:
+        """
+        Zwraca liczbę przypisanych pacjentów i wszystkich wizyt pracownika.
+
+        :return: Słownik {"assignment_count", "appointment_count"} (zera dla pracownika bez przypisań).
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        try:
+            with self.db_controller.read_connection() as connection:
+                row = connection.execute(
+                    f"SELECT assignment_count, appointment_count FROM {TOTAL_STATS_TABLE} WHERE fk_employee_id = ?",
+                    (employee_id,),
+                ).fetchone()
+            if row is None:
+                return {"assignment_count": 0, "appointment_count": 0}
+            return {"assignment_count": row[0], "appointment_count": row[1]}
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Błąd podczas pobierania liczby wizyt: {e}") from e
+
+
+def main(argv=None) -> int:
+    """
+    Punkt wejścia wiersza poleceń: `python -m database.appointment_stats [--rebuild]`.
+    """
+    parser = argparse.ArgumentParser(description="Liczniki wizyt pracowników (employee_daily_appointment_stats).")
+    parser.add_argument("--rebuild", action="store_true", help="Odtwórz liczniki na podstawie wszystkich wizyt.")
+    args = parser.parse_args(argv)
+
+    db_controller = DatabaseController()
+    db_controller.connect_to_database()
+    try:
+        manager = AppointmentStatsManager(db_controller)
+        report = manager.apply()
+        if args.rebuild and not report["rebuilt"]:
+            report["rebuilt"] = manager.rebuild()
+    finally:
+        db_controller.close_connection()
+
+    if report["skipped"]:
+        print("Brak tabel appointments / assigned_patients - liczniki nie zostały utworzone.")
+        return 1
+    for table_name in report["created_tables"]:
+        print(f"Utworzono tabelę: {table_name}")
+    for trigger_name in report["created_triggers"]:
+        print(f"Utworzono wyzwalacz: {trigger_name}")
+    if report["rebuilt"]:
+        print(f"Odbudowano liczniki: {report['rebuilt']['employees']} pracowników, {report['rebuilt']['days']} dni.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
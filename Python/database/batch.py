@@ -0,0 +1,200 @@
+# batch.py
+
+import sqlite3
+from database.id_sets import encode_id_set
+
+
+def batch_result(index: int, success: bool, error: str = None, record_id: int = None) -> dict:
+    """
+    Zwraca wynik operacji na jednym wierszu partii, np.
+    {"index": 0, "success": True, "error": None, "id": 15}.
+    """
+    return {"index": index, "success": success, "error": error, "id": record_id}
+
+
+class BatchWriter:
+    """
+    Klasa wykonująca zapisy wielu rekordów (`add_many` / `update_many` / `delete_many` modeli)
+    w jednej transakcji (`DatabaseController.unit_of_work`).
+
+    Wiersze odrzucone przez walidację nie są zapisywane. Pozostałe wiersze o tym samym tekście
+    zapytania wykonywane są jednym `executemany` (INSERT zwracające ID - wiersz po wierszu w jednym
+    punkcie zapisu, ID z `lastrowid` każdego wiersza); jeśli którykolwiek z nich narusza ograniczenia
+    bazy, grupa jest wycofywana i wykonywana wiersz po wierszu (każdy we własnym punkcie zapisu),
+    aby wskazać wiersze z błędem. Wynikiem jest lista `batch_result` w kolejności wejściowej.
+    """
+
+    def __init__(self, db_controller):
+        """
+        Inicjalizuje obiekt zapisu partii z kontrolerem bazy danych.
+        """
+        self.db_controller = db_controller
+
+    def missing_values(self, table_name: str, column_name: str, values) -> set:
+        """
+        Zwraca wartości, których nie ma w kolumnie tabeli - jedno zapytanie dla całej partii
+        (np. nieistniejące `patient_id` przed dodaniem przypisań).
+
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        values = [value for value in values if value is not None]
+        if not values:
+            return set()
+        query = f"""
+            SELECT id_set.value FROM json_each(?) AS id_set
+            WHERE NOT EXISTS (SELECT 1 FROM {table_name} WHERE {column_name} = id_set.value)
+        """
+        try:
+            self.db_controller.ensure_connection()
+            cursor = self.db_controller.connection.execute(query, (encode_id_set(values),))
+            return {row[0] for row in cursor.fetchall()}
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Błąd podczas sprawdzania rekordów tabeli `{table_name}`: {e}") from e
+
+    def reference_errors(self, rows: list, references: dict, errors: dict = None) -> dict:
+        """
+        Sprawdza wartości kluczy obcych wierszy partii - jedno zapytanie na kolumnę zamiast
+        jednego na wiersz. Wiersze z błędem już obecnym w `errors` nie są nadpisywane.
+
+        :param rows: Lista słowników wierszy partii.
+        :param references: Słownik {kolumna: (tabela, kolumna klucza, komunikat)}, np.
+            {"fk_patient_id": ("patients", "patient_id", "Pacjent o ID {value} nie istnieje w systemie.")}.
+        :param errors: Słownik {indeks wiersza: komunikat} wcześniejszych błędów walidacji.
+        :return: Słownik {indeks wiersza: komunikat} uzupełniony o brakujące odwołania.
+        """
+        errors = dict(errors or {})
+        for column, (table_name, key_column, message) in references.items():
+            missing = self.missing_values(table_name, key_column, [row.get(column) for row in rows])
+            for index, row in enumerate(rows):
+                if index not in errors and row.get(column) in missing:
+                    errors[index] = message.format(value=row[column])
+        return errors
+
+    def execute(self, statements: list, errors: dict = None, returns_ids: bool = False) -> list:
+        """
+        Wykonuje instrukcje partii w jednej transakcji.
+
+        :param statements: Lista krotek (zapytanie, parametry) - jedna na wiersz partii
+            (None dla wierszy odrzuconych przez walidację).
+        :param errors: Słownik {indeks wiersza: komunikat} wierszy odrzuconych przez walidację.
+        :param returns_ids: Czy zwracać ID dodanych rekordów (tylko INSERT bez podanego klucza głównego).
+        :return: Lista wyników `batch_result` w kolejności wierszy.
+        :raises RuntimeError: W przypadku błędu bazy danych poza pojedynczym wierszem (np. brak połączenia).
+        """
+        errors = errors or {}
+        results = [None] * len(statements)
+        groups = {}  # {zapytanie: [indeksy wierszy]} - kolejność pierwszego wystąpienia
+        for index, statement in enumerate(statements):
+            if index in errors or statement is None:
+                results[index] = batch_result(index, False, errors.get(index, "Wiersz odrzucony przez walidację."))
+            else:
+                groups.setdefault(statement[0], []).append(index)
+
+        try:
+            with self.db_controller.unit_of_work() as connection:
+                for query, indexes in groups.items():
+                    self._execute_group(connection, query, indexes, statements, results, returns_ids)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Błąd podczas zapisu partii: {e}") from e
+        return results
+
+    @staticmethod
+    def _execute_group(connection, query, indexes, statements, results, returns_ids):
+        try:
+            with connection.savepoint():
+                if returns_ids:
+                    # ID z `lastrowid` każdego wiersza - wyzwalacze mogą dodawać rekordy do tej samej tabeli,
+                    # więc ID partii nie muszą być kolejnymi liczbami kończącymi się na last_insert_rowid()
+                    record_ids = [connection.execute(query, statements[index][1]).lastrowid for index in indexes]
+                else:
+                    connection.executemany(query, [statements[index][1] for index in indexes])
+                    record_ids = [None] * len(indexes)
+        except sqlite3.Error:
+            # Wskazanie wierszy naruszających ograniczenia - każdy we własnym punkcie zapisu
+            for index in indexes:
+                try:
+                    with connection.savepoint():
+                        cursor = connection.execute(query, statements[index][1])
+                    results[index] = batch_result(index, True, record_id=cursor.lastrowid if returns_ids else None)
+                except sqlite3.Error as e:
+                    results[index] = batch_result(index, False, str(e))
+            return
+
+        for index, record_id in zip(indexes, record_ids):
+            results[index] = batch_result(index, True, record_id=record_id)
+
+    def _validate_columns(self, table_name: str, columns):
+        # Nazwy kolumn trafiają do tekstu zapytania - dozwolone są tylko kolumny tabeli
+        valid_columns = self.db_controller.schema_catalog.get_columns(table_name)
+        invalid_columns = [column for column in columns if column not in valid_columns]
+        if invalid_columns:
+            raise ValueError(f"Nieprawidłowe kolumny tabeli `{table_name}`: {', '.join(invalid_columns)}.")
+
+    def insert_many(self, table_name: str, columns: tuple, rows: list, errors: dict = None) -> list:
+        """
+        Dodaje rekordy (słowniki z kluczami `columns`) i zwraca wyniki z ID dodanych rekordów.
+
+        :raises ValueError: Jeśli `columns` zawiera kolumnę spoza tabeli.
+        """
+        self._validate_columns(table_name, columns)
+        errors = dict(errors or {})
+        query = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+        statements = []
+        for index, row in enumerate(rows):
+            missing = [column for column in columns if column not in row]
+            if missing and index not in errors:
+                errors[index] = f"Brak wartości kolumn: {', '.join(missing)}."
+            statements.append(None if index in errors else (query, tuple(row[column] for column in columns)))
+        return self.execute(statements, errors, returns_ids=True)
+
+    def update_many(self, table_name: str, key_column: str, updates: list, errors: dict = None,
+                    allowed_columns: tuple = None) -> list:
+        """
+        Aktualizuje rekordy - każdy słownik zawiera klucz główny `key_column` i zmieniane kolumny.
+        Wiersze o tym samym zestawie kolumn wykonywane są jednym `executemany`,
+        a nieistniejące rekordy sprawdzane są jednym zapytaniem.
+
+        :param allowed_columns: Kolumny, które można aktualizować (inne kolumny oznaczają błąd wiersza).
+        :raises ValueError: Jeśli aktualizacja zawiera kolumnę spoza tabeli.
+        """
+        errors = dict(errors or {})
+        for index, update in enumerate(updates):
+            if index in errors:
+                continue
+            columns = [column for column in update if column != key_column]
+            forbidden = [column for column in columns if allowed_columns is not None and column not in allowed_columns]
+            if key_column not in update:
+                errors[index] = f"Brak wartości kolumny: {key_column}."
+            elif forbidden:
+                errors[index] = f"Niedozwolone kolumny: {', '.join(forbidden)}."
+            elif not columns:
+                errors[index] = "Brak danych do aktualizacji."
+        errors = self._missing_key_errors(table_name, key_column, [update.get(key_column) for update in updates], errors)
+
+        statements = []
+        for index, update in enumerate(updates):
+            if index in errors:
+                statements.append(None)
+                continue
+            columns = [column for column in update if column != key_column]
+            self._validate_columns(table_name, columns)
+            set_clause = ", ".join(f"{column} = ?" for column in columns)
+            query = f"UPDATE {table_name} SET {set_clause} WHERE {key_column} = ?"
+            statements.append((query, tuple(update[column] for column in columns) + (update[key_column],)))
+        return self.execute(statements, errors)
+
+    def delete_many(self, table_name: str, key_column: str, keys: list, errors: dict = None) -> list:
+        """
+        Usuwa rekordy o podanych kluczach głównych (nieistniejące rekordy oznaczane są jako błędy).
+        """
+        errors = self._missing_key_errors(table_name, key_column, keys, errors)
+        query = f"DELETE FROM {table_name} WHERE {key_column} = ?"
+        return self.execute([None if index in errors else (query, (key,)) for index, key in enumerate(keys)], errors)
+
+    def _missing_key_errors(self, table_name, key_column, keys, errors):
+        missing = self.missing_values(table_name, key_column, keys)
+        errors = dict(errors or {})
+        for index, key in enumerate(keys):
+            if index not in errors and (key is None or key in missing):
+                errors[index] = f"Rekord o ID {key} nie istnieje w tabeli `{table_name}`."
+        return errors
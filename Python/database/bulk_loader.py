@@ -0,0 +1,447 @@
+# bulk_loader.py
+# Ładowanie danych startowych z plików `lists_files/*.txt` do bazy danych w jednym procesie.
+
+import argparse
+import csv
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from functools import partial
+
+from controllers.database_controller import DatabaseController
+from validators.appointments_model_validation import validate_appointment_status, validate_date_format
+from validators.diagnoses_model_validation import validate_description, validate_icd11_code
+from validators.employees_model_validation import (
+    validate_email as validate_employee_email,
+    validate_first_name as validate_employee_first_name,
+    validate_is_medical_staff,
+    validate_last_name as validate_employee_last_name,
+    validate_phone as validate_employee_phone,
+    validate_profession,
+)
+from validators.form_types_model_validation import validate_form_name
+from validators.internal_meetings_model_validation import (
+    validate_internal_meeting_status,
+    validate_meeting_date_format,
+    validate_notes_length,
+)
+from validators.meeting_participants_model_validation import validate_attendance, validate_participant_role
+from validators.meeting_types_model_validation import validate_meeting_type
+from validators.patients_model_validation import (
+    validate_address,
+    validate_date_of_birth,
+    validate_email,
+    validate_first_name,
+    validate_last_name,
+    validate_pesel,
+    validate_phone,
+)
+from validators.prescriptions_model_validation import (
+    validate_dosage,
+    validate_medicine_name,
+    validate_medicine_price,
+    validate_prescription_code,
+)
+from validators.roles_model_validation import validate_role_name
+from validators.room_reservations_model_validation import validate_reservation_date, validate_reservation_time
+from validators.room_types_model_validation import validate_room_type
+from validators.rooms_model_validation import validate_fk_room_type_id, validate_floor, validate_room_number
+from validators.services_model_validation import (
+    validate_duration_minutes,
+    validate_service_price,
+    validate_service_type,
+)
+from validators.specialties_model_validation import validate_specialty_name
+from validators.users_accounts_model_validation import validate_datetime_field
+
+
+LISTS_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "database_files", "lists_files")
+
+# Data wygaśnięcia kont użytkowników tworzonych z pliku (jak w load_users.py)
+USERS_EXPIRED_AT = "2026-01-01 00:00"
+
+
+def hash_password(password: str) -> str:
+    """
+    Zwraca hash bcrypt hasła (bcrypt jest importowany dopiero przy ładowaniu tabeli `users_accounts`).
+    """
+    import bcrypt # pylint: disable=import-outside-toplevel
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+
+
+# Opis plików z danymi: kolumny pliku (w kolejności) z konwersją wartości, walidatory używane
+# w trybie `validate` oraz kolumny uzupełniane wartością wspólną dla całego ładowania (`defaults`).
+# Tabele z kluczem głównym w pliku są ładowane z jawnymi identyfikatorami, dzięki czemu
+# klucze obce w kolejnych plikach wskazują na te same rekordy.
+LOAD_SPECS = {
+    "patients": {
+        "file": "patients_list.txt",
+        "columns": (
+            ("patient_id", int), ("first_name", str), ("last_name", str), ("pesel", str),
+            ("phone", str), ("email", str), ("address", str), ("date_of_birth", str),
+        ),
+        "validators": {
+            "first_name": validate_first_name,
+            "last_name": validate_last_name,
+            "pesel": partial(validate_pesel, existing_pesels=()),  # Unikalność sprawdza ograniczenie UNIQUE
+            "phone": validate_phone,
+            "email": validate_email,
+            "address": validate_address,
+            "date_of_birth": validate_date_of_birth,
+        },
+    },
+    "employees": {
+        "file": "employees_list.txt",
+        "columns": (
+            ("employee_id", int), ("first_name", str), ("last_name", str), ("email", str),
+            ("phone", str), ("profession", str), ("is_medical_staff", int),
+        ),
+        "validators": {
+            "first_name": validate_employee_first_name,
+            "last_name": validate_employee_last_name,
+            "email": validate_employee_email,
+            "phone": validate_employee_phone,
+            "profession": validate_profession,
+            "is_medical_staff": validate_is_medical_staff,
+        },
+    },
+    "roles": {
+        "file": "roles_list.txt",
+        "columns": (("role_name", str),),
+        "validators": {"role_name": validate_role_name},
+    },
+    "services": {
+        "file": "services_list.txt",
+        "columns": (("service_id", int), ("service_type", str), ("duration_minutes", int), ("service_price", float)),
+        "validators": {
+            "service_type": validate_service_type,
+            "duration_minutes": validate_duration_minutes,
+            "service_price": validate_service_price,
+        },
+    },
+    "specialties": {
+        "file": "specialties_list.txt",
+        "columns": (("specialty_id", int), ("specialty_name", str)),
+        "validators": {"specialty_name": validate_specialty_name},
+    },
+    "meeting_types": {
+        "file": "meeting_types_list.txt",
+        "columns": (("meeting_type_id", int), ("meeting_type", str)),
+        "validators": {"meeting_type": validate_meeting_type},
+    },
+    "room_types": {
+        "file": "room_types_list.txt",
+        "columns": (("room_type_id", int), ("room_type", str)),
+        "validators": {"room_type": validate_room_type},
+    },
+    "form_types": {
+        "file": "form_types_list.txt",
+        "columns": (("form_type_id", int), ("form_name", str)),
+        "validators": {"form_name": validate_form_name},
+    },
+    "employee_specialties": {
+        "file": "employee_specialties_list.txt",
+        "columns": (("employee_specialty_id", int), ("employee_id", int), ("specialty_id", int)),
+    },
+    "employee_services": {
+        "file": "employee_services_list.txt",
+        "columns": (("employee_service_id", int), ("employee_id", int), ("service_id", int)),
+    },
+    "users_accounts": {
+        "file": "users_list.txt",
+        "columns": (
+            ("username", str), ("password_hash", hash_password), ("role_id", int),
+            ("employee_id", int), ("is_active", int),
+        ),
+        "defaults": {
+            "created_at": lambda: datetime.now().strftime("%Y-%m-%d %H:%M"),
+            "expired": lambda: USERS_EXPIRED_AT,
+        },
+        "validators": {"created_at": validate_datetime_field, "expired": validate_datetime_field},
+    },
+    "assigned_patients": {
+        "file": "assigned_patients_list_v2.txt",
+        "columns": (("assignment_id", int), ("fk_patient_id", int), ("fk_employee_id", int)),
+    },
+    "rooms": {
+        "file": "rooms_list.txt",
+        "columns": (("room_id", int), ("room_number", int), ("floor", int), ("fk_room_type_id", int)),
+        "validators": {
+            "room_number": validate_room_number,
+            "floor": validate_floor,
+            "fk_room_type_id": validate_fk_room_type_id,
+        },
+    },
+    "room_reservations": {
+        "file": "room_reservations_list.txt",
+        "columns": (("reservation_id", int), ("fk_room_id", int), ("reservation_date", str), ("reservation_time", str)),
+        "validators": {
+            "reservation_date": validate_reservation_date,
+            "reservation_time": validate_reservation_time,
+        },
+    },
+    "appointments": {
+        "file": "appointments_list_v3.txt",
+        "columns": (
+            ("appointment_id", int), ("fk_assignment_id", int), ("fk_service_id", int), ("fk_reservation_id", int),
+            ("appointment_date", str), ("appointment_status", str), ("notes", str),
+        ),
+        "validators": {
+            "appointment_date": validate_date_format,
+            "appointment_status": validate_appointment_status,
+        },
+    },
+    "diagnoses": {
+        "file": "diagnoses_list.txt",
+        "columns": (("diagnosis_id", int), ("fk_appointment_id", int), ("description", str), ("icd11_code", str)),
+        "validators": {"description": validate_description, "icd11_code": validate_icd11_code},
+    },
+    "prescriptions": {
+        "file": "prescriptions_list.txt",
+        "columns": (
+            ("prescription_id", int), ("fk_appointment_id", int), ("medicine_name", str),
+            ("dosage", float), ("medicine_price", float), ("prescription_code", str),
+        ),
+        "validators": {
+            "medicine_name": validate_medicine_name,
+            "dosage": validate_dosage,
+            "medicine_price": validate_medicine_price,
+            "prescription_code": validate_prescription_code,
+        },
+    },
+    "internal_meetings": {
+        "file": "internal_meetings_list_v2.txt",
+        "columns": (
+            ("meeting_id", int), ("fk_meeting_type_id", int), ("fk_reservation_id", int),
+            ("meeting_date", str), ("notes", str), ("internal_meeting_status", str),
+        ),
+        "validators": {
+            "meeting_date": validate_meeting_date_format,
+            "notes": validate_notes_length,
+            "internal_meeting_status": validate_internal_meeting_status,
+        },
+    },
+    "meeting_participants": {
+        "file": "meeting_participants_list.txt",
+        "columns": (
+            ("participant_id", int), ("fk_meeting_id", int), ("fk_employee_id", int),
+            ("participant_role", str), ("attendance", str),
+        ),
+        "validators": {"participant_role": validate_participant_role, "attendance": validate_attendance},
+    },
+}
+
+
+def get_load_order(foreign_key_graph: dict, tables) -> list:
+    """
+    Ustala kolejność ładowania tabel zgodnie z zależnościami kluczy obcych
+    (tabela nadrzędna przed podrzędną). Przy braku zależności zachowywana jest kolejność `tables`.
+
+    :param foreign_key_graph: Graf {tabela: [tabele, do których tabela się odwołuje]}
+        (`SchemaCatalog.get_foreign_key_graph`).
+    :param tables: Tabele do załadowania.
+    :return: Lista tabel w kolejności ładowania.
+    :raises ValueError: Jeśli zależności tabel tworzą cykl.
+    """
+    tables = list(tables)
+    pending = set(tables)
+    order = []
+    while pending:
+        ready = [
+            table for table in tables
+            if table in pending
+            and not any(parent in pending and parent != table for parent in foreign_key_graph.get(table, []))
+        ]
+        if not ready:
+            raise ValueError(f"Cykliczne zależności kluczy obcych między tabelami: {', '.join(sorted(pending))}")
+        order.extend(ready)
+        pending.difference_update(ready)
+    return order
+
+
+class BulkLoader:
+    """
+    Ładuje dane z plików `lists_files/*.txt` do bazy danych.
+
+    - Pliki są czytane strumieniowo (`csv.reader`), a wiersze trafiają bezpośrednio do `executemany`.
+    - Każda tabela jest ładowana w jednej transakcji (czyszczenie tabeli + wstawienie wszystkich wierszy).
+    - Klucze obce są wyłączone na czas ładowania i sprawdzane raz na końcu (`PRAGMA foreign_key_check`).
+    - W trybie `validate` każdy wiersz przechodzi przez walidatory modeli, a wiersze z błędami
+      są pomijane i raportowane (zamiast przerywać ładowanie tabeli).
+    """
+
+    def __init__(self, db_controller, lists_directory: str = LISTS_DIRECTORY, validate: bool = False):
+        """
+        Inicjalizuje loader z kontrolerem bazy danych i katalogiem plików z danymi.
+        """
+        self.db_controller = db_controller
+        self.lists_directory = lists_directory
+        self.validate = validate
+        self.errors = []  # [{"table": ..., "line": ..., "message": ...}]
+
+    def _add_error(self, table_name, line_number, message):
+        self.errors.append({"table": table_name, "line": line_number, "message": message})
+
+    def iter_rows(self, table_name: str):
+        """
+        Zwraca generator krotek do wstawienia w tabeli `table_name`, czytając plik wiersz po wierszu.
+        Wiersze z niewłaściwą liczbą kolumn lub błędem konwersji (a w trybie `validate` również
+        z błędem walidacji) są pomijane i zapisywane w `errors`.
+        """
+        spec = LOAD_SPECS[table_name]
+        columns = spec["columns"]
+        validators = spec.get("validators", {}) if self.validate else {}
+        defaults = {column: factory() for column, factory in spec.get("defaults", {}).items()}
+        default_values = tuple(defaults.values())
+
+        file_path = os.path.join(self.lists_directory, spec["file"])
+        with open(file_path, "r", encoding="utf-8", newline="") as file:
+            for line_number, fields in enumerate(csv.reader(file), start=1):
+                if not fields or not any(field.strip() for field in fields):
+                    continue  # Pomijamy puste linie
+                if len(fields) != len(columns):
+                    self._add_error(table_name, line_number, f"Niewłaściwa liczba kolumn ({len(fields)}).")
+                    continue
+
+                try:
+                    row = {column: convert(field.strip()) for (column, convert), field in zip(columns, fields)}
+                    row.update(defaults)
+                    for column, validator in validators.items():
+                        validator(row[column])
+                except ValueError as e:
+                    self._add_error(table_name, line_number, str(e))
+                    continue
+
+                yield tuple(row[column] for column, _ in columns) + default_values
+
+    def load_table(self, table_name: str) -> dict:
+        """
+        Czyści tabelę i ładuje do niej wszystkie wiersze z pliku w jednej transakcji.
+
+        :return: Statystyki ładowania: {"table", "rows", "skipped", "seconds", "rows_per_second"}.
+        :raises RuntimeError: W przypadku błędu bazy danych (transakcja tabeli jest wycofywana).
+        """
+        spec = LOAD_SPECS[table_name]
+        column_names = [column for column, _ in spec["columns"]] + list(spec.get("defaults", {}))
+        query = (
+            f"INSERT INTO {table_name} ({', '.join(column_names)}) "
+            f"VALUES ({', '.join('?' for _ in column_names)})"
+        )
+        connection = self.db_controller.connection
+        errors_before = len(self.errors)
+
+        start = time.perf_counter()
+        try:
+            with connection:
+                connection.execute(f"DELETE FROM {table_name}")
+                connection.execute("DELETE FROM sqlite_sequence WHERE name = ?", (table_name,))
+                rows = connection.executemany(query, self.iter_rows(table_name)).rowcount
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Błąd podczas ładowania tabeli {table_name}: {e}") from e
+        seconds = time.perf_counter() - start
+
+        return {
+            "table": table_name,
+            "rows": rows,
+            "skipped": len(self.errors) - errors_before,
+            "seconds": seconds,
+            "rows_per_second": rows / seconds if seconds > 0 else 0.0,
+        }
+
+    def load_all(self, tables=None) -> dict:
+        """
+        Ładuje wskazane tabele (domyślnie wszystkie z `LOAD_SPECS`) w kolejności zależności kluczy obcych.
+
+        :return: Raport: {"tables": [statystyki tabel], "errors": [...], "foreign_key_violations": [...],
+            "seconds": czas całkowity}.
+        :raises ValueError: Jeśli podano tabelę spoza `LOAD_SPECS`.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        tables = list(LOAD_SPECS) if tables is None else list(tables)
+        unknown = [table for table in tables if table not in LOAD_SPECS]
+        if unknown:
+            raise ValueError(f"Brak pliku z danymi dla tabel: {', '.join(unknown)}")
+
+        self.db_controller.ensure_connection()
+        connection = self.db_controller.connection
+        order = get_load_order(self.db_controller.schema_catalog.get_foreign_key_graph(), tables)
+
+        start = time.perf_counter()
+        table_stats = []
+        try:
+            # PRAGMA foreign_keys nie działa wewnątrz transakcji
+            connection.commit()
+            connection.execute("PRAGMA foreign_keys = OFF")
+            for table_name in order:
+                table_stats.append(self.load_table(table_name))
+            violations = [
+                {"table": row[0], "rowid": row[1], "parent": row[2]}
+                for row in connection.execute("PRAGMA foreign_key_check").fetchall()
+            ]
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Błąd podczas sprawdzania kluczy obcych: {e}") from e
+        finally:
+            connection.execute("PRAGMA foreign_keys = ON")
+            self.db_controller.room_availability.invalidate()
+            self.db_controller.reference_cache.invalidate()
+
+        return {
+            "tables": table_stats,
+            "errors": list(self.errors),
+            "foreign_key_violations": violations,
+            "seconds": time.perf_counter() - start,
+        }
+
+
+def print_report(report: dict):
+    """
+    Wyświetla raport ładowania: liczbę wierszy i wydajność (wiersze/s) dla każdej tabeli.
+    """
+    print(f"{'Tabela':<24}{'Wiersze':>9}{'Pominięte':>11}{'Czas [s]':>11}{'Wiersze/s':>12}")
+    for stats in report["tables"]:
+        print(
+            f"{stats['table']:<24}{stats['rows']:>9}{stats['skipped']:>11}"
+            f"{stats['seconds']:>11.4f}{stats['rows_per_second']:>12.0f}"
+        )
+    total_rows = sum(stats["rows"] for stats in report["tables"])
+    print(f"Razem: {total_rows} wierszy w {report['seconds']:.3f} s")
+
+    for error in report["errors"]:
+        print(f"Ostrzeżenie: {error['table']}, wiersz {error['line']} pominięty - {error['message']}")
+    for violation in report["foreign_key_violations"]:
+        print(
+            f"Błąd klucza obcego: {violation['table']} (rowid {violation['rowid']}) "
+            f"wskazuje na nieistniejący rekord w {violation['parent']}"
+        )
+
+
+def main(argv=None) -> int:
+    """
+    Punkt wejścia wiersza poleceń: `python -m database.bulk_loader [--reset] [--validate] [--tables ...]`.
+    """
+    parser = argparse.ArgumentParser(description="Ładowanie danych startowych z plików lists_files/*.txt.")
+    parser.add_argument("--reset", action="store_true", help="Odtwórz strukturę tabel przed ładowaniem.")
+    parser.add_argument("--validate", action="store_true", help="Sprawdź wiersze walidatorami modeli.")
+    parser.add_argument("--tables", nargs="+", choices=list(LOAD_SPECS), help="Ładuj tylko wskazane tabele.")
+    parser.add_argument("--lists-dir", default=LISTS_DIRECTORY, help="Katalog z plikami *.txt.")
+    args = parser.parse_args(argv)
+
+    if args.reset:
+        from database.database_files.reset_database_v2 import reset_database # pylint: disable=import-outside-toplevel
+        reset_database()
+
+    db_controller = DatabaseController()
+    db_controller.connect_to_database()
+    try:
+        report = BulkLoader(db_controller, args.lists_dir, validate=args.validate).load_all(args.tables)
+    finally:
+        db_controller.close_connection()
+
+    print_report(report)
+    return 1 if report["foreign_key_violations"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
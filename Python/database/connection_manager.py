@@ -0,0 +1,183 @@
+# connection_manager.py
+
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from database.unit_of_work import UnitOfWorkConnection
+
+
+class ConnectionManager:
+    """
+    Klasa odpowiedzialna za tworzenie i przydzielanie połączeń SQLite.
+
+    - Każdy wątek otrzymuje własne połączenie do zapisu (połączeń sqlite3 nie należy współdzielić między wątkami).
+    - Czytelnicy mogą pobrać połączenie tylko do odczytu z puli (`read_connection`).
+    - Każde połączenie jest konfigurowane parametrami z profilu (`Config.get_connection_profile`):
+      tryb dziennika (WAL), `synchronous`, `cache_size`, `mmap_size` i `busy_timeout`.
+
+    Baza w pamięci (":memory:") istnieje tylko w jednym połączeniu, dlatego wszystkie wątki
+    i czytelnicy otrzymują wtedy to samo połączenie.
+    """
+
+    def __init__(self, database_path: str, profile: dict, on_connect=None, on_read_connect=None):
+        """
+        Inicjalizuje menedżera połączeń dla wskazanej bazy danych i profilu połączeń.
+
+        :param on_connect: Opcjonalna funkcja `on_connect(connection)` wywoływana dla każdego
+            nowego połączenia do zapisu (np. rejestracja autoryzatora).
+        :param on_read_connect: Opcjonalna funkcja `on_read_connect(connection)` wywoływana dla każdego
+            nowego połączenia tylko do odczytu (np. włączenie profilowania zapytań).
+        """
+        self.database_path = database_path
+        self.profile = profile
+        self.on_connect = on_connect
+        self.on_read_connect = on_read_connect
+        self.is_memory = database_path == ":memory:"
+        self.journal_mode = None  # Tryb dziennika zwrócony przez SQLite (np. "wal", "memory")
+
+        self._lock = threading.Lock()
+        self._thread_connections = {}  # {identyfikator_wątku: połączenie}
+        self._read_pool = queue.LifoQueue()
+        self._read_connections = []  # Wszystkie połączenia tylko do odczytu (również wypożyczone)
+
+    def _apply_pragmas(self, connection, read_only=False):
+        """
+        Ustawia parametry połączenia z profilu.
+        """
+        profile = self.profile
+        connection.execute(f"PRAGMA busy_timeout = {int(profile['busy_timeout'])}")
+        connection.execute(f"PRAGMA cache_size = {int(profile['cache_size'])}")
+        connection.execute(f"PRAGMA mmap_size = {int(profile['mmap_size'])}")
+        connection.execute(f"PRAGMA temp_store = {profile['temp_store']}")
+
+        if read_only:
+            connection.execute("PRAGMA query_only = ON")
+            return
+
+        # Tryb dziennika jest zapisywany w pliku bazy - wystarczy ustawić go w połączeniu do zapisu
+        self.journal_mode = connection.execute(f"PRAGMA journal_mode = {profile['journal_mode']}").fetchone()[0]
+        connection.execute(f"PRAGMA synchronous = {profile['synchronous']}")
+
+        # Włączenie obsługi kluczy obcych
+        connection.execute("PRAGMA foreign_keys = ON")
+
+    def _open_connection(self):
+        # check_same_thread=False pozwala zamknąć połączenie z innego wątku (close_all);
+        # do zapytań każde połączenie jest używane wyłącznie przez swój wątek
+        connection = sqlite3.connect(
+            self.database_path,
+            timeout=self.profile["busy_timeout"] / 1000,
+            cached_statements=self.profile["cached_statements"],
+            check_same_thread=False,
+            factory=UnitOfWorkConnection,  # Odkładanie commit() w jednostce pracy
+        )
+        connection.row_factory = sqlite3.Row
+        self._apply_pragmas(connection)
+        if self.on_connect is not None:
+            self.on_connect(connection)
+        return connection
+
+    def _open_read_connection(self):
+        uri = f"{Path(self.database_path).resolve().as_uri()}?mode=ro"
+        connection = sqlite3.connect(
+            uri,
+            uri=True,
+            timeout=self.profile["busy_timeout"] / 1000,
+            cached_statements=self.profile["cached_statements"],
+            check_same_thread=False,
+        )
+        connection.row_factory = sqlite3.Row
+        self._apply_pragmas(connection, read_only=True)
+        if self.on_read_connect is not None:
+            self.on_read_connect(connection)
+        return connection
+
+    def _thread_key(self):
+        # Baza w pamięci - jedno połączenie wspólne dla wszystkich wątków
+        return None if self.is_memory else threading.get_ident()
+
+    def get_connection(self):
+        """
+        Zwraca połączenie bieżącego wątku, tworząc je przy pierwszym wywołaniu.
+
+        :raises RuntimeError: W przypadku błędu podczas nawiązywania połączenia.
+        """
+        key = self._thread_key()
+        with self._lock:
+            connection = self._thread_connections.get(key)
+            if connection is None:
+                try:
+                    connection = self._open_connection()
+                except sqlite3.Error as e:
+                    raise RuntimeError(f"Błąd podczas łączenia z bazą danych: {e}") from e
+                self._thread_connections[key] = connection
+            return connection
+
+    def peek_connection(self):
+        """
+        Zwraca połączenie bieżącego wątku lub None, jeśli wątek nie ma jeszcze połączenia.
+        """
+        with self._lock:
+            return self._thread_connections.get(self._thread_key())
+
+    @contextmanager
+    def read_connection(self):
+        """
+        Wypożycza połączenie tylko do odczytu z puli na czas bloku `with`.
+
+        Gdy pula jest wyłączona (`read_pool_size` = 0) lub baza jest w pamięci,
+        zwracane jest połączenie bieżącego wątku.
+
+        Przykład:
+            with manager.read_connection() as connection:
+                rows = connection.execute("SELECT ...").fetchall()
+        """
+        pool_size = int(self.profile["read_pool_size"])
+        if self.is_memory or pool_size <= 0:
+            yield self.get_connection()
+            return
+
+        connection = None
+        with self._lock:
+            if self._read_pool.empty() and len(self._read_connections) < pool_size:
+                try:
+                    connection = self._open_read_connection()
+                except sqlite3.Error as e:
+                    raise RuntimeError(f"Błąd podczas łączenia z bazą danych (odczyt): {e}") from e
+                self._read_connections.append(connection)
+
+        if connection is None:
+            # Czekanie na zwolnienie połączenia przez innego czytelnika
+            connection = self._read_pool.get()
+
+        try:
+            yield connection
+        finally:
+            # Zakończenie ewentualnej transakcji odczytu, aby nie blokować checkpointu WAL
+            if connection.in_transaction:
+                connection.rollback()
+            self._read_pool.put(connection)
+
+    def close_thread_connection(self):
+        """
+        Zamyka połączenie bieżącego wątku (dla bazy w pamięci - wspólne połączenie).
+        """
+        with self._lock:
+            connection = self._thread_connections.pop(self._thread_key(), None)
+        if connection is not None:
+            connection.close()
+
+    def close_all(self):
+        """
+        Zamyka wszystkie połączenia wątków oraz połączenia z puli tylko do odczytu.
+        """
+        with self._lock:
+            connections = list(self._thread_connections.values()) + self._read_connections
+            self._thread_connections = {}
+            self._read_connections = []
+            self._read_pool = queue.LifoQueue()
+
+        for connection in connections:
+            connection.close()
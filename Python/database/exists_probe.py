@@ -0,0 +1,19 @@
+# exists_probe.py
+
+
+class ExistsProbe:
+    """
+    Pojedyncze sprawdzenie istnienia rekordu: `EXISTS (SELECT 1 FROM tabela WHERE kolumna = ? AND ...)`.
+
+    :param table_name: Nazwa tabeli.
+    :param conditions: Słownik {kolumna: wartość} łączony przez AND.
+    :param exclude: Opcjonalna para (kolumna, wartość) wykluczająca rekord (np. edytowany rekord
+        przy sprawdzaniu unikalności).
+    """
+
+    __slots__ = ("table_name", "conditions", "exclude")
+
+    def __init__(self, table_name: str, conditions: dict, exclude: tuple = None):
+        self.table_name = table_name
+        self.conditions = conditions
+        self.exclude = exclude
@@ -0,0 +1,215 @@
+# filter_cache.py
+
+import re
+import threading
+from collections import OrderedDict
+from database.id_sets import JSON_ID_SET_SQL, encode_id_set
+
+# Dozwolona postać nazwy kolumny: `kolumna` lub `alias.kolumna`
+IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)?$")
+
+COMPARISON_OPERATORS = ("=", ">", "<", ">=", "<=")
+SORT_DIRECTIONS = ("ASC", "DESC")
+
+
+class CompiledFilter:
+    """
+    Skompilowany kształt filtra: gotowy tekst warunku SQL oraz sposób przygotowania parametrów.
+    """
+
+    __slots__ = ("sql", "binders")
+
+    def __init__(self, sql, binders):
+        self.sql = sql
+        self.binders = binders  # Lista funkcji: wartość filtra -> lista parametrów
+
+    def bind(self, filters):
+        """
+        Zwraca listę parametrów zapytania dla filtrów o kształcie tego obiektu.
+        """
+        values = []
+        if filters:
+            for binder, filter_item in zip(self.binders, filters):
+                values.extend(binder(filter_item.get("value")))
+        return values
+
+
+def _bind_single(value):
+    return [value]
+
+
+def _bind_many(value):
+    return list(value)
+
+
+def _bind_id_set(value):
+    return [encode_id_set(value)]
+
+
+def _bind_none(_value):
+    return []
+
+
+def _bind_like(value):
+    # Dodajemy dokładniejsze dopasowanie wzorca
+    if not value.startswith("%") and not value.endswith("%"):
+        value = f"%{value}%"
+    return [value]
+
+
+class FilterCache:
+    """
+    Pamięć podręczna skompilowanych filtrów dla `DatabaseController.build_filters`.
+
+    Kluczem jest (tabela, kształt filtrów, sortowanie), gdzie kształt to lista
+    (kolumna, operator, liczba wartości) - bez samych wartości. Dzięki temu ten sam kształt
+    zawsze daje identyczny tekst SQL, który trafia w pamięć podręczną instrukcji sqlite3
+    (`cached_statements`), a nazwy kolumn są walidowane tylko raz na kształt.
+    Lista wartości operatora IN przekazywana jest jednym parametrem JSON (`json_each`),
+    więc jej długość nie zmienia kształtu.
+
+    Dla podanej tabeli kolumny są sprawdzane z katalogiem schematu (`SchemaCatalog`);
+    zmiana schematu (DDL) czyści skompilowane filtry. Bez tabeli (zapytania z JOIN) sprawdzana jest tylko poprawność identyfikatora.
+    """
+
+    def __init__(self, db_controller, max_size=256):
+        """
+        Inicjalizuje pamięć podręczną filtrów z kontrolerem bazy danych.
+        """
+        self.db_controller = db_controller
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._compiled = OrderedDict()  # {klucz: CompiledFilter} w kolejności ostatniego użycia
+        self._schema_version = None  # Wersja katalogu schematu, z którą zwalidowano filtry
+        self._lock = threading.Lock()  # Kontroler (i pamięć podręczna) jest współdzielony między wątkami
+
+    def get_table_columns(self, table_name):
+        """
+        Zwraca zbiór kolumn tabeli z katalogu schematu.
+
+        :raises ValueError: Jeśli tabela nie istnieje.
+        """
+        columns = self.db_controller.schema_catalog.get_columns(table_name)
+        if not columns:
+            raise ValueError(f"Nieznana tabela: {table_name}")
+        return frozenset(columns)
+
+    @staticmethod
+    def get_shape(filters, sort_by):
+        """
+        Zwraca kształt filtrów i sortowania (klucz bez wartości filtrów).
+        """
+        filter_shape = ()
+        if filters:
+            shape = []
+            for filter_item in filters:
+                operator = filter_item["operator"].upper()
+                value = filter_item.get("value")
+                if operator == "BETWEEN":
+                    arity = len(value) if isinstance(value, tuple) else -1
+                elif operator == "IN":
+                    # Lista wartości IN to jeden parametr JSON - liczba wartości nie zmienia kształtu
+                    arity = 1 if isinstance(value, (list, tuple)) else -1
+                else:
+                    arity = 1
+                shape.append((filter_item["column"], operator, arity))
+            filter_shape = tuple(shape)
+
+        sort_shape = tuple((column, direction.upper()) for column, direction in sort_by) if sort_by else ()
+        return filter_shape, sort_shape
+
+    def _validate_column(self, column, table_name):
+        if not isinstance(column, str) or not IDENTIFIER_PATTERN.match(column):
+            raise ValueError(f"Nieprawidłowa nazwa kolumny: {column}")
+        if table_name is not None and column not in self.get_table_columns(table_name):
+            raise ValueError(f"Nieprawidłowa kolumna: {column}. Tabela `{table_name}` nie zawiera takiej kolumny.")
+
+    def _compile(self, filter_shape, sort_shape, table_name):
+        query_string = "1=1"  # Domyślne zapytanie
+        binders = []
+
+        # Obsługa filtrów
+        if filter_shape:
+            conditions = []
+            for column, operator, arity in filter_shape:
+                self._validate_column(column, table_name)
+
+                # Obsługa różnych operatorów
+                if operator == "BETWEEN" and arity == 2:
+                    conditions.append(f"{column} BETWEEN ? AND ?")
+                    binders.append(_bind_many)
+                elif operator in COMPARISON_OPERATORS:
+                    conditions.append(f"{column} {operator} ?")
+                    binders.append(_bind_single)
+                elif operator == "LIKE":
+                    conditions.append(f"{column} LIKE ?")
+                    binders.append(_bind_like)
+                elif operator == "IN" and arity >= 0:
+                    conditions.append(f"{column} IN {JSON_ID_SET_SQL}")
+                    binders.append(_bind_id_set)
+                elif operator == "IS NULL":
+                    conditions.append(f"{column} IS NULL")
+                    binders.append(_bind_none)
+                elif operator == "IS NOT NULL":
+                    conditions.append(f"{column} IS NOT NULL")
+                    binders.append(_bind_none)
+                else:
+                    raise ValueError(f"Nieobsługiwany operator: {operator}")
+
+            query_string += " AND " + " AND ".join(conditions)
+
+        # Obsługa sortowania
+        if sort_shape:
+            sort_clauses = []
+            for column, direction in sort_shape:
+                if direction not in SORT_DIRECTIONS:
+                    raise ValueError(f"Nieobsługiwany kierunek sortowania: {direction}")
+                self._validate_column(column, table_name)
+                sort_clauses.append(f"{column} {direction}")
+            query_string += " ORDER BY " + ", ".join(sort_clauses)
+
+        return CompiledFilter(query_string, binders)
+
+    def get(self, filters=None, sort_by=None, table_name=None):
+        """
+        Zwraca skompilowany filtr dla kształtu filtrów i sortowania, kompilując go przy pierwszym użyciu.
+
+        :raises ValueError: Przy nieobsługiwanym operatorze, kierunku sortowania lub nieprawidłowej kolumnie.
+        """
+        filter_shape, sort_shape = self.get_shape(filters, sort_by)
+        key = (table_name, filter_shape, sort_shape)
+
+        # Filtry zwalidowane z poprzednią wersją schematu są nieaktualne
+        schema_version = self.db_controller.schema_catalog.version
+        if schema_version != self._schema_version:
+            self.clear()
+            self._schema_version = schema_version
+
+        with self._lock:
+            compiled = self._compiled.get(key)
+            if compiled is not None:
+                self.hits += 1
+                self._compiled.move_to_end(key)
+                return compiled
+            self.misses += 1
+
+        compiled = self._compile(filter_shape, sort_shape, table_name)
+        with self._lock:
+            self._compiled[key] = compiled
+            if len(self._compiled) > self.max_size:
+                self._compiled.popitem(last=False)
+        return compiled
+
+    def clear(self):
+        """
+        Czyści skompilowane filtry (np. po zmianie schematu).
+        """
+        with self._lock:
+            self._compiled.clear()
+
+    def get_stats(self):
+        """
+        Zwraca statystyki pamięci podręcznej: trafienia, chybienia i liczbę kształtów.
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._compiled)}
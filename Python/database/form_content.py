@@ -0,0 +1,306 @@
+# form_content.py
+
+import argparse
+import io
+import sqlite3
+import sys
+import zlib
+from contextlib import ExitStack
+from controllers.database_controller import DatabaseController
+
+# Treść formularzy skompresowana zlib, poza tabelą `patient_forms` - listy formularzy
+# odczytują tylko metadane, a treść jest pobierana lub strumieniowana dla jednego formularza.
+CONTENT_TABLE = "patient_form_contents"
+
+# fk_patient_form_id jest aliasem rowid, więc `Connection.blobopen` otwiera treść po ID formularza
+CONTENT_TABLE_SQL = f"""CREATE TABLE IF NOT EXISTS {CONTENT_TABLE} (
+    fk_patient_form_id INTEGER PRIMARY KEY,
+    content BLOB NOT NULL,
+    is_text INTEGER NOT NULL DEFAULT 1 CHECK (is_text IN (0, 1)),
+    original_size INTEGER NOT NULL,
+    compressed_size INTEGER NOT NULL,
+    FOREIGN KEY (fk_patient_form_id) REFERENCES patient_forms(patient_form_id) ON DELETE CASCADE ON UPDATE CASCADE
+)"""
+
+COMPRESSION_LEVEL = 6
+# Rozmiar fragmentu odczytywanego z BLOB i maksymalny rozmiar jednej porcji po dekompresji
+CHUNK_SIZE = 64 * 1024
+# Liczba formularzy przenoszonych w jednej porcji migracji
+MIGRATION_BATCH_SIZE = 500
+
+SAVE_CONTENT_QUERY = f"""
+INSERT INTO {CONTENT_TABLE} (fk_patient_form_id, content, is_text, original_size, compressed_size)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (fk_patient_form_id) DO UPDATE SET
+    content = excluded.content,
+    is_text = excluded.is_text,
+    original_size = excluded.original_size,
+    compressed_size = excluded.compressed_size
+"""
+
+
+def compress_content(content) -> tuple:
+    """
+    Kompresuje treść formularza (tekst zapisywany jako UTF-8 lub bajty, np. skan załącznika).
+
+    :return: Krotka (skompresowane bajty, is_text, rozmiar oryginalny w bajtach).
+    :raises ValueError: Jeśli treść nie jest tekstem ani bajtami.
+    """
+    if isinstance(content, str):
+        data, is_text = content.encode("utf-8"), 1
+    elif isinstance(content, (bytes, bytearray, memoryview)):
+        data, is_text = bytes(content), 0
+    else:
+        raise ValueError(f"Nieprawidłowy typ treści formularza: {type(content).__name__}")
+    return zlib.compress(data, COMPRESSION_LEVEL), is_text, len(data)
+
+
+class FormContentReader(io.RawIOBase):
+    """
+    Strumień tylko do odczytu zdekompresowanej treści formularza.
+
+    Treść jest czytana z bazy fragmentami (`Connection.blobopen`) i dekompresowana przyrostowo,
+    więc w pamięci jest najwyżej jeden fragment BLOB i jedna porcja wyniku - niezależnie od
+    rozmiaru formularza. Strumień należy zamknąć (`with`), aby zwolnić uchwyt BLOB i połączenie.
+    Treść tekstową można czytać jako tekst przez `io.TextIOWrapper(reader, encoding="utf-8")`.
+    """
+
+    def __init__(self, blob, is_text: bool, original_size: int, exit_stack: ExitStack, chunk_size: int = CHUNK_SIZE):
+        super().__init__()
+        self.is_text = bool(is_text)
+        self.original_size = original_size
+        self._blob = blob
+        self._exit_stack = exit_stack
+        self._chunk_size = chunk_size
+        self._decompressor = zlib.decompressobj()
+        self._pending = b""
+        self._finished = False
+
+    def readable(self) -> bool:
+        return True
+
+    def _fill(self):
+        # Porcje nie większe niż `chunk_size` - nadmiar czeka w `unconsumed_tail` dekompresora
+        while not self._pending and not self._finished:
+            if self._decompressor.unconsumed_tail:
+                self._pending = self._decompressor.decompress(self._decompressor.unconsumed_tail, self._chunk_size)
+                continue
+            chunk = self._blob.read(self._chunk_size)
+            if chunk:
+                self._pending = self._decompressor.decompress(chunk, self._chunk_size)
+            else:
+                self._pending = self._decompressor.flush()
+                self._finished = True
+
+    def readinto(self, buffer) -> int:
+        if self.closed:
+            raise ValueError("Odczyt z zamkniętego strumienia treści formularza.")
+        self._fill()
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def close(self):
+        if not self.closed:
+            try:
+                self._blob.close()
+            finally:
+                self._exit_stack.close()
+        super().close()
+
+
+class FormContentStore:
+    """
+    Klasa odpowiedzialna za skompresowaną treść formularzy pacjentów (`patient_form_contents`).
+
+    Zapis i usunięcie treści korzystają z połączenia bieżącego wątku i nie zatwierdzają transakcji -
+    robi to wywołujący model. Odczyt pojedynczej treści i strumieniowanie korzystają z połączeń
+    tylko do odczytu. Treść zapisana przed migracją w `patient_forms.content` przenosi `apply`
+    (`python -m database.form_content`).
+    """
+
+    def __init__(self, db_controller):
+        """
+        Inicjalizuje magazyn treści formularzy z kontrolerem bazy danych.
+        """
+        self.db_controller = db_controller
+
+    def create_table(self) -> bool:
+        """
+        Tworzy tabelę treści formularzy, jeśli jeszcze nie istnieje.
+
+        :return: True, jeśli tabela została utworzona.
+        """
+        if self.db_controller.table_exists(CONTENT_TABLE):
+            return False
+        self.db_controller.connection.execute(CONTENT_TABLE_SQL)
+        return True
+
+    def save(self, patient_form_id: int, content):
+        """
+        Zapisuje (lub zastępuje) skompresowaną treść formularza. Treść None usuwa zapisaną treść.
+
+        :raises ValueError: Jeśli treść nie jest tekstem ani bajtami.
+        :raises sqlite3.Error: W przypadku błędu bazy danych.
+        """
+        if content is None:
+            self.delete(patient_form_id)
+            return
+        compressed, is_text, original_size = compress_content(content)
+        self.db_controller.connection.execute(
+            SAVE_CONTENT_QUERY, (patient_form_id, compressed, is_text, original_size, len(compressed))
+        )
+
+    def delete(self, patient_form_id: int):
+        """
+        Usuwa treść formularza.
+
+        :raises sqlite3.Error: W przypadku błędu bazy danych.
+        """
+        self.db_controller.connection.execute(
+            f"DELETE FROM {CONTENT_TABLE} WHERE fk_patient_form_id = ?", (patient_form_id,)
+        )
+
+    def load(self, patient_form_id: int):
+        """
+        Zwraca całą zdekompresowaną treść formularza (str dla treści tekstowej, bytes dla binarnej)
+        lub None, jeśli formularz nie ma treści. Duże treści należy czytać przez `open`.
+
+        :raises sqlite3.Error: W przypadku błędu bazy danych.
+        """
+        with self.db_controller.read_connection() as connection:
+            row = connection.execute(
+                f"SELECT content, is_text FROM {CONTENT_TABLE} WHERE fk_patient_form_id = ?", (patient_form_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        data = zlib.decompress(row[0])
+        return data.decode("utf-8") if row[1] else data
+
+    def open(self, patient_form_id: int, chunk_size: int = CHUNK_SIZE):
+        """
+        Otwiera strumień zdekompresowanej treści formularza (`FormContentReader`) lub zwraca None,
+        jeśli formularz nie ma treści. Połączenie tylko do odczytu jest wypożyczone do zamknięcia strumienia.
+
+        :raises sqlite3.Error: W przypadku błędu bazy danych.
+        """
+        with ExitStack() as exit_stack:
+            connection = exit_stack.enter_context(self.db_controller.read_connection())
+            row = connection.execute(
+                f"SELECT is_text, original_size FROM {CONTENT_TABLE} WHERE fk_patient_form_id = ?", (patient_form_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            blob = connection.blobopen(CONTENT_TABLE, "content", patient_form_id, readonly=True)
+            return FormContentReader(blob, row[0], row[1], exit_stack.pop_all(), chunk_size)
+
+    def get_statistics(self) -> dict:
+        """
+        Zwraca statystyki rozmiaru treści formularzy.
+
+        :return: Słownik {"forms", "text_forms", "original_size", "compressed_size", "largest_size",
+            "ratio" (rozmiar skompresowany / oryginalny, 0.0 bez treści)}.
+        :raises sqlite3.Error: W przypadku błędu bazy danych.
+        """
+        with self.db_controller.read_connection() as connection:
+            row = connection.execute(f"""
+                SELECT COUNT(*), COALESCE(SUM(is_text), 0), COALESCE(SUM(original_size), 0),
+                       COALESCE(SUM(compressed_size), 0), COALESCE(MAX(original_size), 0)
+                FROM {CONTENT_TABLE}
+            """).fetchone()
+        forms, text_forms, original_size, compressed_size, largest_size = row
+        return {
+            "forms": forms,
+            "text_forms": text_forms,
+            "original_size": original_size,
+            "compressed_size": compressed_size,
+            "largest_size": largest_size,
+            "ratio": compressed_size / original_size if original_size else 0.0,
+        }
+
+    def _migrate_legacy_content(self) -> int:
+        connection = self.db_controller.connection
+        migrated = 0
+        last_id = 0
+        while True:
+            rows = connection.execute(
+                """
+                SELECT patient_form_id, content FROM patient_forms
+                WHERE content IS NOT NULL AND patient_form_id > ?
+                ORDER BY patient_form_id LIMIT ?
+                """,
+                (last_id, MIGRATION_BATCH_SIZE),
+            ).fetchall()
+            if not rows:
+                return migrated
+            batch = []
+            for patient_form_id, content in rows:
+                compressed, is_text, original_size = compress_content(content)
+                batch.append((patient_form_id, compressed, is_text, original_size, len(compressed)))
+            connection.executemany(SAVE_CONTENT_QUERY, batch)
+            connection.executemany(
+                "UPDATE patient_forms SET content = NULL WHERE patient_form_id = ?", [(row[0],) for row in rows]
+            )
+            migrated += len(rows)
+            last_id = rows[-1][0]
+
+    def apply(self) -> dict:
+        """
+        Tworzy tabelę treści i przenosi do niej (po kompresji) treść zapisaną w `patient_forms.content`.
+        Kolumna `patient_forms.content` pozostaje w tabeli, ale po migracji zawiera NULL.
+        Bez tabeli `patient_forms` migracja nic nie zmienia.
+
+        :return: Słownik z listą `created_tables`, liczbą `migrated` przeniesionych treści i flagą `skipped`.
+        :raises RuntimeError: W przypadku błędu bazy danych lub treści o nieobsługiwanym typie.
+        """
+        report = {"created_tables": [], "migrated": 0, "skipped": False}
+        try:
+            self.db_controller.ensure_connection()
+            if not self.db_controller.schema_catalog.has_table("patient_forms"):
+                report["skipped"] = True
+                return report
+
+            with self.db_controller.connection:
+                if self.create_table():
+                    report["created_tables"].append(CONTENT_TABLE)
+                report["migrated"] = self._migrate_legacy_content()
+            return report
+        except (sqlite3.Error, ValueError) as e:
+            raise RuntimeError(f"Błąd podczas migracji treści formularzy: {e}") from e
+
+
+def main(argv=None) -> int:
+    """
+    Punkt wejścia wiersza poleceń: `python -m database.form_content [--stats]`.
+    """
+    parser = argparse.ArgumentParser(description="Skompresowana treść formularzy pacjentów (patient_form_contents).")
+    parser.add_argument("--stats", action="store_true", help="Wypisz statystyki rozmiaru treści formularzy.")
+    args = parser.parse_args(argv)
+
+    db_controller = DatabaseController()
+    db_controller.connect_to_database()
+    try:
+        store = FormContentStore(db_controller)
+        report = store.apply()
+        statistics = store.get_statistics() if args.stats and not report["skipped"] else None
+    finally:
+        db_controller.close_connection()
+
+    if report["skipped"]:
+        print("Brak tabeli patient_forms - treść formularzy nie została przeniesiona.")
+        return 1
+    for table_name in report["created_tables"]:
+        print(f"Utworzono tabelę: {table_name}")
+    print(f"Przeniesiono treść {report['migrated']} formularzy.")
+    if statistics:
+        print(
+            f"Formularze z treścią: {statistics['forms']}, rozmiar: {statistics['original_size']} B, "
+            f"po kompresji: {statistics['compressed_size']} B (współczynnik {statistics['ratio']:.2f}), "
+            f"największy: {statistics['largest_size']} B."
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
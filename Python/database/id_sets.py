@@ -0,0 +1,116 @@
+# id_sets.py
+
+import itertools
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# Zbiór wartości przekazywany jednym parametrem (tablica JSON), np. `WHERE patient_id IN (SELECT value FROM json_each(?))`.
+# Tekst zapytania nie zależy od liczby wartości, więc nie przekracza limitu parametrów SQLite
+# (SQLITE_MAX_VARIABLE_NUMBER) i trafia w pamięć podręczną instrukcji sqlite3.
+JSON_ID_SET_SQL = "(SELECT value FROM json_each(?))"
+
+# Od tej liczby wartości zbiór jest zapisywany w tabeli tymczasowej połączenia (z kluczem głównym)
+TEMP_TABLE_THRESHOLD = 10000
+
+TEMP_TABLE_NAME = "id_set_values"
+
+
+def encode_id_set(ids) -> str:
+    """
+    Zamienia kolekcję wartości na tablicę JSON (bez duplikatów, z zachowaniem kolejności).
+
+    Przykład:
+        encode_id_set([3, 1, 3])  # '[3, 1]'
+    """
+    return json.dumps(list(dict.fromkeys(ids)))
+
+
+def json_id_set(ids) -> tuple:
+    """
+    Zwraca podzapytanie i parametry zbioru wartości przekazanego jako tablica JSON.
+
+    Przykład:
+        id_set_sql, id_set_params = json_id_set(patient_ids)
+        connection.execute(f"SELECT * FROM patients WHERE patient_id IN {id_set_sql}", id_set_params)
+
+    :return: Krotka (podzapytanie SQL, lista parametrów).
+    """
+    return JSON_ID_SET_SQL, [encode_id_set(ids)]
+
+
+class IdSetBinder:
+    """
+    Klasa przekazująca zbiory ID do zapytań SQL bez generowania `IN (?, ?, …)` z jednym
+    parametrem na wartość.
+
+    Zbiory mniejsze niż `temp_table_threshold` przekazywane są jako jeden parametr JSON
+    (`json_each`). Większe zbiory zapisywane są w tabeli tymczasowej połączenia
+    `temp.id_set_values` (klucz główny (set_id, value)), po której SQLite może wyszukiwać
+    bez budowania indeksu tymczasowego dla każdego zapytania. Wiersze zbioru są usuwane
+    po wyjściu z bloku `with`.
+    """
+
+    def __init__(self, db_controller, temp_table_threshold=TEMP_TABLE_THRESHOLD):
+        """
+        Inicjalizuje obiekt wiązania zbiorów ID z kontrolerem bazy danych.
+        """
+        self.db_controller = db_controller
+        self.temp_table_threshold = temp_table_threshold
+        self._set_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _ensure_temp_table(connection):
+        # Sprawdzenie bez instrukcji DDL - utworzenie tabeli unieważnia katalog schematu
+        exists = connection.execute(
+            "SELECT 1 FROM temp.sqlite_master WHERE type = 'table' AND name = ?", (TEMP_TABLE_NAME,)
+        ).fetchone()
+        if exists is None:
+            connection.execute(
+                f"CREATE TEMP TABLE IF NOT EXISTS {TEMP_TABLE_NAME} ("
+                "set_id INTEGER NOT NULL, value NOT NULL, PRIMARY KEY (set_id, value)) WITHOUT ROWID"
+            )
+
+    @contextmanager
+    def bind(self, ids, connection=None):
+        """
+        Udostępnia zbiór ID jako podzapytanie SQL na czas bloku `with`.
+
+        Przykład:
+            with db_controller.id_sets.bind(appointment_ids) as (id_set_sql, id_set_params):
+                rows = connection.execute(
+                    f"SELECT * FROM diagnoses WHERE fk_appointment_id IN {id_set_sql}", id_set_params
+                ).fetchall()
+
+        :param ids: Kolekcja wartości (liczby lub teksty).
+        :param connection: Połączenie, na którym zostanie wykonane zapytanie (domyślnie połączenie bieżącego wątku).
+        :return: Krotka (podzapytanie SQL, lista parametrów).
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        values = list(dict.fromkeys(ids))
+        if len(values) < self.temp_table_threshold:
+            yield JSON_ID_SET_SQL, [json.dumps(values)]
+            return
+
+        connection = connection or self.db_controller.connection
+        with self._lock:
+            set_id = next(self._set_ids)
+        started_transaction = not connection.in_transaction
+        try:
+            self._ensure_temp_table(connection)
+            connection.executemany(
+                f"INSERT INTO temp.{TEMP_TABLE_NAME} (set_id, value) VALUES (?, ?)",
+                ((set_id, value) for value in values),
+            )
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Błąd podczas zapisu zbioru ID w tabeli tymczasowej: {e}") from e
+
+        try:
+            yield f"(SELECT value FROM temp.{TEMP_TABLE_NAME} WHERE set_id = ?)", [set_id]
+        finally:
+            connection.execute(f"DELETE FROM temp.{TEMP_TABLE_NAME} WHERE set_id = ?", (set_id,))
+            # Transakcja rozpoczęta tylko dla tabeli tymczasowej nie może blokować kolejnych zapisów
+            if started_transaction and connection.in_transaction:
+                connection.commit()
@@ -0,0 +1,181 @@
+# indexes.py
+
+import sqlite3
+from controllers.database_controller import DatabaseController
+
+# Prefiks indeksów zarządzanych przez rejestr. Indeksy z tym prefiksem, których nie ma
+# w rejestrze, są usuwane podczas migracji (np. po zmianie nazwy lub kolumn indeksu).
+INDEX_PREFIX = "idx_"
+
+# Rejestr indeksów pomocniczych: (nazwa_indeksu, tabela, kolumny).
+# Kolumny FK objęte już lewą częścią ograniczenia UNIQUE (np. employee_specialties.employee_id,
+# assigned_patients.fk_patient_id, role_permissions.role_id) nie wymagają osobnego indeksu.
+INDEX_REGISTRY = (
+    # employee_specialties / employee_services
+    ("idx_employee_specialties_specialty_id", "employee_specialties", ("specialty_id",)),
+    ("idx_employee_services_service_id", "employee_services", ("service_id",)),
+
+    # users_accounts
+    ("idx_users_accounts_role_id", "users_accounts", ("role_id",)),
+
+    # role_permissions
+    ("idx_role_permissions_permission_id", "role_permissions", ("permission_id",)),
+
+    # assigned_patients
+    ("idx_assigned_patients_fk_employee_id", "assigned_patients", ("fk_employee_id", "fk_patient_id")),
+
+    # rooms / room_reservations
+    ("idx_rooms_fk_room_type_id", "rooms", ("fk_room_type_id",)),
+    ("idx_room_reservations_room_date", "room_reservations", ("fk_room_id", "reservation_date")),
+    ("idx_room_reservations_date", "room_reservations", ("reservation_date",)),
+    ("idx_room_reservations_start_ts", "room_reservations", ("start_ts",)),
+    ("idx_room_reservations_room_start_ts", "room_reservations", ("fk_room_id", "start_ts")),
+
+    # appointments
+    ("idx_appointments_assignment_date", "appointments", ("fk_assignment_id", "appointment_date")),
+    ("idx_appointments_fk_service_id", "appointments", ("fk_service_id",)),
+    ("idx_appointments_fk_reservation_id", "appointments", ("fk_reservation_id",)),
+    ("idx_appointments_date", "appointments", ("appointment_date",)),
+    ("idx_appointments_start_ts", "appointments", ("start_ts",)),
+    ("idx_appointments_assignment_start_ts", "appointments", ("fk_assignment_id", "start_ts")),
+
+    # diagnoses / prescriptions
+    ("idx_diagnoses_fk_appointment_id", "diagnoses", ("fk_appointment_id",)),
+    ("idx_prescriptions_fk_appointment_id", "prescriptions", ("fk_appointment_id",)),
+
+    # internal_meetings / meeting_participants
+    ("idx_internal_meetings_fk_meeting_type_id", "internal_meetings", ("fk_meeting_type_id",)),
+    ("idx_internal_meetings_fk_reservation_id", "internal_meetings", ("fk_reservation_id",)),
+    ("idx_internal_meetings_date", "internal_meetings", ("meeting_date",)),
+    ("idx_meeting_participants_fk_meeting_id", "meeting_participants", ("fk_meeting_id",)),
+    ("idx_meeting_participants_employee_meeting", "meeting_participants", ("fk_employee_id", "fk_meeting_id")),
+
+    # patient_forms
+    ("idx_patient_forms_fk_patient_id", "patient_forms", ("fk_patient_id", "submission_date")),
+    ("idx_patient_forms_fk_form_type_id", "patient_forms", ("fk_form_type_id",)),
+)
+
+
+def find_full_scans(plan: list) -> list:
+    """
+    Zwraca kroki planu zapytania (EXPLAIN QUERY PLAN), które są pełnym skanem tabeli.
+
+    Skan indeksu pokrywającego (`SCAN t USING COVERING INDEX ...`) również jest traktowany
+    jako pełny skan, ponieważ jego koszt rośnie liniowo z rozmiarem tabeli. `SCAN CONSTANT ROW`
+    (zapytanie bez tabeli, np. `SELECT EXISTS (...), EXISTS (...)`) ani skan `json_each` (zbiór ID
+    przekazany parametrem, `database/id_sets.py`) nie są skanem tabeli.
+
+    :param plan: Lista opisów kroków planu, np. ["SEARCH appointments USING INDEX ..."].
+    :return: Lista kroków zaczynających się od `SCAN`.
+    """
+    return [
+        detail for detail in plan
+        if detail.startswith("SCAN ") and detail != "SCAN CONSTANT ROW"
+        and not detail.startswith("SCAN json_each VIRTUAL TABLE")
+    ]
+
+
+class IndexManager:
+    """
+    Klasa odpowiedzialna za tworzenie i migrację indeksów z rejestru `INDEX_REGISTRY`.
+    """
+
+    def __init__(self, db_controller: DatabaseController, registry=INDEX_REGISTRY):
+        """
+        Inicjalizuje menedżera indeksów z kontrolerem bazy danych.
+        """
+        self.db_controller = db_controller
+        self.registry = registry
+
+    def get_table_columns(self, table_name: str) -> list:
+        """
+        Pobiera listę kolumn tabeli z katalogu schematu lub pustą listę, jeśli tabela nie istnieje.
+        """
+        return self.db_controller.schema_catalog.get_columns(table_name)
+
+    def get_index_columns(self, index_name: str) -> tuple:
+        """
+        Pobiera kolumny istniejącego indeksu w kolejności lub pustą krotkę, jeśli indeks nie istnieje.
+        """
+        cursor = self.db_controller.connection.execute(f"PRAGMA index_info({index_name})")
+        return tuple(row[2] for row in sorted(cursor.fetchall(), key=lambda row: row[0]))
+
+    def get_managed_indexes(self) -> dict:
+        """
+        Pobiera indeksy z prefiksem `INDEX_PREFIX` istniejące w bazie.
+
+        :return: Słownik {nazwa_indeksu: tabela}.
+        """
+        query = "SELECT name, tbl_name FROM sqlite_master WHERE type = 'index' AND name LIKE ?"
+        cursor = self.db_controller.connection.execute(query, (f"{INDEX_PREFIX}%",))
+        return {row[0]: row[1] for row in cursor.fetchall()}
+
+    def apply_indexes(self) -> dict:
+        """
+        Tworzy brakujące indeksy z rejestru, odtwarza indeksy o zmienionych kolumnach
+        i usuwa indeksy z prefiksem `INDEX_PREFIX`, których nie ma już w rejestrze.
+
+        Indeksy dla tabel lub kolumn nieobecnych w bazie są pomijane.
+
+        :return: Słownik z listami nazw indeksów: `created`, `recreated`, `dropped`, `skipped`.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        report = {"created": [], "recreated": [], "dropped": [], "skipped": []}
+        try:
+            self.db_controller.ensure_connection()
+            connection = self.db_controller.connection
+            existing = self.get_managed_indexes()
+            registered_names = {name for name, _, _ in self.registry}
+            table_columns = {}
+
+            with connection:
+                # Usunięcie indeksów, które zniknęły z rejestru
+                for index_name in existing:
+                    if index_name not in registered_names:
+                        connection.execute(f"DROP INDEX IF EXISTS {index_name}")
+                        report["dropped"].append(index_name)
+
+                for index_name, table_name, columns in self.registry:
+                    if table_name not in table_columns:
+                        table_columns[table_name] = self.get_table_columns(table_name)
+
+                    # Pominięcie indeksów dla tabel/kolumn, których nie ma w bazie
+                    if not set(columns).issubset(table_columns[table_name]):
+                        report["skipped"].append(index_name)
+                        continue
+
+                    if index_name in existing:
+                        if existing[index_name] == table_name and self.get_index_columns(index_name) == tuple(columns):
+                            continue
+                        # Definicja indeksu się zmieniła - odtworzenie
+                        connection.execute(f"DROP INDEX IF EXISTS {index_name}")
+                        report["recreated"].append(index_name)
+                    else:
+                        report["created"].append(index_name)
+
+                    connection.execute(
+                        f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} ({', '.join(columns)})"
+                    )
+
+            # Odświeżenie statystyk planisty tylko wtedy, gdy zestaw indeksów się zmienił
+            if report["created"] or report["recreated"] or report["dropped"]:
+                connection.execute("PRAGMA optimize")
+
+            return report
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Błąd podczas tworzenia indeksów: {e}") from e
+
+    def explain_query_plan(self, query: str, params=()) -> list:
+        """
+        Zwraca opisy kroków planu zapytania (`EXPLAIN QUERY PLAN`).
+
+        :param query: Zapytanie SQL.
+        :param params: Parametry zapytania.
+        :return: Lista opisów kroków, np. ["SEARCH appointments USING INDEX ..."].
+        """
+        try:
+            self.db_controller.ensure_connection()
+            cursor = self.db_controller.connection.execute(f"EXPLAIN QUERY PLAN {query}", params)
+            return [row[3] for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Błąd podczas pobierania planu zapytania: {e}") from e
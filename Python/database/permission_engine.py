@@ -0,0 +1,258 @@
+# permission_engine.py
+
+import threading
+
+# Uprawnienia z tabeli `system_permissions` (lista z CHECK w models/permissions.py);
+# pozycja na liście to numer bitu w masce uprawnień roli
+PERMISSION_NAMES = (
+    "zarzadzaj_wszystkimi_pacjentami",
+    "przegladaj_przypisanych_pacjentow",
+    "edytuj_przypisanych_pacjentow",
+    "zarzadzaj_wizytami",
+    "zarzadzaj_swoimi_wizytami",
+    "zarzadzaj_pracownikami",
+    "zarzadzaj_rolami_i_uprawnieniami",
+    "zarzadzaj_pomieszczeniami",
+    "zarzadzaj_platnosciami",
+    "przegladaj_swoj_kalendarz",
+    "zarzadzaj_swoim_kalendarzem",
+    "przegladaj_kalendarz_placowki",
+    "zarzadzaj_spotkaniami_wewnetrznymi",
+    "zarzadzaj_typami_spotkan_wewnetrznych",
+    "zarzadzaj_uslugami",
+    "zarzadzaj_specjalnosciami",
+    "przegladaj_diagnozy",
+    "zarzadzaj_diagnozami",
+    "przegladaj_recepty",
+    "zarzadzaj_receptami",
+    "zarzadzaj_typami_formularzy",
+    "zarzadzaj_formularzami_pacjentow",
+)
+PERMISSION_BITS = {name: 1 << bit for bit, name in enumerate(PERMISSION_NAMES)}
+
+# Zakres wierszy dostępnych dla roli
+SCOPE_NONE = "none"  # Brak dostępu
+SCOPE_ASSIGNED = "assigned"  # Tylko dane pacjentów przypisanych do pracownika
+SCOPE_ALL = "all"  # Wszystkie dane
+
+
+def permission_mask(*permission_names) -> int:
+    """
+    Zamienia nazwy uprawnień na maskę bitową, np. ("przegladaj_diagnozy", "zarzadzaj_diagnozami") -> 0b11 << 16.
+    """
+    mask = 0
+    for permission_name in permission_names:
+        mask |= PERMISSION_BITS[permission_name]
+    return mask
+
+
+# Reguły dostępu: (akcja, zasób) -> maski uprawnień wymagane dla zakresu SCOPE_ALL i SCOPE_ASSIGNED
+# (None - zakres niedostępny dla tej akcji). Rola ma dany zakres, jeśli posiada wszystkie bity maski.
+ACCESS_RULES = {
+    ("view", "patients"): (
+        permission_mask("zarzadzaj_wszystkimi_pacjentami"),
+        permission_mask("przegladaj_przypisanych_pacjentow"),
+    ),
+    ("edit", "patients"): (
+        permission_mask("zarzadzaj_wszystkimi_pacjentami"),
+        permission_mask("edytuj_przypisanych_pacjentow"),
+    ),
+    ("delete", "patients"): (permission_mask("zarzadzaj_wszystkimi_pacjentami"), None),
+    ("view", "appointments"): (
+        permission_mask("zarzadzaj_wizytami"),
+        permission_mask("zarzadzaj_swoimi_wizytami"),
+    ),
+    ("edit", "appointments"): (
+        permission_mask("zarzadzaj_wizytami"),
+        permission_mask("zarzadzaj_swoimi_wizytami"),
+    ),
+    ("view", "diagnoses"): (
+        permission_mask("przegladaj_diagnozy", "zarzadzaj_wszystkimi_pacjentami"),
+        permission_mask("przegladaj_diagnozy", "przegladaj_przypisanych_pacjentow"),
+    ),
+    ("edit", "diagnoses"): (
+        permission_mask("zarzadzaj_diagnozami", "zarzadzaj_wszystkimi_pacjentami"),
+        permission_mask("zarzadzaj_diagnozami", "edytuj_przypisanych_pacjentow"),
+    ),
+    ("view", "prescriptions"): (
+        permission_mask("przegladaj_recepty", "zarzadzaj_wszystkimi_pacjentami"),
+        permission_mask("przegladaj_recepty", "przegladaj_przypisanych_pacjentow"),
+    ),
+    ("edit", "prescriptions"): (
+        permission_mask("zarzadzaj_receptami", "zarzadzaj_wszystkimi_pacjentami"),
+        permission_mask("zarzadzaj_receptami", "edytuj_przypisanych_pacjentow"),
+    ),
+    # Wystawianie recept - tylko lekarz prowadzący (recepty pacjentów przypisanych do pracownika),
+    # bez ról zarządzających receptami całej placówki
+    ("issue", "prescriptions"): (None, permission_mask("zarzadzaj_receptami", "edytuj_przypisanych_pacjentow")),
+    ("view", "users"): (permission_mask("zarzadzaj_rolami_i_uprawnieniami"), None),
+    ("edit", "rooms"): (permission_mask("zarzadzaj_pomieszczeniami"), None),
+    ("edit", "employees"): (permission_mask("zarzadzaj_pracownikami"), None),
+}
+
+# Uprawnienia ról używane dla ról bez wpisów w tabeli `role_permissions`
+# (odpowiadają dotychczasowym listom role_id w mostkach i serwisach)
+_FACILITY_PERMISSIONS = (
+    "zarzadzaj_wszystkimi_pacjentami", "zarzadzaj_wizytami", "przegladaj_diagnozy", "zarzadzaj_diagnozami",
+    "przegladaj_recepty", "zarzadzaj_receptami", "zarzadzaj_pomieszczeniami", "zarzadzaj_pracownikami",
+)
+_CLINICAL_PERMISSIONS = (
+    "przegladaj_przypisanych_pacjentow", "edytuj_przypisanych_pacjentow", "zarzadzaj_swoimi_wizytami",
+    "przegladaj_diagnozy", "zarzadzaj_diagnozami",
+)
+DEFAULT_ROLE_PERMISSIONS = {
+    1: _FACILITY_PERMISSIONS + ("zarzadzaj_rolami_i_uprawnieniami",),  # Administrator
+    2: _FACILITY_PERMISSIONS,  # Recepcjonista
+    3: _CLINICAL_PERMISSIONS + ("przegladaj_recepty", "zarzadzaj_receptami"),  # Psychiatra
+    4: _CLINICAL_PERMISSIONS,  # Psycholog kliniczny
+    5: _CLINICAL_PERMISSIONS,  # Psychoterapeuta
+    6: _CLINICAL_PERMISSIONS,  # Psychopedagog
+    7: _CLINICAL_PERMISSIONS,  # Terapeuta uzależnień
+    8: _CLINICAL_PERMISSIONS,  # Dietetyk kliniczny
+    9: _FACILITY_PERMISSIONS + ("zarzadzaj_rolami_i_uprawnieniami",),  # Informatyk
+    10: _FACILITY_PERMISSIONS,  # Kierownik
+}
+
+
+def compile_scopes(mask: int) -> dict:
+    """
+    Wyznacza zakres dostępu roli o danej masce dla każdej reguły z `ACCESS_RULES`.
+
+    :return: Słownik {(akcja, zasób): SCOPE_ALL | SCOPE_ASSIGNED} (reguły bez dostępu są pomijane).
+    """
+    scopes = {}
+    for rule, (all_mask, assigned_mask) in ACCESS_RULES.items():
+        if all_mask is not None and mask & all_mask == all_mask:
+            scopes[rule] = SCOPE_ALL
+        elif assigned_mask is not None and mask & assigned_mask == assigned_mask:
+            scopes[rule] = SCOPE_ASSIGNED
+    return scopes
+
+
+class PermissionEngine:
+    """
+    Silnik uprawnień oparty na tabelach `role_permissions` i `system_permissions`.
+
+    Uprawnienia każdej roli są kompilowane (przy starcie aplikacji lub pierwszym użyciu) do maski
+    bitowej, a z niej do słownika zakresów {(akcja, zasób): zakres}. Sprawdzenie `can` i `row_scope`
+    to odczyt ze słownika - bez zapytań do bazy w slotach mostków.
+
+    Role bez wpisów w tabeli `role_permissions` (także gdy tabela nie istnieje lub jest pusta) otrzymują
+    uprawnienia z `DEFAULT_ROLE_PERMISSIONS` - skonfigurowanie w tabeli części ról nie odbiera dostępu pozostałym.
+    Silnik jest unieważniany przez modele `RolePermissions` i `Permissions` po każdej zmianie,
+    więc zmiany administratora obowiązują bez ponownego uruchamiania aplikacji.
+    """
+
+    def __init__(self, db_controller):
+        """
+        Inicjalizuje silnik uprawnień z kontrolerem bazy danych.
+        """
+        self.db_controller = db_controller
+        self.version = 0  # Zwiększany przy każdym unieważnieniu
+        self._role_masks = None  # {role_id: maska}
+        self._role_scopes = None  # {role_id: {(akcja, zasób): zakres}}
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        """
+        Unieważnia skompilowane uprawnienia; zostaną wczytane ponownie przy następnym użyciu.
+        """
+        with self._lock:
+            self.version += 1
+            self._role_masks = None
+            self._role_scopes = None
+
+    def _load_role_masks(self) -> dict:
+        role_masks = {}
+        if self.db_controller.table_exists("role_permissions") and self.db_controller.table_exists("system_permissions"):
+            query = """
+            SELECT rp.role_id, sp.permission_name
+            FROM role_permissions rp
+            JOIN system_permissions sp ON rp.permission_id = sp.permission_id
+            """
+            with self.db_controller.read_connection() as connection:
+                for role_id, permission_name in connection.execute(query).fetchall():
+                    role_masks[role_id] = role_masks.get(role_id, 0) | PERMISSION_BITS.get(permission_name, 0)
+
+        for role_id, permission_names in DEFAULT_ROLE_PERMISSIONS.items():
+            if role_id not in role_masks:
+                role_masks[role_id] = permission_mask(*permission_names)
+        return role_masks
+
+    def load(self):
+        """
+        Kompiluje uprawnienia wszystkich ról do masek bitowych i słowników zakresów.
+        """
+        with self._lock:
+            version = self.version
+        role_masks = self._load_role_masks()
+        role_scopes = {role_id: compile_scopes(mask) for role_id, mask in role_masks.items()}
+        with self._lock:
+            # Uprawnienia zmienione w trakcie wczytywania nie są zapamiętywane
+            if self.version == version:
+                self._role_masks = role_masks
+                self._role_scopes = role_scopes
+        return role_scopes
+
+    def _get_scopes(self) -> dict:
+        with self._lock:
+            role_scopes = self._role_scopes
+        if role_scopes is None:
+            role_scopes = self.load()
+        return role_scopes
+
+    def get_role_mask(self, role_id: int) -> int:
+        """
+        Zwraca maskę bitową uprawnień roli (0, jeśli rola nie ma uprawnień).
+        """
+        self._get_scopes()
+        with self._lock:
+            role_masks = self._role_masks or {}
+        return role_masks.get(role_id, 0)
+
+    def get_roles_with_access(self, action: str, resource: str) -> list:
+        """
+        Zwraca posortowane ID ról, które mogą wykonać akcję na zasobie (w dowolnym zakresie),
+        np. role wystawiające recepty: `get_roles_with_access("issue", "prescriptions")`.
+
+        :raises KeyError: Jeśli para (akcja, zasób) nie jest zdefiniowana w `ACCESS_RULES`.
+        """
+        if (action, resource) not in ACCESS_RULES:
+            raise KeyError(f"Nieznana reguła dostępu: {action} {resource}")
+        return sorted(role_id for role_id, scopes in self._get_scopes().items() if (action, resource) in scopes)
+
+    def row_scope(self, session, action: str, resource: str) -> str:
+        """
+        Zwraca zakres wierszy, do których użytkownik sesji ma dostęp dla akcji na zasobie:
+        `SCOPE_ALL`, `SCOPE_ASSIGNED` (pacjenci przypisani do pracownika) lub `SCOPE_NONE`.
+
+        :raises KeyError: Jeśli para (akcja, zasób) nie jest zdefiniowana w `ACCESS_RULES`.
+        """
+        if (action, resource) not in ACCESS_RULES:
+            raise KeyError(f"Nieznana reguła dostępu: {action} {resource}")
+        if session is None:
+            return SCOPE_NONE
+        return self._get_scopes().get(session.role_id, {}).get((action, resource), SCOPE_NONE)
+
+    def can(self, session, action: str, resource: str) -> bool:
+        """
+        Sprawdza, czy użytkownik sesji może wykonać akcję na zasobie (w dowolnym zakresie).
+
+        Przykład:
+            permission_engine.can(session, "edit", "prescriptions")
+        """
+        return self.row_scope(session, action, resource) != SCOPE_NONE
+
+    def scope_condition(self, session, action: str, resource: str, employee_column: str) -> tuple:
+        """
+        Zamienia zakres wierszy na warunek SQL dla kolumny z ID pracownika (np. `ap.fk_employee_id`).
+
+        :return: Krotka (warunek, parametry), np. ("ap.fk_employee_id = ?", [5]) dla `SCOPE_ASSIGNED`,
+            ("1", []) dla `SCOPE_ALL` i ("0", []) przy braku dostępu.
+        """
+        scope = self.row_scope(session, action, resource)
+        if scope == SCOPE_ALL:
+            return "1", []
+        if scope == SCOPE_ASSIGNED and session.employee_id is not None:
+            return f"{employee_column} = ?", [session.employee_id]
+        return "0", []
@@ -0,0 +1,348 @@
+# profiler.py
+
+import csv
+import json
+import os
+import re
+import sys
+import threading
+import time
+from datetime import datetime
+from config import Config
+
+_PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GUI_DIR = os.path.join(_PYTHON_DIR, "gui")
+SERVICES_DIR = os.path.join(_PYTHON_DIR, "services")
+
+# Moduły infrastruktury mostków - ich funkcje nie są traktowane jako sloty
+IGNORED_GUI_MODULES = ("bridge_worker.py", "entity_list_model.py")
+
+NO_SLOT = "(poza slotem)"
+NO_SERVICE = "(poza serwisem)"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Zamienia literały na `?` i łączy białe znaki, aby instrukcje różniące się tylko
+    wartościami parametrów były liczone razem, np. "WHERE id = 5" -> "WHERE id = ?".
+    """
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def _code_name(code) -> str:
+    module = os.path.splitext(os.path.basename(code.co_filename))[0]
+    return f"{module}.{getattr(code, 'co_qualname', code.co_name)}"
+
+
+def is_slot_code(code) -> bool:
+    """
+    Sprawdza, czy funkcja pochodzi z modułu mostków (`gui/`) - wywołanie najbardziej zewnętrznej
+    takiej funkcji w wątku jest traktowane jako wywołanie slotu (lub zadania wątku roboczego).
+    """
+    filename = code.co_filename
+    return os.path.dirname(filename) == GUI_DIR and os.path.basename(filename) not in IGNORED_GUI_MODULES
+
+
+def is_service_code(code) -> bool:
+    """
+    Sprawdza, czy funkcja pochodzi z modułu serwisów (`services/`).
+    """
+    return os.path.dirname(code.co_filename) == SERVICES_DIR
+
+
+class _SlotInvocation:
+    """
+    Pojedyncze wywołanie slotu: czas rozpoczęcia, liczba zapytań i liczba powtórzeń każdej instrukcji.
+    """
+
+    __slots__ = ("name", "frame", "started", "queries", "statement_counts")
+
+    def __init__(self, name, frame, started):
+        self.name = name
+        self.frame = frame
+        self.started = started
+        self.queries = 0
+        self.statement_counts = {}
+
+
+class QueryProfiler:
+    """
+    Profiler zapytań SQL i slotów mostków QML (tryb profilowania, `APP_PROFILE=1`).
+
+    - Każde połączenie SQLite otrzymuje `set_trace_callback`. Czas instrukcji to czas od jej
+      rozpoczęcia do następnej instrukcji w tym wątku lub do powrotu z funkcji, która ją wykonała
+      (obejmuje więc również pobieranie wierszy). Instrukcja jest przypisywana do najbliższej
+      metody serwisu i do slotu.
+    - Wywołania slotów są wykrywane funkcją profilującą wątku (`sys.setprofile`), instalowaną
+      przy pierwszym zapytaniu w danym wątku. Dla każdego wywołania zapisywany jest czas, liczba
+      zapytań i największa liczba powtórzeń jednej instrukcji (wzorzec N+1).
+    - Gdy profilowanie jest wyłączone, profiler nie jest tworzony i nic nie jest instalowane.
+    """
+
+    def __init__(self, settings: dict, slot_filter=is_slot_code, service_filter=is_service_code):
+        """
+        Inicjalizuje profiler z ustawieniami z `Config.get_profiling_settings`.
+
+        :param slot_filter: Funkcja `slot_filter(code)` rozpoznająca funkcje slotów.
+        :param service_filter: Funkcja `service_filter(code)` rozpoznająca metody serwisów.
+        """
+        self.settings = settings
+        self.slot_filter = slot_filter
+        self.service_filter = service_filter
+        self.statements = {}  # {(instrukcja, serwis, slot): [liczba, czas_łączny, czas_maks]}
+        self.slots = {}  # {slot: {"calls", "total_time", "max_time", "queries", "max_queries", ...}}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._slot_codes = {}  # {code: nazwa slotu lub None}
+        self._last_summary = time.perf_counter()
+
+    # +-+-+-+- Instalacja +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+    def attach(self, connection):
+        """
+        Włącza śledzenie instrukcji połączenia SQLite.
+        """
+        connection.set_trace_callback(self._on_statement)
+
+    def detach(self, connection):
+        """
+        Wyłącza śledzenie instrukcji połączenia i usuwa funkcję profilującą bieżącego wątku.
+        """
+        connection.set_trace_callback(None)
+        if getattr(self._local, "installed", False):
+            self._finish_statement(time.perf_counter())
+            sys.setprofile(None)
+            self._local.installed = False
+
+    def _install_thread(self, now):
+        state = self._local
+        state.installed = True
+        state.invocation = None
+        state.pending = None
+        sys.setprofile(self._on_profile)
+
+        # Slot, który już trwa (np. zadanie wątku roboczego otwierające połączenie)
+        outermost = None
+        frame = sys._getframe(2)  # pylint: disable=protected-access
+        while frame is not None:
+            if self._get_slot_name(frame.f_code) is not None:
+                outermost = frame
+            frame = frame.f_back
+        if outermost is not None:
+            state.invocation = _SlotInvocation(self._get_slot_name(outermost.f_code), outermost, now)
+
+    def _get_slot_name(self, code):
+        name = self._slot_codes.get(code, False)
+        if name is False:
+            name = _code_name(code) if self.slot_filter(code) else None
+            self._slot_codes[code] = name
+        return name
+
+    # +-+-+-+- Wywołania slotów +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+    def _on_profile(self, frame, event, _arg):
+        if event == "call":
+            if self._local.invocation is None:
+                name = self._get_slot_name(frame.f_code)
+                if name is not None:
+                    self._local.invocation = _SlotInvocation(name, frame, time.perf_counter())
+        elif event == "return":
+            pending = self._local.pending
+            if pending is not None and pending[2] is frame:
+                self._finish_statement(time.perf_counter())
+            invocation = self._local.invocation
+            if invocation is not None and invocation.frame is frame:
+                self._finish_invocation(invocation, time.perf_counter())
+
+    def _finish_invocation(self, invocation, now):
+        self._finish_statement(now)
+        self._local.invocation = None
+        invocation.frame = None
+
+        duration = now - invocation.started
+        repeated_statement, repeated_count = max(
+            invocation.statement_counts.items(), key=lambda item: item[1], default=(None, 0)
+        )
+        with self._lock:
+            stats = self.slots.setdefault(invocation.name, {
+                "calls": 0, "total_time": 0.0, "max_time": 0.0, "queries": 0, "max_queries": 0,
+                "max_repeated_count": 0, "max_repeated_statement": None,
+            })
+            stats["calls"] += 1
+            stats["total_time"] += duration
+            stats["max_time"] = max(stats["max_time"], duration)
+            stats["queries"] += invocation.queries
+            stats["max_queries"] = max(stats["max_queries"], invocation.queries)
+            if repeated_count > stats["max_repeated_count"]:
+                stats["max_repeated_count"] = repeated_count
+                stats["max_repeated_statement"] = repeated_statement
+
+        interval = self.settings.get("summary_interval", 0)
+        if interval and now - self._last_summary >= interval:
+            self._last_summary = now
+            self.print_summary()
+
+    # +-+-+-+- Instrukcje SQL +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+    def _on_statement(self, sql):
+        now = time.perf_counter()
+        state = self._local
+        if not getattr(state, "installed", False):
+            self._install_thread(now)
+        self._finish_statement(now)
+
+        service = NO_SERVICE
+        caller = frame = sys._getframe(1)  # pylint: disable=protected-access
+        while frame is not None:
+            if self.service_filter(frame.f_code):
+                service = _code_name(frame.f_code)
+                break
+            frame = frame.f_back
+
+        statement = normalize_sql(sql)
+        invocation = state.invocation
+        if invocation is not None:
+            invocation.queries += 1
+            invocation.statement_counts[statement] = invocation.statement_counts.get(statement, 0) + 1
+            slot = invocation.name
+        else:
+            slot = NO_SLOT
+        state.pending = (now, (statement, service, slot), caller)
+
+    def _finish_statement(self, now):
+        pending = getattr(self._local, "pending", None)
+        if pending is None:
+            return
+        self._local.pending = None
+        started, key, _caller = pending
+        duration = now - started
+        with self._lock:
+            stats = self.statements.get(key)
+            if stats is None:
+                self.statements[key] = [1, duration, duration]
+            else:
+                stats[0] += 1
+                stats[1] += duration
+                stats[2] = max(stats[2], duration)
+
+    # +-+-+-+- Raporty +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+    def get_slot_report(self) -> list:
+        """
+        Zwraca statystyki slotów posortowane malejąco po łącznym czasie.
+
+        :return: Lista słowników z `slot`, `calls`, `total_ms`, `avg_ms`, `max_ms`, `queries`,
+            `avg_queries`, `max_queries`, `max_repeated_count`, `max_repeated_statement`.
+        """
+        with self._lock:
+            slots = {name: dict(stats) for name, stats in self.slots.items()}
+        report = []
+        for name, stats in slots.items():
+            report.append({
+                "slot": name,
+                "calls": stats["calls"],
+                "total_ms": round(stats["total_time"] * 1000, 3),
+                "avg_ms": round(stats["total_time"] * 1000 / stats["calls"], 3),
+                "max_ms": round(stats["max_time"] * 1000, 3),
+                "queries": stats["queries"],
+                "avg_queries": round(stats["queries"] / stats["calls"], 2),
+                "max_queries": stats["max_queries"],
+                "max_repeated_count": stats["max_repeated_count"],
+                "max_repeated_statement": stats["max_repeated_statement"],
+            })
+        return sorted(report, key=lambda row: row["total_ms"], reverse=True)
+
+    def get_statement_report(self) -> list:
+        """
+        Zwraca statystyki instrukcji SQL (z przypisaniem do serwisu i slotu) posortowane malejąco po łącznym czasie.
+        """
+        with self._lock:
+            statements = {key: list(stats) for key, stats in self.statements.items()}
+        report = [
+            {
+                "statement": statement,
+                "service": service,
+                "slot": slot,
+                "count": count,
+                "total_ms": round(total * 1000, 3),
+                "avg_ms": round(total * 1000 / count, 3),
+                "max_ms": round(maximum * 1000, 3),
+            }
+            for (statement, service, slot), (count, total, maximum) in statements.items()
+        ]
+        return sorted(report, key=lambda row: row["total_ms"], reverse=True)
+
+    def get_top_slots(self, top_n: int = None) -> list:
+        """
+        Zwraca `top_n` slotów o największym średnim czasie wywołania.
+        """
+        top_n = top_n or self.settings.get("top_n", 10)
+        return sorted(self.get_slot_report(), key=lambda row: row["avg_ms"], reverse=True)[:top_n]
+
+    def print_summary(self, top_n: int = None):
+        """
+        Wypisuje na konsolę najwolniejsze sloty (średni czas, liczba zapytań na wywołanie).
+        """
+        print(f"[Profiler] Najwolniejsze sloty (top {top_n or self.settings.get('top_n', 10)}):")
+        for row in self.get_top_slots(top_n):
+            print(
+                f"[Profiler]   {row['slot']}: {row['calls']} wywołań, śr. {row['avg_ms']} ms, "
+                f"maks. {row['max_ms']} ms, śr. {row['avg_queries']} zapytań, "
+                f"maks. {row['max_repeated_count']} powtórzeń jednej instrukcji"
+            )
+
+    def write_report(self, output_dir: str = None) -> dict:
+        """
+        Zapisuje raport profilowania: JSON (sloty i instrukcje) oraz dwa pliki CSV.
+
+        :return: Słownik ze ścieżkami plików {"json", "slots_csv", "statements_csv"}.
+        """
+        output_dir = output_dir or self.settings["output_dir"]
+        os.makedirs(output_dir, exist_ok=True)
+        prefix = os.path.join(output_dir, f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}")
+        slots = self.get_slot_report()
+        statements = self.get_statement_report()
+        paths = {
+            "json": f"{prefix}.json",
+            "slots_csv": f"{prefix}_slots.csv",
+            "statements_csv": f"{prefix}_statements.csv",
+        }
+
+        with open(paths["json"], "w", encoding="utf-8") as file:
+            json.dump({"slots": slots, "statements": statements}, file, ensure_ascii=False, indent=2)
+        for path, rows, fields in (
+            (paths["slots_csv"], slots, list(slots[0]) if slots else ["slot"]),
+            (paths["statements_csv"], statements, list(statements[0]) if statements else ["statement"]),
+        ):
+            with open(path, "w", encoding="utf-8", newline="") as file:
+                writer = csv.DictWriter(file, fieldnames=fields)
+                writer.writeheader()
+                writer.writerows(rows)
+
+        print(f"[Profiler] Zapisano raport profilowania: {paths['json']}")
+        return paths
+
+
+_profiler = None
+_profiler_lock = threading.Lock()
+
+
+def get_profiler():
+    """
+    Zwraca wspólny dla procesu profiler lub None, jeśli tryb profilowania jest wyłączony.
+    """
+    global _profiler  # pylint: disable=global-statement
+    if _profiler is None:
+        settings = Config.get_profiling_settings()
+        if not settings["enabled"]:
+            return None
+        with _profiler_lock:
+            if _profiler is None:
+                _profiler = QueryProfiler(settings)
+    return _profiler
@@ -0,0 +1,170 @@
+# reference_cache.py
+
+import sqlite3
+import threading
+
+# Małe, rzadko zmieniane tabele słownikowe: klucz główny i kolumny tworzące nazwę wyświetlaną
+REFERENCE_TABLES = {
+    "roles": {"key": "role_id", "name": ("role_name",)},
+    "services": {"key": "service_id", "name": ("service_type",)},
+    "specialties": {"key": "specialty_id", "name": ("specialty_name",)},
+    "room_types": {"key": "room_type_id", "name": ("room_type",)},
+    "meeting_types": {"key": "meeting_type_id", "name": ("meeting_type",)},
+    "form_types": {"key": "form_type_id", "name": ("form_name",)},
+    "system_permissions": {"key": "permission_id", "name": ("permission_name",)},
+    "rooms": {"key": "room_id", "name": ("room_number",)},
+    "employees": {"key": "employee_id", "name": ("first_name", "last_name")},
+}
+
+
+class ReferenceCache:
+    """
+    Pamięć podręczna tabel słownikowych (`REFERENCE_TABLES`) współdzielona przez wszystkie serwisy.
+    W procesie istnieje jedna instancja (`DatabaseController.reference_cache` jedynego `MainController`),
+    z której korzystają wątek GUI i wątek roboczy `BridgeWorker`.
+
+    Każda tabela jest wczytywana w całości przy pierwszym użyciu i serwowana z pamięci
+    (np. nazwy usług, pokoi i pracowników przy formatowaniu list wizyt), zamiast ponownego
+    odczytu przy każdym odświeżeniu widoku. Tabela ma własny numer wersji zwiększany przez
+    `invalidate` - wywoływane przez modele po każdym dodaniu, zmianie lub usunięciu rekordu.
+    Zmiana schematu (DDL) unieważnia wszystkie tabele.
+
+    Wewnątrz jednostki pracy (`DatabaseController.unit_of_work`) zapis nie jest jeszcze zatwierdzony,
+    a tabele wczytywane są połączeniem z puli odczytu - odczyt w trakcie jednostki zapamiętałby dane
+    sprzed zapisu. Dlatego tabele unieważnione w jednostce pracy są unieważniane ponownie po jej
+    zatwierdzeniu (`begin_deferred` / `end_deferred`).
+
+    Zwracane słowniki są współdzielone - nie należy ich modyfikować.
+    """
+
+    def __init__(self, db_controller, tables=REFERENCE_TABLES):
+        """
+        Inicjalizuje pamięć podręczną tabel słownikowych z kontrolerem bazy danych.
+        """
+        self.db_controller = db_controller
+        self.tables = tables
+        self.hits = 0
+        self.misses = 0
+        self._versions = {table_name: 0 for table_name in tables}  # Zwiększane przy każdym unieważnieniu
+        self._entries = {}  # {tabela: {"rows": {klucz: wiersz}, "names": {klucz: nazwa}}}
+        self._schema_version = None  # Wersja katalogu schematu, z którą wczytano tabele
+        self._lock = threading.Lock()  # Kontroler (i pamięć podręczna) jest współdzielony między wątkami
+        self._deferred = threading.local()  # Tabele unieważnione w jednostce pracy bieżącego wątku
+
+    def get_version(self, table_name: str) -> int:
+        """
+        Zwraca bieżący numer wersji tabeli (np. do sprawdzenia aktualności danych poza pamięcią podręczną).
+        """
+        return self._versions[table_name]
+
+    def invalidate(self, *table_names):
+        """
+        Unieważnia podane tabele (bez argumentów - wszystkie); zostaną wczytane ponownie przy następnym użyciu.
+        """
+        table_names = table_names or tuple(self.tables)
+        pending = getattr(self._deferred, "tables", None)
+        if pending is not None:
+            pending.update(table_names)
+        with self._lock:
+            for table_name in table_names:
+                if table_name in self._versions:
+                    self._versions[table_name] += 1
+                    self._entries.pop(table_name, None)
+
+    def begin_deferred(self):
+        """
+        Rozpoczyna zbieranie tabel unieważnianych w bieżącym wątku (początek zewnętrznej jednostki pracy).
+        """
+        self._deferred.tables = set()
+
+    def end_deferred(self, committed: bool = True):
+        """
+        Kończy zbieranie tabel i unieważnia je ponownie po zatwierdzeniu jednostki pracy
+        (tabele wczytane w jej trakcie mogły zawierać dane sprzed zapisu).
+        """
+        pending = getattr(self._deferred, "tables", None)
+        self._deferred.tables = None
+        if committed and pending:
+            self.invalidate(*pending)
+
+    def _load(self, table_name: str) -> dict:
+        spec = self.tables[table_name]
+        rows, names = {}, {}
+        if self.db_controller.schema_catalog.has_table(table_name):
+            with self.db_controller.read_connection() as connection:
+                cursor = connection.execute(f"SELECT * FROM {table_name} ORDER BY {spec['key']}")
+                column_names = [column[0] for column in cursor.description]
+                for values in cursor.fetchall():
+                    row = dict(zip(column_names, values))
+                    rows[row[spec["key"]]] = row
+                    names[row[spec["key"]]] = " ".join(str(row[column]) for column in spec["name"])
+        return {"rows": rows, "names": names}
+
+    def _get_entry(self, table_name: str) -> dict:
+        if table_name not in self.tables:
+            raise ValueError(f"Tabela `{table_name}` nie jest tabelą słownikową.")
+
+        # Tabele wczytane z poprzednią wersją schematu są nieaktualne
+        schema_version = self.db_controller.schema_catalog.version
+        if schema_version != self._schema_version:
+            self.invalidate()
+            self._schema_version = schema_version
+
+        with self._lock:
+            entry = self._entries.get(table_name)
+            if entry is not None:
+                self.hits += 1
+                return entry
+            self.misses += 1
+            version = self._versions[table_name]
+
+        try:
+            entry = self._load(table_name)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Błąd podczas wczytywania tabeli słownikowej `{table_name}`: {e}") from e
+
+        with self._lock:
+            # Tabela unieważniona w trakcie wczytywania (zapis w innym wątku) nie jest zapamiętywana
+            if self._versions[table_name] == version:
+                self._entries[table_name] = entry
+        return entry
+
+    def get_rows(self, table_name: str) -> dict:
+        """
+        Zwraca wszystkie wiersze tabeli słownikowej.
+
+        :return: Słownik {klucz główny: wiersz jako słownik}.
+        :raises ValueError: Jeśli tabela nie jest tabelą słownikową.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        return self._get_entry(table_name)["rows"]
+
+    def get_row(self, table_name: str, key):
+        """
+        Zwraca wiersz tabeli słownikowej o podanym kluczu głównym lub None.
+        """
+        return self._get_entry(table_name)["rows"].get(key)
+
+    def get_names(self, table_name: str) -> dict:
+        """
+        Zwraca nazwy wyświetlane rekordów tabeli słownikowej,
+        np. {1: "Konsultacja psychiatryczna"} dla `services` lub {1: "Jan Kowalski"} dla `employees`.
+        """
+        return self._get_entry(table_name)["names"]
+
+    def get_name(self, table_name: str, key, default=None):
+        """
+        Zwraca nazwę wyświetlaną rekordu o podanym kluczu głównym lub `default`.
+        """
+        return self._get_entry(table_name)["names"].get(key, default)
+
+    def get_stats(self) -> dict:
+        """
+        Zwraca statystyki pamięci podręcznej: trafienia, chybienia, wczytane tabele i ich wersje.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "tables": sorted(self._entries),
+            "versions": dict(self._versions),
+        }
@@ -0,0 +1,303 @@
+# room_availability.py
+
+import re
+import threading
+import weakref
+from bisect import bisect_left, bisect_right
+
+TIME_PATTERN = re.compile(r"^(\d{1,2}):(\d{2})$")
+TIME_RANGE_PATTERN = re.compile(r"^(\d{1,2}):(\d{2})-(\d{1,2}):(\d{2})$")
+
+# Domyślne godziny, w których szukane są wolne terminy (w minutach od północy)
+DAY_START_MINUTE = 8 * 60
+DAY_END_MINUTE = 20 * 60
+
+# Rezerwacje pokoju nachodzące na przedział - zawsze odczyt z bazy (kolumny start_ts / end_ts,
+# indeks (fk_room_id, start_ts)). Rezerwacja trwa najwyżej dobę, więc zakres indeksu jest ograniczony
+# z obu stron. Początek dnia liczony jest tym samym wyrażeniem co w wyzwalaczach `database/time_columns.py`.
+CONFLICTS_QUERY = """
+WITH day AS (SELECT CAST(strftime('%s', :reservation_date) AS INTEGER) / 60 AS start_ts)
+SELECT r.reservation_id
+FROM day
+JOIN room_reservations r
+    ON r.fk_room_id = :room_id
+   AND r.start_ts > day.start_ts + :start - 1440
+   AND r.start_ts < day.start_ts + :end
+   AND r.end_ts > day.start_ts + :start
+WHERE r.reservation_id IS NOT :exclude_reservation_id
+ORDER BY r.start_ts, r.reservation_id
+"""
+
+
+def parse_minutes(time_value: str) -> int:
+    """
+    Zamienia godzinę `HH:MM` na minuty od północy, np. "10:30" -> 630.
+
+    :raises ValueError: Jeśli format lub godzina są nieprawidłowe.
+    """
+    match = TIME_PATTERN.match(time_value or "")
+    if not match:
+        raise ValueError(f"Nieprawidłowy format godziny: {time_value}. Oczekiwany format: HH:MM.")
+    hour, minute = map(int, match.groups())
+    if hour > 23 or minute > 59:
+        raise ValueError(f"Nieprawidłowa godzina: {time_value}.")
+    return hour * 60 + minute
+
+
+def parse_time_range(reservation_time: str) -> tuple:
+    """
+    Zamienia przedział czasu `HH:MM-HH:MM` na minuty od północy.
+
+    :return: Krotka (początek, koniec), np. "10:00-11:30" -> (600, 690).
+    :raises ValueError: Jeśli format jest nieprawidłowy lub początek nie jest wcześniejszy niż koniec.
+    """
+    match = TIME_RANGE_PATTERN.match(reservation_time or "")
+    if not match:
+        raise ValueError(f"Nieprawidłowy format czasu rezerwacji: {reservation_time}. Oczekiwany format: HH:MM-HH:MM.")
+    start_hour, start_minute, end_hour, end_minute = map(int, match.groups())
+    if start_hour > 23 or end_hour > 24 or start_minute > 59 or end_minute > 59:
+        raise ValueError(f"Nieprawidłowa godzina w przedziale: {reservation_time}.")
+
+    start, end = start_hour * 60 + start_minute, end_hour * 60 + end_minute
+    if start >= end:
+        raise ValueError("Nieprawidłowy przedział czasowy: godzina rozpoczęcia musi być wcześniejsza niż godzina zakończenia.")
+    return start, end
+
+
+def format_minutes(minutes: int) -> str:
+    """
+    Zamienia minuty od północy na tekst `HH:MM`.
+    """
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def format_time_range(start: int, end: int) -> str:
+    """
+    Zamienia przedział w minutach na tekst `HH:MM-HH:MM` (format kolumny `reservation_time`).
+    """
+    return f"{format_minutes(start)}-{format_minutes(end)}"
+
+
+class RoomSchedule:
+    """
+    Rezerwacje jednego pokoju w jednym dniu jako posortowane przedziały [początek, koniec) w minutach.
+
+    - `starts` / `ends` / `reservation_ids` - rezerwacje posortowane po początku,
+      `max_ends[i]` - największy koniec wśród rezerwacji 0..i (pozwala w O(log n) stwierdzić,
+      że żadna wcześniejsza rezerwacja nie nachodzi na sprawdzany przedział),
+    - `busy_starts` / `busy_ends` - zajętość pokoju po scaleniu nachodzących rezerwacji
+      (rozłączne przedziały, używane do wyszukiwania wolnych terminów).
+    """
+
+    __slots__ = ("starts", "ends", "reservation_ids", "max_ends", "busy_starts", "busy_ends")
+
+    def __init__(self, intervals):
+        intervals = sorted(intervals)  # [(początek, koniec, reservation_id)]
+        self.starts = [start for start, _, _ in intervals]
+        self.ends = [end for _, end, _ in intervals]
+        self.reservation_ids = [reservation_id for _, _, reservation_id in intervals]
+
+        self.max_ends = []
+        max_end = 0
+        for end in self.ends:
+            max_end = max(max_end, end)
+            self.max_ends.append(max_end)
+
+        self.busy_starts = []
+        self.busy_ends = []
+        for start, end, _ in intervals:
+            if self.busy_ends and start <= self.busy_ends[-1]:
+                self.busy_ends[-1] = max(self.busy_ends[-1], end)
+            else:
+                self.busy_starts.append(start)
+                self.busy_ends.append(end)
+
+    def find_conflicts(self, start: int, end: int) -> list:
+        """
+        Zwraca ID rezerwacji nachodzących na przedział [start, end).
+        """
+        # Kandydatami są wyłącznie rezerwacje zaczynające się przed końcem przedziału
+        count = bisect_left(self.starts, end)
+        # `max_ends` jest niemalejące - rezerwacje przed `first` kończą się najpóźniej w chwili `start`
+        first = bisect_right(self.max_ends, start, 0, count)
+        return [self.reservation_ids[i] for i in range(first, count) if self.ends[i] > start]
+
+    def first_free_start(self, duration: int, earliest: int, latest: int):
+        """
+        Zwraca najwcześniejszy początek wolnego terminu o długości `duration` w przedziale
+        [earliest, latest] lub None, jeśli pokój nie ma takiego terminu.
+        """
+        candidate = earliest
+        # Pierwszy zajęty przedział kończący się po `earliest`
+        index = bisect_right(self.busy_ends, earliest)
+        while index < len(self.busy_starts) and self.busy_starts[index] < candidate + duration:
+            candidate = max(candidate, self.busy_ends[index])
+            index += 1
+        return candidate if candidate + duration <= latest else None
+
+    def free_slots(self, earliest: int, latest: int) -> list:
+        """
+        Zwraca wolne przedziały [(początek, koniec)] pokoju pomiędzy `earliest` i `latest`.
+        """
+        slots = []
+        candidate = earliest
+        index = bisect_right(self.busy_ends, earliest)
+        while index < len(self.busy_starts) and self.busy_starts[index] < latest:
+            if self.busy_starts[index] > candidate:
+                slots.append((candidate, self.busy_starts[index]))
+            candidate = max(candidate, self.busy_ends[index])
+            index += 1
+        if candidate < latest:
+            slots.append((candidate, latest))
+        return slots
+
+
+EMPTY_SCHEDULE = RoomSchedule([])
+
+
+class RoomAvailabilityIndex:
+    """
+    Indeks dostępności pokoi oparty na przedziałach czasu.
+
+    Do wyszukiwania wolnych terminów rezerwacje z tabeli `room_reservations` są wczytywane dla
+    całego dnia jednym zapytaniem (przy pierwszym pytaniu o ten dzień) i przechowywane jako
+    `RoomSchedule` dla każdej pary (pokój, dzień). Dni są unieważniane przez model `RoomReservations`
+    po każdej zmianie rezerwacji, a wszystkie dni - gdy `PRAGMA data_version` połączenia bieżącego
+    wątku wskaże zapis innego połączenia (inny wątek, skrypt ładujący, narzędzie zewnętrzne).
+
+    Sprawdzenie konfliktu (`get_conflicts`, `is_available`) nie korzysta z wczytanych dni - jest
+    zapytaniem do bazy na połączeniu bieżącego wątku, więc wewnątrz transakcji zapisu
+    (`RoomReservations.add_reservation(..., check_conflicts=True)`) widzi stan, który zostanie zapisany.
+    Wykrywane są również przedziały częściowo nachodzące (np. 10:00-11:00 i 10:30-11:30).
+    """
+
+    def __init__(self, db_controller):
+        """
+        Inicjalizuje indeks dostępności z kontrolerem bazy danych.
+        """
+        self.db_controller = db_controller
+        self.version = 0  # Zwiększany przy każdym unieważnieniu indeksu
+        self._days = {}  # {data: {room_id: RoomSchedule}}
+        self._data_versions = weakref.WeakKeyDictionary()  # {połączenie wątku: ostatni PRAGMA data_version}
+        self._lock = threading.Lock()
+
+    def invalidate(self, reservation_date: str = None):
+        """
+        Unieważnia indeks dla wskazanego dnia (lub wszystkich dni); zostanie wczytany ponownie przy następnym użyciu.
+        """
+        with self._lock:
+            self.version += 1
+            if reservation_date is None:
+                self._days.clear()
+            else:
+                self._days.pop(reservation_date, None)
+
+    def _check_data_version(self):
+        # data_version zmienia się po zatwierdzeniu zapisu przez inne połączenie niż bieżące;
+        # własne zapisy połączenia unieważniają indeks przez modele
+        connection = self.db_controller.connection
+        if connection is None:
+            return
+        data_version = connection.execute("PRAGMA data_version").fetchone()[0]
+        with self._lock:
+            previous = self._data_versions.get(connection)
+            self._data_versions[connection] = data_version
+        if previous != data_version:
+            self.invalidate()
+
+    def _load_day(self, reservation_date: str) -> dict:
+        query = """
+            SELECT reservation_id, fk_room_id, reservation_time
+            FROM room_reservations
+            WHERE reservation_date = ?
+        """
+        with self.db_controller.read_connection() as connection:
+            rows = connection.execute(query, (reservation_date,)).fetchall()
+
+        intervals_by_room = {}
+        for reservation_id, room_id, reservation_time in rows:
+            try:
+                start, end = parse_time_range(reservation_time)
+            except ValueError:
+                print(f"[RoomAvailabilityIndex] Pominięto rezerwację {reservation_id} z nieprawidłowym czasem: {reservation_time}")
+                continue
+            intervals_by_room.setdefault(room_id, []).append((start, end, reservation_id))
+
+        return {room_id: RoomSchedule(intervals) for room_id, intervals in intervals_by_room.items()}
+
+    def get_schedule(self, room_id: int, reservation_date: str) -> RoomSchedule:
+        """
+        Zwraca rezerwacje pokoju w danym dniu (`RoomSchedule`).
+        """
+        self._check_data_version()
+        with self._lock:
+            day = self._days.get(reservation_date)
+            version = self.version
+        if day is None:
+            day = self._load_day(reservation_date)
+            with self._lock:
+                # Dzień unieważniony w trakcie wczytywania (zmiana rezerwacji w innym wątku) nie jest zapamiętywany
+                if self.version == version:
+                    self._days[reservation_date] = day
+        return day.get(room_id, EMPTY_SCHEDULE)
+
+    def get_conflicts(self, room_id: int, reservation_date: str, start: int, end: int,
+                      exclude_reservation_id: int = None) -> list:
+        """
+        Zwraca ID rezerwacji pokoju nachodzących na przedział [start, end) w danym dniu.
+        Odczyt z bazy na połączeniu bieżącego wątku (widzi niezatwierdzone zapisy jego transakcji).
+
+        :param exclude_reservation_id: Rezerwacja pomijana przy sprawdzaniu (np. aktualizowana).
+        :raises sqlite3.Error: W przypadku błędu bazy danych.
+        """
+        self.db_controller.ensure_connection()
+        cursor = self.db_controller.connection.execute(CONFLICTS_QUERY, {
+            "reservation_date": reservation_date,
+            "room_id": room_id,
+            "start": start,
+            "end": end,
+            "exclude_reservation_id": exclude_reservation_id,
+        })
+        return [row[0] for row in cursor.fetchall()]
+
+    def is_available(self, room_id: int, reservation_date: str, start: int, end: int,
+                     exclude_reservation_id: int = None) -> bool:
+        """
+        Sprawdza, czy pokój jest wolny w przedziale [start, end) danego dnia.
+        """
+        return not self.get_conflicts(room_id, reservation_date, start, end, exclude_reservation_id)
+
+    def get_free_slots(self, room_id: int, reservation_date: str,
+                       earliest: int = DAY_START_MINUTE, latest: int = DAY_END_MINUTE) -> list:
+        """
+        Zwraca wolne przedziały [(początek, koniec)] pokoju w danym dniu.
+        """
+        return self.get_schedule(room_id, reservation_date).free_slots(earliest, latest)
+
+    def find_first_free_room(self, room_type_id: int, reservation_date: str, duration: int,
+                             earliest: int = DAY_START_MINUTE, latest: int = DAY_END_MINUTE):
+        """
+        Wyszukuje pokój danego typu z najwcześniejszym wolnym terminem o długości `duration` minut.
+        Przy równych terminach wybierany jest pokój o najniższym numerze.
+
+        :return: Słownik {"room_id", "room_number", "start", "end", "reservation_time"} lub None.
+        :raises ValueError: Jeśli czas trwania nie jest dodatni.
+        """
+        if duration <= 0:
+            raise ValueError("Czas trwania musi być liczbą dodatnią.")
+
+        query = "SELECT room_id, room_number FROM rooms WHERE fk_room_type_id = ? ORDER BY room_number"
+        with self.db_controller.read_connection() as connection:
+            rooms = connection.execute(query, (room_type_id,)).fetchall()
+
+        best = None
+        for room_id, room_number in rooms:
+            start = self.get_schedule(room_id, reservation_date).first_free_start(duration, earliest, latest)
+            if start is not None and (best is None or start < best["start"]):
+                best = {"room_id": room_id, "room_number": room_number, "start": start, "end": start + duration}
+                if start == earliest:
+                    break  # Wcześniejszego terminu nie ma
+
+        if best is not None:
+            best["reservation_time"] = format_time_range(best["start"], best["end"])
+        return best
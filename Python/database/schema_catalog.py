@@ -0,0 +1,257 @@
+# schema_catalog.py
+
+import re
+import sqlite3
+import threading
+
+# Akcje autoryzatora SQLite zmieniające listę tabel lub kolumn (DDL)
+SCHEMA_CHANGING_ACTIONS = frozenset({
+    sqlite3.SQLITE_CREATE_TABLE,
+    sqlite3.SQLITE_CREATE_TEMP_TABLE,
+    sqlite3.SQLITE_DROP_TABLE,
+    sqlite3.SQLITE_DROP_TEMP_TABLE,
+    sqlite3.SQLITE_ALTER_TABLE,
+    sqlite3.SQLITE_CREATE_VTABLE,
+    sqlite3.SQLITE_DROP_VTABLE,
+})
+
+
+CHECK_PATTERN = re.compile(r"\bCHECK\s*\(", re.IGNORECASE)
+
+
+def strip_sql_comments(sql: str) -> str:
+    """
+    Usuwa komentarze `-- ...` z instrukcji SQL (z pominięciem literałów tekstowych).
+    """
+    result = []
+    in_string = False
+    index = 0
+    while index < len(sql):
+        char = sql[index]
+        if char == "'":
+            in_string = not in_string
+        elif not in_string and sql.startswith("--", index):
+            index = sql.find("\n", index)
+            if index == -1:
+                break
+            continue
+        result.append(char)
+        index += 1
+    return "".join(result)
+
+
+def extract_check_constraints(create_sql: str) -> list:
+    """
+    Wyodrębnia wyrażenia ograniczeń CHECK z instrukcji CREATE TABLE.
+
+    :param create_sql: Treść instrukcji CREATE TABLE (kolumna `sql` z `sqlite_master`).
+    :return: Lista wyrażeń, np. ["LENGTH(phone) = 9 AND phone GLOB '[0-9]*'"].
+    """
+    checks = []
+    if not create_sql:
+        return checks
+
+    sql = strip_sql_comments(create_sql)
+    position = 0
+    while True:
+        match = CHECK_PATTERN.search(sql, position)
+        if match is None:
+            break
+        start = match.end() - 1
+
+        # Wyszukanie nawiasu zamykającego z uwzględnieniem zagnieżdżeń i literałów tekstowych
+        depth = 0
+        in_string = False
+        end = start
+        for end in range(start, len(sql)):
+            char = sql[end]
+            if char == "'":
+                in_string = not in_string
+            elif not in_string and char == "(":
+                depth += 1
+            elif not in_string and char == ")":
+                depth -= 1
+                if depth == 0:
+                    break
+
+        checks.append(" ".join(sql[start + 1:end].split()))
+        position = end + 1
+    return checks
+
+
+class SchemaCatalog:
+    """
+    Katalog schematu bazy danych przechowywany w pamięci.
+
+    Metadane wszystkich tabel (kolumny, typy, ograniczenia CHECK, klucze obce) są wczytywane
+    jednym przebiegiem (`load`), a następnie serwowane bez zapytań do SQLite.
+    Katalog jest unieważniany wyłącznie przez instrukcje DDL (CREATE/DROP/ALTER TABLE),
+    wykrywane autoryzatorem połączenia (`on_authorize`) - kolejne użycie wczytuje go ponownie.
+    """
+
+    def __init__(self, db_controller):
+        """
+        Inicjalizuje katalog schematu z kontrolerem bazy danych.
+        """
+        self.db_controller = db_controller
+        self.version = 0  # Zwiększany przy każdym unieważnieniu katalogu
+        self.load_count = 0  # Liczba wczytań katalogu (diagnostyka)
+        self._tables = None  # {tabela: {"columns": [...], "checks": [...], "foreign_keys": [...]}}
+        self._referenced_by = {}  # {tabela: [tabele z kluczem obcym do tej tabeli]}
+        self._lock = threading.Lock()
+
+    def on_authorize(self, action, _arg1, _arg2, _database, _trigger):
+        """
+        Autoryzator połączenia SQLite: unieważnia katalog przy instrukcjach DDL.
+        Zawsze zezwala na wykonanie instrukcji.
+        """
+        if action in SCHEMA_CHANGING_ACTIONS:
+            self.invalidate()
+        return sqlite3.SQLITE_OK
+
+    def invalidate(self):
+        """
+        Unieważnia katalog; zostanie wczytany ponownie przy następnym użyciu.
+        """
+        with self._lock:
+            self._tables = None
+            self.version += 1
+
+    def load(self):
+        """
+        Wczytuje metadane wszystkich tabel bazy danych.
+
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        try:
+            self.db_controller.ensure_connection()
+            connection = self.db_controller.connection
+            version = self.version
+
+            tables = {}
+            cursor = connection.execute(
+                "SELECT name, sql FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+            )
+            for table_name, create_sql in cursor.fetchall():
+                columns = [
+                    {
+                        "name": row[1],
+                        "type": row[2],
+                        "not_null": bool(row[3]),
+                        "default": row[4],
+                        "primary_key": bool(row[5]),
+                    }
+                    for row in connection.execute(f"PRAGMA table_info({table_name})").fetchall()
+                ]
+                foreign_keys = [
+                    {
+                        "column": row[3],
+                        "ref_table": row[2],
+                        "ref_column": row[4],
+                        "on_update": row[5],
+                        "on_delete": row[6],
+                    }
+                    for row in connection.execute(f"PRAGMA foreign_key_list({table_name})").fetchall()
+                ]
+                tables[table_name] = {
+                    "columns": columns,
+                    "checks": extract_check_constraints(create_sql),
+                    "foreign_keys": foreign_keys,
+                }
+
+            referenced_by = {}
+            for table_name, table in tables.items():
+                for foreign_key in table["foreign_keys"]:
+                    referencing = referenced_by.setdefault(foreign_key["ref_table"], [])
+                    if table_name not in referencing:
+                        referencing.append(table_name)
+
+            with self._lock:
+                # Katalog unieważniony w trakcie wczytywania (DDL w innym wątku) nie jest zapamiętywany
+                if self.version == version:
+                    self._tables = tables
+                    self._referenced_by = referenced_by
+                self.load_count += 1
+            return tables
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Błąd podczas wczytywania schematu bazy danych: {e}") from e
+
+    def _get_tables(self):
+        tables = self._tables
+        if tables is None:
+            tables = self.load()
+        return tables
+
+    def get_table_names(self) -> list:
+        """
+        Zwraca listę nazw tabel.
+        """
+        return list(self._get_tables())
+
+    def has_table(self, table_name: str) -> bool:
+        """
+        Sprawdza, czy tabela istnieje.
+        """
+        return table_name in self._get_tables()
+
+    def get_columns(self, table_name: str) -> list:
+        """
+        Zwraca listę nazw kolumn tabeli (pustą, jeśli tabela nie istnieje).
+        """
+        table = self._get_tables().get(table_name)
+        return [column["name"] for column in table["columns"]] if table else []
+
+    def get_column_types(self, table_name: str) -> dict:
+        """
+        Zwraca słownik {kolumna: zadeklarowany typ} dla tabeli.
+        """
+        table = self._get_tables().get(table_name)
+        return {column["name"]: column["type"] for column in table["columns"]} if table else {}
+
+    def get_column_info(self, table_name: str) -> list:
+        """
+        Zwraca pełne metadane kolumn tabeli (nazwa, typ, NOT NULL, wartość domyślna, klucz główny).
+        """
+        table = self._get_tables().get(table_name)
+        return [dict(column) for column in table["columns"]] if table else []
+
+    def get_check_constraints(self, table_name: str) -> list:
+        """
+        Zwraca wyrażenia ograniczeń CHECK tabeli.
+        """
+        table = self._get_tables().get(table_name)
+        return list(table["checks"]) if table else []
+
+    def get_foreign_keys(self, table_name: str) -> list:
+        """
+        Zwraca klucze obce tabeli jako listę słowników
+        (`column`, `ref_table`, `ref_column`, `on_update`, `on_delete`).
+        """
+        table = self._get_tables().get(table_name)
+        return [dict(foreign_key) for foreign_key in table["foreign_keys"]] if table else []
+
+    def get_referencing_tables(self, table_name: str) -> list:
+        """
+        Zwraca tabele, które mają klucz obcy wskazujący na podaną tabelę.
+        """
+        self._get_tables()
+        return list(self._referenced_by.get(table_name, []))
+
+    def get_foreign_key_graph(self) -> dict:
+        """
+        Zwraca graf kluczy obcych: {tabela: [tabele, do których tabela się odwołuje]}.
+        """
+        return {
+            table_name: sorted({foreign_key["ref_table"] for foreign_key in table["foreign_keys"]})
+            for table_name, table in self._get_tables().items()
+        }
+
+
+def get_valid_columns(db_controller, table_name: str) -> list:
+    """
+    Pobiera listę kolumn dla podanej tabeli z katalogu schematu.
+    :param db_controller: Obiekt kontrolera bazy danych.
+    :param table_name: Nazwa tabeli.
+    :return: Lista nazw kolumn.
+    """
+    return db_controller.schema_catalog.get_columns(table_name)
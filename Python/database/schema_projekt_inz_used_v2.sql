@@ -1,4 +1,6 @@
 -- tabele usuwa się w odwrotnej kolejności niż są tworzone
+DROP TABLE IF EXISTS employee_daily_appointment_stats;
+DROP TABLE IF EXISTS employee_appointment_stats;
 DROP TABLE IF EXISTS patient_forms;
 DROP TABLE IF EXISTS meeting_participants;
 DROP TABLE IF EXISTS internal_meetings;
@@ -225,6 +227,8 @@ CREATE TABLE room_reservations (
     reservation_time TEXT NOT NULL CHECK (
        reservation_time GLOB '[0-2][0-9]:[0-5][0-9]-[0-2][0-9]:[0-5][0-9]'
     ), -- Format daty YYYY-MM-DD
+    start_ts INTEGER, -- Początek rezerwacji w minutach od epoki (wyliczany przez wyzwalacz)
+    end_ts INTEGER, -- Koniec rezerwacji w minutach od epoki (wyliczany przez wyzwalacz)
     FOREIGN KEY (fk_room_id) REFERENCES rooms(room_id)
         ON DELETE RESTRICT 
         ON UPDATE CASCADE -- Automatyczne zarządzanie relacją pokoju
@@ -243,6 +247,8 @@ CREATE TABLE appointments (
         appointment_status GLOB '[a-zA-ZĄąĆćĘęŁłŃńÓóŚśŹźŻż ()-:.\\/]*'
     ),
     notes TEXT, -- Notatki bez walidacji
+    start_ts INTEGER, -- Początek wizyty w minutach od epoki (wyliczany przez wyzwalacz)
+    end_ts INTEGER, -- Koniec wizyty w minutach od epoki (wyliczany przez wyzwalacz)
     FOREIGN KEY (fk_assignment_id) REFERENCES assigned_patients(assignment_id)
         ON DELETE RESTRICT 
         ON UPDATE CASCADE,
@@ -340,6 +346,207 @@ CREATE TABLE meeting_participants (
         ON UPDATE CASCADE 
 );
 
+-- INDEKSY
+-- Indeksy na kolumnach kluczy obcych i złożonych kluczach wyszukiwania.
+-- Rejestr indeksów znajduje się w database/indexes.py (INDEX_REGISTRY) i jest stosowany
+-- przy starcie aplikacji (MainController.initialize_critical_tables).
+CREATE INDEX idx_employee_specialties_specialty_id ON employee_specialties (specialty_id);
+CREATE INDEX idx_employee_services_service_id ON employee_services (service_id);
+CREATE INDEX idx_users_accounts_role_id ON users_accounts (role_id);
+CREATE INDEX idx_assigned_patients_fk_employee_id ON assigned_patients (fk_employee_id, fk_patient_id);
+CREATE INDEX idx_rooms_fk_room_type_id ON rooms (fk_room_type_id);
+CREATE INDEX idx_room_reservations_room_date ON room_reservations (fk_room_id, reservation_date);
+CREATE INDEX idx_room_reservations_date ON room_reservations (reservation_date);
+CREATE INDEX idx_room_reservations_start_ts ON room_reservations (start_ts);
+CREATE INDEX idx_room_reservations_room_start_ts ON room_reservations (fk_room_id, start_ts);
+CREATE INDEX idx_appointments_assignment_date ON appointments (fk_assignment_id, appointment_date);
+CREATE INDEX idx_appointments_fk_service_id ON appointments (fk_service_id);
+CREATE INDEX idx_appointments_fk_reservation_id ON appointments (fk_reservation_id);
+CREATE INDEX idx_appointments_date ON appointments (appointment_date);
+CREATE INDEX idx_appointments_start_ts ON appointments (start_ts);
+CREATE INDEX idx_appointments_assignment_start_ts ON appointments (fk_assignment_id, start_ts);
+CREATE INDEX idx_diagnoses_fk_appointment_id ON diagnoses (fk_appointment_id);
+CREATE INDEX idx_prescriptions_fk_appointment_id ON prescriptions (fk_appointment_id);
+CREATE INDEX idx_internal_meetings_fk_meeting_type_id ON internal_meetings (fk_meeting_type_id);
+CREATE INDEX idx_internal_meetings_fk_reservation_id ON internal_meetings (fk_reservation_id);
+CREATE INDEX idx_internal_meetings_date ON internal_meetings (meeting_date);
+CREATE INDEX idx_meeting_participants_fk_meeting_id ON meeting_participants (fk_meeting_id);
+CREATE INDEX idx_meeting_participants_employee_meeting ON meeting_participants (fk_employee_id, fk_meeting_id);
+
+-- START_TS / END_TS
+-- Minuty od epoki wyliczane z appointment_date oraz reservation_date / reservation_time
+-- (database/time_columns.py - migracja istniejących baz przy starcie aplikacji)
+CREATE TRIGGER appointments_time_columns_on_insert
+AFTER INSERT ON appointments
+BEGIN
+    UPDATE appointments
+    SET start_ts = CAST(strftime('%s', substr(NEW.appointment_date, 1, 10)) AS INTEGER) / 60 + CAST(substr(NEW.appointment_date, 12, 2) AS INTEGER) * 60 + CAST(substr(NEW.appointment_date, 15, 2) AS INTEGER),
+        end_ts = CAST(strftime('%s', substr(NEW.appointment_date, 1, 10)) AS INTEGER) / 60 + CAST(substr(NEW.appointment_date, 18, 2) AS INTEGER) * 60 + CAST(substr(NEW.appointment_date, 21, 2) AS INTEGER)
+    WHERE appointment_id = NEW.appointment_id;
+END;
+
+CREATE TRIGGER appointments_time_columns_on_update
+AFTER UPDATE OF appointment_date ON appointments
+BEGIN
+    UPDATE appointments
+    SET start_ts = CAST(strftime('%s', substr(NEW.appointment_date, 1, 10)) AS INTEGER) / 60 + CAST(substr(NEW.appointment_date, 12, 2) AS INTEGER) * 60 + CAST(substr(NEW.appointment_date, 15, 2) AS INTEGER),
+        end_ts = CAST(strftime('%s', substr(NEW.appointment_date, 1, 10)) AS INTEGER) / 60 + CAST(substr(NEW.appointment_date, 18, 2) AS INTEGER) * 60 + CAST(substr(NEW.appointment_date, 21, 2) AS INTEGER)
+    WHERE appointment_id = NEW.appointment_id;
+END;
+
+CREATE TRIGGER room_reservations_time_columns_on_insert
+AFTER INSERT ON room_reservations
+BEGIN
+    UPDATE room_reservations
+    SET start_ts = CAST(strftime('%s', NEW.reservation_date) AS INTEGER) / 60 + CAST(substr(NEW.reservation_time, 1, 2) AS INTEGER) * 60 + CAST(substr(NEW.reservation_time, 4, 2) AS INTEGER),
+        end_ts = CAST(strftime('%s', NEW.reservation_date) AS INTEGER) / 60 + CAST(substr(NEW.reservation_time, 7, 2) AS INTEGER) * 60 + CAST(substr(NEW.reservation_time, 10, 2) AS INTEGER)
+    WHERE reservation_id = NEW.reservation_id;
+END;
+
+CREATE TRIGGER room_reservations_time_columns_on_update
+AFTER UPDATE OF reservation_date, reservation_time ON room_reservations
+BEGIN
+    UPDATE room_reservations
+    SET start_ts = CAST(strftime('%s', NEW.reservation_date) AS INTEGER) / 60 + CAST(substr(NEW.reservation_time, 1, 2) AS INTEGER) * 60 + CAST(substr(NEW.reservation_time, 4, 2) AS INTEGER),
+        end_ts = CAST(strftime('%s', NEW.reservation_date) AS INTEGER) / 60 + CAST(substr(NEW.reservation_time, 7, 2) AS INTEGER) * 60 + CAST(substr(NEW.reservation_time, 10, 2) AS INTEGER)
+    WHERE reservation_id = NEW.reservation_id;
+END;
+
+-- LICZNIKI WIZYT PRACOWNIKÓW
+-- Liczba wizyt pracownika w danym dniu i łącznie, utrzymywana przez wyzwalacze
+-- (database/appointment_stats.py - migracja istniejących baz przy starcie aplikacji)
+CREATE TABLE employee_daily_appointment_stats (
+    fk_employee_id INTEGER NOT NULL,
+    appointment_day TEXT NOT NULL,
+    appointment_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (fk_employee_id, appointment_day)
+) WITHOUT ROWID;
+
+CREATE TABLE employee_appointment_stats (
+    fk_employee_id INTEGER PRIMARY KEY,
+    assignment_count INTEGER NOT NULL DEFAULT 0,
+    appointment_count INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER appointments_stats_on_insert
+AFTER INSERT ON appointments
+BEGIN
+    INSERT INTO employee_daily_appointment_stats (fk_employee_id, appointment_day, appointment_count)
+    SELECT fk_employee_id, substr(NEW.appointment_date, 1, 10), 1
+    FROM assigned_patients WHERE assignment_id = NEW.fk_assignment_id
+    ON CONFLICT (fk_employee_id, appointment_day) DO UPDATE SET appointment_count = appointment_count + 1;
+    INSERT INTO employee_appointment_stats (fk_employee_id, assignment_count, appointment_count)
+    SELECT fk_employee_id, 0, 1
+    FROM assigned_patients WHERE assignment_id = NEW.fk_assignment_id
+    ON CONFLICT (fk_employee_id) DO UPDATE SET appointment_count = appointment_count + 1;
+END;
+
+CREATE TRIGGER appointments_stats_on_delete
+AFTER DELETE ON appointments
+BEGIN
+    UPDATE employee_daily_appointment_stats SET appointment_count = appointment_count - 1
+    WHERE fk_employee_id = (SELECT fk_employee_id FROM assigned_patients WHERE assignment_id = OLD.fk_assignment_id) AND appointment_day = substr(OLD.appointment_date, 1, 10);
+    DELETE FROM employee_daily_appointment_stats
+    WHERE fk_employee_id = (SELECT fk_employee_id FROM assigned_patients WHERE assignment_id = OLD.fk_assignment_id) AND appointment_day = substr(OLD.appointment_date, 1, 10)
+      AND appointment_count <= 0;
+    UPDATE employee_appointment_stats SET appointment_count = appointment_count - 1
+    WHERE fk_employee_id = (SELECT fk_employee_id FROM assigned_patients WHERE assignment_id = OLD.fk_assignment_id);
+END;
+
+CREATE TRIGGER appointments_stats_on_update
+AFTER UPDATE OF fk_assignment_id, appointment_date ON appointments
+WHEN OLD.fk_assignment_id IS NEW.fk_assignment_id
+    OR EXISTS (SELECT 1 FROM assigned_patients WHERE assignment_id = OLD.fk_assignment_id)
+BEGIN
+    UPDATE employee_daily_appointment_stats SET appointment_count = appointment_count - 1
+    WHERE fk_employee_id = (SELECT fk_employee_id FROM assigned_patients WHERE assignment_id = OLD.fk_assignment_id) AND appointment_day = substr(OLD.appointment_date, 1, 10);
+    DELETE FROM employee_daily_appointment_stats
+    WHERE fk_employee_id = (SELECT fk_employee_id FROM assigned_patients WHERE assignment_id = OLD.fk_assignment_id) AND appointment_day = substr(OLD.appointment_date, 1, 10)
+      AND appointment_count <= 0;
+    UPDATE employee_appointment_stats SET appointment_count = appointment_count - 1
+    WHERE fk_employee_id = (SELECT fk_employee_id FROM assigned_patients WHERE assignment_id = OLD.fk_assignment_id);
+    INSERT INTO employee_daily_appointment_stats (fk_employee_id, appointment_day, appointment_count)
+    SELECT fk_employee_id, substr(NEW.appointment_date, 1, 10), 1
+    FROM assigned_patients WHERE assignment_id = NEW.fk_assignment_id
+    ON CONFLICT (fk_employee_id, appointment_day) DO UPDATE SET appointment_count = appointment_count + 1;
+    INSERT INTO employee_appointment_stats (fk_employee_id, assignment_count, appointment_count)
+    SELECT fk_employee_id, 0, 1
+    FROM assigned_patients WHERE assignment_id = NEW.fk_assignment_id
+    ON CONFLICT (fk_employee_id) DO UPDATE SET appointment_count = appointment_count + 1;
+END;
+
+CREATE TRIGGER assigned_patients_stats_on_insert
+AFTER INSERT ON assigned_patients
+BEGIN
+    INSERT INTO employee_appointment_stats (fk_employee_id, assignment_count, appointment_count)
+    SELECT NEW.fk_employee_id, 1, COUNT(*) FROM appointments WHERE fk_assignment_id = NEW.assignment_id
+    ON CONFLICT (fk_employee_id) DO UPDATE SET
+        assignment_count = assignment_count + 1,
+        appointment_count = appointment_count + excluded.appointment_count;
+    INSERT INTO employee_daily_appointment_stats (fk_employee_id, appointment_day, appointment_count)
+    SELECT NEW.fk_employee_id, substr(appointment_date, 1, 10), COUNT(*)
+    FROM appointments WHERE fk_assignment_id = NEW.assignment_id
+    GROUP BY substr(appointment_date, 1, 10)
+    ON CONFLICT (fk_employee_id, appointment_day) DO UPDATE SET
+        appointment_count = appointment_count + excluded.appointment_count;
+END;
+
+CREATE TRIGGER assigned_patients_stats_before_delete
+BEFORE DELETE ON assigned_patients
+BEGIN
+    UPDATE employee_daily_appointment_stats SET appointment_count = appointment_count - (
+        SELECT COUNT(*) FROM appointments
+        WHERE fk_assignment_id = OLD.assignment_id
+          AND substr(appointment_date, 1, 10) = employee_daily_appointment_stats.appointment_day
+    )
+    WHERE fk_employee_id = OLD.fk_employee_id AND appointment_day IN (
+        SELECT substr(appointment_date, 1, 10) FROM appointments WHERE fk_assignment_id = OLD.assignment_id
+    );
+    DELETE FROM employee_daily_appointment_stats WHERE fk_employee_id = OLD.fk_employee_id AND appointment_count <= 0;
+    UPDATE employee_appointment_stats SET appointment_count = appointment_count - (
+        SELECT COUNT(*) FROM appointments WHERE fk_assignment_id = OLD.assignment_id
+    )
+    WHERE fk_employee_id = OLD.fk_employee_id;
+END;
+
+CREATE TRIGGER assigned_patients_stats_on_delete
+AFTER DELETE ON assigned_patients
+BEGIN
+    UPDATE employee_appointment_stats SET assignment_count = assignment_count - 1
+    WHERE fk_employee_id = OLD.fk_employee_id;
+END;
+
+CREATE TRIGGER assigned_patients_stats_on_update
+AFTER UPDATE OF assignment_id, fk_employee_id ON assigned_patients
+BEGIN
+    UPDATE employee_daily_appointment_stats SET appointment_count = appointment_count - (
+        SELECT COUNT(*) FROM appointments
+        WHERE fk_assignment_id IN (OLD.assignment_id, NEW.assignment_id)
+          AND substr(appointment_date, 1, 10) = employee_daily_appointment_stats.appointment_day
+    )
+    WHERE fk_employee_id = OLD.fk_employee_id AND appointment_day IN (
+        SELECT substr(appointment_date, 1, 10) FROM appointments WHERE fk_assignment_id IN (OLD.assignment_id, NEW.assignment_id)
+    );
+    DELETE FROM employee_daily_appointment_stats WHERE fk_employee_id = OLD.fk_employee_id AND appointment_count <= 0;
+    UPDATE employee_appointment_stats SET
+        assignment_count = assignment_count - 1,
+        appointment_count = appointment_count - (
+            SELECT COUNT(*) FROM appointments WHERE fk_assignment_id IN (OLD.assignment_id, NEW.assignment_id)
+        )
+    WHERE fk_employee_id = OLD.fk_employee_id;
+    INSERT INTO employee_appointment_stats (fk_employee_id, assignment_count, appointment_count)
+    SELECT NEW.fk_employee_id, 1, COUNT(*) FROM appointments WHERE fk_assignment_id IN (OLD.assignment_id, NEW.assignment_id)
+    ON CONFLICT (fk_employee_id) DO UPDATE SET
+        assignment_count = assignment_count + 1,
+        appointment_count = appointment_count + excluded.appointment_count;
+    INSERT INTO employee_daily_appointment_stats (fk_employee_id, appointment_day, appointment_count)
+    SELECT NEW.fk_employee_id, substr(appointment_date, 1, 10), COUNT(*)
+    FROM appointments WHERE fk_assignment_id IN (OLD.assignment_id, NEW.assignment_id)
+    GROUP BY substr(appointment_date, 1, 10)
+    ON CONFLICT (fk_employee_id, appointment_day) DO UPDATE SET
+        appointment_count = appointment_count + excluded.appointment_count;
+END;
+
 -- ASSIGN_PATIENTES
 -- Dezaktywacja przypisań pacjentów, jeśli pacjent zostanie dezaktywowany
 CREATE TRIGGER deactivate_assigned_patients_on_patient
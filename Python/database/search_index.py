@@ -0,0 +1,186 @@
+# search_index.py
+
+import re
+import sqlite3
+
+# Indeksy pełnotekstowe FTS5 z zewnętrzną treścią (`content=`): tabela FTS przechowuje tylko indeks,
+# a wartości kolumn odczytywane są z tabeli źródłowej po `rowid` (= klucz główny `key`).
+SEARCH_INDEXES = {
+    "patients_fts": {
+        "table": "patients",
+        "key": "patient_id",
+        "columns": ("first_name", "last_name", "pesel", "phone", "email", "address"),
+    },
+    "diagnoses_fts": {
+        "table": "diagnoses",
+        "key": "diagnosis_id",
+        "columns": ("description", "icd11_code"),
+    },
+    "prescriptions_fts": {
+        "table": "prescriptions",
+        "key": "prescription_id",
+        "columns": ("medicine_name", "prescription_code"),
+    },
+    "appointments_fts": {
+        "table": "appointments",
+        "key": "appointment_id",
+        "columns": ("notes",),
+    },
+    "internal_meetings_fts": {
+        "table": "internal_meetings",
+        "key": "meeting_id",
+        "columns": ("notes",),
+    },
+}
+
+# unicode61 z usuwaniem znaków diakrytycznych: "Łódź" pasuje do "łodz" ("ł" nie jest rozkładane przez Unicode)
+SEARCH_TOKENIZER = "unicode61 remove_diacritics 2"
+
+# Maksymalna liczba słów zapytania (kolejne są pomijane)
+MAX_SEARCH_TERMS = 8
+
+_TERM_PATTERN = re.compile(r"\w+")
+
+
+def build_match_query(text: str, max_terms: int = MAX_SEARCH_TERMS):
+    """
+    Zamienia tekst wpisany przez użytkownika na zapytanie FTS5 MATCH: każde słowo jest
+    wyszukiwane jako prefiks, a wszystkie słowa muszą wystąpić w rekordzie.
+    Znaki składni FTS5 (cudzysłowy, operatory, nawiasy) są pomijane.
+
+    Przykład:
+        build_match_query("Kowal 9005")  # '"kowal"* "9005"*'
+
+    :return: Zapytanie MATCH lub None, jeśli tekst nie zawiera żadnego słowa.
+    """
+    terms = _TERM_PATTERN.findall((text or "").lower())[:max_terms]
+    if not terms:
+        return None
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def is_fts5_available(connection) -> bool:
+    """
+    Sprawdza, czy biblioteka SQLite została skompilowana z modułem FTS5.
+    """
+    return bool(connection.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')").fetchone()[0])
+
+
+def get_trigger_sql(index_name: str, indexes=SEARCH_INDEXES) -> dict:
+    """
+    Zwraca instrukcje tworzące wyzwalacze, które utrzymują indeks FTS5 zgodny z tabelą źródłową.
+    Usunięcie wpisu z indeksu z zewnętrzną treścią wymaga podania starych wartości kolumn (polecenie 'delete').
+
+    :return: Słownik {nazwa_wyzwalacza: instrukcja CREATE TRIGGER}.
+    """
+    spec = indexes[index_name]
+    table_name = spec["table"]
+    columns = ", ".join(spec["columns"])
+    new_values = ", ".join(f"NEW.{column}" for column in spec["columns"])
+    old_values = ", ".join(f"OLD.{column}" for column in spec["columns"])
+    insert_new = f"INSERT INTO {index_name} (rowid, {columns}) VALUES (NEW.{spec['key']}, {new_values});"
+    delete_old = (
+        f"INSERT INTO {index_name} ({index_name}, rowid, {columns}) "
+        f"VALUES ('delete', OLD.{spec['key']}, {old_values});"
+    )
+    return {
+        f"{index_name}_on_insert": (
+            f"CREATE TRIGGER IF NOT EXISTS {index_name}_on_insert\n"
+            f"AFTER INSERT ON {table_name}\nBEGIN\n    {insert_new}\nEND"
+        ),
+        f"{index_name}_on_delete": (
+            f"CREATE TRIGGER IF NOT EXISTS {index_name}_on_delete\n"
+            f"AFTER DELETE ON {table_name}\nBEGIN\n    {delete_old}\nEND"
+        ),
+        # Tylko zmiana indeksowanych kolumn (np. nie start_ts ustawiane przez wyzwalacze kolumn czasu)
+        f"{index_name}_on_update": (
+            f"CREATE TRIGGER IF NOT EXISTS {index_name}_on_update\n"
+            f"AFTER UPDATE OF {spec['key']}, {columns} ON {table_name}\nBEGIN\n    {delete_old}\n    {insert_new}\nEND"
+        ),
+    }
+
+
+class SearchIndexManager:
+    """
+    Klasa odpowiedzialna za migrację indeksów pełnotekstowych FTS5 (`SEARCH_INDEXES`).
+
+    Indeksy obejmują dane pacjentów, opisy i kody diagnoz, recepty oraz notatki wizyt i spotkań.
+    Wyszukiwanie dopasowuje prefiksy słów i sortuje wyniki według trafności (bm25), zamiast
+    pełnego skanu tabeli `LIKE '%x%'` przy każdym wpisanym znaku. Indeksy są utrzymywane
+    przez wyzwalacze, więc pozostają zgodne niezależnie od tego, który model, mostek lub skrypt
+    ładujący zmienia dane.
+    """
+
+    def __init__(self, db_controller, indexes=SEARCH_INDEXES):
+        """
+        Inicjalizuje menedżera indeksów pełnotekstowych z kontrolerem bazy danych.
+        """
+        self.db_controller = db_controller
+        self.indexes = indexes
+
+    def get_existing_triggers(self) -> set:
+        """
+        Pobiera nazwy wyzwalaczy istniejących w bazie.
+        """
+        cursor = self.db_controller.connection.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+        return {row[0] for row in cursor.fetchall()}
+
+    def rebuild(self, index_name: str) -> int:
+        """
+        Odbudowuje indeks na podstawie wszystkich wierszy tabeli źródłowej.
+
+        :return: Liczba zaindeksowanych wierszy.
+        """
+        connection = self.db_controller.connection
+        connection.execute(f"INSERT INTO {index_name} ({index_name}) VALUES ('rebuild')")
+        return connection.execute(f"SELECT COUNT(*) FROM {self.indexes[index_name]['table']}").fetchone()[0]
+
+    def apply(self) -> dict:
+        """
+        Tworzy brakujące tabele FTS5 i wyzwalacze, a po ich utworzeniu indeksuje istniejące wiersze.
+        Indeksy tabel nieobecnych w bazie są pomijane, a bez modułu FTS5 migracja nic nie zmienia.
+
+        :return: Słownik z listami `created_tables`, `created_triggers`, `skipped`, słownikiem
+            `rebuilt` {indeks: liczba wierszy} i flagą `unavailable` (brak FTS5).
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        report = {"created_tables": [], "created_triggers": [], "rebuilt": {}, "skipped": [], "unavailable": False}
+        try:
+            self.db_controller.ensure_connection()
+            connection = self.db_controller.connection
+            if not is_fts5_available(connection):
+                report["unavailable"] = True
+                return report
+
+            catalog = self.db_controller.schema_catalog
+            existing_triggers = self.get_existing_triggers()
+
+            with connection:
+                for index_name, spec in self.indexes.items():
+                    if not catalog.has_table(spec["table"]):
+                        report["skipped"].append(index_name)
+                        continue
+
+                    changed = False
+                    if not catalog.has_table(index_name):
+                        connection.execute(
+                            f"CREATE VIRTUAL TABLE {index_name} USING fts5("
+                            f"{', '.join(spec['columns'])}, content='{spec['table']}', "
+                            f"content_rowid='{spec['key']}', tokenize='{SEARCH_TOKENIZER}')"
+                        )
+                        report["created_tables"].append(index_name)
+                        changed = True
+
+                    for trigger_name, trigger_sql in get_trigger_sql(index_name, self.indexes).items():
+                        if trigger_name not in existing_triggers:
+                            connection.execute(trigger_sql)
+                            report["created_triggers"].append(trigger_name)
+                            changed = True
+
+                    # Wiersze zapisane przed utworzeniem indeksu lub wyzwalaczy
+                    if changed:
+                        report["rebuilt"][index_name] = self.rebuild(index_name)
+
+            return report
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Błąd podczas migracji indeksów pełnotekstowych: {e}") from e
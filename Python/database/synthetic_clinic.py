@@ -0,0 +1,532 @@
+# synthetic_clinic.py
+# Deterministyczny generator danych syntetycznej placówki (benchmarki, testy wydajności) w skali od 1 tys. do 1 mln wizyt.
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import time
+from datetime import date, timedelta
+
+from controllers.database_controller import DatabaseController
+from database.bulk_loader import BulkLoader, hash_password, print_report
+from models.patient_forms import PatientForms
+from models.permissions import Permissions
+from models.role_permissions import RolePermissions
+
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "schema_projekt_inz_used_v2.sql")
+
+# Skale nazwane liczbą wizyt (`appointments`); pozostałe tabele są wyliczane w `get_scale_counts`
+SCALES = {
+    "1k": 1_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+}
+
+# Tabele słownikowe ładowane z plików `lists_files/*.txt` (BulkLoader)
+DICTIONARY_TABLES = ("roles", "services", "specialties", "meeting_types", "room_types", "form_types")
+
+# Hasło wszystkich wygenerowanych kont (hash bcrypt liczony raz dla całego generowania)
+SYNTHETIC_PASSWORD = "haslo123"
+ADMIN_USERNAME = "admin"
+
+START_DATE = "2025-01-06"
+SLOT_TIMES = tuple(f"{hour:02d}:00-{hour + 1:02d}:00" for hour in range(8, 18))  # 10 rezerwacji na pokój dziennie
+
+FIRST_NAMES = (
+    "Anna", "Maria", "Katarzyna", "Małgorzata", "Agnieszka", "Barbara", "Ewa", "Zofia", "Joanna", "Magdalena",
+    "Jan", "Piotr", "Krzysztof", "Andrzej", "Tomasz", "Paweł", "Michał", "Łukasz", "Grzegorz", "Wojciech",
+)
+LAST_NAMES = (
+    "Nowak", "Kowalski", "Wiśniewski", "Wójcik", "Kowalczyk", "Kamiński", "Lewandowski", "Zieliński",
+    "Szymański", "Woźniak", "Dąbrowski", "Kozłowski", "Jankowski", "Mazur", "Kwiatkowski", "Krawczyk",
+)
+CITIES = ("Warszawa", "Kraków", "Gliwice", "Wrocław", "Poznań", "Gdańsk", "Łódź", "Katowice")
+STREETS = ("Główna", "Zielona", "Polna", "Leśna", "Słoneczna", "Krótka", "Szkolna", "Ogrodowa")
+
+# Zawody pracowników medycznych (personel przypisywany do pacjentów) i pozostałych
+MEDICAL_PROFESSIONS = (
+    "Psychiatra", "Psycholog kliniczny", "Psychoterapeuta", "Psychopedagog", "Terapeuta uzależnień", "Dietetyk kliniczny",
+)
+# Rola konta pracownika (nazwa z `roles_list.txt`) według zawodu; pozostałe zawody otrzymują rolę "Inny"
+PROFESSION_ROLES = {
+    "Administrator": "Administrator",
+    "Kierownik": "Kierownik",
+    "Informatyk": "Informatyk",
+    "Recepcjonista": "Recepcjonista",
+    **{profession: profession for profession in MEDICAL_PROFESSIONS},
+}
+
+APPOINTMENT_STATUSES = (("Zrealizowana", 55), ("Odwołana", 25), ("Zaplanowana", 20))
+APPOINTMENT_NOTES = ("Konsultacja terapeutyczna", "Pierwsza konsultacja", "Terapia indywidualna")
+DIAGNOSES = (
+    ("Zaburzenie depresyjne nawracające", "6A71"), ("Zaburzenie afektywne dwubiegunowe", "6A60"),
+    ("Schizofrenia paranoidalna", "6A20"), ("Fobia społeczna", "6B04"), ("Anoreksja", "6B80"),
+    ("Zaburzenia lękowe uogólnione", "6B00"),
+)
+MEDICINES = ("Sertraline", "Fluoxetine", "Citalopram", "Escitalopram", "Bupropion", "Diazepam", "Clozapine")
+MEETING_STATUSES = ("Zaplanowane", "Zakończone", "Odwołane", "Przełożone")
+MEETING_NOTES = ("Konsultacje przypadków", "Sesja superwizji grupowej", "Omówienie planów")
+
+PESEL_WEIGHTS = (1, 3, 7, 9, 1, 3, 7, 9, 1, 3)
+BIRTH_DATE_FROM = date(1940, 1, 1)
+BIRTH_DATE_TO = date(2005, 12, 31)
+
+_ASCII_LETTERS = str.maketrans("ąćęłńóśźżĄĆĘŁŃÓŚŹŻ", "acelnoszzACELNOSZZ")
+
+
+def get_scale_counts(appointments: int) -> dict:
+    """
+    Wylicza liczność tabel dla zadanej liczby wizyt (proporcje zbliżone do danych z `lists_files`).
+
+    Przykład:
+        get_scale_counts(1_000)  # {"appointments": 1000, "patients": 100, "employees": 12, ...}
+
+    :raises ValueError: Jeśli liczba wizyt jest mniejsza niż 1.
+    """
+    if appointments < 1:
+        raise ValueError(f"Nieprawidłowa liczba wizyt: {appointments}")
+    employees = max(12, appointments // 500)
+    return {
+        "appointments": appointments,
+        "patients": max(50, appointments // 10),
+        "employees": employees,
+        "rooms": min(100, max(10, employees // 4)),  # room_number: 1-100 (CHECK w schemacie)
+        "internal_meetings": max(5, appointments // 100),
+    }
+
+
+def resolve_scale(scale) -> int:
+    """
+    Zamienia nazwę skali ("1k", "100k", "1m") lub liczbę na liczbę wizyt.
+
+    :raises ValueError: Jeśli skala jest nieznana.
+    """
+    if str(scale).lower() in SCALES:
+        return SCALES[str(scale).lower()]
+    try:
+        return int(scale)
+    except ValueError as e:
+        raise ValueError(f"Nieznana skala: {scale} (dozwolone: {', '.join(SCALES)} lub liczba wizyt)") from e
+
+
+def pesel_checksum(digits: str) -> int:
+    """
+    Zwraca cyfrę kontrolną dla pierwszych 10 cyfr numeru PESEL.
+    """
+    return (10 - sum(weight * int(digit) for weight, digit in zip(PESEL_WEIGHTS, digits)) % 10) % 10
+
+
+def make_pesel(birth_date: date, serial: int, female: bool) -> str:
+    """
+    Tworzy poprawny numer PESEL (data urodzenia z przesunięciem miesiąca dla stulecia,
+    numer serii 0-999, cyfra płci i cyfra kontrolna).
+    """
+    month_offset = {18: 80, 19: 0, 20: 20, 21: 40, 22: 60}[birth_date.year // 100]
+    sex_digit = (serial % 5) * 2 + (0 if female else 1)
+    digits = (
+        f"{birth_date.year % 100:02d}{birth_date.month + month_offset:02d}{birth_date.day:02d}"
+        f"{serial % 1000:03d}{sex_digit}"
+    )
+    return f"{digits}{pesel_checksum(digits)}"
+
+
+def is_valid_pesel(pesel: str) -> bool:
+    """
+    Sprawdza format, datę urodzenia i cyfrę kontrolną numeru PESEL.
+    """
+    if len(pesel) != 11 or not pesel.isdigit():
+        return False
+    month = int(pesel[2:4])
+    century = {0: 1900, 20: 2000, 40: 2100, 60: 2200, 80: 1800}[month // 20 * 20]
+    try:
+        date(century + int(pesel[:2]), month % 20, int(pesel[4:6]))
+    except ValueError:
+        return False
+    return pesel_checksum(pesel[:10]) == int(pesel[10])
+
+
+def _ascii(text: str) -> str:
+    return text.translate(_ASCII_LETTERS).lower()
+
+
+class SyntheticClinicGenerator:
+    """
+    Generuje spójne (klucze obce, ograniczenia UNIQUE i CHECK) dane placówki w skali od tysięcy
+    do milionów wizyt.
+
+    - Dane są deterministyczne: każda tabela ma własny generator liczb losowych wyznaczony
+      z `seed` i nazwy tabeli, więc te same parametry dają identyczną bazę.
+    - Numery PESEL są poprawne (data urodzenia i cyfra kontrolna), a telefony i e-maile unikalne.
+    - Rezerwacje sal są rozkładane na siatce (dzień, godzina, sala), więc nigdy się nie nakładają;
+      każda wizyta i każde spotkanie wewnętrzne ma własną rezerwację.
+    - Wiersze są generowane strumieniowo i wstawiane przez `executemany` (jedna transakcja na tabelę),
+      a tabele słownikowe ładowane są z plików `lists_files/*.txt` przez `BulkLoader`.
+    """
+
+    def __init__(self, db_controller, seed: int = 2025, start_date: str = START_DATE, password_hash: str = None):
+        """
+        Inicjalizuje generator.
+
+        :param seed: Ziarno generatora liczb losowych.
+        :param start_date: Data pierwszego dnia rezerwacji (YYYY-MM-DD).
+        :param password_hash: Hash hasła kont; domyślnie hash bcrypt `SYNTHETIC_PASSWORD`.
+        """
+        self.db_controller = db_controller
+        self.seed = seed
+        self.start_date = date.fromisoformat(start_date)
+        self.password_hash = password_hash
+
+        # Wartości wyliczane podczas generowania i używane przez kolejne tabele
+        self._role_ids = {}  # {nazwa_roli: role_id}
+        self._service_ids = []
+        self._specialty_ids = []
+        self._meeting_type_ids = []
+        self._room_type_ids = []
+        self._employees = []  # [(employee_id, zawód, imię, nazwisko)]
+        self._medical_employee_ids = []
+        self._employee_services = {}  # {employee_id: [service_id, ...]}
+        self._assignment_employees = [None]  # Indeks = assignment_id
+        self._completed_appointment_ids = []
+
+    def _rng(self, table_name: str) -> random.Random:
+        return random.Random(f"{self.seed}:{table_name}")
+
+    def get_days(self, counts: dict) -> int:
+        """
+        Zwraca liczbę dni potrzebną, aby rezerwacje wizyt i spotkań zmieściły się na siatce sal.
+        """
+        reservations = counts["appointments"] + counts["internal_meetings"]
+        per_day = counts["rooms"] * len(SLOT_TIMES)
+        return -(-reservations // per_day)
+
+    def get_reference_date(self, counts: dict) -> str:
+        """
+        Zwraca środkowy dzień okresu rezerwacji (punkt odniesienia dla zapytań o "dzisiaj").
+        """
+        return (self.start_date + timedelta(days=self.get_days(counts) // 2)).isoformat()
+
+    def _reservation_slot(self, index: int, rooms: int) -> tuple:
+        # Siatka: kolejne rezerwacje zajmują kolejne sale, potem kolejne godziny, potem kolejne dni
+        per_day = rooms * len(SLOT_TIMES)
+        day, rest = divmod(index, per_day)
+        slot, room_index = divmod(rest, rooms)
+        return room_index + 1, (self.start_date + timedelta(days=day)).isoformat(), SLOT_TIMES[slot]
+
+    # +-+-+-+- Wiersze tabel +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+    def iter_patients(self, counts: dict):
+        rng = self._rng("patients")
+        birth_days = (BIRTH_DATE_TO - BIRTH_DATE_FROM).days + 1
+        for patient_id in range(1, counts["patients"] + 1):
+            index = patient_id - 1
+            first_name = rng.choice(FIRST_NAMES)
+            last_name = rng.choice(LAST_NAMES)
+            birth_date = BIRTH_DATE_FROM + timedelta(days=index % birth_days)
+            # Para (data urodzenia, seria) jest unikalna, więc numery PESEL się nie powtarzają
+            pesel = make_pesel(birth_date, index // birth_days, female=first_name.endswith("a"))
+            yield (
+                patient_id, first_name, last_name, pesel, f"6{patient_id:08d}",
+                f"{_ascii(first_name)}.{_ascii(last_name)}.{patient_id}@example.com",
+                f"{rng.choice(CITIES)} ul. {rng.choice(STREETS)} {rng.randint(1, 120)}", birth_date.isoformat(),
+            )
+
+    def iter_employees(self, counts: dict):
+        rng = self._rng("employees")
+        for employee_id in range(1, counts["employees"] + 1):
+            if employee_id == 1:
+                profession = "Administrator"
+            elif employee_id == 2:
+                profession = "Kierownik"
+            elif employee_id == 3:
+                profession = "Informatyk"
+            elif employee_id % 20 == 0:
+                profession = "Recepcjonista"
+            elif employee_id % 50 == 1:
+                profession = "Księgowy"
+            else:
+                profession = MEDICAL_PROFESSIONS[employee_id % len(MEDICAL_PROFESSIONS)]
+
+            is_medical_staff = int(profession in MEDICAL_PROFESSIONS)
+            if is_medical_staff:
+                self._medical_employee_ids.append(employee_id)
+            first_name = rng.choice(FIRST_NAMES)
+            last_name = rng.choice(LAST_NAMES)
+            self._employees.append((employee_id, profession, first_name, last_name))
+            yield (
+                employee_id, first_name, last_name,
+                f"{_ascii(first_name)}.{_ascii(last_name)}.{employee_id}@klinika.com",
+                f"5{employee_id:08d}", profession, is_medical_staff,
+            )
+
+    def iter_users_accounts(self, _counts: dict):
+        if self.password_hash is None:
+            self.password_hash = hash_password(SYNTHETIC_PASSWORD)
+        for employee_id, profession, first_name, last_name in self._employees:
+            role_id = self._role_ids.get(PROFESSION_ROLES.get(profession, "Inny"), self._role_ids.get("Inny"))
+            username = ADMIN_USERNAME if employee_id == 1 else f"{_ascii(first_name)}.{_ascii(last_name)}{employee_id}"
+            yield (employee_id, employee_id, role_id, username, self.password_hash, 1, "2024-12-01 08:00", "2099-12-31 23:59")
+
+    def iter_employee_specialties(self, _counts: dict):
+        rng = self._rng("employee_specialties")
+        row_id = 0
+        for employee_id in self._medical_employee_ids:
+            for specialty_id in rng.sample(self._specialty_ids, min(len(self._specialty_ids), rng.randint(1, 2))):
+                row_id += 1
+                yield row_id, employee_id, specialty_id
+
+    def iter_employee_services(self, _counts: dict):
+        rng = self._rng("employee_services")
+        row_id = 0
+        for employee_id in self._medical_employee_ids:
+            services = rng.sample(self._service_ids, min(len(self._service_ids), 3))
+            self._employee_services[employee_id] = services
+            for service_id in services:
+                row_id += 1
+                yield row_id, employee_id, service_id
+
+    def iter_assigned_patients(self, counts: dict):
+        rng = self._rng("assigned_patients")
+        assignment_id = 0
+        for patient_id in range(1, counts["patients"] + 1):
+            # 70% pacjentów ma jednego specjalistę, pozostali dwóch
+            specialists = 1 if rng.random() < 0.7 or len(self._medical_employee_ids) < 2 else 2
+            for employee_id in rng.sample(self._medical_employee_ids, specialists):
+                assignment_id += 1
+                self._assignment_employees.append(employee_id)
+                yield assignment_id, patient_id, employee_id
+
+    def iter_rooms(self, counts: dict):
+        rng = self._rng("rooms")
+        for room_id in range(1, counts["rooms"] + 1):
+            yield room_id, room_id, (room_id - 1) * 6 // counts["rooms"], rng.choice(self._room_type_ids)
+
+    def iter_room_reservations(self, counts: dict):
+        reservations = counts["appointments"] + counts["internal_meetings"]
+        for index in range(reservations):
+            room_id, reservation_date, reservation_time = self._reservation_slot(index, counts["rooms"])
+            yield index + 1, room_id, reservation_date, reservation_time
+
+    def _meeting_stride(self, counts: dict) -> int:
+        # Co `stride`-ta rezerwacja należy do spotkania wewnętrznego, aby spotkania były rozłożone w czasie
+        return (counts["appointments"] + counts["internal_meetings"]) // counts["internal_meetings"]
+
+    def iter_appointments(self, counts: dict):
+        rng = self._rng("appointments")
+        statuses = [status for status, _ in APPOINTMENT_STATUSES]
+        weights = [weight for _, weight in APPOINTMENT_STATUSES]
+        assignments = len(self._assignment_employees) - 1
+        stride = self._meeting_stride(counts)
+
+        reservation_id = 0
+        for appointment_id in range(1, counts["appointments"] + 1):
+            reservation_id += 1
+            if reservation_id % stride == 0 and reservation_id // stride <= counts["internal_meetings"]:
+                reservation_id += 1  # Rezerwacja spotkania wewnętrznego
+            _, reservation_date, reservation_time = self._reservation_slot(reservation_id - 1, counts["rooms"])
+
+            assignment_id = rng.randint(1, assignments)
+            employee_services = self._employee_services.get(self._assignment_employees[assignment_id]) or [None]
+            status = rng.choices(statuses, weights)[0]
+            if status == "Zrealizowana":
+                self._completed_appointment_ids.append(appointment_id)
+            yield (
+                appointment_id, assignment_id, rng.choice(employee_services), reservation_id,
+                f"{reservation_date} {reservation_time}", status, rng.choice(APPOINTMENT_NOTES),
+            )
+
+    def iter_internal_meetings(self, counts: dict):
+        rng = self._rng("internal_meetings")
+        stride = self._meeting_stride(counts)
+        for meeting_id in range(1, counts["internal_meetings"] + 1):
+            reservation_id = meeting_id * stride
+            _, reservation_date, reservation_time = self._reservation_slot(reservation_id - 1, counts["rooms"])
+            yield (
+                meeting_id, rng.choice(self._meeting_type_ids), reservation_id,
+                f"{reservation_date} {reservation_time}", rng.choice(MEETING_NOTES), rng.choice(MEETING_STATUSES),
+            )
+
+    def iter_meeting_participants(self, counts: dict):
+        rng = self._rng("meeting_participants")
+        participant_id = 0
+        for meeting_id in range(1, counts["internal_meetings"] + 1):
+            participants = rng.sample(self._medical_employee_ids, min(3, len(self._medical_employee_ids)))
+            for position, employee_id in enumerate(participants):
+                participant_id += 1
+                yield (
+                    participant_id, meeting_id, employee_id, "Organizator" if position == 0 else "Uczestnik",
+                    "Obecny" if rng.random() < 0.8 else "Nieobecny",
+                )
+
+    def iter_diagnoses(self, _counts: dict):
+        rng = self._rng("diagnoses")
+        diagnosis_id = 0
+        for appointment_id in self._completed_appointment_ids:
+            if rng.random() < 0.6:
+                diagnosis_id += 1
+                description, icd11_code = rng.choice(DIAGNOSES)
+                yield diagnosis_id, appointment_id, description, icd11_code
+
+    def iter_prescriptions(self, _counts: dict):
+        rng = self._rng("prescriptions")
+        prescription_id = 0
+        for appointment_id in self._completed_appointment_ids:
+            if rng.random() < 0.3:
+                prescription_id += 1
+                yield (
+                    prescription_id, appointment_id, rng.choice(MEDICINES), float(rng.choice((10, 20, 50, 100))),
+                    round(rng.uniform(5, 80), 2), f"{rng.randint(0, 9999):04d}",
+                )
+
+    # +-+-+-+- Generowanie +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+    # Kolejność tabel (tabela nadrzędna przed podrzędną) i kolumny wstawiane przez generator
+    TABLES = (
+        ("patients", ("patient_id", "first_name", "last_name", "pesel", "phone", "email", "address", "date_of_birth")),
+        ("employees", ("employee_id", "first_name", "last_name", "email", "phone", "profession", "is_medical_staff")),
+        ("users_accounts", (
+            "user_id", "employee_id", "role_id", "username", "password_hash", "is_active", "created_at", "expired",
+        )),
+        ("employee_specialties", ("employee_specialty_id", "employee_id", "specialty_id")),
+        ("employee_services", ("employee_service_id", "employee_id", "service_id")),
+        ("assigned_patients", ("assignment_id", "fk_patient_id", "fk_employee_id")),
+        ("rooms", ("room_id", "room_number", "floor", "fk_room_type_id")),
+        ("room_reservations", ("reservation_id", "fk_room_id", "reservation_date", "reservation_time")),
+        ("appointments", (
+            "appointment_id", "fk_assignment_id", "fk_service_id", "fk_reservation_id",
+            "appointment_date", "appointment_status", "notes",
+        )),
+        ("internal_meetings", (
+            "meeting_id", "fk_meeting_type_id", "fk_reservation_id", "meeting_date", "notes", "internal_meeting_status",
+        )),
+        ("meeting_participants", ("participant_id", "fk_meeting_id", "fk_employee_id", "participant_role", "attendance")),
+        ("diagnoses", ("diagnosis_id", "fk_appointment_id", "description", "icd11_code")),
+        ("prescriptions", (
+            "prescription_id", "fk_appointment_id", "medicine_name", "dosage", "medicine_price", "prescription_code",
+        )),
+    )
+
+    def _load_dictionaries(self) -> list:
+        report = BulkLoader(self.db_controller).load_all(DICTIONARY_TABLES)
+        connection = self.db_controller.connection
+        self._role_ids = {name: role_id for role_id, name in connection.execute("SELECT role_id, role_name FROM roles")}
+        self._service_ids = [row[0] for row in connection.execute("SELECT service_id FROM services ORDER BY service_id")]
+        self._specialty_ids = [row[0] for row in connection.execute("SELECT specialty_id FROM specialties ORDER BY specialty_id")]
+        self._meeting_type_ids = [
+            row[0] for row in connection.execute("SELECT meeting_type_id FROM meeting_types ORDER BY meeting_type_id")
+        ]
+        self._room_type_ids = [row[0] for row in connection.execute("SELECT room_type_id FROM room_types ORDER BY room_type_id")]
+        return report["tables"]
+
+    def _insert_table(self, table_name: str, columns: tuple, rows) -> dict:
+        query = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})"
+        connection = self.db_controller.connection
+        start = time.perf_counter()
+        with connection:
+            connection.execute(f"DELETE FROM {table_name}")
+            inserted = connection.executemany(query, rows).rowcount
+        seconds = time.perf_counter() - start
+        return {
+            "table": table_name,
+            "rows": inserted,
+            "skipped": 0,
+            "seconds": seconds,
+            "rows_per_second": inserted / seconds if seconds > 0 else 0.0,
+        }
+
+    def generate(self, counts: dict) -> dict:
+        """
+        Wypełnia bazę danymi w liczności `counts` (`get_scale_counts`). Schemat musi już istnieć.
+
+        :return: Raport w formacie `BulkLoader.load_all`: {"tables", "errors", "foreign_key_violations",
+            "seconds"} oraz `counts` i `reference_date`.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        self.db_controller.ensure_connection()
+        connection = self.db_controller.connection
+        start = time.perf_counter()
+        try:
+            table_stats = self._load_dictionaries()
+
+            connection.commit()
+            connection.execute("PRAGMA foreign_keys = OFF")
+            for table_name, columns in self.TABLES:
+                rows = getattr(self, f"iter_{table_name}")(counts)
+                table_stats.append(self._insert_table(table_name, columns, rows))
+            violations = [
+                {"table": row[0], "rowid": row[1], "parent": row[2]}
+                for row in connection.execute("PRAGMA foreign_key_check").fetchall()
+            ]
+            connection.execute("ANALYZE")
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Błąd podczas generowania danych syntetycznych: {e}") from e
+        finally:
+            connection.execute("PRAGMA foreign_keys = ON")
+            self.db_controller.room_availability.invalidate()
+            self.db_controller.reference_cache.invalidate()
+
+        return {
+            "tables": table_stats,
+            "errors": [],
+            "foreign_key_violations": violations,
+            "seconds": time.perf_counter() - start,
+            "counts": dict(counts),
+            "reference_date": self.get_reference_date(counts),
+        }
+
+
+def create_database(database_path: str, appointments: int, seed: int = 2025, password_hash: str = None) -> dict:
+    """
+    Tworzy plik bazy danych ze schematem v2 i wypełnia go danymi syntetycznymi.
+    Baza jest budowana w pliku tymczasowym i przenoszona na miejsce dopiero po udanym generowaniu.
+
+    :return: Raport `SyntheticClinicGenerator.generate`.
+    :raises FileExistsError: Jeśli plik bazy już istnieje.
+    """
+    if os.path.exists(database_path):
+        raise FileExistsError(f"Plik bazy danych już istnieje: {database_path}")
+    os.makedirs(os.path.dirname(os.path.abspath(database_path)), exist_ok=True)
+    temporary_path = f"{database_path}.tmp"
+    for path in (temporary_path, f"{temporary_path}-wal", f"{temporary_path}-shm"):
+        if os.path.exists(path):
+            os.remove(path)
+
+    db_controller = DatabaseController()
+    db_controller.database_path = temporary_path
+    db_controller.connect_to_database()
+    try:
+        with open(SCHEMA_PATH, encoding="utf-8") as schema_file:
+            db_controller.connection.executescript(schema_file.read())
+        # Tabele spoza pliku schematu tworzone przy starcie aplikacji przez modele
+        for model_class in (Permissions, RolePermissions, PatientForms):
+            model_class(db_controller).create_table()
+        generator = SyntheticClinicGenerator(db_controller, seed=seed, password_hash=password_hash)
+        report = generator.generate(get_scale_counts(appointments))
+        db_controller.connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        db_controller.close_connection()
+
+    os.replace(temporary_path, database_path)
+    return report
+
+
+def main(argv=None) -> int:
+    """
+    Punkt wejścia wiersza poleceń: `python -m database.synthetic_clinic --scale 100k --output clinic_100k.db`.
+    """
+    parser = argparse.ArgumentParser(description="Generowanie syntetycznej bazy placówki.")
+    parser.add_argument("--scale", default="1k", help=f"Skala ({', '.join(SCALES)}) lub liczba wizyt.")
+    parser.add_argument("--seed", type=int, default=2025, help="Ziarno generatora liczb losowych.")
+    parser.add_argument("--output", required=True, help="Ścieżka nowego pliku bazy danych.")
+    parser.add_argument("--password-hash", help="Gotowy hash hasła kont (domyślnie bcrypt hasła SYNTHETIC_PASSWORD).")
+    args = parser.parse_args(argv)
+
+    report = create_database(args.output, resolve_scale(args.scale), seed=args.seed, password_hash=args.password_hash)
+    print_report(report)
+    print(f"Dzień odniesienia (środek okresu rezerwacji): {report['reference_date']}")
+    return 1 if report["foreign_key_violations"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
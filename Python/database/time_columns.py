@@ -0,0 +1,186 @@
+# time_columns.py
+
+import sqlite3
+from datetime import date, timedelta
+from database.room_availability import parse_minutes
+
+EPOCH_DATE = date(1970, 1, 1)
+MINUTES_PER_DAY = 24 * 60
+
+
+def _epoch_minutes_sql(date_expression: str, time_column: str, time_offset: int) -> str:
+    """
+    Wyrażenie SQL zamieniające datę `YYYY-MM-DD` i godzinę `HH:MM` (zaczynającą się na pozycji
+    `time_offset` kolumny `time_column`) na minuty od 1970-01-01 00:00.
+
+    Format kolumn jest gwarantowany przez CHECK (GLOB) w schemacie, więc godziny i minuty
+    odczytywane są ze stałych pozycji. Nieprawidłowa data daje NULL.
+    """
+    return (
+        f"CAST(strftime('%s', {date_expression}) AS INTEGER) / 60"
+        f" + CAST(substr({time_column}, {time_offset}, 2) AS INTEGER) * 60"
+        f" + CAST(substr({time_column}, {time_offset + 3}, 2) AS INTEGER)"
+    )
+
+
+# Tabele z kolumnami `start_ts` / `end_ts` (minuty od epoki, czas lokalny placówki bez strefy).
+# Wyrażenia używają prefiksu `{row}` - "NEW." w wyzwalaczach i "" przy migracji istniejących wierszy.
+TIME_COLUMN_TABLES = {
+    # appointment_date: 'YYYY-MM-DD HH:MM-HH:MM'
+    "appointments": {
+        "key": "appointment_id",
+        "source_columns": ("appointment_date",),
+        "start_ts": _epoch_minutes_sql("substr({row}appointment_date, 1, 10)", "{row}appointment_date", 12),
+        "end_ts": _epoch_minutes_sql("substr({row}appointment_date, 1, 10)", "{row}appointment_date", 18),
+    },
+    # reservation_date: 'YYYY-MM-DD', reservation_time: 'HH:MM-HH:MM'
+    "room_reservations": {
+        "key": "reservation_id",
+        "source_columns": ("reservation_date", "reservation_time"),
+        "start_ts": _epoch_minutes_sql("{row}reservation_date", "{row}reservation_time", 1),
+        "end_ts": _epoch_minutes_sql("{row}reservation_date", "{row}reservation_time", 7),
+    },
+}
+
+
+def epoch_minutes(date_value: str, time_value: str = "00:00") -> int:
+    """
+    Zamienia datę `YYYY-MM-DD` i godzinę `HH:MM` na minuty od epoki (wartość kolumn `start_ts` / `end_ts`).
+
+    Przykład:
+        epoch_minutes("2025-02-24", "10:00")  # 29006520
+
+    :raises ValueError: Jeśli data lub godzina mają nieprawidłowy format.
+    """
+    days = (date.fromisoformat(date_value) - EPOCH_DATE).days
+    return days * MINUTES_PER_DAY + parse_minutes(time_value)
+
+
+def day_range_ts(date_from: str, date_to: str = None) -> tuple:
+    """
+    Zwraca przedział [początek, koniec) w minutach od epoki obejmujący całe dni od `date_from`
+    do `date_to` włącznie (domyślnie jeden dzień) - do zapytań `start_ts >= ? AND start_ts < ?`.
+
+    :raises ValueError: Jeśli data ma nieprawidłowy format lub `date_to` jest wcześniejsza niż `date_from`.
+    """
+    start = epoch_minutes(date_from)
+    end = epoch_minutes(date_to or date_from) + MINUTES_PER_DAY
+    if end <= start:
+        raise ValueError(f"Nieprawidłowy zakres dat: {date_from} - {date_to}.")
+    return start, end
+
+
+def format_ts(timestamp: int) -> str:
+    """
+    Zamienia minuty od epoki na tekst `YYYY-MM-DD HH:MM`.
+    """
+    days, minutes = divmod(timestamp, MINUTES_PER_DAY)
+    return f"{(EPOCH_DATE + timedelta(days=days)).isoformat()} {minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def get_trigger_sql(table_name: str, tables=TIME_COLUMN_TABLES) -> dict:
+    """
+    Zwraca instrukcje tworzące wyzwalacze utrzymujące `start_ts` / `end_ts` tabeli.
+
+    :return: Słownik {nazwa_wyzwalacza: instrukcja CREATE TRIGGER}.
+    """
+    spec = tables[table_name]
+    body = f"""
+BEGIN
+    UPDATE {table_name}
+    SET start_ts = {spec['start_ts'].format(row='NEW.')},
+        end_ts = {spec['end_ts'].format(row='NEW.')}
+    WHERE {spec['key']} = NEW.{spec['key']};
+END"""
+    return {
+        f"{table_name}_time_columns_on_insert": (
+            f"CREATE TRIGGER IF NOT EXISTS {table_name}_time_columns_on_insert\n"
+            f"AFTER INSERT ON {table_name}{body}"
+        ),
+        f"{table_name}_time_columns_on_update": (
+            f"CREATE TRIGGER IF NOT EXISTS {table_name}_time_columns_on_update\n"
+            f"AFTER UPDATE OF {', '.join(spec['source_columns'])} ON {table_name}{body}"
+        ),
+    }
+
+
+class TimeColumnsManager:
+    """
+    Klasa odpowiedzialna za migrację kolumn `start_ts` / `end_ts` w tabelach `appointments`
+    i `room_reservations`.
+
+    Kolumny przechowują początek i koniec terminu jako liczbę minut od epoki, dzięki czemu zapytania
+    o zakres dat ("dzisiaj", "nadchodzące") są skanem zakresu indeksu, a nie porównaniem tekstu.
+    Wartości są wyliczane przez wyzwalacze, więc pozostają zgodne niezależnie od tego, który model,
+    mostek lub skrypt ładujący zmienia datę.
+    """
+
+    def __init__(self, db_controller, tables=TIME_COLUMN_TABLES):
+        """
+        Inicjalizuje menedżera kolumn czasu z kontrolerem bazy danych.
+        """
+        self.db_controller = db_controller
+        self.tables = tables
+
+    def get_existing_triggers(self) -> set:
+        """
+        Pobiera nazwy wyzwalaczy istniejących w bazie.
+        """
+        cursor = self.db_controller.connection.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+        return {row[0] for row in cursor.fetchall()}
+
+    def backfill(self, table_name: str) -> int:
+        """
+        Wylicza `start_ts` / `end_ts` dla wszystkich wierszy tabeli.
+
+        :return: Liczba zaktualizowanych wierszy.
+        """
+        spec = self.tables[table_name]
+        query = (
+            f"UPDATE {table_name} SET start_ts = {spec['start_ts'].format(row='')}, "
+            f"end_ts = {spec['end_ts'].format(row='')}"
+        )
+        return self.db_controller.connection.execute(query).rowcount
+
+    def apply(self) -> dict:
+        """
+        Dodaje brakujące kolumny `start_ts` / `end_ts` i wyzwalacze, a po ich dodaniu
+        wylicza wartości dla istniejących wierszy. Tabele nieobecne w bazie są pomijane.
+
+        :return: Słownik z listami `added_columns`, `created_triggers`, `skipped`
+            i słownikiem `backfilled` {tabela: liczba wierszy}.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        report = {"added_columns": [], "created_triggers": [], "backfilled": {}, "skipped": []}
+        try:
+            self.db_controller.ensure_connection()
+            connection = self.db_controller.connection
+            existing_triggers = self.get_existing_triggers()
+
+            with connection:
+                for table_name in self.tables:
+                    columns = self.db_controller.schema_catalog.get_columns(table_name)
+                    if not columns:
+                        report["skipped"].append(table_name)
+                        continue
+
+                    changed = False
+                    for column in ("start_ts", "end_ts"):
+                        if column not in columns:
+                            connection.execute(f"ALTER TABLE {table_name} ADD COLUMN {column} INTEGER")
+                            report["added_columns"].append(f"{table_name}.{column}")
+                            changed = True
+
+                    for trigger_name, trigger_sql in get_trigger_sql(table_name, self.tables).items():
+                        if trigger_name not in existing_triggers:
+                            connection.execute(trigger_sql)
+                            report["created_triggers"].append(trigger_name)
+                            changed = True
+
+                    # Wiersze zapisane przed dodaniem kolumn lub wyzwalaczy
+                    if changed:
+                        report["backfilled"][table_name] = self.backfill(table_name)
+
+            return report
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Błąd podczas migracji kolumn czasu: {e}") from e
@@ -0,0 +1,73 @@
+# unit_of_work.py
+
+import itertools
+import sqlite3
+from contextlib import contextmanager
+
+
+class UnitOfWorkConnection(sqlite3.Connection):
+    """
+    Połączenie do zapisu z obsługą jednostki pracy (`DatabaseController.unit_of_work`).
+
+    Wewnątrz jednostki pracy `commit()` wywoływane przez modele po każdym zapisie jest odkładane
+    do zakończenia zewnętrznej jednostki (jeden zapis na dysk zamiast jednego na rekord), a `rollback()`
+    i blok `with connection:` zakończony wyjątkiem cofają zmiany tylko do bieżącego punktu zapisu
+    (SAVEPOINT). Jednostki pracy można zagnieżdżać - każda jest osobnym punktem zapisu.
+
+    Poza jednostką pracy połączenie działa jak zwykłe `sqlite3.Connection`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.savepoints = []  # Nazwy otwartych punktów zapisu (ostatni - najbardziej zagnieżdżony)
+        self._savepoint_ids = itertools.count(1)
+
+    @property
+    def in_unit_of_work(self) -> bool:
+        """
+        Informuje, czy połączenie jest wewnątrz jednostki pracy.
+        """
+        return bool(self.savepoints)
+
+    def commit(self):
+        # Zatwierdzenie odkładane do końca zewnętrznej jednostki pracy
+        if self.savepoints:
+            return
+        super().commit()
+
+    def rollback(self):
+        # Wycofanie tylko zmian bieżącego punktu zapisu
+        if self.savepoints:
+            self.execute(f"ROLLBACK TO {self.savepoints[-1]}")
+            return
+        super().rollback()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.savepoints:
+            if exc_type is not None:
+                self.rollback()
+            return False
+        return super().__exit__(exc_type, exc_value, traceback)
+
+    @contextmanager
+    def savepoint(self):
+        """
+        Otwiera punkt zapisu na czas bloku `with`. Wyjątek cofa zmiany bloku i jest przekazywany dalej;
+        zakończenie zewnętrznego punktu zapisu zatwierdza transakcję.
+        """
+        name = f"unit_of_work_{next(self._savepoint_ids)}"
+        outermost = not self.savepoints
+        self.execute(f"SAVEPOINT {name}")
+        self.savepoints.append(name)
+        try:
+            yield self
+        except BaseException:
+            self.execute(f"ROLLBACK TO {name}")
+            self.savepoints.pop()
+            self.execute(f"RELEASE {name}")
+            raise
+        self.savepoints.pop()
+        self.execute(f"RELEASE {name}")
+        # Transakcja rozpoczęta przed jednostką pracy (niejawny BEGIN) nie kończy się na RELEASE
+        if outermost and self.in_transaction:
+            super().commit()
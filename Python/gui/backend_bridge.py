@@ -2,13 +2,78 @@
 import sqlite3
 import re
 from PySide6.QtCore import QObject, Signal, Slot, Property # pylint: disable=E0611
-from services.dashboard_service import DashboardService
-from services.patients_service import PatientsService
-from controllers.users_accounts_controller import UsersAccountsController
+from database.exists_probe import ExistsProbe
+from database.permission_engine import SCOPE_ALL, SCOPE_ASSIGNED, SCOPE_NONE
 from controllers.patients_controller import PatientController
-from controllers.assigned_patients_controller import AssignedPatientsController
 from controllers.diagnoses_controller import DiagnosesController
 from controllers.prescriptions_controller import PrescriptionsController
+from gui.bridge_worker import BridgeWorker
+from gui.entity_list_model import EntityListModel
+
+# Liczba pacjentów przesyłanych do QML w jednej porcji (paginacja po patient_id)
+PATIENTS_PAGE_SIZE = 200
+
+# Pola (role) modelu listy pacjentów udostępnianego do QML
+PATIENT_FIELDS = (
+    "patient_id", "first_name", "last_name", "pesel", "phone", "email", "address", "date_of_birth", "is_active"
+)
+
+
+def _login_task(main_controller, username, password):
+    """
+    Zadanie wątku roboczego: uwierzytelnia użytkownika (bcrypt) i pobiera migawkę dashboardu.
+
+    Returns:
+        tuple: (user, snapshot) lub (None, None) przy nieprawidłowych danych logowania.
+    """
+    user = main_controller.login_user(username, password)
+    if not user:
+        return None, None
+
+    dashboard_service = main_controller.get_service("dashboard")
+    return user, dashboard_service.get_snapshot(user['user_id'])
+
+
+def _prescriptions_task(main_controller, logged_in_user_id):
+    """
+    Zadanie wątku roboczego: pobiera recepty widoczne dla użytkownika.
+
+    Returns:
+        list lub None: Lista recept lub None, jeśli rola użytkownika nie ma dostępu do recept.
+    """
+    session = main_controller.session_service.get_session(logged_in_user_id)
+
+    # Warunek: rola bez uprawnienia do przeglądania recept nie ma dostępu
+    if not main_controller.db_controller.permission_engine.can(session, "view", "prescriptions"):
+        print(f"[BackendBridge] Użytkownik {logged_in_user_id} (role_id={session.role_id}) nie ma uprawnień do przeglądania recept.")
+        return None
+
+    return main_controller.get_service("patients").table_get_prescriptions_data(logged_in_user_id)
+
+
+def _validate_patient_contacts(main_controller, pesel, phone, email, patient_id=None):
+    """
+    Sprawdza unikalność numeru PESEL, telefonu i adresu email pacjenta jednym zapytaniem.
+
+    :param patient_id: ID aktualizowanego pacjenta (jego własne dane nie są traktowane jako duplikaty).
+    :return: Lista komunikatów o błędach (pusta, jeśli wartości są unikalne).
+    """
+    exclude = ("patient_id", patient_id) if patient_id is not None else None
+    pesel_taken, phone_taken, email_taken = main_controller.get_service("validation").check(
+        ExistsProbe("patients", {"pesel": pesel}, exclude),
+        ExistsProbe("patients", {"phone": phone}, exclude),
+        ExistsProbe("patients", {"email": email}, exclude),
+    )
+
+    errors = []
+    if pesel_taken:
+        errors.append(f"Numer PESEL ({pesel}) już istnieje w bazie.")
+    if phone_taken:
+        errors.append(f"Numer telefonu ({phone}) już istnieje w bazie.")
+    if email_taken:
+        errors.append(f"Adres email ({email}) już istnieje w bazie.")
+    return errors
+
 
 class BackendBridge(QObject):
     loginSuccess = Signal(str, str) 
@@ -23,6 +88,7 @@ class BackendBridge(QObject):
     upcomingAppointmentsChanged = Signal(str)
     meetingsChanged = Signal(str)
     patientsListChanged = Signal(list)
+    patientsPageAppended = Signal(list)
     medicalDataFetched = Signal(dict)  
     prescriptionsDataFetched = Signal(dict)
     appointmentsCountForUserChanged = Signal(int)
@@ -49,14 +115,16 @@ class BackendBridge(QObject):
     prescriptionsAccessGranted = Signal()
     prescriptionDeletionFailed = Signal(str)
     prescriptionDeletedSuccessfully = Signal()
+    searchResultsChanged = Signal(dict)
 
 
 
-    def __init__(self, main_controller):
+    def __init__(self, main_controller, worker=None):
         try:
             super().__init__()
             print("BackendBridge initialized")  # Debugging
             self.main_controller = main_controller
+            self.worker = worker if worker is not None else BridgeWorker(main_controller)
             self.bridge_employee = None  # Atrybut dla bridge_employee
             self.bridge_room = None
             self.bridge_admin = None
@@ -72,6 +140,10 @@ class BackendBridge(QObject):
             self._upcoming_appointments = "Brak danych"
             self._meetings = "Brak danych"
             self._patients_list = [] 
+            self._patients_model = EntityListModel("patient_id", PATIENT_FIELDS, parent=self)
+            self._patients_model_progressive = False  # Pierwsze wypełnienie modelu - strony dopisywane na bieżąco
+            self._login_result = ""
+            self._patients_search_text = ""
             self._medical_data = {}  
             self._prescriptions_data = {} 
             self._appointmentsCountForUser = 0
@@ -131,7 +203,7 @@ class BackendBridge(QObject):
                 return "Brak zalogowanego użytkownika"
 
             # Inicjalizacja DashboardService
-            dashboard_service = DashboardService(self.main_controller, self.main_controller.db_controller)
+            dashboard_service = self.main_controller.get_service("dashboard")
 
 
 
@@ -168,7 +240,7 @@ class BackendBridge(QObject):
         try:
             if self._logged_in_user_id is not None:
                 # Inicjalizacja DashboardService
-                dashboard_service = DashboardService(self.main_controller, self.main_controller.db_controller)
+                dashboard_service = self.main_controller.get_service("dashboard")
 
 
 
@@ -198,13 +270,9 @@ class BackendBridge(QObject):
         """
         try:
             if self._logged_in_user_id is not None:
-                # Inicjalizacja DashboardService
-                dashboard_service = DashboardService(self.main_controller, self.main_controller.db_controller)
-
-
-                
-                # Pobranie nazwy roli użytkownika
-                user_role = dashboard_service.fetch_user_role_name(self._logged_in_user_id)
+                # Nazwa roli z kontekstu sesji (bez zapytania do bazy)
+                session = self.main_controller.session_service.get_session(self._logged_in_user_id)
+                user_role = session.role_name
                 
                 # Aktualizacja roli i emitowanie sygnału
                 self._user_role = user_role or "Nieznana rola"
@@ -235,12 +303,9 @@ class BackendBridge(QObject):
         try:
             if self._logged_in_user_id is not None:
                 # print(f"bridge updateSpecialties: Zalogowany użytkownik o ID {self._logged_in_user_id}")
-                # Inicjalizacja DashboardService
-                dashboard_service = DashboardService(self.main_controller, self.main_controller.db_controller)
-
-                
-                # Pobranie listy specjalizacji użytkownika
-                specialties = dashboard_service.get_specialties_for_logged_in_user(self._logged_in_user_id)
+                # Specjalizacje użytkownika z kontekstu sesji (bez zapytań do bazy)
+                session = self.main_controller.session_service.get_session(self._logged_in_user_id)
+                specialties = session.specialties
                 # print(f"bridge updateSpecialties: Pobrane specjalizacje: {specialties}")
 
                 if specialties:
@@ -287,7 +352,7 @@ class BackendBridge(QObject):
         """
         try:
             # print("bridge: updateCurrentDate: Rozpoczynam pobieranie daty z dashboard_service...")
-            dashboard_service = DashboardService(self.main_controller, self.main_controller.db_controller)
+            dashboard_service = self.main_controller.get_service("dashboard")
 
             self._current_date = dashboard_service.get_date_with_offset()  # Pobranie dzisiejszej daty
 
@@ -324,7 +389,7 @@ class BackendBridge(QObject):
         """
         try:
             # print("bridge: updateCurrentDayName: Rozpoczynam aktualizację dnia tygodnia...")
-            dashboard_service = DashboardService(self.main_controller, self.main_controller.db_controller)
+            dashboard_service = self.main_controller.get_service("dashboard")
 
 
             # Pobranie aktualnej nazwy dnia tygodnia
@@ -368,13 +433,12 @@ class BackendBridge(QObject):
         try:
             if self._logged_in_user_id is not None:
                 # Inicjalizacja DashboardService
-                dashboard_service = DashboardService(self.main_controller, self.main_controller.db_controller)
+                dashboard_service = self.main_controller.get_service("dashboard")
 
-                # Pobranie liczby dzisiejszych wizyt dla użytkownika
-                todays_appointments = dashboard_service.get_todays_appointments_by_employee_id(self._logged_in_user_id)
+                # Pobranie liczby dzisiejszych wizyt dla użytkownika (licznik, bez pobierania wizyt)
+                todays_appointments_count = dashboard_service.get_todays_appointment_count_by_employee_id(self._logged_in_user_id)
 
-                # Konwersja do liczby całkowitej, jeśli zwrócone zostało więcej niż 0 wizyt
-                self._todays_appointments = str(len(todays_appointments))
+                self._todays_appointments = str(todays_appointments_count)
 
                 # Emitowanie sygnału do frontendu
                 self.todaysAppointmentsChanged.emit(self._todays_appointments)
@@ -410,7 +474,7 @@ class BackendBridge(QObject):
         try:
             if self._logged_in_user_id is not None:
                 # Inicjalizacja DashboardService
-                dashboard_service = DashboardService(self.main_controller, self.main_controller.db_controller)
+                dashboard_service = self.main_controller.get_service("dashboard")
 
                 # Pobranie liczby wizyt dla użytkownika (pracownika)
                 appointment_count_text = dashboard_service.get_appointment_count_by_employee_id(self._logged_in_user_id)
@@ -460,7 +524,7 @@ class BackendBridge(QObject):
         try:
             if self._logged_in_user_id is not None:
                 # Utworzenie instancji DashboardService
-                dashboard_service = DashboardService(self.main_controller, self.main_controller.db_controller)
+                dashboard_service = self.main_controller.get_service("dashboard")
 
                 # Pobranie szczegółowych informacji o wizytach dla zalogowanego użytkownika
                 upcoming_appointments = dashboard_service.get_patient_appointments_with_rooms(self._logged_in_user_id)
@@ -509,7 +573,7 @@ class BackendBridge(QObject):
         try:
             if self._logged_in_user_id is not None:
                 # Utworzenie instancji DashboardService
-                dashboard_service = DashboardService(self.main_controller, self.main_controller.db_controller)
+                dashboard_service = self.main_controller.get_service("dashboard")
 
                 # Pobranie szczegółów spotkań dla zalogowanego użytkownika
                 meetings = dashboard_service.get_meeting_details_by_employee_id(self._logged_in_user_id)
@@ -551,16 +615,16 @@ class BackendBridge(QObject):
     def updateUserRoleId(self):
         """
         Aktualizuje rolę użytkownika (jako int) na podstawie self._logged_in_user_id,
-        wywołując metodę get_role_id_by_user_id z UsersAccountsController.
+        odczytując `role_id` z kontekstu sesji (`session_service.get_session`).
         Emituje sygnał z tą wartością do frontend jako string.
         """
         try:
             if self._logged_in_user_id is not None:
-                # Tworzymy instancję kontrolera
-                users_accounts_controller = UsersAccountsController(self.main_controller.db_controller)
+                # Kontekst sesji zalogowanego użytkownika
+                session = self.main_controller.session_service.get_session(self._logged_in_user_id)
 
-                # Pobieramy role_id za pomocą kontrolera
-                role_id = users_accounts_controller.get_role_id_by_user_id(self._logged_in_user_id)
+                # Odczytujemy role_id z kontekstu sesji
+                role_id = session.role_id
 
                 if role_id is not None:
                     # Przechowujemy rolę użytkownika jako int
@@ -597,8 +661,8 @@ class BackendBridge(QObject):
         """
         try:
             if self._logged_in_user_id is not None:
-                users_accounts_controller = UsersAccountsController(self.main_controller.db_controller)
-                employee_id = users_accounts_controller.get_employee_id_by_user_id(self._logged_in_user_id)
+                session = self.main_controller.session_service.get_session(self._logged_in_user_id)
+                employee_id = session.employee_id
                 if employee_id is not None:
                     self._employee_id = employee_id
                     self.employeeIdFetched.emit(str(self._employee_id))  # Emitujemy jako string do QML
@@ -619,80 +683,154 @@ class BackendBridge(QObject):
 
  # -------------------------------------------------------------------------
 
-    @Slot(str, str, result=str)
-    def login(self, username, password):
+    @Slot()
+    def updateDashboard(self):
         """
-        Obsługuje logowanie użytkownika na podstawie nazwy użytkownika i hasła.
+        Pobiera migawkę dashboardu (DashboardService.get_snapshot) stałą liczbą zapytań
+        w wątku roboczym i aktualizuje wszystkie właściwości dashboardu, emitując ich sygnały do frontendu.
         """
-        try:
-            # Wywołanie logiki logowania z MainController
-            user = self.main_controller.login_user(username, password)
+        if self._logged_in_user_id is not None:
+            self.worker.run(
+                "BackendBridge_dashboard",
+                lambda main_controller, user_id: main_controller.get_service("dashboard").get_snapshot(user_id),
+                (self._logged_in_user_id,),
+                on_success=self._apply_dashboard_snapshot,
+                on_failure=lambda error: print(f"updateDashboard: Błąd podczas pobierania danych dashboardu: {error}"),
+            )
+        else:
+            print("updateDashboard: Brak zalogowanego użytkownika.")
 
-            if user:
-                # Sukces logowania
-                self._logged_in_user_id = user['user_id']  # Ustawiamy ID zalogowanego użytkownika
+    def _apply_dashboard_snapshot(self, snapshot):
+        """
+        Ustawia właściwości dashboardu na podstawie migawki i emituje sygnały zmian
+        w tym samym formacie co pojedyncze sloty `update*`.
+        """
+        self._formatted_username = snapshot["formatted_username"] or "Nieznany użytkownik"
+        self.formattedUsernameChanged.emit()
 
-                if self.bridge_employee is not None:
-                    self.bridge_employee.setLoggedInUserId(self._logged_in_user_id)
-                
-                if self.bridge_room is not None:
-                    self.bridge_room.setLoggedInUserId(self._logged_in_user_id)
+        self._user_role = snapshot["role_name"] or "Nieznana rola"
+        self.userRoleChanged.emit(self._user_role)
 
-                try:
-                    # Aktualizujemy sformatowaną nazwę użytkownika
-                    self.updateFormattedUsername()
+        specialties = snapshot["specialties"]
+        self._specialties = "<br>".join(specialties) if specialties else "Brak specjalizacji"
+        self.specialtiesChanged.emit(self._specialties)
 
-                    # Aktualizujemy rolę użytkownika
-                    self.updateUserRole()
+        self._current_date = snapshot["date"]
+        self.dateChanged.emit(self._current_date)
 
-                    # Aktualizujemy specjalizacje użytkownika
-                    self.updateSpecialties()
-                    
-                    # Aktualizujemy bieżącą datę dla użytkownika
-                    self.updateCurrentDate()  
-                    
-                    self.updateCurrentDayName()
+        self._current_day_name = snapshot["day_name"]
+        self.dayNameChanged.emit(self._current_day_name)
 
-                    self.updateTodaysAppointments()
+        self._todays_appointments = str(snapshot["todays_appointments_count"])
+        self.todaysAppointmentsChanged.emit(self._todays_appointments)
 
-                    self.updateUpcomingAppointments()
+        if snapshot["upcoming_appointments"]:
+            self._upcoming_appointments = "<br>".join(
+                f"{appointment['appointment_date']} - Pokój: {appointment['room_number']} - {appointment['patient_name']}"
+                for appointment in snapshot["upcoming_appointments"]
+            )
+        else:
+            self._upcoming_appointments = "Brak nadchodzących wizyt."
+        self.upcomingAppointmentsChanged.emit(self._upcoming_appointments)
+
+        if snapshot["meetings"]:
+            self._meetings = "<br>".join(
+                f"{meeting['meeting_date']} - Pokój: {meeting['room_number']} - {meeting['meeting_type']}"
+                for meeting in snapshot["meetings"]
+            )
+        else:
+            self._meetings = "Brak spotkań."
+        self.meetingsChanged.emit(self._meetings)
+
+        self._appointmentsCountForUser = int(snapshot["appointments_count"])
+        self.appointmentsCountForUserChanged.emit(self._appointmentsCountForUser)
 
-                    self.updateMeetings()
+        if snapshot["role_id"] is not None:
+            self._user_role_as_int = int(snapshot["role_id"])
+            self.userRoleIdChanged.emit(str(self._user_role_as_int))
 
-                    self.updateAppointmentsCountForUser()
+        if snapshot["employee_id"] is not None:
+            self._employee_id = snapshot["employee_id"]
+            self.employeeIdFetched.emit(str(self._employee_id))
 
-                    self.updateUserRoleId()
+ # -------------------------------------------------------------------------
 
-                    self.fetchEmployeeId()
+    @Slot(str, str, result=str)
+    def login(self, username, password):
+        """
+        Obsługuje logowanie użytkownika na podstawie nazwy użytkownika i hasła.
 
-                except KeyError as ke:
-                    print(f"Błąd: Brak wymaganego klucza w danych użytkownika: {ke}")
-                    self.loginFailure.emit(f"Błąd klucza danych: {ke}")
-                    return f"error:Błąd klucza danych: {ke}"
+        Weryfikacja hasła (bcrypt) i pobranie danych dashboardu odbywają się w wątku roboczym,
+        a wynik jest przekazywany sygnałami `loginSuccess` / `loginFailure`.
+        Metoda zwraca od razu "pending:" (lub wynik, jeśli zadanie wykonano synchronicznie).
+        """
+        self._login_result = "pending:Logowanie..."
+        self.worker.run(
+            "BackendBridge_login",
+            _login_task,
+            (username, password),
+            on_success=self._on_login_finished,
+            on_failure=self._on_login_failed,
+        )
+        return self._login_result
+
+    def _on_login_finished(self, result):
+        """
+        Obsługuje wynik logowania w wątku GUI.
+        """
+        user, snapshot = result
+        if not user:
+            # Nieprawidłowe dane logowania
+            self._login_result = "error:Nieprawidłowa nazwa użytkownika lub hasło."
+            self.loginFailure.emit("Nieprawidłowa nazwa użytkownika lub hasło.")
+            return
 
-                except ValueError as ve:
-                    print(f"Błąd w danych użytkownika: {ve}")
-                    self.loginFailure.emit(f"Błąd danych: {ve}")
-                    return f"error:Błąd danych: {ve}"
+        # Sukces logowania
+        self.main_controller.logged_in_user = user
+        self._logged_in_user_id = user['user_id']  # Ustawiamy ID zalogowanego użytkownika
 
-                # Emitowanie sygnału sukcesu logowania z nazwą użytkownika, rolą i specjalizacjami
-                self.loginSuccess.emit(user['username'], user.get('role_name', 'Nieznana rola'))
-                return f"success:{user['username']}:{user.get('role_name', 'Nieznana rola')}"
+        if self.bridge_employee is not None:
+            self.bridge_employee.setLoggedInUserId(self._logged_in_user_id)
 
-            else:
-                # Nieprawidłowe dane logowania
-                self.loginFailure.emit("Nieprawidłowa nazwa użytkownika lub hasło.")
-                return "error:Nieprawidłowa nazwa użytkownika lub hasło."
+        if self.bridge_room is not None:
+            self.bridge_room.setLoggedInUserId(self._logged_in_user_id)
+
+        try:
+            # Aktualizujemy wszystkie dane dashboardu z migawki pobranej razem z logowaniem
+            # (nazwa, rola, specjalizacje, data, wizyty, spotkania, ID pracownika)
+            self._apply_dashboard_snapshot(snapshot)
 
         except KeyError as ke:
-            # Obsługa brakujących kluczy w słowniku
-            self.loginFailure.emit(f"Błąd klucza: {str(ke)}")
-            return f"error:Błąd klucza:{ke}"
+            print(f"Błąd: Brak wymaganego klucza w danych użytkownika: {ke}")
+            self._login_result = f"error:Błąd klucza danych: {ke}"
+            self.loginFailure.emit(f"Błąd klucza danych: {ke}")
+            return
 
         except ValueError as ve:
+            print(f"Błąd w danych użytkownika: {ve}")
+            self._login_result = f"error:Błąd danych: {ve}"
+            self.loginFailure.emit(f"Błąd danych: {ve}")
+            return
+
+        # Emitowanie sygnału sukcesu logowania z nazwą użytkownika i rolą
+        self._login_result = f"success:{user['username']}:{user.get('role_name', 'Nieznana rola')}"
+        self.loginSuccess.emit(user['username'], user.get('role_name', 'Nieznana rola'))
+
+    def _on_login_failed(self, error):
+        """
+        Obsługuje błąd zadania logowania w wątku GUI.
+        """
+        if isinstance(error, KeyError):
+            # Obsługa brakujących kluczy w słowniku
+            message = f"Błąd klucza: {error}"
+        elif isinstance(error, ValueError):
             # Obsługa błędów walidacji danych
-            self.loginFailure.emit(f"Błąd walidacji: {str(ve)}")
-            return f"error:Błąd walidacji:{ve}"
+            message = f"Błąd walidacji: {error}"
+        else:
+            print(f"[BackendBridge] Błąd podczas logowania: {error}")
+            message = "Błąd systemowy podczas logowania."
+        self._login_result = f"error:{message}"
+        self.loginFailure.emit(message)
 
 
  # -------------------------------------------------------------------------
@@ -700,33 +838,111 @@ class BackendBridge(QObject):
     @Slot()
     def updatePatientsList(self):
         """
-        Pobiera listę pacjentów przypisanych do aktualnego użytkownika
-        i emituje sygnał do QML.
+        Pobiera listę pacjentów przypisanych do aktualnego użytkownika w wątku roboczym
+        i przesyła ją do QML porcjami po `PATIENTS_PAGE_SIZE` rekordów.
+
+        Pierwsza strona jest emitowana sygnałem `patientsListChanged` (zastępuje listę),
+        kolejne - sygnałem `patientsPageAppended`. Nowe wywołanie (np. zmiana filtra)
+        unieważnia strony z poprzedniego ładowania.
+
+        Model `patientsModel` przy pierwszym wypełnieniu dostaje strony na bieżąco,
+        a przy ponownym ładowaniu - tylko różnice względem poprzedniej listy (po wczytaniu wszystkich stron).
         """
         if self._logged_in_user_id is not None:
-            try:
-                # Pobranie danych z serwisu pacjentów
-                patients_service = PatientsService(self.main_controller)
-                patients_list = patients_service.table_get_patients_for_user(self._logged_in_user_id)
-                # Walidacja i ustawienie wartości domyślnych
-                for patient in patients_list:
-                    if 'patient_id' not in patient or patient['patient_id'] is None:
-                        patient['patient_id'] = "Brak danych"
-                    
-                # print(f"lista pacjentów: {patients_list}")
-                self._patients_list = patients_list
-                
-                # Emitowanie sygnału z listą pacjentów
-                self.patientsListChanged.emit(self._patients_list)
-            
-            except KeyError as ke:
-                print(f"[updatePatientsList] Klucz nie znaleziony w danych pacjenta: {ke}")
-            except ValueError as ve:
-                print(f"[updatePatientsList] Błąd w wartościach danych pacjenta: {ve}")
+            self._patients_list = []
+            self._patients_model_progressive = self._patients_model.rowCount() == 0
+            self._load_patients_page(0)
         else:
             print("[updatePatientsList] Brak zalogowanego użytkownika. Nie można pobrać listy pacjentów.")
 
+    @Slot(str)
+    def searchPatients(self, search_text):
+        """
+        Ustawia filtr tekstowy listy pacjentów (imię, nazwisko, PESEL, telefon, e-mail)
+        i ponownie ładuje listę. Pusty tekst usuwa filtr.
+        """
+        self._patients_search_text = search_text or ""
+        self.updatePatientsList()
 
+    @Slot(str)
+    def searchAll(self, search_text):
+        """
+        Wyszukiwanie pełnotekstowe (FTS5) pacjentów, diagnoz, recept i notatek - do wyszukiwania
+        w trakcie pisania: każde wywołanie unieważnia poprzednie, niezakończone wyszukiwanie,
+        więc do QML trafia tylko wynik dla ostatnio wpisanego tekstu.
+
+        Wynik emitowany jest sygnałem `searchResultsChanged` jako słownik
+        {"query", "patients", "diagnoses", "prescriptions", "notes"} (`SearchService.search`).
+        """
+        if self._logged_in_user_id is None:
+            print("[BackendBridge_searchAll] Brak zalogowanego użytkownika. Nie można wyszukiwać.")
+            return
+
+        self.worker.run(
+            "BackendBridge_search",
+            lambda main_controller, user_id, text: main_controller.get_service("search").search(user_id, text),
+            (self._logged_in_user_id, search_text or ""),
+            on_success=self.searchResultsChanged.emit,
+            on_failure=lambda error: print(f"[BackendBridge_searchAll] Błąd podczas wyszukiwania: {error}"),
+        )
+
+    def _load_patients_page(self, after_patient_id):
+        """
+        Zleca pobranie jednej strony pacjentów w wątku roboczym.
+        """
+        self.worker.run(
+            "BackendBridge_patients",
+            lambda main_controller, user_id, after_id, search_text: main_controller.get_service("patients").table_get_patients_for_user(
+                user_id, after_patient_id=after_id, limit=PATIENTS_PAGE_SIZE, search_text=search_text
+            ),
+            (self._logged_in_user_id, after_patient_id, self._patients_search_text),
+            on_success=lambda patients_page: self._on_patients_page_loaded(after_patient_id, patients_page),
+            on_failure=lambda error: print(f"[updatePatientsList] Błąd podczas pobierania pacjentów: {error}"),
+        )
+
+    def _on_patients_page_loaded(self, after_patient_id, patients_page):
+        """
+        Emituje stronę pacjentów do QML i, jeśli strona jest pełna, zleca pobranie następnej.
+        """
+        # Walidacja i ustawienie wartości domyślnych
+        for patient in patients_page:
+            if 'patient_id' not in patient or patient['patient_id'] is None:
+                patient['patient_id'] = "Brak danych"
+
+        self._patients_list.extend(patients_page)
+
+        # Emitowanie sygnału ze stroną pacjentów
+        if after_patient_id == 0:
+            self.patientsListChanged.emit(patients_page)
+        elif patients_page:
+            self.patientsPageAppended.emit(patients_page)
+
+        if self._patients_model_progressive:
+            self._patients_model.append_rows(patients_page)
+
+        if len(patients_page) == PATIENTS_PAGE_SIZE:
+            self._load_patients_page(patients_page[-1]['patient_id'])
+        elif not self._patients_model_progressive:
+            # Ostatnia strona - zastosowanie różnic do modelu
+            self._patients_model.set_rows(self._patients_list)
+
+    def _refresh_patient_row(self, patient_id):
+        """
+        Odświeża w modelu listy pacjentów jeden wiersz (po edycji pacjenta),
+        jeśli pacjent jest widoczny na liście.
+        """
+        if not self._patients_model.contains_key(patient_id):
+            return
+        patient = PatientController(self.main_controller.db_controller).get_patient_by_id(patient_id)
+        if patient is None:
+            self._patients_model.remove_key(patient_id)
+        else:
+            self._patients_model.upsert_row(patient)
+
+    def get_patients_model(self):
+        return self._patients_model
+
+    patientsModel = Property(QObject, get_patients_model, constant=True)
 
     @Slot(result=list)
     def getPatientsList(self):
@@ -742,25 +958,16 @@ class BackendBridge(QObject):
     @Slot()
     def updateDiagnosesDataForUserList(self):
         """
-        Pobiera dane medyczne dla użytkownika i emituje wynik do QML.
+        Pobiera dane medyczne dla użytkownika w wątku roboczym i emituje wynik do QML.
         """
         if self._logged_in_user_id is not None:
-            try:
-                # Inicjalizacja serwisu danych medycznych
-                patients_service = PatientsService(self.main_controller)
-
-                # Pobranie danych medycznych dla podanego użytkownika
-                diagnoses_data = patients_service.table_get_diagnoses_data(self._logged_in_user_id)
-
-                # Debugowanie: Logowanie pobranych danych
-                # print(f"[BackendBridge] Pobranie danych medycznych dla user_id={self._logged_in_user_id}: {diagnoses_data}")
-
-                # Emitowanie danych do QML
-                self.medicalDataFetched.emit({"records": diagnoses_data})
-
-            except Exception as e:
-                print(f"[BackendBridge] Błąd podczas pobierania danych medycznych dla user_id={self._logged_in_user_id}: {e}")
-                raise RuntimeError(f"Błąd podczas pobierania danych medycznych: {e}") from e
+            self.worker.run(
+                "BackendBridge_diagnoses",
+                lambda main_controller, user_id: main_controller.get_service("patients").table_get_diagnoses_data(user_id),
+                (self._logged_in_user_id,),
+                on_success=lambda diagnoses_data: self.medicalDataFetched.emit({"records": diagnoses_data}),
+                on_failure=lambda error: print(f"[BackendBridge] Błąd podczas pobierania danych medycznych dla user_id={self._logged_in_user_id}: {error}"),
+            )
         else:
             print("[BackendBridge] Nie można pobrać danych medycznych. user_id jest None.")
 
@@ -782,48 +989,39 @@ class BackendBridge(QObject):
     @Slot()
     def updatePrescriptionsDataForUser(self):
         """
-        Pobiera dane recept dla użytkownika i emituje wynik do QML.
+        Pobiera dane recept dla użytkownika w wątku roboczym i emituje wynik do QML.
         """
         if self._logged_in_user_id is not None:
-            try:
-                # Pobranie roli użytkownika
-                users_accounts_controller = UsersAccountsController(self.main_controller.db_controller)
-                role_id = users_accounts_controller.get_role_id_by_user_id(self._logged_in_user_id)
-
-                # Warunek: Użytkownik z rolą 4-8 nie ma dostępu**
-                if role_id in [4, 5, 6, 7, 8]:
-                    print(f"[BackendBridge] Użytkownik {self._logged_in_user_id} (role_id={role_id}) nie ma uprawnień do przeglądania recept.")
-                    
-                    # **Emitowanie komunikatu błędu nowym sygnałem**
-                    self.prescriptionsErrorOccurred.emit("Brak uprawnień do przeglądania recept.")
-                    return  # **Zakończ metodę bez dalszego przetwarzania**
-
-                
-                patients_service = PatientsService(self.main_controller)
-
-                prescriptions_data = patients_service.table_get_prescriptions_data(self._logged_in_user_id)
-
-                # Debugowanie
-                # print(f"[BackendBridge] Pobranie danych recept dla user_id={self._logged_in_user_id}: {prescriptions_data}")
-
-                # Emitowanie poprawnych danych do QML
-                self.prescriptionsDataFetched.emit({"records": prescriptions_data})
-
-            except ValueError as ve:
-                print(f"[BackendBridge] Błąd danych wejściowych podczas pobierania recept: {ve}")
-                self.prescriptionsErrorOccurred.emit("Błąd danych wejściowych.")
+            self.worker.run(
+                "BackendBridge_prescriptions",
+                _prescriptions_task,
+                (self._logged_in_user_id,),
+                on_success=self._on_prescriptions_loaded,
+                on_failure=self._on_prescriptions_failed,
+            )
+        else:
+            print("[BackendBridge] Nie można pobrać danych recept. user_id jest None.")
+            self.prescriptionsErrorOccurred.emit("Nie zalogowano użytkownika.")
 
-            except KeyError as ke:
-                print(f"[BackendBridge] Błąd klucza podczas przetwarzania danych recept: {ke}")
-                self.prescriptionsErrorOccurred.emit("Błąd przetwarzania danych.")
+    def _on_prescriptions_loaded(self, prescriptions_data):
+        if prescriptions_data is None:
+            # **Emitowanie komunikatu błędu nowym sygnałem**
+            self.prescriptionsErrorOccurred.emit("Brak uprawnień do przeglądania recept.")
+            return
 
-            except AttributeError as ae:
-                print(f"[BackendBridge] Błąd atrybutu (np. brak metody lub kontrolera): {ae}")
-                self.prescriptionsErrorOccurred.emit("Błąd systemowy - brak kontrolera.")
+        # Emitowanie poprawnych danych do QML
+        self.prescriptionsDataFetched.emit({"records": prescriptions_data})
 
+    def _on_prescriptions_failed(self, error):
+        if isinstance(error, ValueError):
+            print(f"[BackendBridge] Błąd danych wejściowych podczas pobierania recept: {error}")
+            self.prescriptionsErrorOccurred.emit("Błąd danych wejściowych.")
+        elif isinstance(error, KeyError):
+            print(f"[BackendBridge] Błąd klucza podczas przetwarzania danych recept: {error}")
+            self.prescriptionsErrorOccurred.emit("Błąd przetwarzania danych.")
         else:
-            print("[BackendBridge] Nie można pobrać danych recept. user_id jest None.")
-            self.prescriptionsErrorOccurred.emit("Nie zalogowano użytkownika.")
+            print(f"[BackendBridge] Błąd podczas pobierania recept: {error}")
+            self.prescriptionsErrorOccurred.emit("Błąd systemowy.")
 
 
 
@@ -844,40 +1042,25 @@ class BackendBridge(QObject):
     def addNewPatient(self, first_name, last_name, pesel, phone, email, address, birth):
         """
         Dodaje nowego pacjenta, przyjmując dane z QML (insert_employee_id + dane pacjenta).
-        W zależności od roli zalogowanego użytkownika:
-        - jeżeli role_id in [1, 2, 9, 10]:
+        W zależności od zakresu dostępu do pacjentów (silnik uprawnień):
+        - wszyscy pacjenci (SCOPE_ALL):
             sprawdza, czy insert_employee_id istnieje w bazie i ma is_active=1, a potem przypisuje.
-        - jeżeli role_id in [3, 4, 5, 6, 7, 8]:
+        - przypisani pacjenci (SCOPE_ASSIGNED):
             pobiera employee_id zalogowanego użytkownika i porównuje z insert_employee_id,
             jeśli się zgadza -> przypisuje, w przeciwnym razie błąd.
         """
 
         if self._logged_in_user_id is not None:
             try:
-                users_accounts_controller = UsersAccountsController(self.main_controller.db_controller)
-                role_id = users_accounts_controller.get_role_id_by_user_id(self._logged_in_user_id)
-                print(f"[BackendBridge_addNewPatient] Rola zalogowanego usera (role_id): {role_id}")
+                session = self.main_controller.session_service.get_session(self._logged_in_user_id)
+                patients_scope = self.main_controller.db_controller.permission_engine.row_scope(session, "view", "patients")
+                print(f"[BackendBridge_addNewPatient] Rola zalogowanego usera (role_id): {session.role_id}, zakres: {patients_scope}")
 
                 # Inicjalizacja do weryfikacji personelu i przypisywania pacjenta
                 patients_controller = PatientController(self.main_controller.db_controller) 
 
-                errors = []
-
-                # 3. Pobranie istniejących wartości pesel, phone, email
-                existing_data = patients_controller.get_all_pesel_phone_email()
-                existing_pesels = {patient["pesel"] for patient in existing_data}
-                existing_phones = {patient["phone"] for patient in existing_data}
-                existing_emails = {patient["email"] for patient in existing_data}
-
-                # 4. Sprawdzenie, czy pesel, phone lub email istnieją już w bazie
-                if pesel in existing_pesels:
-                    errors.append(f"Numer PESEL ({pesel}) już istnieje w bazie.")
-
-                if phone in existing_phones:
-                    errors.append(f"Numer telefonu ({phone}) już istnieje w bazie.")
-
-                if email in existing_emails:
-                    errors.append(f"Adres email ({email}) już istnieje w bazie.")
+                # 3. Sprawdzenie, czy pesel, phone lub email istnieją już w bazie
+                errors = _validate_patient_contacts(self.main_controller, pesel, phone, email)
 
                 # Jeśli są jakieś błędy, wyemituj sygnał z listą błędów
                 if errors:
@@ -898,6 +1081,13 @@ class BackendBridge(QObject):
                     is_active=1
                 )
                 # print("[BackendBridge_addNewPatient] Pacjent został dodany i przypisany (role_id w [1,2,9,10]).")
+
+                # Nowy pacjent jest widoczny na liście tylko dla ról z dostępem do wszystkich pacjentów
+                # (nie jest jeszcze przypisany) i tylko gdy lista nie jest filtrowana
+                if patients_scope == SCOPE_ALL and not self._patients_search_text and self._patients_model.rowCount() > 0:
+                    new_patient = patients_controller.get_patient_by_id(patients_controller.get_last_patient_id())
+                    if new_patient is not None:
+                        self._patients_model.upsert_row(new_patient)
                 self.patientAddedSuccessfully.emit()
 
             except ValueError as ve:
@@ -946,214 +1136,105 @@ class BackendBridge(QObject):
         if self._logged_in_user_id is not None:
             try:
                 # Inicjalizacja kontrolerów
-                users_accounts_controller = UsersAccountsController(self.main_controller.db_controller)
+                session = self.main_controller.session_service.get_session(self._logged_in_user_id)
                 patients_controller = PatientController(self.main_controller.db_controller)
-                assigned_patients_controller = AssignedPatientsController(self.main_controller.db_controller)
 
 
                 # Pobranie roli użytkownika
-                role_id = users_accounts_controller.get_role_id_by_user_id(self._logged_in_user_id)
+                role_id = session.role_id
+                patients_scope = self.main_controller.db_controller.permission_engine.row_scope(session, "edit", "patients")
                 print(f"[BackendBridge_updatePatient] Rola zalogowanego użytkownika (role_id): {role_id}")
 
-                if role_id in [1, 2, 9, 10]:
-                    # Pobranie wszystkich patient_id z bazy danych
-                    all_patient_ids = patients_controller.get_all_patient_ids()
-                    
-                    # Sprawdzenie, czy podany patient_id istnieje
-                    if patient_id not in all_patient_ids:
-                        msg = f"Pacjent o Id ({patient_id}) nie istnieje w bazie."
-                        print("[BackendBridge_updatePatient] " + msg)
-                        self.patientAdditionFailed.emit(msg)
-                        return
-
-                    # Pobranie szczegółowych danych pacjenta
-                    patient_data = patients_controller.get_patient_by_id(patient_id)
-
-                    if not patient_data:
-                        msg = f"Błąd podczas pobierania szczegółów pacjenta o Id ({patient_id})."
-                        print("[BackendBridge_updatePatient] " + msg)
-                        self.patientAdditionFailed.emit(msg)
-                        return
-
-                    # Lista do przechowywania błędów
-                    errors = []
-
-                    # 3. Pobranie istniejących wartości pesel, phone, email
-                    existing_data = patients_controller.get_all_pesel_phone_email()
-                    existing_pesels = {patient["pesel"] for patient in existing_data}
-                    existing_phones = {patient["phone"] for patient in existing_data}
-                    existing_emails = {patient["email"] for patient in existing_data}
-
-                    # 4. Sprawdzenie, czy pesel, phone lub email istnieją już w bazie
-                    if pesel in existing_pesels:
-                        errors.append(f"Numer PESEL ({pesel}) już istnieje w bazie.")
-                    if phone in existing_phones:
-                        errors.append(f"Numer telefonu ({phone}) już istnieje w bazie.")
-                    if email in existing_emails:
-                        errors.append(f"Adres email ({email}) już istnieje w bazie.")
-
-                    # Jeśli są jakieś błędy, wyemituj sygnał z listą błędów
-                    if errors:
-                        error_message = "\n".join(errors)
-                        print(f"[BackendBridge_addNewPatient] Błędy walidacji: {error_message}")
-                        self.patientAdditionFailed.emit(error_message)
-                        return
-
-                                # Normalizacja wartości is_active (pole opcjonalne)
-                    is_active = None
-                    if insert_is_active:
-                        normalized_is_active = insert_is_active.strip().lower()
-                        if normalized_is_active == "tak":
-                            is_active = 1
-                        elif normalized_is_active == "nie":
-                            is_active = 0
-                        else:
-                            self.patientAdditionFailed.emit("Niepoprawna wartość dla pola 'Aktywność'. Użyj 'Tak' lub 'Nie'.")
-                            return
-
-                    # Budowanie słownika `data_to_update` tylko dla wartości, które są różne od tych w bazie
-                    data_to_update = {}
-                    if first_name and first_name != patient_data["first_name"]:
-                        data_to_update["first_name"] = first_name
-                    if last_name and last_name != patient_data["last_name"]:
-                        data_to_update["last_name"] = last_name
-                    if pesel and pesel != patient_data["pesel"]:
-                        data_to_update["pesel"] = pesel
-                    if phone and phone != patient_data["phone"]:
-                        data_to_update["phone"] = phone
-                    if email and email != patient_data["email"]:
-                        data_to_update["email"] = email
-                    if address and address != patient_data["address"]:
-                        data_to_update["address"] = address
-                    if birth and birth != patient_data["date_of_birth"]:
-                        data_to_update["date_of_birth"] = birth
-                    if is_active is not None and is_active != patient_data.get("is_active"):
-                        data_to_update["is_active"] = is_active 
-
-                    # Jeśli użytkownik nie podał żadnych zmian, wyemituj błąd
-                    if not data_to_update:
-                        print("[BackendBridge_updatePatient] Brak zmian w danych pacjenta. Aktualizacja nie została wykonana.")
-                        self.patientAdditionFailed.emit("Brak zmian w danych pacjenta.")
-                        return
-
-                    # Wywołanie metody aktualizacji pacjenta w kontrolerze
-                    patients_controller.update_patient(patient_id, **data_to_update)
-                    print("[BackendBridge_updatePatient] Pacjent został zaktualizowany w bazie danych.")
-                    self.patientUpdatedSuccessfully.emit()
+                if patients_scope == SCOPE_NONE:
+                    msg = f"Brak uprawnień do aktualizacji pacjenta dla roli role_id={role_id}."
+                    print("[BackendBridge_updatePatient] " + msg)
+                    self.patientAdditionFailed.emit(msg)
+                    return
 
-                elif role_id in [3, 4, 5, 6, 7, 8]:
-                    # Pobranie wszystkich patient_id z bazy danych
-                    all_patient_ids = patients_controller.get_all_patient_ids()
-                    
-                    # Sprawdzenie, czy podany patient_id istnieje
-                    if patient_id not in all_patient_ids:
-                        msg = f"Pacjent o Id ({patient_id}) nie istnieje w bazie."
-                        print("[BackendBridge_updatePatient] " + msg)
-                        self.patientAdditionFailed.emit(msg)
-                        return
+                # Sprawdzenie, czy podany patient_id istnieje
+                if not self.main_controller.get_service("validation").exists("patients", "patient_id", patient_id):
+                    msg = f"Pacjent o Id ({patient_id}) nie istnieje w bazie."
+                    print("[BackendBridge_updatePatient] " + msg)
+                    self.patientAdditionFailed.emit(msg)
+                    return
 
-                    # Pobranie employee_id zalogowanego użytkownika
-                    employee_id = users_accounts_controller.get_employee_id_by_user_id(self._logged_in_user_id)
+                # Zakres SCOPE_ASSIGNED - tylko pacjenci przypisani do pracownika zalogowanego użytkownika
+                if patients_scope == SCOPE_ASSIGNED:
+                    employee_id = session.employee_id
                     if not employee_id:
                         msg = f"Brak pracownika przypisanego do user_id ({self._logged_in_user_id})."
                         print("[BackendBridge_updatePatient] " + msg)
                         self.patientAdditionFailed.emit(msg)
                         return
 
-                    # Pobranie wszystkich patient_id przypisanych do tego pracownika
-                    assigned_patient_ids = [
-                        item["fk_patient_id"] for item in assigned_patients_controller.get_assigned_patients_by_employee_id(employee_id)
-                    ]
-
-                    # Sprawdzenie, czy podany patient_id istnieje w przypisanych pacjentach
-                    if patient_id not in assigned_patient_ids:
-                        msg = (
-                            f"Pacjent o Id ({patient_id}) nie jest przypisany do pracownika (employee_id={employee_id}).\n"
-                            f"Identyfikatory przypisanych pacjentów: {', '.join(map(str, assigned_patient_ids))}"
-                        )
+                    # Sprawdzenie, czy podany patient_id jest przypisany do tego pracownika (kontekst sesji)
+                    if not session.is_assigned_patient(patient_id):
+                        msg = f"Pacjent o Id ({patient_id}) nie jest przypisany do pracownika (employee_id={employee_id})."
                         print("[BackendBridge_updatePatient] " + msg)
                         self.patientAdditionFailed.emit(msg)
                         return
 
-                    # Pobranie szczegółowych danych pacjenta
-                    patient_data = patients_controller.get_patient_by_id(patient_id)
+                # Pobranie szczegółowych danych pacjenta
+                patient_data = patients_controller.get_patient_by_id(patient_id)
 
-                    if not patient_data:
-                        msg = f"Błąd podczas pobierania szczegółów pacjenta o Id ({patient_id})."
-                        print("[BackendBridge_updatePatient] " + msg)
-                        self.patientAdditionFailed.emit(msg)
-                        return
+                if not patient_data:
+                    msg = f"Błąd podczas pobierania szczegółów pacjenta o Id ({patient_id})."
+                    print("[BackendBridge_updatePatient] " + msg)
+                    self.patientAdditionFailed.emit(msg)
+                    return
 
-                    # Lista do przechowywania błędów
-                    errors = []
-
-                    # 3. Pobranie istniejących wartości pesel, phone, email
-                    existing_data = patients_controller.get_all_pesel_phone_email()
-                    existing_pesels = {patient["pesel"] for patient in existing_data}
-                    existing_phones = {patient["phone"] for patient in existing_data}
-                    existing_emails = {patient["email"] for patient in existing_data}
-
-                    # 4. Sprawdzenie, czy pesel, phone lub email istnieją już w bazie
-                    if pesel in existing_pesels:
-                        errors.append(f"Numer PESEL ({pesel}) już istnieje w bazie.")
-                    if phone in existing_phones:
-                        errors.append(f"Numer telefonu ({phone}) już istnieje w bazie.")
-                    if email in existing_emails:
-                        errors.append(f"Adres email ({email}) już istnieje w bazie.")
-
-                    # Jeśli są jakieś błędy, wyemituj sygnał z listą błędów
-                    if errors:
-                        error_message = "\n".join(errors)
-                        print(f"[BackendBridge_addNewPatient] Błędy walidacji: {error_message}")
-                        self.patientAdditionFailed.emit(error_message)
-                        return
+                # 3. Sprawdzenie, czy pesel, phone lub email należą już do innego pacjenta
+                errors = _validate_patient_contacts(self.main_controller, pesel, phone, email, patient_id)
 
-                    # Normalizacja wartości is_active (pole opcjonalne)
-                    is_active = None
-                    if insert_is_active:
-                        normalized_is_active = insert_is_active.strip().lower()
-                        if normalized_is_active == "tak":
-                            is_active = 1
-                        elif normalized_is_active == "nie":
-                            is_active = 0
-                        else:
-                            self.patientAdditionFailed.emit("Niepoprawna wartość dla pola 'Aktywność'. Użyj 'Tak' lub 'Nie'.")
-                            return
-
-                    # Budowanie słownika `data_to_update` tylko dla wartości, które są różne od tych w bazie
-                    data_to_update = {}
-                    if first_name and first_name != patient_data["first_name"]:
-                        data_to_update["first_name"] = first_name
-                    if last_name and last_name != patient_data["last_name"]:
-                        data_to_update["last_name"] = last_name
-                    if pesel and pesel != patient_data["pesel"]:
-                        data_to_update["pesel"] = pesel
-                    if phone and phone != patient_data["phone"]:
-                        data_to_update["phone"] = phone
-                    if email and email != patient_data["email"]:
-                        data_to_update["email"] = email
-                    if address and address != patient_data["address"]:
-                        data_to_update["address"] = address
-                    if birth and birth != patient_data["date_of_birth"]:
-                        data_to_update["date_of_birth"] = birth
-                    if is_active is not None and is_active != patient_data.get("is_active"):
-                        data_to_update["is_active"] = is_active          
-
-                    # Jeśli użytkownik nie podał żadnych zmian, wyemituj błąd
-                    if not data_to_update:
-                        print("[BackendBridge_updatePatient] Brak zmian w danych pacjenta. Aktualizacja nie została wykonana.")
-                        self.patientAdditionFailed.emit("Brak zmian w danych pacjenta.")
+                # Jeśli są jakieś błędy, wyemituj sygnał z listą błędów
+                if errors:
+                    error_message = "\n".join(errors)
+                    print(f"[BackendBridge_addNewPatient] Błędy walidacji: {error_message}")
+                    self.patientAdditionFailed.emit(error_message)
+                    return
+
+                # Normalizacja wartości is_active (pole opcjonalne)
+                is_active = None
+                if insert_is_active:
+                    normalized_is_active = insert_is_active.strip().lower()
+                    if normalized_is_active == "tak":
+                        is_active = 1
+                    elif normalized_is_active == "nie":
+                        is_active = 0
+                    else:
+                        self.patientAdditionFailed.emit("Niepoprawna wartość dla pola 'Aktywność'. Użyj 'Tak' lub 'Nie'.")
                         return
 
-                    # Wywołanie metody aktualizacji pacjenta w kontrolerze
-                    patients_controller.update_patient(patient_id, **data_to_update)
-                    print("[BackendBridge_updatePatient] Pacjent został zaktualizowany w bazie danych.")
-                    self.patientUpdatedSuccessfully.emit()
+                # Budowanie słownika `data_to_update` tylko dla wartości, które są różne od tych w bazie
+                data_to_update = {}
+                if first_name and first_name != patient_data["first_name"]:
+                    data_to_update["first_name"] = first_name
+                if last_name and last_name != patient_data["last_name"]:
+                    data_to_update["last_name"] = last_name
+                if pesel and pesel != patient_data["pesel"]:
+                    data_to_update["pesel"] = pesel
+                if phone and phone != patient_data["phone"]:
+                    data_to_update["phone"] = phone
+                if email and email != patient_data["email"]:
+                    data_to_update["email"] = email
+                if address and address != patient_data["address"]:
+                    data_to_update["address"] = address
+                if birth and birth != patient_data["date_of_birth"]:
+                    data_to_update["date_of_birth"] = birth
+                if is_active is not None and is_active != patient_data.get("is_active"):
+                    data_to_update["is_active"] = is_active
+
+                # Jeśli użytkownik nie podał żadnych zmian, wyemituj błąd
+                if not data_to_update:
+                    print("[BackendBridge_updatePatient] Brak zmian w danych pacjenta. Aktualizacja nie została wykonana.")
+                    self.patientAdditionFailed.emit("Brak zmian w danych pacjenta.")
+                    return
 
-                else:
-                    msg = f"Brak uprawnień do aktualizacji pacjenta dla roli role_id={role_id}."
-                    print("[BackendBridge_updatePatient] " + msg)
-                    self.patientAdditionFailed.emit(msg)
+                # Wywołanie metody aktualizacji pacjenta w kontrolerze
+                patients_controller.update_patient(patient_id, **data_to_update)
+                print("[BackendBridge_updatePatient] Pacjent został zaktualizowany w bazie danych.")
+                self._refresh_patient_row(patient_id)
+                self.patientUpdatedSuccessfully.emit()
 
             except KeyError as ke:
                 error_msg = f"[BackendBridge_updatePatient] Błąd klucza: {ke}"
@@ -1194,35 +1275,38 @@ class BackendBridge(QObject):
 
         try:
             # Inicjalizacja kontrolerów
-            patients_service = PatientsService(self.main_controller)
+            validation_service = self.main_controller.get_service("validation")
             patients_controller = PatientController(self.main_controller.db_controller)
-            users_accounts_controller = UsersAccountsController(self.main_controller.db_controller)
+            session = self.main_controller.session_service.get_session(self._logged_in_user_id)
 
             # Pobranie roli użytkownika
-            role_id = users_accounts_controller.get_role_id_by_user_id(self._logged_in_user_id)
+            role_id = session.role_id
+            patients_scope = self.main_controller.db_controller.permission_engine.row_scope(session, "delete", "patients")
             print(f"[BridgeRoom_deletePatient] Użytkownik o ID {self._logged_in_user_id} ma rolę {role_id}.")
 
 
 
-            # **Logika dla ról [1, 2, 9, 10]**
-            if role_id in [1, 2, 9, 10]:
+            # **Logika dla ról z dostępem do wszystkich pacjentów**
+            if patients_scope == SCOPE_ALL:
 
-                # **Sprawdzenie, czy pacjent istnieje**
-                all_patient_ids = patients_controller.get_all_patient_ids()
-                if insert_patient_id not in all_patient_ids:
+                # **Sprawdzenie, czy pacjent istnieje i czy jest przypisany do pracownika (jedno zapytanie)**
+                patient_exists, patient_assigned = validation_service.check(
+                    ExistsProbe("patients", {"patient_id": insert_patient_id}),
+                    ExistsProbe("assigned_patients", {"fk_patient_id": insert_patient_id}),
+                )
+                if not patient_exists:
                     msg = f"Pacjent o ID ({insert_patient_id}) nie istnieje w bazie."
                     print(f"[BridgeRoom_deletePatient] {msg}")
                     self.patientAdditionFailed.emit(msg)
                     return
             
-                assigned_patient_ids = patients_service.get_all_patient_id_assigned()
-                if insert_patient_id in assigned_patient_ids:
+                if patient_assigned:
                     msg = f"Nie można usunąć pacjenta o ID ({insert_patient_id}), ponieważ jest przypisany w tabeli przypisania pacjentów do pracowników."
                     print(f"[BridgeRoom_deletePatient] {msg}")
                     self.patientAdditionFailed.emit(msg)
                     return
 
-            elif role_id in [3, 4, 5, 6, 7, 8]:
+            else:
 
                 msg = f"Usuwanie pacjenta nie jest przeznaczone dla użytkonwika o ID: {self._logged_in_user_id}."
                 print(f"[BridgeRoom_deletePatient] {msg}")
@@ -1234,6 +1318,7 @@ class BackendBridge(QObject):
 
             if success:
                 print(f"[BridgeRoom_deletePatient] Pacjent o ID {insert_patient_id} został usunięty.")
+                self._patients_model.remove_key(insert_patient_id)
                 self.patientDeletedSuccessfully.emit()
             else:
                 print("[BridgeRoom_deletePatient] Nie udało się usunąć pacjenta.")
@@ -1261,16 +1346,16 @@ class BackendBridge(QObject):
     def checkAccessToAdminUsersView(self):
         """
         Sprawdza, czy użytkownik ma dostęp do widoku AdminSettingsMainUsersList.qml.
-        Dostęp mają tylko role_id 1 i 9.
+        Dostęp mają role z uprawnieniem `zarzadzaj_rolami_i_uprawnieniami` (domyślnie role_id 1 i 9).
         """
         if self._logged_in_user_id is not None:
             try:
                 # Pobranie roli użytkownika
-                users_accounts_controller = UsersAccountsController(self.main_controller.db_controller)
-                role_id = users_accounts_controller.get_role_id_by_user_id(self._logged_in_user_id)
+                session = self.main_controller.session_service.get_session(self._logged_in_user_id)
+                role_id = session.role_id
 
                 # **Sprawdzenie, czy użytkownik ma uprawnienia**
-                if role_id in [1, 9]:
+                if self.main_controller.db_controller.permission_engine.can(session, "view", "users"):
                     print(f"[BackendBridge] Użytkownik {self._logged_in_user_id} (role_id={role_id}) ma dostęp do widoku użytkowników.")
                     
                     # Emitowanie sygnału o dostępie
@@ -1318,25 +1403,32 @@ class BackendBridge(QObject):
 
         try:
             # Inicjalizacja kontrolerów
-            users_accounts_controller = UsersAccountsController(self.main_controller.db_controller)
-            patients_service = PatientsService(self.main_controller)
+            session = self.main_controller.session_service.get_session(self._logged_in_user_id)
+            patients_service = self.main_controller.get_service("patients")
+            validation_service = self.main_controller.get_service("validation")
             diagnoses_controller = DiagnosesController(self.main_controller.db_controller)
 
             errors = []  # Lista do przechowywania błędów
 
             # Pobranie roli użytkownika
-            role_id = users_accounts_controller.get_role_id_by_user_id(self._logged_in_user_id)
+            role_id = session.role_id
+            diagnoses_scope = self.main_controller.db_controller.permission_engine.row_scope(session, "edit", "diagnoses")
             print(f"[BridgeRoom_addDiagnosis] Użytkownik o ID {self._logged_in_user_id} ma rolę {role_id}.")
 
-            if role_id in [1, 2, 9, 10]:
-                # Pobranie wszystkich ID wizyt w tabeli appointments
-                all_appointment_ids = patients_service.get_all_appointment_ids_appointments_table()
-                if insert_appointment_id not in all_appointment_ids:
+            if diagnoses_scope == SCOPE_NONE:
+                msg = f"Brak uprawnień do dodawania diagnoz dla roli role_id={role_id}."
+                print(f"[BridgeRoom_addDiagnosis] {msg}")
+                self.diagnosisAdditionFailed.emit(msg)
+                return
+
+            if diagnoses_scope == SCOPE_ALL:
+                # Sprawdzenie, czy wizyta istnieje w tabeli appointments
+                if not validation_service.exists("appointments", "appointment_id", insert_appointment_id):
                     errors.append(f"Wizyta o ID ({insert_appointment_id}) nie istnieje w bazie wizyt.")
 
-            elif role_id in [3, 4, 5, 6, 7, 8]:
+            elif diagnoses_scope == SCOPE_ASSIGNED:
                 # Pobranie employee_id użytkownika
-                employee_id = users_accounts_controller.get_employee_id_by_user_id(self._logged_in_user_id)
+                employee_id = session.employee_id
                 print(f"[BridgeRoom_addDiagnosis] Employee ID dla użytkownika {self._logged_in_user_id}: {employee_id}")
 
                 # Pobranie ID wizyt przypisanych do pracownika
@@ -1407,35 +1499,42 @@ class BackendBridge(QObject):
 
         try:
             # Inicjalizacja kontrolerów
-            users_accounts_controller = UsersAccountsController(self.main_controller.db_controller)
-            patients_service = PatientsService(self.main_controller)
+            session = self.main_controller.session_service.get_session(self._logged_in_user_id)
+            patients_service = self.main_controller.get_service("patients")
+            validation_service = self.main_controller.get_service("validation")
             diagnoses_controller = DiagnosesController(self.main_controller.db_controller)
 
             errors = []  # Lista błędów
 
             # Pobranie roli użytkownika
-            role_id = users_accounts_controller.get_role_id_by_user_id(self._logged_in_user_id)
+            role_id = session.role_id
+            diagnoses_scope = self.main_controller.db_controller.permission_engine.row_scope(session, "edit", "diagnoses")
             print(f"[BridgeRoom_updateDiagnosis] Użytkownik o ID {self._logged_in_user_id} ma rolę {role_id}.")
 
+            if diagnoses_scope == SCOPE_NONE:
+                msg = f"Brak uprawnień do edycji diagnoz dla roli role_id={role_id}."
+                print(f"[BridgeRoom_updateDiagnosis] {msg}")
+                self.diagnosisUpdateFailed.emit(msg)
+                return
+
             # Sprawdzenie czy diagnoza istnieje w bazie
-            all_diagnosis_ids = patients_service.get_all_diagnosis_ids()
-            if insert_diagnosis_id not in all_diagnosis_ids:
+            if not validation_service.exists("diagnoses", "diagnosis_id", insert_diagnosis_id):
                 errors.append(f"Diagnoza o ID {insert_diagnosis_id} nie istnieje w systemie.")
 
             # Weryfikacja uprawnień użytkownika
-            if role_id in [1, 2, 9, 10] and insert_appointment_id:
-                all_appointment_ids = patients_service.get_all_appointment_ids_appointments_table()
-                if insert_appointment_id not in all_appointment_ids:
+            if diagnoses_scope == SCOPE_ALL and insert_appointment_id:
+                # Sprawdzenie, czy wizyta istnieje w tabeli appointments
+                if not validation_service.exists("appointments", "appointment_id", insert_appointment_id):
                     errors.append(f"Wizyta o ID {insert_appointment_id} nie istnieje w systemie.")
 
-            elif role_id in [3, 4, 5, 6, 7, 8]:
+            elif diagnoses_scope == SCOPE_ASSIGNED:
                 # Pobranie employee_id użytkownika
-                employee_id = users_accounts_controller.get_employee_id_by_user_id(self._logged_in_user_id)
+                employee_id = session.employee_id
                 print(f"[BridgeRoom_updateDiagnosis] Employee ID dla użytkownika {self._logged_in_user_id}: {employee_id}")
 
                 if insert_appointment_id:
-                    all_appointment_ids = patients_service.get_all_appointment_ids_appointments_table()
-                    if insert_appointment_id not in all_appointment_ids:
+                    # Sprawdzenie, czy wizyta istnieje w tabeli appointments
+                    if not validation_service.exists("appointments", "appointment_id", insert_appointment_id):
                         errors.append(f"Wizyta o ID {insert_appointment_id} nie istnieje w systemie.")
 
                     # Sprawdzenie, czy wizyta jest przypisana do pracownika
@@ -1523,26 +1622,33 @@ class BackendBridge(QObject):
 
         try:
             # Inicjalizacja kontrolerów
-            users_accounts_controller = UsersAccountsController(self.main_controller.db_controller)
-            patients_service = PatientsService(self.main_controller)
+            session = self.main_controller.session_service.get_session(self._logged_in_user_id)
+            patients_service = self.main_controller.get_service("patients")
+            validation_service = self.main_controller.get_service("validation")
             diagnoses_controller = DiagnosesController(self.main_controller.db_controller)
 
             # Pobranie roli użytkownika
-            role_id = users_accounts_controller.get_role_id_by_user_id(self._logged_in_user_id)
+            role_id = session.role_id
+            diagnoses_scope = self.main_controller.db_controller.permission_engine.row_scope(session, "edit", "diagnoses")
             print(f"[BridgeRoom_deleteDiagnosis] Użytkownik o ID {self._logged_in_user_id} ma rolę {role_id}.")
 
+            if diagnoses_scope == SCOPE_NONE:
+                msg = f"Brak uprawnień do usuwania diagnoz dla roli role_id={role_id}."
+                print(f"[BridgeRoom_deleteDiagnosis] {msg}")
+                self.diagnosisDeletionFailed.emit(msg)
+                return
+
             # Sprawdzenie czy diagnoza istnieje w bazie
-            all_diagnosis_ids = patients_service.get_all_diagnosis_ids()
-            if insert_diagnosis_id not in all_diagnosis_ids:
+            if not validation_service.exists("diagnoses", "diagnosis_id", insert_diagnosis_id):
                 msg = f"Diagnoza o ID {insert_diagnosis_id} nie istnieje w systemie."
                 print(f"[BridgeRoom_deleteDiagnosis] {msg}")
                 self.diagnosisDeletionFailed.emit(msg)
                 return
 
-            # **Logika dla ról [3, 4, 5, 6, 7, 8]**
-            if role_id in [3, 4, 5, 6, 7, 8]:
+            # **Logika dla ról z dostępem do przypisanych pacjentów**
+            if diagnoses_scope == SCOPE_ASSIGNED:
                 # Pobranie employee_id użytkownika
-                employee_id = users_accounts_controller.get_employee_id_by_user_id(self._logged_in_user_id)
+                employee_id = session.employee_id
                 print(f"[BridgeRoom_deleteDiagnosis] Employee ID dla użytkownika {self._logged_in_user_id}: {employee_id}")
 
                 # Pobranie listy przypisanych diagnosis_id dla pracownika
@@ -1606,43 +1712,44 @@ class BackendBridge(QObject):
 
         try:
             # Inicjalizacja kontrolerów
-            users_accounts_controller = UsersAccountsController(self.main_controller.db_controller)
-            patients_service = PatientsService(self.main_controller)
+            session = self.main_controller.session_service.get_session(self._logged_in_user_id)
+            validation_service = self.main_controller.get_service("validation")
             prescriptions_controller = PrescriptionsController(self.main_controller.db_controller)
 
             errors = []  # Lista na błędy
 
             # **Sprawdzenie, czy kod recepty już istnieje**
-            all_prescription_codes = patients_service.get_all_prescription_codes()
-            if str(insert_code) in map(str, all_prescription_codes):  # Konwersja na stringi, aby uniknąć błędów porównania
+            if not validation_service.is_unique("prescriptions", "prescription_code", str(insert_code)):
                 errors.append(f"Recepta o kodzie {insert_code} już istnieje w systemie.")
 
             # Pobranie roli użytkownika
-            role_id = users_accounts_controller.get_role_id_by_user_id(self._logged_in_user_id)
+            role_id = session.role_id
+            prescriptions_scope = self.main_controller.db_controller.permission_engine.row_scope(session, "edit", "prescriptions")
             print(f"[BridgeRoom_addPrescription] Użytkownik o ID {self._logged_in_user_id} ma rolę {role_id}.")
 
-            if role_id in [1, 2, 9, 10]:
-                # Pobranie wszystkich ID wizyt w tabeli appointments
-                all_appointment_ids = patients_service.get_all_appointment_ids_appointments_table()
-                if insert_appointment_id not in all_appointment_ids:
+            if prescriptions_scope == SCOPE_NONE:
+                msg = f"Brak uprawnień do wystawiania recept dla roli role_id={role_id}."
+                print(f"[BridgeRoom_addPrescription] {msg}")
+                self.prescriptionAdditionFailed.emit(msg)
+                return
+
+            if prescriptions_scope == SCOPE_ALL:
+                # Sprawdzenie, czy wizyta istnieje w tabeli appointments
+                if not validation_service.exists("appointments", "appointment_id", insert_appointment_id):
                     errors.append(f"Wizyta o ID ({insert_appointment_id}) nie istnieje w bazie wizyt.")
 
-                # **Dodatkowe sprawdzenie - czy wizyta jest przypisana do pracownika (role_id = 3)**
-                assigned_prescriptions_ids = patients_service.get_appointment_id_by_user_id()
-                if insert_appointment_id not in assigned_prescriptions_ids:
-                    errors.append(f"Wizyta o ID ({insert_appointment_id}) nie jest przypisana do żadnego lekarza (role_id = 3).")
-                    errors.append(f"Dostępne ID wizyty dla użytkownika o roli 3: {assigned_prescriptions_ids}")
+                # **Dodatkowe sprawdzenie - czy wizyta jest przypisana do pracownika wystawiającego recepty**
+                if not validation_service.is_prescriber_appointment(insert_appointment_id):
+                    errors.append(f"Wizyta o ID ({insert_appointment_id}) nie jest przypisana do pracownika uprawnionego do wystawiania recept.")
 
-            elif role_id == 3:
+            elif prescriptions_scope == SCOPE_ASSIGNED:
                 # Pobranie employee_id użytkownika
-                employee_id = users_accounts_controller.get_employee_id_by_user_id(self._logged_in_user_id)
+                employee_id = session.employee_id
                 print(f"[BridgeRoom_addPrescription] Employee ID dla użytkownika {self._logged_in_user_id}: {employee_id}")
 
-                # Pobranie ID wizyt przypisanych do pracownika
-                assigned_appointment_ids = patients_service.get_appointments_by_employee_id(employee_id)
-                if insert_appointment_id not in assigned_appointment_ids:
+                # Sprawdzenie, czy wizyta jest przypisana do pracownika
+                if not validation_service.is_prescriber_appointment(insert_appointment_id, employee_id):
                     errors.append(f"Wizyta o ID ({insert_appointment_id}) nie jest przypisana do pracownika o ID {employee_id}.")
-                    errors.append(f"Dostępne ID wizyty dla pracownika o ID {employee_id}: {assigned_appointment_ids}.")
 
             # **Walidacje danych**
             
@@ -1720,54 +1827,53 @@ class BackendBridge(QObject):
 
         try:
             # Inicjalizacja kontrolerów
-            users_accounts_controller = UsersAccountsController(self.main_controller.db_controller)
-            patients_service = PatientsService(self.main_controller)
+            session = self.main_controller.session_service.get_session(self._logged_in_user_id)
+            patients_service = self.main_controller.get_service("patients")
+            validation_service = self.main_controller.get_service("validation")
             prescriptions_controller = PrescriptionsController(self.main_controller.db_controller)
 
             errors = []  # Lista na błędy
 
             # Pobranie roli użytkownika
-            role_id = users_accounts_controller.get_role_id_by_user_id(self._logged_in_user_id)
+            role_id = session.role_id
+            prescriptions_scope = self.main_controller.db_controller.permission_engine.row_scope(session, "edit", "prescriptions")
             print(f"[BridgeRoom_updatePrescription] Użytkownik o ID {self._logged_in_user_id} ma rolę {role_id}.")
 
+            if prescriptions_scope == SCOPE_NONE:
+                msg = f"Brak uprawnień do edycji recept dla roli role_id={role_id}."
+                print(f"[BridgeRoom_updatePrescription] {msg}")
+                self.prescriptionUpdateFailed.emit(msg)
+                return
+
             # Sprawdzenie, czy recepta istnieje
-            all_prescription_ids = patients_service.get_all_prescription_ids()
-            if insert_prescription_id not in all_prescription_ids:
+            if not validation_service.exists("prescriptions", "prescription_id", insert_prescription_id):
                 errors.append(f"Recepta o ID {insert_prescription_id} nie istnieje w systemie.")
 
-            if role_id in [1, 2, 9, 10]:
-                # Pobranie wszystkich ID wizyt z tabeli appointments
-                all_appointment_ids = patients_service.get_all_appointment_ids_appointments_table()
-                if insert_appointment_id and insert_appointment_id not in all_appointment_ids:
+            if prescriptions_scope == SCOPE_ALL:
+                # Sprawdzenie, czy wizyta istnieje w tabeli appointments
+                if insert_appointment_id and not validation_service.exists("appointments", "appointment_id", insert_appointment_id):
                     errors.append(f"Wizyta o ID ({insert_appointment_id}) nie istnieje w bazie wizyt.")
 
-                # Dodatkowe sprawdzenie – czy wizyta jest przypisana do lekarza (role_id = 3)
-                assigned_prescriptions_ids = patients_service.get_appointment_id_by_user_id()
-                if insert_appointment_id and insert_appointment_id not in assigned_prescriptions_ids:
-                    errors.append(f"Wizyta o ID ({insert_appointment_id}) nie jest przypisana do żadnego lekarza (role_id = 3).")
-                    errors.append(f"Dostępne wizyty dla pracownika o roli o ID {role_id}: {assigned_prescriptions_ids}")
+                # Dodatkowe sprawdzenie – czy wizyta jest przypisana do pracownika wystawiającego recepty
+                if insert_appointment_id and not validation_service.is_prescriber_appointment(insert_appointment_id):
+                    errors.append(f"Wizyta o ID ({insert_appointment_id}) nie jest przypisana do pracownika uprawnionego do wystawiania recept.")
 
-            elif role_id == 3:
+            elif prescriptions_scope == SCOPE_ASSIGNED:
                 # Pobranie employee_id użytkownika
-                employee_id = users_accounts_controller.get_employee_id_by_user_id(self._logged_in_user_id)
+                employee_id = session.employee_id
                 print(f"[BridgeRoom_updatePrescription] Employee ID dla użytkownika {self._logged_in_user_id}: {employee_id}")
 
                 # Sprawdzenie, czy wizyta jest przypisana do pracownika
-                assigned_appointment_ids = patients_service.get_appointments_by_employee_id(employee_id)
-                if insert_appointment_id and insert_appointment_id not in assigned_appointment_ids:
+                if insert_appointment_id and not validation_service.is_prescriber_appointment(insert_appointment_id, employee_id):
                     errors.append(f"Wizyta o ID {insert_appointment_id} nie jest przypisana do pracownika o ID {employee_id}.")
-                    errors.append(f"Dostępne ID wizyt dla pracownika {employee_id}: {assigned_appointment_ids}")
 
                 # Sprawdzenie, czy recepta została wystawiona przez tego pracownika
-                assigned_prescription_ids = patients_service.get_prescriptions_id_by_employee_id(employee_id)
-                if insert_prescription_id not in assigned_prescription_ids:
+                if not validation_service.is_employee_prescription(insert_prescription_id, employee_id):
                     errors.append(f"Recepta o ID {insert_prescription_id} nie została wystawiona przez pracownika o ID {employee_id}.")
-                    errors.append(f"Dostępne recepty dla pracownika {employee_id}: {assigned_prescription_ids}")
 
             # Sprawdzenie, czy kod recepty już istnieje – wykonujemy tylko, gdy podano wartość
             if insert_code and insert_code.strip() != "":
-                all_prescription_codes = patients_service.get_all_prescription_codes()
-                if str(insert_code) in map(str, all_prescription_codes):
+                if not validation_service.is_unique("prescriptions", "prescription_code", str(insert_code)):
                     errors.append(f"Recepta o kodzie {insert_code} już istnieje w systemie.")
 
             # Walidacje danych – wykonujemy walidację tylko dla pól, które nie są puste
@@ -1868,24 +1974,31 @@ class BackendBridge(QObject):
 
         try:
             # Inicjalizacja kontrolerów
-            users_accounts_controller = UsersAccountsController(self.main_controller.db_controller)
-            patients_service = PatientsService(self.main_controller)
+            session = self.main_controller.session_service.get_session(self._logged_in_user_id)
+            patients_service = self.main_controller.get_service("patients")
+            validation_service = self.main_controller.get_service("validation")
             prescriptions_controller = PrescriptionsController(self.main_controller.db_controller)
 
             errors = []  # Lista na błędy
 
             # Pobranie roli użytkownika
-            role_id = users_accounts_controller.get_role_id_by_user_id(self._logged_in_user_id)
+            role_id = session.role_id
+            prescriptions_scope = self.main_controller.db_controller.permission_engine.row_scope(session, "edit", "prescriptions")
             print(f"[BridgeRoom_deletePrescription] Użytkownik o ID {self._logged_in_user_id} ma rolę {role_id}.")
 
+            if prescriptions_scope == SCOPE_NONE:
+                msg = f"Brak uprawnień do usuwania recept dla roli role_id={role_id}."
+                print(f"[BridgeRoom_deletePrescription] {msg}")
+                self.prescriptionDeletionFailed.emit(msg)
+                return
+
             # Sprawdzenie czy recepta istnieje w bazie
-            all_prescription_ids = patients_service.get_all_prescription_ids()
-            if insert_prescription_id not in all_prescription_ids:
+            if not validation_service.exists("prescriptions", "prescription_id", insert_prescription_id):
                 errors.append(f"Recepta o ID {insert_prescription_id} nie istnieje w systemie.")
 
-            if role_id == 3:
+            if prescriptions_scope == SCOPE_ASSIGNED:
                 # Pobranie employee_id użytkownika
-                employee_id = users_accounts_controller.get_employee_id_by_user_id(self._logged_in_user_id)
+                employee_id = session.employee_id
                 print(f"[BridgeRoom_deletePrescription] Employee ID dla użytkownika {self._logged_in_user_id}: {employee_id}")
 
                 # Sprawdzenie, czy recepta została wystawiona przez tego pracownika
@@ -1943,14 +2056,14 @@ class BackendBridge(QObject):
 
         try:
             # Inicjalizacja kontrolera użytkowników
-            users_accounts_controller = UsersAccountsController(self.main_controller.db_controller)
+            session = self.main_controller.session_service.get_session(self._logged_in_user_id)
 
             # Pobranie roli użytkownika
-            role_id = users_accounts_controller.get_role_id_by_user_id(self._logged_in_user_id)
+            role_id = session.role_id
             print(f"[BackendBridge_checkPrescriptionsAccess] Użytkownik o ID {self._logged_in_user_id} ma rolę {role_id}.")
 
-            # Warunek: Użytkownik z rolą 4-8 nie ma dostępu
-            if role_id in [4, 5, 6, 7, 8]:
+            # Warunek: Rola bez uprawnienia do przeglądania recept nie ma dostępu
+            if not self.main_controller.db_controller.permission_engine.can(session, "view", "prescriptions"):
                 msg = "Brak uprawnień do rzadządzania receptami."
                 print(f"[BackendBridge_checkPrescriptionsAccess] {msg}")
                 
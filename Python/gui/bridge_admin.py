@@ -1,13 +1,14 @@
         
 import bcrypt
+import json
 import sqlite3
 import re
 from PySide6.QtCore import QObject, Signal, Slot# pylint: disable=E0611
 from controllers.users_accounts_controller import UsersAccountsController
-from controllers.patients_controller import PatientController
 from controllers.assigned_patients_controller import AssignedPatientsController
 from controllers.roles_controller import RolesController
-from services.admin_service import AdminService
+from database.exists_probe import ExistsProbe
+from gui.bridge_worker import BridgeWorker
 from datetime import datetime
 
 
@@ -27,6 +28,7 @@ class BridgeAdmin(QObject):
     patientAssignmentUpdateFailed = Signal(str)
     patientAssignmentDeletedSuccessfully = Signal()
     patientAssignmentDeletionFailed = Signal(str)
+    assignedPatientsBatchFinished = Signal(list)  # Wyniki wierszy {"index", "success", "error", "id"}
     roleAddedSuccessfully = Signal()
     roleAdditionFailed = Signal(str)
     roleUpdatedSuccessfully = Signal()
@@ -34,11 +36,12 @@ class BridgeAdmin(QObject):
     roleDeletedSuccessfully = Signal()
     roleDeletionFailed = Signal(str)
 
-    def __init__(self, main_controller):
+    def __init__(self, main_controller, worker=None):
         try:
             super().__init__()
             print("BridgeAdmin initialized")  # Debugging
             self.main_controller = main_controller
+            self.worker = worker if worker is not None else BridgeWorker(main_controller)
             self._logged_in_user_id = None
             self._user_list = []
             self._roles_list = []
@@ -50,37 +53,38 @@ class BridgeAdmin(QObject):
 
  # -------------------------------------------------------------------------
 
-    @Slot()
-    def updateUserList(self):
+    def _emit_result(self, error_message, success_signal, failure_signal):
         """
-        Pobiera listę użytkowników z admin_service i emituje sygnał do QML.
+        Emituje sygnał sukcesu (brak komunikatu błędu) lub sygnał błędu z komunikatem
+        na podstawie wyniku zadania wykonanego w wątku roboczym.
         """
-        try:
-            admin_service = AdminService(self.main_controller)
-            # Pobranie listy użytkowników z admin_service
-            user_list = admin_service.get_all_user_accounts()
-
-
-            if not isinstance(user_list, list):
-                print("[BridgeAdmin_updateUserList] Nieprawidłowy format danych użytkowników.")
-                self.userListChanged.emit([])  # Emituj pustą listę w przypadku błędu
-                return
+        if error_message:
+            failure_signal.emit(error_message)
+        else:
+            success_signal.emit()
 
-            # Aktualizacja lokalnej listy użytkowników
-            self._user_list = user_list
-
-            # Emitowanie sygnału z listą użytkowników
-            self.userListChanged.emit(self._user_list)
+ # -------------------------------------------------------------------------
 
-        except KeyError as ke:
-            print(f"[BridgeAdmin_updateUserList] Błąd klucza w danych użytkowników: {ke}")
-            self.userListChanged.emit([])  # Emituj pustą listę w przypadku błędu
-        except ValueError as ve:
-            print(f"[BridgeAdmin_updateUserList] Nieprawidłowa wartość w danych użytkowników: {ve}")
-            self.userListChanged.emit([])  # Emituj pustą listę w przypadku błędu
-        except TypeError as te:
-            print(f"[BridgeAdmin_updateUserList] Błąd typu danych użytkowników: {te}")
+    @Slot()
+    def updateUserList(self):
+        """
+        Pobiera listę użytkowników z admin_service (w wątku roboczym) i emituje sygnał do QML.
+        """
+        self.worker.load_list(
+            "BridgeAdmin_updateUserList",
+            lambda main_controller: main_controller.get_service("admin").get_all_user_accounts(),
+            self._set_user_list,
+            self.userListChanged,
+        )
+
+    def _set_user_list(self, items):
+        if not isinstance(items, list):
+            print("[BridgeAdmin_updateUserList] Nieprawidłowy format danych użytkowników.")
             self.userListChanged.emit([])  # Emituj pustą listę w przypadku błędu
+            return
+
+        self._user_list = items
+        self.userListChanged.emit(self._user_list)
 
     @Slot(result=list)
     def getUserList(self):
@@ -94,33 +98,23 @@ class BridgeAdmin(QObject):
     @Slot()
     def updateRolesList(self):
         """
-        Pobiera listę ról z admin_service i emituje sygnał do QML.
+        Pobiera listę ról z admin_service (w wątku roboczym) i emituje sygnał do QML.
         """
-        try:
-            # Pobranie listy ról z admin_service
-            admin_service = AdminService(self.main_controller)
-            roles_list = admin_service.get_all_roles()
-
-            if not isinstance(roles_list, list):
-                print("[BridgeAdmin_updateRolesList] Nieprawidłowy format danych ról.")
-                self.rolesListChanged.emit([])  # Emituj pustą listę w przypadku błędu
-                return
-
-            # Aktualizacja lokalnej listy ról
-            self._roles_list = roles_list
-
-            # Emitowanie sygnału z listą ról
-            self.rolesListChanged.emit(self._roles_list)
-
-        except KeyError as ke:
-            print(f"[BridgeAdmin_updateRolesList] Błąd klucza w danych ról: {ke}")
-            self.rolesListChanged.emit([])  # Emituj pustą listę w przypadku błędu
-        except ValueError as ve:
-            print(f"[BridgeAdmin_updateRolesList] Nieprawidłowa wartość w danych ról: {ve}")
-            self.rolesListChanged.emit([])  # Emituj pustą listę w przypadku błędu
-        except TypeError as te:
-            print(f"[BridgeAdmin_updateRolesList] Błąd typu danych ról: {te}")
+        self.worker.load_list(
+            "BridgeAdmin_updateRolesList",
+            lambda main_controller: main_controller.get_service("admin").get_all_roles(),
+            self._set_roles_list,
+            self.rolesListChanged,
+        )
+
+    def _set_roles_list(self, items):
+        if not isinstance(items, list):
+            print("[BridgeAdmin_updateRolesList] Nieprawidłowy format danych ról.")
             self.rolesListChanged.emit([])  # Emituj pustą listę w przypadku błędu
+            return
+
+        self._roles_list = items
+        self.rolesListChanged.emit(self._roles_list)
 
     @Slot(result=list)
     def getRolesList(self):
@@ -134,33 +128,23 @@ class BridgeAdmin(QObject):
     @Slot()
     def updateAssignedPatientsList(self):
         """
-        Pobiera listę przypisanych pacjentów z admin_service i emituje sygnał do QML.
+        Pobiera listę przypisanych pacjentów z admin_service (w wątku roboczym) i emituje sygnał do QML.
         """
-        try:
-            # Pobranie listy przypisanych pacjentów z admin_service
-            admin_service = AdminService(self.main_controller)
-            assigned_patients_list = admin_service.get_all_assigned_patients()
-
-            if not isinstance(assigned_patients_list, list):
-                print("[BridgeAdmin_updateAssignedPatientsList] Nieprawidłowy format danych przypisanych pacjentów.")
-                self.assignedPatientsListChanged.emit([])  # Emituj pustą listę w przypadku błędu
-                return
-
-            # Aktualizacja lokalnej listy przypisanych pacjentów
-            self._assigned_patients_list = assigned_patients_list
-
-            # Emitowanie sygnału z listą przypisanych pacjentów
-            self.assignedPatientsListChanged.emit(self._assigned_patients_list)
-
-        except KeyError as ke:
-            print(f"[BridgeAdmin_updateAssignedPatientsList] Błąd klucza w danych przypisanych pacjentów: {ke}")
-            self.assignedPatientsListChanged.emit([])  # Emituj pustą listę w przypadku błędu
-        except ValueError as ve:
-            print(f"[BridgeAdmin_updateAssignedPatientsList] Nieprawidłowa wartość w danych przypisanych pacjentów: {ve}")
-            self.assignedPatientsListChanged.emit([])  # Emituj pustą listę w przypadku błędu
-        except TypeError as te:
-            print(f"[BridgeAdmin_updateAssignedPatientsList] Błąd typu danych przypisanych pacjentów: {te}")
+        self.worker.load_list(
+            "BridgeAdmin_updateAssignedPatientsList",
+            lambda main_controller: main_controller.get_service("admin").get_all_assigned_patients(),
+            self._set_assigned_patients_list,
+            self.assignedPatientsListChanged,
+        )
+
+    def _set_assigned_patients_list(self, items):
+        if not isinstance(items, list):
+            print("[BridgeAdmin_updateAssignedPatientsList] Nieprawidłowy format danych przypisanych pacjentów.")
             self.assignedPatientsListChanged.emit([])  # Emituj pustą listę w przypadku błędu
+            return
+
+        self._assigned_patients_list = items
+        self.assignedPatientsListChanged.emit(self._assigned_patients_list)
 
     @Slot(result=list)
     def getAssignedPatientsList(self):
@@ -174,8 +158,22 @@ class BridgeAdmin(QObject):
 
     @Slot(int, int, str, str, str)
     def addInternalUser(self, insert_employee_id, insert_role_id, insert_username, insert_password, insert_expired_date):
+        """
+        Dodaje użytkownika wewnętrznego w wątku roboczym (walidacja, hashowanie hasła, zapis)
+        i emituje `userAddedSuccessfully` lub `userAdditionFailed`.
+        """
+        self.worker.run(
+            "BridgeAdmin_addInternalUser",
+            self._add_internal_user,
+            (insert_employee_id, insert_role_id, insert_username, insert_password, insert_expired_date),
+            on_success=lambda error_message: self._emit_result(error_message, self.userAddedSuccessfully, self.userAdditionFailed),
+            on_failure=lambda error: self._emit_result(f"Błąd systemowy: {error}", self.userAddedSuccessfully, self.userAdditionFailed),
+        )
+
+    def _add_internal_user(self, main_controller, insert_employee_id, insert_role_id, insert_username, insert_password, insert_expired_date):
         """
         Dodaje użytkownika wewnętrznego do systemu po zweryfikowaniu poprawności danych.
+        Wykonywane w wątku roboczym (bcrypt.hashpw); zwraca komunikat błędu lub None przy sukcesie.
 
         :param insert_employee_id: ID pracownika.
         :param insert_role_id: ID roli.
@@ -189,30 +187,30 @@ class BridgeAdmin(QObject):
 
         try:
 
-            admin_service = AdminService(self.main_controller)
-            users_accounts_controller = UsersAccountsController(self.main_controller.db_controller)
+            users_accounts_controller = UsersAccountsController(main_controller.db_controller)
 
-            # Pobranie listy employee_id, role_id, username oraz użytych employee_id z users_accounts
-            all_employee_ids = admin_service.get_all_employee_ids()
-            all_employee_ids_from_users_accounts = admin_service.get_all_employee_ids_from_users_accounts()
-            all_role_ids = admin_service.get_all_role_ids()
-            all_usernames = admin_service.get_all_usernames()
+            # Sprawdzenie pracownika, jego konta, roli i nazwy użytkownika jednym zapytaniem
+            employee_exists, employee_has_account, role_exists, username_taken = main_controller.get_service("validation").check(
+                ExistsProbe("employees", {"employee_id": insert_employee_id}),
+                ExistsProbe("users_accounts", {"employee_id": insert_employee_id}),
+                ExistsProbe("roles", {"role_id": insert_role_id}),
+                ExistsProbe("users_accounts", {"username": insert_username}),
+            )
 
             # **Sprawdzenie warunków dla `insert_employee_id`**
-            if insert_employee_id not in all_employee_ids:
+            if not employee_exists:
                 errors.append(f"Pracownik o ID {insert_employee_id} nie istnieje w systemie.")
-            elif insert_employee_id in all_employee_ids and insert_employee_id in all_employee_ids_from_users_accounts:
-                available_ids = [emp_id for emp_id in all_employee_ids if emp_id not in all_employee_ids_from_users_accounts]
-                errors.append(f"Pracownik o ID {insert_employee_id} istnieje już w users_accounts. Dostępne employee_id do przypisania: {available_ids}")
-            elif insert_employee_id not in all_employee_ids_from_users_accounts:
+            elif employee_has_account:
+                errors.append(f"Pracownik o ID {insert_employee_id} istnieje już w users_accounts.")
+            else:
                 print(f"[BridgeRoom_addInternalUser] Pracownik o ID {insert_employee_id} jest dostępny do przypisania.")
 
             # **Sprawdzenie czy `insert_role_id` istnieje**
-            if insert_role_id not in all_role_ids:
+            if not role_exists:
                 errors.append(f"Rola o ID {insert_role_id} nie istnieje w systemie.")
 
             # **Sprawdzenie czy `insert_username` już istnieje**
-            if insert_username in all_usernames:
+            if username_taken:
                 errors.append(f"Nazwa użytkownika '{insert_username}' jest już zajęta.")
 
              # **Walidacja nazwy użytkownika (`insert_username`)**
@@ -246,8 +244,7 @@ class BridgeAdmin(QObject):
             if errors:
                 error_message = "\n".join(errors)
                 print(f"[BridgeRoom_addInternalUser] Błędy walidacji:\n{error_message}")
-                self.userAdditionFailed.emit(error_message)
-                return
+                return error_message
 
             # **Hashowanie hasła przy użyciu bcrypt**
             hashed_password = bcrypt.hashpw(insert_password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
@@ -271,36 +268,50 @@ class BridgeAdmin(QObject):
 
             if success:
                 print(f"[BridgeRoom_addInternalUser] Użytkownik został dodany pomyślnie! Username: {insert_username}")
-                self.userAddedSuccessfully.emit()
+                return None
             else:
                 print("[BridgeRoom_addInternalUser] Nie udało się dodać użytkownika do systemu.")
-                self.userAdditionFailed.emit("Wystąpił problem podczas dodawania użytkownika.")
+                return "Wystąpił problem podczas dodawania użytkownika."
 
         except sqlite3.OperationalError as op_err:
             print(f"[BridgeRoom_addInternalUser] Błąd operacyjny bazy danych: {str(op_err)}")
-            self.userAdditionFailed.emit("Błąd operacyjny bazy danych.")
+            return "Błąd operacyjny bazy danych."
 
         except sqlite3.DatabaseError as db_err:
             print(f"[BridgeRoom_addInternalUser] Błąd bazy danych: {str(db_err)}")
-            self.userAdditionFailed.emit("Błąd bazy danych.")
+            return "Błąd bazy danych."
 
         except KeyError as ke:
             print(f"[BridgeRoom_addInternalUser] Błąd klucza w danych: {str(ke)}")
-            self.userAdditionFailed.emit("Błąd w strukturze danych.")
+            return "Błąd w strukturze danych."
 
         except TypeError as te:
             print(f"[BridgeRoom_addInternalUser] Błąd przetwarzania danych: {str(te)}")
-            self.userAdditionFailed.emit("Błąd przetwarzania danych.")
+            return "Błąd przetwarzania danych."
 
  # -------------------------------------------------------------------------
 
 
     @Slot(int, int, int, str, str, str, str)
     def updateUser(self, insert_user_id, insert_employee_id=0, insert_role_id=0, insert_username="", insert_password="", insert_expired_date="", insert_is_active=""):
+        """
+        Aktualizuje dane użytkownika w wątku roboczym (walidacja, bcrypt, zapis)
+        i emituje `userUpdatedSuccessfully` lub `userUpdateFailed`.
+        """
+        self.worker.run(
+            "BridgeAdmin_updateUser",
+            self._update_user,
+            (insert_user_id, insert_employee_id, insert_role_id, insert_username, insert_password, insert_expired_date, insert_is_active),
+            on_success=lambda error_message: self._emit_result(error_message, self.userUpdatedSuccessfully, self.userUpdateFailed),
+            on_failure=lambda error: self._emit_result(f"Błąd systemowy: {error}", self.userUpdatedSuccessfully, self.userUpdateFailed),
+        )
+
+    def _update_user(self, main_controller, insert_user_id, insert_employee_id=0, insert_role_id=0, insert_username="", insert_password="", insert_expired_date="", insert_is_active=""):
         """
         Aktualizuje dane użytkownika w systemie na podstawie podanych parametrów.
         Parametr insert_user_id jest wymagany.
         Pozostałe parametry są opcjonalne – aktualizacja nastąpi tylko dla pól, które mają przekazaną wartość.
+        Wykonywane w wątku roboczym (bcrypt); zwraca komunikat błędu lub None przy sukcesie.
 
         :param insert_user_id: ID użytkownika do aktualizacji.
         :param insert_employee_id: Nowe ID pracownika.
@@ -314,34 +325,31 @@ class BridgeAdmin(QObject):
         errors = []
 
         try:
-            admin_service = AdminService(self.main_controller)
-            users_accounts_controller = UsersAccountsController(self.main_controller.db_controller)
+            validation_service = main_controller.get_service("validation")
+            users_accounts_controller = UsersAccountsController(main_controller.db_controller)
             
             # *** Walidacja insert_user_id ***
-            all_user_ids = admin_service.get_all_user_ids()
-
-
-            if insert_user_id not in all_user_ids:
-                self.userUpdateFailed.emit(f"Użytkownik o podanym ID {insert_user_id} nie istnieje w systemie.")
-                return
+            if not validation_service.exists("users_accounts", "user_id", insert_user_id):
+                return f"Użytkownik o podanym ID {insert_user_id} nie istnieje w systemie."
 
             # Pobranie obecnych danych użytkownika
             current_data = users_accounts_controller.get_user_by_id(insert_user_id)
             if current_data is None:
-                self.userUpdateFailed.emit("Użytkownik o podanym ID nie istnieje w systemie.")
-                return
+                return "Użytkownik o podanym ID nie istnieje w systemie."
 
             update_data = {}
 
             # Aktualizacja pola insert_employee_id (przekazujemy int, 0 oznacza brak wartości)
             if insert_employee_id != 0:
-                all_employee_ids = admin_service.get_all_employee_ids()
-                all_employee_ids_from_users_accounts = admin_service.get_all_employee_ids_from_users_accounts()
-                if insert_employee_id not in all_employee_ids:
+                # Konto aktualizowanego użytkownika nie jest traktowane jako zajęte
+                employee_exists, employee_has_account = validation_service.check(
+                    ExistsProbe("employees", {"employee_id": insert_employee_id}),
+                    ExistsProbe("users_accounts", {"employee_id": insert_employee_id}, ("user_id", insert_user_id)),
+                )
+                if not employee_exists:
                     errors.append(f"Pracownik o ID {insert_employee_id} nie istnieje w systemie.")
-                elif insert_employee_id in all_employee_ids and insert_employee_id in all_employee_ids_from_users_accounts:
-                    available_ids = [emp_id for emp_id in all_employee_ids if emp_id not in all_employee_ids_from_users_accounts]
-                    errors.append(f"Pracownik o ID {insert_employee_id} jest już przypisany. Dostępne employee_id: {available_ids}")
+                elif employee_has_account:
+                    errors.append(f"Pracownik o ID {insert_employee_id} jest już przypisany.")
                 else:
                     if current_data.get('employee_id') == insert_employee_id:
                         print(f"[BridgeRoom_updateUser] insert_employee_id jest taki sam jak obecny: {insert_employee_id}")
@@ -350,8 +358,7 @@ class BridgeAdmin(QObject):
 
             # Aktualizacja pola insert_role_id (przekazujemy int, 0 oznacza brak wartości)
             if insert_role_id != 0:
-                all_role_ids = admin_service.get_all_role_ids()
-                if insert_role_id not in all_role_ids:
+                if not validation_service.exists("roles", "role_id", insert_role_id):
                     errors.append(f"Rola o ID {insert_role_id} nie istnieje w systemie.")
                 else:
                     if current_data.get('role_id') == insert_role_id:
@@ -361,8 +368,7 @@ class BridgeAdmin(QObject):
 
             # Aktualizacja pola insert_username
             if insert_username != "":
-                all_usernames = admin_service.get_all_usernames()
-                if insert_username != current_data.get('username') and insert_username in all_usernames:
+                if not validation_service.is_unique("users_accounts", "username", insert_username, ("user_id", insert_user_id)):
                     errors.append(f"Nazwa użytkownika '{insert_username}' jest już zajęta.")
                 username_regex = r'^[a-z]+[.][a-z]+$'
                 if not re.match(username_regex, insert_username) or len(insert_username) < 3:
@@ -429,40 +435,40 @@ class BridgeAdmin(QObject):
             if errors:
                 error_message = "\n".join(errors)
                 print(f"[BridgeRoom_updateUser] Błędy walidacji:\n{error_message}")
-                self.userUpdateFailed.emit(error_message)
-                return
+                return error_message
 
             if not update_data:
-                self.userUpdateFailed.emit("Brak zmian w danych do aktualizacji.")
-                return
+                return "Brak zmian w danych do aktualizacji."
 
             try:
                 success = users_accounts_controller.update_user_by_ids(insert_user_id, **update_data)
                 if success:
                     print(f"[BridgeRoom_updateUser] Użytkownik o ID {insert_user_id} został zaktualizowany pomyślnie.")
-                    self.userUpdatedSuccessfully.emit()
+                    # Rola lub pracownik użytkownika mogły się zmienić - kontekst sesji zostanie wczytany ponownie
+                    main_controller.session_service.invalidate_user(insert_user_id)
+                    return None
                 else:
                     print("[BridgeRoom_updateUser] Nie udało się zaktualizować użytkownika.")
-                    self.userUpdateFailed.emit("Wystąpił problem podczas aktualizacji użytkownika.")
+                    return "Wystąpił problem podczas aktualizacji użytkownika."
             except sqlite3.OperationalError as op_err:
                 print(f"[BridgeRoom_updateUser] Błąd operacyjny bazy danych: {str(op_err)}")
-                self.userUpdateFailed.emit("Błąd operacyjny bazy danych.")
+                return "Błąd operacyjny bazy danych."
             except sqlite3.DatabaseError as db_err:
                 print(f"[BridgeRoom_updateUser] Błąd bazy danych: {str(db_err)}")
-                self.userUpdateFailed.emit("Błąd bazy danych.")
+                return "Błąd bazy danych."
             except KeyError as ke:
                 print(f"[BridgeRoom_updateUser] Błąd klucza w danych: {str(ke)}")
-                self.userUpdateFailed.emit("Błąd w strukturze danych.")
+                return "Błąd w strukturze danych."
             except TypeError as te:
                 print(f"[BridgeRoom_updateUser] Błąd przetwarzania danych: {str(te)}")
-                self.userUpdateFailed.emit("Błąd przetwarzania danych.")
+                return "Błąd przetwarzania danych."
 
         except sqlite3.OperationalError as op_err:
             print(f"[BridgeRoom_updateUser] Błąd operacyjny bazy danych: {str(op_err)}")
-            self.userUpdateFailed.emit("Błąd operacyjny bazy danych.")
+            return "Błąd operacyjny bazy danych."
         except sqlite3.DatabaseError as db_err:
             print(f"[BridgeRoom_updateUser] Błąd bazy danych: {str(db_err)}")
-            self.userUpdateFailed.emit("Błąd bazy danych.")
+            return "Błąd bazy danych."
 
  # -------------------------------------------------------------------------
 
@@ -477,14 +483,10 @@ class BridgeAdmin(QObject):
         print(f"[BridgeAdmin_deleteUser] Otrzymano żądanie usunięcia użytkownika o ID: {insert_user_id}")
 
         try:
-            admin_service = AdminService(self.main_controller)
             users_accounts_controller = UsersAccountsController(self.main_controller.db_controller)
 
-            # **Pobranie wszystkich user_id z bazy**
-            all_user_ids = admin_service.get_all_user_ids()
-
             # **Sprawdzenie, czy `insert_user_id` istnieje w bazie**
-            if insert_user_id not in all_user_ids:
+            if not self.main_controller.get_service("validation").exists("users_accounts", "user_id", insert_user_id):
                 msg = f"Użytkownik o ID ({insert_user_id}) nie istnieje w bazie."
                 print(f"[BridgeAdmin_deleteUser] {msg}")
                 self.userDeletionFailed.emit(msg)
@@ -495,6 +497,7 @@ class BridgeAdmin(QObject):
 
             if success:
                 print(f"[BridgeAdmin_deleteUser] Użytkownik o ID {insert_user_id} został usunięty.")
+                self.main_controller.session_service.invalidate_user(insert_user_id)
                 self.userDeletedSuccessfully.emit()
             else:
                 print("[BridgeAdmin_deleteUser] Nie udało się usunąć użytkownika.")
@@ -530,40 +533,31 @@ class BridgeAdmin(QObject):
 
         try:
             # Inicjalizacja kontrolerów
-            admin_service = AdminService(self.main_controller)
-            patients_controller = PatientController(self.main_controller.db_controller)
             assigned_patients_controller = AssignedPatientsController(self.main_controller.db_controller)
 
-            # Pobranie listy patient_id, employee_id oraz przypisanych pacjent-pracownik
-            all_patient_ids = patients_controller.get_all_patient_ids()
-            all_employee_ids = admin_service.get_all_employee_ids()
-            assigned_patients = admin_service.get_all_assigned_patients()
+            # Sprawdzenie pacjenta, pracownika i istniejących przypisań jednym zapytaniem
+            patient_exists, employee_exists, has_active_assignment, pair_exists = self.main_controller.get_service("validation").check(
+                ExistsProbe("patients", {"patient_id": insert_patient_id}),
+                ExistsProbe("employees", {"employee_id": insert_employee_id}),
+                ExistsProbe("assigned_patients", {"fk_patient_id": insert_patient_id, "is_active": 1}),
+                ExistsProbe("assigned_patients", {"fk_patient_id": insert_patient_id, "fk_employee_id": insert_employee_id}),
+            )
 
             # **Sprawdzenie czy `insert_patient_id` istnieje w bazie**
-            if insert_patient_id not in all_patient_ids:
+            if not patient_exists:
                 errors.append(f"Pacjent o ID {insert_patient_id} nie istnieje w systemie.")
 
             # **Sprawdzenie czy `insert_employee_id` istnieje w bazie**
-            if insert_employee_id not in all_employee_ids:
+            if not employee_exists:
                 errors.append(f"Pracownik o ID {insert_employee_id} nie istnieje w systemie.")
 
-            # **Sprawdzenie, czy pacjent ma już przypisanego pracownika**
-            for assigned in assigned_patients:
-                if assigned["fk_patient_id"] == insert_patient_id:
-                    if assigned["is_active"] == 1:
-                        errors.append(
-                            f"Pacjent o ID {insert_patient_id} ma już aktywnie przypisanego pracownika o ID {assigned['fk_employee_id']}."
-                        )
-                    elif assigned["is_active"] == 0:
-                        print(
-                            f"[BridgeRoom_addAssignedPatient] Pacjent {insert_patient_id} miał wcześniej przypisanego pracownika "
-                            f"o ID {assigned['fk_employee_id']}, ale przypisanie było nieaktywne. Przechodzimy dalej..."
-                        )
+            # **Sprawdzenie, czy pacjent ma już aktywnie przypisanego pracownika**
+            if has_active_assignment:
+                errors.append(f"Pacjent o ID {insert_patient_id} ma już aktywnie przypisanego pracownika.")
 
             # **Sprawdzenie czy kombinacja `insert_patient_id` i `insert_employee_id` już istnieje**
-            for assigned in assigned_patients:
-                if assigned["fk_patient_id"] == insert_patient_id and assigned["fk_employee_id"] == insert_employee_id:
-                    errors.append(f"Kombinacja pacjenta o ID {insert_patient_id} i pracownika o ID {insert_employee_id} już istnieje.")
+            if pair_exists:
+                errors.append(f"Kombinacja pacjenta o ID {insert_patient_id} i pracownika o ID {insert_employee_id} już istnieje.")
 
             # **Jeśli są błędy, emitujemy je i przerywamy działanie**
             if errors:
@@ -584,6 +578,7 @@ class BridgeAdmin(QObject):
 
             if success:
                 print(f"[BridgeRoom_addAssignedPatient] Pacjent {insert_patient_id} został przypisany do pracownika {insert_employee_id}.")
+                self.main_controller.session_service.invalidate_employee(insert_employee_id)
                 self.patientAssignedSuccessfully.emit()
             else:
                 print("[BridgeRoom_addAssignedPatient] Nie udało się przypisać pacjenta do pracownika.")
@@ -626,13 +621,11 @@ class BridgeAdmin(QObject):
 
         try:
             # Inicjalizacja kontrolerów
-            patients_controller = PatientController(self.main_controller.db_controller)
-            admin_service = AdminService(self.main_controller)
             assigned_patients_controller = AssignedPatientsController(self.main_controller.db_controller)
 
-            # Sprawdzenie czy insert_assignment_id istnieje w bazie (get_all_assignment_ids)
-            all_assignment_ids = admin_service.get_all_assignment_ids()
-            if insert_assignment_id not in all_assignment_ids:
+            # Sprawdzenie czy insert_assignment_id istnieje w bazie
+            validation_service = self.main_controller.get_service("validation")
+            if not validation_service.exists("assigned_patients", "assignment_id", insert_assignment_id):
                 self.patientAssignmentUpdateFailed.emit(
                     f"Przypisanie pacjenta o ID {insert_assignment_id} nie istnieje w systemie."
                 )
@@ -648,46 +641,37 @@ class BridgeAdmin(QObject):
 
             update_data = {}
 
-            # Pobranie listy pacjentów, pracowników i przypisań
-            all_patient_ids = patients_controller.get_all_patient_ids()
-            all_employee_ids = admin_service.get_all_employee_ids()
-            all_assigned_patients = admin_service.get_all_assigned_patients()
+            # Sprawdzenie pacjenta, pracownika i istniejących przypisań jednym zapytaniem
+            # (aktualizowane przypisanie nie jest traktowane jako duplikat)
+            exclude = ("assignment_id", insert_assignment_id)
+            patient_exists, employee_exists, has_active_assignment, pair_exists = validation_service.check(
+                ExistsProbe("patients", {"patient_id": insert_patient_id}),
+                ExistsProbe("employees", {"employee_id": insert_employee_id}),
+                ExistsProbe("assigned_patients", {"fk_patient_id": insert_patient_id, "is_active": 1}),
+                ExistsProbe("assigned_patients", {"fk_patient_id": insert_patient_id, "fk_employee_id": insert_employee_id}, exclude),
+            )
 
             # Sprawdzenie, czy pacjent już ma aktywne przypisanie do jakiegokolwiek pracownika
-            for record in all_assigned_patients:
-                if record["fk_patient_id"] == insert_patient_id:
-                    if record["is_active"] == 1:
-                        errors.append(
-                            f"Pacjent o ID {insert_patient_id} ma już aktywnie przypisanego pracownika o ID {record['fk_employee_id']}."
-                        )
-                    elif record["is_active"] == 0:
-                        print(
-                            f"[BridgeRoom_updateAssignedPatient] Pacjent {insert_patient_id} miał wcześniej przypisanego pracownika "
-                            f"o ID {record['fk_employee_id']}, ale przypisanie było nieaktywne. Przechodzimy dalej..."
-                        )
+            if has_active_assignment:
+                errors.append(f"Pacjent o ID {insert_patient_id} ma już aktywnie przypisanego pracownika.")
 
             # Walidacja insert_employee_id
             if insert_employee_id != 0:
-                if insert_employee_id not in all_employee_ids:
+                if not employee_exists:
                     errors.append(f"Pracownik o ID {insert_employee_id} nie istnieje w systemie.")
                 elif current_data.get("fk_employee_id") != insert_employee_id:
                     update_data["fk_employee_id"] = insert_employee_id
 
             # Walidacja insert_patient_id
             if insert_patient_id != 0:
-                if insert_patient_id not in all_patient_ids:
+                if not patient_exists:
                     errors.append(f"Pacjent o ID {insert_patient_id} nie istnieje w systemie.")
                 elif current_data.get("fk_patient_id") != insert_patient_id:
                     update_data["fk_patient_id"] = insert_patient_id
 
             # Sprawdzenie unikalności kombinacji insert_patient_id i insert_employee_id
-            if insert_patient_id != 0 and insert_employee_id != 0:
-                for record in all_assigned_patients:
-                    # Pomijamy rekord, który aktualnie aktualizujemy
-                    if record.get("assignment_id") != insert_assignment_id:
-                        if record.get("fk_patient_id") == insert_patient_id and record.get("fk_employee_id") == insert_employee_id:
-                            errors.append(f"Kombinacja pacjenta {insert_patient_id} i pracownika {insert_employee_id} już istnieje.")
-                            break
+            if insert_patient_id != 0 and insert_employee_id != 0 and pair_exists:
+                errors.append(f"Kombinacja pacjenta {insert_patient_id} i pracownika {insert_employee_id} już istnieje.")
 
             # Normalizacja wartości insert_is_active
             if insert_is_active != "":
@@ -719,6 +703,10 @@ class BridgeAdmin(QObject):
             success = assigned_patients_controller.update_record_by_ids(insert_assignment_id, **update_data)
             if success:
                 print(f"[BridgeRoom_updateAssignedPatient] Przypisanie pacjenta o ID {insert_assignment_id} zostało zaktualizowane.")
+                # Zmiana dotyczy zarówno poprzedniego, jak i nowego pracownika przypisania
+                self.main_controller.session_service.invalidate_employee(current_data.get("fk_employee_id"))
+                if "fk_employee_id" in update_data:
+                    self.main_controller.session_service.invalidate_employee(update_data["fk_employee_id"])
                 self.patientAssignmentUpdatedSuccessfully.emit()
             else:
                 print("[BridgeRoom_updateAssignedPatient] Nie udało się zaktualizować przypisania pacjenta.")
@@ -750,34 +738,38 @@ class BridgeAdmin(QObject):
         print(f"[BridgeAdmin_deleteAssignedPatient] Otrzymano żądanie usunięcia przypisania o ID: {insert_assignment_id}")
 
         try:
-            admin_service = AdminService(self.main_controller)
             assigned_patients_controller = AssignedPatientsController(self.main_controller.db_controller)
 
-            # **Pobranie wszystkich assignment_id z bazy**
-            all_assignment_ids = admin_service.get_all_assignment_ids()
+            # **Sprawdzenie istnienia przypisania i jego powiązań z wizytami jednym zapytaniem**
+            assignment_exists, used_in_appointments = self.main_controller.get_service("validation").check(
+                ExistsProbe("assigned_patients", {"assignment_id": insert_assignment_id}),
+                ExistsProbe("appointments", {"fk_assignment_id": insert_assignment_id}),
+            )
 
             # **Sprawdzenie, czy `insert_assignment_id` istnieje w bazie**
-            if insert_assignment_id not in all_assignment_ids:
+            if not assignment_exists:
                 msg = f"Przypisanie o ID ({insert_assignment_id}) nie istnieje w bazie."
                 print(f"[BridgeAdmin_deleteAssignedPatient] {msg}")
                 self.patientAssignmentDeletionFailed.emit(msg)
                 return
 
-            # **Pobranie wszystkich `fk_assignment_id` z tabeli `appointments`**
-            all_fk_assignment_ids = admin_service.get_all_fk_assignment_ids()
-
             # **Sprawdzenie, czy `insert_assignment_id` jest używane w `appointments`**
-            if insert_assignment_id in all_fk_assignment_ids:
+            if used_in_appointments:
                 msg = f"Nie można usunąć przypisania o ID ({insert_assignment_id}), ponieważ jest ono powiązane z wizytami."
                 print(f"[BridgeAdmin_deleteAssignedPatient] {msg}")
                 self.patientAssignmentDeletionFailed.emit(msg)
                 return
 
+            # Pracownik przypisania - jego kontekst sesji zostanie unieważniony po usunięciu
+            assignment = assigned_patients_controller.get_assigned_patient_by_id(insert_assignment_id)
+
             # **Próba usunięcia przypisania**
             success = assigned_patients_controller.delete_record_by_id(insert_assignment_id)
 
             if success:
                 print(f"[BridgeAdmin_deleteAssignedPatient] Przypisanie o ID {insert_assignment_id} zostało usunięte.")
+                if isinstance(assignment, dict):
+                    self.main_controller.session_service.invalidate_employee(assignment.get("fk_employee_id"))
                 self.patientAssignmentDeletedSuccessfully.emit()
             else:
                 print("[BridgeAdmin_deleteAssignedPatient] Nie udało się usunąć przypisania.")
@@ -795,6 +787,93 @@ class BridgeAdmin(QObject):
             print(f"[BridgeAdmin_deleteAssignedPatient] Błąd klucza w danych: {str(ke)}")
             self.patientAssignmentDeletionFailed.emit("Błąd w strukturze danych.")
 
+ # -------------------------------------------------------------------------
+
+    @Slot(str)
+    def updateAssignedPatients(self, updates_json):
+        """
+        Aktualizuje wiele przypisań pacjentów w jednej transakcji (np. przeniesienie pacjentów
+        odchodzącego terapeuty) i emituje `assignedPatientsBatchFinished` z wynikami wierszy.
+
+        :param updates_json: Tablica JSON, np. '[{"assignment_id": 5, "fk_employee_id": 3}]'.
+        """
+        updates = self._parse_batch_json(updates_json, dict, self.patientAssignmentUpdateFailed)
+        if updates is None:
+            return
+        self.worker.run(
+            "BridgeAdmin_updateAssignedPatients",
+            self._update_assigned_patients,
+            (updates,),
+            on_success=self._finish_assigned_patients_batch,
+            on_failure=lambda error: self.patientAssignmentUpdateFailed.emit(f"Błąd systemowy: {error}"),
+        )
+
+    def _update_assigned_patients(self, main_controller, updates):
+        """
+        Wykonywane w wątku roboczym; zwraca wyniki wierszy i pracowników, których dotyczy zmiana.
+        """
+        assigned_patients_controller = AssignedPatientsController(main_controller.db_controller)
+        # Zmiana dotyczy zarówno poprzednich, jak i nowych pracowników przypisań
+        employee_ids = assigned_patients_controller.get_employee_ids_by_assignment_ids(
+            [update.get("assignment_id") for update in updates]
+        )
+        results = assigned_patients_controller.update_many(updates)
+        employee_ids.update(
+            update["fk_employee_id"] for update, result in zip(updates, results)
+            if result["success"] and "fk_employee_id" in update
+        )
+        return results, employee_ids
+
+    @Slot(str)
+    def deleteAssignedPatients(self, assignment_ids_json):
+        """
+        Usuwa wiele przypisań pacjentów w jednej transakcji i emituje `assignedPatientsBatchFinished`
+        z wynikami wierszy. Przypisania powiązane z wizytami nie są usuwane.
+
+        :param assignment_ids_json: Tablica JSON z ID przypisań, np. '[5, 6, 7]'.
+        """
+        assignment_ids = self._parse_batch_json(assignment_ids_json, int, self.patientAssignmentDeletionFailed)
+        if assignment_ids is None:
+            return
+        self.worker.run(
+            "BridgeAdmin_deleteAssignedPatients",
+            self._delete_assigned_patients,
+            (assignment_ids,),
+            on_success=self._finish_assigned_patients_batch,
+            on_failure=lambda error: self.patientAssignmentDeletionFailed.emit(f"Błąd systemowy: {error}"),
+        )
+
+    def _delete_assigned_patients(self, main_controller, assignment_ids):
+        """
+        Wykonywane w wątku roboczym; zwraca wyniki wierszy i pracowników usuwanych przypisań.
+        """
+        assigned_patients_controller = AssignedPatientsController(main_controller.db_controller)
+        employee_ids = assigned_patients_controller.get_employee_ids_by_assignment_ids(assignment_ids)
+        return assigned_patients_controller.delete_many(assignment_ids), employee_ids
+
+    def _finish_assigned_patients_batch(self, outcome):
+        results, employee_ids = outcome
+        for employee_id in employee_ids:
+            self.main_controller.session_service.invalidate_employee(employee_id)
+        failed = sum(1 for result in results if not result["success"])
+        print(f"[BridgeAdmin_assignedPatientsBatch] Zapisano {len(results) - failed} z {len(results)} wierszy.")
+        self.assignedPatientsBatchFinished.emit(results)
+
+    @staticmethod
+    def _parse_batch_json(json_text, item_type, failure_signal):
+        """
+        Odczytuje tablicę JSON przekazaną z QML; przy nieprawidłowym formacie emituje `failure_signal`
+        i zwraca None.
+        """
+        try:
+            items = json.loads(json_text)
+        except (TypeError, ValueError):
+            items = None
+        if not isinstance(items, list) or not all(isinstance(item, item_type) for item in items):
+            failure_signal.emit("Nieprawidłowy format danych - oczekiwano tablicy JSON.")
+            return None
+        return items
+
  # -------------------------------------------------------------------------
 
     @Slot(str)
@@ -808,16 +887,13 @@ class BridgeAdmin(QObject):
 
         try:
             # Inicjalizacja kontrolerów
-            admin_service = AdminService(self.main_controller)
             roles_controller = RolesController(self.main_controller.db_controller)
 
-            # Pobranie listy dostępnych ról
-            all_role_names = admin_service.get_all_role_names()
-
             # **Walidacja `insert_role_name`**
             normalized_role_name = insert_role_name.strip().capitalize()  # Konwersja np. "KIEROWNIK" → "Kierownik"
 
-            if normalized_role_name in [role.capitalize() for role in all_role_names]:
+            # Kolumna `role_name` ignoruje wielkość liter (COLLATE NOCASE)
+            if not self.main_controller.get_service("validation").is_unique("roles", "role_name", normalized_role_name):
                 msg = f"Rola '{insert_role_name}' istnieje w systemie."
                 print(f"[BridgeRoom_addRole] {msg}")
                 self.roleAdditionFailed.emit(msg)
@@ -866,19 +942,22 @@ class BridgeAdmin(QObject):
 
         try:
             # Inicjalizacja kontrolerów
-            admin_service = AdminService(self.main_controller)
             roles_controller = RolesController(self.main_controller.db_controller)
 
+            normalized_role_name = insert_role_name.strip().capitalize()  # Konwersja np. "KIEROWNIK" → "Kierownik"
+
+            # **Sprawdzenie roli i unikalności nazwy jednym zapytaniem**
+            role_exists, role_name_taken = self.main_controller.get_service("validation").check(
+                ExistsProbe("roles", {"role_id": insert_role_id}),
+                ExistsProbe("roles", {"role_name": normalized_role_name}),
+            )
+
             # **Sprawdzenie czy insert_role_id istnieje w bazie**
-            all_role_ids = admin_service.get_all_role_ids()
-            if insert_role_id not in all_role_ids:
+            if not role_exists:
                 errors.append(f"Rola o ID {insert_role_id} nie istnieje w systemie.")
 
-            # **Pobranie listy ról i walidacja insert_role_name**
-            all_role_names = admin_service.get_all_role_names()
-            normalized_role_name = insert_role_name.strip().capitalize()  # Konwersja np. "KIEROWNIK" → "Kierownik"
-
-            if normalized_role_name in [role.capitalize() for role in all_role_names]:
+            # **Walidacja insert_role_name**
+            if role_name_taken:
                 errors.append(f"Rola '{insert_role_name}' już istnieje w systemie.")
 
             # **Jeśli są błędy, emitujemy je i przerywamy działanie**
@@ -908,6 +987,7 @@ class BridgeAdmin(QObject):
 
             if success:
                 print(f"[BridgeRoom_updateRole] Rola '{normalized_role_name}' została zaktualizowana pomyślnie.")
+                self.main_controller.session_service.invalidate_role(insert_role_id)
                 self.roleUpdatedSuccessfully.emit()
             else:
                 print("[BridgeRoom_updateRole] Nie udało się zaktualizować roli.")
@@ -942,26 +1022,24 @@ class BridgeAdmin(QObject):
 
         try:
             # Inicjalizacja kontrolerów
-            admin_service = AdminService(self.main_controller)
             roles_controller = RolesController(self.main_controller.db_controller)
 
-            # **Pobranie wszystkich role_id z bazy**
-            all_role_ids = admin_service.get_all_role_ids()
+            # **Sprawdzenie istnienia roli i jej przypisań do użytkowników jednym zapytaniem**
+            role_exists, role_assigned = self.main_controller.get_service("validation").check(
+                ExistsProbe("roles", {"role_id": insert_role_id}),
+                ExistsProbe("users_accounts", {"role_id": insert_role_id}),
+            )
 
             # **Sprawdzenie, czy `insert_role_id` istnieje w bazie**
-            if insert_role_id not in all_role_ids:
+            if not role_exists:
                 msg = f"Rola o ID ({insert_role_id}) nie istnieje w bazie."
                 print(f"[BridgeRoom_deleteRole] {msg}")
                 self.roleDeletionFailed.emit(msg)
                 return
 
-            # **Pobranie wszystkich przypisań roli do użytkowników**
-            role_user_assignments = admin_service.get_all_role_user_ids()
-
             # **Sprawdzenie, czy `insert_role_id` jest przypisane do użytkowników**
-            assigned_users = [entry["user_id"] for entry in role_user_assignments if entry["role_id"] == insert_role_id]
-            if assigned_users:
-                msg = f"Nie można usunąć roli o ID ({insert_role_id}), ponieważ jest przypisana do użytkowników o user_id: {', '.join(map(str, assigned_users))}."
+            if role_assigned:
+                msg = f"Nie można usunąć roli o ID ({insert_role_id}), ponieważ jest przypisana do użytkowników."
                 print(f"[BridgeRoom_deleteRole] {msg}")
                 self.roleDeletionFailed.emit(msg)
                 return
@@ -1,12 +1,11 @@
 from PySide6.QtCore import QObject, Signal, Slot # pylint: disable=E0611
-from services.employee_service import EmployeeService
+from database.exists_probe import ExistsProbe
 from controllers.employees_controller import EmployeesController
-from controllers.users_accounts_controller import UsersAccountsController
-from controllers.assigned_patients_controller import AssignedPatientsController
 from controllers.services_controller import ServicesController
 from controllers.employee_services_controller import EmployeeServicesController
 from controllers.specialties_controller import SpecialtiesController
 from controllers.employee_specialties_controller import EmployeeSpecialtiesController
+from gui.bridge_worker import BridgeWorker
 
 class BridgeEmployee(QObject):
     employeeListChanged = Signal(list)
@@ -46,11 +45,12 @@ class BridgeEmployee(QObject):
     employeeServiceDeletionFailed = Signal(str)
     employeeServiceDeletedSuccessfully = Signal()
 
-    def __init__(self, main_controller, parent=None):
+    def __init__(self, main_controller, parent=None, worker=None):
         try:
             super().__init__(parent)
             print("bridgeEmployee initialized")  # Debugging
             self.main_controller = main_controller
+            self.worker = worker if worker is not None else BridgeWorker(main_controller)
             self._logged_in_user_id = None
             self._employee_list = []
             self._services_data = []
@@ -85,26 +85,17 @@ class BridgeEmployee(QObject):
             self.employeeListChanged.emit([])  # Emituj pustą listę, aby frontend mógł zareagować
             return
 
-        try:
-            # Pobranie danych z serwisu pracowników
-            employee_controller = EmployeesController(self.main_controller.db_controller)
-            employee_list = employee_controller.get_all_employees()
-
-            # Debugowanie pobranych danych
-            # print(f"[BridgeEmployee_updateEmployeeList] Pobranie danych pracowników: {employee_list}")
-                
-            # Aktualizacja listy pracowników
-            self._employee_list = employee_list
-            
-            # Emitowanie sygnału z listą pracowników
-            self.employeeListChanged.emit(self._employee_list)
+        # Pobranie danych pracowników w wątku roboczym
+        self.worker.load_list(
+            "BridgeEmployee_updateEmployeeList",
+            lambda main_controller: EmployeesController(main_controller.db_controller).get_all_employees(),
+            self._set_employee_list,
+            self.employeeListChanged,
+        )
 
-        except KeyError as ke:
-            print(f"[BridgeEmployee_updateEmployeeList] Klucz nie znaleziony w danych pracownika: {ke}")
-            self.employeeListChanged.emit([])  # Emituj pustą listę w przypadku błędu
-        except ValueError as ve:
-            print(f"[BridgeEmployee_updateEmployeeList] Błąd w wartościach danych pracownika: {ve}")
-            self.employeeListChanged.emit([])  # Emituj pustą listę w przypadku błędu
+    def _set_employee_list(self, employee_list):
+        self._employee_list = employee_list
+        self.employeeListChanged.emit(self._employee_list)
 
     @Slot(result=list)
     def getEmployeeList(self):
@@ -129,35 +120,21 @@ class BridgeEmployee(QObject):
             self.employeeListChanged.emit([])  # Emituj pustą listę, aby frontend mógł zareagować
             return
 
-        try:
-            # Inicjalizacja EmployeeService
-            employee_service = EmployeeService(self.main_controller)
-        
-            # Wywołanie metody z EmployeeService
-            data = employee_service.get_services_and_specialties_table()
-
-            # Pobranie danych z tabeli services i specialties
-            services_data = data.get("services", [])
-            specialties_data = data.get("specialties", [])
-
-            self._services_data = services_data
-            self._specialties_data = specialties_data
+        # Pobranie danych z tabel services i specialties w wątku roboczym
+        self.worker.run(
+            "BridgeEmployee_fetchServicesAndSpecialties",
+            lambda main_controller: main_controller.get_service("employee").get_services_and_specialties_table(),
+            on_success=self._set_services_and_specialties,
+            on_failure=lambda error: print(f"[BridgeEmployee_fetchServicesAndSpecialties] Błąd: {error}"),
+        )
 
-            # Debugowanie pobranych danych
-            # print(f"[BridgeEmployee_fetchServicesAndSpecialties] Services: {services_data}")
-            # print(f"[BridgeEmployee_fetchServicesAndSpecialties] Specialties: {specialties_data}")
-
-            # Emitowanie sygnałów do frontendu
-            self.servicesListChanged.emit(services_data)
-            self.specialtiesListChanged.emit(specialties_data)
-
-        except AttributeError as ae:
-            print(f"[BridgeEmployee_fetchServicesAndSpecialties] Błąd atrybutu: {str(ae)}")
-        except KeyError as ke:
-            print(f"[BridgeEmployee_fetchServicesAndSpecialties] Brak klucza w danych: {str(ke)}")
-        except ValueError as ve:
-            print(f"[BridgeEmployee_fetchServicesAndSpecialties] Błąd wartości: {str(ve)}")
+    def _set_services_and_specialties(self, data):
+        self._services_data = data.get("services", [])
+        self._specialties_data = data.get("specialties", [])
 
+        # Emitowanie sygnałów do frontendu
+        self.servicesListChanged.emit(self._services_data)
+        self.specialtiesListChanged.emit(self._specialties_data)
 
     @Slot(result=list)
     def getfetchServicesAndSpecialties(self):
@@ -175,26 +152,16 @@ class BridgeEmployee(QObject):
         Wywołuje metodę `get_formatted_employee_services` z `employee_services.py`
         i emituje sygnał z sformatowanymi danymi do QML.
         """
-        try:
-            # Inicjalizacja EmployeeService
-            employee_service = EmployeeService(self.main_controller)
-
-            # Pobranie sformatowanych danych
-            formatted_data = employee_service.get_formatted_employee_services()
+        self.worker.load_list(
+            "BridgeEmployee_fetchFormattedEmployeeServices",
+            lambda main_controller: main_controller.get_service("employee").get_formatted_employee_services(),
+            self._set_formatted_employee_services,
+            self.formattedEmployeeServicesChanged,
+        )
 
-            # Debugowanie pobranych danych
-            # print(f"[BridgeEmployee_fetchFormattedEmployeeServices] Sformatowane dane: {formatted_data}")
-
-            # Przechowywanie i emitowanie danych
-            self._formatted_employee_services = formatted_data
-            self.formattedEmployeeServicesChanged.emit(formatted_data)
-
-        except KeyError as ke:
-            print(f"[BridgeEmployee_fetchFormattedEmployeeServices] Brak klucza w danych: {str(ke)}")
-        except ValueError as ve:
-            print(f"[BridgeEmployee_fetchFormattedEmployeeServices] Błąd wartości: {str(ve)}")
-        except AttributeError as ae:
-            print(f"[BridgeEmployee_fetchFormattedEmployeeServices] Błąd atrybutu: {str(ae)}")
+    def _set_formatted_employee_services(self, formatted_data):
+        self._formatted_employee_services = formatted_data
+        self.formattedEmployeeServicesChanged.emit(formatted_data)
 
     @Slot(result=list)
     def getFormattedEmployeeServices(self):
@@ -218,29 +185,17 @@ class BridgeEmployee(QObject):
             self.employeeSpecialtiesListChanged.emit([])  # Emitowanie pustej listy do QML
             return
 
-        try:
-            # Inicjalizacja EmployeeService
-            employee_service = EmployeeService(self.main_controller)
-
-            # Pobranie sformatowanych danych pracowników i ich specjalizacji
-            formatted_specialties_data = employee_service.get_formatted_employee_specialties()
-
-            # Przechowywanie danych w obiekcie klasy
-            self._employee_specialties_data = formatted_specialties_data
-
-            # Debugowanie pobranych danych
-            # print(f"[BridgeEmployee_fetchEmployeeSpecialties] Pobrane dane: {formatted_specialties_data}")
+        self.worker.load_list(
+            "BridgeEmployee_fetchEmployeeSpecialties",
+            lambda main_controller: main_controller.get_service("employee").get_formatted_employee_specialties(),
+            self._set_employee_specialties,
+            self.employeeSpecialtiesListChanged,
+        )
 
-            # Emitowanie sygnału do QML
-            self.employeeSpecialtiesListChanged.emit(formatted_specialties_data)
+    def _set_employee_specialties(self, formatted_specialties_data):
+        self._employee_specialties_data = formatted_specialties_data
+        self.employeeSpecialtiesListChanged.emit(formatted_specialties_data)
 
-        except AttributeError as ae:
-            print(f"[BridgeEmployee_fetchEmployeeSpecialties] Błąd atrybutu: {str(ae)}")
-        except KeyError as ke:
-            print(f"[BridgeEmployee_fetchEmployeeSpecialties] Brak klucza w danych: {str(ke)}")
-        except ValueError as ve:
-            print(f"[BridgeEmployee_fetchEmployeeSpecialties] Błąd wartości: {str(ve)}")
-        
     @Slot(result=list)
     def getEmployeeSpecialties(self):
         """
@@ -262,14 +217,11 @@ class BridgeEmployee(QObject):
             return
 
         try:
-            users_accounts_controller = UsersAccountsController(self.main_controller.db_controller)
-            role_id = users_accounts_controller.get_role_id_by_user_id(self._logged_in_user_id)
+            session = self.main_controller.session_service.get_session(self._logged_in_user_id)
+            role_id = session.role_id
             print(f"DEBUG: Pobranie role_id dla użytkownika {self._logged_in_user_id} -> role_id: {role_id}")
 
 
-            # Zestaw ról blokujących dostęp do widoków
-            blocked_roles = [3, 4, 5, 6, 7, 8, 11]
-
             # Mapa widoków do komunikatów błędów
             view_messages = {
                 "EmployeeCRUD": "Brak uprawnień do zarządzania pracownikami.",
@@ -277,8 +229,8 @@ class BridgeEmployee(QObject):
                 "EmployeeAssignServSpecCRUD": "Brak uprawnień do zarządzania przypisaniami."
             }
 
-            # Sprawdzenie dostępu
-            if role_id in blocked_roles:
+            # Sprawdzenie dostępu (uprawnienie `zarzadzaj_pracownikami`)
+            if not self.main_controller.db_controller.permission_engine.can(session, "edit", "employees"):
                 error_message = view_messages.get(view_name, "Brak uprawnień do tego widoku.")
                 print(f"[BridgeEmployee_checkEmployeeCrudAccess] {error_message}")
                 self.employeeErrorOccurred.emit(error_message)
@@ -324,23 +276,24 @@ class BridgeEmployee(QObject):
         try:
             employees_controller = EmployeesController(self.main_controller.db_controller)
 
-            # Walidacja unikalnych wartości email i telefonu
-            existing_data = employees_controller.get_all_emails_and_phones()
-            existing_phones = {str(item["phone"]) for item in existing_data}
-            existing_emails = {item["email"] for item in existing_data}
+            # Walidacja unikalnych wartości email i telefonu oraz zawodu jednym zapytaniem
+            phone_taken, email_taken, profession_exists = self.main_controller.get_service("validation").check(
+                ExistsProbe("employees", {"phone": str(phone)}),
+                ExistsProbe("employees", {"email": email}),
+                ExistsProbe("employees", {"profession": profession}),
+            )
 
             errors = []
 
-            if phone in existing_phones:
+            if phone_taken:
                 errors.append(f"Numer telefonu ({phone}) już istnieje w bazie.")
-            if email in existing_emails:
+            if email_taken:
                 errors.append(f"Adres email ({email}) już istnieje w bazie.")
 
-            # Sprawdzenie poprawności zawodu
-            existing_professions = employees_controller.get_all_professions()
-            if profession not in existing_professions:
+            # Sprawdzenie poprawności zawodu (lista zawodów pobierana tylko na potrzeby komunikatu)
+            if not profession_exists:
                 errors.append(f"Podany zawód ({profession}) nie znajduje się w bazie.")
-                errors.append(f"Dostępne zawody: {existing_professions}")
+                errors.append(f"Dostępne zawody: {employees_controller.get_all_professions()}")
 
             # Jeśli są błędy, emitujemy błąd
             if errors:
@@ -395,10 +348,10 @@ class BridgeEmployee(QObject):
 
         try:
             employees_controller = EmployeesController(self.main_controller.db_controller)
+            validation_service = self.main_controller.get_service("validation")
 
-            # Pobranie wszystkich employee_id z bazy
-            all_employee_ids = employees_controller.get_all_employee_ids()
-            if employee_id not in all_employee_ids:
+            # Sprawdzenie, czy pracownik istnieje w bazie
+            if not validation_service.exists("employees", "employee_id", employee_id):
                 msg = f"Pracownik o ID ({employee_id}) nie istnieje w bazie."
                 print("[BridgeEmployee_updateEmployee] " + msg)
                 self.employeeUpdateFailed.emit(msg)
@@ -415,21 +368,23 @@ class BridgeEmployee(QObject):
             # Lista do przechowywania błędów
             errors = []
 
-            # Sprawdzenie unikalności danych – numer telefonu porównujemy jako ciąg znaków
-            existing_data = employees_controller.get_all_emails_and_phones()
-            existing_phones = {str(emp["phone"]) for emp in existing_data}
-            existing_emails = {emp["email"] for emp in existing_data}
+            # Sprawdzenie unikalności danych (z pominięciem aktualizowanego pracownika) i zawodu jednym zapytaniem
+            exclude = ("employee_id", employee_id)
+            phone_taken, email_taken, profession_exists = validation_service.check(
+                ExistsProbe("employees", {"phone": str(phone)}, exclude),
+                ExistsProbe("employees", {"email": email}, exclude),
+                ExistsProbe("employees", {"profession": profession}),
+            )
 
-            if phone and phone != str(employee_data["phone"]) and phone in existing_phones:
+            if phone and phone_taken:
                 errors.append(f"Numer telefonu ({phone}) już istnieje w bazie.")
-            if email and email != employee_data["email"] and email in existing_emails:
+            if email and email_taken:
                 errors.append(f"Adres email ({email}) już istnieje w bazie.")
 
             # Sprawdzenie poprawności zawodu – walidacja, jeżeli użytkownik podał wartość
-            existing_professions = employees_controller.get_all_professions()
-            if profession and profession not in existing_professions:
+            if profession and not profession_exists:
                 errors.append(f"Podany zawód ({profession}) nie znajduje się w bazie.")
-                errors.append(f"Dostępne zawody: {existing_professions}")
+                errors.append(f"Dostępne zawody: {employees_controller.get_all_professions()}")
 
             if errors:
                 error_message = "\n".join(errors)
@@ -515,28 +470,22 @@ class BridgeEmployee(QObject):
         try:
             employees_controller = EmployeesController(self.main_controller.db_controller)
 
-            # Pobranie wszystkich `employee_id` z bazy danych
-            all_employee_ids = employees_controller.get_all_employee_ids()
+            # Sprawdzenie istnienia pracownika i jego przypisań do pacjentów jednym zapytaniem
+            employee_exists, has_assignments = self.main_controller.get_service("validation").check(
+                ExistsProbe("employees", {"employee_id": insert_employee_id}),
+                ExistsProbe("assigned_patients", {"fk_employee_id": insert_employee_id}),
+            )
 
             # Sprawdzenie, czy podany `insert_employee_id` istnieje w bazie
-            if insert_employee_id not in all_employee_ids:
+            if not employee_exists:
                 msg = f"Pracownik o ID ({insert_employee_id}) nie istnieje w bazie."
                 print(f"[BridgeEmployee_deleteEmployee] {msg}")
                 self.employeeDeletionFailed.emit(msg)
                 return
 
-            # Pobranie przypisań pacjentów do pracowników
-            assigned_patients_controller = AssignedPatientsController(self.main_controller.db_controller)
-            assigned_patients = assigned_patients_controller.get_all_assigned_patients()
-
             # Sprawdzenie, czy pracownik jest przypisany w `assigned_patients`
-            assigned_assignments = [
-                record["assignment_id"] for record in assigned_patients if record["fk_employee_id"] == insert_employee_id
-            ]
-
-            if assigned_assignments:
-                msg = (f"Nie można usunąć pracownika o ID ({insert_employee_id}), "
-                    f"ponieważ jest przypisany w następujących assignment_id: {', '.join(map(str, assigned_assignments))}.")
+            if has_assignments:
+                msg = f"Nie można usunąć pracownika o ID ({insert_employee_id}), ponieważ jest przypisany do pacjentów."
                 print(f"[BridgeEmployee_deleteEmployee] {msg}")
                 self.employeeDeletionFailed.emit(msg)
                 return
@@ -576,17 +525,8 @@ class BridgeEmployee(QObject):
         try:
             services_controller = ServicesController(self.main_controller.db_controller)
 
-            # Pobranie wszystkich istniejących typów usług
-            existing_service_types = services_controller.get_all_service_types()
-
-            # Konwersja listy na małe litery dla porównania (ignorowanie wielkości liter)
-            existing_service_types_lower = {service.lower() for service in existing_service_types}
-
-            # Konwersja wpisanego service_type na małe litery
-            service_type_lower = service_type.lower()
-
-            # Sprawdzenie, czy podany service_type już istnieje (bez uwzględniania wielkości liter)
-            if service_type_lower in existing_service_types_lower:
+            # Sprawdzenie, czy podany service_type już istnieje (kolumna z COLLATE NOCASE - bez uwzględniania wielkości liter)
+            if not self.main_controller.get_service("validation").is_unique("services", "service_type", service_type):
                 error_message = f"Usługa '{service_type}' już istnieje w bazie."
                 print(f"[BridgeEmployee_addNewService] {error_message}")
                 self.serviceAdditionFailed.emit(error_message)
@@ -639,20 +579,19 @@ class BridgeEmployee(QObject):
         try:
             services_controller = ServicesController(self.main_controller.db_controller)
 
-            # Pobranie wszystkich service_id z bazy
-            all_service_ids = services_controller.get_all_service_ids()
-            if service_id not in all_service_ids:
+            # Sprawdzenie istnienia usługi i unikalności nazwy (z pominięciem aktualizowanej usługi) jednym zapytaniem
+            service_exists, service_type_taken = self.main_controller.get_service("validation").check(
+                ExistsProbe("services", {"service_id": service_id}),
+                ExistsProbe("services", {"service_type": service_type.strip()}, ("service_id", service_id)),
+            )
+            if not service_exists:
                 msg = f"Usługa o ID ({service_id}) nie istnieje w bazie."
                 print("[BridgeEmployee_updateService] " + msg)
                 self.serviceUpdateFailed.emit(msg)
                 return
 
-            # Pobranie wszystkich typów usług
-            existing_service_types = services_controller.get_all_service_types()
-            normalized_service_type = service_type.strip().lower()
-
             # Sprawdzenie, czy podany service_type już istnieje (bez uwzględniania wielkości liter)
-            if any(existing_type.lower() == normalized_service_type for existing_type in existing_service_types):
+            if service_type_taken:
                 error_message = f"Usługa '{service_type}' już istnieje w bazie."
                 print(f"[BridgeEmployee_updateService] {error_message}")
                 self.serviceUpdateFailed.emit(error_message)
@@ -726,29 +665,23 @@ class BridgeEmployee(QObject):
 
         try:
             services_controller = ServicesController(self.main_controller.db_controller)
-            employee_services_controller = EmployeeServicesController(self.main_controller.db_controller)
 
-            # Pobranie wszystkich `service_id` z bazy
-            all_service_ids = services_controller.get_all_service_ids()
+            # Sprawdzenie istnienia usługi i jej przypisań do pracowników jednym zapytaniem
+            service_exists, service_assigned = self.main_controller.get_service("validation").check(
+                ExistsProbe("services", {"service_id": insert_service_id}),
+                ExistsProbe("employee_services", {"service_id": insert_service_id}),
+            )
 
             # Sprawdzenie, czy podany `insert_service_id` istnieje w bazie
-            if insert_service_id not in all_service_ids:
+            if not service_exists:
                 msg = f"Usługa o ID ({insert_service_id}) nie istnieje w bazie."
                 print(f"[BridgeEmployee_deleteService] {msg}")
                 self.serviceDeletionFailed.emit(msg)
                 return
 
-            # Pobranie przypisań usług do pracowników
-            employee_services = employee_services_controller.get_all_employee_services()
-
             # Sprawdzenie, czy usługa jest przypisana w `employee_services`
-            assigned_services = [
-                record["employee_service_id"] for record in employee_services if record["service_id"] == insert_service_id
-            ]
-
-            if assigned_services:
-                msg = (f"Nie można usunąć usługi o ID ({insert_service_id}), "
-                    f"ponieważ jest przypisana w następujących employee_service_id: {', '.join(map(str, assigned_services))}.")
+            if service_assigned:
+                msg = f"Nie można usunąć usługi o ID ({insert_service_id}), ponieważ jest przypisana do pracowników."
                 print(f"[BridgeEmployee_deleteService] {msg}")
                 self.serviceDeletionFailed.emit(msg)
                 return
@@ -789,17 +722,8 @@ class BridgeEmployee(QObject):
         try:
             specialties_controller = SpecialtiesController(self.main_controller.db_controller)
 
-            # Pobranie wszystkich istniejących specjalności
-            existing_specialties = specialties_controller.get_all_specialty_names()
-
-            # Konwersja listy specjalności na małe litery dla porównania (ignorowanie wielkości liter)
-            existing_specialties_lower = {specialty.lower() for specialty in existing_specialties}
-
-            # Konwersja wpisanej specjalności na małe litery
-            specialty_name_lower = insert_specialty_name.strip().lower()
-
-            # Sprawdzenie, czy podana specjalność już istnieje (bez uwzględniania wielkości liter)
-            if specialty_name_lower in existing_specialties_lower:
+            # Sprawdzenie, czy podana specjalność już istnieje (kolumna z COLLATE NOCASE - bez uwzględniania wielkości liter)
+            if not self.main_controller.get_service("validation").is_unique("specialties", "specialty_name", insert_specialty_name.strip()):
                 error_message = f"Specjalność '{insert_specialty_name}' już istnieje w bazie."
                 print(f"[BridgeEmployee_addNewSpecialty] {error_message}")
                 self.specialtyAdditionFailed.emit(error_message)
@@ -850,20 +774,19 @@ class BridgeEmployee(QObject):
         try:
             specialties_controller = SpecialtiesController(self.main_controller.db_controller)
 
-            # Pobranie wszystkich specialty_id z bazy
-            all_specialty_ids = specialties_controller.get_all_specialty_ids()
-            if specialty_id not in all_specialty_ids:
+            # Sprawdzenie istnienia specjalności i unikalności nazwy (z pominięciem aktualizowanej) jednym zapytaniem
+            specialty_exists, specialty_name_taken = self.main_controller.get_service("validation").check(
+                ExistsProbe("specialties", {"specialty_id": specialty_id}),
+                ExistsProbe("specialties", {"specialty_name": insert_specialty_name.strip()}, ("specialty_id", specialty_id)),
+            )
+            if not specialty_exists:
                 msg = f"Specjalność o ID ({specialty_id}) nie istnieje w bazie."
                 print("[BridgeEmployee_updateSpecialty] " + msg)
                 self.specialtyUpdateFailed.emit(msg)
                 return
 
-            # Pobranie wszystkich nazw specjalności
-            existing_specialty_names = specialties_controller.get_all_specialty_names()
-            normalized_specialty_name = insert_specialty_name.strip().lower()
-
             # Sprawdzenie, czy podana nazwa specjalności już istnieje (bez uwzględniania wielkości liter)
-            if any(existing_name.lower() == normalized_specialty_name for existing_name in existing_specialty_names):
+            if specialty_name_taken:
                 error_message = f"Specjalność '{insert_specialty_name}' już istnieje w bazie."
                 print(f"[BridgeEmployee_updateSpecialty] {error_message}")
                 self.specialtyUpdateFailed.emit(error_message)
@@ -904,6 +827,7 @@ class BridgeEmployee(QObject):
             # Wywołanie aktualizacji w kontrolerze
             specialties_controller.update_specialty(specialty_id, data_to_update)
             print("[BridgeEmployee_updateSpecialty] Specjalność została zaktualizowana w bazie danych.")
+            self.main_controller.session_service.invalidate_specialty(specialty_data["specialty_name"])
             self.specialtyUpdatedSuccessfully.emit()
 
         except ValueError as ve:
@@ -932,29 +856,23 @@ class BridgeEmployee(QObject):
 
         try:
             specialties_controller = SpecialtiesController(self.main_controller.db_controller)
-            employee_specialties_controller = EmployeeSpecialtiesController(self.main_controller.db_controller)
 
-            # Pobranie wszystkich `specialty_id` z bazy
-            all_specialty_ids = specialties_controller.get_all_specialty_ids()
+            # Sprawdzenie istnienia specjalności i jej przypisań do pracowników jednym zapytaniem
+            specialty_exists, specialty_assigned = self.main_controller.get_service("validation").check(
+                ExistsProbe("specialties", {"specialty_id": insert_specialty_id}),
+                ExistsProbe("employee_specialties", {"specialty_id": insert_specialty_id}),
+            )
 
             # Sprawdzenie, czy podany `insert_specialty_id` istnieje w bazie
-            if insert_specialty_id not in all_specialty_ids:
+            if not specialty_exists:
                 msg = f"Specjalność o ID ({insert_specialty_id}) nie istnieje w bazie."
                 print(f"[BridgeEmployee_deleteSpecialty] {msg}")
                 self.specialtyDeletionFailed.emit(msg)
                 return
 
-            # Pobranie przypisań specjalności do pracowników
-            employee_specialties = employee_specialties_controller.get_all_employee_specialties()
-
             # Sprawdzenie, czy specjalność jest przypisana w `employee_specialties`
-            assigned_specialties = [
-                record["employee_specialty_id"] for record in employee_specialties if record["specialty_id"] == insert_specialty_id
-            ]
-
-            if assigned_specialties:
-                msg = (f"Nie można usunąć specjalności o ID ({insert_specialty_id}), "
-                    f"ponieważ jest przypisana w następujących employee_specialty_id: {', '.join(map(str, assigned_specialties))}.")
+            if specialty_assigned:
+                msg = f"Nie można usunąć specjalności o ID ({insert_specialty_id}), ponieważ jest przypisana do pracowników."
                 print(f"[BridgeEmployee_deleteSpecialty] {msg}")
                 self.specialtyDeletionFailed.emit(msg)
                 return
@@ -1002,18 +920,19 @@ class BridgeEmployee(QObject):
 
         try:
             employee_services_controller = EmployeeServicesController(self.main_controller.db_controller)
-            services_controller = ServicesController(self.main_controller.db_controller)
-            employees_controller = EmployeesController(self.main_controller.db_controller)
 
-            # Pobranie wszystkich employee_id i service_id z bazy
-            all_employee_ids = employees_controller.get_all_employee_ids()
-            all_service_ids = services_controller.get_all_service_ids()
+            # Sprawdzenie pracownika, usługi i istniejącego przypisania jednym zapytaniem
+            employee_exists, service_exists, pair_exists = self.main_controller.get_service("validation").check(
+                ExistsProbe("employees", {"employee_id": employee_id}),
+                ExistsProbe("services", {"service_id": service_id}),
+                ExistsProbe("employee_services", {"employee_id": employee_id, "service_id": service_id}),
+            )
 
             # Sprawdzenie, czy podane ID istnieją w bazie
-            if employee_id not in all_employee_ids:
+            if not employee_exists:
                 errors.append(f"Pracownik o ID ({employee_id}) nie istnieje w bazie.")
 
-            if service_id not in all_service_ids:
+            if not service_exists:
                 errors.append(f"Usługa o ID ({service_id}) nie istnieje w bazie.")
 
             # Jeśli są błędy na tym etapie, emitujemy je i przerywamy działanie
@@ -1023,11 +942,8 @@ class BridgeEmployee(QObject):
                 self.employeeServiceAdditionFailed.emit(error_message)
                 return
 
-            # Pobranie wszystkich przypisań employee_service
-            existing_employee_services = employee_services_controller.get_all_employee_services()
-
             # Sprawdzenie, czy podane przypisanie już istnieje
-            if any(record["employee_id"] == employee_id and record["service_id"] == service_id for record in existing_employee_services):
+            if pair_exists:
                 errors.append(f"Pracownik o ID ({employee_id}) jest już przypisany do usługi o ID ({service_id}).")
 
             # Jeśli są błędy w przypisaniach, emitujemy je i przerywamy działanie
@@ -1080,18 +996,19 @@ class BridgeEmployee(QObject):
 
         try:
             employee_specialties_controller = EmployeeSpecialtiesController(self.main_controller.db_controller)
-            specialties_controller = SpecialtiesController(self.main_controller.db_controller)
-            employees_controller = EmployeesController(self.main_controller.db_controller)
 
-            # Pobranie wszystkich employee_id i specialty_id z bazy
-            all_employee_ids = employees_controller.get_all_employee_ids()
-            all_specialty_ids = specialties_controller.get_all_specialty_ids()
+            # Sprawdzenie pracownika, specjalności i istniejącego przypisania jednym zapytaniem
+            employee_exists, specialty_exists, pair_exists = self.main_controller.get_service("validation").check(
+                ExistsProbe("employees", {"employee_id": employee_id}),
+                ExistsProbe("specialties", {"specialty_id": specialty_id}),
+                ExistsProbe("employee_specialties", {"employee_id": employee_id, "specialty_id": specialty_id}),
+            )
 
             # Sprawdzenie, czy podane ID istnieją w bazie
-            if employee_id not in all_employee_ids:
+            if not employee_exists:
                 errors.append(f"Pracownik o Id ({employee_id}) nie istnieje w bazie.")
 
-            if specialty_id not in all_specialty_ids:
+            if not specialty_exists:
                 errors.append(f"Specjalność o Id ({specialty_id}) nie istnieje w bazie.")
 
             # Jeśli są błędy na tym etapie, emitujemy je i przerywamy działanie
@@ -1101,11 +1018,8 @@ class BridgeEmployee(QObject):
                 self.employeeSpecialtyAdditionFailed.emit(error_message)
                 return
 
-            # Pobranie wszystkich przypisań employee_specialty
-            existing_employee_specialties = employee_specialties_controller.get_all_employee_specialties()
-
             # Sprawdzenie, czy podane przypisanie już istnieje
-            if any(record["employee_id"] == employee_id and record["specialty_id"] == specialty_id for record in existing_employee_specialties):
+            if pair_exists:
                 errors.append(f"Pracownik o ID ({employee_id}) jest już przypisany do specjalności o ID ({specialty_id}).")
 
             # Jeśli są błędy w przypisaniach, emitujemy je i przerywamy działanie
@@ -1119,6 +1033,7 @@ class BridgeEmployee(QObject):
             employee_specialties_controller.add_employee_specialty(employee_id, specialty_id, is_active=1)
 
             print("[BridgeEmployee_addEmployeeToSpecialty] Pracownik został przypisany do specjalności pomyślnie!")
+            self.main_controller.session_service.invalidate_employee(employee_id)
             self.employeeSpecialtyAddedSuccessfully.emit()
 
         except ValueError as ve:
@@ -1179,29 +1094,27 @@ class BridgeEmployee(QObject):
 
         try:
             employee_services_controller = EmployeeServicesController(self.main_controller.db_controller)
-            services_controller = ServicesController(self.main_controller.db_controller)
-            employees_controller = EmployeesController(self.main_controller.db_controller)
 
-            # Pobranie wszystkich employee_service_id z bazy
-            all_employee_service_ids = employee_services_controller.get_all_employee_service_ids()
-            if employee_service_id not in all_employee_service_ids:
-                errors.append(f"Przypisanie o ID ({employee_service_id}) nie istnieje w bazie.")
+            # Sprawdzenie przypisania, pracownika, usługi i duplikatu (z pominięciem aktualizowanego rekordu) jednym zapytaniem
+            assignment_exists, employee_exists, service_exists, pair_exists = self.main_controller.get_service("validation").check(
+                ExistsProbe("employee_services", {"employee_service_id": employee_service_id}),
+                ExistsProbe("employees", {"employee_id": employee_id}),
+                ExistsProbe("services", {"service_id": service_id}),
+                ExistsProbe("employee_services", {"employee_id": employee_id, "service_id": service_id},
+                            ("employee_service_id", employee_service_id)),
+            )
 
-            # Pobranie wszystkich employee_id i service_id
-            all_employee_ids = employees_controller.get_all_employee_ids()
-            all_service_ids = services_controller.get_all_service_ids()
+            if not assignment_exists:
+                errors.append(f"Przypisanie o ID ({employee_service_id}) nie istnieje w bazie.")
 
             # Sprawdzenie, czy podane ID istnieją w bazie – tylko dla pól, które zostały podane
-            if employee_id is not None and employee_id not in all_employee_ids:
+            if employee_id is not None and not employee_exists:
                 errors.append(f"Pracownik o ID ({employee_id}) nie istnieje w bazie.")
-            if service_id is not None and service_id not in all_service_ids:
+            if service_id is not None and not service_exists:
                 errors.append(f"Usługa o ID ({service_id}) nie istnieje w bazie.")
 
-            # Pobranie wszystkich przypisań employee_service
-            existing_employee_services = employee_services_controller.get_all_employee_services()
-
             # Sprawdzenie, czy podane przypisanie już istnieje
-            if any(record["employee_id"] == employee_id and record["service_id"] == service_id for record in existing_employee_services):
+            if pair_exists:
                 errors.append(f"Pracownik o ID ({employee_id}) jest już przypisany do usługi o ID ({service_id}).")
 
             # Normalizacja wartości is_active (pole opcjonalne)
@@ -1318,27 +1231,30 @@ class BridgeEmployee(QObject):
 
         try:
             employee_specialties_controller = EmployeeSpecialtiesController(self.main_controller.db_controller)
-            specialties_controller = SpecialtiesController(self.main_controller.db_controller)
-            employees_controller = EmployeesController(self.main_controller.db_controller)
+
+            # Sprawdzenie przypisania, pracownika, specjalności i duplikatu (z pominięciem aktualizowanego rekordu) jednym zapytaniem
+            assignment_exists, employee_exists, specialty_exists, pair_exists = self.main_controller.get_service("validation").check(
+                ExistsProbe("employee_specialties", {"employee_specialty_id": employee_specialty_id}),
+                ExistsProbe("employees", {"employee_id": employee_id}),
+                ExistsProbe("specialties", {"specialty_id": specialty_id}),
+                ExistsProbe("employee_specialties", {"employee_id": employee_id, "specialty_id": specialty_id},
+                            ("employee_specialty_id", employee_specialty_id)),
+            )
 
             # Sprawdzenie istnienia przypisania
-            all_employee_specialty_ids = employee_specialties_controller.get_all_employee_specialty_ids()
-            if employee_specialty_id not in all_employee_specialty_ids:
+            if not assignment_exists:
                 errors.append(f"Przypisanie o ID {employee_specialty_id} nie istnieje.")
 
             # Sprawdzenie istnienia pracownika (tylko jeśli podano wartość)
-            if insert_employee_id.strip() and employee_id not in employees_controller.get_all_employee_ids():
+            if insert_employee_id.strip() and not employee_exists:
                 errors.append(f"Pracownik o ID {employee_id} nie istnieje.")
 
             # Sprawdzenie istnienia specjalności (tylko jeśli podano wartość)
-            if insert_specialty_id.strip() and specialty_id not in specialties_controller.get_all_specialty_ids():
+            if insert_specialty_id.strip() and not specialty_exists:
                 errors.append(f"Specjalność o ID {specialty_id} nie istnieje.")
 
-            # Pobranie wszystkich przypisań employee_specialty
-            existing_employee_specialties = employee_specialties_controller.get_all_employee_specialties()
-
             # Sprawdzenie, czy podane przypisanie już istnieje
-            if any(record["employee_id"] == employee_id and record["specialty_id"] == specialty_id for record in existing_employee_specialties):
+            if pair_exists:
                 errors.append(f"Pracownik o ID ({employee_id}) jest już przypisany do specjalności o ID ({specialty_id}).")
 
             if errors:
@@ -1376,6 +1292,10 @@ class BridgeEmployee(QObject):
             )
 
             print("[BridgeEmployee_updateEmployeeSpecialty] Przypisanie zaktualizowane pomyślnie.")
+            # Zmiana dotyczy zarówno poprzedniego, jak i nowego pracownika przypisania
+            self.main_controller.session_service.invalidate_employee(existing_data["employee_id"])
+            if "employee_id" in data_to_update:
+                self.main_controller.session_service.invalidate_employee(data_to_update["employee_id"])
             self.employeeSpecialtyUpdatedSuccessfully.emit()
 
         except ValueError as ve:
@@ -1407,20 +1327,23 @@ class BridgeEmployee(QObject):
         try:
             employee_specialties_controller = EmployeeSpecialtiesController(self.main_controller.db_controller)
 
-            # Pobranie wszystkich `employee_specialty_id` z bazy
-            all_employee_specialty_ids = employee_specialties_controller.get_all_employee_specialty_ids()
-
             # Sprawdzenie, czy podany `insert_employee_specialty_id` istnieje w bazie
-            if insert_employee_specialty_id not in all_employee_specialty_ids:
+            if not self.main_controller.get_service("validation").exists(
+                "employee_specialties", "employee_specialty_id", insert_employee_specialty_id
+            ):
                 msg = f"Przypisanie pracownika do specjalności o ID ({insert_employee_specialty_id}) nie istnieje w bazie."
                 print(f"[BridgeEmployee_deleteEmployeeSpecialty] {msg}")
                 self.employeeSpecialtyDeletionFailed.emit(msg)
                 return
 
+            # Pracownik przypisania - jego kontekst sesji zostanie unieważniony po usunięciu
+            existing_data = employee_specialties_controller.get_employee_specialty_by_id(insert_employee_specialty_id)
+
             # Próba usunięcia przypisania
             employee_specialties_controller.delete_employee_specialty(insert_employee_specialty_id)
 
             print(f"[BridgeEmployee_deleteEmployeeSpecialty] Przypisanie o ID {insert_employee_specialty_id} zostało usunięte.")
+            self.main_controller.session_service.invalidate_employee(existing_data["employee_id"])
             self.employeeSpecialtyDeletedSuccessfully.emit()
 
         except ValueError as ve:
@@ -1452,11 +1375,10 @@ class BridgeEmployee(QObject):
         try:
             employee_services_controller = EmployeeServicesController(self.main_controller.db_controller)
 
-            # Pobranie wszystkich `employee_service_id` z bazy
-            all_employee_service_ids = employee_services_controller.get_all_employee_service_ids()
-
             # Sprawdzenie, czy podany `insert_employee_service_id` istnieje w bazie
-            if insert_employee_service_id not in all_employee_service_ids:
+            if not self.main_controller.get_service("validation").exists(
+                "employee_services", "employee_service_id", insert_employee_service_id
+            ):
                 msg = f"Przypisanie pracownika do usługi o ID ({insert_employee_service_id}) nie istnieje w bazie."
                 print(f"[BridgeEmployee_deleteEmployeeService] {msg}")
                 self.employeeServiceDeletionFailed.emit(msg)
@@ -1,9 +1,10 @@
+import json
 import sqlite3
 import re
 from datetime import datetime, timedelta
-from PySide6.QtCore import QObject, Signal, Slot # pylint: disable=E0611
-from services.room_service import RoomService
-from controllers.users_accounts_controller import UsersAccountsController
+from PySide6.QtCore import QObject, Signal, Slot, Property # pylint: disable=E0611
+from database.exists_probe import ExistsProbe
+from database.permission_engine import SCOPE_ALL, SCOPE_ASSIGNED
 from controllers.rooms_controller import RoomsController
 from controllers.room_types_controller import RoomTypesController
 from controllers.room_reservations_controller import RoomReservationsController
@@ -12,7 +13,46 @@ from controllers.assigned_patients_controller import AssignedPatientsController
 from controllers.internal_meetings_controller import InternalMeetingsController
 from controllers.meeting_participants_controller import MeetingParticipantsController
 from controllers.employees_controller import EmployeesController
+from gui.bridge_worker import BridgeWorker
+from gui.entity_list_model import EntityListModel
 
+# Pola (role) modeli list udostępnianych do QML
+ROOM_FIELDS = ("room_id", "room_number", "floor", "fk_room_type_id", "room_type")
+APPOINTMENT_FIELDS = (
+    "appointment_id", "fk_assignment_id", "patient_name", "employee_name", "fk_service_id", "service_type",
+    "fk_reservation_id", "room_number", "appointment_date", "appointment_status", "notes"
+)
+
+
+def _load_appointments_for_user(main_controller, logged_in_user_id):
+    """
+    Zadanie wątku roboczego: pobiera wizyty widoczne dla użytkownika w zależności od zakresu uprawnień roli.
+    Role z `zarzadzaj_swoimi_wizytami` widzą tylko wizyty własnych pacjentów, role z `zarzadzaj_wizytami` -
+    wszystkie, pozostałe - żadne.
+    """
+    session = main_controller.session_service.get_session(logged_in_user_id)
+    role_id = session.role_id
+    appointments_scope = main_controller.db_controller.permission_engine.row_scope(session, "view", "appointments")
+
+    room_service = main_controller.get_service("room")
+
+    if appointments_scope == SCOPE_ASSIGNED:
+        # Pobranie `employee_id` na podstawie zalogowanego użytkownika
+        employee_id = session.employee_id
+
+        if employee_id is None:
+            print("[BridgeRoom_updateAppointmentsList] Brak przypisanego pracownika dla zalogowanego użytkownika.")
+            return []
+
+        # Pobranie sformatowanych wizyt dla konkretnego pracownika
+        return room_service.table_get_formatted_appointments_for_employee(employee_id)
+
+    if appointments_scope == SCOPE_ALL:
+        # Pobranie wszystkich wizyt
+        return room_service.table_get_all_appointments()
+
+    print(f"[BridgeRoom_updateAppointmentsList] Brak dostępu dla role_id: {role_id}")
+    return []
 
 
 class BridgeRoom(QObject):
@@ -38,6 +78,8 @@ class BridgeRoom(QObject):
     reservationUpdateFailed = Signal(str)
     reservationDeletedSuccessfully = Signal()
     reservationDeletionFailed = Signal(str)
+    freeRoomFound = Signal(dict)
+    freeRoomSearchFailed = Signal(str)
     appointmentsListChanged = Signal(list)
     meetingTypesListChanged = Signal(list)
     internalMeetingsListChanged = Signal(list)
@@ -47,6 +89,8 @@ class BridgeRoom(QObject):
     appointmentUpdateFailed = Signal(str)
     appointmentDeletedSuccessfully = Signal()
     appointmentDeletionFailed = Signal(str)
+    appointmentSeriesScheduled = Signal(dict)  # {"scheduled": [...], "conflicts": [...]}
+    appointmentSeriesFailed = Signal(str)
     internalMeetingAddedSuccessfully = Signal()
     internalMeetingAdditionFailed = Signal(str)
     internalMeetingUpdatedSuccessfully = Signal()
@@ -63,16 +107,19 @@ class BridgeRoom(QObject):
 
 
 
-    def __init__(self, main_controller, parent=None):
+    def __init__(self, main_controller, parent=None, worker=None):
         try:
             super().__init__(parent)
             print("bridgeRoom initialized")  # Debugging
             self.main_controller = main_controller
+            self.worker = worker if worker is not None else BridgeWorker(main_controller)
             self._logged_in_user_id = None
             self._room_types_list = []
             self._rooms_list = []  # Przechowywana lista pokoi
             self._room_reservations_list = [] 
             self._appointments_list = []
+            self._rooms_model = EntityListModel("room_id", ROOM_FIELDS, parent=self)
+            self._appointments_model = EntityListModel("appointment_id", APPOINTMENT_FIELDS, parent=self)
             self._meeting_types_list = []
             self._internal_meetings_list = []
             self._meeting_participants_list = []
@@ -96,28 +143,18 @@ class BridgeRoom(QObject):
     @Slot()
     def updateRoomTypesList(self):
         """
-        Pobiera listę typów pokoi i emituje sygnał do QML.
+        Pobiera listę typów pokoi (w wątku roboczym) i emituje sygnał do QML.
         """
-        try:
-            # Pobranie danych z serwisu pokoi
-            room_service = RoomService(self.main_controller)
-            room_types_list = room_service.get_room_types_table()
-
-            # Debugowanie pobranych danych
-            # print(f"[BridgeRoom_updateRoomTypesList] Pobranie danych typów pokoi: {room_types_list}")
+        self.worker.load_list(
+            "BridgeRoom_updateRoomTypesList",
+            lambda main_controller: main_controller.get_service("room").get_room_types_table(),
+            self._set_room_types_list,
+            self.roomTypesListChanged,
+        )
 
-            # Aktualizacja listy typów pokoi
-            self._room_types_list = room_types_list
-
-            # Emitowanie sygnału z listą typów pokoi
-            self.roomTypesListChanged.emit(self._room_types_list)
-
-        except KeyError as ke:
-            print(f"[BridgeRoom_updateRoomTypesList] Klucz nie znaleziony w danych typu pokoju: {ke}")
-            self.roomTypesListChanged.emit([])  # Emituj pustą listę w przypadku błędu
-        except ValueError as ve:
-            print(f"[BridgeRoom_updateRoomTypesList] Błąd w wartościach danych typu pokoju: {ve}")
-            self.roomTypesListChanged.emit([])  # Emituj pustą listę w przypadku błędu
+    def _set_room_types_list(self, items):
+        self._room_types_list = items
+        self.roomTypesListChanged.emit(self._room_types_list)
 
     @Slot(result=list)
     def getRoomTypesList(self):
@@ -131,31 +168,24 @@ class BridgeRoom(QObject):
     @Slot()
     def updateRoomsList(self):
         """
-        Pobiera listę pokoi wraz z typami i emituje sygnał do QML.
+        Pobiera listę pokoi wraz z typami (w wątku roboczym) i emituje sygnał do QML.
         """
-        try:
-            # Pobranie danych z serwisu pokoi
-            room_service = RoomService(self.main_controller)
-            rooms_list = room_service.get_rooms_with_types()
+        self.worker.load_list(
+            "BridgeRoom_updateRoomsList",
+            lambda main_controller: main_controller.get_service("room").get_rooms_with_types(),
+            self._set_rooms_list,
+            self.roomListChanged,
+        )
 
-            # Debugowanie pobranych danych
-            # print(f"[BridgeRoom_updateRoomsList] Pobranie danych pokoi: {rooms_list}")
+    def _set_rooms_list(self, items):
+        self._rooms_list = items
+        self._rooms_model.set_rows(items)  # Tylko zmienione wiersze
+        self.roomListChanged.emit(self._rooms_list)
 
-            # Aktualizacja listy pokoi
-            self._rooms_list = rooms_list
+    def get_rooms_model(self):
+        return self._rooms_model
 
-            # Emitowanie sygnału z listą pokoi
-            self.roomListChanged.emit(self._rooms_list)
-
-        except KeyError as ke:
-            print(f"[BridgeRoom_updateRoomsList] Klucz nie znaleziony w danych pokoju: {ke}")
-            self.roomListChanged.emit([])  # Emituj pustą listę w przypadku błędu
-        except ValueError as ve:
-            print(f"[BridgeRoom_updateRoomsList] Błąd w wartościach danych pokoju: {ve}")
-            self.roomListChanged.emit([])  # Emituj pustą listę w przypadku błędu
-        except RuntimeError as rue:
-            print(f"[BridgeRoom_updateRoomsList] Błąd bazy danych: {rue}")
-            self.roomListChanged.emit([])  # Emituj pustą listę w przypadku błędu
+    roomsModel = Property(QObject, get_rooms_model, constant=True)
 
     @Slot(result=list)
     def getRoomsList(self):
@@ -170,31 +200,18 @@ class BridgeRoom(QObject):
     @Slot()
     def updateRoomReservationsList(self):
         """
-        Pobiera listę rezerwacji pokoi wraz ze szczegółami i emituje sygnał do QML.
+        Pobiera listę rezerwacji pokoi wraz ze szczegółami (w wątku roboczym) i emituje sygnał do QML.
         """
-        try:
-            # Pobranie danych rezerwacji z serwisu pokoi
-            room_service = RoomService(self.main_controller)
-            reservations_list = room_service.get_room_reservations_with_detailed_rooms()
+        self.worker.load_list(
+            "BridgeRoom_updateRoomReservationsList",
+            lambda main_controller: main_controller.get_service("room").get_room_reservations_with_detailed_rooms(),
+            self._set_room_reservations_list,
+            self.roomReservationsListChanged,
+        )
 
-            # Debugowanie pobranych danych
-            # print(f"[BridgeRoom_updateRoomReservationsList] Pobranie danych rezerwacji pokoi: {reservations_list}")
-
-            # Aktualizacja listy rezerwacji
-            self._room_reservations_list = reservations_list
-
-            # Emitowanie sygnału z listą rezerwacji pokoi
-            self.roomReservationsListChanged.emit(self._room_reservations_list)
-
-        except KeyError as ke:
-            print(f"[BridgeRoom_updateRoomReservationsList] Klucz nie znaleziony w danych rezerwacji pokoju: {ke}")
-            self.roomReservationsListChanged.emit([])  # Emituj pustą listę w przypadku błędu
-        except ValueError as ve:
-            print(f"[BridgeRoom_updateRoomReservationsList] Błąd w wartościach danych rezerwacji pokoju: {ve}")
-            self.roomReservationsListChanged.emit([])  # Emituj pustą listę w przypadku błędu
-        except RuntimeError as rue:
-            print(f"[BridgeRoom_updateRoomReservationsList] Błąd bazy danych: {rue}")
-            self.roomReservationsListChanged.emit([])  # Emituj pustą listę w przypadku błędu
+    def _set_room_reservations_list(self, items):
+        self._room_reservations_list = items
+        self.roomReservationsListChanged.emit(self._room_reservations_list)
 
     @Slot(result=list)
     def getRoomReservationsList(self):
@@ -218,16 +235,15 @@ class BridgeRoom(QObject):
             return
 
         try:
-            users_accounts_controller = UsersAccountsController(self.main_controller.db_controller)
-            role_id = users_accounts_controller.get_role_id_by_user_id(self._logged_in_user_id)
+            session = self.main_controller.session_service.get_session(self._logged_in_user_id)
+            role_id = session.role_id
             print(f"DEBUG: Pobranie role_id dla użytkownika {self._logged_in_user_id} -> role_id: {role_id}")
 
             # Sprawdzamy dostęp tylko dla widoku RoomsCRUD.qml
             if view_name == "RoomsCRUD.qml":
-                # Zestaw ról blokujących dostęp do widoku RoomsCRUD.qml
-                blocked_roles = [3, 4, 5, 6, 7, 8, 11]
+                # Dostęp do widoku RoomsCRUD.qml wymaga uprawnienia `zarzadzaj_pomieszczeniami`
                 error_message = "Brak uprawnień do zarządzania pokojami."
-                if role_id in blocked_roles:
+                if not self.main_controller.db_controller.permission_engine.can(session, "edit", "rooms"):
                     print(f"[BridgeRoom_checkRoomCrudAccess] {error_message}")
                     self.roomErrorOccurred.emit(error_message)
                     return
@@ -272,12 +288,15 @@ class BridgeRoom(QObject):
             errors.append("Numer pokoju, numer piętra i ID typu pokoju muszą być liczbami całkowitymi.")
 
         try:
-            # Pobranie wszystkich numerów pokoi
-            room_service = RoomService(self.main_controller)
-            all_room_numbers = room_service.get_all_room_numbers()
+            # Sprawdzenie numeru pokoju i typu pokoju jednym zapytaniem
+            validation_service = self.main_controller.get_service("validation")
+            room_number_taken, room_type_exists = validation_service.check(
+                ExistsProbe("rooms", {"room_number": room_number}),
+                ExistsProbe("room_types", {"room_type_id": room_type_id}),
+            )
 
             # Sprawdzenie czy numer pokoju istnieje w bazie
-            if room_number in all_room_numbers:
+            if room_number_taken:
                 errors.append(f"Pokój o numerze {room_number} już istnieje w bazie.")
 
             # Sprawdzenie czy podane piętro jest w zakresie 0-3
@@ -285,12 +304,9 @@ class BridgeRoom(QObject):
             if floor_number not in valid_floors:
                 errors.append(f"Nieprawidłowe piętro: {floor_number}. Dostępne piętra: {valid_floors}")
 
-            # Pobranie wszystkich dostępnych ID typów pokoi
-            all_room_type_ids = room_service.get_all_room_type_ids()
-
             # Sprawdzenie czy podany `room_type_id` istnieje w bazie
-            if room_type_id not in all_room_type_ids:
-                errors.append(f"Nieprawidłowe ID typu pokoju: {room_type_id}. Dostępne ID: {all_room_type_ids}")
+            if not room_type_exists:
+                errors.append(f"Nieprawidłowe ID typu pokoju: {room_type_id}.")
 
             # Jeśli są błędy, emitujemy je i przerywamy działanie
             if errors:
@@ -347,7 +363,7 @@ class BridgeRoom(QObject):
 
         try:
             room_controller = RoomsController(self.main_controller.db_controller)
-            room_service = RoomService(self.main_controller)
+            validation_service = self.main_controller.get_service("validation")
 
             # Konwersja ID pokoju
             try:
@@ -367,7 +383,7 @@ class BridgeRoom(QObject):
                 try:
                     new_room_number = int(insert_room_number)
                     if new_room_number != existing_data["room_number"]:
-                        if new_room_number in room_service.get_all_room_numbers():
+                        if not validation_service.is_unique("rooms", "room_number", new_room_number):
                             errors.append(f"Pokój {new_room_number} już istnieje!")
                         else:
                             data_to_update["room_number"] = new_room_number
@@ -390,8 +406,7 @@ class BridgeRoom(QObject):
             if insert_room_type_id.strip():
                 try:
                     new_type_id = int(insert_room_type_id)
-                    all_type_ids = room_service.get_all_room_type_ids()
-                    if new_type_id not in all_type_ids:
+                    if not validation_service.exists("room_types", "room_type_id", new_type_id):
                         errors.append("Nieprawidłowy ID typu pokoju")
                     elif new_type_id != existing_data["fk_room_type_id"]:
                         data_to_update["fk_room_type_id"] = new_type_id
@@ -454,27 +469,18 @@ class BridgeRoom(QObject):
 
         try:
             room_controller = RoomsController(self.main_controller.db_controller)
-            room_service = RoomService(self.main_controller)
-
-            # Pobranie wszystkich `room_id` z bazy
-            all_room_ids = room_service.get_all_room_ids()
+            room_service = self.main_controller.get_service("room")
+            validation_service = self.main_controller.get_service("validation")
 
             # Sprawdzenie, czy podany `insert_room_id` istnieje w bazie
-            if insert_room_id not in all_room_ids:
+            if not validation_service.exists("rooms", "room_id", insert_room_id):
                 msg = f"Pokój o ID ({insert_room_id}) nie istnieje w bazie."
                 print(f"[BridgeRoom_deleteRoom] {msg}")
                 self.roomDeletionFailed.emit(msg)
                 return
 
-            # Pobranie wszystkich rezerwacji pokoi
-            all_room_reservations = room_service.get_all_room_reservations()
-
             # Sprawdzenie, czy pokój jest powiązany z jakąkolwiek rezerwacją
-            reservations_with_room = [
-                reservation["reservation_id"]
-                for reservation in all_room_reservations
-                if reservation["fk_room_id"] == insert_room_id
-            ]
+            reservations_with_room = room_service.get_reservation_ids_for_room(insert_room_id)
 
             if reservations_with_room:
                 reservations_str = ", ".join(map(str, reservations_with_room))
@@ -488,6 +494,7 @@ class BridgeRoom(QObject):
 
             if success:
                 # print(f"[BridgeRoom_deleteRoom] Pokój o ID {insert_room_id} został pomyślnie usunięty.")
+                self._rooms_model.remove_key(insert_room_id)
                 self.roomDeletedSuccessfully.emit()
             else:
                 print(f"[BridgeRoom_deleteRoom] Usunięcie pokoju o ID {insert_room_id} nie powiodło się.")
@@ -527,16 +534,10 @@ class BridgeRoom(QObject):
         errors = []  # Lista błędów walidacyjnych
 
         try:
-            # Pobranie istniejących typów pokoi
-            room_service = RoomService(self.main_controller)
-            all_room_types = room_service.get_all_room_types()
+            validation_service = self.main_controller.get_service("validation")
 
-            # Normalizacja wielkości liter dla porównania (ignorowanie wielkości liter)
-            normalized_room_types = [room_type.lower() for room_type in all_room_types]
-            normalized_insert_room_type = insert_room_type.strip().lower()
-
-            # Sprawdzenie, czy typ pokoju już istnieje
-            if normalized_insert_room_type in normalized_room_types:
+            # Sprawdzenie, czy typ pokoju już istnieje (kolumna `room_type` ignoruje wielkość liter - COLLATE NOCASE)
+            if not validation_service.is_unique("room_types", "room_type", insert_room_type.strip()):
                 errors.append(f"Typ pokoju '{insert_room_type}' już istnieje w bazie.")
 
             # Jeśli są błędy, emitujemy je i kończymy wykonanie
@@ -594,7 +595,7 @@ class BridgeRoom(QObject):
         errors = []  # Lista błędów walidacyjnych
 
         try:
-            room_service = RoomService(self.main_controller)
+            validation_service = self.main_controller.get_service("validation")
             room_types_controller = RoomTypesController(self.main_controller.db_controller)
 
             # Konwersja wartości do int
@@ -603,22 +604,18 @@ class BridgeRoom(QObject):
             except ValueError:
                 errors.append("ID typu pokoju musi być liczbą całkowitą.")
 
-            # Pobranie wszystkich dostępnych ID typów pokoi
-            all_room_type_ids = room_service.get_all_room_type_ids()
+            # Sprawdzenie ID typu pokoju i unikalności nazwy jednym zapytaniem
+            room_type_exists, room_type_name_taken = validation_service.check(
+                ExistsProbe("room_types", {"room_type_id": room_type_id}),
+                ExistsProbe("room_types", {"room_type": insert_room_type.strip()}),
+            )
 
             # Sprawdzenie czy podany room_type_id istnieje w bazie
-            if room_type_id not in all_room_type_ids:
-                errors.append(f"Nieprawidłowe ID typu pokoju: {room_type_id}. Dostępne ID: {all_room_type_ids}")
-
-            # Pobranie wszystkich istniejących typów pokoi
-            all_room_types = room_service.get_all_room_types()
-
-            # Normalizacja wielkości liter dla porównania (ignorowanie wielkości liter)
-            normalized_room_types = [room_type.lower() for room_type in all_room_types]
-            normalized_insert_room_type = insert_room_type.strip().lower()
+            if not room_type_exists:
+                errors.append(f"Nieprawidłowe ID typu pokoju: {room_type_id}.")
 
             # Sprawdzenie, czy podana nazwa już istnieje
-            if normalized_insert_room_type in normalized_room_types:
+            if room_type_name_taken:
                 errors.append(f"Typ pokoju '{insert_room_type}' już istnieje w bazie.")
 
             # Jeśli są błędy, emitujemy je i kończymy wykonanie
@@ -672,7 +669,7 @@ class BridgeRoom(QObject):
         errors = []  # Lista błędów walidacyjnych
 
         try:
-            room_service = RoomService(self.main_controller)
+            validation_service = self.main_controller.get_service("validation")
             room_types_controller = RoomTypesController(self.main_controller.db_controller)
 
             # Konwersja wartości do int
@@ -681,12 +678,9 @@ class BridgeRoom(QObject):
             except ValueError:
                 errors.append("ID typu pokoju musi być liczbą całkowitą.")
 
-            # Pobranie wszystkich dostępnych ID typów pokoi
-            all_room_type_ids = room_service.get_all_room_type_ids()
-
             # Sprawdzenie, czy podany `room_type_id` istnieje w bazie
-            if room_type_id not in all_room_type_ids:
-                errors.append(f"Nieprawidłowe ID typu pokoju: {room_type_id}. Dostępne ID: {all_room_type_ids}")
+            if not validation_service.exists("room_types", "room_type_id", room_type_id):
+                errors.append(f"Nieprawidłowe ID typu pokoju: {room_type_id}.")
 
             # Jeśli są błędy, emitujemy je i kończymy wykonanie
             if errors:
@@ -743,7 +737,7 @@ class BridgeRoom(QObject):
         errors = []  # Lista błędów walidacyjnych
 
         try:
-            room_service = RoomService(self.main_controller)
+            room_service = self.main_controller.get_service("room")
             reservation_controller = RoomReservationsController(self.main_controller.db_controller)
 
             # Konwersja `insert_room_id` do liczby całkowitej
@@ -752,11 +746,8 @@ class BridgeRoom(QObject):
             except ValueError:
                 errors.append("ID pokoju musi być liczbą całkowitą.")
 
-            # Pobranie wszystkich dostępnych `room_id`
-            all_room_ids = room_service.get_all_room_ids()
-
             # Sprawdzenie, czy pokój istnieje w bazie
-            if room_id not in all_room_ids:
+            if not self.main_controller.get_service("validation").exists("rooms", "room_id", room_id):
                 errors.append(f"Pokój o ID {room_id} nie istnieje w bazie.")
 
             # Walidacja formatu `reservation_date` (YYYY-MM-DD)
@@ -787,15 +778,14 @@ class BridgeRoom(QObject):
                 if start_time >= end_time:
                     errors.append("Nieprawidłowy przedział czasowy: godzina rozpoczęcia musi być wcześniejsza niż godzina zakończenia.")
 
-            # Pobranie wszystkich istniejących rezerwacji
-            all_reservations = room_service.get_all_room_reservations()
-
-            # Sprawdzenie, czy podana kombinacja już istnieje
-            for reservation in all_reservations:
-                if (reservation["fk_room_id"] == room_id and
-                    reservation["reservation_date"] == reservation_date and
-                    reservation["reservation_time"] == reservation_time):
-                    errors.append(f"Rezerwacja pokoju {room_id} na dzień {reservation_date} w godzinach {reservation_time} już istnieje.")
+            # Sprawdzenie kolizji z rezerwacjami pokoju w tym dniu (również częściowo nachodzącymi)
+            if not errors:
+                conflicts = room_service.get_reservation_conflicts(room_id, reservation_date, reservation_time)
+                if conflicts:
+                    errors.append(
+                        f"Pokój {room_id} jest już zarezerwowany na dzień {reservation_date} "
+                        f"w godzinach nachodzących na {reservation_time} (rezerwacje: {', '.join(map(str, conflicts))})."
+                    )
 
             # Jeśli są błędy, emitujemy je i przerywamy działanie
             if errors:
@@ -804,8 +794,16 @@ class BridgeRoom(QObject):
                 self.reservationAdditionFailed.emit(error_message)
                 return
 
-            # Dodanie rezerwacji do bazy
-            success = reservation_controller.add_reservation(room_id, reservation_date, reservation_time)
+            # Dodanie rezerwacji do bazy - kolizje sprawdzane ponownie w transakcji zapisu
+            # (rezerwacja mogła zostać dodana w innym wątku lub przez inny proces po walidacji)
+            try:
+                success = reservation_controller.add_reservation(
+                    room_id, reservation_date, reservation_time, check_conflicts=True
+                )
+            except ValueError as ve:
+                print(f"[BridgeRoom_addReservation] {ve}")
+                self.reservationAdditionFailed.emit(str(ve))
+                return
 
             if success:
                 print("[BridgeRoom_addReservation] Rezerwacja została dodana pomyślnie!")
@@ -917,12 +915,12 @@ class BridgeRoom(QObject):
                 self.reservationUpdateFailed.emit(error_message)
                 return
 
-            room_service = RoomService(self.main_controller)
+            room_service = self.main_controller.get_service("room")
+            validation_service = self.main_controller.get_service("validation")
             reservation_controller = RoomReservationsController(self.main_controller.db_controller)
 
             # Sprawdzenie istnienia rezerwacji
-            all_reservation_ids = room_service.get_all_reservation_ids()
-            if reservation_id not in all_reservation_ids:
+            if not validation_service.exists("room_reservations", "reservation_id", reservation_id):
                 errors.append(f"Rezerwacja o ID {reservation_id} nie istnieje.")
             else:
                 existing_reservation = room_service.get_reservation_by_id(reservation_id)
@@ -937,7 +935,7 @@ class BridgeRoom(QObject):
 
             # Budowanie słownika danych do aktualizacji – tylko dla pól, które zostały podane
             if new_room_id is not None and new_room_id != existing_reservation.get("fk_room_id"):
-                if new_room_id not in room_service.get_all_room_ids():
+                if not validation_service.exists("rooms", "room_id", new_room_id):
                     errors.append(f"Pokój o ID {new_room_id} nie istnieje.")
                 else:
                     data_to_update["fk_room_id"] = new_room_id
@@ -953,13 +951,11 @@ class BridgeRoom(QObject):
                 room_id = data_to_update.get("fk_room_id", existing_reservation.get("fk_room_id"))
                 date = data_to_update.get("reservation_date", existing_reservation.get("reservation_date"))
                 time = data_to_update.get("reservation_time", existing_reservation.get("reservation_time"))
-                for reservation in room_service.get_all_room_reservations():
-                    if (reservation["reservation_id"] != reservation_id and
-                        reservation["fk_room_id"] == room_id and
-                        reservation["reservation_date"] == date and
-                        reservation["reservation_time"] == time):
+                try:
+                    if room_service.get_reservation_conflicts(room_id, date, time, exclude_reservation_id=reservation_id):
                         errors.append("Konflikt z istniejącą rezerwacją.")
-                        break
+                except ValueError as ve:
+                    errors.append(str(ve))
 
             if errors:
                 error_message = "\n".join(errors)
@@ -972,10 +968,16 @@ class BridgeRoom(QObject):
                 self.reservationUpdateFailed.emit("Brak zmian w danych.")
                 return
 
-            success = reservation_controller.update_reservation(
-                reservation_id,
-                **data_to_update
-            )
+            try:
+                success = reservation_controller.update_reservation(
+                    reservation_id,
+                    **data_to_update,
+                    check_conflicts=True
+                )
+            except ValueError as ve:
+                print(f"[BridgeRoom_updateReservation] {ve}")
+                self.reservationUpdateFailed.emit(str(ve))
+                return
 
             if success:
                 print("[BridgeRoom_updateReservation] Aktualizacja udana!")
@@ -1017,7 +1019,7 @@ class BridgeRoom(QObject):
         errors = []  # Lista błędów walidacyjnych
 
         try:
-            room_service = RoomService(self.main_controller)
+            validation_service = self.main_controller.get_service("validation")
             reservation_controller = RoomReservationsController(self.main_controller.db_controller)
 
             # Konwersja wartości do int
@@ -1026,27 +1028,22 @@ class BridgeRoom(QObject):
             except ValueError:
                 errors.append("ID rezerwacji musi być liczbą całkowitą.")
 
-            # Pobranie wszystkich `reservation_id`
-            all_reservation_ids = room_service.get_all_reservation_ids()
+            # Sprawdzenie istnienia rezerwacji i jej powiązań z `appointments` oraz `internal_meetings` jednym zapytaniem
+            reservation_exists, has_appointments, has_meetings = validation_service.check(
+                ExistsProbe("room_reservations", {"reservation_id": reservation_id}),
+                ExistsProbe("appointments", {"fk_reservation_id": reservation_id}),
+                ExistsProbe("internal_meetings", {"fk_reservation_id": reservation_id}),
+            )
 
             # Sprawdzenie, czy rezerwacja istnieje w bazie
-            if reservation_id not in all_reservation_ids:
+            if not reservation_exists:
                 errors.append(f"Rezerwacja o ID {reservation_id} nie istnieje w bazie.")
 
-            # Pobranie `fk_reservation_id` z `appointments`
-            appointment_reservations = room_service.get_all_appointment_id_reservation_id()
-            appointment_ids = [record["appointment_id"] for record in appointment_reservations if record["fk_reservation_id"] == reservation_id]
-
-            # Pobranie `fk_reservation_id` z `internal_meetings`
-            meeting_reservations = room_service.get_all_meeting_id_reservation_id()
-            meeting_ids = [record["meeting_id"] for record in meeting_reservations if record["fk_reservation_id"] == reservation_id]
-
             # Sprawdzenie, czy rezerwacja jest powiązana z `appointments` lub `internal_meetings`
-            if appointment_ids or meeting_ids:
-                if appointment_ids:
-                    errors.append(f"Nie można usunąć rezerwacji {reservation_id}, ponieważ jest powiązana z wizytami o ID: {appointment_ids}.")
-                if meeting_ids:
-                    errors.append(f"Nie można usunąć rezerwacji {reservation_id}, ponieważ jest powiązana ze spotkaniami o ID: {meeting_ids}.")
+            if has_appointments:
+                errors.append(f"Nie można usunąć rezerwacji {reservation_id}, ponieważ jest powiązana z wizytami.")
+            if has_meetings:
+                errors.append(f"Nie można usunąć rezerwacji {reservation_id}, ponieważ jest powiązana ze spotkaniami.")
 
             # Jeśli są błędy, emitujemy je i kończymy wykonanie
             if errors:
@@ -1083,56 +1080,80 @@ class BridgeRoom(QObject):
 
     # -------------------------------------------------------------------------
 
-    @Slot()
-    def updateAppointmentsList(self):
+    @Slot(str, str, str, str)
+    def findFirstFreeRoom(self, insert_room_type_id, reservation_date, insert_duration_minutes, earliest_time=""):
         """
-        Pobiera listę wizyt (`appointments`) na podstawie `role_id` i emituje sygnał do QML.
+        Wyszukuje pokój danego typu z najwcześniejszym wolnym terminem o podanej długości.
+        Wynik (room_id, room_number, reservation_date, reservation_time) jest emitowany sygnałem `freeRoomFound`.
+
+        :param insert_room_type_id: ID typu pokoju.
+        :param reservation_date: Data rezerwacji (YYYY-MM-DD).
+        :param insert_duration_minutes: Czas trwania w minutach.
+        :param earliest_time: Najwcześniejsza godzina rozpoczęcia (HH:MM), opcjonalnie.
         """
+        print(f"[BridgeRoom_findFirstFreeRoom] Otrzymano dane: RoomTypeID={insert_room_type_id}, "
+              f"Date={reservation_date}, Duration={insert_duration_minutes}, Earliest={earliest_time}")
+
+        if self._logged_in_user_id is None:
+            print("[BridgeRoom_findFirstFreeRoom] Brak zalogowanego użytkownika.")
+            self.freeRoomSearchFailed.emit("Brak zalogowanego użytkownika.")
+            return
+
         try:
-            # Pobranie roli użytkownika
-            users_accounts_controller = UsersAccountsController(self.main_controller.db_controller)
-            role_id = users_accounts_controller.get_role_id_by_user_id(self._logged_in_user_id)
+            if not str(insert_room_type_id).isdigit():
+                raise ValueError("ID typu pokoju musi być liczbą całkowitą.")
+            if not str(insert_duration_minutes).isdigit():
+                raise ValueError("Czas trwania musi być liczbą całkowitą (w minutach).")
+            room_type_id = int(insert_room_type_id)
+            duration_minutes = int(insert_duration_minutes)
+            if not re.match(r"^\d{4}-\d{2}-\d{2}$", reservation_date or ""):
+                raise ValueError("Nieprawidłowy format daty. Poprawny format: YYYY-MM-DD.")
+
+            room_service = self.main_controller.get_service("room")
+            free_room = room_service.find_first_free_room(
+                room_type_id, reservation_date, duration_minutes, earliest_time.strip() or None
+            )
 
-            room_service = RoomService(self.main_controller)
+            if free_room is None:
+                print("[BridgeRoom_findFirstFreeRoom] Brak wolnego pokoju.")
+                self.freeRoomSearchFailed.emit(f"Brak wolnego pokoju tego typu w dniu {reservation_date}.")
+                return
 
-            if role_id in [3, 4, 5, 6, 7, 8]:
-                # Pobranie `employee_id` na podstawie zalogowanego użytkownika
-                employee_id = users_accounts_controller.get_employee_id_by_user_id(self._logged_in_user_id)
+            print(f"[BridgeRoom_findFirstFreeRoom] Znaleziono: {free_room}")
+            self.freeRoomFound.emit(free_room)
 
-                if employee_id is None:
-                    print("[BridgeRoom_updateAppointmentsList] Brak przypisanego pracownika dla zalogowanego użytkownika.")
-                    self.appointmentsListChanged.emit([])  # Brak uprawnień, zwróć pustą listę
-                    return
+        except ValueError as ve:
+            print(f"[BridgeRoom_findFirstFreeRoom] Błąd walidacji: {str(ve)}")
+            self.freeRoomSearchFailed.emit(str(ve))
 
-                # Pobranie sformatowanych wizyt dla konkretnego pracownika
-                appointments_list = room_service.table_get_formatted_appointments_for_employee(employee_id)
+        except sqlite3.DatabaseError as db_err:
+            print(f"[BridgeRoom_findFirstFreeRoom] Błąd bazy danych: {str(db_err)}")
+            self.freeRoomSearchFailed.emit("Błąd bazy danych.")
 
-            elif role_id in [1, 2, 9, 10]:
-                # Pobranie wszystkich wizyt
-                appointments_list = room_service.table_get_all_appointments()
-            else:
-                print(f"[BridgeRoom_updateAppointmentsList] Brak dostępu dla role_id: {role_id}")
-                self.appointmentsListChanged.emit([])  # Brak uprawnień, zwróć pustą listę
-                return
+    # -------------------------------------------------------------------------
 
-            # Debugowanie pobranych danych
-            # print(f"[BridgeRoom_updateAppointmentsList] Pobranie danych wizyt: {appointments_list}")
+    @Slot()
+    def updateAppointmentsList(self):
+        """
+        Pobiera listę wizyt (`appointments`) na podstawie `role_id` (w wątku roboczym) i emituje sygnał do QML.
+        """
+        self.worker.load_list(
+            "BridgeRoom_updateAppointmentsList",
+            _load_appointments_for_user,
+            self._set_appointments_list,
+            self.appointmentsListChanged,
+            (self._logged_in_user_id,),
+        )
 
-            # Aktualizacja listy wizyt
-            self._appointments_list = appointments_list
+    def _set_appointments_list(self, appointments_list):
+        self._appointments_list = appointments_list
+        self._appointments_model.set_rows(appointments_list)  # Tylko zmienione wiersze
+        self.appointmentsListChanged.emit(self._appointments_list)
 
-            # Emitowanie sygnału z listą wizyt do frontendu
-            self.appointmentsListChanged.emit(self._appointments_list)
+    def get_appointments_model(self):
+        return self._appointments_model
 
-        except KeyError as ke:
-            print(f"[BridgeRoom_updateAppointmentsList] Klucz nie znaleziony w danych wizyt: {ke}")
-            self.appointmentsListChanged.emit([])  # Emituj pustą listę w przypadku błędu
-        except ValueError as ve:
-            print(f"[BridgeRoom_updateAppointmentsList] Błąd w wartościach danych wizyt: {ve}")
-            self.appointmentsListChanged.emit([])  # Emituj pustą listę w przypadku błędu
-        except RuntimeError as rue:
-            print(f"[BridgeRoom_updateAppointmentsList] Błąd bazy danych: {rue}")
-            self.appointmentsListChanged.emit([])  # Emituj pustą listę w przypadku błędu
+    appointmentsModel = Property(QObject, get_appointments_model, constant=True)
 
     @Slot(result=list)
     def getAppointmentsList(self):
@@ -1146,31 +1167,18 @@ class BridgeRoom(QObject):
     @Slot()
     def updateMeetingTypesList(self):
         """
-        Pobiera listę typów spotkań i emituje sygnał do QML.
+        Pobiera listę typów spotkań (w wątku roboczym) i emituje sygnał do QML.
         """
-        try:
-            # Pobranie danych typów spotkań z serwisu pokoi
-            room_service = RoomService(self.main_controller)
-            meeting_types_list = room_service.table_get_all_meeting_types()
-
-            # Debugowanie pobranych danych
-            # print(f"[BridgeRoom_updateMeetingTypesList] Pobranie typów spotkań: {meeting_types_list}")
-
-            # Aktualizacja listy typów spotkań
-            self._meeting_types_list = meeting_types_list
+        self.worker.load_list(
+            "BridgeRoom_updateMeetingTypesList",
+            lambda main_controller: main_controller.get_service("room").table_get_all_meeting_types(),
+            self._set_meeting_types_list,
+            self.meetingTypesListChanged,
+        )
 
-            # Emitowanie sygnału z listą typów spotkań
-            self.meetingTypesListChanged.emit(self._meeting_types_list)
-
-        except KeyError as ke:
-            print(f"[BridgeRoom_updateMeetingTypesList] Klucz nie znaleziony w danych typów spotkań: {ke}")
-            self.meetingTypesListChanged.emit([])  # Emituj pustą listę w przypadku błędu
-        except ValueError as ve:
-            print(f"[BridgeRoom_updateMeetingTypesList] Błąd w wartościach danych typów spotkań: {ve}")
-            self.meetingTypesListChanged.emit([])  # Emituj pustą listę w przypadku błędu
-        except RuntimeError as rue:
-            print(f"[BridgeRoom_updateMeetingTypesList] Błąd bazy danych: {rue}")
-            self.meetingTypesListChanged.emit([])  # Emituj pustą listę w przypadku błędu
+    def _set_meeting_types_list(self, items):
+        self._meeting_types_list = items
+        self.meetingTypesListChanged.emit(self._meeting_types_list)
 
     @Slot(result=list)
     def getMeetingTypesList(self):
@@ -1185,31 +1193,18 @@ class BridgeRoom(QObject):
     @Slot()
     def updateInternalMeetingsList(self):
         """
-        Pobiera listę spotkań wewnętrznych i emituje sygnał do QML.
+        Pobiera listę spotkań wewnętrznych (w wątku roboczym) i emituje sygnał do QML.
         """
-        try:
-            # Pobranie danych spotkań wewnętrznych z serwisu pokoi
-            room_service = RoomService(self.main_controller)
-            internal_meetings_list = room_service.table_get_all_internal_meetings()
-
-            # Debugowanie pobranych danych
-            # print(f"[BridgeRoom_updateInternalMeetingsList] Pobranie danych spotkań wewnętrznych: {internal_meetings_list}")
-
-            # Aktualizacja listy spotkań wewnętrznych
-            self._internal_meetings_list = internal_meetings_list
+        self.worker.load_list(
+            "BridgeRoom_updateInternalMeetingsList",
+            lambda main_controller: main_controller.get_service("room").table_get_all_internal_meetings(),
+            self._set_internal_meetings_list,
+            self.internalMeetingsListChanged,
+        )
 
-            # Emitowanie sygnału z listą spotkań wewnętrznych
-            self.internalMeetingsListChanged.emit(self._internal_meetings_list)
-
-        except KeyError as ke:
-            print(f"[BridgeRoom_updateInternalMeetingsList] Klucz nie znaleziony w danych spotkań: {ke}")
-            self.internalMeetingsListChanged.emit([])  # Emituj pustą listę w przypadku błędu
-        except ValueError as ve:
-            print(f"[BridgeRoom_updateInternalMeetingsList] Błąd w wartościach danych spotkań: {ve}")
-            self.internalMeetingsListChanged.emit([])  # Emituj pustą listę w przypadku błędu
-        except RuntimeError as rue:
-            print(f"[BridgeRoom_updateInternalMeetingsList] Błąd bazy danych: {rue}")
-            self.internalMeetingsListChanged.emit([])  # Emituj pustą listę w przypadku błędu
+    def _set_internal_meetings_list(self, items):
+        self._internal_meetings_list = items
+        self.internalMeetingsListChanged.emit(self._internal_meetings_list)
 
     @Slot(result=list)
     def getInternalMeetingsList(self):
@@ -1250,77 +1245,80 @@ class BridgeRoom(QObject):
                 self.appointmentAdditionFailed.emit("ID przypisania, ID usługi oraz ID rezerwacji muszą być liczbami całkowitymi.")
                 return
 
-            room_service = RoomService(self.main_controller)
+            room_service = self.main_controller.get_service("room")
+            validation_service = self.main_controller.get_service("validation")
             appointment_controller = AppointmentsController(self.main_controller.db_controller)
-            users_accounts_controller = UsersAccountsController(self.main_controller.db_controller)
+            session = self.main_controller.session_service.get_session(self._logged_in_user_id)
             
 
-            # Pobranie roli użytkownika
-            role_id = users_accounts_controller.get_role_id_by_user_id(self._logged_in_user_id)
+            # Pobranie zakresu uprawnień użytkownika do wizyt
+            appointments_scope = self.main_controller.db_controller.permission_engine.row_scope(
+                session, "edit", "appointments"
+            )
 
-            if role_id in [3, 4, 5, 6, 7, 8]:
+            if appointments_scope == SCOPE_ASSIGNED:
                 # Pobranie `employee_id`
-                employee_id = users_accounts_controller.get_employee_id_by_user_id(self._logged_in_user_id)
+                employee_id = session.employee_id
 
                 if employee_id is None:
                     errors.append("Brak przypisanego pracownika dla zalogowanego użytkownika.")
                 else:
-                    # Pobranie listy `assignment_id` przypisanych do pracownika
-                    valid_assignment_ids_for_employee = room_service.get_all_assignment_ids_for_employee(employee_id)
+                    # Sprawdzenie przypisań i usług pracownika jednym zapytaniem
+                    has_assignments, assignment_valid, has_services, service_valid = validation_service.check(
+                        ExistsProbe("assigned_patients", {"fk_employee_id": employee_id}),
+                        ExistsProbe("assigned_patients", {"assignment_id": insert_assignment_id, "fk_employee_id": employee_id}),
+                        ExistsProbe("employee_services", {"employee_id": employee_id}),
+                        ExistsProbe("employee_services", {"employee_id": employee_id, "service_id": insert_service_id}),
+                    )
 
-                    if not valid_assignment_ids_for_employee:
+                    if not has_assignments:
                         errors.append(f"Brak przypisań pacjentów do pracownika {employee_id}.")
-                    elif insert_assignment_id not in valid_assignment_ids_for_employee:
-                        errors.append(f"Przypisanie o ID {insert_assignment_id} nie jest przypisane do pracownika {employee_id}. "
-                                    f"Dostępne ID przypisań: {valid_assignment_ids_for_employee}")
-
-                    # Pobranie listy `service_id` przypisanych do pracownika
-                    valid_service_ids_for_employee = room_service.get_all_service_ids_by_employee(employee_id)
+                    elif not assignment_valid:
+                        errors.append(f"Przypisanie o ID {insert_assignment_id} nie jest przypisane do pracownika {employee_id}.")
 
-                    if not valid_service_ids_for_employee:
+                    if not has_services:
                         errors.append(f"Brak przypisanych usług dla pracownika {employee_id}.")
-                    elif insert_service_id not in valid_service_ids_for_employee:
-                        errors.append(f"Usługa o ID {insert_service_id} nie jest przypisana do pracownika {employee_id}. "
-                                    f"Dostępne ID usług: {valid_service_ids_for_employee}")
+                    elif not service_valid:
+                        errors.append(f"Usługa o ID {insert_service_id} nie jest przypisana do pracownika {employee_id}.")
+
 
 
+            elif appointments_scope == SCOPE_ALL:
+                # Pobranie `employee_id` na podstawie `assignment_id` (pusta lista, jeśli przypisanie nie istnieje)
+                employee_ids = room_service.get_all_employee_id_for_assignment(insert_assignment_id)
 
-            elif role_id in [1, 2, 9, 10]:
-                # Pobranie listy `assignment_id`
-                all_assignment_ids = room_service.get_all_assignment_ids()
-                if insert_assignment_id not in all_assignment_ids:
+                if not employee_ids:
                     errors.append(f"Przypisanie o ID {insert_assignment_id} nie istnieje w systemie.")
                 else:
-                    # Pobranie `employee_id` na podstawie `assignment_id`
-                    employee_id = room_service.get_all_employee_id_for_assignment(insert_assignment_id)
-
-                    if not employee_id:
-                        errors.append(f"Nie znaleziono pracownika przypisanego do assignment_id {insert_assignment_id}.")
-                    else:
-                        # Pobranie listy `service_id` przypisanych do `employee_id`
-                        valid_service_ids_for_employee = room_service.get_all_service_ids_by_employee(employee_id)
-
-                        if not valid_service_ids_for_employee:
-                            errors.append(f"Brak przypisanych usług dla pracownika {employee_id}.")
-                        elif insert_service_id not in valid_service_ids_for_employee:
-                            errors.append(f"Usługa o ID {insert_service_id} nie jest przypisana do pracownika o ID {employee_id}. "
-                                        f"Dostępne ID usług: {valid_service_ids_for_employee}")
+                    employee_id = employee_ids[0]
 
+                    # Sprawdzenie usług pracownika jednym zapytaniem
+                    has_services, service_valid = validation_service.check(
+                        ExistsProbe("employee_services", {"employee_id": employee_id}),
+                        ExistsProbe("employee_services", {"employee_id": employee_id, "service_id": insert_service_id}),
+                    )
 
+                    if not has_services:
+                        errors.append(f"Brak przypisanych usług dla pracownika {employee_id}.")
+                    elif not service_valid:
+                        errors.append(f"Usługa o ID {insert_service_id} nie jest przypisana do pracownika o ID {employee_id}.")
 
+            else:
+                errors.append("Brak uprawnień do dodawania wizyt.")
 
-            # **Nowe sprawdzenie, czy insert_reservation_id istnieje w bazie**
-            all_reservation_ids = room_service.get_all_reservation_ids()
-            if insert_reservation_id not in all_reservation_ids:
+            # Sprawdzenie istnienia rezerwacji i jej wykorzystania w wizytach / spotkaniach jednym zapytaniem
+            reservation_exists, used_in_appointments, used_in_meetings = validation_service.check(
+                ExistsProbe("room_reservations", {"reservation_id": insert_reservation_id}),
+                ExistsProbe("appointments", {"fk_reservation_id": insert_reservation_id}),
+                ExistsProbe("internal_meetings", {"fk_reservation_id": insert_reservation_id}),
+            )
+            if not reservation_exists:
                 errors.append(f"Rezerwacja o ID {insert_reservation_id} nie istnieje w bazie.")
             else:
-                # Pobranie wszystkich `reservation_id` z `appointments` i sprawdzenie, czy istnieje
-                existing_reservation_ids_appointments = room_service.get_all_reservation_ids_from_appointments()
-                if insert_reservation_id in existing_reservation_ids_appointments:
+                if used_in_appointments:
                     errors.append(f"Rezerwacja o ID {insert_reservation_id} już istnieje w tabeli wizyty.")
 
-                existing_reservation_ids_meetings = room_service.get_all_reservation_ids_from_internal_meetings()
-                if insert_reservation_id in existing_reservation_ids_meetings:
+                if used_in_meetings:
                     errors.append(f"Rezerwacja o ID {insert_reservation_id} już istnieje w tabeli spotkania wewnętrzne.")
 
             # Pobranie i zmodyfikowanie daty rezerwacji
@@ -1374,6 +1372,100 @@ class BridgeRoom(QObject):
 
     # -------------------------------------------------------------------------
 
+    @Slot(str)
+    def scheduleAppointmentSeries(self, series_json):
+        """
+        Zapisuje serię wizyt (np. 12-tygodniową terapię) - rezerwacje i wizyty wszystkich terminów
+        w jednej transakcji - i emituje `appointmentSeriesScheduled` z zapisanymi terminami oraz
+        terminami z konfliktem (z propozycjami wolnych godzin). Seria z konfliktem nie jest zapisywana,
+        chyba że podano "skip_conflicts": true.
+
+        :param series_json: Obiekt JSON z parametrami serii, np. '{"assignment_id": 4, "service_id": 2,
+            "room_type_id": 1, "start_date": "2025-03-03", "weekdays": [0, 3], "start_time": "10:00", "count": 12}'.
+        """
+        print(f"[BridgeRoom_scheduleAppointmentSeries] Otrzymano dane: {series_json}")
+
+        if self._logged_in_user_id is None:
+            print("[BridgeRoom_scheduleAppointmentSeries] Brak zalogowanego użytkownika.")
+            self.appointmentSeriesFailed.emit("Brak zalogowanego użytkownika.")
+            return
+
+        try:
+            series = json.loads(series_json)
+        except (TypeError, ValueError):
+            series = None
+        if not isinstance(series, dict):
+            self.appointmentSeriesFailed.emit("Nieprawidłowy format danych - oczekiwano obiektu JSON.")
+            return
+
+        try:
+            error_message = self._validate_series_access(series.get("assignment_id"), series.get("service_id"))
+        except sqlite3.DatabaseError as db_err:
+            print(f"[BridgeRoom_scheduleAppointmentSeries] Błąd bazy danych: {str(db_err)}")
+            error_message = "Błąd bazy danych."
+        if error_message:
+            print(f"[BridgeRoom_scheduleAppointmentSeries] Błędy walidacji:\n{error_message}")
+            self.appointmentSeriesFailed.emit(error_message)
+            return
+
+        self.worker.run(
+            "BridgeRoom_scheduleAppointmentSeries",
+            lambda main_controller, series: main_controller.get_service("room").schedule_appointment_series(series),
+            (series,),
+            on_success=self._on_appointment_series_scheduled,
+            on_failure=self._on_appointment_series_failed,
+        )
+
+    def _validate_series_access(self, assignment_id, service_id):
+        """
+        Sprawdza uprawnienia do dodawania wizyt dla przypisania i usługi serii (jak `addAppointment`).
+        Zwraca komunikat błędu lub None.
+        """
+        session = self.main_controller.session_service.get_session(self._logged_in_user_id)
+        appointments_scope = self.main_controller.db_controller.permission_engine.row_scope(
+            session, "edit", "appointments"
+        )
+        validation_service = self.main_controller.get_service("validation")
+
+        if appointments_scope == SCOPE_ASSIGNED:
+            employee_id = session.employee_id
+            if employee_id is None:
+                return "Brak przypisanego pracownika dla zalogowanego użytkownika."
+            assignment_valid, service_valid = validation_service.check(
+                ExistsProbe("assigned_patients", {"assignment_id": assignment_id, "fk_employee_id": employee_id}),
+                ExistsProbe("employee_services", {"employee_id": employee_id, "service_id": service_id}),
+            )
+            if not assignment_valid:
+                return f"Przypisanie o ID {assignment_id} nie jest przypisane do pracownika {employee_id}."
+        elif appointments_scope == SCOPE_ALL:
+            employee_ids = self.main_controller.get_service("room").get_all_employee_id_for_assignment(assignment_id)
+            if not employee_ids:
+                return f"Przypisanie o ID {assignment_id} nie istnieje w systemie."
+            employee_id = employee_ids[0]
+            service_valid, = validation_service.check(
+                ExistsProbe("employee_services", {"employee_id": employee_id, "service_id": service_id}),
+            )
+        else:
+            return "Brak uprawnień do dodawania wizyt."
+
+        if not service_valid:
+            return f"Usługa o ID {service_id} nie jest przypisana do pracownika o ID {employee_id}."
+        return None
+
+    def _on_appointment_series_scheduled(self, result):
+        print(f"[BridgeRoom_scheduleAppointmentSeries] Zapisano terminów: {len(result['scheduled'])}, "
+              f"konflikty: {len(result['conflicts'])}")
+        self.appointmentSeriesScheduled.emit(result)
+
+    def _on_appointment_series_failed(self, error):
+        print(f"[BridgeRoom_scheduleAppointmentSeries] Błąd: {error}")
+        if isinstance(error, ValueError):
+            self.appointmentSeriesFailed.emit(str(error))
+        else:
+            self.appointmentSeriesFailed.emit(f"Błąd systemowy: {error}")
+
+    # -------------------------------------------------------------------------
+
 
     @Slot(str, str, str, str, str, str)
     def updateAppointment(self, insert_appointment_id, insert_assignment_id=None, insert_service_id=None,
@@ -1413,67 +1505,65 @@ class BridgeRoom(QObject):
                 if insert_notes == "":
                     insert_notes = None
 
-            room_service = RoomService(self.main_controller)
+            room_service = self.main_controller.get_service("room")
+            validation_service = self.main_controller.get_service("validation")
             appointment_controller = AppointmentsController(self.main_controller.db_controller)
-            users_accounts_controller = UsersAccountsController(self.main_controller.db_controller)
+            session = self.main_controller.session_service.get_session(self._logged_in_user_id)
             assigned_patients_controller = AssignedPatientsController(self.main_controller.db_controller)
 
-            # Pobranie roli użytkownika
-            role_id = users_accounts_controller.get_role_id_by_user_id(self._logged_in_user_id)
+            # Pobranie zakresu uprawnień użytkownika do wizyt
+            appointments_scope = self.main_controller.db_controller.permission_engine.row_scope(
+                session, "edit", "appointments"
+            )
+
+            employee_id = None
+            if appointments_scope == SCOPE_ASSIGNED:  # Rola pracownika medycznego
+                employee_id = session.employee_id
+                if employee_id is None:
+                    errors.append("Brak przypisanego pracownika dla zalogowanego użytkownika.")
 
-            if role_id in [3, 4, 5, 6, 7, 8]:  # Rola pracownika medycznego
-                employee_id = users_accounts_controller.get_employee_id_by_user_id(self._logged_in_user_id)
-                valid_assignment_ids_for_employee = room_service.get_all_assignment_ids_for_employee(employee_id)
-                valid_appointments = room_service.get_appointment_ids_by_assignment(valid_assignment_ids_for_employee)
-                valid_services = room_service.get_all_service_ids_for_employee(employee_id)
+            elif appointments_scope == SCOPE_ALL:
+                if not validation_service.exists("appointments", "appointment_id", insert_appointment_id):
+                    errors.append(f"Przypisanie o ID {insert_appointment_id} nie istnieje w systemie.")
+                else:
+                    assignment_id = appointment_controller.get_assignment_id_by_appointment_id(insert_appointment_id)
+                    employee_id = assigned_patients_controller.get_employee_id_by_assignment_id(assignment_id)
 
-                if insert_appointment_id not in valid_appointments:
+            else:
+                errors.append("Brak uprawnień do edycji wizyt.")
+
+            if employee_id is not None:
+                # Wizyta, przypisanie i usługa muszą należeć do pracownika - sprawdzenie jednym zapytaniem
+                appointment_assignment_id = appointment_controller.get_assignment_id_by_appointment_id(insert_appointment_id)
+                appointment_valid, assignment_valid, service_valid = validation_service.check(
+                    ExistsProbe("assigned_patients", {"assignment_id": appointment_assignment_id, "fk_employee_id": employee_id}),
+                    ExistsProbe("assigned_patients", {"assignment_id": insert_assignment_id, "fk_employee_id": employee_id}),
+                    ExistsProbe("employee_services", {"employee_id": employee_id, "service_id": insert_service_id}),
+                )
+
+                if not appointment_valid:
                     errors.append(
-                        f"Użytkownik o ID pracownika {employee_id} może aktualizować tylko przypisane wizyty: {valid_appointments}"
+                        f"Użytkownik o ID pracownika {employee_id} może aktualizować tylko przypisane wizyty."
                     )
-                if insert_assignment_id is not None and insert_assignment_id not in valid_assignment_ids_for_employee:
+                if insert_assignment_id is not None and not assignment_valid:
                     errors.append(
-                        f"Przypisanie o ID {insert_assignment_id} nie istnieje lub nie należy do pracownika {employee_id}. "
-                        f"Dostępne ID: {valid_assignment_ids_for_employee}"
+                        f"Przypisanie o ID {insert_assignment_id} nie istnieje lub nie należy do pracownika {employee_id}."
                     )
-                if insert_service_id is not None and insert_service_id not in valid_services:
+                if insert_service_id is not None and not service_valid:
                     errors.append(
-                        f"Usługa o ID {insert_service_id} nie istnieje lub nie jest dostępna dla pracownika {employee_id}. "
-                        f"Dostępne ID: {valid_services}"
+                        f"Usługa o ID {insert_service_id} nie istnieje lub nie jest dostępna dla pracownika {employee_id}."
                     )
 
-            elif role_id in [1, 2, 9, 10]:
-                all_appointment_ids = room_service.get_all_appointment_ids()
-                if insert_appointment_id not in all_appointment_ids:
-                    errors.append(f"Przypisanie o ID {insert_appointment_id} nie istnieje w systemie.")
-                else:
-                    assignment_id = appointment_controller.get_assignment_id_by_appointment_id(insert_appointment_id)
-                    employee_id = assigned_patients_controller.get_employee_id_by_assignment_id(assignment_id)
-                    valid_assignment_ids_for_employee = room_service.get_all_assignment_ids_for_employee(employee_id)
-                    valid_appointments = room_service.get_appointment_ids_by_assignment(valid_assignment_ids_for_employee)
-                    valid_services = room_service.get_all_service_ids_for_employee(employee_id)
-                    if insert_appointment_id not in valid_appointments:
-                        errors.append(
-                            f"Użytkownik o ID pracownika {employee_id} może aktualizować tylko przypisane wizyty: {valid_appointments}"
-                        )
-                    if insert_assignment_id is not None and insert_assignment_id not in valid_assignment_ids_for_employee:
-                        errors.append(
-                            f"Przypisanie o ID {insert_assignment_id} nie istnieje lub nie należy do pracownika {employee_id}. "
-                            f"Dostępne ID: {valid_assignment_ids_for_employee}"
-                        )
-                    if insert_service_id is not None and insert_service_id not in valid_services:
-                        errors.append(
-                            f"Usługa o ID {insert_service_id} nie istnieje lub nie jest dostępna dla pracownika {employee_id}. "
-                            f"Dostępne ID: {valid_services}"
-                        )
-
             # Sprawdzenie rezerwacji
-            existing_appointment_reservation_ids = room_service.get_all_reservation_ids_from_appointments()
-            if insert_reservation_id is not None and insert_reservation_id in existing_appointment_reservation_ids:
-                errors.append(f"Rezerwacja o ID {insert_reservation_id} już istnieje w tabeli wizyt.")
-            existing_room_reservation_ids = room_service.get_all_reservation_ids()
-            if insert_reservation_id is not None and insert_reservation_id not in existing_room_reservation_ids:
-                errors.append(f"Rezerwacja o ID {insert_reservation_id} nie istnieje w tabeli rezerwacje.")
+            if insert_reservation_id is not None:
+                reservation_used, reservation_exists = validation_service.check(
+                    ExistsProbe("appointments", {"fk_reservation_id": insert_reservation_id}),
+                    ExistsProbe("room_reservations", {"reservation_id": insert_reservation_id}),
+                )
+                if reservation_used:
+                    errors.append(f"Rezerwacja o ID {insert_reservation_id} już istnieje w tabeli wizyt.")
+                if not reservation_exists:
+                    errors.append(f"Rezerwacja o ID {insert_reservation_id} nie istnieje w tabeli rezerwacje.")
 
             # Pobranie i ewentualna modyfikacja daty rezerwacji
             modified_appointment_date = room_service.get_reservation_datetime(insert_reservation_id) if insert_reservation_id else None
@@ -1563,37 +1653,33 @@ class BridgeRoom(QObject):
             return
 
         try:
-            room_service = RoomService(self.main_controller)
+            validation_service = self.main_controller.get_service("validation")
             appointment_controller = AppointmentsController(self.main_controller.db_controller)
 
-            # Pobranie wszystkich `appointment_id` z bazy
-            all_appointment_ids = room_service.get_all_appointment_ids()
+            # Sprawdzenie istnienia wizyty i jej powiązań z diagnozami oraz receptami jednym zapytaniem
+            appointment_exists, has_diagnoses, has_prescriptions = validation_service.check(
+                ExistsProbe("appointments", {"appointment_id": insert_appointment_id}),
+                ExistsProbe("diagnoses", {"fk_appointment_id": insert_appointment_id}),
+                ExistsProbe("prescriptions", {"fk_appointment_id": insert_appointment_id}),
+            )
 
             # Sprawdzenie, czy podany `insert_appointment_id` istnieje w bazie
-            if insert_appointment_id not in all_appointment_ids:
+            if not appointment_exists:
                 msg = f"Wizyta o ID ({insert_appointment_id}) nie istnieje w bazie."
                 print(f"[BridgeRoom_deleteAppointment] {msg}")
                 self.appointmentDeletionFailed.emit(msg)
                 return
 
-            # Pobranie wszystkich `fk_appointment_id` i `diagnosis_id` z tabeli diagnoses
-            diagnoses_data = room_service.get_all_appointment_ids_diagnoses_ids_from_diagnoses()
-            diagnosis_ids = [entry["diagnosis_id"] for entry in diagnoses_data if entry["fk_appointment_id"] == insert_appointment_id]
-
             # Sprawdzenie, czy `insert_appointment_id` jest powiązane z diagnozami
-            if diagnosis_ids:
-                msg = f"Nie można usunąć wizyty o ID {insert_appointment_id}, ponieważ jest przypisana w następujących diagnosis_id: {diagnosis_ids}"
+            if has_diagnoses:
+                msg = f"Nie można usunąć wizyty o ID {insert_appointment_id}, ponieważ jest przypisana do diagnoz."
                 print(f"[BridgeRoom_deleteAppointment] {msg}")
                 self.appointmentDeletionFailed.emit(msg)
                 return
 
-            # Pobranie wszystkich `fk_appointment_id` i `prescription_id` z tabeli prescriptions
-            prescriptions_data = room_service.get_all_appointment_ids_prescriptions_ids_from_prescriptions()
-            prescription_ids = [entry["prescription_id"] for entry in prescriptions_data if entry["fk_appointment_id"] == insert_appointment_id]
-
             # Sprawdzenie, czy `insert_appointment_id` jest powiązane z receptami
-            if prescription_ids:
-                msg = f"Nie można usunąć wizyty o ID {insert_appointment_id}, ponieważ jest przypisana w następujących prescriptions_id: {prescription_ids}"
+            if has_prescriptions:
+                msg = f"Nie można usunąć wizyty o ID {insert_appointment_id}, ponieważ jest przypisana do recept."
                 print(f"[BridgeRoom_deleteAppointment] {msg}")
                 self.appointmentDeletionFailed.emit(msg)
                 return
@@ -1603,6 +1689,7 @@ class BridgeRoom(QObject):
 
             if success:
                 print(f"[BridgeRoom_deleteAppointment] Wizyta o ID {insert_appointment_id} została pomyślnie usunięta.")
+                self._appointments_model.remove_key(insert_appointment_id)
                 self.appointmentDeletedSuccessfully.emit()
             else:
                 print(f"[BridgeRoom_deleteAppointment] Nie udało się usunąć wizyty o ID {insert_appointment_id}.")
@@ -1653,25 +1740,30 @@ class BridgeRoom(QObject):
                 self.internalMeetingAdditionFailed.emit("ID typu spotkania oraz ID rezerwacji muszą być liczbami całkowitymi.")
                 return
 
-            room_service = RoomService(self.main_controller)
+            room_service = self.main_controller.get_service("room")
             internal_meetings_controller = InternalMeetingsController(self.main_controller.db_controller)
 
+            # Sprawdzenie typu spotkania i rezerwacji jednym zapytaniem
+            validation_service = self.main_controller.get_service("validation")
+            meeting_type_exists, used_in_appointments, used_in_meetings, reservation_exists = validation_service.check(
+                ExistsProbe("meeting_types", {"meeting_type_id": insert_meeting_type_id}),
+                ExistsProbe("appointments", {"fk_reservation_id": insert_reservation_id}),
+                ExistsProbe("internal_meetings", {"fk_reservation_id": insert_reservation_id}),
+                ExistsProbe("room_reservations", {"reservation_id": insert_reservation_id}),
+            )
+
             # **Sprawdzenie czy `insert_meeting_type_id` istnieje w systemie**
-            all_meeting_type_ids = room_service.get_all_meeting_type_ids()
-            if insert_meeting_type_id not in all_meeting_type_ids:
-                errors.append(f"Typ spotkania o ID {insert_meeting_type_id} nie istnieje w tabeli typy spotkań. Dostępne typy spotkań o ID: {all_meeting_type_ids}")
+            if not meeting_type_exists:
+                errors.append(f"Typ spotkania o ID {insert_meeting_type_id} nie istnieje w tabeli typy spotkań.")
 
             # Sprawdzenie czy `insert_reservation_id` już istnieje w tabeli wizyt
-            existing_appointment_reservation_ids = room_service.get_all_reservation_ids_from_appointments()
-            if insert_reservation_id is not None and insert_reservation_id in existing_appointment_reservation_ids:
+            if used_in_appointments:
                 errors.append(f"Rezerwacja o ID {insert_reservation_id} już istnieje w tabeli wizyty.")
 
-            existing_internal_reservation_ids = room_service.get_all_reservation_ids_from_internal_meetings()
-            if insert_reservation_id is not None and insert_reservation_id in existing_internal_reservation_ids:
+            if used_in_meetings:
                 errors.append(f"Rezerwacja o ID {insert_reservation_id} już istnieje w tabeli spotkania wewnętrzne.")
 
-            existing_room_reservation_ids = room_service.get_all_reservation_ids()
-            if insert_reservation_id is not None and insert_reservation_id not in existing_room_reservation_ids:
+            if not reservation_exists:
                 errors.append(f"Rezerwacja o ID {insert_reservation_id}  nie istnieje w tabeli rezerwacje.")
     
 
@@ -1775,32 +1867,37 @@ class BridgeRoom(QObject):
                 return
 
             # **Inicjalizacja kontrolerów**
-            room_service = RoomService(self.main_controller)
+            room_service = self.main_controller.get_service("room")
             internal_meetings_controller = InternalMeetingsController(self.main_controller.db_controller)
 
+            # **Sprawdzenie spotkania, typu spotkania i rezerwacji jednym zapytaniem**
+            validation_service = self.main_controller.get_service("validation")
+            (meeting_exists, meeting_type_exists, used_in_appointments,
+             used_in_meetings, reservation_exists) = validation_service.check(
+                ExistsProbe("internal_meetings", {"meeting_id": insert_meeting_id}),
+                ExistsProbe("meeting_types", {"meeting_type_id": insert_meeting_type_id}),
+                ExistsProbe("appointments", {"fk_reservation_id": insert_reservation_id}),
+                ExistsProbe("internal_meetings", {"fk_reservation_id": insert_reservation_id}),
+                ExistsProbe("room_reservations", {"reservation_id": insert_reservation_id}),
+            )
+
             # **Sprawdzenie czy `insert_meeting_id` istnieje**
-            all_meeting_ids = room_service.get_all_meeting_ids()
-            if insert_meeting_id not in all_meeting_ids:
+            if not meeting_exists:
                 errors.append(f"Spotkanie o ID {insert_meeting_id} nie istnieje w systemie.")
 
             # **Sprawdzenie czy `insert_meeting_type_id` istnieje (jeśli podano)**
-            if insert_meeting_type_id is not None:
-                all_meeting_type_ids = room_service.get_all_room_type_ids()
-                if insert_meeting_type_id not in all_meeting_type_ids:
-                    errors.append(f"Typ spotkania o ID {insert_meeting_type_id} nie istnieje w systemie.")
+            if insert_meeting_type_id is not None and not meeting_type_exists:
+                errors.append(f"Typ spotkania o ID {insert_meeting_type_id} nie istnieje w systemie.")
 
             # **Sprawdzenie czy `insert_reservation_id` istnieje i czy nie jest zajęte (jeśli podano)**
             if insert_reservation_id is not None:
-                existing_appointment_reservation_ids = room_service.get_all_reservation_ids_from_appointments()
-                if insert_reservation_id in existing_appointment_reservation_ids:
+                if used_in_appointments:
                     errors.append(f"Rezerwacja o ID {insert_reservation_id} już istnieje w tabeli wizyty.")
 
-                existing_internal_reservation_ids = room_service.get_all_reservation_ids_from_internal_meetings()
-                if insert_reservation_id in existing_internal_reservation_ids:
+                if used_in_meetings:
                     errors.append(f"Rezerwacja o ID {insert_reservation_id} już istnieje w tabeli spotkań wewnętrznych.")
 
-                existing_room_reservation_ids = room_service.get_all_reservation_ids()
-                if insert_reservation_id not in existing_room_reservation_ids:
+                if not reservation_exists:
                     errors.append(f"Rezerwacja o ID {insert_reservation_id} nie istnieje w tabeli rezerwacji.")
 
                 # Pobranie i zmodyfikowanie daty rezerwacji
@@ -1897,14 +1994,11 @@ class BridgeRoom(QObject):
 
         try:
             # Inicjalizacja kontrolerów
-            room_service = RoomService(self.main_controller)
+            validation_service = self.main_controller.get_service("validation")
             internal_meetings_controller = InternalMeetingsController(self.main_controller.db_controller)
 
-            # Pobranie wszystkich `meeting_id` z bazy
-            all_meeting_ids = room_service.get_all_meeting_ids()
-
             # Sprawdzenie, czy podany `insert_meeting_id` istnieje w bazie
-            if insert_meeting_id not in all_meeting_ids:
+            if not validation_service.exists("internal_meetings", "meeting_id", insert_meeting_id):
                 msg = f"Spotkanie o ID ({insert_meeting_id}) nie istnieje w bazie."
                 print(f"[BridgeRoom_deleteInternalMeeting] {msg}")
                 self.internalMeetingDeletionFailed.emit(msg)
@@ -1965,18 +2059,20 @@ class BridgeRoom(QObject):
                 return
 
             # Inicjalizacja kontrolerów
-            room_service = RoomService(self.main_controller)
-            employees_controller = EmployeesController(self.main_controller.db_controller)
+            validation_service = self.main_controller.get_service("validation")
             meeting_participants_controller = MeetingParticipantsController(self.main_controller.db_controller)
 
+            meeting_exists, employee_exists = validation_service.check(
+                ExistsProbe("internal_meetings", {"meeting_id": insert_meeting_id}),
+                ExistsProbe("employees", {"employee_id": insert_employee_id}),
+            )
+
             # **Sprawdzenie czy `insert_meeting_id` istnieje w systemie**
-            all_meeting_ids = room_service.get_all_meeting_ids()
-            if insert_meeting_id not in all_meeting_ids:
+            if not meeting_exists:
                 errors.append(f"Spotkanie o ID {insert_meeting_id} nie istnieje w systemie.")
 
             # **Sprawdzenie czy `insert_employee_id` istnieje w systemie**
-            all_employee_ids = employees_controller.get_all_employee_ids()
-            if insert_employee_id not in all_employee_ids:
+            if not employee_exists:
                 errors.append(f"Pracownik o ID {insert_employee_id} nie istnieje w systemie.")
 
             # **Walidacja `insert_participant_role` oraz `insert_attendance` (niewrażliwa na wielkość liter)**
@@ -2073,26 +2169,26 @@ class BridgeRoom(QObject):
                 return
 
             # **Inicjalizacja kontrolerów**
-            room_service = RoomService(self.main_controller)
-            employees_controller = EmployeesController(self.main_controller.db_controller)
+            validation_service = self.main_controller.get_service("validation")
             meeting_participants_controller = MeetingParticipantsController(self.main_controller.db_controller)
 
+            participant_exists, meeting_exists, employee_exists = validation_service.check(
+                ExistsProbe("meeting_participants", {"participant_id": insert_participant_id}),
+                ExistsProbe("internal_meetings", {"meeting_id": insert_meeting_id}),
+                ExistsProbe("employees", {"employee_id": insert_employee_id}),
+            )
+
             # **Sprawdzenie czy `insert_participant_id` istnieje**
-            all_participant_ids = room_service.get_all_participant_ids()
-            if insert_participant_id not in all_participant_ids:
+            if not participant_exists:
                 errors.append(f"Uczestnik o ID {insert_participant_id} nie istnieje w systemie.")
 
             # **Sprawdzenie czy `insert_meeting_id` istnieje (jeśli podano)**
-            if insert_meeting_id is not None:
-                all_meeting_ids = room_service.get_all_meeting_ids()
-                if insert_meeting_id not in all_meeting_ids:
-                    errors.append(f"Spotkanie o ID {insert_meeting_id} nie istnieje w systemie.")
+            if insert_meeting_id is not None and not meeting_exists:
+                errors.append(f"Spotkanie o ID {insert_meeting_id} nie istnieje w systemie.")
 
             # **Sprawdzenie czy `insert_employee_id` istnieje (jeśli podano)**
-            if insert_employee_id is not None:
-                all_employee_ids = employees_controller.get_all_employee_ids()
-                if insert_employee_id not in all_employee_ids:
-                    errors.append(f"Pracownik o ID {insert_employee_id} nie istnieje w systemie.")
+            if insert_employee_id is not None and not employee_exists:
+                errors.append(f"Pracownik o ID {insert_employee_id} nie istnieje w systemie.")
 
             # **Walidacja `insert_participant_role` oraz `insert_attendance` (niewrażliwa na wielkość liter)**
             valid_roles = ["Organizator", "Uczestnik"]
@@ -2186,14 +2282,11 @@ class BridgeRoom(QObject):
             return
 
         try:
-            room_service = RoomService(self.main_controller)
+            validation_service = self.main_controller.get_service("validation")
             meeting_participants_controller = MeetingParticipantsController(self.main_controller.db_controller)
 
-            # **Pobranie wszystkich participant_id z bazy**
-            all_participant_ids = room_service.get_all_participant_ids()
-
             # **Sprawdzenie, czy `insert_participant_id` istnieje w bazie**
-            if insert_participant_id not in all_participant_ids:
+            if not validation_service.exists("meeting_participants", "participant_id", insert_participant_id):
                 msg = f"Uczestnik o ID ({insert_participant_id}) nie istnieje w bazie."
                 print(f"[BridgeRoom_deleteParticipant] {msg}")
                 self.participantDeletionFailed.emit(msg)
@@ -2227,31 +2320,18 @@ class BridgeRoom(QObject):
     @Slot()
     def updateMeetingParticipantsList(self):
         """
-        Pobiera listę uczestników spotkań i emituje sygnał do QML.
+        Pobiera listę uczestników spotkań (w wątku roboczym) i emituje sygnał do QML.
         """
-        try:
-            # Pobranie danych uczestników spotkań z serwisu pokoi
-            room_service = RoomService(self.main_controller)
-            meeting_participants_list = room_service.get_meeting_participants_table()
-
-            # Debugowanie pobranych danych
-            # print(f"[BridgeRoom_updateMeetingParticipantsList] Pobranie uczestników spotkań: {meeting_participants_list}")
+        self.worker.load_list(
+            "BridgeRoom_updateMeetingParticipantsList",
+            lambda main_controller: main_controller.get_service("room").get_meeting_participants_table(),
+            self._set_meeting_participants_list,
+            self.meetingParticipantsListChanged,
+        )
 
-            # Aktualizacja listy uczestników spotkań
-            self._meeting_participants_list = meeting_participants_list
-
-            # Emitowanie sygnału z listą uczestników spotkań
-            self.meetingParticipantsListChanged.emit(self._meeting_participants_list)
-
-        except KeyError as ke:
-            print(f"[BridgeRoom_updateMeetingParticipantsList] Klucz nie znaleziony w danych uczestników spotkań: {ke}")
-            self.meetingParticipantsListChanged.emit([])  # Emituj pustą listę w przypadku błędu
-        except ValueError as ve:
-            print(f"[BridgeRoom_updateMeetingParticipantsList] Błąd w wartościach danych uczestników spotkań: {ve}")
-            self.meetingParticipantsListChanged.emit([])  # Emituj pustą listę w przypadku błędu
-        except RuntimeError as rue:
-            print(f"[BridgeRoom_updateMeetingParticipantsList] Błąd bazy danych: {rue}")
-            self.meetingParticipantsListChanged.emit([])  # Emituj pustą listę w przypadku błędu
+    def _set_meeting_participants_list(self, items):
+        self._meeting_participants_list = items
+        self.meetingParticipantsListChanged.emit(self._meeting_participants_list)
 
     @Slot(result=list)
     def getMeetingParticipantsList(self):
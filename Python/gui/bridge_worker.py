@@ -0,0 +1,146 @@
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot # pylint: disable=E0611
+
+
+class _BridgeTask(QRunnable):
+    """
+    Zadanie wykonywane w wątku roboczym `BridgeWorker`.
+
+    Wynik lub wyjątek jest przekazywany z powrotem sygnałami workera, które Qt dostarcza
+    w wątku GUI (połączenie kolejkowane), więc callbacki mogą bezpiecznie emitować sygnały do QML.
+    """
+
+    def __init__(self, worker, request_name, generation, task, args):
+        super().__init__()
+        self._worker = worker
+        self._request_name = request_name
+        self._generation = generation
+        self._task = task
+        self._args = args
+
+    def run(self):
+        # Zadanie zastąpione nowszym żądaniem przed uruchomieniem - nie ma sensu go wykonywać
+        if self._worker.is_stale(self._request_name, self._generation):
+            return
+
+        try:
+            result = self._task(self._worker.main_controller, *self._args)
+        except Exception as e: # pylint: disable=broad-except
+            self._worker.taskFailed.emit(self._request_name, self._generation, e)
+            return
+
+        self._worker.taskFinished.emit(self._request_name, self._generation, result)
+
+
+class BridgeWorker(QObject):
+    """
+    Warstwa wykonywania zadań mostków QML poza wątkiem GUI.
+
+    Zadania (zapytania SQLite, bcrypt) są uruchamiane w jednym wątku `QThreadPool` na tym samym
+    `MainController` co wątek GUI - `DatabaseController` przydziela wątkowi roboczemu własne połączenie
+    SQLite, a pamięci podręczne (słowniki, dostępność pokoi, uprawnienia, sesje) pozostają wspólne,
+    więc zmiana zapisana w jednym wątku unieważnia je także dla drugiego. Wyniki wracają do wątku GUI
+    i są przekazywane do callbacków mostka, które emitują istniejące sygnały sukcesu/błędu.
+
+    Każde żądanie ma nazwę (np. "patients"). Nowe żądanie o tej samej nazwie unieważnia poprzednie:
+    wynik starszego żądania jest odrzucany, a jeśli jeszcze nie wystartowało - w ogóle nie jest wykonywane.
+
+    Dla bazy w pamięci (APP_ENV=test) drugie połączenie widziałoby pustą bazę, dlatego zadania
+    są wtedy wykonywane synchronicznie na `main_controller` wątku GUI.
+    """
+
+    taskFinished = Signal(str, int, object)
+    taskFailed = Signal(str, int, object)
+
+    def __init__(self, main_controller, synchronous=None, parent=None):
+        super().__init__(parent)
+        self.main_controller = main_controller
+        if synchronous is None:
+            synchronous = main_controller.db_controller.database_path == ":memory:"
+        self.synchronous = synchronous
+
+        self._generations = {}  # {nazwa_żądania: numer ostatniego żądania}
+        self._callbacks = {}  # {nazwa_żądania: (on_success, on_failure)} - tylko dla najnowszego żądania
+
+        # Jeden wątek = jedno połączenie; zapisy w SQLite i tak są serializowane
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._pool.setExpiryTimeout(-1)  # Wątek (i jego połączenie) żyje do zamknięcia aplikacji
+
+        self.taskFinished.connect(self._on_task_finished)
+        self.taskFailed.connect(self._on_task_failed)
+
+    def is_stale(self, request_name, generation):
+        """
+        Sprawdza, czy żądanie zostało zastąpione nowszym żądaniem o tej samej nazwie.
+        """
+        return self._generations.get(request_name) != generation
+
+    def run(self, request_name, task, args=(), on_success=None, on_failure=None):
+        """
+        Uruchamia zadanie `task(main_controller, *args)` w wątku roboczym.
+
+        :param request_name: Nazwa żądania; nowsze żądanie o tej nazwie unieważnia starsze.
+        :param task: Funkcja wykonywana poza wątkiem GUI. Nie może dotykać obiektów Qt/QML.
+        :param args: Argumenty zadania (wartości, nie obiekty Qt).
+        :param on_success: Callback `on_success(result)` wywoływany w wątku GUI.
+        :param on_failure: Callback `on_failure(exception)` wywoływany w wątku GUI.
+        :return: Numer żądania.
+        """
+        generation = self._generations.get(request_name, 0) + 1
+        self._generations[request_name] = generation
+        self._callbacks[request_name] = (on_success, on_failure)
+
+        if self.synchronous:
+            try:
+                result = task(self.main_controller, *args)
+            except Exception as e: # pylint: disable=broad-except
+                self._on_task_failed(request_name, generation, e)
+            else:
+                self._on_task_finished(request_name, generation, result)
+        else:
+            self._pool.start(_BridgeTask(self, request_name, generation, task, args))
+
+        return generation
+
+    def load_list(self, request_name, task, on_loaded, list_signal, args=()):
+        """
+        Pobiera listę w wątku roboczym i przekazuje ją do `on_loaded(list)` w wątku GUI.
+        W przypadku błędu emituje pustą listę sygnałem `list_signal` (jak dotychczasowe sloty `update*List`).
+
+        :param request_name: Nazwa żądania, używana też jako prefiks komunikatów, np. "BridgeRoom_updateRoomsList".
+        """
+        def on_failure(error):
+            print(f"[{request_name}] Błąd podczas pobierania danych: {error}")
+            list_signal.emit([])
+
+        return self.run(request_name, task, args, on_loaded, on_failure)
+
+    @Slot(str, int, object)
+    def _on_task_finished(self, request_name, generation, result):
+        if self.is_stale(request_name, generation):
+            print(f"[BridgeWorker] Odrzucono nieaktualny wynik żądania '{request_name}' ({generation})")
+            return
+        on_success, _ = self._callbacks.pop(request_name, (None, None))
+        if on_success is not None:
+            on_success(result)
+
+    @Slot(str, int, object)
+    def _on_task_failed(self, request_name, generation, error):
+        if self.is_stale(request_name, generation):
+            print(f"[BridgeWorker] Odrzucono błąd nieaktualnego żądania '{request_name}' ({generation}): {error}")
+            return
+        _, on_failure = self._callbacks.pop(request_name, (None, None))
+        if on_failure is not None:
+            on_failure(error)
+        else:
+            print(f"[BridgeWorker] Błąd żądania '{request_name}': {error}")
+
+    def shutdown(self):
+        """
+        Czeka na zakończenie zadań i zamyka połączenie wątku roboczego.
+        """
+        self._pool.waitForDone()
+        if not self.synchronous:
+            # Połączenie wątku roboczego jest zamykane w tym wątku; połączenie wątku GUI pozostaje otwarte
+            self._pool.start(self.main_controller.db_controller.connection_manager.close_thread_connection)
+            self._pool.waitForDone()
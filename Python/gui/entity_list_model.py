@@ -0,0 +1,205 @@
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt, Signal, Slot, Property # pylint: disable=E0611
+
+
+class EntityListModel(QAbstractListModel):
+    """
+    Model listy rekordów jednej encji (np. pacjentów, wizyt, pokoi) udostępniany do QML.
+
+    Wiersze są identyfikowane kluczem głównym (`key_field`), a zmiany są stosowane na poziomie
+    pojedynczych wierszy (wstawienie / aktualizacja / usunięcie / przeniesienie), więc edycja
+    jednego rekordu powoduje jedną aktualizację modelu zamiast przebudowy wszystkich delegatów.
+
+    Role modelu odpowiadają nazwom pól (`fields`), dzięki czemu delegaty w QML korzystają
+    z nich tak samo jak z `ListModel`, np. `model.patient_id`. Wartości None są zastępowane
+    tekstem `placeholder` (jak dotychczas robiły to widoki QML).
+    """
+
+    countChanged = Signal()
+
+    def __init__(self, key_field, fields, placeholder="Brak danych", parent=None):
+        super().__init__(parent)
+        self.key_field = key_field
+        self.fields = list(fields)
+        self.placeholder = placeholder
+        self._rows = []
+        self._index_by_key = {}  # {klucz: numer wiersza}
+        self._roles = {Qt.UserRole + 1 + number: field for number, field in enumerate(self.fields)}
+
+    # +-+-+-+- Interfejs QAbstractListModel +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+    def rowCount(self, parent=QModelIndex()): # pylint: disable=invalid-name
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        field = self._roles.get(role)
+        if field is None:
+            return None
+        return self._rows[index.row()].get(field)
+
+    def roleNames(self): # pylint: disable=invalid-name
+        return {role: field.encode("utf-8") for role, field in self._roles.items()}
+
+    def get_count(self):
+        return len(self._rows)
+
+    count = Property(int, get_count, notify=countChanged)
+
+    @Slot(int, result="QVariantMap")
+    def get(self, row):
+        """
+        Zwraca rekord z wiersza `row` (dla QML, jak `ListModel.get`).
+        """
+        return dict(self._rows[row]) if 0 <= row < len(self._rows) else {}
+
+    @Slot(result=list)
+    def toList(self): # pylint: disable=invalid-name
+        """
+        Zwraca kopię wszystkich rekordów modelu.
+        """
+        return [dict(row) for row in self._rows]
+
+    # +-+-+-+- Zmiany na poziomie wierszy +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+    def _normalize(self, row):
+        normalized = {field: row.get(field) for field in self.fields}
+        for field, value in normalized.items():
+            if value is None:
+                normalized[field] = self.placeholder
+        return normalized
+
+    def _reindex(self, start=0):
+        for number in range(start, len(self._rows)):
+            self._index_by_key[self._rows[number][self.key_field]] = number
+
+    def _update_at(self, number, row):
+        if self._rows[number] == row:
+            return False
+        changed_roles = [role for role, field in self._roles.items() if self._rows[number].get(field) != row.get(field)]
+        self._rows[number] = row
+        model_index = self.index(number, 0)
+        self.dataChanged.emit(model_index, model_index, changed_roles)
+        return True
+
+    def _insert_at(self, number, rows):
+        self.beginInsertRows(QModelIndex(), number, number + len(rows) - 1)
+        self._rows[number:number] = rows
+        self._reindex(number)
+        self.endInsertRows()
+
+    def _remove_at(self, number, reindex=True):
+        self.beginRemoveRows(QModelIndex(), number, number)
+        removed = self._rows.pop(number)
+        del self._index_by_key[removed[self.key_field]]
+        if reindex:
+            self._reindex(number)
+        self.endRemoveRows()
+
+    def _move(self, source, destination):
+        # beginMoveRows oczekuje pozycji docelowej sprzed usunięcia wiersza źródłowego
+        destination_child = destination + 1 if destination > source else destination
+        self.beginMoveRows(QModelIndex(), source, source, QModelIndex(), destination_child)
+        self._rows.insert(destination, self._rows.pop(source))
+        self._reindex(min(source, destination))
+        self.endMoveRows()
+
+    def contains_key(self, key):
+        """
+        Sprawdza, czy model zawiera wiersz o podanym kluczu.
+        """
+        return key in self._index_by_key
+
+    def upsert_row(self, row):
+        """
+        Aktualizuje wiersz o kluczu rekordu lub dopisuje go na końcu modelu.
+
+        :return: True, jeśli model się zmienił.
+        """
+        row = self._normalize(row)
+        number = self._index_by_key.get(row[self.key_field])
+        if number is not None:
+            return self._update_at(number, row)
+
+        self._insert_at(len(self._rows), [row])
+        self.countChanged.emit()
+        return True
+
+    def remove_key(self, key):
+        """
+        Usuwa wiersz o podanym kluczu.
+
+        :return: True, jeśli wiersz istniał.
+        """
+        number = self._index_by_key.get(key)
+        if number is None:
+            return False
+        self._remove_at(number)
+        self.countChanged.emit()
+        return True
+
+    def append_rows(self, rows):
+        """
+        Dopisuje rekordy na końcu modelu (np. kolejna strona listy); istniejące klucze są aktualizowane.
+        """
+        new_rows = []
+        for row in rows:
+            row = self._normalize(row)
+            number = self._index_by_key.get(row[self.key_field])
+            if number is not None:
+                self._update_at(number, row)
+            else:
+                new_rows.append(row)
+
+        if new_rows:
+            self._insert_at(len(self._rows), new_rows)
+            self.countChanged.emit()
+
+    def set_rows(self, rows):
+        """
+        Ustawia zawartość modelu na `rows`, stosując tylko różnice względem obecnych wierszy
+        (usunięcia, przeniesienia, wstawienia i aktualizacje zmienionych wierszy).
+        """
+        new_rows = [self._normalize(row) for row in rows]
+        new_keys = {row[self.key_field] for row in new_rows}
+        count_before = len(self._rows)
+
+        # Usunięcie wierszy, których nie ma w nowej liście (od końca, aby nie przesuwać indeksów)
+        for number in range(len(self._rows) - 1, -1, -1):
+            if self._rows[number][self.key_field] not in new_keys:
+                self._remove_at(number, reindex=False)
+        self._index_by_key = {}
+        self._reindex()
+
+        number = 0
+        while number < len(new_rows):
+            current = self._index_by_key.get(new_rows[number][self.key_field])
+            if current is None:
+                # Ciąg kolejnych nowych rekordów jest wstawiany jedną operacją
+                end = number + 1
+                while end < len(new_rows) and new_rows[end][self.key_field] not in self._index_by_key:
+                    end += 1
+                self._insert_at(number, new_rows[number:end])
+                number = end
+                continue
+
+            # Wiersze przed `number` są już na swoich miejscach, więc current > number
+            if current != number:
+                self._move(current, number)
+            self._update_at(number, new_rows[number])
+            number += 1
+
+        if len(self._rows) != count_before:
+            self.countChanged.emit()
+
+    def clear(self):
+        """
+        Usuwa wszystkie wiersze modelu.
+        """
+        if not self._rows:
+            return
+        self.beginResetModel()
+        self._rows = []
+        self._index_by_key = {}
+        self.endResetModel()
+        self.countChanged.emit()
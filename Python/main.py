@@ -4,6 +4,7 @@
 import os
 import sys
 from pathlib import Path
+from startup_timer import STARTUP_TIMER  # Pierwszy import aplikacji - początek pomiaru czasu uruchamiania
 from PySide6.QtCore import QObject, Signal, Property, QTimer
 from PySide6.QtQuickControls2 import QQuickStyle
 from PySide6.QtGui import QGuiApplication, Qt
@@ -14,6 +15,7 @@ from gui.backend_bridge import BackendBridge   # Import klasy Backend
 from gui.bridge_employee import BridgeEmployee
 from gui.bridge_room import BridgeRoom
 from gui.bridge_admin import BridgeAdmin
+from gui.bridge_worker import BridgeWorker
 
 
 QQuickStyle.setStyle("Basic")  # Możliwe wartości: "Basic" "Material" "Fusion" "Imagine" "Default"
@@ -109,6 +111,7 @@ class GeometryManager(QObject):
  # --------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
+    STARTUP_TIMER.mark("Importy modułów")
     app = QGuiApplication(sys.argv)
     engine = QQmlApplicationEngine()
 
@@ -119,27 +122,32 @@ if __name__ == '__main__':
         engine.addImportPath(os.fspath(app_dir / path))
 
     # Integracja z MainController
+    STARTUP_TIMER.mark("Inicjalizacja Qt")
     main_controller = MainController()
-    main_controller.initialize_application()
+    main_controller.initialize_application(STARTUP_TIMER)
+
+    # Wspólny wątek roboczy mostków (zapytania SQLite i bcrypt poza wątkiem GUI)
+    bridge_worker = BridgeWorker(main_controller)
+    app.aboutToQuit.connect(bridge_worker.shutdown)
 
     # Tworzenie instancji klasy BackendBridge
-    backend_bridge = BackendBridge(main_controller)
+    backend_bridge = BackendBridge(main_controller, worker=bridge_worker)
 
     print("Rejestracja backendBridge w QML")
     # Rejestracja obiektu Backend w kontekście QML
     engine.rootContext().setContextProperty("backendBridge", backend_bridge)
 
-    bridge_employee = BridgeEmployee(main_controller)  # Drugi backend bridge
+    bridge_employee = BridgeEmployee(main_controller, worker=bridge_worker)  # Drugi backend bridge
     backend_bridge.bridge_employee = bridge_employee  # Dodaj referencję
     print("Rejestracja bridgeEmployee w QML")
     engine.rootContext().setContextProperty("bridgeEmployee", bridge_employee)
 
-    bridge_room = BridgeRoom(main_controller)  # Drugi backend bridge
+    bridge_room = BridgeRoom(main_controller, worker=bridge_worker)  # Drugi backend bridge
     backend_bridge.bridge_room = bridge_room  # Dodaj referencję
     print("Rejestracja bridgeRoom w QML")
     engine.rootContext().setContextProperty("bridgeRoom", bridge_room)
 
-    bridge_admin = BridgeAdmin(main_controller)  # Drugi backend bridge
+    bridge_admin = BridgeAdmin(main_controller, worker=bridge_worker)  # Drugi backend bridge
     backend_bridge.bridge_admin = bridge_admin  # Dodaj referencję
     print("Rejestracja bridgeAdmin w QML")
     engine.rootContext().setContextProperty("bridgeAdmin", bridge_admin)
@@ -148,6 +156,7 @@ if __name__ == '__main__':
     logical_dpi = app.primaryScreen().logicalDotsPerInch() / 96.0  # Zakładając bazowe DPI 96
     print(f"DPI Scaling Factor: {logical_dpi}")  # Wyświetlenie wartości
     engine.rootContext().setContextProperty("dpiScalingFactor", logical_dpi)
+    STARTUP_TIMER.mark("Mostki QML")
 
  # ------------------------------------------------------------------------------------------------
 
@@ -157,6 +166,8 @@ if __name__ == '__main__':
     engine.load(qml_file)
     if not engine.rootObjects():
         sys.exit(-1)
+    STARTUP_TIMER.mark("Ładowanie QML")
+    STARTUP_TIMER.print_report()
 
     # Pobierz główny obiekt okna
     root_objects = engine.rootObjects()
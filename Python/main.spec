@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('database', 'database'), ('..\\Projekt_inzContent', 'Projekt_inzContent')],
-    hiddenimports=['bcrypt'],
+    hiddenimports=['bcrypt', 'services.admin_service', 'services.dashboard_service', 'services.employee_service', 'services.patients_service', 'services.room_service', 'services.search_service', 'services.validation_service'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -6,12 +6,23 @@ from controllers.patients_controller import PatientController
 from controllers.employees_controller import EmployeesController
 from controllers.services_controller import ServicesController
 from controllers.rooms_controller import RoomsController
+from database.batch import BatchWriter
 
 class Appointments:
     """
     Klasa odpowiedzialna za zarządzanie tabelą `appointments` w kontekście operacji CRUD.
     """
 
+    # Kolumny zapisywane przez operacje na wielu rekordach
+    BATCH_COLUMNS = (
+        "fk_assignment_id", "fk_service_id", "fk_reservation_id", "appointment_date", "appointment_status", "notes"
+    )
+    BATCH_REFERENCES = {
+        "fk_assignment_id": ("assigned_patients", "assignment_id", "Przypisanie o ID {value} nie istnieje w systemie."),
+        "fk_service_id": ("services", "service_id", "Usługa o ID {value} nie istnieje w systemie."),
+        "fk_reservation_id": ("room_reservations", "reservation_id", "Rezerwacja o ID {value} nie istnieje w systemie."),
+    }
+
     def __init__(self, db_controller: DatabaseController):
         """
         Inicjalizuje instancję klasy Appointments z kontrolerem bazy danych.
@@ -30,6 +41,7 @@ class Appointments:
             self.db_controller.ensure_connection()
             if not self.db_controller.table_exists("appointments"):
                 query = """
+                CREATE TABLE IF NOT EXISTS appointments (
                     appointment_id INTEGER PRIMARY KEY AUTOINCREMENT,
                     fk_assignment_id INTEGER NOT NULL, -- Klucz obcy odwołujący się do tabeli assigned_patients
                     fk_service_id INTEGER NOT NULL,
@@ -50,6 +62,7 @@ class Appointments:
                     FOREIGN KEY (fk_room_id) REFERENCES rooms(room_id) ON DELETE SET NULL ON UPDATE CASCADE,
                     UNIQUE (fk_assignment_id, appointment_date), -- Zapobiega powtórzeniom przypisania i daty wizyty
                     UNIQUE (fk_room_id, appointment_date) -- Zapobiega powtórzeniom pokoju i daty wizyty
+                )
                 """
                 self.db_controller.connection.execute(query)
                 self.db_controller.connection.commit()
@@ -116,10 +129,7 @@ class Appointments:
         """
         try:
             self.db_controller.ensure_connection()
-            query_conditions, values = self.db_controller.build_filters(filters, sort_by)
-            query = f"SELECT * FROM appointments WHERE {query_conditions}"
-            cursor = self.db_controller.connection.execute(query, values)
-            return [dict(row) for row in cursor.fetchall()]
+            return self.db_controller.select_filtered("appointments", filters, sort_by)
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas pobierania rekordów: {e}") from e
 
@@ -380,3 +390,44 @@ class Appointments:
 
         except sqlite3.DatabaseError as db_err:
             raise RuntimeError(f"Błąd bazy danych podczas pobierania `fk_assignment_id` dla `appointment_id` {appointment_id}.") from db_err
+
+
+
+    def add_many(self, appointments: list) -> list:
+        """
+        Dodaje wiele wizyt w jednej transakcji.
+
+        :param appointments: Lista słowników z kolumnami `BATCH_COLUMNS`
+            (`fk_service_id`, `fk_reservation_id` i `notes` domyślnie None).
+        :return: Lista wyników wierszy {"index", "success", "error", "id"} w kolejności wejściowej.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        batch_writer = BatchWriter(self.db_controller)
+        rows = [{"fk_service_id": None, "fk_reservation_id": None, "notes": None, **appointment} for appointment in appointments]
+        errors = batch_writer.reference_errors(rows, self.BATCH_REFERENCES)
+        return batch_writer.insert_many("appointments", self.BATCH_COLUMNS, rows, errors)
+
+    def update_many(self, updates: list) -> list:
+        """
+        Aktualizuje wiele wizyt w jednej transakcji (np. zmiana statusu wszystkich wizyt dnia).
+
+        :param updates: Lista słowników z `appointment_id` i zmienianymi kolumnami, np.
+            [{"appointment_id": 7, "appointment_status": "Odwołana"}].
+        :return: Lista wyników wierszy {"index", "success", "error", "id"} w kolejności wejściowej.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        batch_writer = BatchWriter(self.db_controller)
+        errors = batch_writer.reference_errors(updates, self.BATCH_REFERENCES)
+        return batch_writer.update_many(
+            "appointments", "appointment_id", updates, errors, allowed_columns=self.BATCH_COLUMNS
+        )
+
+    def delete_many(self, appointment_ids: list) -> list:
+        """
+        Usuwa wiele wizyt w jednej transakcji.
+
+        :param appointment_ids: Lista ID wizyt.
+        :return: Lista wyników wierszy {"index", "success", "error", "id"} w kolejności wejściowej.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        return BatchWriter(self.db_controller).delete_many("appointments", "appointment_id", appointment_ids)
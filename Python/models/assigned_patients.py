@@ -4,6 +4,8 @@ import sqlite3
 from controllers.database_controller import DatabaseController
 from controllers.users_accounts_controller import UsersAccountsController
 from controllers.patients_controller import PatientController
+from database.batch import BatchWriter
+from database.schema_catalog import get_valid_columns  # pylint: disable=unused-import # Dostępne też pod dawną ścieżką
 from validators.assigned_patients_model_validation import (
     validate_name,
     validate_user_name,
@@ -15,24 +17,18 @@ from validators.assigned_patients_model_validation import (
 )
 
 
-def get_valid_columns(db_controller, table_name: str) -> list:
-    """
-    Pobiera listę kolumn dla podanej tabeli z bazy danych.
-    :param db_controller: Obiekt kontrolera bazy danych.
-    :param table_name: Nazwa tabeli.
-    :return: Lista nazw kolumn.
-    """
-    db_controller.ensure_connection()
-    query = f"PRAGMA table_info({table_name})"
-    cursor = db_controller.connection.execute(query)
-    return [row["name"] for row in cursor.fetchall()]
-
-
 class AssignedPatients:
     """
     Klasa zarządzająca tabelą `assigned_patients` dla operacji CRUD.
     """
 
+    # Kolumny zapisywane przez operacje na wielu rekordach
+    BATCH_COLUMNS = ("fk_patient_id", "fk_employee_id", "is_active")
+    BATCH_REFERENCES = {
+        "fk_patient_id": ("patients", "patient_id", "Pacjent o ID {value} nie istnieje w systemie."),
+        "fk_employee_id": ("employees", "employee_id", "Pracownik o ID {value} nie istnieje w systemie."),
+    }
+
     def __init__(self, db_controller: DatabaseController):
         """
         Inicjalizuje obiekt klasy AssignedPatients.
@@ -532,3 +528,68 @@ class AssignedPatients:
         except ValueError as ve:
             print(f"[### ASSIGNED_PATIENTS_MODEL] Błąd wartości: {ve}")
             return None
+
+
+
+    def get_employee_ids_by_assignment_ids(self, assignment_ids: list) -> set:
+        """
+        Pobiera ID pracowników przypisań o podanych ID (jedno zapytanie dla całej listy).
+
+        :param assignment_ids: Lista ID przypisań.
+        :return: Zbiór ID pracowników (bez przypisań, które nie istnieją).
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        try:
+            self.db_controller.ensure_connection()
+            with self.db_controller.id_sets.bind(assignment_ids) as (id_set_sql, id_set_params):
+                query = f"SELECT DISTINCT fk_employee_id FROM assigned_patients WHERE assignment_id IN {id_set_sql}"
+                cursor = self.db_controller.connection.execute(query, id_set_params)
+                return {row["fk_employee_id"] for row in cursor.fetchall()}
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Błąd podczas pobierania pracowników przypisań: {e}") from e
+
+    def add_many(self, records: list) -> list:
+        """
+        Dodaje wiele przypisań w jednej transakcji.
+
+        :param records: Lista słowników, np. [{"fk_patient_id": 1, "fk_employee_id": 2, "is_active": 1}]
+            (`is_active` domyślnie 1).
+        :return: Lista wyników wierszy {"index", "success", "error", "id"} w kolejności wejściowej.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        batch_writer = BatchWriter(self.db_controller)
+        rows = [{"is_active": 1, **record} for record in records]
+        errors = batch_writer.reference_errors(rows, self.BATCH_REFERENCES)
+        return batch_writer.insert_many("assigned_patients", self.BATCH_COLUMNS, rows, errors)
+
+    def update_many(self, updates: list) -> list:
+        """
+        Aktualizuje wiele przypisań w jednej transakcji (np. przeniesienie pacjentów do innego pracownika).
+
+        :param updates: Lista słowników z `assignment_id` i zmienianymi kolumnami, np.
+            [{"assignment_id": 5, "fk_employee_id": 3}].
+        :return: Lista wyników wierszy {"index", "success", "error", "id"} w kolejności wejściowej.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        batch_writer = BatchWriter(self.db_controller)
+        errors = batch_writer.reference_errors(updates, self.BATCH_REFERENCES)
+        return batch_writer.update_many(
+            "assigned_patients", "assignment_id", updates, errors, allowed_columns=self.BATCH_COLUMNS
+        )
+
+    def delete_many(self, assignment_ids: list) -> list:
+        """
+        Usuwa wiele przypisań w jednej transakcji. Przypisania powiązane z wizytami nie są usuwane.
+
+        :param assignment_ids: Lista ID przypisań.
+        :return: Lista wyników wierszy {"index", "success", "error", "id"} w kolejności wejściowej.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        batch_writer = BatchWriter(self.db_controller)
+        unused = batch_writer.missing_values("appointments", "fk_assignment_id", assignment_ids)
+        errors = {
+            index: f"Nie można usunąć przypisania o ID ({assignment_id}), ponieważ jest ono powiązane z wizytami."
+            for index, assignment_id in enumerate(assignment_ids)
+            if assignment_id is not None and assignment_id not in unused
+        }
+        return batch_writer.delete_many("assigned_patients", "assignment_id", assignment_ids, errors)
@@ -95,10 +95,7 @@ class Diagnoses:
 
             # Pobieranie rekordów
             self.db_controller.ensure_connection()
-            query_conditions, values = self.db_controller.build_filters(filters, sort_by)
-            query = f"SELECT * FROM diagnoses WHERE {query_conditions}"
-            cursor = self.db_controller.connection.execute(query, values)
-            return [dict(row) for row in cursor.fetchall()]
+            return self.db_controller.select_filtered("diagnoses", filters, sort_by)
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas pobierania rekordów: {e}") from e
 
@@ -198,13 +195,15 @@ class Diagnoses:
 
         try:
             self.db_controller.ensure_connection()
-            query = f"""
-            SELECT *
-            FROM diagnoses
-            WHERE appointment_id IN ({','.join(['?'] * len(appointment_ids))})
-            """
-            cursor = self.db_controller.connection.execute(query, appointment_ids)
-            rows = cursor.fetchall()
+            # Zbiór ID jako jeden parametr JSON (duże zbiory - tabela tymczasowa), bez limitu parametrów SQLite
+            with self.db_controller.id_sets.bind(appointment_ids) as (id_set_sql, id_set_params):
+                query = f"""
+                SELECT *
+                FROM diagnoses
+                WHERE appointment_id IN {id_set_sql}
+                """
+                cursor = self.db_controller.connection.execute(query, id_set_params)
+                rows = cursor.fetchall()
 
             result = []
             for row in rows:
@@ -222,7 +221,7 @@ class Diagnoses:
             #     )
 
             return result
-        except sqlite3.Error as e:
+        except (sqlite3.Error, RuntimeError) as e:
             print(f"[model diagnoses] Błąd SQLite: {e}")
             return []
 
@@ -4,6 +4,7 @@ import sqlite3
 from controllers.database_controller import DatabaseController
 from controllers.employees_controller import EmployeesController
 from controllers.services_controller import ServicesController
+from database.batch import BatchWriter
 from validators.employee_services_model_validation import (
     validate_add_employee_specialty_by_names,
     validate_unique_employee_service_by_names,
@@ -12,23 +13,19 @@ from validators.employee_services_model_validation import (
 )
 
 
-def get_valid_columns(db_controller, table_name: str) -> list:
-    """
-    Pobiera listę kolumn dla podanej tabeli z bazy danych.
-    :param db_controller: Obiekt kontrolera bazy danych.
-    :param table_name: Nazwa tabeli.
-    :return: Lista nazw kolumn.
-    """
-    db_controller.ensure_connection()
-    query = f"PRAGMA table_info({table_name})"
-    cursor = db_controller.connection.execute(query)
-    return [row["name"] for row in cursor.fetchall()]
 
 class EmployeeServices:
     """
     Klasa odpowiedzialna za zarządzanie tabelą `employee_services` w kontekście operacji CRUD.
     """
 
+    # Kolumny zapisywane przez operacje na wielu rekordach
+    BATCH_COLUMNS = ("employee_id", "service_id", "is_active")
+    BATCH_REFERENCES = {
+        "employee_id": ("employees", "employee_id", "Pracownik o ID {value} nie istnieje w systemie."),
+        "service_id": ("services", "service_id", "Usługa o ID {value} nie istnieje w systemie."),
+    }
+
     def __init__(self, db_controller: DatabaseController):
         """
         Inicjalizuje instancję klasy EmployeeServices z kontrolerem bazy danych.
@@ -334,4 +331,43 @@ class EmployeeServices:
         except KeyError as ke:
             raise KeyError(f"Błąd klucza podczas pobierania employee_service_id: {ke}") from ke
         except ValueError as ve:
-            raise ValueError(f"Błąd wartości w danych employee_service_id: {ve}") from ve
\ No newline at end of file
+            raise ValueError(f"Błąd wartości w danych employee_service_id: {ve}") from ve
+
+
+    # +-+-+-+- metody operacji na wielu rekordach -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+
+
+    def add_many(self, records: list) -> list:
+        """
+        Dodaje wiele przypisań usług do pracowników w jednej transakcji.
+
+        :param records: Lista słowników, np. [{"employee_id": 1, "service_id": 2, "is_active": 1}] (`is_active` domyślnie 1).
+        :return: Lista wyników wierszy {"index", "success", "error", "id"} w kolejności wejściowej.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        batch_writer = BatchWriter(self.db_controller)
+        rows = [{"is_active": 1, **record} for record in records]
+        errors = batch_writer.reference_errors(rows, self.BATCH_REFERENCES)
+        return batch_writer.insert_many("employee_services", self.BATCH_COLUMNS, rows, errors)
+
+    def update_many(self, updates: list) -> list:
+        """
+        Aktualizuje wiele rekordów w jednej transakcji (np. dezaktywacja wszystkich przypisań usługi).
+
+        :param updates: Lista słowników z `employee_service_id` i zmienianymi kolumnami, np.
+            [{"employee_service_id": 4, "is_active": 0}].
+        :return: Lista wyników wierszy {"index", "success", "error", "id"} w kolejności wejściowej.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        batch_writer = BatchWriter(self.db_controller)
+        errors = batch_writer.reference_errors(updates, self.BATCH_REFERENCES)
+        return batch_writer.update_many("employee_services", "employee_service_id", updates, errors, allowed_columns=self.BATCH_COLUMNS)
+
+    def delete_many(self, employee_service_ids: list) -> list:
+        """
+        Usuwa wiele rekordów w jednej transakcji.
+
+        :param employee_service_ids: Lista ID rekordów.
+        :return: Lista wyników wierszy {"index", "success", "error", "id"} w kolejności wejściowej.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        return BatchWriter(self.db_controller).delete_many("employee_services", "employee_service_id", employee_service_ids)
@@ -4,6 +4,7 @@ import sqlite3
 from controllers.database_controller import DatabaseController
 from controllers.employees_controller import EmployeesController
 from controllers.specialties_controller import SpecialtiesController
+from database.batch import BatchWriter
 from validators.employee_specialties_model_validation import (
     validate_employee_id,
     validate_specialty_id,
@@ -13,23 +14,19 @@ from validators.employee_specialties_model_validation import (
 )
 
 
-def get_valid_columns(db_controller, table_name: str) -> list:
-    """
-    Pobiera listę kolumn dla podanej tabeli z bazy danych.
-    :param db_controller: Obiekt kontrolera bazy danych.
-    :param table_name: Nazwa tabeli.
-    :return: Lista nazw kolumn.
-    """
-    db_controller.ensure_connection()
-    query = f"PRAGMA table_info({table_name})"
-    cursor = db_controller.connection.execute(query)
-    return [row["name"] for row in cursor.fetchall()]
 
 class EmployeeSpecialties:
     """
     Klasa odpowiedzialna za zarządzanie tabelą `employee_specialties` w kontekście operacji CRUD.
     """
 
+    # Kolumny zapisywane przez operacje na wielu rekordach
+    BATCH_COLUMNS = ("employee_id", "specialty_id", "is_active")
+    BATCH_REFERENCES = {
+        "employee_id": ("employees", "employee_id", "Pracownik o ID {value} nie istnieje w systemie."),
+        "specialty_id": ("specialties", "specialty_id", "Specjalność o ID {value} nie istnieje w systemie."),
+    }
+
     def __init__(self, db_controller: DatabaseController):
         """
         Inicjalizuje instancję klasy `EmployeeSpecialties` z kontrolerem bazy danych.
@@ -135,7 +132,7 @@ class EmployeeSpecialties:
                 raise RuntimeError("Tabela `employee_specialties` nie istnieje w bazie danych.")
 
             # Pobranie kolumn dla tabeli (dynamicznie)
-            valid_columns = get_valid_columns(self.db_controller, "employee_specialties")
+            valid_columns = self.db_controller.schema_catalog.get_columns("employee_specialties")
 
             # Walidacja filtrów i sortowania
             if filters:
@@ -636,4 +633,43 @@ class EmployeeSpecialties:
                 raise ValueError(f"Nie znaleziono przypisania o ID {employee_specialty_id}.")
                 
         except sqlite3.Error as db_error:
-            raise RuntimeError("Błąd bazy danych podczas aktualizacji przypisania pracownika do specjalności.") from db_error
\ No newline at end of file
+            raise RuntimeError("Błąd bazy danych podczas aktualizacji przypisania pracownika do specjalności.") from db_error
+
+
+    # +-+-+-+- metody operacji na wielu rekordach -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+
+
+    def add_many(self, records: list) -> list:
+        """
+        Dodaje wiele przypisań specjalności do pracowników w jednej transakcji.
+
+        :param records: Lista słowników, np. [{"employee_id": 1, "specialty_id": 2, "is_active": 1}] (`is_active` domyślnie 1).
+        :return: Lista wyników wierszy {"index", "success", "error", "id"} w kolejności wejściowej.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        batch_writer = BatchWriter(self.db_controller)
+        rows = [{"is_active": 1, **record} for record in records]
+        errors = batch_writer.reference_errors(rows, self.BATCH_REFERENCES)
+        return batch_writer.insert_many("employee_specialties", self.BATCH_COLUMNS, rows, errors)
+
+    def update_many(self, updates: list) -> list:
+        """
+        Aktualizuje wiele rekordów w jednej transakcji (np. dezaktywacja wszystkich przypisań specjalności).
+
+        :param updates: Lista słowników z `employee_specialty_id` i zmienianymi kolumnami, np.
+            [{"employee_specialty_id": 4, "is_active": 0}].
+        :return: Lista wyników wierszy {"index", "success", "error", "id"} w kolejności wejściowej.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        batch_writer = BatchWriter(self.db_controller)
+        errors = batch_writer.reference_errors(updates, self.BATCH_REFERENCES)
+        return batch_writer.update_many("employee_specialties", "employee_specialty_id", updates, errors, allowed_columns=self.BATCH_COLUMNS)
+
+    def delete_many(self, employee_specialty_ids: list) -> list:
+        """
+        Usuwa wiele rekordów w jednej transakcji.
+
+        :param employee_specialty_ids: Lista ID rekordów.
+        :return: Lista wyników wierszy {"index", "success", "error", "id"} w kolejności wejściowej.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        return BatchWriter(self.db_controller).delete_many("employee_specialties", "employee_specialty_id", employee_specialty_ids)
@@ -60,6 +60,7 @@ class Employees:
             self.db_controller.connection.execute(query, 
                 (first_name, last_name, email, phone, profession, is_medical_staff, is_active))
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("employees")
         except sqlite3.IntegrityError as e:
             raise ValueError("Błąd unikalności danych (email lub telefon już istnieje).") from e
         except sqlite3.Error as e:
@@ -110,6 +111,7 @@ class Employees:
             query = f"UPDATE employees SET {columns} WHERE employee_id = ?"
             cursor = self.db_controller.connection.execute(query, params)
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("employees")
 
             if cursor.rowcount == 0:
                 raise KeyError(f"Pracownik o ID {employee_id} nie istnieje.")
@@ -135,6 +137,7 @@ class Employees:
         try:
             cursor = self.db_controller.connection.execute(query, params)
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("employees")
 
             if cursor.rowcount == 0:
                 raise KeyError("Brak pracowników spełniających podane kryteria.")
@@ -357,6 +360,7 @@ class Employees:
             query = "DELETE FROM employees WHERE employee_id = ?"
             cursor = self.db_controller.connection.execute(query, (employee_id,))
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("employees")
 
             if cursor.rowcount == 0:
                 raise KeyError(f"Pracownik o ID {employee_id} nie istnieje.")
@@ -12,17 +12,6 @@ from validators.form_types_model_validation import (
    #validate_operator_and_value -->> jest wywoływana w validate_filters_and_sorting
 )
 
-def get_valid_columns(db_controller, table_name: str) -> list:
-    """
-    Pobiera listę kolumn dla podanej tabeli z bazy danych.
-    :param db_controller: Obiekt kontrolera bazy danych.
-    :param table_name: Nazwa tabeli.
-    :return: Lista nazw kolumn.
-    """
-    db_controller.ensure_connection()
-    query = f"PRAGMA table_info({table_name})"
-    cursor = db_controller.connection.execute(query)
-    return [row["name"] for row in cursor.fetchall()]
 
 
 class FormTypes:
@@ -89,6 +78,7 @@ class FormTypes:
             query = "INSERT INTO form_types (form_name) VALUES (?)"
             cursor = self.db_controller.connection.execute(query, (form_name,))
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("form_types")
             return cursor  # Zwracamy kursor
 
         except sqlite3.IntegrityError as e:
@@ -113,11 +103,9 @@ class FormTypes:
             self.db_controller.ensure_connection()
             if not self.db_controller.table_exists("form_types"):
                 raise RuntimeError("Tabela 'form_types' nie istnieje w bazie danych.")
-            valid_columns = get_valid_columns(self.db_controller, "form_types")  # Pobierz kolumny dynamicznie
+            valid_columns = self.db_controller.schema_catalog.get_columns("form_types")  # Pobierz kolumny dynamicznie
             validate_filters_and_sorting(filters, sort_by, valid_columns)
-            query, values = self.db_controller.build_filters(filters, sort_by)
-            cursor = self.db_controller.connection.execute(f"SELECT * FROM form_types WHERE {query}", values)
-            return [dict(row) for row in cursor.fetchall()]
+            return self.db_controller.select_filtered("form_types", filters, sort_by)
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas pobierania rekordów: {e}") from e
 
@@ -139,12 +127,12 @@ class FormTypes:
                 raise RuntimeError(f"Rekord o ID {form_type_id} nie istnieje.")
 
             # Walidacja danych aktualizacji za pomocą validate_update_fields
-            valid_columns = get_valid_columns(self.db_controller, "form_types")
+            valid_columns = self.db_controller.schema_catalog.get_columns("form_types")
             validate_update_fields(updates, valid_columns)
 
 
             # Walidacja danych aktualizacji
-            valid_columns = get_valid_columns(self.db_controller, "form_types")
+            valid_columns = self.db_controller.schema_catalog.get_columns("form_types")
             for column, value in updates.items():
                 if column not in valid_columns:
                     raise ValueError(f"Nieprawidłowa kolumna: {column}")
@@ -157,6 +145,7 @@ class FormTypes:
             params = list(updates.values()) + [form_type_id]
             self.db_controller.connection.execute(query, params)
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("form_types")
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas aktualizowania rekordu: {e}") from e
 
@@ -182,5 +171,6 @@ class FormTypes:
             
             self.db_controller.connection.execute(query, (form_type_id,))
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("form_types")
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas usuwania rekordu: {e}") from e
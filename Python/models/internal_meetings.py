@@ -99,10 +99,7 @@ class InternalMeetings:
                     validate_operator_and_value(filter_item["operator"], filter_item.get("value"))
 
             self.db_controller.ensure_connection()
-            query_conditions, values = self.db_controller.build_filters(filters, sort_by)
-            query = f"SELECT * FROM internal_meetings WHERE {query_conditions}"
-            cursor = self.db_controller.connection.execute(query, values)
-            return [dict(row) for row in cursor.fetchall()]
+            return self.db_controller.select_filtered("internal_meetings", filters, sort_by)
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas pobierania spotkań: {e}") from e
 
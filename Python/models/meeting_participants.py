@@ -179,10 +179,7 @@ class MeetingParticipants:
 
             # Przygotowanie zapytania SQL
             self.db_controller.ensure_connection()
-            query_conditions, values = self.db_controller.build_filters(filters, sort_by)
-            query = f"SELECT * FROM meeting_participants WHERE {query_conditions}"
-            cursor = self.db_controller.connection.execute(query, values)
-            return [dict(row) for row in cursor.fetchall()]
+            return self.db_controller.select_filtered("meeting_participants", filters, sort_by)
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas pobierania uczestników: {e}") from e
 
@@ -10,17 +10,6 @@ from validators.meeting_types_model_validation import (
    #validate_operator_and_value -->> jest wywoływana w validate_filters_and_sorting
 )
 
-def get_valid_columns(db_controller, table_name: str) -> list:
-    """
-    Pobiera listę kolumn dla podanej tabeli z bazy danych.
-    :param db_controller: Obiekt kontrolera bazy danych.
-    :param table_name: Nazwa tabeli.
-    :return: Lista nazw kolumn.
-    """
-    db_controller.ensure_connection()
-    query = f"PRAGMA table_info({table_name})"
-    cursor = db_controller.connection.execute(query)
-    return [row["name"] for row in cursor.fetchall()]
 
 
 class MeetingTypes:
@@ -103,6 +92,7 @@ class MeetingTypes:
             query = "INSERT INTO meeting_types (meeting_type) VALUES (?)"
             self.db_controller.connection.execute(query, (meeting_type,))
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("meeting_types")
         except sqlite3.IntegrityError as e:
             self.db_controller.connection.rollback()
             raise ValueError(f"Błąd podczas dodawania rekordu: {e}") from e
@@ -124,11 +114,9 @@ class MeetingTypes:
             self.db_controller.ensure_connection()
             if not self.db_controller.table_exists("meeting_types"):
                 raise RuntimeError("Tabela 'meeting_types' nie istnieje w bazie danych.")
-            valid_columns = get_valid_columns(self.db_controller, "meeting_types")  # Pobierz kolumny dynamicznie
+            valid_columns = self.db_controller.schema_catalog.get_columns("meeting_types")  # Pobierz kolumny dynamicznie
             validate_filters_and_sorting(filters, sort_by, valid_columns)
-            query, values = self.db_controller.build_filters(filters, sort_by)
-            cursor = self.db_controller.connection.execute(f"SELECT * FROM meeting_types WHERE {query}", values)
-            return [dict(row) for row in cursor.fetchall()]
+            return self.db_controller.select_filtered("meeting_types", filters, sort_by)
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas pobierania rekordów: {e}") from e
 
@@ -150,12 +138,12 @@ class MeetingTypes:
                 raise RuntimeError(f"Rekord o ID {meeting_type_id} nie istnieje.")
 
             # Walidacja danych aktualizacji za pomocą validate_update_fields
-            valid_columns = get_valid_columns(self.db_controller, "meeting_types")
+            valid_columns = self.db_controller.schema_catalog.get_columns("meeting_types")
             validate_update_fields(updates, valid_columns)
 
 
             # Walidacja danych aktualizacji
-            valid_columns = get_valid_columns(self.db_controller, "meeting_types")
+            valid_columns = self.db_controller.schema_catalog.get_columns("meeting_types")
             for column, value in updates.items():
                 if column not in valid_columns:
                     raise ValueError(f"Nieprawidłowa kolumna: {column}")
@@ -168,6 +156,7 @@ class MeetingTypes:
             params = list(updates.values()) + [meeting_type_id]
             self.db_controller.connection.execute(query, params)
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("meeting_types")
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas aktualizowania rekordu: {e}") from e
 
@@ -193,5 +182,6 @@ class MeetingTypes:
             
             self.db_controller.connection.execute(query, (meeting_type_id,))
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("meeting_types")
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas usuwania rekordu: {e}") from e
\ No newline at end of file
@@ -2,6 +2,7 @@
 
 import sqlite3
 from controllers.database_controller import DatabaseController
+from database.form_content import CHUNK_SIZE, FormContentStore
 from validators.patient_forms_model_validation import (
     validate_submission_date,
     validate_fk_patient_id_exists,
@@ -12,17 +13,30 @@ from validators.patient_forms_model_validation import (
 )
 
 
+# Metadane formularza zwracane przez listy - treść pobiera `get_form_content` / `open_form_content`
+LIST_QUERY = """
+SELECT patient_form_id, fk_patient_id, fk_form_type_id, submission_date,
+       (SELECT original_size FROM patient_form_contents WHERE fk_patient_form_id = patient_form_id) AS content_size
+FROM patient_forms
+WHERE {conditions}
+"""
+
+
 class PatientForms:
     """
     Klasa odpowiedzialna za zarządzanie tabelą `patient_forms` w kontekście operacji CRUD.
+
+    Treść formularzy jest przechowywana w postaci skompresowanej w tabeli `patient_form_contents`
+    (`database/form_content.py`), a kolumna `patient_forms.content` pozostaje pusta.
     """
 
     def __init__(self, db_controller: DatabaseController):
         self.db_controller = db_controller
+        self.content_store = FormContentStore(db_controller)
 
     def create_table(self):
         """
-        Tworzy tabelę `patient_forms` w bazie danych, jeśli jeszcze nie istnieje.
+        Tworzy tabelę `patient_forms` oraz tabelę jej treści w bazie danych, jeśli jeszcze nie istnieją.
         """
         try:
             self.db_controller.ensure_connection()
@@ -41,7 +55,8 @@ class PatientForms:
                 )
                 """
                 self.db_controller.connection.execute(query)
-                self.db_controller.connection.commit()
+            self.content_store.create_table()
+            self.db_controller.connection.commit()
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas tworzenia tabeli: {e}") from e
 
@@ -53,7 +68,7 @@ class PatientForms:
             fk_patient_id (int): ID pacjenta.
             fk_form_type_id (int): ID typu formularza.
             submission_date (str): Data zgłoszenia w formacie YYYY-MM-DD.
-            content (str | None): Opcjonalna treść formularza.
+            content (str | bytes | None): Opcjonalna treść formularza (zapisywana po kompresji).
 
         Returns:
             int: ID nowo dodanego formularza.
@@ -71,20 +86,23 @@ class PatientForms:
             validate_fk_form_type_id_exists(self.db_controller, fk_form_type_id)
 
             query = """
-            INSERT INTO patient_forms (fk_patient_id, fk_form_type_id, submission_date, content)
-            VALUES (?, ?, ?, ?)
+            INSERT INTO patient_forms (fk_patient_id, fk_form_type_id, submission_date)
+            VALUES (?, ?, ?)
             """
-            cursor = self.db_controller.connection.execute(
-                query, (fk_patient_id, fk_form_type_id, submission_date, content)
-            )
-            self.db_controller.connection.commit()
+            with self.db_controller.unit_of_work():
+                cursor = self.db_controller.connection.execute(
+                    query, (fk_patient_id, fk_form_type_id, submission_date)
+                )
+                if content is not None:
+                    self.content_store.save(cursor.lastrowid, content)
             return cursor.lastrowid
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas dodawania formularza: {e}") from e
 
     def get_forms(self, filters=None, sort_by=None):
         """
-        Pobiera rekordy z tabeli `patient_forms` z opcjonalnymi filtrami i sortowaniem.
+        Pobiera metadane formularzy z tabeli `patient_forms` z opcjonalnymi filtrami i sortowaniem.
+        Treść formularzy nie jest odczytywana - `content_size` zawiera jej rozmiar w bajtach (None bez treści).
 
         Args:
             filters (list): Lista filtrów w formacie [{"column": ..., "operator": ..., "value": ...}].
@@ -96,12 +114,11 @@ class PatientForms:
         try:
             self.db_controller.ensure_connection()
 
-            valid_columns = ["patient_form_id", "fk_patient_id", "fk_form_type_id", "submission_date", "content"]
+            valid_columns = ["patient_form_id", "fk_patient_id", "fk_form_type_id", "submission_date"]
             validate_filters_and_sorting(filters, sort_by, valid_columns)
 
-            query_conditions, values = self.db_controller.build_filters(filters, sort_by)
-            query = f"SELECT * FROM patient_forms WHERE {query_conditions}"
-            cursor = self.db_controller.connection.execute(query, values)
+            conditions, values = self.db_controller.build_filters(filters, sort_by, "patient_forms")
+            cursor = self.db_controller.connection.execute(LIST_QUERY.format(conditions=conditions), values)
             return [dict(row) for row in cursor.fetchall()]
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas pobierania formularzy: {e}") from e
@@ -139,12 +156,16 @@ class PatientForms:
             if "fk_form_type_id" in updates:
                 validate_fk_form_type_id_exists(self.db_controller, updates["fk_form_type_id"])
 
-            # Aktualizacja danych
-            set_clause = ", ".join([f"{key} = ?" for key in updates.keys()])
-            values = list(updates.values()) + [patient_form_id]
-            query = f"UPDATE patient_forms SET {set_clause} WHERE patient_form_id = ?"
-            self.db_controller.connection.execute(query, values)
-            self.db_controller.connection.commit()
+            # Aktualizacja danych - treść trafia do `patient_form_contents`
+            columns = {key: value for key, value in updates.items() if key != "content"}
+            with self.db_controller.unit_of_work():
+                if columns:
+                    set_clause = ", ".join([f"{key} = ?" for key in columns.keys()])
+                    values = list(columns.values()) + [patient_form_id]
+                    query = f"UPDATE patient_forms SET {set_clause} WHERE patient_form_id = ?"
+                    self.db_controller.connection.execute(query, values)
+                if "content" in updates:
+                    self.content_store.save(patient_form_id, updates["content"])
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas aktualizacji formularza: {e}") from e
 
@@ -179,3 +200,46 @@ class PatientForms:
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas usuwania formularza: {e}") from e
 
+
+    def get_form_content(self, patient_form_id: int):
+        """
+        Pobiera całą treść formularza.
+
+        Args:
+            patient_form_id (int): ID formularza.
+
+        Returns:
+            str | bytes | None: Treść tekstowa, treść binarna lub None, jeśli formularz nie ma treści.
+        """
+        try:
+            return self.content_store.load(patient_form_id)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Błąd podczas pobierania treści formularza: {e}") from e
+
+    def open_form_content(self, patient_form_id: int, chunk_size: int = CHUNK_SIZE):
+        """
+        Otwiera strumień treści formularza czytany fragmentami bez wczytywania całej treści do pamięci.
+
+        Args:
+            patient_form_id (int): ID formularza.
+            chunk_size (int): Rozmiar fragmentu odczytu w bajtach.
+
+        Returns:
+            FormContentReader | None: Strumień bajtów do zamknięcia po odczycie lub None, jeśli formularz nie ma treści.
+        """
+        try:
+            return self.content_store.open(patient_form_id, chunk_size)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Błąd podczas otwierania treści formularza: {e}") from e
+
+    def get_content_statistics(self):
+        """
+        Pobiera statystyki rozmiaru i kompresji treści formularzy.
+
+        Returns:
+            dict: Słownik {"forms", "text_forms", "original_size", "compressed_size", "largest_size", "ratio"}.
+        """
+        try:
+            return self.content_store.get_statistics()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Błąd podczas pobierania statystyk treści formularzy: {e}") from e
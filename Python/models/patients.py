@@ -1,6 +1,8 @@
 from controllers.database_controller import DatabaseController
 import sqlite3
 from typing import List
+from database.batch import BatchWriter
+from database.search_index import build_match_query
 from validators.patients_model_validation import (
     validate_first_name,
     validate_last_name,
@@ -14,6 +16,9 @@ from validators.patients_model_validation import (
 )
 
 class Patients:
+    # Kolumny zapisywane przez operacje na wielu rekordach
+    BATCH_COLUMNS = ("first_name", "last_name", "pesel", "phone", "email", "address", "date_of_birth", "is_active")
+
     def __init__(self, db_controller: DatabaseController):
         self.db_controller = db_controller
 
@@ -128,6 +133,59 @@ class Patients:
         self.db_controller.connection.commit()
         return cursor.rowcount
 
+
+    # +-+-+-+- metody operacji na wielu rekordach -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+
+
+    @staticmethod
+    def _batch_validation_errors(rows: list) -> dict:
+        # Walidacja formatu pól każdego wiersza (jak `update_patient`); unikalność PESEL, telefonu
+        # i adresu email sprawdzają ograniczenia UNIQUE tabeli - błąd wskazywany jest dla wiersza
+        errors = {}
+        for index, row in enumerate(rows):
+            try:
+                validate_patient_update(row, ())
+            except (ValueError, TypeError) as e:
+                errors[index] = str(e)
+        return errors
+
+    def add_many(self, patients: list) -> list:
+        """
+        Dodaje wielu pacjentów w jednej transakcji (zamiast `safe_execute` z zatwierdzeniem po każdym rekordzie).
+
+        :param patients: Lista słowników z kolumnami `BATCH_COLUMNS` (`is_active` domyślnie 1).
+        :return: Lista wyników wierszy {"index", "success", "error", "id"} w kolejności wejściowej.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        rows = [{"is_active": 1, **patient} for patient in patients]
+        errors = self._batch_validation_errors(rows)
+        return BatchWriter(self.db_controller).insert_many("patients", self.BATCH_COLUMNS, rows, errors)
+
+    def update_many(self, updates: list) -> list:
+        """
+        Aktualizuje wielu pacjentów w jednej transakcji (np. dezaktywacja pacjentów).
+
+        :param updates: Lista słowników z `patient_id` i zmienianymi kolumnami, np.
+            [{"patient_id": 3, "is_active": 0}].
+        :return: Lista wyników wierszy {"index", "success", "error", "id"} w kolejności wejściowej.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        errors = self._batch_validation_errors(
+            [{column: value for column, value in update.items() if column != "patient_id"} for update in updates]
+        )
+        return BatchWriter(self.db_controller).update_many(
+            "patients", "patient_id", updates, errors, allowed_columns=self.BATCH_COLUMNS
+        )
+
+    def delete_many(self, patient_ids: list) -> list:
+        """
+        Usuwa wielu pacjentów w jednej transakcji.
+
+        :param patient_ids: Lista ID pacjentów.
+        :return: Lista wyników wierszy {"index", "success", "error", "id"} w kolejności wejściowej.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        return BatchWriter(self.db_controller).delete_many("patients", "patient_id", patient_ids)
+
     def search_patients(self, first_name=None, last_name=None):
         """
         Wyszukuje pacjentów na podstawie imienia i/lub nazwiska.
@@ -252,6 +310,75 @@ class Patients:
             raise RuntimeError(f"Błąd bazy danych: {e}") from e
 
 
+    def get_patients_page(self, fk_employee_id=None, after_patient_id=0, limit=None, search_text=None) -> list:
+        """
+        Pobiera stronę pacjentów posortowaną po `patient_id` (paginacja kluczem - keyset).
+
+        Jeśli podano `fk_employee_id`, zwracani są tylko pacjenci przypisani do pracownika
+        (jedno zapytanie `assigned_patients JOIN patients` zamiast osobnego SELECT-a na pacjenta).
+
+        Args:
+            fk_employee_id (int, optional): ID pracownika, którego pacjentów pobrać. None - wszyscy pacjenci.
+            after_patient_id (int): Ostatni `patient_id` z poprzedniej strony (0 - pierwsza strona).
+            limit (int, optional): Maksymalna liczba rekordów na stronie. None - bez limitu.
+            search_text (str, optional): Fragment imienia, nazwiska, PESEL-u, telefonu lub e-maila.
+                Gdy istnieje indeks `patients_fts`, każde słowo dopasowywane jest jako prefiks
+                (również adresu); bez indeksu - jako dowolny fragment (LIKE).
+
+        Returns:
+            list: Lista słowników z danymi pacjentów (te same klucze co `get_all_patients_details`).
+
+        Raises:
+            RuntimeError: W przypadku błędu bazy danych.
+        """
+        columns = "p.patient_id, p.first_name, p.last_name, p.pesel, p.phone, p.email, p.address, p.date_of_birth, p.is_active"
+
+        if fk_employee_id is not None:
+            query = f"""
+            SELECT {columns}
+            FROM assigned_patients ap
+            JOIN patients p ON p.patient_id = ap.fk_patient_id
+            WHERE ap.fk_employee_id = ? AND ap.fk_patient_id > ?
+            """
+            params = [fk_employee_id, after_patient_id or 0]
+            order_by = "ap.fk_patient_id"
+        else:
+            query = f"""
+            SELECT {columns}
+            FROM patients p
+            WHERE p.patient_id > ?
+            """
+            params = [after_patient_id or 0]
+            order_by = "p.patient_id"
+
+        if search_text and search_text.strip() and self.db_controller.schema_catalog.has_table("patients_fts"):
+            # Indeks pełnotekstowy (database/search_index.py) - prefiksy słów zamiast pełnego skanu LIKE
+            match_query = build_match_query(search_text)
+            if match_query is None:
+                return []
+            query += " AND p.patient_id IN (SELECT rowid FROM patients_fts WHERE patients_fts MATCH ?)"
+            params.append(match_query)
+        elif search_text and search_text.strip():
+            # Znaki specjalne LIKE są traktowane dosłownie
+            pattern = search_text.strip().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            query += """
+            AND (p.first_name LIKE ? ESCAPE '\\' OR p.last_name LIKE ? ESCAPE '\\'
+                 OR p.pesel LIKE ? ESCAPE '\\' OR p.phone LIKE ? ESCAPE '\\' OR p.email LIKE ? ESCAPE '\\')
+            """
+            params.extend([f"%{pattern}%"] * 5)
+
+        # LIMIT -1 w SQLite oznacza brak limitu
+        query += f" ORDER BY {order_by} LIMIT ?"
+        params.append(limit if limit is not None else -1)
+
+        try:
+            cursor = self.db_controller.connection.execute(query, params)
+            return [dict(row) for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            print(f"[ERROR] Błąd bazy danych podczas pobierania strony pacjentów: {e}")
+            raise RuntimeError(f"Błąd bazy danych: {e}") from e
+
+
 
 
 
@@ -3,6 +3,7 @@
 
 import sqlite3
 from controllers.database_controller import DatabaseController
+from database.id_sets import json_id_set
 from validators.permissions_model_validation import SystemPermissionsValidation
 
 #      WYMAGANIA MODELU: 
@@ -89,6 +90,8 @@ class Permissions:
             query = "INSERT INTO system_permissions (permission_name) VALUES (?)"
             self.db_controller.connection.execute(query, (permission_name,))
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("system_permissions")
+            self.db_controller.permission_engine.invalidate()
         except sqlite3.IntegrityError as e:
             raise ValueError(f"Uprawnienie o nazwie '{permission_name}' już istnieje.") from e
         except sqlite3.Error as e:
@@ -140,9 +143,9 @@ class Permissions:
             if not permission_names:
                 raise ValueError("Lista nazw uprawnień nie może być pusta.")
             SystemPermissionsValidation.validate_operator_and_value("IN", permission_names)
-            placeholders = ", ".join(["?"] * len(permission_names))
-            query += f" AND permission_name IN ({placeholders})"
-            params.extend(permission_names)
+            id_set_sql, id_set_params = json_id_set(permission_names)
+            query += f" AND permission_name IN {id_set_sql}"
+            params.extend(id_set_params)
 
         if name_pattern:
             SystemPermissionsValidation.validate_operator_and_value("LIKE", name_pattern)
@@ -220,8 +223,8 @@ class Permissions:
         """
         SystemPermissionsValidation.validate_database_connection(self.db_controller)
         SystemPermissionsValidation.validate_operator_and_value("IN", names)
-        placeholders = ", ".join(["?"] * len(names))
-        query = f"SELECT COUNT(*) as count FROM system_permissions WHERE permission_name IN ({placeholders})"
+        id_set_sql, id_set_params = json_id_set(names)
+        query = f"SELECT COUNT(*) as count FROM system_permissions WHERE permission_name IN {id_set_sql}"
 
-        cursor = self.db_controller.connection.execute(query, names)
+        cursor = self.db_controller.connection.execute(query, id_set_params)
         return cursor.fetchone()["count"]
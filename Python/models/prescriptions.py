@@ -106,10 +106,7 @@ class Prescriptions:
                 for filter_item in filters:
                     validate_operator_and_value(filter_item["operator"], filter_item.get("value"))
             
-            query_conditions, values = self.db_controller.build_filters(filters, sort_by)
-            query = f"SELECT * FROM prescriptions WHERE {query_conditions}"
-            cursor = self.db_controller.connection.execute(query, values)
-            return [dict(row) for row in cursor.fetchall()]
+            return self.db_controller.select_filtered("prescriptions", filters, sort_by)
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas pobierania rekordów: {e}") from e
 
@@ -17,17 +17,6 @@ from validators.role_permissions_model_validation import (
     validate_operator_and_value
 )
 
-def get_valid_columns(db_controller, table_name: str) -> list:
-    """
-    Pobiera listę kolumn dla podanej tabeli z bazy danych.
-    :param db_controller: Obiekt kontrolera bazy danych.
-    :param table_name: Nazwa tabeli.
-    :return: Lista nazw kolumn.
-    """
-    db_controller.ensure_connection()
-    query = f"PRAGMA table_info({table_name})"
-    cursor = db_controller.connection.execute(query)
-    return [row["name"] for row in cursor.fetchall()]
 
 class RolePermissions:
     """
@@ -81,6 +70,7 @@ class RolePermissions:
             query = "INSERT INTO role_permissions (role_id, permission_id) VALUES (?, ?)"
             self.db_controller.connection.execute(query, (role_id, permission_id))
             self.db_controller.connection.commit()
+            self.db_controller.permission_engine.invalidate()
         except ValueError as validation_error:
             raise ValueError(f"Błąd walidacji: {validation_error}") from validation_error
 
@@ -198,10 +188,7 @@ class RolePermissions:
                 sort_by = [(item["column"], item["direction"]) for item in sort_by]
 
             # Przekazanie danych do DatabaseController
-            query_conditions, values = self.db_controller.build_filters(filters, sort_by)
-            query = f"SELECT * FROM role_permissions WHERE {query_conditions}"
-            cursor = self.db_controller.connection.execute(query, values)
-            return [dict(row) for row in cursor.fetchall()]
+            return self.db_controller.select_filtered("role_permissions", filters, sort_by)
         except ValueError as validation_error:
             raise ValueError(f"Błąd walidacji: {validation_error}") from validation_error
         except sqlite3.Error as db_error:
@@ -258,6 +245,7 @@ class RolePermissions:
             query = f"UPDATE role_permissions SET {', '.join(updates)} WHERE role_permission_id = ?"
             self.db_controller.connection.execute(query, params)
             self.db_controller.connection.commit()
+            self.db_controller.permission_engine.invalidate()
 
         except sqlite3.IntegrityError as e:
             raise RuntimeError(f"Błąd podczas aktualizacji rekordu: {e}") from e
@@ -316,6 +304,7 @@ class RolePermissions:
             query_update = f"UPDATE role_permissions SET {', '.join(updates)} WHERE role_permission_id = ?"
             self.db_controller.connection.execute(query_update, params)
             self.db_controller.connection.commit()
+            self.db_controller.permission_engine.invalidate()
         except sqlite3.IntegrityError as exc:
             raise RuntimeError("Błąd bazy danych: naruszenie unikalności rekordu.") from exc
 
@@ -340,6 +329,7 @@ class RolePermissions:
             query = "DELETE FROM role_permissions WHERE role_permission_id = ?"
             self.db_controller.connection.execute(query, (role_permission_id,))
             self.db_controller.connection.commit()
+            self.db_controller.permission_engine.invalidate()
         except sqlite3.Error as db_error:
             raise RuntimeError(f"Błąd bazy danych: {db_error}") from db_error
         except KeyError as key_error:
@@ -383,6 +373,7 @@ class RolePermissions:
             query = f"DELETE FROM role_permissions WHERE {' OR '.join(conditions)}"
             self.db_controller.connection.execute(query, params)
             self.db_controller.connection.commit()
+            self.db_controller.permission_engine.invalidate()
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas usuwania rekordów: {e}") from e
 
@@ -416,6 +407,7 @@ class RolePermissions:
             query = f"DELETE FROM role_permissions WHERE {' AND '.join(conditions)}"
             self.db_controller.connection.execute(query, params)
             self.db_controller.connection.commit()
+            self.db_controller.permission_engine.invalidate()
         except sqlite3.Error as db_error:
             raise RuntimeError(f"Błąd bazy danych: {db_error}") from db_error
         except KeyError as key_error:
@@ -3,6 +3,7 @@
 
 import sqlite3
 from controllers.database_controller import DatabaseController
+from database.id_sets import json_id_set
 from validators.roles_model_validation import (
     validate_role_name,
     validate_unique_role_name,
@@ -71,6 +72,7 @@ class Roles:
             query = "INSERT INTO roles (role_name) VALUES (?)"
             self.db_controller.connection.execute(query, (role_name,))
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("roles")
 
             print(f"[RolesModel_create_new_record] Rola '{role_name}' została dodana pomyślnie.")
             return True  # Operacja zakończona sukcesem
@@ -145,8 +147,8 @@ class Roles:
 
             query = ""
             if operator.upper() == "IN":
-                placeholders = ", ".join(["?"] * len(values))
-                query = f"SELECT * FROM roles WHERE {column_name} IN ({placeholders})"
+                id_set_sql, values = json_id_set(values)
+                query = f"SELECT * FROM roles WHERE {column_name} IN {id_set_sql}"
             elif operator.upper() == "LIKE":
                 query = f"SELECT * FROM roles WHERE {column_name} LIKE ?"
                 values = [values]
@@ -189,6 +191,7 @@ class Roles:
 
             cursor = self.db_controller.connection.execute(query, params)
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("roles")
 
             return cursor.rowcount > 0  # Zwróci True, jeśli co najmniej 1 wiersz został zaktualizowany
 
@@ -223,6 +226,7 @@ class Roles:
             query = "DELETE FROM roles WHERE role_id = ?"
             cursor = self.db_controller.connection.execute(query, (record_id,))
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("roles")
 
             return cursor.rowcount > 0  # Zwraca True, jeśli usunięto przynajmniej jeden rekord
 
@@ -246,6 +250,7 @@ class Roles:
             query = f"DELETE FROM roles WHERE {column_name} = ?"
             self.db_controller.connection.execute(query, (value,))
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("roles")
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas usuwania rekordów na podstawie kryterium: {e}") from e
 
@@ -2,6 +2,7 @@
 
 import sqlite3
 from controllers.database_controller import DatabaseController
+from database.room_availability import parse_time_range
 #pylint: disable=E0401
 #pylint: disable=E0611
 from validators.room_reservations_model_validation import (
@@ -44,7 +45,25 @@ class RoomReservations:
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas tworzenia tabeli: {e}") from e
 
-    def add_reservation(self, fk_room_id, reservation_date, reservation_time):
+    def check_conflicts(self, fk_room_id, reservation_date, reservation_time, exclude_reservation_id=None):
+        """
+        Sprawdza w bazie (połączenie bieżącego wątku), czy pokój jest wolny w podanym przedziale.
+        Wywołane w transakcji zapisu gwarantuje, że zapisywana rezerwacja nie nachodzi na inną.
+
+        Raises:
+            ValueError: Jeśli przedział ma nieprawidłowy format lub nachodzi na inne rezerwacje pokoju.
+        """
+        start, end = parse_time_range(reservation_time)
+        conflicts = self.db_controller.room_availability.get_conflicts(
+            fk_room_id, reservation_date, start, end, exclude_reservation_id
+        )
+        if conflicts:
+            raise ValueError(
+                f"Pokój {fk_room_id} jest już zarezerwowany na dzień {reservation_date} "
+                f"w godzinach nachodzących na {reservation_time} (rezerwacje: {', '.join(map(str, conflicts))})."
+            )
+
+    def add_reservation(self, fk_room_id, reservation_date, reservation_time, check_conflicts=False):
         """
         Dodaje nową rezerwację do tabeli `room_reservations`.
 
@@ -54,22 +73,28 @@ class RoomReservations:
             fk_meeting_id (int | None): ID spotkania.
             reservation_date (str): Data rezerwacji.
             reservation_time (str): Czas rezerwacji.
+            check_conflicts (bool): Czy sprawdzić kolizje z innymi rezerwacjami pokoju w tej samej transakcji.
 
         Returns:
             int: ID nowo dodanej rezerwacji.
+
+        Raises:
+            ValueError: Jeśli `check_conflicts` i rezerwacja nachodzi na inną rezerwację pokoju.
         """
         try:
-            # Walidacje
             # Dodanie rezerwacji
             self.db_controller.ensure_connection()
             query = """
             INSERT INTO room_reservations (fk_room_id, reservation_date, reservation_time)
             VALUES (?, ?, ?)
             """
-            cursor = self.db_controller.connection.execute(
-                query, (fk_room_id, reservation_date, reservation_time)
-            )
-            self.db_controller.connection.commit()
+            with self.db_controller.unit_of_work():
+                if check_conflicts:
+                    self.check_conflicts(fk_room_id, reservation_date, reservation_time)
+                cursor = self.db_controller.connection.execute(
+                    query, (fk_room_id, reservation_date, reservation_time)
+                )
+            self.db_controller.room_availability.invalidate(reservation_date)
             return cursor.lastrowid
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas dodawania rezerwacji: {e}") from e
@@ -87,14 +112,12 @@ class RoomReservations:
         """
         try:
             self.db_controller.ensure_connection()
-            query_conditions, values = self.db_controller.build_filters(filters, sort_by)
-            query = f"SELECT * FROM room_reservations WHERE {query_conditions}"
-            cursor = self.db_controller.connection.execute(query, values)
-            return [dict(row) for row in cursor.fetchall()]
+            return self.db_controller.select_filtered("room_reservations", filters, sort_by)
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas pobierania rezerwacji: {e}") from e
 
-    def update_reservation(self, reservation_id, fk_room_id=None, reservation_date=None, reservation_time=None):
+    def update_reservation(self, reservation_id, fk_room_id=None, reservation_date=None, reservation_time=None,
+                           check_conflicts=False):
         """
         Aktualizuje rekord w tabeli `room_reservations`.
 
@@ -105,19 +128,20 @@ class RoomReservations:
             fk_meeting_id (int, opcjonalnie): Nowe ID spotkania.
             reservation_date (str, opcjonalnie): Nowa data rezerwacji.
             reservation_time (str, opcjonalnie): Nowy czas rezerwacji.
+            check_conflicts (bool): Czy sprawdzić kolizje z innymi rezerwacjami pokoju w tej samej transakcji.
 
         Raises:
             RuntimeError: Jeśli rekord o podanym ID nie istnieje.
+            ValueError: Jeśli `check_conflicts` i rezerwacja nachodzi na inną rezerwację pokoju.
         """
         try:
             self.db_controller.ensure_connection()
 
             # Sprawdzenie, czy rekord istnieje
-            query_check = "SELECT COUNT(*) FROM room_reservations WHERE reservation_id = ?"
-            cursor = self.db_controller.connection.execute(query_check, (reservation_id,))
-            record_exists = cursor.fetchone()[0] > 0
+            query_check = "SELECT fk_room_id, reservation_date, reservation_time FROM room_reservations WHERE reservation_id = ?"
+            existing = self.db_controller.connection.execute(query_check, (reservation_id,)).fetchone()
 
-            if not record_exists:
+            if existing is None:
                 raise RuntimeError(f"Nie znaleziono rekordu o podanym ID {reservation_id}.")
 
             updates = {}
@@ -137,8 +161,17 @@ class RoomReservations:
             set_clause = ", ".join([f"{key} = ?" for key in updates.keys()])
             values = list(updates.values()) + [reservation_id]
             query = f"UPDATE room_reservations SET {set_clause} WHERE reservation_id = ?"
-            self.db_controller.connection.execute(query, values)
-            self.db_controller.connection.commit()
+            with self.db_controller.unit_of_work():
+                if check_conflicts:
+                    self.check_conflicts(
+                        updates.get("fk_room_id", existing["fk_room_id"]),
+                        updates.get("reservation_date", existing["reservation_date"]),
+                        updates.get("reservation_time", existing["reservation_time"]),
+                        exclude_reservation_id=reservation_id,
+                    )
+                self.db_controller.connection.execute(query, values)
+            # Rezerwacja mogła zostać przeniesiona na inny dzień - unieważniamy cały indeks
+            self.db_controller.room_availability.invalidate()
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas aktualizacji rezerwacji: {e}") from e
 
@@ -168,6 +201,7 @@ class RoomReservations:
             query_delete = "DELETE FROM room_reservations WHERE reservation_id = ?"
             self.db_controller.connection.execute(query_delete, (reservation_id,))
             self.db_controller.connection.commit()
+            self.db_controller.room_availability.invalidate()
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas usuwania rezerwacji: {e}") from e
 
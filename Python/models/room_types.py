@@ -8,17 +8,6 @@ from validators.room_types_model_validation import (
     validate_filters_and_sorting
 )
 
-def get_valid_columns(db_controller, table_name: str) -> list:
-    """
-    Pobiera listę kolumn dla podanej tabeli z bazy danych.
-    :param db_controller: Obiekt kontrolera bazy danych.
-    :param table_name: Nazwa tabeli.
-    :return: Lista nazw kolumn.
-    """
-    db_controller.ensure_connection()
-    query = f"PRAGMA table_info({table_name})"
-    cursor = db_controller.connection.execute(query)
-    return [row["name"] for row in cursor.fetchall()]
 
 
 class RoomTypes:
@@ -76,6 +65,7 @@ class RoomTypes:
             query = "INSERT INTO room_types (room_type) VALUES (?)"
             self.db_controller.connection.execute(query, (room_type,))
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("room_types")
         except sqlite3.IntegrityError as e:
             self.db_controller.connection.rollback()
             raise ValueError(f"Błąd podczas dodawania rekordu: {e}") from e
@@ -97,11 +87,9 @@ class RoomTypes:
             self.db_controller.ensure_connection()
             if not self.db_controller.table_exists("room_types"):
                 raise RuntimeError("Tabela 'room_types' nie istnieje w bazie danych.")
-            valid_columns = get_valid_columns(self.db_controller, "room_types")  # Pobierz kolumny dynamicznie
+            valid_columns = self.db_controller.schema_catalog.get_columns("room_types")  # Pobierz kolumny dynamicznie
             validate_filters_and_sorting(filters, sort_by, valid_columns)
-            query, values = self.db_controller.build_filters(filters, sort_by)
-            cursor = self.db_controller.connection.execute(f"SELECT * FROM room_types WHERE {query}", values)
-            return [dict(row) for row in cursor.fetchall()]
+            return self.db_controller.select_filtered("room_types", filters, sort_by)
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas pobierania rekordów: {e}") from e
 
@@ -120,6 +108,7 @@ class RoomTypes:
             query_update = "UPDATE room_types SET room_type = ? WHERE room_type_id = ?"
             self.db_controller.connection.execute(query_update, (new_room_type, room_type_id))
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("room_types", "rooms")
 
         except sqlite3.OperationalError as op_err:
             raise RuntimeError(f"Błąd operacyjny bazy danych: {op_err}") from op_err
@@ -149,5 +138,7 @@ class RoomTypes:
             
             self.db_controller.connection.execute(query, (room_type_id,))
             self.db_controller.connection.commit()
+            # Usunięcie typu ustawia NULL w `rooms.fk_room_type_id`
+            self.db_controller.reference_cache.invalidate("room_types", "rooms")
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas usuwania rekordu: {e}") from e
\ No newline at end of file
@@ -14,19 +14,6 @@ from validators.rooms_model_validation import (
 )
 
 
-def get_valid_columns(db_controller, table_name: str) -> list:
-    """
-    Pobiera listę kolumn dla podanej tabeli z bazy danych.
-    :param db_controller: Obiekt kontrolera bazy danych.
-    :param table_name: Nazwa tabeli.
-    :return: Lista nazw kolumn.
-    """
-    db_controller.ensure_connection()
-    query = f"PRAGMA table_info({table_name})"
-    cursor = db_controller.connection.execute(query)
-    return [row["name"] for row in cursor.fetchall()]
-
-
 class Rooms:
     """
     Klasa odpowiedzialna za zarządzanie tabelą `rooms` w kontekście operacji CRUD.
@@ -81,6 +68,7 @@ class Rooms:
             """
             self.db_controller.connection.execute(query, (room_number, floor, fk_room_type_id))
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("rooms")
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas dodawania pokoju: {e}") from e
 
@@ -135,16 +123,13 @@ class Rooms:
         """
         try:
             # Pobranie dozwolonych kolumn
-            valid_columns = get_valid_columns(self.db_controller, "rooms")
+            valid_columns = self.db_controller.schema_catalog.get_columns("rooms")
 
             # Walidacje
             validate_filters_and_sorting(filters, sort_by, valid_columns)
 
             # Pobieranie danych
-            query_conditions, values = self.db_controller.build_filters(filters, sort_by)
-            query = f"SELECT * FROM rooms WHERE {query_conditions}"
-            cursor = self.db_controller.connection.execute(query, values)
-            return [dict(row) for row in cursor.fetchall()]
+            return self.db_controller.select_filtered("rooms", filters, sort_by)
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas pobierania rekordów: {e}") from e
 
@@ -213,6 +198,7 @@ class Rooms:
             query = f"UPDATE rooms SET {set_clause} WHERE room_id = ?"
             self.db_controller.connection.execute(query, values)
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("rooms")
 
         except sqlite3.Error as db_error:
             raise RuntimeError("Błąd bazy danych podczas aktualizacji pokoju.") from db_error
@@ -245,6 +231,7 @@ class Rooms:
             query_delete = "DELETE FROM rooms WHERE room_id = ?"
             self.db_controller.connection.execute(query_delete, (room_id,))
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("rooms")
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas usuwania pokoju: {e}") from e
 
@@ -74,6 +74,7 @@ class Services:
             """
             self.db_controller.connection.execute(query, (service_type, duration_minutes, service_price, is_active))
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("services")
         except sqlite3.IntegrityError as e:
             self.db_controller.connection.rollback()
             raise ValueError(f"Błąd integralności podczas dodawania rekordu: {e}") from e
@@ -98,9 +99,7 @@ class Services:
                     validate_operator_and_value(operator, value)
             
             # Budowanie zapytania przy użyciu build_filters z DatabaseController
-            query, values = self.db_controller.build_filters(filters, sort_by)
-            cursor = self.db_controller.connection.execute(f"SELECT * FROM services WHERE {query}", values)
-            return [dict(row) for row in cursor.fetchall()]
+            return self.db_controller.select_filtered("services", filters, sort_by)
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas pobierania rekordów: {e}") from e
 
@@ -128,6 +127,7 @@ class Services:
             params = list(updates.values()) + [service_id]
             self.db_controller.connection.execute(query, params)
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("services")
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas aktualizowania rekordu: {e}") from e
 
@@ -152,6 +152,7 @@ class Services:
             query = "DELETE FROM services WHERE service_id = ?"
             self.db_controller.connection.execute(query, (service_id,))
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("services")
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas usuwania rekordu: {e}") from e
 
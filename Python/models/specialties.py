@@ -11,17 +11,6 @@ from validators.specialties_model_validation import (
 )
 
 
-def get_valid_columns(db_controller, table_name: str) -> list:
-    """
-    Pobiera listę kolumn dla podanej tabeli z bazy danych.
-    :param db_controller: Obiekt kontrolera bazy danych.
-    :param table_name: Nazwa tabeli.
-    :return: Lista nazw kolumn.
-    """
-    db_controller.ensure_connection()
-    query = f"PRAGMA table_info({table_name})"
-    cursor = db_controller.connection.execute(query)
-    return [row["name"] for row in cursor.fetchall()]
 
 class Specialties:
     """
@@ -78,6 +67,7 @@ class Specialties:
             query = "INSERT INTO specialties (specialty_name, is_active) VALUES (?, ?)"
             self.db_controller.connection.execute(query, (specialty_name, is_active))
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("specialties")
         except sqlite3.IntegrityError as e:
             self.db_controller.connection.rollback()
             raise ValueError(f"Błąd podczas dodawania rekordu: {e}") from e
@@ -136,11 +126,9 @@ class Specialties:
             self.db_controller.ensure_connection()
             if not self.db_controller.table_exists("specialties"):
                 raise RuntimeError("Tabela 'specialties' nie istnieje w bazie danych.")
-            valid_columns = get_valid_columns(self.db_controller, "specialties")  # Pobierz kolumny dynamicznie
+            valid_columns = self.db_controller.schema_catalog.get_columns("specialties")  # Pobierz kolumny dynamicznie
             validate_filters_and_sorting(filters, sort_by, valid_columns)
-            query, values = self.db_controller.build_filters(filters, sort_by)
-            cursor = self.db_controller.connection.execute(f"SELECT * FROM specialties WHERE {query}", values)
-            return [dict(row) for row in cursor.fetchall()]
+            return self.db_controller.select_filtered("specialties", filters, sort_by)
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas pobierania rekordów: {e}") from e
 
@@ -162,12 +150,12 @@ class Specialties:
                 raise RuntimeError(f"Rekord o ID {specialty_id} nie istnieje.")
 
             # Walidacja danych aktualizacji za pomocą validate_update_fields
-            valid_columns = get_valid_columns(self.db_controller, "specialties")
+            valid_columns = self.db_controller.schema_catalog.get_columns("specialties")
             validate_update_fields(updates, valid_columns)
 
 
             # Walidacja danych aktualizacji
-            valid_columns = get_valid_columns(self.db_controller, "specialties")
+            valid_columns = self.db_controller.schema_catalog.get_columns("specialties")
             for column, value in updates.items():
                 if column not in valid_columns:
                     raise ValueError(f"Nieprawidłowa kolumna: {column}")
@@ -180,6 +168,7 @@ class Specialties:
             params = list(updates.values()) + [specialty_id]
             self.db_controller.connection.execute(query, params)
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("specialties")
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas aktualizowania rekordu: {e}") from e
 
@@ -205,6 +194,7 @@ class Specialties:
             
             self.db_controller.connection.execute(query, (specialty_id,))
             self.db_controller.connection.commit()
+            self.db_controller.reference_cache.invalidate("specialties")
         except sqlite3.Error as e:
             raise RuntimeError(f"Błąd podczas usuwania rekordu: {e}") from e
 
@@ -4,6 +4,7 @@ import sqlite3
 from controllers.database_controller import DatabaseController
 from controllers.employees_controller import EmployeesController
 from controllers.roles_controller import RolesController
+from database.batch import BatchWriter
 from validators.users_accounts_model_validation import (
     validate_name_field,
     validate_role_name,
@@ -17,6 +18,15 @@ class UsersAccounts:
     Klasa odpowiedzialna za zarządzanie tabelą `users_accounts` w kontekście operacji CRUD.
     """
 
+    # Kolumny zapisywane przez operacje na wielu rekordach
+    BATCH_COLUMNS = (
+        "employee_id", "role_id", "username", "password_hash", "is_active", "created_at", "last_login", "expired"
+    )
+    BATCH_REFERENCES = {
+        "employee_id": ("employees", "employee_id", "Nie znaleziono pracownika o ID {value}."),
+        "role_id": ("roles", "role_id", "Nie znaleziono roli o ID {value}."),
+    }
+
     def __init__(self, db_controller: DatabaseController):
         """
         Inicjalizuje instancję klasy UsersAccounts z kontrolerem bazy danych.
@@ -418,6 +428,44 @@ class UsersAccounts:
    
 
 
+    # +-+-+-+- metody operacji na wielu rekordach -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+
+
+    def add_many(self, users: list) -> list:
+        """
+        Dodaje wiele kont użytkowników w jednej transakcji (partia `add_user_by_ids`).
+
+        :param users: Lista słowników z kolumnami `BATCH_COLUMNS` (`last_login` i `expired` domyślnie None).
+        :return: Lista wyników wierszy {"index", "success", "error", "id"} w kolejności wejściowej.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        batch_writer = BatchWriter(self.db_controller)
+        rows = [{"last_login": None, "expired": None, **user} for user in users]
+        errors = batch_writer.reference_errors(rows, self.BATCH_REFERENCES)
+        return batch_writer.insert_many("users_accounts", self.BATCH_COLUMNS, rows, errors)
+
+    def update_many(self, updates: list) -> list:
+        """
+        Aktualizuje wiele kont w jednej transakcji (np. zmiana roli lub dezaktywacja kont).
+
+        :param updates: Lista słowników z `user_id` i zmienianymi kolumnami, np. [{"user_id": 4, "is_active": 0}].
+        :return: Lista wyników wierszy {"index", "success", "error", "id"} w kolejności wejściowej.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        batch_writer = BatchWriter(self.db_controller)
+        errors = batch_writer.reference_errors(updates, self.BATCH_REFERENCES)
+        return batch_writer.update_many("users_accounts", "user_id", updates, errors, allowed_columns=self.BATCH_COLUMNS)
+
+    def delete_many(self, user_ids: list) -> list:
+        """
+        Usuwa wiele kont w jednej transakcji.
+
+        :param user_ids: Lista ID użytkowników.
+        :return: Lista wyników wierszy {"index", "success", "error", "id"} w kolejności wejściowej.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        return BatchWriter(self.db_controller).delete_many("users_accounts", "user_id", user_ids)
+
+
     def update_last_login(self, user_id: int, last_login: str):
         """
         Aktualizuje kolumnę last_login dla danego użytkownika.
@@ -17,10 +17,15 @@ class AdminService():
         w tym dane pracownika (`employee_name`) oraz rolę (`role_name`).
         """
         try:
-            # Pobranie wszystkich danych z tabeli users_accounts (bez password_hash)
+            # Pobranie wszystkich danych z tabeli users_accounts (bez password_hash) wraz z pracownikiem i rolą
             query_users = """
-                SELECT user_id, employee_id, role_id, username, is_active, created_at, last_login, expired
-                FROM users_accounts
+                SELECT ua.user_id, ua.employee_id, ua.role_id, ua.username, ua.is_active, ua.created_at,
+                       ua.last_login, ua.expired,
+                       e.first_name || ' ' || e.last_name AS employee_name, r.role_name
+                FROM users_accounts ua
+                LEFT JOIN employees e ON e.employee_id = ua.employee_id
+                LEFT JOIN roles r ON r.role_id = ua.role_id
+                ORDER BY ua.user_id
             """
             cursor = self.admin_service_controller.db_controller.connection.execute(query_users)
             users_data = [dict(row) for row in cursor.fetchall()]
@@ -29,39 +34,15 @@ class AdminService():
                 print("[### ADMIN_SERVICE] Brak danych użytkowników w tabeli users_accounts.")
                 return []
 
-            # Pobranie employee_id dla wszystkich użytkowników
-            employee_ids = list(set(user["employee_id"] for user in users_data if user["employee_id"] is not None))
-            if employee_ids:
-                placeholders = ', '.join(['?'] * len(employee_ids))
-                query_employees = f"""
-                    SELECT employee_id, first_name, last_name FROM employees WHERE employee_id IN ({placeholders})
-                """
-                cursor = self.admin_service_controller.db_controller.connection.execute(query_employees, employee_ids)
-                employees_data = {row["employee_id"]: f"{row['first_name']} {row['last_name']}" for row in cursor.fetchall()}
-            else:
-                employees_data = {}
-
-            # Pobranie role_id dla wszystkich użytkowników
-            role_ids = list(set(user["role_id"] for user in users_data if user["role_id"] is not None))
-            if role_ids:
-                placeholders = ', '.join(['?'] * len(role_ids))
-                query_roles = f"""
-                    SELECT role_id, role_name FROM roles WHERE role_id IN ({placeholders})
-                """
-                cursor = self.admin_service_controller.db_controller.connection.execute(query_roles, role_ids)
-                roles_data = {row["role_id"]: row["role_name"] for row in cursor.fetchall()}
-            else:
-                roles_data = {}
-
             # Formatowanie wyników
             formatted_users = []
             for user in users_data:
                 formatted_users.append({
                     "user_id": user["user_id"],
                     "employee_id": user["employee_id"],
-                    "employee_name": employees_data.get(user["employee_id"], "Nieznany pracownik"),
+                    "employee_name": user["employee_name"] or "Nieznany pracownik",
                     "role_id": user["role_id"],
-                    "role_name": roles_data.get(user["role_id"], "Nieznana rola"),
+                    "role_name": user["role_name"] or "Nieznana rola",
                     "username": user["username"],
                     "is_active": user["is_active"],
                     "created_at": user["created_at"],
@@ -126,10 +107,15 @@ class AdminService():
         :return: Lista słowników zawierających przypisanych pacjentów.
         """
         try:
-            # Pobranie wszystkich danych z tabeli assigned_patients
+            # Pobranie wszystkich danych z tabeli assigned_patients wraz z pacjentem i pracownikiem
             query_assignments = """
-                SELECT assignment_id, fk_patient_id, fk_employee_id, is_active 
-                FROM assigned_patients
+                SELECT ap.assignment_id, ap.fk_patient_id, ap.fk_employee_id, ap.is_active,
+                       p.first_name || ' ' || p.last_name AS patient_name,
+                       e.first_name || ' ' || e.last_name AS employee_name
+                FROM assigned_patients ap
+                LEFT JOIN patients p ON p.patient_id = ap.fk_patient_id
+                LEFT JOIN employees e ON e.employee_id = ap.fk_employee_id
+                ORDER BY ap.assignment_id
             """
             cursor = self.admin_service_controller.db_controller.connection.execute(query_assignments)
             assignments_data = [dict(row) for row in cursor.fetchall()]
@@ -138,39 +124,15 @@ class AdminService():
                 print("[### ADMIN_SERVICE] Brak przypisanych pacjentów w tabeli assigned_patients.")
                 return []
 
-            # Pobranie unikalnych employee_id
-            employee_ids = list(set(row["fk_employee_id"] for row in assignments_data if row["fk_employee_id"] is not None))
-            if employee_ids:
-                placeholders = ', '.join(['?'] * len(employee_ids))
-                query_employees = f"""
-                    SELECT employee_id, first_name, last_name FROM employees WHERE employee_id IN ({placeholders})
-                """
-                cursor = self.admin_service_controller.db_controller.connection.execute(query_employees, employee_ids)
-                employees_data = {row["employee_id"]: f"{row['first_name']} {row['last_name']}" for row in cursor.fetchall()}
-            else:
-                employees_data = {}
-
-            # Pobranie unikalnych patient_id
-            patient_ids = list(set(row["fk_patient_id"] for row in assignments_data if row["fk_patient_id"] is not None))
-            if patient_ids:
-                placeholders = ', '.join(['?'] * len(patient_ids))
-                query_patients = f"""
-                    SELECT patient_id, first_name, last_name FROM patients WHERE patient_id IN ({placeholders})
-                """
-                cursor = self.admin_service_controller.db_controller.connection.execute(query_patients, patient_ids)
-                patients_data = {row["patient_id"]: f"{row['first_name']} {row['last_name']}" for row in cursor.fetchall()}
-            else:
-                patients_data = {}
-
             # Formatowanie wyników
             formatted_assignments = []
             for assignment in assignments_data:
                 formatted_assignments.append({
                     "assignment_id": assignment["assignment_id"],
                     "fk_patient_id": assignment["fk_patient_id"],
-                    "patient_name": patients_data.get(assignment["fk_patient_id"], "Nieznany pacjent"),
+                    "patient_name": assignment["patient_name"] or "Nieznany pacjent",
                     "fk_employee_id": assignment["fk_employee_id"],
-                    "employee_name": employees_data.get(assignment["fk_employee_id"], "Nieznany pracownik"),
+                    "employee_name": assignment["employee_name"] or "Nieznany pracownik",
                     "is_active": assignment["is_active"]
                 })
 
@@ -2,18 +2,21 @@ import sqlite3
 from datetime import date, timedelta
 from controllers.roles_controller import RolesController
 from controllers.employee_specialties_controller import EmployeeSpecialtiesController
-from controllers.specialties_controller import SpecialtiesController
 from controllers.users_accounts_controller import UsersAccountsController
 from controllers.employees_controller import EmployeesController
 from controllers.database_controller import DatabaseController
+from database.appointment_stats import AppointmentStatsManager
+from database.time_columns import day_range_ts, epoch_minutes
 
 class DashboardService:
-    def __init__(self, dashboard_controller, db_controller: DatabaseController):
+    def __init__(self, dashboard_controller, db_controller: DatabaseController = None):
         """
         Inicjalizuje DashboardService z kontrolerem dashboardu.
+        Bez `db_controller` używany jest kontroler bazy danych `dashboard_controller`.
         """
         self.dashboard_controller = dashboard_controller
-        self.db_controller = db_controller  # Przypisanie kontrolera bazy danych do atrybutu klasy
+        # Przypisanie kontrolera bazy danych do atrybutu klasy
+        self.db_controller = db_controller if db_controller is not None else dashboard_controller.db_controller
 
     def fetch_and_format_username(self, user_id):
         """
@@ -92,11 +95,11 @@ class DashboardService:
                 print(f"Brak specialties dla employee_id: {employee_id}")  # Debug
                 return []
 
-            # Pobranie nazw specjalizacji
-            specialties_controller = SpecialtiesController(self.dashboard_controller.db_controller)
+            # Nazwy specjalizacji z pamięci podręcznej tabel słownikowych (bez zapytania dla każdej specjalizacji)
+            reference_cache = self.dashboard_controller.db_controller.reference_cache
             specialties_names = []
             for specialty_id in specialties_ids:
-                specialty_name = specialties_controller.get_specialty_name_by_id(specialty_id)
+                specialty_name = reference_cache.get_name("specialties", specialty_id)
                 # print(f"service specialties: Pobrano specialty_name: {specialty_name} dla specialty_id: {specialty_id}")  # Debug
                 if specialty_name:
                     specialties_names.append(specialty_name)
@@ -116,6 +119,10 @@ class DashboardService:
             print(f"Błąd atrybutów (np. kontrolery): {ae}")
             return []
 
+        except RuntimeError as re:
+            print(f"Błąd bazy danych podczas pobierania specjalności użytkownika: {re}")
+            return []
+
 
  # -------------------------------------------------------------------------
 
@@ -221,95 +228,21 @@ class DashboardService:
             # Oblicz przesuniętą datę
             target_date = (date.today() + timedelta(days=date_offset)).strftime("%Y-%m-%d")
 
-            ### Pobranie `meeting_id` dla `employee_id` ###
-            query_meeting_ids = """
-            SELECT fk_meeting_id 
-            FROM meeting_participants 
-            WHERE fk_employee_id = ?
-            """
-            cursor = self.db_controller.connection.execute(query_meeting_ids, (employee_id,))
-            meeting_ids = [row[0] for row in cursor.fetchall()]
-
-            # Debugowanie
-            # print(f"[DEBUG] Pobranie meeting_id dla employee_id {employee_id}: {meeting_ids}")
-
-            if not meeting_ids:
-                return []  # Brak spotkań dla pracownika
-
-            ### Pobranie szczegółów spotkań ###
-            placeholders = ", ".join(["?"] * len(meeting_ids))
-            query_meeting_details = f"""
-            SELECT meeting_id, meeting_date, fk_meeting_type_id, fk_reservation_id
-            FROM internal_meetings
-            WHERE meeting_id IN ({placeholders}) AND meeting_date >= ?
-            """
-            cursor = self.db_controller.connection.execute(query_meeting_details, meeting_ids + [target_date])
-            meeting_details = {
-                row[0]: {
-                    "meeting_date": row[1],
-                    "fk_meeting_type_id": row[2],
-                    "fk_reservation_id": row[3]
-                }
-                for row in cursor.fetchall()
-            }
-
-            # Debugowanie
-            # print(f"[DEBUG] Szczegóły spotkań: {meeting_details}")
-
-            ### Pobranie nazw `meeting_type` ###
-            meeting_type_ids = list(set([details["fk_meeting_type_id"] for details in meeting_details.values()]))
-
-            query_meeting_types = f"""
-            SELECT meeting_type_id, meeting_type 
-            FROM meeting_types 
-            WHERE meeting_type_id IN ({", ".join(["?"] * len(meeting_type_ids))})
-            """
-            cursor = self.db_controller.connection.execute(query_meeting_types, meeting_type_ids)
-            meeting_types = {row[0]: row[1] for row in cursor.fetchall()}
-
-            # Debugowanie
-            # print(f"[DEBUG] Pobranie meeting_types: {meeting_types}")
-
-            ### Pobranie numerów pokoi ###
-            reservation_ids = list(set([details["fk_reservation_id"] for details in meeting_details.values()]))
-
-            # Pobierz powiązania między reservation_id a room_id z tabeli room_reservations
-            query_reservations = f"""
-            SELECT reservation_id, fk_room_id 
-            FROM room_reservations 
-            WHERE reservation_id IN ({", ".join(["?"] * len(reservation_ids))})
+            ### Spotkania pracownika z typem spotkania i numerem pokoju (jedno zapytanie) ###
+            query_meetings = """
+            SELECT im.meeting_date,
+                   COALESCE(mt.meeting_type, 'Nieznane') AS meeting_type,
+                   COALESCE(ro.room_number, 'Brak pokoju') AS room_number
+            FROM meeting_participants mp
+            JOIN internal_meetings im ON im.meeting_id = mp.fk_meeting_id
+            LEFT JOIN meeting_types mt ON mt.meeting_type_id = im.fk_meeting_type_id
+            LEFT JOIN room_reservations rr ON rr.reservation_id = im.fk_reservation_id
+            LEFT JOIN rooms ro ON ro.room_id = rr.fk_room_id
+            WHERE mp.fk_employee_id = ? AND im.meeting_date >= ?
+            ORDER BY im.meeting_id
             """
-            cursor = self.db_controller.connection.execute(query_reservations, reservation_ids)
-            reservation_to_room = {row[0]: row[1] for row in cursor.fetchall()}
-
-            # Debugowanie
-            # print(f"[DEBUG] Powiązanie reservation_id -> room_id: {reservation_to_room}")
-
-            # Pobierz room_number na podstawie room_id
-            room_ids = list(set(reservation_to_room.values()))
-            query_room_numbers = f"""
-            SELECT room_id, room_number 
-            FROM rooms 
-            WHERE room_id IN ({", ".join(["?"] * len(room_ids))})
-            """
-            cursor = self.db_controller.connection.execute(query_room_numbers, room_ids)
-            room_numbers = {row[0]: row[1] for row in cursor.fetchall()}
-
-            # Debugowanie
-            # print(f"[DEBUG] Pobranie room_numbers: {room_numbers}")
-
-            ### Formatowanie wyników ###
-            final_results = []
-            #pylint: disable=W0612
-            for meeting_id, details in meeting_details.items():
-                meeting_type = meeting_types.get(details["fk_meeting_type_id"], "Nieznane")
-                room_id = reservation_to_room.get(details["fk_reservation_id"], None)
-                room_number = room_numbers.get(room_id, "Brak pokoju")
-                final_results.append({
-                    "meeting_date": details["meeting_date"],
-                    "meeting_type": meeting_type,
-                    "room_number": room_number
-                })
+            cursor = self.db_controller.connection.execute(query_meetings, (employee_id, target_date))
+            final_results = [dict(row) for row in cursor.fetchall()]
 
             # Debugowanie
             # print(f"[DEBUG] Końcowe wyniki spotkań: {final_results}")
@@ -340,94 +273,27 @@ class DashboardService:
         try:
             self.db_controller.ensure_connection()
 
-            # Obliczenie daty początkowej
+            # Obliczenie daty początkowej (początek dnia w minutach od epoki - kolumna start_ts)
             target_date = (date.today() + timedelta(days=date_offset)).strftime("%Y-%m-%d")
+            target_ts = epoch_minutes(target_date)
             # print(f"[dashboard_service][DEBUG] Używana data: {target_date}")
 
-            # Pobranie assignment_id przypisanych do fk_employee_id
-            query_assignments = """
-            SELECT assignment_id
-            FROM assigned_patients
-            WHERE fk_employee_id = ?
-            """
-            cursor = self.db_controller.connection.execute(query_assignments, (fk_employee_id,))
-            assignment_ids = [row[0] for row in cursor.fetchall()]
-
-            # print(f"[dashboard_service][DEBUG] Pobranie assignment_id dla fk_employee_id {fk_employee_id}: {assignment_ids}")
-
-            if not assignment_ids:
-                return []  # Brak przypisań dla pracownika
-
-            # Pobranie appointment_date oraz fk_reservation_id z tabeli appointments
-            placeholders = ", ".join(["?"] * len(assignment_ids))
-            query_appointments = f"""
-            SELECT fk_assignment_id, appointment_date, fk_reservation_id
-            FROM appointments
-            WHERE fk_assignment_id IN ({placeholders}) AND appointment_date >= ?
-            ORDER BY appointment_date ASC
+            # Najbliższe wizyty pracownika z pacjentem i numerem pokoju (jedno zapytanie)
+            query_appointments = """
+            SELECT a.appointment_date,
+                   COALESCE(p.first_name || ' ' || p.last_name, 'Nieznany pacjent') AS patient_name,
+                   COALESCE(ro.room_number, 'Brak pokoju') AS room_number
+            FROM assigned_patients ap
+            JOIN appointments a ON a.fk_assignment_id = ap.assignment_id
+            LEFT JOIN patients p ON p.patient_id = ap.fk_patient_id
+            LEFT JOIN room_reservations rr ON rr.reservation_id = a.fk_reservation_id
+            LEFT JOIN rooms ro ON ro.room_id = rr.fk_room_id
+            WHERE ap.fk_employee_id = ? AND a.start_ts >= ?
+            ORDER BY a.start_ts ASC
             LIMIT 5
             """
-            cursor = self.db_controller.connection.execute(query_appointments, assignment_ids + [target_date])
-            appointments = {
-                row[0]: {
-                    "appointment_date": row[1],
-                    "fk_reservation_id": row[2]
-                }
-                for row in cursor.fetchall()
-            }
-
-            # print(f"[dashboard_service][DEBUG] Szczegóły wizyt z tabeli appointments: {appointments}")
-
-            if not appointments:
-                return []  # Brak wizyt
-
-            # Pobranie fk_patient_id przypisanych do assignment_id
-            query_patients = f"""
-            SELECT assignment_id, fk_patient_id
-            FROM assigned_patients
-            WHERE assignment_id IN ({placeholders})
-            """
-            cursor = self.db_controller.connection.execute(query_patients, assignment_ids)
-            assignment_to_patient = {row[0]: row[1] for row in cursor.fetchall()}
-
-            # print(f"[dashboard_service][DEBUG] Powiązania assignment_id -> fk_patient_id: {assignment_to_patient}")
-
-            # Pobranie first_name i last_name z tabeli patients
-            patient_ids = list(set(assignment_to_patient.values()))
-            query_patient_names = f"""
-            SELECT patient_id, first_name || ' ' || last_name AS full_name
-            FROM patients
-            WHERE patient_id IN ({", ".join(["?"] * len(patient_ids))})
-            """
-            cursor = self.db_controller.connection.execute(query_patient_names, patient_ids)
-            patient_names = {row[0]: row[1] for row in cursor.fetchall()}
-
-            # print(f"[dashboard_service][DEBUG] Pobranie imion i nazwisk pacjentów: {patient_names}")
-
-            # Pobranie numerów pokoi na podstawie fk_reservation_id
-            reservation_ids = list(set([details["fk_reservation_id"] for details in appointments.values()]))
-            query_room_numbers = f"""
-            SELECT reservation_id, room_number
-            FROM room_reservations
-            JOIN rooms ON room_reservations.fk_room_id = rooms.room_id
-            WHERE reservation_id IN ({", ".join(["?"] * len(reservation_ids))})
-            """
-            cursor = self.db_controller.connection.execute(query_room_numbers, reservation_ids)
-            room_numbers = {row[0]: row[1] for row in cursor.fetchall()}
-
-            # print(f"[dashboard_service][DEBUG] Pobranie numerów pokoi: {room_numbers}")
-
-            # Formatowanie wyników
-            final_results = []
-            for assignment_id, appointment in appointments.items():
-                patient_id = assignment_to_patient.get(assignment_id)
-                patient_name = patient_names.get(patient_id, "Nieznany pacjent")
-                room_number = room_numbers.get(appointment["fk_reservation_id"], "Brak pokoju")
-                final_results.append({
-                    "appointment_date": appointment["appointment_date"],
-                    "patient_name": patient_name,
-                    "room_number": room_number
-                })
+            cursor = self.db_controller.connection.execute(query_appointments, (fk_employee_id, target_ts))
+            final_results = [dict(row) for row in cursor.fetchall()]
 
             # print(f"[dashboard_service][DEBUG] Końcowe wyniki wizyt: {final_results}")
 
@@ -451,37 +317,19 @@ class DashboardService:
         try:
             self.db_controller.ensure_connection()
 
-            # Pobranie assignment_id przypisanych do employee_id
-            query_assignments = """
-            SELECT assignment_id
-            FROM assigned_patients
-            WHERE fk_employee_id = ?
-            """
-            cursor = self.db_controller.connection.execute(query_assignments, (employee_id,))
-            assignment_ids = [row[0] for row in cursor.fetchall()]
-
-            # print(f"[dashboard_services][DEBUG] Pobranie assignment_id dla employee_id {employee_id}: {assignment_ids}")
+            # Liczniki utrzymywane przez wyzwalacze - odczyt jednego wiersza po kluczu głównym
+            totals = AppointmentStatsManager(self.db_controller).get_totals(employee_id)
 
-            if not assignment_ids:
+            if not totals["assignment_count"]:
                 return "Brak przypisanych wizyt."
 
-            # Pobranie appointment_id przypisanych do assignment_id
-            placeholders = ", ".join(["?"] * len(assignment_ids))
-            query_appointments = f"""
-            SELECT COUNT(*)
-            FROM appointments
-            WHERE fk_assignment_id IN ({placeholders})
-            """
-            cursor = self.db_controller.connection.execute(query_appointments, assignment_ids)
-            appointment_count = cursor.fetchone()[0]
-
-            # print(f"[dashboard_services][DEBUG] Liczba pobranych wizyt dla employee_id {employee_id}: {appointment_count}")
+            # print(f"[dashboard_services][DEBUG] Liczba pobranych wizyt dla employee_id {employee_id}: {totals['appointment_count']}")
 
-            return f"Liczba przypisanych wizyt: {appointment_count}"
+            return f"Liczba przypisanych wizyt: {totals['appointment_count']}"
 
-        except sqlite3.Error as e:
-            print(f"[dashboard_services][ERROR] Błąd podczas pobierania liczby wizyt: {e}")
-            raise RuntimeError(f"Błąd podczas pobierania liczby wizyt: {e}") from e
+        except RuntimeError as e:
+            print(f"[dashboard_services][ERROR] {e}")
+            raise
 
 
     def get_todays_appointments_by_employee_id(self, employee_id, date_offset=0):
@@ -503,27 +351,17 @@ class DashboardService:
             target_date = (date.today() + timedelta(days=date_offset)).strftime("%Y-%m-%d")
             # print(f"[dashboard_service][DEBUG] Pobieranie wizyt dla employee_id {employee_id} na dzień: {target_date}")
 
-            # Pobranie assignment_id przypisanych do employee_id
-            query_assignments = """
-            SELECT assignment_id FROM assigned_patients WHERE fk_employee_id = ?
-            """
-            cursor = self.db_controller.connection.execute(query_assignments, (employee_id,))
-            assignment_ids = [row[0] for row in cursor.fetchall()]
-
-            # print(f"[dashboard_service][DEBUG] Pobranie assignment_id: {assignment_ids}")
-
-            if not assignment_ids:
-                return []  # Brak przypisań do pracownika
-
-            # Pobranie wizyt przypisanych do assignment_id 
-            placeholders = ", ".join(["?"] * len(assignment_ids))
-            query_appointments = f"""
-            SELECT appointment_id, appointment_date, fk_assignment_id, fk_reservation_id
-            FROM appointments
-            WHERE fk_assignment_id IN ({placeholders}) AND appointment_date LIKE ?
-            ORDER BY appointment_date ASC
+            # Wizyty pracownika z danego dnia (zakres start_ts obejmujący cały dzień)
+            query_appointments = """
+            SELECT a.appointment_id, a.appointment_date, a.fk_assignment_id, a.fk_reservation_id
+            FROM assigned_patients ap
+            JOIN appointments a ON a.fk_assignment_id = ap.assignment_id
+            WHERE ap.fk_employee_id = ? AND a.start_ts >= ? AND a.start_ts < ?
+            ORDER BY a.start_ts ASC
             """
-            cursor = self.db_controller.connection.execute(query_appointments, assignment_ids + [f"{target_date}%"])
+            cursor = self.db_controller.connection.execute(
+                query_appointments, (employee_id, *day_range_ts(target_date))
+            )
             appointments = [
                 {
                     "appointment_id": row[0],
@@ -541,3 +379,144 @@ class DashboardService:
         except sqlite3.Error as e:
             print(f"[dashboard_service][ERROR] Błąd podczas pobierania wizyt: {e}")
             raise RuntimeError(f"Błąd podczas pobierania wizyt: {e}") from e
+
+
+    def get_todays_appointment_count_by_employee_id(self, employee_id, date_offset=0):
+        """
+        Pobiera liczbę wizyt danego pracownika (`employee_id`) na określoną datę
+        (dzisiejszą z możliwością przesunięcia) z liczników `employee_daily_appointment_stats`.
+
+        Args:
+            employee_id (int): ID pracownika.
+            date_offset (int, opcjonalne): Przesunięcie daty w dniach (np. -1 dla wczoraj, 1 dla jutra).
+
+        Returns:
+            int: Liczba wizyt.
+        """
+        target_date = (date.today() + timedelta(days=date_offset)).strftime("%Y-%m-%d")
+        try:
+            return AppointmentStatsManager(self.db_controller).get_daily_count(employee_id, target_date)
+        except RuntimeError as e:
+            print(f"[dashboard_service][ERROR] {e}")
+            raise
+
+
+ # -------------------------------------------------------------------------
+
+    def get_snapshot(self, user_id, date_offset=0, limit=5):
+        """
+        Pobiera komplet danych dashboardu zalogowanego użytkownika stałą liczbą zapytań
+        (niezależnie od liczby przypisań, wizyt i spotkań):
+        1. użytkownik, rola, pracownik oraz liczba dzisiejszych i wszystkich wizyt,
+        2. specjalizacje pracownika,
+        3. najbliższe wizyty (pacjent, pokój),
+        4. najbliższe spotkania (typ spotkania, pokój).
+
+        Args:
+            user_id (int): ID zalogowanego użytkownika.
+            date_offset (int): Przesunięcie daty (domyślnie 0 = dzisiejsza data).
+            limit (int): Maksymalna liczba najbliższych wizyt i spotkań.
+
+        Returns:
+            dict: Słownik z kluczami `user_id`, `employee_id`, `role_id`, `formatted_username`,
+            `role_name`, `specialties`, `date`, `day_name`, `todays_appointments_count`,
+            `appointments_count`, `upcoming_appointments`, `meetings`.
+
+        Raises:
+            ValueError: Jeśli użytkownik nie istnieje.
+            RuntimeError: W przypadku błędu bazy danych.
+        """
+        try:
+            # Migawka jest tylko odczytem - połączenie z puli tylko do odczytu nie blokuje zapisów (WAL)
+            with self.db_controller.read_connection() as connection:
+
+                target_date = (date.today() + timedelta(days=date_offset)).strftime("%Y-%m-%d")
+                day_start_ts, _ = day_range_ts(target_date)
+
+                ### Użytkownik, rola, pracownik i liczniki wizyt ###
+                # Liczniki utrzymywane przez wyzwalacze (database/appointment_stats.py) -
+                # odczyt po kluczu głównym niezależnie od liczby wizyt pracownika
+                query_user = """
+                SELECT ua.user_id, ua.employee_id, ua.role_id, r.role_name, e.first_name, e.last_name,
+                    COALESCE(ds.appointment_count, 0) AS todays_appointments_count,
+                    COALESCE(ts.appointment_count, 0) AS appointments_count
+                FROM users_accounts ua
+                LEFT JOIN roles r ON r.role_id = ua.role_id
+                LEFT JOIN employees e ON e.employee_id = ua.employee_id
+                LEFT JOIN employee_daily_appointment_stats ds
+                    ON ds.fk_employee_id = ua.employee_id AND ds.appointment_day = ?
+                LEFT JOIN employee_appointment_stats ts ON ts.fk_employee_id = ua.employee_id
+                WHERE ua.user_id = ?
+                """
+                user_row = connection.execute(query_user, (target_date, user_id)).fetchone()
+                if user_row is None:
+                    raise ValueError(f"Nie znaleziono użytkownika o ID {user_id}")
+
+                employee_id = user_row["employee_id"]
+                formatted_name = None
+                if user_row["first_name"] is not None or user_row["last_name"] is not None:
+                    formatted_name = f"{(user_row['first_name'] or '').capitalize()} {(user_row['last_name'] or '').capitalize()}".strip()
+
+                ### Specjalizacje ###
+                query_specialties = """
+                SELECT s.specialty_name
+                FROM employee_specialties es
+                JOIN specialties s ON s.specialty_id = es.specialty_id
+                WHERE es.employee_id = ?
+                ORDER BY es.employee_specialty_id
+                """
+                cursor = connection.execute(query_specialties, (employee_id,))
+                specialties = [row[0] for row in cursor.fetchall() if row[0]]
+
+                ### Najbliższe wizyty ###
+                query_appointments = """
+                SELECT a.appointment_date,
+                       COALESCE(p.first_name || ' ' || p.last_name, 'Nieznany pacjent') AS patient_name,
+                       COALESCE(ro.room_number, 'Brak pokoju') AS room_number
+                FROM assigned_patients ap
+                JOIN appointments a ON a.fk_assignment_id = ap.assignment_id
+                LEFT JOIN patients p ON p.patient_id = ap.fk_patient_id
+                LEFT JOIN room_reservations rr ON rr.reservation_id = a.fk_reservation_id
+                LEFT JOIN rooms ro ON ro.room_id = rr.fk_room_id
+                WHERE ap.fk_employee_id = ? AND a.start_ts >= ?
+                ORDER BY a.start_ts ASC
+                LIMIT ?
+                """
+                cursor = connection.execute(query_appointments, (employee_id, day_start_ts, limit))
+                upcoming_appointments = [dict(row) for row in cursor.fetchall()]
+
+                ### Najbliższe spotkania ###
+                query_meetings = """
+                SELECT im.meeting_date,
+                       COALESCE(mt.meeting_type, 'Nieznane') AS meeting_type,
+                       COALESCE(ro.room_number, 'Brak pokoju') AS room_number
+                FROM meeting_participants mp
+                JOIN internal_meetings im ON im.meeting_id = mp.fk_meeting_id
+                LEFT JOIN meeting_types mt ON mt.meeting_type_id = im.fk_meeting_type_id
+                LEFT JOIN room_reservations rr ON rr.reservation_id = im.fk_reservation_id
+                LEFT JOIN rooms ro ON ro.room_id = rr.fk_room_id
+                WHERE mp.fk_employee_id = ? AND im.meeting_date >= ?
+                ORDER BY im.meeting_date ASC
+                LIMIT ?
+                """
+                cursor = connection.execute(query_meetings, (employee_id, target_date, limit))
+                meetings = [dict(row) for row in cursor.fetchall()]
+
+                return {
+                    "user_id": user_row["user_id"],
+                    "employee_id": employee_id,
+                    "role_id": user_row["role_id"],
+                    "formatted_username": formatted_name,
+                    "role_name": user_row["role_name"] or "Nieznana rola",
+                    "specialties": specialties,
+                    "date": target_date,
+                    "day_name": self.get_current_day_name(date_offset),
+                    "todays_appointments_count": user_row["todays_appointments_count"],
+                    "appointments_count": user_row["appointments_count"],
+                    "upcoming_appointments": upcoming_appointments,
+                    "meetings": meetings,
+                }
+
+        except sqlite3.Error as e:
+            print(f"[dashboard_service][ERROR] Błąd podczas pobierania danych dashboardu: {e}")
+            raise RuntimeError(f"Błąd podczas pobierania danych dashboardu: {e}") from e
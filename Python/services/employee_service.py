@@ -18,16 +18,14 @@ class EmployeeService():
             dict: Zawiera dwie listy - services i specialties, każda jako lista słowników.
         """
         try:
-            # Pobranie wszystkich danych z tabeli services
-            query_services = "SELECT * FROM services"
-            cursor = self.employee_service_controller.db_controller.connection.execute(query_services)
-            services_data = [dict(row) for row in cursor.fetchall()]
+            reference_cache = self.employee_service_controller.db_controller.reference_cache
+
+            # Wszystkie dane z tabeli services (kopie wierszy z pamięci podręcznej tabel słownikowych)
+            services_data = [dict(row) for row in reference_cache.get_rows("services").values()]
             # print(f"[### EMPLOYEE_SERVICE] Pobranie danych z tabeli services: {services_data}")
 
-            # Pobranie wszystkich danych z tabeli specialties
-            query_specialties = "SELECT * FROM specialties"
-            cursor = self.employee_service_controller.db_controller.connection.execute(query_specialties)
-            specialties_data = [dict(row) for row in cursor.fetchall()]
+            # Wszystkie dane z tabeli specialties
+            specialties_data = [dict(row) for row in reference_cache.get_rows("specialties").values()]
             # print(f"[### EMPLOYEE_SERVICE] Pobranie danych z tabeli specialties: {specialties_data}")
 
             # Zwrócenie wyników jako słownik
@@ -42,6 +40,9 @@ class EmployeeService():
         except TypeError as type_error:
             print(f"[### EMPLOYEE_SERVICE] Błąd typu danych: {str(type_error)}")
             return {"services": [], "specialties": []}
+        except RuntimeError as runtime_error:
+            print(f"[### EMPLOYEE_SERVICE] Błąd pamięci podręcznej tabel słownikowych: {str(runtime_error)}")
+            return {"services": [], "specialties": []}
 
 
     def get_formatted_employee_services(self):
@@ -59,16 +60,12 @@ class EmployeeService():
             employee_services_data = [dict(row) for row in cursor.fetchall()]
             # print(f"[### EMPLOYEE_SERVICE] Dane z tabeli employee_services: {employee_services_data}")
 
-            # Pobranie danych z tabeli employees
-            query_employees = "SELECT employee_id, first_name, last_name FROM employees"
-            cursor = self.employee_service_controller.db_controller.connection.execute(query_employees)
-            employees_data = {row["employee_id"]: {"first_name": row["first_name"], "last_name": row["last_name"]} for row in cursor.fetchall()}
+            # Dane pracowników i nazwy usług z pamięci podręcznej tabel słownikowych
+            reference_cache = self.employee_service_controller.db_controller.reference_cache
+            employees_data = reference_cache.get_rows("employees")
             # print(f"[### EMPLOYEE_SERVICE] Dane z tabeli employees: {employees_data}")
 
-            # Pobranie danych z tabeli services
-            query_services = "SELECT service_id, service_type FROM services"
-            cursor = self.employee_service_controller.db_controller.connection.execute(query_services)
-            services_data = {row["service_id"]: row["service_type"] for row in cursor.fetchall()}
+            services_data = reference_cache.get_names("services")
             # print(f"[### EMPLOYEE_SERVICE] Dane z tabeli services: {services_data}")
 
             # Formatowanie danych
@@ -101,6 +98,9 @@ class EmployeeService():
         except AttributeError as ae:
             print(f"[### EMPLOYEE_SERVICE] Błąd atrybutu: {str(ae)}")
             return []
+        except RuntimeError as re:
+            print(f"[### EMPLOYEE_SERVICE] Błąd pamięci podręcznej tabel słownikowych: {str(re)}")
+            return []
 
 
     def get_formatted_employee_specialties(self):
@@ -118,18 +118,12 @@ class EmployeeService():
             employee_specialties_data = [dict(row) for row in cursor.fetchall()]
             # print(f"[### EMPLOYEE_SERVICE] Pobranie danych z tabeli employee_specialties: {employee_specialties_data}")
 
-            # Pobranie kolumn employee_id, first_name, last_name z tabeli employees
-            query_employees = "SELECT employee_id, first_name, last_name FROM employees"
-            cursor = self.employee_service_controller.db_controller.connection.execute(query_employees)
-            employees_data = {row["employee_id"]: {"first_name": row["first_name"], "last_name": row["last_name"]}
-                              for row in cursor.fetchall()}
+            # Dane pracowników i specjalizacji z pamięci podręcznej tabel słownikowych
+            reference_cache = self.employee_service_controller.db_controller.reference_cache
+            employees_data = reference_cache.get_rows("employees")
             # print(f"[### EMPLOYEE_SERVICE] Pobranie danych z tabeli employees: {employees_data}")
 
-            # Pobranie kolumn specialty_id, specialty_name z tabeli specialties
-            query_specialties = "SELECT specialty_id, specialty_name FROM specialties"
-            cursor = self.employee_service_controller.db_controller.connection.execute(query_specialties)
-            specialties_data = {row["specialty_id"]: {"specialty_name": row["specialty_name"]}
-                                for row in cursor.fetchall()}
+            specialties_data = reference_cache.get_rows("specialties")
             # print(f"[### EMPLOYEE_SERVICE] Pobranie danych z tabeli specialties: {specialties_data}")
 
             # Formatowanie danych
@@ -154,6 +148,9 @@ class EmployeeService():
         except AttributeError as ae:
             print(f"[### EMPLOYEE_SERVICE] Błąd atrybutu: {str(ae)}")
             return []
+        except RuntimeError as re:
+            print(f"[### EMPLOYEE_SERVICE] Błąd pamięci podręcznej tabel słownikowych: {str(re)}")
+            return []
 
 
     def get_all_employee_specialties(self):
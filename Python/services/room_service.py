@@ -1,5 +1,15 @@
 
 import sqlite3
+from database.room_availability import (
+    DAY_END_MINUTE,
+    DAY_START_MINUTE,
+    format_time_range,
+    parse_minutes,
+    parse_time_range,
+)
+from database.appointment_series import SERIES_PARAMETERS, AppointmentSeriesScheduler
+from database.id_sets import json_id_set
+from database.time_columns import day_range_ts
 
 class RoomService():
     """
@@ -238,6 +248,193 @@ class RoomService():
             print(f"[### ROOM_SERVICE] Błąd bazy danych: {db_err}")
             return []
 
+    def get_reservation_ids_for_room(self, room_id):
+        """
+        Pobiera `reservation_id` rezerwacji przypisanych do podanego pokoju.
+
+        :param room_id: ID pokoju.
+        :return: Lista wartości `reservation_id` jako liczby całkowite.
+        """
+        try:
+            query = "SELECT reservation_id FROM room_reservations WHERE fk_room_id = ? ORDER BY reservation_id"
+            cursor = self.room_service_controller.db_controller.connection.execute(query, (room_id,))
+            return [row[0] for row in cursor.fetchall()]
+
+        except sqlite3.OperationalError as op_err:
+            print(f"[### ROOM_SERVICE] Błąd operacyjny bazy danych: {op_err}")
+            return []
+
+        except sqlite3.DatabaseError as db_err:
+            print(f"[### ROOM_SERVICE] Błąd bazy danych: {db_err}")
+            return []
+
+    def get_reservation_conflicts(self, room_id, reservation_date, reservation_time, exclude_reservation_id=None):
+        """
+        Zwraca ID rezerwacji pokoju, które nachodzą na podany przedział czasu w danym dniu
+        (również częściowo, np. 10:00-11:00 i 10:30-11:30).
+
+        :param room_id: ID pokoju.
+        :param reservation_date: Data rezerwacji (YYYY-MM-DD).
+        :param reservation_time: Przedział czasu (HH:MM-HH:MM).
+        :param exclude_reservation_id: Rezerwacja pomijana przy sprawdzaniu (np. aktualizowana).
+        :return: Lista ID kolidujących rezerwacji.
+        :raises ValueError: Jeśli przedział czasu ma nieprawidłowy format.
+        """
+        start, end = parse_time_range(reservation_time)
+        room_availability = self.room_service_controller.db_controller.room_availability
+        return room_availability.get_conflicts(room_id, reservation_date, start, end, exclude_reservation_id)
+
+    def get_free_slots(self, room_id, reservation_date):
+        """
+        Zwraca wolne przedziały czasu pokoju w danym dniu (w godzinach pracy).
+
+        :return: Lista przedziałów w formacie HH:MM-HH:MM.
+        """
+        room_availability = self.room_service_controller.db_controller.room_availability
+        return [format_time_range(start, end) for start, end in room_availability.get_free_slots(room_id, reservation_date)]
+
+    def find_first_free_room(self, room_type_id, reservation_date, duration_minutes, earliest_time=None):
+        """
+        Wyszukuje pokój danego typu z najwcześniejszym wolnym terminem o podanej długości.
+
+        :param room_type_id: ID typu pokoju.
+        :param reservation_date: Data rezerwacji (YYYY-MM-DD).
+        :param duration_minutes: Czas trwania w minutach.
+        :param earliest_time: Najwcześniejsza godzina rozpoczęcia (HH:MM), domyślnie początek dnia pracy.
+        :return: Słownik {"room_id", "room_number", "reservation_date", "reservation_time"} lub None.
+        :raises ValueError: Jeśli czas trwania lub godzina mają nieprawidłową wartość.
+        """
+        earliest = parse_minutes(earliest_time) if earliest_time else DAY_START_MINUTE
+        room_availability = self.room_service_controller.db_controller.room_availability
+        free_room = room_availability.find_first_free_room(
+            room_type_id, reservation_date, duration_minutes, earliest, DAY_END_MINUTE
+        )
+        if free_room is None:
+            return None
+        return {
+            "room_id": free_room["room_id"],
+            "room_number": free_room["room_number"],
+            "reservation_date": reservation_date,
+            "reservation_time": free_room["reservation_time"],
+        }
+
+    def plan_appointment_series(self, series: dict) -> dict:
+        """
+        Wyznacza terminy serii wizyt i ich konflikty bez zapisu do bazy (zob. `AppointmentSeriesScheduler.plan`).
+
+        :param series: Słownik parametrów serii, np. {"assignment_id": 4, "service_id": 2, "room_type_id": 1,
+            "start_date": "2025-03-03", "weekdays": [0, 3], "start_time": "10:00", "count": 12}.
+        :raises ValueError: Jeśli parametry serii są nieprawidłowe.
+        """
+        series = self._check_series_parameters(series)
+        for parameter in ("skip_conflicts", "appointment_status", "notes"):
+            series.pop(parameter, None)
+        return AppointmentSeriesScheduler(self.room_service_controller.db_controller).plan(**series)
+
+    def schedule_appointment_series(self, series: dict) -> dict:
+        """
+        Zapisuje rezerwacje i wizyty serii w jednej transakcji (zob. `AppointmentSeriesScheduler.schedule`).
+
+        :return: Słownik {"scheduled", "conflicts"}.
+        :raises ValueError: Jeśli parametry serii są nieprawidłowe.
+        :raises RuntimeError: W przypadku błędu bazy danych.
+        """
+        series = self._check_series_parameters(series)
+        return AppointmentSeriesScheduler(self.room_service_controller.db_controller).schedule(**series)
+
+    @staticmethod
+    def _check_series_parameters(series):
+        unknown = sorted(set(series) - set(SERIES_PARAMETERS))
+        if unknown:
+            raise ValueError(f"Nieznane parametry serii: {', '.join(unknown)}.")
+        missing = [name for name in ("assignment_id", "service_id", "start_date", "weekdays", "start_time") if name not in series]
+        if missing:
+            raise ValueError(f"Brak parametrów serii: {', '.join(missing)}.")
+        return dict(series)
+
+    def get_reservations_in_range(self, date_from, date_to=None, room_id=None):
+        """
+        Pobiera rezerwacje rozpoczynające się w dniach od `date_from` do `date_to` włącznie
+        (domyślnie jeden dzień), opcjonalnie tylko dla jednego pokoju.
+
+        Zakres jest skanem indeksu `start_ts` (lub `fk_room_id, start_ts`), a nie porównaniem tekstu daty.
+
+        :param date_from: Pierwszy dzień zakresu (YYYY-MM-DD).
+        :param date_to: Ostatni dzień zakresu (YYYY-MM-DD).
+        :param room_id: ID pokoju (None - wszystkie pokoje).
+        :return: Lista słowników posortowana po `start_ts`.
+        :raises ValueError: Jeśli data ma nieprawidłowy format.
+        """
+        start_ts, end_ts = day_range_ts(date_from, date_to)
+        query = """
+            SELECT reservation_id, fk_room_id, reservation_date, reservation_time, start_ts, end_ts
+            FROM room_reservations
+            WHERE start_ts >= ? AND start_ts < ?
+        """
+        params = [start_ts, end_ts]
+        if room_id is not None:
+            query += " AND fk_room_id = ?"
+            params.append(room_id)
+        query += " ORDER BY start_ts"
+
+        try:
+            with self.room_service_controller.db_controller.read_connection() as connection:
+                return [dict(row) for row in connection.execute(query, params).fetchall()]
+
+        except sqlite3.OperationalError as op_err:
+            print(f"[### ROOM_SERVICE] Błąd operacyjny bazy danych: {op_err}")
+            return []
+
+        except sqlite3.DatabaseError as db_err:
+            print(f"[### ROOM_SERVICE] Błąd bazy danych: {db_err}")
+            return []
+
+    def get_appointments_in_range(self, date_from, date_to=None, employee_id=None):
+        """
+        Pobiera wizyty rozpoczynające się w dniach od `date_from` do `date_to` włącznie
+        (domyślnie jeden dzień), opcjonalnie tylko wizyty pacjentów przypisanych do pracownika.
+
+        Zakres jest skanem indeksu `start_ts` (lub `fk_assignment_id, start_ts`), a nie porównaniem tekstu daty.
+
+        :param date_from: Pierwszy dzień zakresu (YYYY-MM-DD).
+        :param date_to: Ostatni dzień zakresu (YYYY-MM-DD).
+        :param employee_id: ID pracownika (None - wszystkie wizyty).
+        :return: Lista słowników posortowana po `start_ts`.
+        :raises ValueError: Jeśli data ma nieprawidłowy format.
+        """
+        start_ts, end_ts = day_range_ts(date_from, date_to)
+        if employee_id is None:
+            query = """
+                SELECT a.appointment_id, a.fk_assignment_id, a.fk_service_id, a.fk_reservation_id,
+                       a.appointment_date, a.appointment_status, a.start_ts, a.end_ts
+                FROM appointments a
+                WHERE a.start_ts >= ? AND a.start_ts < ?
+                ORDER BY a.start_ts
+            """
+            params = (start_ts, end_ts)
+        else:
+            query = """
+                SELECT a.appointment_id, a.fk_assignment_id, a.fk_service_id, a.fk_reservation_id,
+                       a.appointment_date, a.appointment_status, a.start_ts, a.end_ts
+                FROM assigned_patients ap
+                JOIN appointments a ON a.fk_assignment_id = ap.assignment_id
+                WHERE ap.fk_employee_id = ? AND a.start_ts >= ? AND a.start_ts < ?
+                ORDER BY a.start_ts
+            """
+            params = (employee_id, start_ts, end_ts)
+
+        try:
+            with self.room_service_controller.db_controller.read_connection() as connection:
+                return [dict(row) for row in connection.execute(query, params).fetchall()]
+
+        except sqlite3.OperationalError as op_err:
+            print(f"[### ROOM_SERVICE] Błąd operacyjny bazy danych: {op_err}")
+            return []
+
+        except sqlite3.DatabaseError as db_err:
+            print(f"[### ROOM_SERVICE] Błąd bazy danych: {db_err}")
+            return []
+
     def get_all_room_types(self):
         """
         Pobiera wszystkie wartości z kolumny room_type z tabeli room_types.
@@ -392,31 +589,22 @@ class RoomService():
             cursor = self.room_service_controller.db_controller.connection.execute(query_assigned_patients)
             assigned_patients_data = {row["assignment_id"]: dict(row) for row in cursor.fetchall()}  # KONWERSJA NA SŁOWNIK
 
-            # Pobranie imion i nazwisk pracowników
-            query_employees = "SELECT employee_id, first_name, last_name FROM employees"
-            cursor = self.room_service_controller.db_controller.connection.execute(query_employees)
-            employees_data = {row["employee_id"]: f"{row['first_name']} {row['last_name']}" for row in cursor.fetchall()}
+            # Imiona i nazwiska pracowników, typy usług i pokoje z pamięci podręcznej tabel słownikowych
+            reference_cache = self.room_service_controller.db_controller.reference_cache
+            employees_data = reference_cache.get_names("employees")
+            services_data = reference_cache.get_names("services")
+            rooms_data = reference_cache.get_rows("rooms")
 
             # Pobranie imion i nazwisk pacjentów
             query_patients = "SELECT patient_id, first_name, last_name FROM patients"
             cursor = self.room_service_controller.db_controller.connection.execute(query_patients)
             patients_data = {row["patient_id"]: f"{row['first_name']} {row['last_name']}" for row in cursor.fetchall()}
 
-            # Pobranie typów usług na podstawie `fk_service_id`
-            query_services = "SELECT service_id, service_type FROM services"
-            cursor = self.room_service_controller.db_controller.connection.execute(query_services)
-            services_data = {row["service_id"]: row["service_type"] for row in cursor.fetchall()}
-
             # Pobranie `fk_room_id` na podstawie `fk_reservation_id` z `room_reservations`
             query_room_reservations = "SELECT reservation_id, fk_room_id FROM room_reservations"
             cursor = self.room_service_controller.db_controller.connection.execute(query_room_reservations)
             room_reservations_data = {row["reservation_id"]: row["fk_room_id"] for row in cursor.fetchall()}
 
-            # Pobranie numerów pokojów na podstawie `room_id`
-            query_rooms = "SELECT room_id, room_number FROM rooms"
-            cursor = self.room_service_controller.db_controller.connection.execute(query_rooms)
-            rooms_data = {row["room_id"]: row["room_number"] for row in cursor.fetchall()}
-
             # Formatowanie wyników
             formatted_appointments = []
             for appointment in appointments_data:
@@ -425,6 +613,7 @@ class RoomService():
                 employee_id = assigned_patients_data.get(assignment_id, {}).get("fk_employee_id", None)
                 service_id = appointment["fk_service_id"]
                 reservation_id = appointment["fk_reservation_id"]
+                room = rooms_data.get(room_reservations_data.get(reservation_id))
 
                 formatted_appointments.append({
                     "appointment_id": appointment["appointment_id"],
@@ -434,7 +623,7 @@ class RoomService():
                     "fk_service_id": service_id,
                     "service_type": services_data.get(service_id, "Nieznana usługa"),
                     "fk_reservation_id": reservation_id,
-                    "room_number": rooms_data.get(room_reservations_data.get(reservation_id), "Nieznany pokój"),
+                    "room_number": room["room_number"] if room else "Nieznany pokój",
                     "appointment_date": appointment["appointment_date"],
                     "appointment_status": appointment["appointment_status"],
                     "notes": appointment["notes"],
@@ -457,6 +646,9 @@ class RoomService():
         except TypeError as te:
             print(f"[### ROOM_SERVICE] Błąd przetwarzania danych: {te}")
             return []
+        except RuntimeError as rt_err:
+            print(f"[### ROOM_SERVICE] Błąd pamięci podręcznej tabel słownikowych: {rt_err}")
+            return []
 
 
 
@@ -470,111 +662,51 @@ class RoomService():
                 print("[### ROOM_SERVICE] Brak przypisanego pracownika dla zalogowanego użytkownika.")
                 return []
 
-            # Pobranie wszystkich `assignment_id` przypisanych do `employee_id` z `assigned_patients`
-            query_assignments = """
-                SELECT assignment_id FROM assigned_patients WHERE fk_employee_id = ?
+            # Wizyty pracownika wraz z pacjentem i pokojem rezerwacji - jedno zapytanie zamiast
+            # łańcucha `assignment_id` -> `appointments` -> `patients` / `room_reservations`
+            query_appointments = """
+                SELECT a.*, ap.fk_patient_id, p.first_name, p.last_name, rr.fk_room_id
+                FROM assigned_patients ap
+                JOIN appointments a ON a.fk_assignment_id = ap.assignment_id
+                LEFT JOIN patients p ON p.patient_id = ap.fk_patient_id
+                LEFT JOIN room_reservations rr ON rr.reservation_id = a.fk_reservation_id
+                WHERE ap.fk_employee_id = ?
+                ORDER BY a.appointment_id
             """
-            cursor = self.room_service_controller.db_controller.connection.execute(query_assignments, (employee_id,))
-            assignment_ids = [row["assignment_id"] for row in cursor.fetchall()]
-
-            if not assignment_ids:
-                print(f"[### ROOM_SERVICE] Brak przypisanych pacjentów dla employee_id: {employee_id}")
-                return []
-
-            # Pobranie wszystkich rekordów z `appointments` na podstawie `fk_assignment_id`
-            placeholders = ', '.join(['?'] * len(assignment_ids))
-            query_appointments = f"""
-                SELECT * FROM appointments WHERE fk_assignment_id IN ({placeholders})
-            """
-            cursor = self.room_service_controller.db_controller.connection.execute(query_appointments, assignment_ids)
+            cursor = self.room_service_controller.db_controller.connection.execute(query_appointments, (employee_id,))
             appointments_data = [dict(row) for row in cursor.fetchall()]
 
             if not appointments_data:
                 print(f"[### ROOM_SERVICE] Brak wizyt przypisanych do pracownika o ID {employee_id}")
                 return []
 
-            # Pobranie dodatkowych danych do sformatowania wyników
-
-            # Pobranie `assignment_id`, `fk_patient_id`, `fk_employee_id` dla aktualnego `employee_id`
-            query_assigned_patients = """
-                SELECT assignment_id, fk_patient_id FROM assigned_patients WHERE fk_employee_id = ?
-            """
-            cursor = self.room_service_controller.db_controller.connection.execute(query_assigned_patients, (employee_id,))
-            assigned_patients_data = {row["assignment_id"]: row["fk_patient_id"] for row in cursor.fetchall()}
-
-            # Pobranie imienia i nazwiska pracownika
-            query_employee_name = """
-                SELECT first_name, last_name FROM employees WHERE employee_id = ?
-            """
-            cursor = self.room_service_controller.db_controller.connection.execute(query_employee_name, (employee_id,))
-            employee_name = cursor.fetchone()
-            employee_full_name = f"{employee_name['first_name']} {employee_name['last_name']}" if employee_name else "Nieznany"
-
-            # Pobranie imienia i nazwiska pacjentów na podstawie `fk_patient_id`
-            patient_ids = list(assigned_patients_data.values())
-            if patient_ids:
-                placeholders = ', '.join(['?'] * len(patient_ids))
-                query_patients = f"""
-                    SELECT patient_id, first_name, last_name FROM patients WHERE patient_id IN ({placeholders})
-                """
-                cursor = self.room_service_controller.db_controller.connection.execute(query_patients, patient_ids)
-                patients_data = {row["patient_id"]: f"{row['first_name']} {row['last_name']}" for row in cursor.fetchall()}
-            else:
-                patients_data = {}
-
-            # Pobranie typu usługi `service_type` na podstawie `fk_service_id`
-            service_ids = [appointment["fk_service_id"] for appointment in appointments_data if appointment["fk_service_id"]]
-            if service_ids:
-                placeholders = ', '.join(['?'] * len(service_ids))
-                query_services = f"""
-                    SELECT service_id, service_type FROM services WHERE service_id IN ({placeholders})
-                """
-                cursor = self.room_service_controller.db_controller.connection.execute(query_services, service_ids)
-                services_data = {row["service_id"]: row["service_type"] for row in cursor.fetchall()}
-            else:
-                services_data = {}
-
-            # Pobranie `fk_room_id` na podstawie `fk_reservation_id` z `room_reservations`
-            reservation_ids = [appointment["fk_reservation_id"] for appointment in appointments_data if appointment["fk_reservation_id"]]
-            if reservation_ids:
-                placeholders = ', '.join(['?'] * len(reservation_ids))
-                query_room_reservations = f"""
-                    SELECT reservation_id, fk_room_id FROM room_reservations WHERE reservation_id IN ({placeholders})
-                """
-                cursor = self.room_service_controller.db_controller.connection.execute(query_room_reservations, reservation_ids)
-                room_reservations_data = {row["reservation_id"]: row["fk_room_id"] for row in cursor.fetchall()}
-            else:
-                room_reservations_data = {}
-
-            # Pobranie numerów pokojów na podstawie `room_id`
-            room_ids = list(room_reservations_data.values())
-            if room_ids:
-                placeholders = ', '.join(['?'] * len(room_ids))
-                query_rooms = f"""
-                    SELECT room_id, room_number FROM rooms WHERE room_id IN ({placeholders})
-                """
-                cursor = self.room_service_controller.db_controller.connection.execute(query_rooms, room_ids)
-                rooms_data = {row["room_id"]: row["room_number"] for row in cursor.fetchall()}
-            else:
-                rooms_data = {}
+            # Imię i nazwisko pracownika, typy usług i pokoje z pamięci podręcznej tabel słownikowych
+            reference_cache = self.room_service_controller.db_controller.reference_cache
+            employee_full_name = reference_cache.get_name("employees", employee_id, "Nieznany")
+            services_data = reference_cache.get_names("services")
+            rooms_data = reference_cache.get_rows("rooms")
 
             # Formatowanie wyników
             formatted_appointments = []
             for appointment in appointments_data:
                 assignment_id = appointment["fk_assignment_id"]
-                patient_id = assigned_patients_data.get(assignment_id, None)
                 service_id = appointment["fk_service_id"]
                 reservation_id = appointment["fk_reservation_id"]
+                room = rooms_data.get(appointment["fk_room_id"])
+                if appointment["first_name"] is not None:
+                    patient_name = f"{appointment['first_name']} {appointment['last_name']}"
+                else:
+                    patient_name = "Nieznany pacjent"
 
                 formatted_appointments.append({
                     "appointment_id": appointment["appointment_id"],
                     "fk_assignment_id": assignment_id,
-                    "patient_name": patients_data.get(patient_id, "Nieznany pacjent"),
+                    "patient_name": patient_name,
                     "employee_name": employee_full_name,
                     "fk_service_id": service_id,
                     "service_type": services_data.get(service_id, "Nieznana usługa"),
                     "fk_reservation_id": reservation_id,
-                    "room_number": rooms_data.get(room_reservations_data.get(reservation_id), "Nieznany pokój"),
+                    "room_number": room["room_number"] if room else "Nieznany pokój",
                     "appointment_date": appointment["appointment_date"],
                     "appointment_status": appointment["appointment_status"],
                     "notes": appointment["notes"],
@@ -596,6 +728,9 @@ class RoomService():
         except TypeError as te:
             print(f"[### ROOM_SERVICE] Błąd przetwarzania danych: {te}")
             return []
+        except RuntimeError as rt_err:
+            print(f"[### ROOM_SERVICE] Błąd pamięci podręcznej tabel słownikowych: {rt_err}")
+            return []
 
 
     def table_get_all_meeting_types(self):
@@ -633,8 +768,12 @@ class RoomService():
         :return: Lista słowników zawierających dane ze spotkań wewnętrznych.
         """
         try:
-            # Pobranie wszystkich rekordów z `internal_meetings`
-            query_meetings = "SELECT * FROM internal_meetings"
+            # Spotkania wraz z pokojem rezerwacji (numery pokojów z pamięci podręcznej tabel słownikowych)
+            query_meetings = """
+                SELECT im.*, rr.fk_room_id
+                FROM internal_meetings im
+                LEFT JOIN room_reservations rr ON rr.reservation_id = im.fk_reservation_id
+            """
             cursor = self.room_service_controller.db_controller.connection.execute(query_meetings)
             meetings_data = [dict(row) for row in cursor.fetchall()]
 
@@ -642,36 +781,14 @@ class RoomService():
                 print("[### ROOM_SERVICE] Brak spotkań wewnętrznych w bazie.")
                 return []
 
-            # Pobranie wszystkich `fk_reservation_id`
-            reservation_ids = [meeting["fk_reservation_id"] for meeting in meetings_data if meeting["fk_reservation_id"]]
-            if reservation_ids:
-                placeholders = ', '.join(['?'] * len(reservation_ids))
-                query_room_reservations = f"""
-                    SELECT reservation_id, fk_room_id FROM room_reservations WHERE reservation_id IN ({placeholders})
-                """
-                cursor = self.room_service_controller.db_controller.connection.execute(query_room_reservations, reservation_ids)
-                room_reservations_data = {row["reservation_id"]: row["fk_room_id"] for row in cursor.fetchall()}
-            else:
-                room_reservations_data = {}
-
-            # Pobranie numerów pokojów na podstawie `room_id`
-            room_ids = list(room_reservations_data.values())
-            if room_ids:
-                placeholders = ', '.join(['?'] * len(room_ids))
-                query_rooms = f"""
-                    SELECT room_id, room_number FROM rooms WHERE room_id IN ({placeholders})
-                """
-                cursor = self.room_service_controller.db_controller.connection.execute(query_rooms, room_ids)
-                rooms_data = {row["room_id"]: row["room_number"] for row in cursor.fetchall()}
-            else:
-                rooms_data = {}
+            rooms_data = self.room_service_controller.db_controller.reference_cache.get_rows("rooms")
 
             # Formatowanie wyników
             formatted_meetings = []
             for meeting in meetings_data:
                 reservation_id = meeting["fk_reservation_id"]
-                room_id = room_reservations_data.get(reservation_id, None)
-                room_number = rooms_data.get(room_id, "Nieznany pokój")
+                room = rooms_data.get(meeting["fk_room_id"])
+                room_number = room["room_number"] if room else "Nieznany pokój"
 
                 formatted_meetings.append({
                     "meeting_id": meeting["meeting_id"],
@@ -699,6 +816,9 @@ class RoomService():
         except TypeError as te:
             print(f"[### ROOM_SERVICE] Błąd przetwarzania danych: {te}")
             return []
+        except RuntimeError as rt_err:
+            print(f"[### ROOM_SERVICE] Błąd pamięci podręcznej tabel słownikowych: {rt_err}")
+            return []
 
 
     def get_all_assignment_ids_for_employee(self, employee_id):
@@ -943,15 +1063,14 @@ class RoomService():
                 print("[### BRIDGE_ROOM] Nieprawidłowa lista assignment_ids")
                 return []
 
-            # Tworzenie placeholders dla zapytania SQL
-            placeholders = ",".join("?" * len(assignment_ids))
-            
+            # Lista ID przekazywana jednym parametrem JSON (niezależnie od liczby przypisań)
+            id_set_sql, id_set_params = json_id_set(assignment_ids)
             query = f"""
                 SELECT appointment_id 
                 FROM appointments 
-                WHERE fk_assignment_id IN ({placeholders})
+                WHERE fk_assignment_id IN {id_set_sql}
             """
-            cursor = self.room_service_controller.db_controller.connection.execute(query, tuple(assignment_ids))
+            cursor = self.room_service_controller.db_controller.connection.execute(query, id_set_params)
             
             appointments = [row["appointment_id"] for row in cursor.fetchall()]
             print(f"[### BRIDGE_ROOM] Pobrano appointment_ids dla assignment_ids {assignment_ids}: {appointments}")
@@ -1149,10 +1268,10 @@ class RoomService():
             if not employee_ids:  # Jeśli lista jest pusta, zwracamy pustą listę
                 return []
 
-            placeholders = ", ".join("?" * len(employee_ids))  # Tworzenie dynamicznych placeholderów (?,?,?)
-            query = f"SELECT service_id FROM employee_services WHERE employee_id IN ({placeholders})"
+            id_set_sql, id_set_params = json_id_set(employee_ids)  # Jeden parametr JSON zamiast (?,?,?)
+            query = f"SELECT service_id FROM employee_services WHERE employee_id IN {id_set_sql}"
 
-            cursor = self.room_service_controller.db_controller.connection.execute(query, employee_ids)
+            cursor = self.room_service_controller.db_controller.connection.execute(query, id_set_params)
             service_ids = [row["service_id"] for row in cursor.fetchall()]
 
             # Debug: Wyświetlenie pobranych service_id
@@ -0,0 +1,199 @@
+import sqlite3
+from database.permission_engine import SCOPE_ALL, SCOPE_ASSIGNED
+from database.search_index import build_match_query
+
+# Maksymalna liczba wyników w każdej kategorii wyszukiwania
+SEARCH_LIMIT = 20
+
+# Znaczniki dopasowania we fragmentach notatek (QML Text obsługuje podstawowe znaczniki HTML)
+SNIPPET_START = "<b>"
+SNIPPET_END = "</b>"
+
+
+class SearchService():
+    """
+    Klasa obsługująca wyszukiwanie pełnotekstowe (FTS5) pacjentów, diagnoz, recept
+    oraz notatek wizyt i spotkań z uwzględnieniem zakresu uprawnień użytkownika.
+
+    Wyniki w każdej kategorii są sortowane według trafności (bm25) - im mniejsza wartość `rank`,
+    tym lepsze dopasowanie. Użytkownik z zakresem `SCOPE_ASSIGNED` widzi tylko dane
+    pacjentów przypisanych do swojego pracownika.
+    """
+
+    def __init__(self, search_service_controller):
+        self.search_service_controller = search_service_controller
+
+    def _has_index(self, index_name: str) -> bool:
+        return self.search_service_controller.db_controller.schema_catalog.has_table(index_name)
+
+    def _patient_scope(self, session, resource: str, patient_column: str) -> tuple:
+        """
+        Zamienia zakres uprawnień do zasobu na warunek SQL dla kolumny z ID pacjenta.
+
+        :return: Krotka (warunek, parametry).
+        """
+        permission_engine = self.search_service_controller.db_controller.permission_engine
+        if permission_engine.row_scope(session, "view", resource) == SCOPE_ALL:
+            return "1", []
+        condition, params = permission_engine.scope_condition(session, "view", resource, "ap_scope.fk_employee_id")
+        return (
+            f"EXISTS (SELECT 1 FROM assigned_patients ap_scope "
+            f"WHERE ap_scope.fk_patient_id = {patient_column} AND {condition})",
+            params,
+        )
+
+    def _meeting_scope(self, session) -> tuple:
+        """
+        Warunek SQL dla spotkań wewnętrznych: wszystkie przy pełnym dostępie do wizyt,
+        w przeciwnym razie tylko spotkania, w których pracownik uczestniczy.
+        """
+        scope = self.search_service_controller.db_controller.permission_engine.row_scope(session, "view", "appointments")
+        if scope == SCOPE_ALL:
+            return "1", []
+        if scope == SCOPE_ASSIGNED and session.employee_id is not None:
+            return (
+                "EXISTS (SELECT 1 FROM meeting_participants mp "
+                "WHERE mp.fk_meeting_id = m.meeting_id AND mp.fk_employee_id = ?)",
+                [session.employee_id],
+            )
+        return "0", []
+
+    def _fetch(self, query: str, params: list) -> list:
+        cursor = self.search_service_controller.db_controller.connection.execute(query, params)
+        return [dict(row) for row in cursor.fetchall()]
+
+    def search_patients(self, session, match_query: str, limit: int = SEARCH_LIMIT) -> list:
+        """
+        Wyszukuje pacjentów po imieniu, nazwisku, PESEL-u, telefonie, e-mailu i adresie.
+        """
+        if not self._has_index("patients_fts"):
+            return []
+        condition, scope_params = self._patient_scope(session, "patients", "p.patient_id")
+        query = f"""
+            SELECT p.patient_id, p.first_name, p.last_name, p.pesel, p.phone, p.email, p.is_active,
+                   bm25(patients_fts) AS rank
+            FROM patients_fts
+            JOIN patients p ON p.patient_id = patients_fts.rowid
+            WHERE patients_fts MATCH ? AND {condition}
+            ORDER BY rank
+            LIMIT ?
+        """
+        return self._fetch(query, [match_query, *scope_params, limit])
+
+    def search_diagnoses(self, session, match_query: str, limit: int = SEARCH_LIMIT) -> list:
+        """
+        Wyszukuje diagnozy po opisie i kodzie ICD-11.
+        """
+        if not self._has_index("diagnoses_fts"):
+            return []
+        condition, scope_params = self._patient_scope(session, "diagnoses", "p.patient_id")
+        query = f"""
+            SELECT d.diagnosis_id, d.description, d.icd11_code, a.appointment_id, a.appointment_date,
+                   p.patient_id, p.first_name, p.last_name, bm25(diagnoses_fts) AS rank
+            FROM diagnoses_fts
+            JOIN diagnoses d ON d.diagnosis_id = diagnoses_fts.rowid
+            JOIN appointments a ON a.appointment_id = d.fk_appointment_id
+            JOIN assigned_patients ap ON ap.assignment_id = a.fk_assignment_id
+            JOIN patients p ON p.patient_id = ap.fk_patient_id
+            WHERE diagnoses_fts MATCH ? AND {condition}
+            ORDER BY rank
+            LIMIT ?
+        """
+        return self._fetch(query, [match_query, *scope_params, limit])
+
+    def search_prescriptions(self, session, match_query: str, limit: int = SEARCH_LIMIT) -> list:
+        """
+        Wyszukuje recepty po nazwie leku i kodzie recepty.
+        """
+        if not self._has_index("prescriptions_fts"):
+            return []
+        condition, scope_params = self._patient_scope(session, "prescriptions", "p.patient_id")
+        query = f"""
+            SELECT pr.prescription_id, pr.medicine_name, pr.dosage, pr.prescription_code,
+                   a.appointment_id, a.appointment_date, p.patient_id, p.first_name, p.last_name,
+                   bm25(prescriptions_fts) AS rank
+            FROM prescriptions_fts
+            JOIN prescriptions pr ON pr.prescription_id = prescriptions_fts.rowid
+            JOIN appointments a ON a.appointment_id = pr.fk_appointment_id
+            JOIN assigned_patients ap ON ap.assignment_id = a.fk_assignment_id
+            JOIN patients p ON p.patient_id = ap.fk_patient_id
+            WHERE prescriptions_fts MATCH ? AND {condition}
+            ORDER BY rank
+            LIMIT ?
+        """
+        return self._fetch(query, [match_query, *scope_params, limit])
+
+    def search_notes(self, session, match_query: str, limit: int = SEARCH_LIMIT) -> list:
+        """
+        Wyszukuje notatki wizyt i spotkań wewnętrznych. Wyniki obu źródeł są łączone
+        według trafności; `snippet` zawiera fragment notatki z wyróżnionym dopasowaniem.
+        """
+        notes = []
+        if self._has_index("appointments_fts"):
+            condition, scope_params = self._patient_scope(session, "appointments", "p.patient_id")
+            query = f"""
+                SELECT 'appointment' AS source, a.appointment_id AS record_id, a.appointment_date AS record_date,
+                       p.patient_id, p.first_name, p.last_name,
+                       snippet(appointments_fts, 0, ?, ?, '…', 12) AS snippet, bm25(appointments_fts) AS rank
+                FROM appointments_fts
+                JOIN appointments a ON a.appointment_id = appointments_fts.rowid
+                JOIN assigned_patients ap ON ap.assignment_id = a.fk_assignment_id
+                JOIN patients p ON p.patient_id = ap.fk_patient_id
+                WHERE appointments_fts MATCH ? AND {condition}
+                ORDER BY rank
+                LIMIT ?
+            """
+            notes.extend(self._fetch(query, [SNIPPET_START, SNIPPET_END, match_query, *scope_params, limit]))
+
+        if self._has_index("internal_meetings_fts"):
+            condition, scope_params = self._meeting_scope(session)
+            query = f"""
+                SELECT 'meeting' AS source, m.meeting_id AS record_id, m.meeting_date AS record_date,
+                       NULL AS patient_id, NULL AS first_name, NULL AS last_name,
+                       snippet(internal_meetings_fts, 0, ?, ?, '…', 12) AS snippet, bm25(internal_meetings_fts) AS rank
+                FROM internal_meetings_fts
+                JOIN internal_meetings m ON m.meeting_id = internal_meetings_fts.rowid
+                WHERE internal_meetings_fts MATCH ? AND {condition}
+                ORDER BY rank
+                LIMIT ?
+            """
+            notes.extend(self._fetch(query, [SNIPPET_START, SNIPPET_END, match_query, *scope_params, limit]))
+
+        notes.sort(key=lambda note: note["rank"])
+        return notes[:limit]
+
+    def search(self, logged_in_user_id, search_text: str, limit: int = SEARCH_LIMIT) -> dict:
+        """
+        Wyszukuje tekst we wszystkich kategoriach dostępnych dla użytkownika.
+
+        Każde słowo tekstu dopasowywane jest jako prefiks (np. "kow 9005" znajdzie pacjenta
+        Kowalski z PESEL-em 9005...), a wszystkie słowa muszą wystąpić w rekordzie.
+
+        Args:
+            logged_in_user_id (int): ID zalogowanego użytkownika.
+            search_text (str): Tekst wpisany przez użytkownika.
+            limit (int): Maksymalna liczba wyników w każdej kategorii.
+
+        Returns:
+            dict: {"query", "patients", "diagnoses", "prescriptions", "notes"} - listy słowników
+                posortowane według trafności (puste przy braku tekstu, nieznanym użytkowniku
+                lub błędzie bazy danych).
+        """
+        results = {"query": search_text or "", "patients": [], "diagnoses": [], "prescriptions": [], "notes": []}
+        match_query = build_match_query(search_text)
+        if match_query is None:
+            return results
+
+        try:
+            session = self.search_service_controller.session_service.get_session(logged_in_user_id)
+            results["patients"] = self.search_patients(session, match_query, limit)
+            results["diagnoses"] = self.search_diagnoses(session, match_query, limit)
+            results["prescriptions"] = self.search_prescriptions(session, match_query, limit)
+            results["notes"] = self.search_notes(session, match_query, limit)
+            return results
+        except ValueError as ve:
+            print(f"[### SEARCH_SERVICE] Błąd danych użytkownika: {ve}")
+            return {**results, "patients": [], "diagnoses": [], "prescriptions": [], "notes": []}
+        except sqlite3.Error as db_err:
+            print(f"[### SEARCH_SERVICE] Błąd bazy danych podczas wyszukiwania: {db_err}")
+            return {**results, "patients": [], "diagnoses": [], "prescriptions": [], "notes": []}
@@ -0,0 +1,208 @@
+# session_service.py
+
+import sqlite3
+import threading
+
+
+def load_role_permissions(connection, role_id: int) -> list:
+    """
+    Pobiera nazwy uprawnień przypisanych do roli (`role_permissions JOIN system_permissions`).
+    Bez tabel uprawnień (baza bez danych ról) zwraca pustą listę - jak `PermissionEngine`,
+    który stosuje wtedy uprawnienia domyślne ról.
+    """
+    tables = connection.execute(
+        "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name IN ('role_permissions', 'system_permissions')"
+    ).fetchone()[0]
+    if tables < 2:
+        return []
+
+    query = """
+    SELECT sp.permission_name
+    FROM role_permissions rp
+    JOIN system_permissions sp ON rp.permission_id = sp.permission_id
+    WHERE rp.role_id = ?
+    """
+    cursor = connection.execute(query, (role_id,))
+    return [row[0] for row in cursor.fetchall()]
+
+
+class UserSession:
+    """
+    Niezmienny kontekst zalogowanego użytkownika, wyznaczany raz przy logowaniu.
+
+    Mostki i serwisy odczytują z niego `role_id`, `employee_id`, specjalizacje, przypisanych
+    pacjentów i uprawnienia zamiast odpytywać bazę przy każdej akcji w interfejsie.
+    Zmiana danych użytkownika (np. edycja roli przez administratora) nie modyfikuje obiektu -
+    `SessionService` unieważnia kontekst i przy następnym odczycie tworzy nowy.
+    """
+
+    __slots__ = (
+        "user_id", "username", "employee_id", "role_id", "role_name",
+        "specialties", "assigned_patient_ids", "permissions"
+    )
+
+    def __init__(self, user_id: int, username: str, employee_id: int, role_id: int, role_name: str,
+                 specialties=(), assigned_patient_ids=(), permissions=()):
+        values = {
+            "user_id": user_id,
+            "username": username,
+            "employee_id": employee_id,
+            "role_id": role_id,
+            "role_name": role_name,
+            "specialties": tuple(specialties),
+            "assigned_patient_ids": frozenset(assigned_patient_ids),
+            "permissions": frozenset(permissions),
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Kontekst sesji jest niezmienny.")
+
+    def __delattr__(self, name):
+        raise AttributeError("Kontekst sesji jest niezmienny.")
+
+    def __repr__(self):
+        return f"UserSession(user_id={self.user_id}, role_id={self.role_id}, employee_id={self.employee_id})"
+
+    def has_permission(self, permission_name: str) -> bool:
+        """
+        Sprawdza, czy rola użytkownika ma uprawnienie o podanej nazwie.
+        """
+        return permission_name in self.permissions
+
+    def is_assigned_patient(self, patient_id: int) -> bool:
+        """
+        Sprawdza, czy pacjent jest przypisany do pracownika zalogowanego użytkownika.
+        """
+        return patient_id in self.assigned_patient_ids
+
+
+class SessionService:
+    """
+    Klasa odpowiedzialna za tworzenie i przechowywanie kontekstów sesji (`UserSession`).
+
+    Kontekst jest budowany przy logowaniu (`start_session`) i zwracany z pamięci przez `get_session`.
+    Po zmianie użytkownika, jego roli, uprawnień roli, przypisanych pacjentów lub specjalizacji
+    mostki wywołują odpowiednią metodę `invalidate_*` - unieważniane są tylko konteksty,
+    których zmiana dotyczy, a nowy kontekst wczytywany jest przy następnym odczycie.
+    W procesie istnieje jedna instancja (`MainController.session_service`), wspólna dla wątku GUI
+    i wątku roboczego `BridgeWorker` (logowanie, edycja użytkowników) - słownik kontekstów chroni blokada.
+    """
+
+    def __init__(self, db_controller):
+        """
+        Inicjalizuje serwis sesji z kontrolerem bazy danych.
+        """
+        self.db_controller = db_controller
+        self.version = 0  # Zwiększany przy każdym unieważnieniu
+        self._sessions = {}  # {user_id: UserSession}
+        self._lock = threading.Lock()
+
+    def _load_session(self, user_id: int, permissions=None):
+        query_user = """
+        SELECT u.user_id, u.username, u.employee_id, u.role_id, r.role_name
+        FROM users_accounts u
+        LEFT JOIN roles r ON r.role_id = u.role_id
+        WHERE u.user_id = ?
+        """
+        query_specialties = """
+        SELECT s.specialty_name
+        FROM employee_specialties es
+        JOIN specialties s ON s.specialty_id = es.specialty_id
+        WHERE es.employee_id = ?
+        ORDER BY es.employee_specialty_id
+        """
+        query_assigned = "SELECT fk_patient_id FROM assigned_patients WHERE fk_employee_id = ?"
+
+        try:
+            with self.db_controller.read_connection() as connection:
+                user = connection.execute(query_user, (user_id,)).fetchone()
+                if user is None:
+                    return None
+                user_id, username, employee_id, role_id, role_name = tuple(user)
+
+                specialties = [row[0] for row in connection.execute(query_specialties, (employee_id,)).fetchall()]
+                assigned_patient_ids = [row[0] for row in connection.execute(query_assigned, (employee_id,)).fetchall()]
+                if permissions is None:
+                    permissions = load_role_permissions(connection, role_id)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Błąd bazy danych podczas wczytywania sesji użytkownika {user_id}: {e}") from e
+
+        return UserSession(
+            user_id, username, employee_id, role_id, role_name,
+            specialties, assigned_patient_ids, permissions
+        )
+
+    def start_session(self, user: dict) -> UserSession:
+        """
+        Tworzy kontekst sesji dla użytkownika zwróconego przez `LoginController.authenticate_user`.
+        Uprawnienia pobrane podczas logowania są używane bez ponownego odpytywania bazy.
+        """
+        session = self._load_session(user["user_id"], user.get("permissions"))
+        with self._lock:
+            self._sessions[user["user_id"]] = session
+        return session
+
+    def get_session(self, user_id: int) -> UserSession:
+        """
+        Zwraca kontekst sesji użytkownika, wczytując go ponownie tylko po unieważnieniu.
+
+        :raises ValueError: Jeśli `user_id` jest pusty albo użytkownik nie istnieje.
+        """
+        if user_id is None:
+            raise ValueError("Brak zalogowanego użytkownika.")
+        with self._lock:
+            session = self._sessions.get(user_id)
+            version = self.version
+        if session is None:
+            session = self._load_session(user_id)
+            if session is None:
+                raise ValueError(f"Nie znaleziono użytkownika o ID {user_id}.")
+            with self._lock:
+                # Kontekst unieważniony w trakcie wczytywania (zmiana w innym wątku) nie jest zapamiętywany
+                if self.version == version:
+                    self._sessions[user_id] = session
+        return session
+
+    def end_session(self, user_id: int = None):
+        """
+        Usuwa kontekst sesji użytkownika (lub wszystkie konteksty, jeśli `user_id` nie podano).
+        """
+        with self._lock:
+            self.version += 1
+            if user_id is None:
+                self._sessions.clear()
+            else:
+                self._sessions.pop(user_id, None)
+
+    def _invalidate_where(self, predicate):
+        with self._lock:
+            self.version += 1
+            for user_id in [user_id for user_id, session in self._sessions.items() if predicate(session)]:
+                del self._sessions[user_id]
+
+    def invalidate_user(self, user_id: int):
+        """
+        Unieważnia kontekst po edycji lub usunięciu konta użytkownika.
+        """
+        self._invalidate_where(lambda session: session.user_id == user_id)
+
+    def invalidate_role(self, role_id: int):
+        """
+        Unieważnia konteksty użytkowników z daną rolą (zmiana nazwy roli lub jej uprawnień).
+        """
+        self._invalidate_where(lambda session: session.role_id == role_id)
+
+    def invalidate_employee(self, employee_id: int):
+        """
+        Unieważnia kontekst użytkownika powiązanego z pracownikiem
+        (zmiana przypisanych pacjentów lub specjalizacji).
+        """
+        self._invalidate_where(lambda session: session.employee_id == employee_id)
+
+    def invalidate_specialty(self, specialty_name: str):
+        """
+        Unieważnia konteksty pracowników z daną specjalizacją (zmiana nazwy lub aktywności specjalizacji).
+        """
+        self._invalidate_where(lambda session: specialty_name in session.specialties)
@@ -0,0 +1,158 @@
+# validation_service.py
+
+from database.exists_probe import ExistsProbe
+from database.id_sets import json_id_set
+
+
+class ValidationService:
+    """
+    Klasa odpowiedzialna za walidację danych wejściowych zapytaniami `EXISTS` korzystającymi z indeksów.
+
+    Zamiast pobierać całe kolumny (np. wszystkie ID) i sprawdzać przynależność do listy w Pythonie,
+    każde sprawdzenie jest pojedynczym zapytaniem o koszcie niezależnym od rozmiaru tabeli.
+    Kilka sprawdzeń potrzebnych w jednej operacji można wykonać jednym zapytaniem (`check`).
+
+    Nazwy tabel i kolumn są sprawdzane w katalogu schematu, więc do zapytania trafiają
+    wyłącznie istniejące identyfikatory.
+    """
+
+    def __init__(self, main_controller):
+        self.main_controller = main_controller
+
+    def _probe_sql(self, probe: ExistsProbe, params: list) -> str:
+        catalog = self.main_controller.db_controller.schema_catalog
+        columns = catalog.get_columns(probe.table_name)
+        if not columns:
+            raise ValueError(f"Tabela {probe.table_name} nie istnieje.")
+
+        clauses = []
+        for column, value in probe.conditions.items():
+            if column not in columns:
+                raise ValueError(f"Nieprawidłowa kolumna: {column}")
+            if value is None:
+                clauses.append(f"{column} IS NULL")
+            else:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+
+        if probe.exclude is not None:
+            column, value = probe.exclude
+            if column not in columns:
+                raise ValueError(f"Nieprawidłowa kolumna: {column}")
+            clauses.append(f"{column} IS NOT ?")
+            params.append(value)
+
+        return f"EXISTS (SELECT 1 FROM {probe.table_name} WHERE {' AND '.join(clauses)})"
+
+    def check(self, *probes: ExistsProbe) -> list:
+        """
+        Wykonuje wszystkie sprawdzenia jednym zapytaniem.
+
+        :return: Lista wartości bool w kolejności sprawdzeń (True - rekord istnieje).
+        :raises ValueError: Jeśli tabela lub kolumna nie istnieje.
+        :raises sqlite3.DatabaseError: W przypadku błędu bazy danych (obsługiwany w slotach mostków
+            tak samo jak błędy pozostałych zapytań).
+        """
+        if not probes:
+            return []
+
+        params = []
+        query = "SELECT " + ", ".join(self._probe_sql(probe, params) for probe in probes)
+        self.main_controller.db_controller.ensure_connection()
+        row = self.main_controller.db_controller.connection.execute(query, params).fetchone()
+        return [bool(value) for value in row]
+
+    def exists(self, table_name: str, column: str, value) -> bool:
+        """
+        Sprawdza, czy w tabeli istnieje rekord z wartością `value` w kolumnie `column`.
+
+        Przykład:
+            validation_service.exists("rooms", "room_id", 5)
+        """
+        return self.check(ExistsProbe(table_name, {column: value}))[0]
+
+    def exists_where(self, table_name: str, conditions: dict) -> bool:
+        """
+        Sprawdza, czy w tabeli istnieje rekord spełniający wszystkie warunki {kolumna: wartość}.
+
+        Przykład:
+            validation_service.exists_where("assigned_patients", {"assignment_id": 3, "fk_employee_id": 7})
+        """
+        return self.check(ExistsProbe(table_name, conditions))[0]
+
+    def is_unique(self, table_name: str, column: str, value, exclude: tuple = None) -> bool:
+        """
+        Sprawdza, czy wartość nie występuje jeszcze w kolumnie (z uwzględnieniem COLLATE kolumny).
+
+        :param exclude: Opcjonalna para (kolumna_klucza, wartość) - rekord pomijany (np. aktualizowany).
+        """
+        return not self.check(ExistsProbe(table_name, {column: value}, exclude))[0]
+
+    def get_referencing_tables(self, value, references) -> list:
+        """
+        Zwraca tabele, w których wartość `value` jest używana w kolumnie klucza obcego.
+
+        :param references: Lista par (tabela, kolumna), np. [("appointments", "fk_reservation_id")].
+        :return: Lista nazw tabel z rekordami wskazującymi na `value` (w kolejności `references`).
+        """
+        references = list(references)
+        results = self.check(*(ExistsProbe(table_name, {column: value}) for table_name, column in references))
+        return [table_name for (table_name, _), referenced in zip(references, results) if referenced]
+
+    def is_referenced(self, value, references) -> bool:
+        """
+        Sprawdza, czy wartość `value` jest używana w którejkolwiek z par (tabela, kolumna).
+        """
+        return bool(self.get_referencing_tables(value, references))
+
+    def is_prescriber_appointment(self, appointment_id, employee_id=None) -> bool:
+        """
+        Sprawdza jednym zapytaniem `EXISTS`, czy wizyta jest przypisana do pracownika, którego rola
+        może wystawiać recepty (`permission_engine`, reguła ("issue", "prescriptions")).
+
+        :param employee_id: Opcjonalnie - wizyta musi należeć do tego pracownika (zakres `SCOPE_ASSIGNED`).
+
+        Przykład:
+            validation_service.is_prescriber_appointment(12, employee_id=session.employee_id)
+        """
+        db_controller = self.main_controller.db_controller
+        role_ids = db_controller.permission_engine.get_roles_with_access("issue", "prescriptions")
+        if not role_ids:
+            return False
+
+        id_set_sql, id_set_params = json_id_set(role_ids)  # Jeden parametr JSON zamiast (?,?,?)
+        params = [appointment_id, *id_set_params]
+        employee_condition = ""
+        if employee_id is not None:
+            employee_condition = "AND ap.fk_employee_id = ?"
+            params.append(employee_id)
+
+        query = f"""
+        SELECT EXISTS (
+            SELECT 1
+            FROM appointments a
+            JOIN assigned_patients ap ON ap.assignment_id = a.fk_assignment_id
+            JOIN users_accounts ua ON ua.employee_id = ap.fk_employee_id
+            WHERE a.appointment_id = ? AND ua.role_id IN {id_set_sql} {employee_condition}
+        )
+        """
+        db_controller.ensure_connection()
+        return bool(db_controller.connection.execute(query, params).fetchone()[0])
+
+    def is_employee_prescription(self, prescription_id, employee_id) -> bool:
+        """
+        Sprawdza jednym zapytaniem `EXISTS`, czy recepta została wystawiona na wizycie pacjenta
+        przypisanego do pracownika.
+        """
+        query = """
+        SELECT EXISTS (
+            SELECT 1
+            FROM prescriptions pr
+            JOIN appointments a ON a.appointment_id = pr.fk_appointment_id
+            JOIN assigned_patients ap ON ap.assignment_id = a.fk_assignment_id
+            WHERE pr.prescription_id = ? AND ap.fk_employee_id = ?
+        )
+        """
+        self.main_controller.db_controller.ensure_connection()
+        row = self.main_controller.db_controller.connection.execute(query, (prescription_id, employee_id)).fetchone()
+        return bool(row[0])
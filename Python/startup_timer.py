@@ -0,0 +1,58 @@
+# startup_timer.py
+
+import time
+
+
+class StartupTimer:
+    """
+    Pomiar czasu uruchamiania aplikacji w kolejnych etapach (importy, baza danych, mostki, QML).
+
+    Pomiar zaczyna się w chwili utworzenia obiektu - `STARTUP_TIMER` tworzony jest przy pierwszym
+    imporcie modułu, dlatego `main.py` importuje go przed pozostałymi modułami.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self._last = self.start
+        self.phases = []  # [(nazwa etapu, sekundy)]
+
+    def mark(self, phase: str) -> float:
+        """
+        Zamyka etap `phase` (czas od poprzedniego znacznika) i zwraca jego długość w sekundach.
+        """
+        now = time.perf_counter()
+        seconds = now - self._last
+        self.phases.append((phase, seconds))
+        self._last = now
+        return seconds
+
+    def get_total(self) -> float:
+        """
+        Zwraca czas od utworzenia obiektu do ostatniego znacznika (w sekundach).
+        """
+        return self._last - self.start
+
+    def get_report(self) -> dict:
+        """
+        Zwraca raport {"total_ms", "phases": [{"phase", "ms", "share"}]}.
+        """
+        total = self.get_total()
+        return {
+            "total_ms": total * 1000,
+            "phases": [
+                {"phase": phase, "ms": seconds * 1000, "share": seconds / total if total > 0 else 0.0}
+                for phase, seconds in self.phases
+            ],
+        }
+
+    def print_report(self):
+        """
+        Wypisuje czasy etapów uruchamiania.
+        """
+        report = self.get_report()
+        print(f"Czas uruchamiania aplikacji: {report['total_ms']:.0f} ms")
+        for phase in report["phases"]:
+            print(f"  {phase['phase']:<32} {phase['ms']:8.1f} ms  ({phase['share']:.0%})")
+
+
+STARTUP_TIMER = StartupTimer()
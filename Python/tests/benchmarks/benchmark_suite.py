@@ -0,0 +1,370 @@
+# benchmark_suite.py
+# Benchmarki serwisów i slotów mostków na syntetycznej bazie placówki (database/synthetic_clinic.py).
+#
+# Uruchomienie (z katalogu Python):
+#   python -m tests.benchmarks.benchmark_suite --scale 1k --save-baseline   # zapis wyników bazowych
+#   python -m tests.benchmarks.benchmark_suite --scale 1k                   # porównanie z wynikami bazowymi
+#
+# Wygenerowane bazy są zapisywane w katalogu tymczasowym (--data-dir) i używane ponownie przy kolejnych
+# uruchomieniach, a wyniki bazowe - w tests/benchmarks/baselines/<skala>.json. Czasy zależą od maszyny,
+# dlatego wyniki bazowe należy zapisać na tej samej maszynie, na której wykonywane jest porównanie.
+
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+from types import SimpleNamespace
+
+from controllers.database_controller import DatabaseController
+from database.synthetic_clinic import (
+    ADMIN_USERNAME, SCALES, SYNTHETIC_PASSWORD, SyntheticClinicGenerator, create_database, get_scale_counts,
+    resolve_scale,
+)
+from services.admin_service import AdminService
+from services.dashboard_service import DashboardService
+from services.employee_service import EmployeeService
+from services.patients_service import PatientsService
+from services.room_service import RoomService
+from services.session_service import SessionService
+
+BASELINES_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+DATA_DIRECTORY = os.path.join(tempfile.gettempdir(), "projekt_inz_benchmarks")
+
+# Wynik jest regresją, jeśli mediana wzrosła o więcej niż `tolerance` i o więcej niż `min_delta_ms`
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_MIN_DELTA_MS = 1.0
+
+# Metody serwisów: (nazwa, funkcja(kontekst)). Kontekst tworzy `create_service_context`.
+SERVICE_BENCHMARKS = (
+    ("RoomService.table_get_all_appointments", lambda c: c.room_service.table_get_all_appointments()),
+    (
+        "RoomService.table_get_formatted_appointments_for_employee",
+        lambda c: c.room_service.table_get_formatted_appointments_for_employee(c.medical_employee_id),
+    ),
+    ("RoomService.get_room_reservations_with_detailed_rooms", lambda c: c.room_service.get_room_reservations_with_detailed_rooms()),
+    ("RoomService.table_get_all_internal_meetings", lambda c: c.room_service.table_get_all_internal_meetings()),
+    (
+        "RoomService.get_appointments_in_range",
+        lambda c: c.room_service.get_appointments_in_range(c.reference_date, employee_id=c.medical_employee_id),
+    ),
+    ("RoomService.get_free_slots", lambda c: c.room_service.get_free_slots(1, c.reference_date)),
+    ("RoomService.find_first_free_room", lambda c: c.room_service.find_first_free_room(c.room_type_id, c.reference_date, 60)),
+    (
+        "PatientsService.table_get_patients_for_user",
+        lambda c: c.patients_service.table_get_patients_for_user(c.admin_user_id, limit=200),
+    ),
+    ("PatientsService.table_get_diagnoses_data[admin]", lambda c: c.patients_service.table_get_diagnoses_data(c.admin_user_id)),
+    (
+        "PatientsService.table_get_diagnoses_data[assigned]",
+        lambda c: c.patients_service.table_get_diagnoses_data(c.medical_user_id),
+    ),
+    (
+        "PatientsService.table_get_prescriptions_data[admin]",
+        lambda c: c.patients_service.table_get_prescriptions_data(c.admin_user_id),
+    ),
+    ("AdminService.get_all_user_accounts", lambda c: c.admin_service.get_all_user_accounts()),
+    ("AdminService.get_all_assigned_patients", lambda c: c.admin_service.get_all_assigned_patients()),
+    ("EmployeeService.get_formatted_employee_services", lambda c: c.employee_service.get_formatted_employee_services()),
+    ("EmployeeService.get_formatted_employee_specialties", lambda c: c.employee_service.get_formatted_employee_specialties()),
+    (
+        "DashboardService.get_snapshot",
+        lambda c: c.dashboard_service.get_snapshot(c.medical_user_id, date_offset=c.date_offset),
+    ),
+)
+
+# Sloty mostków: (nazwa, funkcja(mostki)). Zadania wykonywane są synchronicznie (BridgeWorker(synchronous=True)),
+# więc czas obejmuje zapytania, formatowanie i emisję sygnałów do QML.
+BRIDGE_BENCHMARKS = (
+    ("BackendBridge.login", lambda b: b.backend.login(ADMIN_USERNAME, SYNTHETIC_PASSWORD)),
+    ("BackendBridge.updateDashboard", lambda b: b.backend.updateDashboard()),
+    ("BackendBridge.updatePatientsList", lambda b: b.backend.updatePatientsList()),
+    ("BackendBridge.updateDiagnosesDataForUserList", lambda b: b.backend.updateDiagnosesDataForUserList()),
+    ("BackendBridge.updatePrescriptionsDataForUser", lambda b: b.backend.updatePrescriptionsDataForUser()),
+    ("BridgeRoom.updateAppointmentsList", lambda b: b.room.updateAppointmentsList()),
+    ("BridgeRoom.updateRoomReservationsList", lambda b: b.room.updateRoomReservationsList()),
+    ("BridgeRoom.updateInternalMeetingsList", lambda b: b.room.updateInternalMeetingsList()),
+    ("BridgeAdmin.updateUserList", lambda b: b.admin.updateUserList()),
+    ("BridgeAdmin.updateAssignedPatientsList", lambda b: b.admin.updateAssignedPatientsList()),
+    ("BridgeEmployee.updateEmployeeList", lambda b: b.employee.updateEmployeeList()),
+    ("BridgeEmployee.fetchFormattedEmployeeServices", lambda b: b.employee.fetchFormattedEmployeeServices()),
+)
+
+
+def get_database_path(appointments: int, seed: int, data_directory: str = DATA_DIRECTORY) -> str:
+    """
+    Zwraca ścieżkę pliku syntetycznej bazy dla skali i ziarna.
+    """
+    return os.path.join(data_directory, f"clinic_{appointments}_{seed}.db")
+
+
+def prepare_database(appointments: int, seed: int, data_directory: str = DATA_DIRECTORY, password_hash: str = None) -> str:
+    """
+    Zwraca ścieżkę syntetycznej bazy, generując ją, jeśli jeszcze nie istnieje.
+    """
+    database_path = get_database_path(appointments, seed, data_directory)
+    if not os.path.exists(database_path):
+        print(f"Generowanie bazy syntetycznej ({appointments} wizyt): {database_path}")
+        report = create_database(database_path, appointments, seed=seed, password_hash=password_hash)
+        print(f"Wygenerowano bazę w {report['seconds']:.1f} s")
+    return database_path
+
+
+def get_reference_date(appointments: int) -> str:
+    """
+    Zwraca środkowy dzień okresu rezerwacji bazy syntetycznej (punkt odniesienia dla zapytań o "dzisiaj").
+    """
+    return SyntheticClinicGenerator(None).get_reference_date(get_scale_counts(appointments))
+
+
+def create_service_context(db_controller, reference_date: str) -> SimpleNamespace:
+    """
+    Tworzy serwisy i parametry wywołań (użytkownik z rolą administratora, specjalista z największą
+    liczbą przypisanych pacjentów, typ pierwszego pokoju, przesunięcie daty do dnia odniesienia).
+    """
+    main_controller = SimpleNamespace(db_controller=db_controller, session_service=SessionService(db_controller))
+    db_controller.schema_catalog.load()
+    db_controller.permission_engine.load()
+
+    connection = db_controller.connection
+    medical_employee_id, medical_user_id = connection.execute("""
+        SELECT ap.fk_employee_id, u.user_id
+        FROM assigned_patients ap
+        JOIN users_accounts u ON u.employee_id = ap.fk_employee_id
+        GROUP BY ap.fk_employee_id
+        ORDER BY COUNT(*) DESC, ap.fk_employee_id
+        LIMIT 1
+    """).fetchone()
+    admin_user_id = connection.execute(
+        "SELECT user_id FROM users_accounts WHERE username = ?", (ADMIN_USERNAME,)
+    ).fetchone()[0]
+    room_type_id = connection.execute("SELECT fk_room_type_id FROM rooms WHERE room_id = 1").fetchone()[0]
+
+    return SimpleNamespace(
+        room_service=RoomService(main_controller),
+        patients_service=PatientsService(main_controller),
+        admin_service=AdminService(main_controller),
+        employee_service=EmployeeService(main_controller),
+        dashboard_service=DashboardService(main_controller, db_controller),
+        admin_user_id=admin_user_id,
+        medical_user_id=medical_user_id,
+        medical_employee_id=medical_employee_id,
+        room_type_id=room_type_id,
+        reference_date=reference_date,
+        date_offset=(date.fromisoformat(reference_date) - date.today()).days,
+    )
+
+
+def measure(function, repeat: int = 5, warmup: int = 1) -> dict:
+    """
+    Mierzy czas wywołania funkcji (`warmup` wywołań bez pomiaru, potem `repeat` pomiarów).
+
+    :return: Słownik {"min_ms", "median_ms", "mean_ms", "rows"}; `rows` to długość wyniku (jeśli ma długość).
+    """
+    result = None
+    for _ in range(warmup):
+        function()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        "min_ms": round(min(timings), 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "mean_ms": round(statistics.fmean(timings), 3),
+        "rows": len(result) if hasattr(result, "__len__") and not isinstance(result, str) else None,
+    }
+
+
+def run_service_benchmarks(db_controller, reference_date: str, repeat: int = 5, benchmarks=SERVICE_BENCHMARKS) -> dict:
+    """
+    Mierzy czas metod serwisów na połączonej bazie syntetycznej.
+
+    :return: Słownik {nazwa: wynik `measure`}.
+    """
+    context = create_service_context(db_controller, reference_date)
+    results = {}
+    for name, benchmark in benchmarks:
+        results[name] = measure(lambda benchmark=benchmark: benchmark(context), repeat=repeat)
+        print(f"  {name:<62}{results[name]['median_ms']:>12.3f} ms")
+    return results
+
+
+def run_bridge_benchmarks(database_path: str, repeat: int = 5, benchmarks=BRIDGE_BENCHMARKS) -> dict:
+    """
+    Mierzy czas slotów mostków QML bez interfejsu (QCoreApplication, zadania wykonywane synchronicznie).
+
+    Wymaga PySide6 i bcrypt (logowanie); jeśli nie są zainstalowane, benchmarki mostków są pomijane.
+
+    :return: Słownik {nazwa: wynik `measure`} (pusty, jeśli benchmarki pominięto).
+    """
+    # pylint: disable=import-outside-toplevel
+    try:
+        from PySide6.QtCore import QCoreApplication # pylint: disable=E0611
+        from controllers.main_controller import MainController
+        from gui.backend_bridge import BackendBridge
+        from gui.bridge_admin import BridgeAdmin
+        from gui.bridge_employee import BridgeEmployee
+        from gui.bridge_room import BridgeRoom
+        from gui.bridge_worker import BridgeWorker
+    except ImportError as e:
+        print(f"Pominięto benchmarki mostków (brak zależności: {e.name})")
+        return {}
+
+    app = QCoreApplication.instance() or QCoreApplication([])
+    main_controller = MainController()
+    main_controller.db_controller.database_path = database_path
+    main_controller.initialize_application()
+
+    # Synchroniczny worker ładuje kolejne strony listy pacjentów rekurencyjnie (callback zleca następną stronę)
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 20000))
+    worker = BridgeWorker(main_controller, synchronous=True, parent=app)
+    bridges = SimpleNamespace(
+        backend=BackendBridge(main_controller, worker=worker),
+        room=BridgeRoom(main_controller, worker=worker),
+        admin=BridgeAdmin(main_controller, worker=worker),
+        employee=BridgeEmployee(main_controller, worker=worker),
+    )
+    bridges.backend.bridge_room = bridges.room
+    bridges.backend.bridge_employee = bridges.employee
+    bridges.backend.bridge_admin = bridges.admin
+    bridges.backend.login(ADMIN_USERNAME, SYNTHETIC_PASSWORD)
+
+    results = {}
+    try:
+        for name, benchmark in benchmarks:
+            results[name] = measure(lambda benchmark=benchmark: benchmark(bridges), repeat=repeat)
+            print(f"  {name:<62}{results[name]['median_ms']:>12.3f} ms")
+    finally:
+        main_controller.shutdown_application()
+    return results
+
+
+def run_benchmarks(scale, seed: int = 2025, repeat: int = 5, data_directory: str = DATA_DIRECTORY,
+                   include_bridges: bool = True, password_hash: str = None) -> dict:
+    """
+    Przygotowuje bazę syntetyczną w zadanej skali i mierzy metody serwisów oraz sloty mostków.
+
+    :return: Raport {"scale", "appointments", "seed", "counts", "environment", "results"}.
+    """
+    appointments = resolve_scale(scale)
+    database_path = prepare_database(appointments, seed, data_directory, password_hash)
+    reference_date = get_reference_date(appointments)
+
+    db_controller = DatabaseController()
+    db_controller.database_path = database_path
+    db_controller.connect_to_database()
+    try:
+        print(f"Serwisy ({appointments} wizyt, dzień odniesienia {reference_date}):")
+        results = run_service_benchmarks(db_controller, reference_date, repeat)
+    finally:
+        db_controller.close_connection()
+
+    if include_bridges:
+        print("Sloty mostków:")
+        results.update(run_bridge_benchmarks(database_path, repeat))
+
+    return {
+        "scale": str(scale),
+        "appointments": appointments,
+        "seed": seed,
+        "counts": get_scale_counts(appointments),
+        "environment": {
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def compare_results(report: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE,
+                    min_delta_ms: float = DEFAULT_MIN_DELTA_MS) -> list:
+    """
+    Porównuje mediany czasów z wynikami bazowymi.
+
+    :return: Lista regresji [{"name", "baseline_ms", "current_ms", "change"}] posortowana malejąco po zmianie.
+    :raises ValueError: Jeśli wyniki bazowe dotyczą innej liczby wizyt lub innego ziarna.
+    """
+    if (baseline["appointments"], baseline["seed"]) != (report["appointments"], report["seed"]):
+        raise ValueError(
+            f"Wyniki bazowe dotyczą innej bazy ({baseline['appointments']} wizyt, seed {baseline['seed']})."
+        )
+
+    regressions = []
+    for name, result in report["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        delta = result["median_ms"] - base["median_ms"]
+        if delta > min_delta_ms and result["median_ms"] > base["median_ms"] * (1 + tolerance):
+            regressions.append({
+                "name": name,
+                "baseline_ms": base["median_ms"],
+                "current_ms": result["median_ms"],
+                "change": round(delta / base["median_ms"], 3) if base["median_ms"] else None,
+            })
+    return sorted(regressions, key=lambda regression: regression["change"] or 0, reverse=True)
+
+
+def get_baseline_path(scale, directory: str = BASELINES_DIRECTORY) -> str:
+    return os.path.join(directory, f"{str(scale).lower()}.json")
+
+
+def save_baseline(report: dict, path: str):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+
+
+def load_baseline(path: str) -> dict:
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def main(argv=None) -> int:
+    """
+    Punkt wejścia wiersza poleceń. Zwraca 1, jeśli wykryto regresje względem wyników bazowych.
+    """
+    parser = argparse.ArgumentParser(description="Benchmarki serwisów i mostków na syntetycznej bazie placówki.")
+    parser.add_argument("--scale", default="1k", help=f"Skala ({', '.join(SCALES)}) lub liczba wizyt.")
+    parser.add_argument("--seed", type=int, default=2025, help="Ziarno generatora danych.")
+    parser.add_argument("--repeat", type=int, default=5, help="Liczba pomiarów każdej metody.")
+    parser.add_argument("--data-dir", default=DATA_DIRECTORY, help="Katalog wygenerowanych baz.")
+    parser.add_argument("--no-bridges", action="store_true", help="Pomiń sloty mostków (bez PySide6).")
+    parser.add_argument("--baseline", help="Plik wyników bazowych (domyślnie baselines/<skala>.json).")
+    parser.add_argument("--save-baseline", action="store_true", help="Zapisz wyniki jako wyniki bazowe.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Dopuszczalny wzrost mediany (0.25 = 25%%).")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.scale, args.seed, args.repeat, args.data_dir, include_bridges=not args.no_bridges)
+    baseline_path = args.baseline or get_baseline_path(args.scale)
+
+    if args.save_baseline:
+        save_baseline(report, baseline_path)
+        print(f"Zapisano wyniki bazowe: {baseline_path}")
+        return 0
+
+    if not os.path.exists(baseline_path):
+        print(f"Brak wyników bazowych ({baseline_path}) - uruchom z --save-baseline.")
+        return 0
+
+    regressions = compare_results(report, load_baseline(baseline_path), args.tolerance)
+    for regression in regressions:
+        print(
+            f"REGRESJA: {regression['name']}: {regression['baseline_ms']:.3f} ms -> "
+            f"{regression['current_ms']:.3f} ms (+{regression['change']:.0%})"
+        )
+    if not regressions:
+        print("Brak regresji względem wyników bazowych.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
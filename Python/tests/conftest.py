@@ -0,0 +1,39 @@
+# conftest.py
+
+import os
+import pytest
+from tests.database_templates import DatabaseTemplates
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+
+@pytest.fixture(name="database_templates", scope="session")
+def database_templates_fixture():
+    """
+    Rejestr szablonów baz danych budowanych raz na sesję testów.
+    """
+    templates = DatabaseTemplates()
+
+    yield templates
+
+    templates.close()
+
+
+@pytest.fixture(name="clone_database")
+def clone_database_fixture(database_templates):
+    """
+    Zwraca funkcję `clone(name="empty")` tworzącą kontroler bazy `:memory:` z kopią szablonu
+    ("empty", "small_clinic", "large_clinic"). Połączenia są zamykane po teście.
+    """
+    clones = []
+
+    def clone(name="empty"):
+        db_controller = database_templates.clone(name)
+        clones.append(db_controller)
+        return db_controller
+
+    yield clone
+
+    for db_controller in clones:
+        db_controller.close_connection()
@@ -0,0 +1,121 @@
+# database_templates.py
+#
+# Szablony baz danych dla testów: schemat (i dane) budowane raz na sesję, a każdy test
+# dostaje własną kopię w `:memory:` skopiowaną przez API kopii zapasowej sqlite3 (`Connection.backup`).
+# Fixture'y `database_templates` i `clone_database` są zdefiniowane w tests/conftest.py.
+
+import sqlite3
+from controllers.database_controller import DatabaseController
+from controllers.schema_initializer import migrate_schema
+from database.bulk_loader import hash_password
+from database.synthetic_clinic import SCHEMA_PATH, SYNTHETIC_PASSWORD, SyntheticClinicGenerator, get_scale_counts
+
+# Nazwane szablony: liczba wizyt danych syntetycznych (None - sam schemat, bez danych)
+TEMPLATE_APPOINTMENTS = {
+    "empty": None,
+    "small_clinic": 300,
+    "large_clinic": 20_000,
+}
+TEMPLATE_SEED = 2025
+
+# Zastępczy hash hasła, gdy bcrypt nie jest zainstalowany (logowanie kontami syntetycznymi nie zadziała)
+PLACEHOLDER_PASSWORD_HASH = "!"
+
+
+def get_password_hash() -> str:
+    """
+    Zwraca hash bcrypt `SYNTHETIC_PASSWORD` lub `PLACEHOLDER_PASSWORD_HASH` bez biblioteki bcrypt.
+    """
+    try:
+        return hash_password(SYNTHETIC_PASSWORD)
+    except ImportError:
+        return PLACEHOLDER_PASSWORD_HASH
+
+
+def create_schema_database(db_controller):
+    """
+    Tworzy w bazie kontrolera pełny schemat aplikacji: skrypt schematu v2, a następnie tabele,
+    kolumny czasu i indeksy zakładane przy starcie aplikacji (`migrate_schema`).
+    """
+    with open(SCHEMA_PATH, encoding="utf-8") as schema_file:
+        db_controller.connection.executescript(schema_file.read())
+    migrate_schema(db_controller)
+
+
+class DatabaseTemplates:
+    """
+    Rejestr szablonów baz danych w pamięci.
+
+    - Szablon budowany jest leniwie przy pierwszym użyciu i przechowywany do końca sesji (`close`).
+    - `clone` kopiuje szablon do nowego połączenia `:memory:` - kopia jest niezależna,
+      więc test może ją dowolnie modyfikować.
+    - Raport generatora (`get_report`) udostępnia m.in. liczności tabel i datę odniesienia danych.
+    """
+
+    def __init__(self, seed: int = TEMPLATE_SEED):
+        self.seed = seed
+        self._templates = {}  # {nazwa: DatabaseController}
+        self._reports = {}  # {nazwa: raport SyntheticClinicGenerator.generate lub None}
+
+    def _build(self, name: str):
+        if name not in TEMPLATE_APPOINTMENTS:
+            raise ValueError(f"Nieznany szablon bazy danych: {name}. Dostępne: {', '.join(TEMPLATE_APPOINTMENTS)}")
+
+        db_controller = DatabaseController()
+        db_controller.database_path = ":memory:"
+        db_controller.connect_to_database()
+        try:
+            create_schema_database(db_controller)
+            report = None
+            appointments = TEMPLATE_APPOINTMENTS[name]
+            if appointments is not None:
+                generator = SyntheticClinicGenerator(db_controller, seed=self.seed, password_hash=get_password_hash())
+                report = generator.generate(get_scale_counts(appointments))
+        except (sqlite3.Error, RuntimeError):
+            db_controller.close_connection()
+            raise
+
+        self._templates[name] = db_controller
+        self._reports[name] = report
+
+    def get_template(self, name: str) -> DatabaseController:
+        """
+        Zwraca kontroler bazy szablonu, budując go przy pierwszym użyciu. Szablonu nie należy modyfikować.
+
+        :raises ValueError: Dla nieznanej nazwy szablonu.
+        """
+        if name not in self._templates:
+            self._build(name)
+        return self._templates[name]
+
+    def get_report(self, name: str):
+        """
+        Zwraca raport generatora danych szablonu (None dla szablonu bez danych).
+        """
+        self.get_template(name)
+        return self._reports[name]
+
+    def clone(self, name: str = "empty") -> DatabaseController:
+        """
+        Tworzy nowy, połączony kontroler bazy `:memory:` z kopią szablonu `name`.
+
+        :raises ValueError: Dla nieznanej nazwy szablonu.
+        """
+        template = self.get_template(name)
+
+        db_controller = DatabaseController()
+        db_controller.database_path = ":memory:"
+        db_controller.connect_to_database()
+        template.connection.backup(db_controller.connection)
+        # Kopia nie przechodzi przez instrukcje DDL, więc katalog schematu nie zauważyłby zmiany
+        db_controller.schema_catalog.invalidate()
+        return db_controller
+
+    def close(self):
+        """
+        Zamyka połączenia wszystkich zbudowanych szablonów.
+        """
+        for db_controller in self._templates.values():
+            db_controller.close_connection()
+        self._templates.clear()
+        self._reports.clear()
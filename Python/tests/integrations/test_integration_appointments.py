@@ -1,9 +1,7 @@
 # test_integration_appointments.py
 
 import os
-import sqlite3
 import pytest
-from controllers.database_controller import DatabaseController
 from controllers.appointments_controller import AppointmentsController
 from controllers.patients_controller import PatientController
 from controllers.employees_controller import EmployeesController
@@ -16,13 +14,13 @@ os.environ["APP_ENV"] = "test"
 
 
 @pytest.fixture(name="setup_controllers")
-def setup_controllers_fixture():
+def setup_controllers_fixture(clone_database):
     """
     Fixture konfigurujący testową bazę danych SQLite3.
-    Tworzy wymagane tabele i zapewnia czyste środowisko testowe.
+    Każdy test dostaje własną kopię szablonu "empty" (pełny schemat bez danych, tests/conftest.py),
+    więc nie trzeba tworzyć tabel ani czyścić danych po teście.
     """
-    db_controller = DatabaseController()
-    db_controller.connect_to_database()
+    db_controller = clone_database("empty")
 
     controllers = {
         "appointments": AppointmentsController(db_controller),
@@ -33,25 +31,8 @@ def setup_controllers_fixture():
         "room_types": RoomTypesController(db_controller)
     }
 
-    # Tworzenie tabel
-    for controller in controllers.values():
-        controller.create_table()
-
     yield controllers
 
-    # Czyszczenie danych po każdym teście
-    if db_controller.connection is not None:
-        try:
-            with db_controller.connection:
-                db_controller.connection.execute("DELETE FROM appointments")
-                db_controller.connection.execute("DELETE FROM patients")
-                db_controller.connection.execute("DELETE FROM employees")
-                db_controller.connection.execute("DELETE FROM services")
-                db_controller.connection.execute("DELETE FROM rooms")
-        except sqlite3.Error as e:
-            print(f"Błąd podczas czyszczenia danych: {e}")
-    db_controller.close_connection()
-
 
 # +-+-+-+- Testy metod dodawania rekordu +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
 
@@ -176,7 +176,7 @@ def test_update_form_with_valid_data(setup_controllers):
         filters=[{"column": "patient_form_id", "operator": "=", "value": patient_form_id}]
     )[0]
     assert updated_form["submission_date"] == "2025-03-01"
-    assert updated_form["content"] == "Zaktualizowana treść"
+    assert patient_forms.get_form_content(patient_form_id) == "Zaktualizowana treść"
 
 
 def test_update_form_with_invalid_data(setup_controllers):
@@ -479,7 +479,8 @@ def test_full_crud_flow(setup_controllers):
     )
     forms = patient_forms.get_forms(filters=[{"column": "patient_form_id", "operator": "=", "value": patient_form_id}])
     assert len(forms) == 1, "Formularz nie został poprawnie dodany."
-    assert forms[0]["content"] == "Pierwszy formularz"
+    assert "content" not in forms[0]
+    assert patient_forms.get_form_content(patient_form_id) == "Pierwszy formularz"
 
     # R - Pobieranie danych
     all_forms = patient_forms.get_forms()
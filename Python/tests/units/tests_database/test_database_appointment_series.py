@@ -0,0 +1,193 @@
+# test_database_appointment_series.py
+
+import os
+import pytest
+from controllers.database_controller import DatabaseController
+from database.appointment_series import AppointmentSeriesScheduler, build_occurrences
+from database.appointment_stats import AppointmentStatsManager
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "database", "schema_projekt_inz_used_v2.sql"
+)
+
+
+@pytest.fixture(name="setup_database")
+def setup_database_fixture():
+    """
+    Tworzy testową bazę danych ze schematem v2 oraz danymi: pracownik 1 (przypisania 1 i 2),
+    usługa 1 (50 minut), pokoje 1 i 2 typu 1, rezerwacja pokoju 1 w dniu 2025-03-10 10:00-11:00
+    oraz wizyta pracownika (przypisanie 2, pokój 2) w dniu 2025-03-17 10:30-11:20.
+    """
+    db_controller = DatabaseController()
+    db_controller.connect_to_database()
+    connection = db_controller.connection
+    with open(SCHEMA_PATH, encoding="utf-8") as schema_file:
+        connection.executescript(schema_file.read())
+
+    connection.executescript("""
+        INSERT INTO employees (employee_id, first_name, last_name, email, phone, profession, is_medical_staff)
+        VALUES (1, 'Anna', 'Lekarz', 'anna@example.com', '500000001', 'Psychiatra', 1);
+        INSERT INTO patients (patient_id, first_name, last_name, pesel, phone, email, date_of_birth)
+        VALUES (1, 'Jan', 'Kowalski', '90010100001', '600000001', 'jan@example.com', '1990-01-01'),
+               (2, 'Ewa', 'Zielinska', '90010100002', '600000002', 'ewa@example.com', '1990-01-01');
+        INSERT INTO assigned_patients (assignment_id, fk_patient_id, fk_employee_id) VALUES (1, 1, 1), (2, 2, 1);
+        INSERT INTO services (service_id, service_type, duration_minutes, service_price) VALUES (1, 'Terapia', 50, 200);
+        INSERT INTO room_types (room_type_id, room_type) VALUES (1, 'Gabinet');
+        INSERT INTO rooms (room_id, room_number, floor, fk_room_type_id) VALUES (1, 1, 0, 1), (2, 2, 0, 1);
+        INSERT INTO room_reservations (reservation_id, fk_room_id, reservation_date, reservation_time)
+        VALUES (1, 1, '2025-03-10', '10:00-11:00'),
+               (2, 2, '2025-03-17', '10:30-11:20');
+        INSERT INTO appointments (appointment_id, fk_assignment_id, fk_service_id, fk_reservation_id, appointment_date, appointment_status)
+        VALUES (1, 2, 1, 2, '2025-03-17 10:30-11:20', 'Zaplanowana');
+    """)
+
+    yield db_controller
+
+    db_controller.close_connection()
+
+
+def weekly_series(**overrides):
+    """
+    Zwraca parametry serii czterech poniedziałkowych wizyt o 10:00 od 2025-03-03 w pokoju 1.
+    """
+    series = {
+        "assignment_id": 1, "service_id": 1, "start_date": "2025-03-03", "weekdays": [0],
+        "start_time": "10:00", "count": 4, "room_id": 1,
+    }
+    series.update(overrides)
+    return series
+
+
+# +-+-+-+- Testy wyznaczania terminów +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_build_occurrences_follows_pattern():
+    """
+    Testuje terminy według dni tygodnia, liczby terminów, daty zakończenia i odstępu tygodni.
+    """
+    # 2025-03-05 to środa - pierwszy termin w czwartek, kolejny w poniedziałek
+    assert build_occurrences("2025-03-05", [3, 0], "09:30", 50, count=3) == [
+        ("2025-03-06", 570, 620), ("2025-03-10", 570, 620), ("2025-03-13", 570, 620)
+    ]
+    occurrences = build_occurrences("2025-03-03", [0], "09:00", 60, end_date="2025-03-31", interval_weeks=2)
+    assert [day for day, _, _ in occurrences] == ["2025-03-03", "2025-03-17", "2025-03-31"]
+
+    with pytest.raises(ValueError):
+        build_occurrences("2025-03-03", [7], "09:00", 60, count=3)
+    with pytest.raises(ValueError):
+        build_occurrences("2025-03-03", [0], "09:00", 60)
+    with pytest.raises(ValueError):
+        build_occurrences("2025-03-03", [0], "23:30", 60, count=1)
+
+
+# +-+-+-+- Testy konfliktów serii +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_plan_reports_room_and_employee_conflicts(setup_database):
+    """
+    Testuje wykrycie zajętego pokoju i wizyty pracownika oraz propozycje wolnych terminów tego samego dnia.
+    """
+    plan = AppointmentSeriesScheduler(setup_database).plan(**weekly_series())
+    occurrences = plan["occurrences"]
+
+    assert plan["duration_minutes"] == 50
+    assert [occurrence["room_id"] for occurrence in occurrences] == [1, None, None, 1]
+    assert occurrences[1]["conflicts"] == [{"type": "room", "id": 1}]
+    assert occurrences[2]["conflicts"] == [{"type": "appointment", "id": 1}]
+
+    # Najbliższe żądanej godzinie wolne terminy: przed rezerwacją pokoju (9:10) i przed wizytą pracownika (9:40)
+    assert occurrences[1]["alternatives"][0] == {"reservation_date": "2025-03-10", "reservation_time": "09:10-10:00", "room_id": 1}
+    assert occurrences[2]["alternatives"][0] == {"reservation_date": "2025-03-17", "reservation_time": "09:40-10:30", "room_id": 1}
+    assert occurrences[2]["alternatives"][1]["reservation_time"] == "11:20-12:10"
+
+
+def test_plan_picks_free_room_of_type(setup_database):
+    """
+    Testuje wybór wolnego pokoju danego typu (pokój 1 zajęty 2025-03-10) - konflikt pracownika
+    pozostaje konfliktem w każdym pokoju.
+    """
+    plan = AppointmentSeriesScheduler(setup_database).plan(**weekly_series(room_id=None, room_type_id=1))
+
+    assert [occurrence["room_id"] for occurrence in plan["occurrences"]] == [1, 2, None, 1]
+
+
+# +-+-+-+- Testy zapisu serii +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_schedule_is_atomic(setup_database):
+    """
+    Testuje, czy seria z konfliktem nie jest zapisywana, a po pominięciu konfliktów zapisywane są
+    rezerwacje i wizyty pozostałych terminów (z kolumnami czasu i licznikami wizyt).
+    """
+    db_controller = setup_database
+    connection = db_controller.connection
+    scheduler = AppointmentSeriesScheduler(db_controller)
+
+    result = scheduler.schedule(**weekly_series())
+    assert result["scheduled"] == []
+    assert len(result["conflicts"]) == 2
+    assert connection.execute("SELECT COUNT(*) FROM appointments").fetchone()[0] == 1
+
+    result = scheduler.schedule(**weekly_series(), skip_conflicts=True, notes="Seria")
+    assert [occurrence["reservation_date"] for occurrence in result["scheduled"]] == ["2025-03-03", "2025-03-24"]
+
+    rows = connection.execute(
+        """
+        SELECT a.appointment_id, a.appointment_date, a.notes, a.start_ts, r.reservation_id, r.fk_room_id
+        FROM appointments a JOIN room_reservations r ON r.reservation_id = a.fk_reservation_id
+        WHERE a.fk_assignment_id = 1 ORDER BY a.appointment_id
+        """
+    ).fetchall()
+    assert [(row["appointment_id"], row["reservation_id"]) for row in rows] == [
+        (occurrence["appointment_id"], occurrence["reservation_id"]) for occurrence in result["scheduled"]
+    ]
+    assert [row["appointment_date"] for row in rows] == ["2025-03-03 10:00-10:50", "2025-03-24 10:00-10:50"]
+    assert all(row["start_ts"] is not None and row["notes"] == "Seria" and row["fk_room_id"] == 1 for row in rows)
+    assert AppointmentStatsManager(db_controller).get_totals(1)["appointment_count"] == 3
+    assert not db_controller.room_availability.is_available(1, "2025-03-03", 600, 650)
+
+
+def test_schedule_ids_with_interleaved_inserts(setup_database):
+    """
+    Testuje ID zapisanych rezerwacji i wizyt, gdy wyzwalacz dodaje własne rekordy między wierszami serii
+    (ID serii nie są kolejnymi liczbami).
+    """
+    db_controller = setup_database
+    connection = db_controller.connection
+    connection.execute("""
+        CREATE TEMP TRIGGER audit_series_reservations AFTER INSERT ON room_reservations WHEN NEW.fk_room_id = 1
+        BEGIN
+            INSERT INTO room_reservations (fk_room_id, reservation_date, reservation_time)
+            VALUES (2, NEW.reservation_date, '07:00-07:30');
+        END
+    """)
+
+    result = AppointmentSeriesScheduler(db_controller).schedule(**weekly_series(start_date="2025-04-07"))
+
+    reservation_ids = [occurrence["reservation_id"] for occurrence in result["scheduled"]]
+    assert reservation_ids == [3, 5, 7, 9]
+    rows = connection.execute(
+        "SELECT appointment_id, fk_reservation_id FROM appointments WHERE fk_assignment_id = 1 ORDER BY appointment_id"
+    ).fetchall()
+    assert [(row[0], row[1]) for row in rows] == [
+        (occurrence["appointment_id"], occurrence["reservation_id"]) for occurrence in result["scheduled"]
+    ]
+    assert connection.execute(
+        "SELECT COUNT(*) FROM room_reservations WHERE reservation_id IN (3, 5, 7, 9) AND fk_room_id = 1"
+    ).fetchone()[0] == 4
+
+
+def test_schedule_long_series(setup_database):
+    """
+    Testuje zapis serii kilkuset terminów (codziennie w dni robocze) w pokojach danego typu.
+    """
+    result = AppointmentSeriesScheduler(setup_database).schedule(
+        **weekly_series(room_id=None, room_type_id=1, weekdays=[0, 1, 2, 3, 4], count=300, start_time="12:00"),
+    )
+
+    assert len(result["scheduled"]) == 300
+    assert result["conflicts"] == []
+    assert setup_database.connection.execute("SELECT COUNT(*) FROM appointments").fetchone()[0] == 301
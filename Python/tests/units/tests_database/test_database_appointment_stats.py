@@ -0,0 +1,300 @@
+# test_database_appointment_stats.py
+
+import os
+import pytest
+from controllers.database_controller import DatabaseController
+from controllers.schema_initializer import migrate_schema
+from database.appointment_stats import (
+    CASCADE_DELETE_TRIGGERS,
+    DAILY_STATS_TABLE,
+    REVISED_TRIGGERS,
+    TOTAL_STATS_TABLE,
+    AppointmentStatsManager,
+    get_trigger_sql,
+)
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "database", "schema_projekt_inz_used_v2.sql"
+)
+
+
+@pytest.fixture(name="setup_database")
+def setup_database_fixture():
+    """
+    Tworzy testową bazę danych ze schematem v2 (tabele liczników i wyzwalacze) oraz danymi:
+    pracownik 1 - przypisania 1 i 2, pracownik 2 - przypisanie 3, po jednej wizycie 2025-03-03.
+    """
+    db_controller = DatabaseController()
+    db_controller.connect_to_database()
+    connection = db_controller.connection
+    with open(SCHEMA_PATH, encoding="utf-8") as schema_file:
+        connection.executescript(schema_file.read())
+
+    connection.executescript("""
+        INSERT INTO employees (employee_id, first_name, last_name, email, phone, profession, is_medical_staff)
+        VALUES (1, 'Anna', 'Lekarz', 'anna@example.com', '500000001', 'Psychiatra', 1),
+               (2, 'Adam', 'Inny', 'adam@example.com', '500000002', 'Psycholog kliniczny', 1);
+        INSERT INTO patients (patient_id, first_name, last_name, pesel, phone, email, date_of_birth)
+        VALUES (1, 'Jan', 'Kowalski', '90010100001', '600000001', 'jan@example.com', '1990-01-01'),
+               (2, 'Ewa', 'Zielinska', '90010100002', '600000002', 'ewa@example.com', '1990-01-01');
+        INSERT INTO assigned_patients (assignment_id, fk_patient_id, fk_employee_id) VALUES (1, 1, 1), (2, 2, 1), (3, 2, 2);
+        INSERT INTO appointments (appointment_id, fk_assignment_id, appointment_date, appointment_status)
+        VALUES (1, 1, '2025-03-03 09:00-10:00', 'Zaplanowana'),
+               (2, 2, '2025-03-03 12:00-13:00', 'Zaplanowana'),
+               (3, 3, '2025-03-03 09:00-10:00', 'Zaplanowana');
+    """)
+
+    yield db_controller
+
+    db_controller.close_connection()
+
+
+@pytest.fixture(name="setup_model_database")
+def setup_model_database_fixture():
+    """
+    Tworzy testową bazę danych z tabelami modeli (`create_table`, ON DELETE CASCADE) i migracjami liczników
+    oraz danymi: konto 1 - przypisania 1 (wizyty 2025-03-03 i 2025-03-04) i 2 (wizyta 2025-03-03),
+    konto 2 - przypisanie 3 (wizyta 2025-03-05).
+    """
+    db_controller = DatabaseController()
+    db_controller.connect_to_database()
+    migrate_schema(db_controller)
+
+    db_controller.connection.executescript("""
+        INSERT INTO roles (role_id, role_name) VALUES (1, 'Lekarz');
+        INSERT INTO employees (employee_id, first_name, last_name, email, phone, profession, is_medical_staff)
+        VALUES (1, 'Anna', 'Lekarz', 'anna@example.com', '500000001', 'Psychiatra', 1),
+               (2, 'Adam', 'Inny', 'adam@example.com', '500000002', 'Psycholog kliniczny', 1);
+        INSERT INTO users_accounts (user_id, employee_id, role_id, username, password_hash, is_active, created_at)
+        VALUES (1, 1, 1, 'anna', 'hash', 1, '2025-01-01 08:00'),
+               (2, 2, 1, 'adam', 'hash', 1, '2025-01-01 08:00');
+        INSERT INTO patients (patient_id, first_name, last_name, pesel, phone, email, date_of_birth)
+        VALUES (1, 'Jan', 'Kowalski', '90010100001', '600000001', 'jan@example.com', '1990-01-01'),
+               (2, 'Ewa', 'Zielinska', '90010100002', '600000002', 'ewa@example.com', '1990-01-01');
+        INSERT INTO services (service_id, service_type, duration_minutes, service_price) VALUES (1, 'Konsultacja', 60, 200);
+        INSERT INTO rooms (room_id, room_number, floor) VALUES (1, 10, 0), (2, 11, 0);
+        INSERT INTO assigned_patients (assignment_id, fk_patient_id, fk_employee_id) VALUES (1, 1, 1), (2, 2, 1), (3, 2, 2);
+        INSERT INTO appointments (
+            appointment_id, fk_assignment_id, fk_service_id, fk_room_id, appointment_date, appointment_time,
+            appointment_status
+        )
+        VALUES (1, 1, 1, 1, '2025-03-03', '09:00', 'Zaplanowana'),
+               (2, 1, 1, 1, '2025-03-04', '09:00', 'Zaplanowana'),
+               (3, 2, 1, 2, '2025-03-03', '12:00', 'Zaplanowana'),
+               (4, 3, 1, 1, '2025-03-05', '09:00', 'Zaplanowana');
+    """)
+
+    yield db_controller
+
+    db_controller.close_connection()
+
+
+def get_stats(db_controller):
+    """
+    Zwraca zawartość obu tabel liczników jako posortowane listy krotek.
+    """
+    connection = db_controller.connection
+    daily = connection.execute(f"SELECT * FROM {DAILY_STATS_TABLE} ORDER BY 1, 2").fetchall()
+    totals = connection.execute(f"SELECT * FROM {TOTAL_STATS_TABLE} ORDER BY 1").fetchall()
+    return [tuple(row) for row in daily], [tuple(row) for row in totals]
+
+
+# +-+-+-+- Testy wyzwalaczy liczników +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_triggers_count_appointments(setup_database):
+    """
+    Testuje liczniki po dodaniu, przeniesieniu na inny dzień i usunięciu wizyt.
+    """
+    db_controller = setup_database
+    manager = AppointmentStatsManager(db_controller)
+    connection = db_controller.connection
+
+    assert manager.get_daily_count(1, "2025-03-03") == 2
+    assert manager.get_totals(1) == {"assignment_count": 2, "appointment_count": 2}
+
+    with connection:
+        connection.execute(
+            "INSERT INTO appointments (fk_assignment_id, appointment_date, appointment_status) "
+            "VALUES (1, '2025-03-04 09:00-10:00', 'Zaplanowana')"
+        )
+        connection.execute("UPDATE appointments SET appointment_date = '2025-03-04 12:00-13:00' WHERE appointment_id = 2")
+        connection.execute("DELETE FROM appointments WHERE appointment_id = 1")
+
+    assert manager.get_daily_count(1, "2025-03-03") == 0
+    assert manager.get_daily_count(1, "2025-03-04") == 2
+    assert manager.get_totals(1) == {"assignment_count": 2, "appointment_count": 2}
+    assert manager.get_totals(99) == {"assignment_count": 0, "appointment_count": 0}
+
+    # Dni bez wizyt nie zostają w tabeli
+    daily, _ = get_stats(db_controller)
+    assert (1, "2025-03-03", 0) not in daily
+
+
+def test_triggers_follow_reassignment(setup_database):
+    """
+    Testuje przeniesienie wizyty i przypisania do innego pracownika oraz zgodność z odbudową liczników.
+    """
+    db_controller = setup_database
+    manager = AppointmentStatsManager(db_controller)
+    connection = db_controller.connection
+
+    with connection:
+        connection.execute("UPDATE appointments SET fk_assignment_id = 3 WHERE appointment_id = 2")
+        connection.execute("UPDATE assigned_patients SET fk_employee_id = 2 WHERE assignment_id = 1")
+
+    assert manager.get_daily_count(1, "2025-03-03") == 0
+    assert manager.get_daily_count(2, "2025-03-03") == 3
+    assert manager.get_totals(1) == {"assignment_count": 1, "appointment_count": 0}
+    assert manager.get_totals(2) == {"assignment_count": 2, "appointment_count": 3}
+
+    maintained = get_stats(db_controller)
+    manager.rebuild()
+    # Odbudowa pomija pracowników bez przypisań - porównywane są wiersze z przypisaniami
+    assert maintained[0] == get_stats(db_controller)[0]
+    assert [row for row in maintained[1] if row[1]] == get_stats(db_controller)[1]
+
+
+def test_triggers_follow_assignment_key_change(setup_database):
+    """
+    Testuje zmianę klucza przypisania (wizyty przenoszone przez ON UPDATE CASCADE) - bez podwójnego liczenia,
+    także przy jednoczesnej zmianie pracownika.
+    """
+    db_controller = setup_database
+    manager = AppointmentStatsManager(db_controller)
+    connection = db_controller.connection
+    expected = get_stats(db_controller)
+
+    with connection:
+        connection.execute(
+            "INSERT INTO appointments (fk_assignment_id, appointment_date, appointment_status) "
+            "VALUES (1, '2025-03-04 09:00-10:00', 'Zaplanowana')"
+        )
+        connection.execute("UPDATE assigned_patients SET assignment_id = 99 WHERE assignment_id = 1")
+
+    assert connection.execute("SELECT COUNT(*) FROM appointments WHERE fk_assignment_id = 99").fetchone()[0] == 2
+    assert manager.get_daily_count(1, "2025-03-03") == 2
+    assert manager.get_daily_count(1, "2025-03-04") == 1
+    assert manager.get_totals(1) == {"assignment_count": 2, "appointment_count": 3}
+
+    with connection:
+        connection.execute("UPDATE assigned_patients SET assignment_id = 100, fk_employee_id = 2 WHERE assignment_id = 99")
+
+    assert manager.get_totals(1) == {"assignment_count": 1, "appointment_count": 1}
+    assert manager.get_totals(2) == {"assignment_count": 2, "appointment_count": 3}
+
+    maintained = get_stats(db_controller)
+    manager.rebuild()
+    assert maintained == get_stats(db_controller)
+    assert maintained != expected
+
+
+def test_triggers_follow_cascade_assignment_delete(setup_model_database):
+    """
+    Testuje usunięcie przypisania w tabelach modeli - wizyty usuwane przez ON DELETE CASCADE
+    są odejmowane od liczników pracownika.
+    """
+    db_controller = setup_model_database
+    manager = AppointmentStatsManager(db_controller)
+    connection = db_controller.connection
+
+    assert manager.get_totals(1) == {"assignment_count": 2, "appointment_count": 3}
+
+    with connection:
+        connection.execute("DELETE FROM assigned_patients WHERE assignment_id = 1")
+
+    assert connection.execute("SELECT COUNT(*) FROM appointments WHERE fk_assignment_id = 1").fetchone()[0] == 0
+    assert manager.get_totals(1) == {"assignment_count": 1, "appointment_count": 1}
+    assert manager.get_daily_count(1, "2025-03-03") == 1
+    assert manager.get_daily_count(1, "2025-03-04") == 0
+    assert manager.get_totals(2) == {"assignment_count": 1, "appointment_count": 1}
+
+    maintained = get_stats(db_controller)
+    manager.rebuild()
+    assert maintained == get_stats(db_controller)
+
+
+def test_triggers_follow_cascade_user_delete(setup_model_database):
+    """
+    Testuje usunięcie konta użytkownika - kaskada users_accounts -> assigned_patients -> appointments
+    zeruje liczniki tego konta i nie zmienia liczników pozostałych.
+    """
+    db_controller = setup_model_database
+    manager = AppointmentStatsManager(db_controller)
+    connection = db_controller.connection
+
+    with connection:
+        connection.execute("DELETE FROM users_accounts WHERE user_id = 1")
+
+    assert connection.execute("SELECT COUNT(*) FROM appointments").fetchone()[0] == 1
+    assert manager.get_totals(1) == {"assignment_count": 0, "appointment_count": 0}
+    assert manager.get_totals(2) == {"assignment_count": 1, "appointment_count": 1}
+
+    maintained = get_stats(db_controller)
+    assert maintained[0] == [(2, "2025-03-05", 1)]
+    manager.rebuild()
+    # Odbudowa pomija pracowników bez przypisań - porównywane są wiersze z przypisaniami
+    assert [row for row in maintained[1] if row[1]] == get_stats(db_controller)[1]
+
+
+# +-+-+-+- Testy migracji liczników +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_apply_counts_existing_appointments(setup_database):
+    """
+    Testuje utworzenie tabel i wyzwalaczy w bazie bez liczników oraz zliczenie zapisanych wcześniej wizyt.
+    """
+    db_controller = setup_database
+    connection = db_controller.connection
+    for trigger_name in get_trigger_sql():
+        connection.execute(f"DROP TRIGGER {trigger_name}")
+    connection.execute(f"DROP TABLE {DAILY_STATS_TABLE}")
+    connection.execute(f"DROP TABLE {TOTAL_STATS_TABLE}")
+
+    report = AppointmentStatsManager(db_controller).apply()
+
+    assert report["created_tables"] == [DAILY_STATS_TABLE, TOTAL_STATS_TABLE]
+    assert sorted(report["created_triggers"]) == sorted(get_trigger_sql())
+    assert report["rebuilt"] == {"employees": 2, "days": 2}
+    assert get_stats(db_controller) == (
+        [(1, "2025-03-03", 2), (2, "2025-03-03", 1)],
+        [(1, 2, 2), (2, 1, 1)],
+    )
+
+    report = AppointmentStatsManager(db_controller).apply()
+    assert report == {"created_tables": [], "created_triggers": [], "rebuilt": {}, "skipped": False}
+
+
+def test_refresh_triggers_fixes_counts(setup_database):
+    """
+    Testuje zastąpienie wyzwalaczy z pierwszej wersji i odbudowę zawyżonych przez nie liczników.
+    """
+    db_controller = setup_database
+    connection = db_controller.connection
+    with connection:
+        connection.execute(f"UPDATE {TOTAL_STATS_TABLE} SET appointment_count = 6 WHERE fk_employee_id = 1")
+        connection.execute("DROP TRIGGER assigned_patients_stats_on_update")
+
+    report = AppointmentStatsManager(db_controller).refresh_triggers()
+
+    assert report["replaced_triggers"] == list(REVISED_TRIGGERS)
+    assert report["rebuilt"] == {"employees": 2, "days": 2}
+    assert AppointmentStatsManager(db_controller).get_existing_triggers() >= set(get_trigger_sql())
+    assert get_stats(db_controller)[1] == [(1, 2, 2), (2, 1, 1)]
+
+
+def test_refresh_cascade_delete_triggers(setup_database):
+    """
+    Testuje zastąpienie wyzwalacza usuwania przypisań z poprzedniej wersji (bez BEFORE DELETE).
+    """
+    db_controller = setup_database
+    connection = db_controller.connection
+    connection.execute("DROP TRIGGER assigned_patients_stats_before_delete")
+
+    report = AppointmentStatsManager(db_controller).refresh_triggers(CASCADE_DELETE_TRIGGERS)
+
+    assert report["replaced_triggers"] == list(CASCADE_DELETE_TRIGGERS)
+    assert AppointmentStatsManager(db_controller).get_existing_triggers() >= set(get_trigger_sql())
@@ -0,0 +1,276 @@
+# test_database_batch.py
+
+import os
+import pytest
+from controllers.database_controller import DatabaseController
+from database.batch import BatchWriter
+from models.assigned_patients import AssignedPatients
+from models.employee_services import EmployeeServices
+from models.patients import Patients
+from models.users_accounts import UsersAccounts
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "database", "schema_projekt_inz_used_v2.sql"
+)
+
+
+@pytest.fixture(name="setup_database")
+def setup_database_fixture():
+    """
+    Tworzy testową bazę danych ze schematem v2 oraz danymi: pracownicy 1-3, pacjenci 1-3,
+    przypisania 1-3 do pracownika 1, wizyta przypisania 3, usługi 1-2 pracownika 1.
+    """
+    db_controller = DatabaseController()
+    db_controller.connect_to_database()
+    connection = db_controller.connection
+    with open(SCHEMA_PATH, encoding="utf-8") as schema_file:
+        connection.executescript(schema_file.read())
+
+    connection.executescript("""
+        INSERT INTO employees (employee_id, first_name, last_name, email, phone, profession, is_medical_staff)
+        VALUES (1, 'Anna', 'Lekarz', 'anna@example.com', '500000001', 'Psychiatra', 1),
+               (2, 'Adam', 'Inny', 'adam@example.com', '500000002', 'Psycholog kliniczny', 1),
+               (3, 'Ewa', 'Trzecia', 'ewa@example.com', '500000003', 'Psycholog kliniczny', 1);
+        INSERT INTO patients (patient_id, first_name, last_name, pesel, phone, email, date_of_birth)
+        VALUES (1, 'Jan', 'Kowalski', '90010100001', '600000001', 'jan@example.com', '1990-01-01'),
+               (2, 'Ewa', 'Zielinska', '90010100002', '600000002', 'ewa@example.com', '1990-01-01'),
+               (3, 'Piotr', 'Nowak', '90010100003', '600000003', 'piotr@example.com', '1990-01-01');
+        INSERT INTO assigned_patients (assignment_id, fk_patient_id, fk_employee_id) VALUES (1, 1, 1), (2, 2, 1), (3, 3, 1);
+        INSERT INTO appointments (appointment_id, fk_assignment_id, appointment_date, appointment_status)
+        VALUES (1, 3, '2025-03-03 09:00-10:00', 'Zaplanowana');
+        INSERT INTO services (service_id, service_type, duration_minutes, service_price)
+        VALUES (1, 'Konsultacja', 50, 200), (2, 'Terapia', 50, 250);
+        INSERT INTO employee_services (employee_service_id, employee_id, service_id) VALUES (1, 1, 1), (2, 1, 2);
+    """)
+
+    yield db_controller
+
+    db_controller.close_connection()
+
+
+def count_rows(db_controller, table_name, condition="1 = 1"):
+    """
+    Zwraca liczbę rekordów tabeli spełniających warunek.
+    """
+    return db_controller.connection.execute(f"SELECT COUNT(*) FROM {table_name} WHERE {condition}").fetchone()[0]
+
+
+# +-+-+-+- Testy jednostki pracy +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_unit_of_work_defers_model_commits(setup_database):
+    """
+    Testuje, czy `commit()` modeli wewnątrz jednostki pracy nie kończy transakcji,
+    a wyjątek cofa wszystkie zmiany bloku.
+    """
+    db_controller = setup_database
+    connection = db_controller.connection
+    model = AssignedPatients(db_controller)
+
+    with pytest.raises(ValueError):
+        with db_controller.unit_of_work():
+            model.add_record_by_ids(1, 2)
+            model.add_record_by_ids(2, 2)
+            assert connection.in_transaction
+            raise ValueError("Przerwanie jednostki pracy")
+
+    assert count_rows(db_controller, "assigned_patients", "fk_employee_id = 2") == 0
+    assert not connection.in_unit_of_work
+
+    with db_controller.unit_of_work():
+        model.add_record_by_ids(1, 2)
+    assert not connection.in_transaction
+    assert count_rows(db_controller, "assigned_patients", "fk_employee_id = 2") == 1
+
+
+def test_nested_unit_of_work_rolls_back_inner_block(setup_database):
+    """
+    Testuje, czy wyjątek w zagnieżdżonej jednostce pracy cofa tylko jej zmiany.
+    """
+    db_controller = setup_database
+    model = AssignedPatients(db_controller)
+
+    with db_controller.unit_of_work():
+        model.add_record_by_ids(1, 2)
+        with pytest.raises(RuntimeError):
+            with db_controller.unit_of_work():
+                model.add_record_by_ids(2, 2)
+                model.add_record_by_ids(2, 2)  # Duplikat - naruszenie UNIQUE
+
+    assert count_rows(db_controller, "assigned_patients", "fk_employee_id = 2") == 1
+
+
+# +-+-+-+- Testy zapisu partii +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_insert_many_returns_ids_and_row_errors(setup_database):
+    """
+    Testuje dodanie partii: ID dodanych rekordów, odrzucenie nieistniejących odwołań
+    i naruszenia UNIQUE wskazane dla pojedynczych wierszy.
+    """
+    db_controller = setup_database
+    model = AssignedPatients(db_controller)
+
+    results = model.add_many([
+        {"fk_patient_id": 1, "fk_employee_id": 2},
+        {"fk_patient_id": 99, "fk_employee_id": 2},
+        {"fk_patient_id": 2, "fk_employee_id": 2},
+    ])
+    assert [result["success"] for result in results] == [True, False, True]
+    assert results[1]["error"] == "Pacjent o ID 99 nie istnieje w systemie."
+    assert results[2]["id"] == results[0]["id"] + 1
+    assert count_rows(db_controller, "assigned_patients", f"assignment_id = {results[2]['id']} AND fk_patient_id = 2") == 1
+
+    # Duplikat pary wycofuje executemany i jest wskazany dla właściwego wiersza
+    results = model.add_many([{"fk_patient_id": 3, "fk_employee_id": 2}, {"fk_patient_id": 1, "fk_employee_id": 2}])
+    assert [result["success"] for result in results] == [True, False]
+    assert "UNIQUE" in results[1]["error"]
+    assert count_rows(db_controller, "assigned_patients", "fk_employee_id = 2") == 3
+
+
+def test_update_many_reassigns_patients(setup_database):
+    """
+    Testuje przeniesienie przypisań do innego pracownika jedną partią.
+    """
+    db_controller = setup_database
+    model = AssignedPatients(db_controller)
+
+    results = model.update_many([
+        {"assignment_id": 1, "fk_employee_id": 2},
+        {"assignment_id": 2, "fk_employee_id": 2},
+        {"assignment_id": 50, "fk_employee_id": 2},
+        {"assignment_id": 3, "fk_employee_id": 99},
+        {"assignment_id": 3, "notes": "x"},
+    ])
+
+    assert [result["success"] for result in results] == [True, True, False, False, False]
+    assert results[2]["error"] == "Rekord o ID 50 nie istnieje w tabeli `assigned_patients`."
+    assert results[3]["error"] == "Pracownik o ID 99 nie istnieje w systemie."
+    assert results[4]["error"] == "Niedozwolone kolumny: notes."
+    assert count_rows(db_controller, "assigned_patients", "fk_employee_id = 2") == 2
+    assert model.get_employee_ids_by_assignment_ids([1, 2, 3]) == {1, 2}
+
+
+def test_delete_many_keeps_assignments_with_appointments(setup_database):
+    """
+    Testuje usunięcie partii przypisań z pominięciem przypisań powiązanych z wizytami.
+    """
+    db_controller = setup_database
+    results = AssignedPatients(db_controller).delete_many([1, 3, 2, 50])
+
+    assert [result["success"] for result in results] == [True, False, True, False]
+    assert "powiązane z wizytami" in results[1]["error"]
+    assert count_rows(db_controller, "assigned_patients") == 1
+
+
+def test_update_many_deactivates_service_line(setup_database):
+    """
+    Testuje dezaktywację wszystkich usług pracownika oraz odrzucenie kolumny spoza tabeli przez `BatchWriter`.
+    """
+    db_controller = setup_database
+    results = EmployeeServices(db_controller).update_many([
+        {"employee_service_id": 1, "is_active": 0},
+        {"employee_service_id": 2, "is_active": 0},
+    ])
+
+    assert all(result["success"] for result in results)
+    assert count_rows(db_controller, "employee_services", "is_active = 0") == 2
+
+    with pytest.raises(ValueError):
+        BatchWriter(db_controller).update_many("employee_services", "employee_service_id", [
+            {"employee_service_id": 1, "unknown_column": 1},
+        ])
+
+
+def test_insert_many_ids_with_interleaved_inserts(setup_database):
+    """
+    Testuje ID dodanych rekordów, gdy wyzwalacz dodaje rekordy do tej samej tabeli między wierszami partii
+    (ID partii nie są kolejnymi liczbami).
+    """
+    db_controller = setup_database
+    connection = db_controller.connection
+    connection.execute("""
+        CREATE TEMP TRIGGER copy_patients AFTER INSERT ON patients WHEN NEW.first_name != 'Kopia'
+        BEGIN
+            INSERT INTO patients (first_name, last_name, pesel, phone, email, date_of_birth)
+            VALUES ('Kopia', NEW.last_name, '8' || substr(NEW.pesel, 2), '7' || substr(NEW.phone, 2),
+                    'kopia.' || NEW.email, NEW.date_of_birth);
+        END
+    """)
+
+    results = Patients(db_controller).add_many([
+        {"first_name": "Marek", "last_name": "Lis", "pesel": "90010100004", "phone": "600000004",
+         "email": "marek@example.com", "address": "Polna 1", "date_of_birth": "1990-01-01"},
+        {"first_name": "Ola", "last_name": "Wilk", "pesel": "90010100005", "phone": "600000005",
+         "email": "ola@example.com", "address": "Polna 2", "date_of_birth": "1990-01-01"},
+    ])
+
+    assert [result["id"] for result in results] == [4, 6]
+    rows = connection.execute("SELECT patient_id, first_name FROM patients WHERE patient_id > 3 ORDER BY 1").fetchall()
+    assert [tuple(row) for row in rows] == [(4, "Marek"), (5, "Kopia"), (6, "Ola"), (7, "Kopia")]
+
+
+def test_patients_batch_validates_rows(setup_database):
+    """
+    Testuje partie pacjentów: walidacja formatu pól i unikalność wskazane dla pojedynczych wierszy,
+    aktualizacja i usunięcie w jednej transakcji.
+    """
+    db_controller = setup_database
+    model = Patients(db_controller)
+
+    results = model.add_many([
+        {"first_name": "Marek", "last_name": "Lis", "pesel": "900101", "phone": "600000004",
+         "email": "marek@example.com", "address": "Polna 1", "date_of_birth": "1990-01-01"},
+        {"first_name": "Ola", "last_name": "Wilk", "pesel": "90010100001", "phone": "600000005",
+         "email": "ola@example.com", "address": "Polna 2", "date_of_birth": "1990-01-01"},
+        {"first_name": "Iga", "last_name": "Sowa", "pesel": "90010100006", "phone": "600000006",
+         "email": "iga@example.com", "address": "Polna 3", "date_of_birth": "1990-01-01"},
+    ])
+    assert [result["success"] for result in results] == [False, False, True]
+    assert results[0]["error"] == "Numer PESEL powinien zawierać dokładnie 11 cyfr."
+    assert "UNIQUE" in results[1]["error"]
+
+    results = model.update_many([
+        {"patient_id": 1, "is_active": 0},
+        {"patient_id": 2, "email": "bez-malpy"},
+        {"patient_id": 50, "is_active": 0},
+    ])
+    assert [result["success"] for result in results] == [True, False, False]
+    assert results[1]["error"] == "Adres email jest nieprawidłowy."
+    assert count_rows(db_controller, "patients", "is_active = 0") == 1
+
+    results = model.delete_many([4, 99])
+    assert [result["success"] for result in results] == [True, False]
+    assert count_rows(db_controller, "patients") == 3
+
+
+def test_users_accounts_batch(setup_database):
+    """
+    Testuje partie kont użytkowników: odwołania do pracowników i ról sprawdzane jednym zapytaniem na kolumnę.
+    """
+    db_controller = setup_database
+    db_controller.connection.execute("INSERT INTO roles (role_id, role_name) VALUES (1, 'Administrator'), (3, 'Psychiatra')")
+    model = UsersAccounts(db_controller)
+
+    results = model.add_many([
+        {"employee_id": 1, "role_id": 3, "username": "anna", "password_hash": "hash", "is_active": 1,
+         "created_at": "2025-01-01 10:00"},
+        {"employee_id": 2, "role_id": 7, "username": "adam", "password_hash": "hash", "is_active": 1,
+         "created_at": "2025-01-01 10:00"},
+        {"employee_id": 3, "role_id": 3, "username": "ewa", "password_hash": "hash", "is_active": 1,
+         "created_at": "2025-01-01 10:00"},
+    ])
+    assert [result["success"] for result in results] == [True, False, True]
+    assert results[1]["error"] == "Nie znaleziono roli o ID 7."
+    user_ids = [results[0]["id"], results[2]["id"]]
+
+    results = model.update_many([{"user_id": user_id, "role_id": 1} for user_id in user_ids])
+    assert all(result["success"] for result in results)
+    assert count_rows(db_controller, "users_accounts", "role_id = 1") == 2
+
+    results = model.delete_many(user_ids)
+    assert all(result["success"] for result in results)
+    assert count_rows(db_controller, "users_accounts") == 0
@@ -0,0 +1,120 @@
+# test_database_bulk_loader.py
+
+import os
+import pytest
+from controllers.database_controller import DatabaseController
+from database.bulk_loader import LOAD_SPECS, BulkLoader, get_load_order
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "database", "schema_projekt_inz_used_v2.sql"
+)
+
+
+@pytest.fixture(name="setup_database")
+def setup_database_fixture():
+    """
+    Tworzy testową bazę danych w pamięci na podstawie schema_projekt_inz_used_v2.sql.
+    """
+    db_controller = DatabaseController()
+    db_controller.connect_to_database()
+    with open(SCHEMA_PATH, encoding="utf-8") as schema_file:
+        db_controller.connection.executescript(schema_file.read())
+
+    yield db_controller
+
+    db_controller.close_connection()
+
+
+def write_list_file(directory, table_name, lines):
+    """
+    Zapisuje plik z danymi tabeli w katalogu testowym.
+    """
+    path = directory / LOAD_SPECS[table_name]["file"]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+# +-+-+-+- Testy kolejności ładowania +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_load_order_follows_foreign_keys(setup_database):
+    """
+    Testuje, czy tabela nadrzędna jest ładowana przed tabelą podrzędną.
+    """
+    graph = setup_database.schema_catalog.get_foreign_key_graph()
+
+    order = get_load_order(graph, ["appointments", "rooms", "room_reservations", "room_types"])
+
+    assert order == ["room_types", "rooms", "room_reservations", "appointments"]
+
+
+def test_load_order_rejects_cycle():
+    """
+    Testuje wykrycie cyklicznych zależności kluczy obcych.
+    """
+    with pytest.raises(ValueError, match="Cykliczne zależności"):
+        get_load_order({"a": ["b"], "b": ["a"]}, ["a", "b"])
+
+
+# +-+-+-+- Testy ładowania danych +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_load_all_lists_files(setup_database):
+    """
+    Testuje załadowanie wszystkich plików z lists_files (bez kont użytkowników - wymagają bcrypt).
+    """
+    db_controller = setup_database
+    tables = [table for table in LOAD_SPECS if table != "users_accounts"]
+
+    report = BulkLoader(db_controller, validate=True).load_all(tables)
+
+    assert report["errors"] == []
+    assert report["foreign_key_violations"] == []
+    for stats in report["tables"]:
+        count = db_controller.connection.execute(f"SELECT COUNT(*) FROM {stats['table']}").fetchone()[0]
+        assert count == stats["rows"] > 0
+    assert db_controller.connection.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+
+def test_validate_mode_skips_invalid_rows(setup_database, tmp_path):
+    """
+    Testuje pominięcie wierszy z błędami walidacji i ich raportowanie w trybie `validate`.
+    """
+    write_list_file(tmp_path, "room_types", ["1,Gabinet", "2,Sala 2", "3,Poczekalnia", "4"])
+
+    report = BulkLoader(setup_database, str(tmp_path), validate=True).load_all(["room_types"])
+
+    assert report["tables"][0]["rows"] == 2
+    assert report["tables"][0]["skipped"] == 2
+    assert [error["line"] for error in report["errors"]] == [2, 4]
+
+
+def test_constraint_error_rolls_back_table(setup_database, tmp_path):
+    """
+    Testuje wycofanie transakcji tabeli, gdy wiersz narusza ograniczenie bazy danych.
+    """
+    db_controller = setup_database
+    db_controller.connection.execute("INSERT INTO room_types (room_type) VALUES ('Biuro')")
+    db_controller.connection.commit()
+    write_list_file(tmp_path, "room_types", ["1,Gabinet", "2,Gabinet"])
+
+    with pytest.raises(RuntimeError, match="Błąd podczas ładowania tabeli room_types"):
+        BulkLoader(db_controller, str(tmp_path)).load_all(["room_types"])
+
+    rows = db_controller.connection.execute("SELECT room_type FROM room_types").fetchall()
+    assert [row[0] for row in rows] == ["Biuro"]
+
+
+def test_foreign_keys_checked_after_load(setup_database, tmp_path):
+    """
+    Testuje raportowanie naruszeń kluczy obcych po załadowaniu wszystkich tabel.
+    """
+    write_list_file(tmp_path, "room_types", ["1,Gabinet"])
+    write_list_file(tmp_path, "rooms", ["1,10,1,1", "2,11,1,7"])
+
+    report = BulkLoader(setup_database, str(tmp_path)).load_all(["rooms", "room_types"])
+
+    assert [stats["table"] for stats in report["tables"]] == ["room_types", "rooms"]
+    assert report["foreign_key_violations"] == [{"table": "rooms", "rowid": 2, "parent": "room_types"}]
@@ -0,0 +1,158 @@
+# test_database_connection_manager.py
+
+import os
+import sqlite3
+import threading
+import pytest
+from config import Config, CONNECTION_PROFILES
+from database.connection_manager import ConnectionManager
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+
+@pytest.fixture(name="file_manager")
+def file_manager_fixture(tmp_path):
+    """
+    Tworzy menedżera połączeń dla bazy w pliku z profilem produkcyjnym.
+    """
+    manager = ConnectionManager(str(tmp_path / "test.db"), dict(CONNECTION_PROFILES["production"]))
+    connection = manager.get_connection()
+    connection.execute("CREATE TABLE items (item_id INTEGER PRIMARY KEY, name TEXT)")
+    connection.execute("INSERT INTO items (name) VALUES ('a'), ('b')")
+    connection.commit()
+
+    yield manager
+
+    manager.close_all()
+
+
+def run_in_thread(function):
+    """
+    Wykonuje funkcję w osobnym wątku i zwraca jej wynik.
+    """
+    result = {}
+    thread = threading.Thread(target=lambda: result.setdefault("value", function()))
+    thread.start()
+    thread.join()
+    return result["value"]
+
+
+# +-+-+-+- Testy parametrów połączenia +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_connection_uses_profile_pragmas(file_manager):
+    """
+    Testuje, czy połączenie ma ustawione parametry z profilu (WAL, synchronous, cache, busy_timeout).
+    """
+    connection = file_manager.get_connection()
+    profile = file_manager.profile
+
+    assert file_manager.journal_mode == "wal"
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert connection.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert connection.execute("PRAGMA cache_size").fetchone()[0] == profile["cache_size"]
+    assert connection.execute("PRAGMA busy_timeout").fetchone()[0] == profile["busy_timeout"]
+    assert connection.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+
+def test_get_connection_per_thread(file_manager):
+    """
+    Testuje, czy każdy wątek otrzymuje własne połączenie, a ten sam wątek - zawsze to samo.
+    """
+    main_connection = file_manager.get_connection()
+    thread_connection = run_in_thread(file_manager.get_connection)
+
+    assert file_manager.get_connection() is main_connection
+    assert thread_connection is not main_connection
+
+
+def test_memory_database_shares_connection():
+    """
+    Testuje, czy baza w pamięci używa jednego połączenia dla wszystkich wątków i czytelników.
+    """
+    manager = ConnectionManager(":memory:", dict(CONNECTION_PROFILES["test"]))
+    connection = manager.get_connection()
+
+    with manager.read_connection() as read_connection:
+        assert read_connection is connection
+    assert run_in_thread(manager.get_connection) is connection
+
+    manager.close_all()
+
+
+# +-+-+-+- Testy puli połączeń tylko do odczytu +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_read_connection_is_read_only(file_manager):
+    """
+    Testuje, czy połączenie z puli odczytu widzi dane, ale nie pozwala na zapis.
+    """
+    with file_manager.read_connection() as connection:
+        assert connection.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 2
+
+        with pytest.raises(sqlite3.OperationalError):
+            connection.execute("INSERT INTO items (name) VALUES ('c')")
+
+
+def test_read_connection_is_reused(file_manager):
+    """
+    Testuje, czy zwolnione połączenie wraca do puli i jest ponownie wypożyczane.
+    """
+    with file_manager.read_connection() as first:
+        pass
+    with file_manager.read_connection() as second:
+        pass
+
+    assert first is second
+
+
+def test_reader_does_not_block_writer(file_manager):
+    """
+    Testuje, czy otwarta transakcja odczytu nie blokuje zapisu (tryb WAL).
+    """
+    with file_manager.read_connection() as connection:
+        connection.execute("BEGIN")
+        assert connection.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 2
+
+        writer = file_manager.get_connection()
+        writer.execute("INSERT INTO items (name) VALUES ('c')")
+        writer.commit()
+
+        # Czytelnik widzi migawkę z początku swojej transakcji
+        assert connection.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 2
+
+    with file_manager.read_connection() as connection:
+        assert connection.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 3
+
+
+# +-+-+-+- Testy profilu w Config +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_config_profile_overrides(monkeypatch):
+    """
+    Testuje wybór profilu i nadpisywanie parametrów zmiennymi środowiskowymi.
+    """
+    monkeypatch.setenv("DB_PROFILE", "production")
+    monkeypatch.setenv("DB_CACHE_SIZE", "-64000")
+    monkeypatch.setenv("DB_SYNCHRONOUS", "full")
+
+    profile = Config.get_connection_profile()
+
+    assert profile["journal_mode"] == "WAL"
+    assert profile["cache_size"] == -64000
+    assert profile["synchronous"] == "FULL"
+
+
+def test_config_profile_rejects_invalid_values(monkeypatch):
+    """
+    Testuje odrzucenie nieznanego profilu i nieprawidłowych wartości parametrów.
+    """
+    monkeypatch.setenv("DB_PROFILE", "unknown")
+    with pytest.raises(ValueError, match="Nieznany profil"):
+        Config.get_connection_profile()
+
+    monkeypatch.setenv("DB_PROFILE", "test")
+    monkeypatch.setenv("DB_JOURNAL_MODE", "WAL; DROP TABLE items")
+    with pytest.raises(ValueError, match="journal_mode"):
+        Config.get_connection_profile()
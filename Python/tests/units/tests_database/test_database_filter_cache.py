@@ -0,0 +1,131 @@
+# test_database_filter_cache.py
+
+import os
+import pytest
+from controllers.database_controller import DatabaseController
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+
+@pytest.fixture(name="setup_database")
+def setup_database_fixture():
+    """
+    Tworzy testową bazę danych w pamięci z tabelą `services`.
+    """
+    db_controller = DatabaseController()
+    db_controller.connect_to_database()
+    db_controller.connection.executescript("""
+        CREATE TABLE services (
+            service_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            service_type TEXT NOT NULL,
+            service_price REAL NOT NULL
+        );
+        INSERT INTO services (service_type, service_price) VALUES
+            ('Terapia', 150), ('Konsultacja', 100), ('Diagnoza', 200), ('Terapia grupowa', 80);
+    """)
+
+    yield db_controller
+
+    db_controller.close_connection()
+
+
+# +-+-+-+- Testy kompilacji filtrów +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_build_filters_generates_query(setup_database):
+    """
+    Testuje tekst zapytania i parametry dla różnych operatorów.
+    """
+    db_controller = setup_database
+    filters = [
+        {"column": "service_price", "operator": "BETWEEN", "value": (90, 160)},
+        {"column": "service_type", "operator": "LIKE", "value": "Tera"},
+        {"column": "service_id", "operator": "IN", "value": [1, 2]},
+        {"column": "service_type", "operator": "IS NOT NULL"},
+    ]
+
+    query, values = db_controller.build_filters(filters, [("service_price", "desc")], "services")
+
+    assert query == (
+        "1=1 AND service_price BETWEEN ? AND ? AND service_type LIKE ? AND service_id IN (SELECT value FROM json_each(?))"
+        " AND service_type IS NOT NULL ORDER BY service_price DESC"
+    )
+    assert values == [90, 160, "%Tera%", "[1, 2]"]
+
+
+def test_build_filters_reuses_compiled_shape(setup_database):
+    """
+    Testuje, czy filtry o tym samym kształcie i różnych wartościach trafiają w pamięć podręczną.
+    """
+    db_controller = setup_database
+
+    first_query, first_values = db_controller.build_filters(
+        [{"column": "service_price", "operator": ">", "value": 100}], None, "services"
+    )
+    second_query, second_values = db_controller.build_filters(
+        [{"column": "service_price", "operator": ">", "value": 150}], None, "services"
+    )
+    # Inna liczba wartości IN to ten sam kształt (jeden parametr JSON)
+    db_controller.build_filters([{"column": "service_id", "operator": "IN", "value": [1]}], None, "services")
+    db_controller.build_filters([{"column": "service_id", "operator": "IN", "value": [1, 2]}], None, "services")
+
+    assert first_query == second_query
+    assert first_values == [100]
+    assert second_values == [150]
+    assert db_controller.filter_cache.get_stats() == {"hits": 2, "misses": 2, "size": 2}
+
+
+def test_select_filtered_returns_rows(setup_database):
+    """
+    Testuje pobieranie rekordów z filtrami i sortowaniem przez `select_filtered`.
+    """
+    db_controller = setup_database
+
+    rows = db_controller.select_filtered(
+        "services",
+        [{"column": "service_type", "operator": "LIKE", "value": "Terapia"}],
+        [("service_price", "ASC")],
+    )
+
+    assert [row["service_price"] for row in rows] == [80, 150]
+
+
+# +-+-+-+- Testy walidacji kolumn +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_build_filters_rejects_unknown_column(setup_database):
+    """
+    Testuje odrzucenie kolumny, której nie ma w tabeli.
+    """
+    db_controller = setup_database
+
+    with pytest.raises(ValueError, match="Nieprawidłowa kolumna: room_id"):
+        db_controller.build_filters([{"column": "room_id", "operator": "=", "value": 1}], None, "services")
+
+    with pytest.raises(ValueError, match="Nieprawidłowa kolumna: room_id"):
+        db_controller.build_filters(None, [("room_id", "ASC")], "services")
+
+
+def test_build_filters_rejects_sql_in_column_name(setup_database):
+    """
+    Testuje odrzucenie nazwy kolumny, która nie jest identyfikatorem (także bez podanej tabeli).
+    """
+    db_controller = setup_database
+    filters = [{"column": "service_id = 1 OR 1", "operator": "=", "value": 1}]
+
+    with pytest.raises(ValueError, match="Nieprawidłowa nazwa kolumny"):
+        db_controller.build_filters(filters)
+
+
+def test_build_filters_rejects_unsupported_operator(setup_database):
+    """
+    Testuje odrzucenie nieobsługiwanego operatora i kierunku sortowania.
+    """
+    db_controller = setup_database
+
+    with pytest.raises(ValueError, match="Nieobsługiwany operator"):
+        db_controller.build_filters([{"column": "service_id", "operator": "BETWEEN", "value": [1, 2]}])
+
+    with pytest.raises(ValueError, match="Nieobsługiwany kierunek sortowania"):
+        db_controller.build_filters(None, [("service_id", "UP")])
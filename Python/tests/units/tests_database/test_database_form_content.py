@@ -0,0 +1,149 @@
+# test_database_form_content.py
+
+import io
+import os
+import pytest
+from controllers.database_controller import DatabaseController
+from database.form_content import CONTENT_TABLE, FormContentStore
+from models.patient_forms import PatientForms
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "database", "schema_projekt_inz_used_v2.sql"
+)
+
+
+@pytest.fixture(name="setup_database")
+def setup_database_fixture():
+    """
+    Tworzy testową bazę danych ze schematem v2, tabelą `patient_forms` (z tabelą treści)
+    oraz danymi: pacjent 1 i typ formularza 1.
+    """
+    db_controller = DatabaseController()
+    db_controller.connect_to_database()
+    connection = db_controller.connection
+    with open(SCHEMA_PATH, encoding="utf-8") as schema_file:
+        connection.executescript(schema_file.read())
+    PatientForms(db_controller).create_table()
+
+    connection.executescript("""
+        INSERT INTO patients (patient_id, first_name, last_name, pesel, phone, email, date_of_birth)
+        VALUES (1, 'Jan', 'Kowalski', '90010100001', '600000001', 'jan@example.com', '1990-01-01');
+        INSERT INTO form_types (form_type_id, form_name) VALUES (1, 'Ankieta wstępna');
+    """)
+
+    yield db_controller
+
+    db_controller.close_connection()
+
+
+def questionnaire(answers: int) -> str:
+    """
+    Zwraca treść ankiety o podanej liczbie odpowiedzi.
+    """
+    return "\n".join(f"Pytanie {number}: odpowiedź pacjenta - żółć, gęś ({number % 7})" for number in range(answers))
+
+
+# +-+-+-+- Testy zapisu i odczytu treści +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_forms_list_returns_metadata_only(setup_database):
+    """
+    Testuje zapis treści w postaci skompresowanej i listę formularzy bez treści (tylko jej rozmiar).
+    """
+    model = PatientForms(setup_database)
+    content = questionnaire(200)
+    with_content = model.add_form(1, 1, "2025-03-01", content)
+    without_content = model.add_form(1, 1, "2025-03-02")
+
+    statements = []
+    setup_database.connection.set_trace_callback(statements.append)
+    forms = model.get_forms(filters=[{"column": "fk_patient_id", "operator": "=", "value": 1}])
+    setup_database.connection.set_trace_callback(None)
+
+    assert [form["patient_form_id"] for form in forms] == [with_content, without_content]
+    assert forms[0]["content_size"] == len(content.encode("utf-8"))
+    assert forms[1]["content_size"] is None
+    assert all("content" not in form for form in forms)
+    assert not any("SELECT *" in statement or "content," in statement for statement in statements)
+
+    row = setup_database.connection.execute(
+        "SELECT f.content, c.compressed_size, c.original_size FROM patient_forms f "
+        f"JOIN {CONTENT_TABLE} c ON c.fk_patient_form_id = f.patient_form_id"
+    ).fetchone()
+    assert row[0] is None
+    assert row[1] < row[2] / 5
+    assert model.get_form_content(with_content) == content
+    assert model.get_form_content(without_content) is None
+
+
+def test_update_and_delete_content(setup_database):
+    """
+    Testuje zastąpienie treści, usunięcie jej wartością None oraz usunięcie treści razem z formularzem.
+    """
+    model = PatientForms(setup_database)
+    patient_form_id = model.add_form(1, 1, "2025-03-01", "Pierwsza wersja")
+
+    model.update_form(patient_form_id, {"content": b"%PDF-1.7 skan"})
+    assert model.get_form_content(patient_form_id) == b"%PDF-1.7 skan"
+
+    model.update_form(patient_form_id, {"submission_date": "2025-03-05", "content": None})
+    assert model.get_form_content(patient_form_id) is None
+    assert model.get_forms()[0]["submission_date"] == "2025-03-05"
+
+    model.update_form(patient_form_id, {"content": "Druga wersja"})
+    model.delete_form(patient_form_id)
+    assert setup_database.connection.execute(f"SELECT COUNT(*) FROM {CONTENT_TABLE}").fetchone()[0] == 0
+
+
+def test_open_form_content_streams_in_chunks(setup_database):
+    """
+    Testuje strumieniowy odczyt treści fragmentami nie większymi niż rozmiar fragmentu.
+    """
+    model = PatientForms(setup_database)
+    content = questionnaire(5000)
+    patient_form_id = model.add_form(1, 1, "2025-03-01", content)
+
+    with model.open_form_content(patient_form_id, chunk_size=4096) as reader:
+        assert reader.is_text
+        assert reader.original_size == len(content.encode("utf-8"))
+        chunks = iter(lambda: reader.read(8192), b"")
+        data = b"".join(chunk for chunk in chunks if len(chunk) <= 4096)
+    assert reader.closed
+    assert data.decode("utf-8") == content
+
+    with model.open_form_content(patient_form_id) as reader:
+        assert io.TextIOWrapper(reader, encoding="utf-8").readline() == "Pytanie 0: odpowiedź pacjenta - żółć, gęś (0)\n"
+    assert model.open_form_content(999) is None
+
+
+# +-+-+-+- Testy migracji i statystyk +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_apply_migrates_legacy_content(setup_database):
+    """
+    Testuje przeniesienie treści zapisanej w `patient_forms.content` do tabeli treści i statystyki rozmiaru.
+    """
+    connection = setup_database.connection
+    connection.execute(f"DROP TABLE {CONTENT_TABLE}")
+    connection.executemany(
+        "INSERT INTO patient_forms (patient_form_id, fk_patient_id, fk_form_type_id, submission_date, content) "
+        "VALUES (?, 1, 1, '2025-03-01', ?)",
+        [(form_id, questionnaire(form_id)) for form_id in range(1, 1201)] + [(1201, None)],
+    )
+    connection.commit()
+
+    store = FormContentStore(setup_database)
+    report = store.apply()
+
+    assert report == {"created_tables": [CONTENT_TABLE], "migrated": 1200, "skipped": False}
+    assert connection.execute("SELECT COUNT(*) FROM patient_forms WHERE content IS NOT NULL").fetchone()[0] == 0
+    assert store.load(1200) == questionnaire(1200)
+
+    statistics = store.get_statistics()
+    assert statistics["forms"] == statistics["text_forms"] == 1200
+    assert statistics["largest_size"] == len(questionnaire(1200).encode("utf-8"))
+    assert 0 < statistics["ratio"] < 0.2
+    assert store.apply() == {"created_tables": [], "migrated": 0, "skipped": False}
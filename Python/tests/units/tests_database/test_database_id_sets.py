@@ -0,0 +1,87 @@
+# test_database_id_sets.py
+
+import os
+import pytest
+from controllers.database_controller import DatabaseController
+from database.id_sets import TEMP_TABLE_NAME, IdSetBinder, encode_id_set, json_id_set
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+
+@pytest.fixture(name="setup_database")
+def setup_database_fixture():
+    """
+    Tworzy testową bazę danych z tabelą `items` zawierającą 50 000 rekordów.
+    """
+    db_controller = DatabaseController()
+    db_controller.connect_to_database()
+    with db_controller.connection:
+        db_controller.connection.execute("CREATE TABLE items (item_id INTEGER PRIMARY KEY, name TEXT)")
+        db_controller.connection.executemany(
+            "INSERT INTO items (item_id, name) VALUES (?, ?)", ((i, f"item {i}") for i in range(1, 50001))
+        )
+
+    yield db_controller
+
+    db_controller.close_connection()
+
+
+def count_items(connection, id_set_sql, id_set_params):
+    """
+    Zwraca liczbę rekordów `items`, których ID należy do zbioru.
+    """
+    query = f"SELECT COUNT(*) FROM items WHERE item_id IN {id_set_sql}"
+    return connection.execute(query, id_set_params).fetchone()[0]
+
+
+# +-+-+-+- Testy zbiorów przekazywanych jako JSON +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_json_id_set_has_fixed_statement(setup_database):
+    """
+    Testuje, czy tekst zapytania nie zależy od liczby wartości (jeden parametr, usunięte duplikaty).
+    """
+    assert encode_id_set([3, 1, 3]) == "[3, 1]"
+
+    small_sql, small_params = json_id_set([1, 2])
+    large_sql, large_params = json_id_set(range(1, 1001))
+
+    assert small_sql == large_sql
+    assert len(small_params) == len(large_params) == 1
+    assert count_items(setup_database.connection, small_sql, small_params) == 2
+    assert count_items(setup_database.connection, large_sql, large_params) == 1000
+    assert count_items(setup_database.connection, *json_id_set([])) == 0
+
+
+def test_more_ids_than_parameter_limit(setup_database):
+    """
+    Testuje zbiór większy niż limit parametrów SQLite (32 766), z którym `IN (?, ?, …)` kończy się błędem.
+    """
+    ids = list(range(1, 40001))
+
+    with setup_database.id_sets.bind(ids) as (id_set_sql, id_set_params):
+        assert count_items(setup_database.connection, id_set_sql, id_set_params) == 40000
+
+
+# +-+-+-+- Testy zbiorów w tabeli tymczasowej +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_temp_table_is_cleaned_up(setup_database):
+    """
+    Testuje zapis dużego zbioru w tabeli tymczasowej i usunięcie jego wierszy po wyjściu z bloku.
+    """
+    connection = setup_database.connection
+    binder = IdSetBinder(setup_database, temp_table_threshold=3)
+
+    with binder.bind([1, 2]) as (id_set_sql, _):
+        assert "json_each" in id_set_sql
+
+    with binder.bind([5, 6, 7, 7, 50000]) as (id_set_sql, id_set_params):
+        assert TEMP_TABLE_NAME in id_set_sql
+        assert count_items(connection, id_set_sql, id_set_params) == 4
+        with binder.bind([1, 2, 3]) as (nested_sql, nested_params):
+            assert count_items(connection, nested_sql, nested_params) == 3
+
+    assert connection.execute(f"SELECT COUNT(*) FROM temp.{TEMP_TABLE_NAME}").fetchone()[0] == 0
+    assert not connection.in_transaction
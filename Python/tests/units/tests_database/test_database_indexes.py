@@ -0,0 +1,226 @@
+# test_database_indexes.py
+
+import os
+from types import SimpleNamespace
+import pytest
+from controllers.database_controller import DatabaseController
+from database.indexes import INDEX_REGISTRY, IndexManager, find_full_scans
+from services.dashboard_service import DashboardService
+from services.patients_service import PatientsService
+from services.room_service import RoomService
+from services.session_service import SessionService
+from services.validation_service import ValidationService
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "database", "schema_projekt_inz_used_v2.sql"
+)
+
+
+@pytest.fixture(name="setup_database")
+def setup_database_fixture():
+    """
+    Tworzy testową bazę danych w pamięci na podstawie schema_projekt_inz_used_v2.sql.
+    """
+    db_controller = DatabaseController()
+    db_controller.connect_to_database()
+    with open(SCHEMA_PATH, encoding="utf-8") as schema_file:
+        db_controller.connection.executescript(schema_file.read())
+
+    yield db_controller
+
+    db_controller.close_connection()
+
+
+def drop_managed_indexes(db_controller):
+    """
+    Usuwa wszystkie indeksy z prefiksem `idx_`, aby zasymulować starą bazę danych.
+    """
+    for index_name in IndexManager(db_controller).get_managed_indexes():
+        db_controller.connection.execute(f"DROP INDEX {index_name}")
+
+
+# +-+-+-+- Testy tworzenia i migracji indeksów +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_apply_indexes_creates_missing_indexes(setup_database):
+    """
+    Testuje utworzenie wszystkich indeksów z rejestru w bazie bez indeksów.
+    """
+    db_controller = setup_database
+    drop_managed_indexes(db_controller)
+
+    report = IndexManager(db_controller).apply_indexes()
+    existing = IndexManager(db_controller).get_managed_indexes()
+
+    expected = [name for name, _, _ in INDEX_REGISTRY if name not in report["skipped"]]
+    assert report["created"] == expected
+    assert set(expected) == set(existing)
+
+
+def test_apply_indexes_is_idempotent(setup_database):
+    """
+    Testuje, czy ponowne zastosowanie rejestru nie zmienia bazy danych.
+    """
+    db_controller = setup_database
+    manager = IndexManager(db_controller)
+    manager.apply_indexes()
+
+    report = manager.apply_indexes()
+
+    assert report["created"] == []
+    assert report["recreated"] == []
+    assert report["dropped"] == []
+
+
+def test_apply_indexes_recreates_changed_index(setup_database):
+    """
+    Testuje odtworzenie indeksu, którego kolumny różnią się od definicji w rejestrze.
+    """
+    db_controller = setup_database
+    db_controller.connection.execute("DROP INDEX idx_appointments_assignment_date")
+    db_controller.connection.execute("CREATE INDEX idx_appointments_assignment_date ON appointments (fk_assignment_id)")
+
+    manager = IndexManager(db_controller)
+    report = manager.apply_indexes()
+
+    assert report["recreated"] == ["idx_appointments_assignment_date"]
+    assert manager.get_index_columns("idx_appointments_assignment_date") == ("fk_assignment_id", "appointment_date")
+
+
+def test_apply_indexes_drops_obsolete_index(setup_database):
+    """
+    Testuje usunięcie indeksu z prefiksem `idx_`, którego nie ma w rejestrze.
+    """
+    db_controller = setup_database
+    db_controller.connection.execute("CREATE INDEX idx_appointments_status ON appointments (appointment_status)")
+
+    manager = IndexManager(db_controller)
+    report = manager.apply_indexes()
+
+    assert report["dropped"] == ["idx_appointments_status"]
+    assert "idx_appointments_status" not in manager.get_managed_indexes()
+
+
+def test_apply_indexes_skips_missing_tables(setup_database):
+    """
+    Testuje pominięcie indeksów dla tabel, których nie ma w bazie (np. role_permissions w schemacie v2).
+    """
+    db_controller = setup_database
+
+    report = IndexManager(db_controller).apply_indexes()
+
+    assert "idx_role_permissions_permission_id" in report["skipped"]
+    assert "idx_patient_forms_fk_patient_id" in report["skipped"]
+
+
+# +-+-+-+- Testy planów zapytań serwisów +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+# Wywołania serwisów dla pracownika z zakresem SCOPE_ASSIGNED: nazwa -> funkcja(kontekst)
+SERVICE_CALLS = {
+    "DashboardService.get_snapshot": lambda context: DashboardService(context.controller).get_snapshot(context.user_id),
+    "PatientsService.table_get_patients_for_user": lambda context: PatientsService(context.controller).table_get_patients_for_user(
+        context.employee_id
+    ),
+    "PatientsService.table_get_diagnoses_data": lambda context: PatientsService(context.controller).table_get_diagnoses_data(
+        context.user_id
+    ),
+    "PatientsService.table_get_prescriptions_data": lambda context: PatientsService(context.controller).table_get_prescriptions_data(
+        context.user_id
+    ),
+    "RoomService.get_reservation_ids_for_room": lambda context: RoomService(context.controller).get_reservation_ids_for_room(1),
+    "RoomService.get_all_assignment_ids_for_employee": lambda context: RoomService(
+        context.controller
+    ).get_all_assignment_ids_for_employee(context.employee_id),
+    "RoomService.get_all_service_ids_for_employee": lambda context: RoomService(
+        context.controller
+    ).get_all_service_ids_for_employee(context.employee_id),
+    "RoomService.get_reservations_in_range": lambda context: RoomService(context.controller).get_reservations_in_range(
+        "2025-01-01", "2025-01-31", room_id=1
+    ),
+    "RoomService.get_appointments_in_range": lambda context: RoomService(context.controller).get_appointments_in_range(
+        "2025-01-01", "2025-01-31", employee_id=context.employee_id
+    ),
+    "RoomService.table_get_formatted_appointments_for_employee": lambda context: RoomService(
+        context.controller
+    ).table_get_formatted_appointments_for_employee(context.employee_id),
+    "ValidationService.get_referencing_tables": lambda context: ValidationService(context.controller).get_referencing_tables(
+        1, [("appointments", "fk_reservation_id"), ("internal_meetings", "fk_reservation_id")]
+    ),
+    "ValidationService.is_prescriber_appointment": lambda context: ValidationService(
+        context.controller
+    ).is_prescriber_appointment(1, context.employee_id),
+    "ValidationService.is_employee_prescription": lambda context: ValidationService(
+        context.controller
+    ).is_employee_prescription(1, context.employee_id),
+}
+
+
+@pytest.fixture(name="service_context")
+def service_context_fixture(clone_database):
+    """
+    Zwraca kontekst wywołań serwisów: kontroler z bazą "small_clinic" (dane, dla których wykonują się
+    wszystkie gałęzie zapytań), użytkownika z rolą 3 (zakres SCOPE_ASSIGNED) i jego pracownika
+    oraz bazę "empty" (schemat i indeksy bez statystyk ANALYZE) do sprawdzania planów.
+    """
+    db_controller = clone_database("small_clinic")
+    user_id, employee_id = db_controller.connection.execute(
+        "SELECT user_id, employee_id FROM users_accounts WHERE role_id = 3 ORDER BY user_id LIMIT 1"
+    ).fetchone()
+    return SimpleNamespace(
+        controller=SimpleNamespace(db_controller=db_controller, session_service=SessionService(db_controller)),
+        user_id=user_id,
+        employee_id=employee_id,
+        plan_database=clone_database("empty"),
+    )
+
+
+def capture_statements(db_controller, call) -> list:
+    """
+    Wykonuje wywołanie i zwraca instrukcje SQL przekazane do SQLite (z podstawionymi parametrami).
+    """
+    statements = []
+    db_controller.connection.set_trace_callback(statements.append)
+    try:
+        call()
+    finally:
+        db_controller.connection.set_trace_callback(None)
+    return statements
+
+
+@pytest.mark.parametrize("call_name", SERVICE_CALLS)
+def test_service_queries_do_not_scan(service_context, call_name):
+    """
+    Testuje, czy zapytania wykonywane przez metody serwisów korzystają z indeksów zamiast pełnego skanu tabeli.
+
+    Instrukcje są przechwytywane podczas wywołania metody (`set_trace_callback`), więc test sprawdza
+    rzeczywisty SQL serwisu. Pierwsze wywołanie wypełnia pamięć podręczną (katalog schematu, tabele
+    słownikowe, uprawnienia, sesja) - sprawdzane są instrukcje drugiego wywołania.
+    """
+    def call():
+        return SERVICE_CALLS[call_name](service_context)
+
+    db_controller = service_context.controller.db_controller
+    call()
+    statements = capture_statements(db_controller, call)
+    assert statements, f"{call_name} nie wykonał żadnego zapytania"
+
+    manager = IndexManager(service_context.plan_database)
+    for statement in statements:
+        plan = manager.explain_query_plan(statement)
+        assert find_full_scans(plan) == [], f"{call_name} wykonuje pełny skan tabeli: {plan}\n{statement}"
+
+
+def test_find_full_scans_detects_scan():
+    """
+    Testuje wykrywanie pełnego skanu w planie zapytania.
+    """
+    plan = [
+        "SCAN appointments", "SEARCH rooms USING INTEGER PRIMARY KEY (rowid=?)", "SCAN CONSTANT ROW",
+        "SCAN json_each VIRTUAL TABLE INDEX 1:",
+    ]
+
+    assert find_full_scans(plan) == ["SCAN appointments"]
@@ -0,0 +1,137 @@
+# test_database_permission_engine.py
+
+import os
+import pytest
+from controllers.database_controller import DatabaseController
+from database.permission_engine import SCOPE_ALL, SCOPE_ASSIGNED, SCOPE_NONE, permission_mask
+from models.permissions import Permissions
+from models.role_permissions import RolePermissions
+from services.session_service import UserSession
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "database", "schema_projekt_inz_used_v2.sql"
+)
+
+
+@pytest.fixture(name="setup_database")
+def setup_database_fixture():
+    """
+    Tworzy testową bazę danych w pamięci ze schematem v2 (bez tabel uprawnień).
+    """
+    db_controller = DatabaseController()
+    db_controller.connect_to_database()
+    with open(SCHEMA_PATH, encoding="utf-8") as schema_file:
+        db_controller.connection.executescript(schema_file.read())
+
+    yield db_controller
+
+    db_controller.close_connection()
+
+
+@pytest.fixture(name="setup_permissions")
+def setup_permissions_fixture(setup_database):
+    """
+    Tworzy tabele uprawnień i przypisuje roli 4 dostęp do przypisanych pacjentów i ich diagnoz.
+    """
+    Permissions(setup_database).create_table()
+    RolePermissions(setup_database).create_table()
+    setup_database.connection.executescript("""
+        INSERT INTO roles (role_id, role_name) VALUES (1, 'Administrator'), (4, 'Psycholog kliniczny');
+        INSERT INTO system_permissions (permission_id, permission_name)
+        VALUES (1, 'przegladaj_przypisanych_pacjentow'), (2, 'przegladaj_diagnozy'), (3, 'zarzadzaj_pracownikami');
+        INSERT INTO role_permissions (role_id, permission_id) VALUES (4, 1), (4, 2);
+    """)
+    return setup_database
+
+
+def make_session(role_id, employee_id=7):
+    """
+    Tworzy kontekst sesji użytkownika z podaną rolą.
+    """
+    return UserSession(1, "test.user", employee_id, role_id, "Rola testowa")
+
+
+# +-+-+-+- Testy silnika uprawnień +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_default_permissions_without_tables(setup_database):
+    """
+    Testuje domyślne uprawnienia ról, gdy tabela `role_permissions` nie istnieje.
+    """
+    engine = setup_database.permission_engine
+
+    assert engine.row_scope(make_session(1), "view", "patients") == SCOPE_ALL
+    assert engine.row_scope(make_session(4), "view", "patients") == SCOPE_ASSIGNED
+    assert engine.row_scope(make_session(11), "view", "patients") == SCOPE_NONE
+    assert engine.can(make_session(3), "edit", "prescriptions")
+    assert not engine.can(make_session(4), "view", "prescriptions")
+    assert not engine.can(make_session(2), "view", "users")
+    assert engine.can(make_session(9), "view", "users")
+
+
+def test_permissions_loaded_from_role_permissions(setup_permissions):
+    """
+    Testuje kompilację uprawnień z tabeli `role_permissions` do maski bitowej i zakresów.
+    """
+    engine = setup_permissions.permission_engine
+
+    assert engine.get_role_mask(4) == permission_mask("przegladaj_przypisanych_pacjentow", "przegladaj_diagnozy")
+    assert engine.row_scope(make_session(4), "view", "diagnoses") == SCOPE_ASSIGNED
+    assert not engine.can(make_session(4), "edit", "diagnoses")
+    assert not engine.can(make_session(4), "edit", "patients")
+    # Role bez wpisów w tabeli otrzymują uprawnienia domyślne, pozostałe role - brak uprawnień
+    assert engine.row_scope(make_session(1), "view", "patients") == SCOPE_ALL
+    assert engine.can(make_session(3), "edit", "prescriptions")
+    assert engine.row_scope(make_session(11), "view", "patients") == SCOPE_NONE
+
+
+def test_roles_with_access(setup_permissions):
+    """
+    Testuje wyznaczenie ról z dostępem do zasobu (tabela `role_permissions` i uprawnienia domyślne).
+    """
+    engine = setup_permissions.permission_engine
+
+    assert engine.get_roles_with_access("edit", "prescriptions") == [1, 2, 3, 9, 10]
+    # Wystawianie recept - tylko rola lekarza prowadzącego, bez ról zarządzających receptami placówki
+    assert engine.get_roles_with_access("issue", "prescriptions") == [3]
+    assert 4 in engine.get_roles_with_access("view", "diagnoses")
+    assert 4 not in engine.get_roles_with_access("edit", "diagnoses")
+    with pytest.raises(KeyError):
+        engine.get_roles_with_access("delete", "rooms")
+
+
+def test_role_permission_change_invalidates_engine(setup_permissions):
+    """
+    Testuje, czy zmiana uprawnień roli przez model jest widoczna bez ponownego uruchomienia.
+    """
+    engine = setup_permissions.permission_engine
+    assert not engine.can(make_session(4), "edit", "employees")
+
+    RolePermissions(setup_permissions).add_role_permission_by_ids(4, 3)
+
+    assert engine.can(make_session(4), "edit", "employees")
+
+
+def test_scope_condition(setup_database):
+    """
+    Testuje zamianę zakresu wierszy na warunek SQL.
+    """
+    engine = setup_database.permission_engine
+
+    assert engine.scope_condition(make_session(1), "view", "appointments", "ap.fk_employee_id") == ("1", [])
+    assert engine.scope_condition(make_session(5), "view", "appointments", "ap.fk_employee_id") == (
+        "ap.fk_employee_id = ?", [7]
+    )
+    assert engine.scope_condition(make_session(5, None), "view", "appointments", "ap.fk_employee_id") == ("0", [])
+    assert engine.scope_condition(None, "view", "appointments", "ap.fk_employee_id") == ("0", [])
+
+
+def test_unknown_rule_raises_key_error(setup_database):
+    """
+    Testuje błąd dla niezdefiniowanej reguły dostępu.
+    """
+    with pytest.raises(KeyError):
+        setup_database.permission_engine.can(make_session(1), "delete", "rooms")
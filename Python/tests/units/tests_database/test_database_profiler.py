@@ -0,0 +1,148 @@
+# test_database_profiler.py
+
+import csv
+import json
+import os
+import sqlite3
+import pytest
+from config import Config
+from database.profiler import NO_SERVICE, NO_SLOT, QueryProfiler, normalize_sql
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+
+def fake_service_get_patient(connection, patient_id):
+    """
+    Metoda "serwisu" wykonująca jedno zapytanie.
+    """
+    return connection.execute("SELECT name FROM patients WHERE patient_id = ?", (patient_id,)).fetchone()
+
+
+def fake_slot_load_patients(connection, count):
+    """
+    "Slot" pobierający listę identyfikatorów, a następnie każdego pacjenta osobno (wzorzec N+1).
+    """
+    ids = [row[0] for row in connection.execute("SELECT patient_id FROM patients LIMIT ?", (count,)).fetchall()]
+    return [fake_service_get_patient(connection, patient_id) for patient_id in ids]
+
+
+def count_patients(connection):
+    """
+    Funkcja wykonująca zapytanie poza slotem i serwisem.
+    """
+    return connection.execute("SELECT COUNT(*) FROM patients").fetchone()[0]
+
+
+@pytest.fixture(name="setup_profiler")
+def setup_profiler_fixture():
+    """
+    Tworzy połączenie w pamięci z tabelą pacjentów i profiler rozpoznający funkcje testowe jako slot i serwis.
+    """
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE patients (patient_id INTEGER PRIMARY KEY, name TEXT)")
+    connection.executemany("INSERT INTO patients (name) VALUES (?)", [(f"Pacjent {i}",) for i in range(5)])
+
+    settings = dict(Config.get_profiling_settings(), summary_interval=0)
+    profiler = QueryProfiler(
+        settings,
+        slot_filter=lambda code: code is fake_slot_load_patients.__code__,
+        service_filter=lambda code: code is fake_service_get_patient.__code__,
+    )
+    profiler.attach(connection)
+
+    yield connection, profiler
+
+    profiler.detach(connection)
+    connection.close()
+
+
+# +-+-+-+- Testy ustawień +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_profiling_settings(monkeypatch):
+    """
+    Testuje domyślne wyłączenie profilowania, włączenie zmienną APP_PROFILE i nadpisanie parametrów.
+    """
+    monkeypatch.delenv("APP_PROFILE", raising=False)
+    assert Config.get_profiling_settings()["enabled"] is False
+
+    monkeypatch.setenv("APP_PROFILE", "1")
+    monkeypatch.setenv("APP_PROFILE_TOP", "3")
+    settings = Config.get_profiling_settings()
+    assert settings["enabled"] is True
+    assert settings["top_n"] == 3
+
+    monkeypatch.setenv("APP_PROFILE_INTERVAL", "co chwilę")
+    with pytest.raises(ValueError):
+        Config.get_profiling_settings()
+
+
+def test_normalize_sql():
+    """
+    Testuje zamianę literałów na `?` i łączenie białych znaków.
+    """
+    assert normalize_sql("SELECT *\n  FROM patients WHERE id = 15 AND name = 'O''Brien'") == (
+        "SELECT * FROM patients WHERE id = ? AND name = ?"
+    )
+
+
+# +-+-+-+- Testy profilera +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_slot_invocations_and_repeated_statements(setup_profiler):
+    """
+    Testuje liczenie wywołań slotu, zapytań na wywołanie i powtórzeń jednej instrukcji (N+1).
+    """
+    connection, profiler = setup_profiler
+
+    fake_slot_load_patients(connection, 4)
+    fake_slot_load_patients(connection, 2)
+
+    slots = profiler.get_slot_report()
+    assert len(slots) == 1
+    slot = slots[0]
+    assert slot["slot"].endswith("fake_slot_load_patients")
+    assert slot["calls"] == 2
+    assert slot["queries"] == 8
+    assert slot["max_queries"] == 5
+    assert slot["max_repeated_count"] == 4
+    assert slot["max_repeated_statement"] == "SELECT name FROM patients WHERE patient_id = ?"
+
+
+def test_statement_attribution(setup_profiler):
+    """
+    Testuje przypisanie instrukcji do metody serwisu i slotu oraz instrukcji wykonanych poza slotem.
+    """
+    connection, profiler = setup_profiler
+
+    fake_slot_load_patients(connection, 3)
+    count_patients(connection)
+
+    statements = {row["statement"]: row for row in profiler.get_statement_report()}
+    by_id = statements["SELECT name FROM patients WHERE patient_id = ?"]
+    assert by_id["count"] == 3
+    assert by_id["service"].endswith("fake_service_get_patient")
+    assert by_id["slot"].endswith("fake_slot_load_patients")
+
+    outside = statements["SELECT COUNT(*) FROM patients"]
+    assert (outside["service"], outside["slot"]) == (NO_SERVICE, NO_SLOT)
+
+
+def test_write_report(setup_profiler, tmp_path):
+    """
+    Testuje zapis raportu JSON i plików CSV.
+    """
+    connection, profiler = setup_profiler
+    fake_slot_load_patients(connection, 2)
+
+    paths = profiler.write_report(str(tmp_path))
+
+    with open(paths["json"], encoding="utf-8") as file:
+        report = json.load(file)
+    assert report["slots"][0]["calls"] == 1
+    assert len(report["statements"]) == 2
+    with open(paths["slots_csv"], encoding="utf-8", newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert rows[0]["queries"] == "3"
+    assert profiler.get_top_slots(1)[0]["slot"] == report["slots"][0]["slot"]
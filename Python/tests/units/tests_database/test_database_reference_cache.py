@@ -0,0 +1,156 @@
+# test_database_reference_cache.py
+
+import os
+from types import SimpleNamespace
+import pytest
+from controllers.database_controller import DatabaseController
+from models.room_types import RoomTypes
+from models.specialties import Specialties
+from services.employee_service import EmployeeService
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "database", "schema_projekt_inz_used_v2.sql"
+)
+
+
+@pytest.fixture(name="setup_database")
+def setup_database_fixture(clone_database):
+    """
+    Tworzy bazę z pełnym schematem (szablon "empty") oraz kilkoma rekordami tabel słownikowych.
+    """
+    db_controller = clone_database("empty")
+    db_controller.connection.executescript("""
+        INSERT INTO specialties (specialty_id, specialty_name, is_active) VALUES (1, 'Psychiatria dorosłych', 1);
+        INSERT INTO services (service_id, service_type, duration_minutes, service_price, is_active)
+        VALUES (1, 'Konsultacja psychiatryczna', 60, 250, 1);
+        INSERT INTO room_types (room_type_id, room_type) VALUES (1, 'Gabinet');
+        INSERT INTO rooms (room_id, room_number, floor, fk_room_type_id) VALUES (1, 10, 1, 1);
+        INSERT INTO employees (employee_id, first_name, last_name, email, phone, profession, is_medical_staff)
+        VALUES (1, 'Anna', 'Lekarz', 'anna@example.com', '500000002', 'Psychiatra', 1);
+        INSERT INTO employee_services (employee_id, service_id) VALUES (1, 1);
+    """)
+
+    yield db_controller
+
+
+# +-+-+-+- Testy pamięci podręcznej tabel słownikowych +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_tables_are_read_once(setup_database):
+    """
+    Testuje, czy tabela słownikowa jest odczytywana z bazy tylko przy pierwszym użyciu.
+    """
+    reference_cache = setup_database.reference_cache
+    statements = []
+    setup_database.connection.set_trace_callback(statements.append)
+
+    assert reference_cache.get_name("services", 1) == "Konsultacja psychiatryczna"
+    assert reference_cache.get_name("employees", 1) == "Anna Lekarz"
+    assert reference_cache.get_row("rooms", 1)["room_number"] == 10
+    assert reference_cache.get_name("services", 2, "Nieznana usługa") == "Nieznana usługa"
+    assert reference_cache.get_names("services") == {1: "Konsultacja psychiatryczna"}
+
+    setup_database.connection.set_trace_callback(None)
+    assert [statement for statement in statements if statement.startswith("SELECT * FROM")] == [
+        "SELECT * FROM services ORDER BY service_id",
+        "SELECT * FROM employees ORDER BY employee_id",
+        "SELECT * FROM rooms ORDER BY room_id",
+    ]
+    assert reference_cache.get_stats()["tables"] == ["employees", "rooms", "services"]
+
+    with pytest.raises(ValueError):
+        reference_cache.get_rows("patients")
+
+
+def test_model_writes_invalidate_tables(setup_database):
+    """
+    Testuje unieważnianie tabel przez metody modeli dodające, zmieniające i usuwające rekordy.
+    """
+    reference_cache = setup_database.reference_cache
+    specialties = Specialties(setup_database)
+    assert reference_cache.get_names("specialties") == {1: "Psychiatria dorosłych"}
+    version = reference_cache.get_version("specialties")
+
+    specialties.create_new_record("Psychoterapia")
+    specialties.update_record(1, {"specialty_name": "Psychiatria"})
+
+    assert reference_cache.get_version("specialties") == version + 2
+    assert reference_cache.get_names("specialties") == {1: "Psychiatria", 2: "Psychoterapia"}
+
+    # Usunięcie typu pokoju zmienia też wiersze `rooms` (ON DELETE SET NULL)
+    assert reference_cache.get_row("rooms", 1)["fk_room_type_id"] == 1
+    RoomTypes(setup_database).delete_record(1)
+    assert reference_cache.get_names("room_types") == {}
+    assert reference_cache.get_row("rooms", 1)["fk_room_type_id"] is None
+
+
+def test_unit_of_work_commit_invalidates_tables(tmp_path, monkeypatch):
+    """
+    Testuje, czy tabela wczytana w trakcie jednostki pracy (pula odczytu - dane sprzed zapisu)
+    jest unieważniana po jej zatwierdzeniu, a po wycofaniu nie zawiera cofniętych zmian.
+    """
+    monkeypatch.setenv("DB_JOURNAL_MODE", "WAL")
+    monkeypatch.setenv("DB_READ_POOL_SIZE", "2")
+    db_controller = DatabaseController()
+    db_controller.database_path = str(tmp_path / "reference.db")
+    db_controller.connect_to_database()
+    with open(SCHEMA_PATH, encoding="utf-8") as schema_file:
+        db_controller.connection.executescript(schema_file.read())
+    db_controller.connection.execute("INSERT INTO specialties (specialty_id, specialty_name) VALUES (1, 'Psychiatria')")
+    db_controller.connection.commit()
+    try:
+        reference_cache = db_controller.reference_cache
+        specialties = Specialties(db_controller)
+
+        with db_controller.unit_of_work():
+            specialties.create_new_record("Psychoterapia")
+            assert reference_cache.get_names("specialties") == {1: "Psychiatria"}  # Zapis niezatwierdzony
+        assert reference_cache.get_names("specialties") == {1: "Psychiatria", 2: "Psychoterapia"}
+
+        with pytest.raises(ValueError):
+            with db_controller.unit_of_work():
+                specialties.update_record(2, {"specialty_name": "Seksuologia"})
+                raise ValueError("Przerwanie jednostki pracy")
+        assert reference_cache.get_names("specialties") == {1: "Psychiatria", 2: "Psychoterapia"}
+
+        # Poza jednostką pracy unieważnienie działa od razu
+        specialties.update_record(2, {"specialty_name": "Seksuologia"})
+        assert reference_cache.get_name("specialties", 2) == "Seksuologia"
+    finally:
+        db_controller.close_connection()
+
+
+def test_schema_change_invalidates_tables(setup_database):
+    """
+    Testuje unieważnienie wszystkich tabel po zmianie schematu (DDL).
+    """
+    reference_cache = setup_database.reference_cache
+    assert reference_cache.get_names("form_types") == {}
+
+    setup_database.connection.execute("DROP TABLE patient_forms")
+    setup_database.connection.execute("DROP TABLE form_types")
+    assert reference_cache.get_rows("form_types") == {}  # Brak tabeli
+
+    setup_database.connection.execute("CREATE TABLE form_types (form_type_id INTEGER PRIMARY KEY, form_name TEXT)")
+    setup_database.connection.execute("INSERT INTO form_types VALUES (1, 'Ankieta wstępna')")
+    assert reference_cache.get_names("form_types") == {1: "Ankieta wstępna"}
+
+
+def test_service_resolves_names_from_cache(setup_database):
+    """
+    Testuje formatowanie usług pracowników bez odczytu tabel `employees` i `services` po ich wczytaniu.
+    """
+    employee_service = EmployeeService(SimpleNamespace(db_controller=setup_database))
+    employee_service.get_formatted_employee_services()
+    statements = []
+    setup_database.connection.set_trace_callback(statements.append)
+
+    formatted = employee_service.get_formatted_employee_services()
+
+    setup_database.connection.set_trace_callback(None)
+    assert formatted[0]["first_name"] == "Anna"
+    assert formatted[0]["service_type"] == "Konsultacja psychiatryczna"
+    assert statements == ["SELECT * FROM employee_services"]
@@ -0,0 +1,220 @@
+# test_database_room_availability.py
+
+import os
+import sqlite3
+import pytest
+from controllers.database_controller import DatabaseController
+from database.room_availability import CONFLICTS_QUERY, RoomSchedule, parse_time_range
+from database.time_columns import TimeColumnsManager
+from models.room_reservations import RoomReservations
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+
+@pytest.fixture(name="setup_database")
+def setup_database_fixture():
+    """
+    Tworzy testową bazę danych w pamięci z pokojami dwóch typów i kilkoma rezerwacjami
+    (z kolumnami start_ts / end_ts i indeksem (fk_room_id, start_ts)).
+    """
+    db_controller = DatabaseController()
+    db_controller.connect_to_database()
+    db_controller.connection.executescript("""
+        CREATE TABLE rooms (
+            room_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            room_number INTEGER NOT NULL UNIQUE,
+            floor INTEGER NOT NULL,
+            fk_room_type_id INTEGER
+        );
+        CREATE TABLE room_reservations (
+            reservation_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            fk_room_id INTEGER NOT NULL,
+            reservation_date TEXT NOT NULL,
+            reservation_time TEXT NOT NULL
+        );
+        INSERT INTO rooms (room_number, floor, fk_room_type_id) VALUES (10, 1, 1), (11, 1, 1), (20, 2, 2);
+        INSERT INTO room_reservations (fk_room_id, reservation_date, reservation_time) VALUES
+            (1, '2030-01-07', '08:00-10:00'),
+            (1, '2030-01-07', '10:30-12:00'),
+            (2, '2030-01-07', '08:00-09:00'),
+            (2, '2030-01-07', '09:00-11:00'),
+            (1, '2030-01-08', '08:00-20:00');
+    """)
+    TimeColumnsManager(db_controller).apply()
+    db_controller.connection.execute(
+        "CREATE INDEX idx_room_reservations_room_start_ts ON room_reservations (fk_room_id, start_ts)"
+    )
+
+    yield db_controller
+
+    db_controller.close_connection()
+
+
+# +-+-+-+- Testy przedziałów +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_parse_time_range():
+    """
+    Testuje zamianę przedziału HH:MM-HH:MM na minuty i odrzucenie nieprawidłowych wartości.
+    """
+    assert parse_time_range("10:00-11:30") == (600, 690)
+
+    with pytest.raises(ValueError):
+        parse_time_range("11:00-10:00")
+    with pytest.raises(ValueError):
+        parse_time_range("10-11")
+
+
+def test_schedule_detects_overlapping_ranges():
+    """
+    Testuje wykrywanie przedziałów częściowo nachodzących oraz dopuszczenie przedziałów przylegających.
+    """
+    schedule = RoomSchedule([(600, 660, 1), (720, 780, 2), (540, 900, 3)])
+
+    assert schedule.find_conflicts(630, 690) == [3, 1]
+    assert RoomSchedule([(600, 660, 1)]).find_conflicts(660, 720) == []
+    assert RoomSchedule([(600, 660, 1)]).find_conflicts(540, 600) == []
+
+
+def test_schedule_skips_reservations_ending_before_range():
+    """
+    Testuje, czy sprawdzenie kolizji nie przegląda rezerwacji kończących się przed przedziałem (`max_ends`).
+    """
+    class CountingList(list):
+        reads = 0
+
+        def __getitem__(self, index):
+            CountingList.reads += 1
+            return super().__getitem__(index)
+
+    schedule = RoomSchedule([(minute, minute + 10, minute) for minute in range(0, 1000, 10)])
+    schedule.ends = CountingList(schedule.ends)
+
+    assert schedule.find_conflicts(975, 985) == [970, 980]
+    assert CountingList.reads == 2
+
+
+def test_schedule_free_slots():
+    """
+    Testuje wyszukiwanie wolnych terminów po scaleniu nachodzących rezerwacji.
+    """
+    schedule = RoomSchedule([(480, 600, 1), (570, 630, 2), (660, 720, 3)])
+
+    assert schedule.free_slots(480, 1200) == [(630, 660), (720, 1200)]
+    assert schedule.first_free_start(30, 480, 1200) == 630
+    assert schedule.first_free_start(45, 480, 1200) == 720
+    assert schedule.first_free_start(60, 1150, 1200) is None
+
+
+# +-+-+-+- Testy indeksu dostępności +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_index_conflicts_for_room_and_date(setup_database):
+    """
+    Testuje sprawdzanie kolizji dla pary (pokój, dzień) i pomijanie aktualizowanej rezerwacji.
+    """
+    availability = setup_database.room_availability
+
+    assert availability.get_conflicts(1, "2030-01-07", 570, 660) == [1, 2]
+    assert availability.get_conflicts(1, "2030-01-07", 570, 660, exclude_reservation_id=2) == [1]
+    assert availability.is_available(1, "2030-01-07", 600, 630)
+    assert availability.is_available(3, "2030-01-07", 480, 1200)
+
+
+def test_find_first_free_room(setup_database):
+    """
+    Testuje wyszukanie pokoju danego typu z najwcześniejszym wolnym terminem.
+    """
+    availability = setup_database.room_availability
+
+    free_room = availability.find_first_free_room(1, "2030-01-07", 60)
+    assert free_room["room_number"] == 11
+    assert free_room["reservation_time"] == "11:00-12:00"
+
+    assert availability.find_first_free_room(1, "2030-01-07", 30)["room_number"] == 10
+    assert availability.find_first_free_room(1, "2030-01-08", 60, earliest=1140)["room_number"] == 11
+    assert availability.find_first_free_room(2, "2030-01-07", 13 * 60) is None
+
+
+def test_index_invalidated_after_reservation_change(setup_database):
+    """
+    Testuje unieważnienie indeksu po dodaniu rezerwacji przez model.
+    """
+    db_controller = setup_database
+    availability = db_controller.room_availability
+    assert availability.is_available(3, "2030-01-07", 600, 660)
+
+    RoomReservations(db_controller).add_reservation(3, "2030-01-07", "10:30-11:30")
+
+    assert not availability.is_available(3, "2030-01-07", 600, 660)
+
+
+def test_conflicts_are_read_from_database(setup_database):
+    """
+    Testuje, czy sprawdzenie kolizji widzi rezerwację zapisaną z pominięciem modelu (bez unieważnienia indeksu)
+    i korzysta z indeksu (fk_room_id, start_ts).
+    """
+    db_controller = setup_database
+    availability = db_controller.room_availability
+    assert availability.get_free_slots(3, "2030-01-07")[0] == (480, 1200)
+
+    db_controller.connection.execute(
+        "INSERT INTO room_reservations (fk_room_id, reservation_date, reservation_time) VALUES (3, '2030-01-07', '10:00-11:00')"
+    )
+
+    assert availability.get_conflicts(3, "2030-01-07", 630, 690) == [6]
+    plan = " ".join(row[3] for row in db_controller.connection.execute(f"EXPLAIN QUERY PLAN {CONFLICTS_QUERY}", {
+        "reservation_date": "2030-01-07", "room_id": 3, "start": 630, "end": 690, "exclude_reservation_id": None,
+    }))
+    assert "idx_room_reservations_room_start_ts" in plan
+
+
+def test_add_reservation_checks_conflicts_in_transaction(setup_database):
+    """
+    Testuje odrzucenie kolidującej rezerwacji w transakcji zapisu oraz aktualizację z pominięciem własnej rezerwacji.
+    """
+    db_controller = setup_database
+    model = RoomReservations(db_controller)
+
+    with pytest.raises(ValueError, match="rezerwacje: 2"):
+        model.add_reservation(1, "2030-01-07", "11:30-12:30", check_conflicts=True)
+    count = db_controller.connection.execute("SELECT COUNT(*) FROM room_reservations").fetchone()[0]
+    assert count == 5
+
+    model.update_reservation(2, reservation_time="10:00-12:30", check_conflicts=False)
+    with pytest.raises(ValueError, match="rezerwacje: 1"):
+        model.update_reservation(2, reservation_time="09:30-12:30", check_conflicts=True)
+    model.update_reservation(2, reservation_time="10:15-12:00", check_conflicts=True)
+    assert model.add_reservation(1, "2030-01-07", "12:00-13:00", check_conflicts=True) == 6
+
+
+def test_index_invalidated_after_external_write(tmp_path):
+    """
+    Testuje unieważnienie wczytanych dni po zapisie innego połączenia (PRAGMA data_version).
+    """
+    db_controller = DatabaseController()
+    db_controller.database_path = str(tmp_path / "rooms.db")
+    db_controller.connect_to_database()
+    db_controller.connection.executescript("""
+        CREATE TABLE room_reservations (
+            reservation_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            fk_room_id INTEGER NOT NULL,
+            reservation_date TEXT NOT NULL,
+            reservation_time TEXT NOT NULL
+        );
+    """)
+    try:
+        availability = db_controller.room_availability
+        assert availability.get_free_slots(1, "2030-01-07") == [(480, 1200)]
+
+        external = sqlite3.connect(db_controller.database_path)
+        with external:
+            external.execute(
+                "INSERT INTO room_reservations (fk_room_id, reservation_date, reservation_time) VALUES (1, '2030-01-07', '10:00-11:00')"
+            )
+        external.close()
+
+        assert availability.get_free_slots(1, "2030-01-07") == [(480, 600), (660, 1200)]
+    finally:
+        db_controller.close_connection()
@@ -0,0 +1,117 @@
+# test_database_schema_catalog.py
+
+import os
+import pytest
+from controllers.database_controller import DatabaseController
+from database.schema_catalog import extract_check_constraints
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "database", "schema_projekt_inz_used_v2.sql"
+)
+
+
+@pytest.fixture(name="setup_database")
+def setup_database_fixture():
+    """
+    Tworzy testową bazę danych w pamięci na podstawie schema_projekt_inz_used_v2.sql.
+    """
+    db_controller = DatabaseController()
+    db_controller.connect_to_database()
+    with open(SCHEMA_PATH, encoding="utf-8") as schema_file:
+        db_controller.connection.executescript(schema_file.read())
+    db_controller.schema_catalog.load()
+
+    yield db_controller
+
+    db_controller.close_connection()
+
+
+# +-+-+-+- Testy metadanych +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_catalog_columns_and_types(setup_database):
+    """
+    Testuje listę kolumn i typy kolumn tabeli.
+    """
+    catalog = setup_database.schema_catalog
+
+    assert catalog.get_columns("rooms") == ["room_id", "room_number", "floor", "fk_room_type_id"]
+    assert catalog.get_column_types("rooms")["room_number"] == "INTEGER"
+    assert catalog.get_columns("nieistniejaca_tabela") == []
+    assert catalog.has_table("appointments")
+
+
+def test_catalog_foreign_key_graph(setup_database):
+    """
+    Testuje klucze obce i graf zależności między tabelami.
+    """
+    catalog = setup_database.schema_catalog
+
+    foreign_keys = {fk["column"]: fk["ref_table"] for fk in catalog.get_foreign_keys("meeting_participants")}
+    assert foreign_keys == {"fk_meeting_id": "internal_meetings", "fk_employee_id": "employees"}
+    assert "meeting_participants" in catalog.get_referencing_tables("employees")
+    assert catalog.get_foreign_key_graph()["rooms"] == ["room_types"]
+
+
+def test_catalog_check_constraints(setup_database):
+    """
+    Testuje odczyt ograniczeń CHECK tabeli.
+    """
+    checks = setup_database.schema_catalog.get_check_constraints("meeting_participants")
+
+    assert len(checks) == 2
+    assert checks[0].startswith("participant_role GLOB")
+
+
+def test_extract_check_constraints_skips_comments():
+    """
+    Testuje pominięcie słowa CHECK w komentarzach i nawiasów w literałach tekstowych.
+    """
+    create_sql = """
+    CREATE TABLE t (
+        a TEXT CHECK (a IN ('(', ')')), -- check (nie jest ograniczeniem)
+        b INTEGER,
+        CHECK (b > 0 AND (b < 10))
+    )
+    """
+
+    assert extract_check_constraints(create_sql) == ["a IN ('(', ')')", "b > 0 AND (b < 10)"]
+
+
+# +-+-+-+- Testy unieważniania katalogu +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_catalog_served_from_memory(setup_database):
+    """
+    Testuje, czy kolejne odczyty katalogu nie wykonują zapytań do SQLite.
+    """
+    db_controller = setup_database
+    statements = []
+    db_controller.connection.set_trace_callback(statements.append)
+
+    for _ in range(3):
+        db_controller.schema_catalog.get_columns("rooms")
+        db_controller.schema_catalog.get_foreign_keys("appointments")
+
+    db_controller.connection.set_trace_callback(None)
+    assert statements == []
+
+
+def test_catalog_invalidated_by_ddl_only(setup_database):
+    """
+    Testuje, czy katalog jest wczytywany ponownie tylko po instrukcji DDL.
+    """
+    db_controller = setup_database
+    catalog = db_controller.schema_catalog
+    load_count = catalog.load_count
+
+    db_controller.connection.execute("INSERT INTO room_types (room_type) VALUES ('Gabinet')")
+    assert catalog.get_columns("room_types") == ["room_type_id", "room_type"]
+    assert catalog.load_count == load_count
+
+    db_controller.connection.execute("ALTER TABLE room_types ADD COLUMN description TEXT")
+    assert catalog.get_columns("room_types") == ["room_type_id", "room_type", "description"]
+    assert catalog.load_count == load_count + 1
@@ -0,0 +1,98 @@
+# test_database_schema_migrations.py
+
+import os
+import pytest
+from controllers.database_controller import DatabaseController
+from controllers.schema_initializer import SCHEMA_MIGRATIONS, SCHEMA_VERSION, get_schema_version, migrate_schema
+from startup_timer import StartupTimer
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "database", "schema_projekt_inz_used_v2.sql"
+)
+
+
+@pytest.fixture(name="setup_database")
+def setup_database_fixture():
+    """
+    Tworzy testową bazę danych ze schematem v2 bez numeru wersji (PRAGMA user_version = 0).
+    """
+    db_controller = DatabaseController()
+    db_controller.connect_to_database()
+    with open(SCHEMA_PATH, encoding="utf-8") as schema_file:
+        db_controller.connection.executescript(schema_file.read())
+
+    yield db_controller
+
+    db_controller.close_connection()
+
+
+# +-+-+-+- Testy migracji schematu +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_migrate_new_database(setup_database):
+    """
+    Testuje wykonanie wszystkich kroków migracji i zapis wersji w PRAGMA user_version.
+    """
+    db_controller = setup_database
+    assert get_schema_version(db_controller) == 0
+
+    report = migrate_schema(db_controller)
+
+    assert report["from_version"] == 0
+    assert report["version"] == SCHEMA_VERSION
+    assert [step["version"] for step in report["applied"]] == [version for version, _, _ in SCHEMA_MIGRATIONS]
+    assert get_schema_version(db_controller) == SCHEMA_VERSION
+    assert db_controller.table_exists("role_permissions")
+
+
+def test_current_database_skips_ddl(setup_database):
+    """
+    Testuje, czy aktualna baza nie wykonuje żadnych sprawdzeń tabel ani instrukcji DDL.
+    """
+    db_controller = setup_database
+    migrate_schema(db_controller)
+    statements = []
+    db_controller.connection.set_trace_callback(statements.append)
+
+    report = migrate_schema(db_controller)
+
+    db_controller.connection.set_trace_callback(None)
+    assert report["applied"] == []
+    assert statements == ["PRAGMA user_version"]
+
+
+def test_partial_and_newer_versions(setup_database):
+    """
+    Testuje wykonanie tylko brakujących kroków oraz pominięcie migracji dla bazy z nowszym schematem.
+    """
+    db_controller = setup_database
+    db_controller.connection.execute("PRAGMA user_version = 2")
+
+    report = migrate_schema(db_controller)
+    assert [step["version"] for step in report["applied"]] == [version for version, _, _ in SCHEMA_MIGRATIONS if version > 2]
+
+    db_controller.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 5}")
+    report = migrate_schema(db_controller)
+    assert report["applied"] == []
+    assert report["version"] == SCHEMA_VERSION + 5
+
+
+# +-+-+-+- Testy pomiaru czasu uruchamiania +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_startup_timer():
+    """
+    Testuje oznaczanie etapów uruchamiania i raport z udziałem etapów w całkowitym czasie.
+    """
+    timer = StartupTimer()
+    timer.mark("Importy modułów")
+    timer.mark("Ładowanie QML")
+
+    report = timer.get_report()
+
+    assert [phase["phase"] for phase in report["phases"]] == ["Importy modułów", "Ładowanie QML"]
+    assert report["total_ms"] == pytest.approx(sum(phase["ms"] for phase in report["phases"]))
+    assert sum(phase["share"] for phase in report["phases"]) == pytest.approx(1.0)
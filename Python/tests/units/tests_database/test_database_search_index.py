@@ -0,0 +1,108 @@
+# test_database_search_index.py
+
+import os
+import pytest
+from controllers.database_controller import DatabaseController
+from database.search_index import SEARCH_INDEXES, SearchIndexManager, build_match_query
+from models.patients import Patients
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+
+@pytest.fixture(name="setup_database")
+def setup_database_fixture():
+    """
+    Tworzy testową bazę danych z tabelą pacjentów i dwoma pacjentami dodanymi przed utworzeniem indeksu.
+    """
+    db_controller = DatabaseController()
+    db_controller.connect_to_database()
+    patients = Patients(db_controller)
+    patients.create_table()
+    patients.add_patient("Jan", "Kowalski", "90010100001", "600000001", "jan@example.com", "Łódź, ul. Lipowa 1", "1990-01-01")
+    patients.add_patient("Anna", "Nowak", "85051500002", "600000002", "anna@example.com", "Kraków", "1985-05-15")
+
+    yield patients
+
+    db_controller.close_connection()
+
+
+def search(db_controller, text):
+    """
+    Zwraca posortowane ID pacjentów pasujących do tekstu w indeksie `patients_fts`.
+    """
+    cursor = db_controller.connection.execute(
+        "SELECT rowid FROM patients_fts WHERE patients_fts MATCH ? ORDER BY rowid", (build_match_query(text),)
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+
+# +-+-+-+- Testy zapytań MATCH +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_build_match_query():
+    """
+    Testuje zamianę tekstu na zapytanie prefiksowe oraz pomijanie składni FTS5.
+    """
+    assert build_match_query("Kowal 9001") == '"kowal"* "9001"*'
+    assert build_match_query('jan" OR NEAR(x') == '"jan"* "or"* "near"* "x"*'
+    assert build_match_query("  %* ") is None
+    assert build_match_query(None) is None
+
+
+# +-+-+-+- Testy indeksu pełnotekstowego +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_apply_creates_index_for_existing_rows(setup_database):
+    """
+    Testuje utworzenie indeksu tylko dla istniejących tabel i zaindeksowanie wcześniejszych wierszy.
+    """
+    db_controller = setup_database.db_controller
+
+    report = SearchIndexManager(db_controller).apply()
+
+    assert report["created_tables"] == ["patients_fts"]
+    assert report["rebuilt"] == {"patients_fts": 2}
+    assert sorted(report["skipped"]) == sorted(name for name in SEARCH_INDEXES if name != "patients_fts")
+    assert search(db_controller, "kowal") == [1]
+    assert search(db_controller, "8505") == [2]
+    assert search(db_controller, "krakow") == [2]  # Bez znaków diakrytycznych
+    assert search(db_controller, "łodz") == [1]
+    assert search(db_controller, "owalski") == []  # Tylko prefiksy słów
+
+    assert SearchIndexManager(db_controller).apply()["created_tables"] == []
+
+
+def test_triggers_keep_index_in_sync(setup_database):
+    """
+    Testuje aktualizację indeksu przy dodaniu, zmianie i usunięciu pacjenta.
+    """
+    patients = setup_database
+    db_controller = patients.db_controller
+    SearchIndexManager(db_controller).apply()
+
+    patients.add_patient("Piotr", "Lis", "92020200003", "600000003", "piotr@example.com", "Gdańsk", "1992-02-02")
+    assert search(db_controller, "lis") == [3]
+
+    patients.update_patient(3, address="Sopot")
+    assert search(db_controller, "gdansk") == []
+    assert search(db_controller, "sopot") == [3]
+
+    with db_controller.connection:
+        db_controller.connection.execute("DELETE FROM patients WHERE patient_id = 3")
+    assert search(db_controller, "lis") == []
+    # Sprawdzenie zgodności indeksu z tabelą źródłową (niezgodność zgłasza sqlite3.DatabaseError)
+    db_controller.connection.execute("INSERT INTO patients_fts (patients_fts) VALUES ('integrity-check')")
+
+
+def test_get_patients_page_uses_index(setup_database):
+    """
+    Testuje filtrowanie strony pacjentów przez indeks (prefiksy słów, także adresu).
+    """
+    patients = setup_database
+    SearchIndexManager(patients.db_controller).apply()
+
+    assert [p["patient_id"] for p in patients.get_patients_page(search_text="now")] == [2]
+    assert [p["patient_id"] for p in patients.get_patients_page(search_text="jan 9001")] == [1]
+    assert [p["patient_id"] for p in patients.get_patients_page(search_text="krak")] == [2]
+    assert patients.get_patients_page(search_text="%") == []
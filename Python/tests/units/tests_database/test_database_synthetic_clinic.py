@@ -0,0 +1,174 @@
+# test_database_synthetic_clinic.py
+
+import os
+from datetime import date
+import pytest
+from controllers.database_controller import DatabaseController
+from database.synthetic_clinic import (
+    SyntheticClinicGenerator, get_scale_counts, is_valid_pesel, make_pesel, resolve_scale,
+)
+from models.permissions import Permissions
+from models.role_permissions import RolePermissions
+from tests.benchmarks.benchmark_suite import compare_results, run_service_benchmarks
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "database", "schema_projekt_inz_used_v2.sql"
+)
+
+APPOINTMENTS = 300
+
+
+def create_generated_database(seed=7):
+    """
+    Tworzy bazę w pamięci ze schematem v2 i wypełnia ją danymi syntetycznymi (300 wizyt).
+    """
+    db_controller = DatabaseController()
+    db_controller.connect_to_database()
+    with open(SCHEMA_PATH, encoding="utf-8") as schema_file:
+        db_controller.connection.executescript(schema_file.read())
+    Permissions(db_controller).create_table()
+    RolePermissions(db_controller).create_table()
+
+    generator = SyntheticClinicGenerator(db_controller, seed=seed, password_hash="hash")
+    report = generator.generate(get_scale_counts(APPOINTMENTS))
+    return db_controller, report
+
+
+@pytest.fixture(name="setup_database")
+def setup_database_fixture():
+    """
+    Tworzy testową bazę danych z danymi syntetycznymi.
+    """
+    db_controller, report = create_generated_database()
+
+    yield db_controller, report
+
+    db_controller.close_connection()
+
+
+# +-+-+-+- Testy pomocniczych funkcji generatora +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_make_pesel():
+    """
+    Testuje numery PESEL dla dat z XX i XXI wieku oraz wykrywanie błędnej cyfry kontrolnej.
+    """
+    assert make_pesel(date(1990, 5, 21), 12, female=True) == "90052101248"
+    pesel = make_pesel(date(2003, 11, 2), 0, female=False)
+    assert pesel.startswith("033102")
+    assert is_valid_pesel(pesel)
+    assert not is_valid_pesel(pesel[:10] + str((int(pesel[10]) + 1) % 10))
+    assert not is_valid_pesel("90023101244")  # 31 lutego
+
+
+def test_scale_counts():
+    """
+    Testuje nazwy skal i liczność tabel wyliczaną z liczby wizyt.
+    """
+    assert resolve_scale("100k") == 100_000
+    assert resolve_scale("2500") == 2500
+    with pytest.raises(ValueError):
+        resolve_scale("duża")
+
+    counts = get_scale_counts(1_000_000)
+    assert counts["patients"] == 100_000
+    assert counts["rooms"] == 100
+
+
+# +-+-+-+- Testy generowanych danych +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_generated_data_is_consistent(setup_database):
+    """
+    Testuje spójność danych: klucze obce, poprawne numery PESEL, rezerwacje bez nakładania się
+    i osobną rezerwację dla każdej wizyty i spotkania.
+    """
+    db_controller, report = setup_database
+    connection = db_controller.connection
+
+    assert report["foreign_key_violations"] == []
+    assert connection.execute("SELECT COUNT(*) FROM appointments").fetchone()[0] == APPOINTMENTS
+    assert all(is_valid_pesel(row[0]) for row in connection.execute("SELECT pesel FROM patients"))
+
+    overlapping = connection.execute("""
+        SELECT COUNT(*)
+        FROM room_reservations a
+        JOIN room_reservations b ON b.fk_room_id = a.fk_room_id AND b.reservation_id > a.reservation_id
+        WHERE a.start_ts < b.end_ts AND b.start_ts < a.end_ts
+    """).fetchone()[0]
+    assert overlapping == 0
+
+    shared = connection.execute("""
+        SELECT COUNT(*) FROM (
+            SELECT fk_reservation_id FROM appointments
+            UNION ALL
+            SELECT fk_reservation_id FROM internal_meetings
+        )
+        GROUP BY fk_reservation_id
+        HAVING COUNT(*) > 1
+    """).fetchall()
+    assert shared == []
+
+    mismatched = connection.execute("""
+        SELECT COUNT(*)
+        FROM appointments a
+        JOIN room_reservations r ON r.reservation_id = a.fk_reservation_id
+        WHERE a.appointment_date != r.reservation_date || ' ' || r.reservation_time
+    """).fetchone()[0]
+    assert mismatched == 0
+
+
+def test_generation_is_deterministic(setup_database):
+    """
+    Testuje, czy te same parametry dają identyczne dane, a inne ziarno - inne.
+    """
+    db_controller, _ = setup_database
+    same_controller, _ = create_generated_database(seed=7)
+    other_controller, _ = create_generated_database(seed=8)
+    query = "SELECT * FROM appointments JOIN assigned_patients ON assignment_id = fk_assignment_id ORDER BY appointment_id"
+
+    try:
+        rows = [tuple(row) for row in db_controller.connection.execute(query)]
+        assert rows == [tuple(row) for row in same_controller.connection.execute(query)]
+        assert rows != [tuple(row) for row in other_controller.connection.execute(query)]
+    finally:
+        same_controller.close_connection()
+        other_controller.close_connection()
+
+
+# +-+-+-+- Testy pakietu benchmarków +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_service_benchmarks_run(setup_database):
+    """
+    Testuje wykonanie wszystkich benchmarków serwisów na wygenerowanej bazie.
+    """
+    db_controller, report = setup_database
+
+    results = run_service_benchmarks(db_controller, report["reference_date"], repeat=1)
+
+    assert results["RoomService.table_get_all_appointments"]["rows"] == APPOINTMENTS
+    assert results["RoomService.get_appointments_in_range"]["rows"] > 0
+    assert all(result["median_ms"] >= 0 for result in results.values())
+
+
+def test_compare_results():
+    """
+    Testuje wykrywanie regresji względem wyników bazowych (próg względny i bezwzględny).
+    """
+    baseline = {"appointments": 1000, "seed": 1, "results": {
+        "slow": {"median_ms": 10.0}, "fast": {"median_ms": 0.1}, "stable": {"median_ms": 50.0},
+    }}
+    report = {"appointments": 1000, "seed": 1, "results": {
+        "slow": {"median_ms": 20.0}, "fast": {"median_ms": 0.5}, "stable": {"median_ms": 55.0}, "new": {"median_ms": 1.0},
+    }}
+
+    regressions = compare_results(report, baseline)
+
+    assert [regression["name"] for regression in regressions] == ["slow"]
+    assert regressions[0]["change"] == 1.0
+    with pytest.raises(ValueError):
+        compare_results(dict(report, seed=2), baseline)
@@ -0,0 +1,67 @@
+# test_database_templates.py
+
+import os
+import pytest
+from controllers.patients_controller import PatientController
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+
+# +-+-+-+- Testy szablonów baz danych +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_empty_template_has_full_schema(clone_database):
+    """
+    Testuje, czy szablon "empty" zawiera wszystkie tabele aplikacji, kolumny czasu i indeksy, ale bez danych.
+    """
+    db_controller = clone_database("empty")
+
+    for table_name in ("appointments", "patients", "role_permissions", "patient_forms", "users_accounts"):
+        assert db_controller.table_exists(table_name)
+    columns = [row[1] for row in db_controller.connection.execute("PRAGMA table_info(room_reservations)")]
+    assert "start_ts" in columns
+    assert db_controller.connection.execute("SELECT COUNT(*) FROM patients").fetchone()[0] == 0
+    assert db_controller.schema_catalog.get_columns("patients")
+
+
+def test_clones_are_independent(clone_database, database_templates):
+    """
+    Testuje, czy zmiany w kopii nie trafiają do szablonu ani do innych kopii.
+    """
+    first = clone_database("small_clinic")
+    second = clone_database("small_clinic")
+    query = "SELECT COUNT(*) FROM prescriptions"
+    template = database_templates.get_template("small_clinic")
+    prescriptions = template.connection.execute(query).fetchone()[0]
+
+    with first.connection:
+        first.connection.execute("DELETE FROM prescriptions")
+
+    assert prescriptions > 0
+    assert first.connection.execute(query).fetchone()[0] == 0
+    assert second.connection.execute(query).fetchone()[0] == prescriptions
+    assert template.connection.execute(query).fetchone()[0] == prescriptions
+
+
+def test_clone_works_with_controllers(clone_database):
+    """
+    Testuje operacje kontrolera na kopii szablonu z danymi (klucze obce są włączone).
+    """
+    db_controller = clone_database("small_clinic")
+    patients_controller = PatientController(db_controller)
+
+    assert db_controller.connection.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    assert db_controller.connection.execute("PRAGMA foreign_key_check").fetchall() == []
+    patient = patients_controller.add_patient(
+        "Jan", "Kowalski", "90052101248", "999888777", "jan.kowalski@example.com", "Adres", "1990-05-21"
+    )
+    assert patients_controller.get_patient_by_id(patient["patient_id"])["pesel"] == "90052101248"
+
+
+def test_unknown_template(database_templates):
+    """
+    Testuje błąd dla nieznanej nazwy szablonu.
+    """
+    with pytest.raises(ValueError):
+        database_templates.clone("ogromna_placowka")
@@ -0,0 +1,164 @@
+# test_database_time_columns.py
+
+import os
+from types import SimpleNamespace
+import pytest
+from controllers.database_controller import DatabaseController
+from database.indexes import IndexManager, find_full_scans
+from database.time_columns import TIME_COLUMN_TABLES, TimeColumnsManager, day_range_ts, epoch_minutes, format_ts
+from services.room_service import RoomService
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "database", "schema_projekt_inz_used_v2.sql"
+)
+
+
+@pytest.fixture(name="setup_database")
+def setup_database_fixture():
+    """
+    Tworzy testową bazę danych w pamięci ze schematem v2, dwoma pokojami, trzema rezerwacjami i wizytami.
+    """
+    db_controller = DatabaseController()
+    db_controller.connect_to_database()
+    connection = db_controller.connection
+    with open(SCHEMA_PATH, encoding="utf-8") as schema_file:
+        connection.executescript(schema_file.read())
+
+    connection.executescript("""
+        INSERT INTO room_types (room_type_id, room_type) VALUES (1, 'Gabinet');
+        INSERT INTO rooms (room_id, room_number, floor, fk_room_type_id) VALUES (1, 10, 1, 1), (2, 11, 1, 1);
+        INSERT INTO room_reservations (reservation_id, fk_room_id, reservation_date, reservation_time)
+        VALUES (1, 1, '2030-01-07', '09:00-10:00'),
+               (2, 2, '2030-01-07', '23:00-24:00'),
+               (3, 1, '2030-01-08', '08:30-09:15');
+        INSERT INTO employees (employee_id, first_name, last_name, email, phone, profession, is_medical_staff)
+        VALUES (1, 'Anna', 'Nowak', 'anna@example.com', '500000001', 'Psychiatra', 1),
+               (2, 'Adam', 'Inny', 'adam@example.com', '500000002', 'Psycholog kliniczny', 1);
+        INSERT INTO patients (patient_id, first_name, last_name, pesel, phone, email, date_of_birth)
+        VALUES (1, 'Jan', 'Kowalski', '90010100001', '600000001', 'jan@example.com', '1990-01-01');
+        INSERT INTO assigned_patients (assignment_id, fk_patient_id, fk_employee_id) VALUES (1, 1, 1), (2, 1, 2);
+        INSERT INTO appointments (appointment_id, fk_assignment_id, fk_reservation_id, appointment_date, appointment_status)
+        VALUES (1, 1, 1, '2030-01-07 09:00-10:00', 'Zaplanowana'),
+               (2, 2, 3, '2030-01-08 08:30-09:15', 'Zaplanowana'),
+               (3, 1, NULL, '2030-01-09 12:00-13:00', 'Zaplanowana');
+    """)
+
+    yield db_controller
+
+    db_controller.close_connection()
+
+
+def get_time_columns(db_controller, table_name, key_column, key):
+    """
+    Zwraca (start_ts, end_ts) wiersza tabeli.
+    """
+    row = db_controller.connection.execute(
+        f"SELECT start_ts, end_ts FROM {table_name} WHERE {key_column} = ?", (key,)
+    ).fetchone()
+    return tuple(row)
+
+
+# +-+-+-+- Testy wyzwalaczy i migracji +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_triggers_fill_time_columns(setup_database):
+    """
+    Testuje wyliczenie start_ts / end_ts przy wstawianiu i po zmianie daty lub godziny.
+    """
+    assert get_time_columns(setup_database, "room_reservations", "reservation_id", 2) == (
+        epoch_minutes("2030-01-07", "23:00"), epoch_minutes("2030-01-08")
+    )
+    assert get_time_columns(setup_database, "appointments", "appointment_id", 1) == (
+        epoch_minutes("2030-01-07", "09:00"), epoch_minutes("2030-01-07", "10:00")
+    )
+
+    setup_database.connection.execute("UPDATE room_reservations SET reservation_time = '11:00-12:30' WHERE reservation_id = 1")
+    setup_database.connection.execute("UPDATE appointments SET appointment_date = '2030-02-01 15:00-16:00' WHERE appointment_id = 1")
+
+    assert get_time_columns(setup_database, "room_reservations", "reservation_id", 1) == (
+        epoch_minutes("2030-01-07", "11:00"), epoch_minutes("2030-01-07", "12:30")
+    )
+    assert format_ts(get_time_columns(setup_database, "appointments", "appointment_id", 1)[0]) == "2030-02-01 15:00"
+
+
+def test_apply_migrates_existing_database(setup_database):
+    """
+    Testuje dodanie kolumn i wyzwalaczy do bazy sprzed migracji oraz wyliczenie wartości istniejących wierszy.
+    """
+    connection = setup_database.connection
+    for table_name in TIME_COLUMN_TABLES:
+        connection.execute(f"DROP TRIGGER {table_name}_time_columns_on_insert")
+        connection.execute(f"DROP TRIGGER {table_name}_time_columns_on_update")
+    for index_name in IndexManager(setup_database).get_managed_indexes():
+        if "start_ts" in index_name:
+            connection.execute(f"DROP INDEX {index_name}")
+    connection.execute("ALTER TABLE appointments DROP COLUMN start_ts")
+    connection.execute("ALTER TABLE appointments DROP COLUMN end_ts")
+    connection.execute("UPDATE room_reservations SET start_ts = NULL, end_ts = NULL")
+
+    manager = TimeColumnsManager(setup_database)
+    report = manager.apply()
+
+    assert report["added_columns"] == ["appointments.start_ts", "appointments.end_ts"]
+    assert len(report["created_triggers"]) == 4
+    assert report["backfilled"] == {"appointments": 3, "room_reservations": 3}
+    assert get_time_columns(setup_database, "room_reservations", "reservation_id", 3) == (
+        epoch_minutes("2030-01-08", "08:30"), epoch_minutes("2030-01-08", "09:15")
+    )
+
+    # Ponowne zastosowanie nie zmienia bazy
+    assert manager.apply() == {"added_columns": [], "created_triggers": [], "backfilled": {}, "skipped": []}
+
+
+def test_day_range_ts():
+    """
+    Testuje zakres minut obejmujący całe dni i odrzucenie nieprawidłowego zakresu.
+    """
+    assert day_range_ts("2030-01-07") == (epoch_minutes("2030-01-07"), epoch_minutes("2030-01-08"))
+    assert day_range_ts("2030-01-07", "2030-01-08") == (epoch_minutes("2030-01-07"), epoch_minutes("2030-01-09"))
+    with pytest.raises(ValueError):
+        day_range_ts("2030-01-08", "2030-01-06")
+    with pytest.raises(ValueError):
+        day_range_ts("07-01-2030")
+
+
+# +-+-+-+- Testy zapytań o zakres dat +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_room_service_range_queries(setup_database):
+    """
+    Testuje pobieranie rezerwacji i wizyt z zakresu dni (z filtrem pokoju i pracownika).
+    """
+    room_service = RoomService(SimpleNamespace(db_controller=setup_database))
+
+    reservations = room_service.get_reservations_in_range("2030-01-07")
+    assert [reservation["reservation_id"] for reservation in reservations] == [1, 2]
+    reservations = room_service.get_reservations_in_range("2030-01-07", "2030-01-08", room_id=1)
+    assert [reservation["reservation_id"] for reservation in reservations] == [1, 3]
+
+    appointments = room_service.get_appointments_in_range("2030-01-07", "2030-01-09")
+    assert [appointment["appointment_id"] for appointment in appointments] == [1, 2, 3]
+    appointments = room_service.get_appointments_in_range("2030-01-08", "2030-01-09", employee_id=1)
+    assert [appointment["appointment_id"] for appointment in appointments] == [3]
+
+
+@pytest.mark.parametrize("query, params", [
+    ("SELECT reservation_id FROM room_reservations WHERE start_ts >= ? AND start_ts < ?", (0, 1440)),
+    ("SELECT reservation_id FROM room_reservations WHERE fk_room_id = ? AND start_ts >= ? AND start_ts < ?", (1, 0, 1440)),
+    ("SELECT appointment_id FROM appointments WHERE start_ts >= ? AND start_ts < ? ORDER BY start_ts", (0, 1440)),
+    (
+        "SELECT a.appointment_id FROM assigned_patients ap JOIN appointments a ON a.fk_assignment_id = ap.assignment_id "
+        "WHERE ap.fk_employee_id = ? AND a.start_ts >= ? ORDER BY a.start_ts LIMIT 5",
+        (1, 0),
+    ),
+])
+def test_range_queries_use_indexes(setup_database, query, params):
+    """
+    Testuje, czy zapytania o zakres start_ts korzystają z indeksów zamiast pełnego skanu tabeli.
+    """
+    plan = IndexManager(setup_database).explain_query_plan(query, params)
+
+    assert find_full_scans(plan) == [], f"Zapytanie wykonuje pełny skan tabeli: {plan}"
@@ -0,0 +1,105 @@
+# test_gui_backend_bridge.py
+
+import os
+import pytest
+
+QtCore = pytest.importorskip("PySide6.QtCore")
+
+from controllers.main_controller import MainController # pylint: disable=C0413
+from gui.backend_bridge import BackendBridge # pylint: disable=C0413
+from gui.bridge_worker import BridgeWorker # pylint: disable=C0413
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "database", "schema_projekt_inz_used_v2.sql"
+)
+
+
+@pytest.fixture(name="application")
+def application_fixture():
+    """
+    Zwraca instancję `QCoreApplication` wymaganą przez obiekty Qt.
+    """
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+
+@pytest.fixture(name="setup_bridge")
+def setup_bridge_fixture(application): # pylint: disable=unused-argument
+    """
+    Tworzy `BackendBridge` (synchroniczny wątek roboczy) ze schematem v2 i danymi: użytkownik 1
+    (rola 3 - pacjenci przypisani) z przypisanym pacjentem 1 i użytkownik 2 (rola 1 - wszyscy pacjenci).
+    Lista pacjentów mostka zawiera pacjentów 1 i 2.
+    """
+    main_controller = MainController()
+    main_controller.db_controller.connect_to_database()
+    connection = main_controller.db_controller.connection
+    with open(SCHEMA_PATH, encoding="utf-8") as schema_file:
+        connection.executescript(schema_file.read())
+    connection.executescript("""
+        INSERT INTO roles (role_id, role_name) VALUES (1, 'Administrator'), (3, 'Psychiatra');
+        INSERT INTO employees (employee_id, first_name, last_name, email, phone, profession, is_medical_staff)
+        VALUES (1, 'Anna', 'Nowak', 'anna@example.com', '500000001', 'Psychiatra', 1),
+               (2, 'Adam', 'Admin', 'adam@example.com', '500000002', 'Informatyk', 0);
+        INSERT INTO users_accounts (user_id, employee_id, role_id, username, password_hash, is_active, created_at)
+        VALUES (1, 1, 3, 'anna.nowak', 'hash', 1, '2025-01-01 10:00'),
+               (2, 2, 1, 'admin', 'hash', 1, '2025-01-01 10:00');
+        INSERT INTO patients (patient_id, first_name, last_name, pesel, phone, email, date_of_birth)
+        VALUES (1, 'Jan', 'Kowalski', '90010100001', '600000001', 'jan@example.com', '1990-01-01'),
+               (2, 'Ewa', 'Zielinska', '90010100002', '600000002', 'ewa@example.com', '1990-01-01');
+        INSERT INTO assigned_patients (assignment_id, fk_patient_id, fk_employee_id) VALUES (1, 1, 1);
+    """)
+
+    bridge = BackendBridge(main_controller, worker=BridgeWorker(main_controller, synchronous=True))
+    bridge.get_patients_model().set_rows([
+        dict(row) for row in connection.execute("SELECT * FROM patients ORDER BY patient_id").fetchall()
+    ])
+
+    yield bridge
+
+    main_controller.db_controller.close_connection()
+
+
+def first_names(bridge):
+    """
+    Zwraca imiona pacjentów z modelu listy pacjentów mostka.
+    """
+    return [row["first_name"] for row in bridge.get_patients_model().toList()]
+
+
+# +-+-+-+- Testy edycji pacjentów +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+@pytest.mark.parametrize("user_id", [1, 2])
+def test_update_patient_refreshes_row(setup_bridge, user_id):
+    """
+    Testuje odświeżenie wiersza modelu listy pacjentów po edycji - w zakresie pacjentów przypisanych
+    (rola 3) i wszystkich pacjentów (rola 1).
+    """
+    bridge = setup_bridge
+    bridge._logged_in_user_id = user_id # pylint: disable=protected-access
+    updated, failures = [], []
+    bridge.patientUpdatedSuccessfully.connect(lambda: updated.append(True))
+    bridge.patientAdditionFailed.connect(failures.append)
+
+    bridge.updatePatient(1, "Janusz", "", "", "", "", "", "", "")
+
+    assert failures == []
+    assert updated == [True]
+    assert first_names(bridge) == ["Janusz", "Ewa"]
+
+
+def test_update_patient_checks_assignment(setup_bridge):
+    """
+    Testuje odrzucenie edycji pacjenta nieprzypisanego do pracownika (zakres pacjentów przypisanych).
+    """
+    bridge = setup_bridge
+    bridge._logged_in_user_id = 1 # pylint: disable=protected-access
+    failures = []
+    bridge.patientAdditionFailed.connect(failures.append)
+
+    bridge.updatePatient(2, "Ewelina", "", "", "", "", "", "", "")
+
+    assert len(failures) == 1 and "nie jest przypisany" in failures[0]
+    assert first_names(bridge) == ["Jan", "Ewa"]
@@ -0,0 +1,179 @@
+# test_gui_bridge_worker.py
+
+import os
+import threading
+import time
+import pytest
+
+QtCore = pytest.importorskip("PySide6.QtCore")
+
+from controllers.main_controller import MainController # pylint: disable=C0413
+from gui.bridge_worker import BridgeWorker # pylint: disable=C0413
+from models.rooms import Rooms # pylint: disable=C0413
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "database", "schema_projekt_inz_used_v2.sql"
+)
+
+
+@pytest.fixture(name="application")
+def application_fixture():
+    """
+    Zwraca instancję `QCoreApplication` (sygnały z wątku roboczego są dostarczane przez pętlę zdarzeń).
+    """
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+
+@pytest.fixture(name="setup_controller")
+def setup_controller_fixture(tmp_path):
+    """
+    Tworzy `MainController` z bazą w pliku (wątek roboczy otrzymuje własne połączenie),
+    schematem v2 i pokojem room_id = 1 (numer 11).
+    """
+    main_controller = MainController()
+    main_controller.db_controller.database_path = str(tmp_path / "worker.db")
+    main_controller.db_controller.connect_to_database()
+    connection = main_controller.db_controller.connection
+    with open(SCHEMA_PATH, encoding="utf-8") as schema_file:
+        connection.executescript(schema_file.read())
+    connection.executescript("""
+        INSERT INTO room_types (room_type_id, room_type) VALUES (1, 'Gabinet');
+        INSERT INTO rooms (room_id, room_number, floor, fk_room_type_id) VALUES (1, 11, 1, 1);
+    """)
+
+    yield main_controller
+
+    main_controller.db_controller.close_connection()
+
+
+def wait_for(application, condition, timeout=5.0):
+    """
+    Przetwarza zdarzenia Qt, dopóki warunek nie zostanie spełniony lub nie minie limit czasu.
+    """
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        application.processEvents()
+        time.sleep(0.01)
+    return condition()
+
+
+# +-+-+-+- Testy dostarczania wyników +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_failure_is_delivered_to_callback(application, setup_controller):
+    """
+    Testuje przekazanie wyjątku zadania do `on_failure` w wątku GUI (tryb wątku roboczego i synchroniczny).
+    """
+    for synchronous in (False, True):
+        worker = BridgeWorker(setup_controller, synchronous=synchronous)
+        errors, results = [], []
+
+        def task(_main_controller):
+            raise ValueError("Błąd zadania")
+
+        worker.run("patients", task, on_success=results.append, on_failure=errors.append)
+
+        assert wait_for(application, lambda: errors)
+        assert results == []
+        assert str(errors[0]) == "Błąd zadania"
+        worker.shutdown()
+
+
+def test_stale_result_is_dropped(application, setup_controller):
+    """
+    Testuje odrzucenie wyniku żądania zastąpionego nowszym żądaniem o tej samej nazwie
+    oraz pominięcie żądania zastąpionego przed uruchomieniem.
+    """
+    worker = BridgeWorker(setup_controller, synchronous=False)
+    started, release = threading.Event(), threading.Event()
+    executed, results = [], []
+
+    def slow_task(_main_controller, value):
+        started.set()
+        release.wait(5)
+        executed.append(value)
+        return value
+
+    def task(_main_controller, value):
+        executed.append(value)
+        return value
+
+    worker.run("rooms", slow_task, (1,), on_success=results.append)
+    assert started.wait(5)
+    worker.run("rooms", task, (2,), on_success=results.append)
+    worker.run("rooms", task, (3,), on_success=results.append)  # Zastępuje żądanie 2 przed jego uruchomieniem
+    release.set()
+
+    assert wait_for(application, lambda: results)
+    worker.shutdown()
+    application.processEvents()
+
+    assert results == [3]
+    assert executed == [1, 3]
+
+
+# +-+-+-+- Testy współdzielenia kontrolera +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_worker_shares_controller_caches(application, setup_controller):
+    """
+    Testuje, czy zapis w wątku roboczym (własne połączenie) unieważnia pamięć podręczną odczytywaną w wątku GUI.
+    """
+    main_controller = setup_controller
+    db_controller = main_controller.db_controller
+    worker = BridgeWorker(main_controller, synchronous=False)
+    assert db_controller.reference_cache.get_row("rooms", 1)["room_number"] == 11
+
+    results = []
+
+    def task(task_controller):
+        Rooms(task_controller.db_controller).update_room_by_ids(1, {"room_number": 99})
+        return task_controller, task_controller.db_controller.connection
+
+    worker.run("rooms", task, on_success=results.append)
+    assert wait_for(application, lambda: results)
+    task_controller, task_connection = results[0]
+
+    assert task_controller is main_controller
+    assert task_connection is not db_controller.connection
+    assert db_controller.reference_cache.get_row("rooms", 1)["room_number"] == 99
+    worker.shutdown()
+
+
+def test_worker_session_is_shared(application, setup_controller):
+    """
+    Testuje, czy kontekst sesji utworzony (logowanie) i unieważniony (edycja użytkownika) w wątku roboczym
+    jest widoczny w jedynym `SessionService` używanym przez wątek GUI.
+    """
+    main_controller = setup_controller
+    main_controller.db_controller.connection.executescript("""
+        INSERT INTO roles (role_id, role_name) VALUES (1, 'Administrator'), (3, 'Psychiatra');
+        INSERT INTO employees (employee_id, first_name, last_name, email, phone, profession, is_medical_staff)
+        VALUES (1, 'Anna', 'Nowak', 'anna@example.com', '500000001', 'Psychiatra', 1);
+        INSERT INTO users_accounts (user_id, employee_id, role_id, username, password_hash, is_active, created_at)
+        VALUES (1, 1, 3, 'anna.nowak', 'hash', 1, '2025-01-01 10:00');
+    """)
+    worker = BridgeWorker(main_controller, synchronous=False)
+    results = []
+
+    def login_task(task_controller):
+        # Odpowiednik `MainController.login_user` po uwierzytelnieniu (bez bcrypt)
+        return task_controller.session_service.start_session({"user_id": 1, "permissions": []})
+
+    worker.run("login", login_task, on_success=results.append)
+    assert wait_for(application, lambda: results)
+    assert main_controller.session_service.get_session(1) is results[0]
+
+    def update_user_task(task_controller):
+        task_controller.db_controller.connection.execute("UPDATE users_accounts SET role_id = 1 WHERE user_id = 1")
+        task_controller.db_controller.connection.commit()
+        task_controller.session_service.invalidate_user(1)
+        return True
+
+    worker.run("updateUser", update_user_task, on_success=results.append)
+    assert wait_for(application, lambda: len(results) == 2)
+    assert main_controller.session_service.get_session(1).role_id == 1
+    worker.shutdown()
@@ -0,0 +1,145 @@
+# test_gui_entity_list_model.py
+
+import os
+import pytest
+
+QtCore = pytest.importorskip("PySide6.QtCore")
+
+from gui.entity_list_model import EntityListModel # pylint: disable=C0413
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+FIELDS = ("room_id", "room_number", "room_type")
+
+
+@pytest.fixture(name="application")
+def application_fixture():
+    """
+    Zwraca instancję `QCoreApplication` wymaganą przez obiekty Qt.
+    """
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+
+@pytest.fixture(name="setup_model")
+def setup_model_fixture(application): # pylint: disable=unused-argument
+    """
+    Tworzy model pokoi z trzema wierszami oraz listę rejestrującą emitowane sygnały modelu.
+    """
+    model = EntityListModel("room_id", FIELDS)
+    model.set_rows([
+        {"room_id": 1, "room_number": 10, "room_type": "Gabinet"},
+        {"room_id": 2, "room_number": 11, "room_type": None},
+        {"room_id": 3, "room_number": 12, "room_type": "Sala"},
+    ])
+
+    signals = []
+    model.rowsInserted.connect(lambda _parent, first, last: signals.append(("inserted", first, last)))
+    model.rowsRemoved.connect(lambda _parent, first, last: signals.append(("removed", first, last)))
+    model.rowsMoved.connect(
+        lambda _parent, start, _end, _destination, row: signals.append(("moved", start, row))
+    )
+    model.dataChanged.connect(
+        lambda top_left, _bottom_right, roles: signals.append(("changed", top_left.row(), sorted(roles)))
+    )
+    model.modelReset.connect(lambda: signals.append(("reset",)))
+    model.countChanged.connect(lambda: signals.append(("count", model.rowCount())))
+    return model, signals
+
+
+def role_of(model, field):
+    """
+    Zwraca numer roli modelu dla nazwy pola.
+    """
+    return {name.decode("utf-8"): role for role, name in model.roleNames().items()}[field]
+
+
+def keys(model):
+    """
+    Zwraca klucze wierszy modelu w kolejności wyświetlania.
+    """
+    return [row["room_id"] for row in model.toList()]
+
+
+# +-+-+-+- Testy interfejsu modelu +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_role_names_and_data(setup_model):
+    """
+    Testuje role odpowiadające nazwom pól, liczbę wierszy oraz zastępowanie wartości None tekstem zastępczym.
+    """
+    model, _ = setup_model
+
+    assert sorted(name.decode("utf-8") for name in model.roleNames().values()) == sorted(FIELDS)
+    assert model.rowCount() == model.count == 3
+    assert model.rowCount(model.index(0, 0)) == 0  # Lista nie ma wierszy podrzędnych
+
+    assert model.data(model.index(0, 0), role_of(model, "room_number")) == 10
+    assert model.data(model.index(1, 0), role_of(model, "room_type")) == "Brak danych"
+    assert model.data(model.index(5, 0), role_of(model, "room_number")) is None
+    assert model.data(model.index(0, 0), QtCore.Qt.DisplayRole) is None
+    assert model.get(2)["room_type"] == "Sala"
+    assert model.get(7) == {}
+
+
+# +-+-+-+- Testy zmian na poziomie wierszy +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_upsert_and_remove_emit_row_signals(setup_model):
+    """
+    Testuje sygnały pojedynczego wiersza: aktualizacja (tylko zmienione role), wstawienie i usunięcie.
+    """
+    model, signals = setup_model
+
+    assert model.upsert_row({"room_id": 2, "room_number": 21, "room_type": None})
+    assert not model.upsert_row({"room_id": 2, "room_number": 21, "room_type": None})  # Bez zmian
+    assert model.upsert_row({"room_id": 4, "room_number": 13, "room_type": "Gabinet"})
+    assert model.remove_key(1)
+    assert not model.remove_key(99)
+
+    assert signals == [
+        ("changed", 1, [role_of(model, "room_number")]),
+        ("inserted", 3, 3),
+        ("count", 4),
+        ("removed", 0, 0),
+        ("count", 3),
+    ]
+    assert keys(model) == [2, 3, 4]
+    assert model.contains_key(4) and not model.contains_key(1)
+
+
+def test_set_rows_applies_differences(setup_model):
+    """
+    Testuje, czy `set_rows` stosuje tylko różnice: usunięcie, przeniesienie, wstawienie i aktualizację
+    zmienionego wiersza - bez resetu modelu.
+    """
+    model, signals = setup_model
+
+    model.set_rows([
+        {"room_id": 3, "room_number": 12, "room_type": "Sala"},
+        {"room_id": 5, "room_number": 14, "room_type": "Gabinet"},
+        {"room_id": 6, "room_number": 15, "room_type": "Gabinet"},
+        {"room_id": 2, "room_number": 11, "room_type": "Sala"},
+    ])
+
+    assert signals == [
+        ("removed", 0, 0),
+        ("moved", 1, 0),
+        ("inserted", 1, 2),
+        ("changed", 3, [role_of(model, "room_type")]),
+        ("count", 4),
+    ]
+    assert keys(model) == [3, 5, 6, 2]
+    assert model.get(3)["room_type"] == "Sala"
+
+    signals.clear()
+    model.append_rows([
+        {"room_id": 6, "room_number": 16, "room_type": "Gabinet"},
+        {"room_id": 7, "room_number": 17, "room_type": "Sala"},
+    ])
+    assert signals == [("changed", 2, [role_of(model, "room_number")]), ("inserted", 4, 4), ("count", 5)]
+
+    signals.clear()
+    model.clear()
+    model.clear()
+    assert signals == [("reset",), ("count", 0)]
@@ -260,3 +260,81 @@ def test_advanced_filter_patients_invalid_key(setup_database):
     # Próba filtrowania za pomocą nieobsługiwanego kryterium
     with pytest.raises(ValueError, match="Nieobsługiwane kryterium filtrowania: invalid_key"):
         patients.advanced_filter_patients(invalid_key="test")
+
+
+# +-+-+-+- Testy paginacji listy pacjentów +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def add_test_patients(patients, count):
+    """
+    Dodaje `count` pacjentów testowych o imionach "Anna", "Bartosz", ... i kolejnych numerach PESEL.
+    """
+    names = ["Anna", "Bartosz", "Celina", "Dawid", "Ewa"]
+    for index in range(count):
+        patients.add_patient(
+            first_name=names[index % len(names)],
+            last_name="Nowak",
+            pesel=f"900101{index:05d}",
+            phone=f"600{index:06d}",
+            email=f"pacjent{index}@example.com",
+            address="Kraków, ul. Testowa 1",
+            date_of_birth="1990-01-01"
+        )
+
+
+def test_get_patients_page_keyset_pagination(setup_database):
+    """
+    Test pobierania pacjentów kolejnymi stronami po `patient_id`.
+    """
+    patients = setup_database
+    add_test_patients(patients, 7)
+
+    first_page = patients.get_patients_page(limit=3)
+    second_page = patients.get_patients_page(after_patient_id=first_page[-1]["patient_id"], limit=3)
+    last_page = patients.get_patients_page(after_patient_id=second_page[-1]["patient_id"], limit=3)
+
+    assert [p["patient_id"] for p in first_page] == [1, 2, 3]
+    assert [p["patient_id"] for p in second_page] == [4, 5, 6]
+    assert [p["patient_id"] for p in last_page] == [7]
+    assert set(first_page[0].keys()) == set(patients.get_all_patients_details()[0].keys())
+
+
+def test_get_patients_page_search_text(setup_database):
+    """
+    Test filtrowania strony pacjentów po fragmencie imienia i numeru PESEL.
+    """
+    patients = setup_database
+    add_test_patients(patients, 10)
+
+    result = patients.get_patients_page(search_text="ann")
+    assert [p["patient_id"] for p in result] == [1, 6]
+
+    result = patients.get_patients_page(search_text="90010100003")
+    assert [p["patient_id"] for p in result] == [4]
+
+    # Znaki specjalne LIKE nie działają jak symbole wieloznaczne
+    assert patients.get_patients_page(search_text="%") == []
+
+
+def test_get_patients_page_assigned_to_employee(setup_database):
+    """
+    Test pobierania strony pacjentów przypisanych do pracownika (assigned_patients JOIN patients).
+    """
+    patients = setup_database
+    add_test_patients(patients, 6)
+    connection = patients.db_controller.connection
+    connection.execute(
+        "CREATE TABLE assigned_patients ("
+        "assignment_id INTEGER PRIMARY KEY AUTOINCREMENT, fk_employee_id INTEGER, fk_patient_id INTEGER)"
+    )
+    connection.executemany(
+        "INSERT INTO assigned_patients (fk_employee_id, fk_patient_id) VALUES (?, ?)",
+        [(1, 5), (1, 2), (2, 3), (1, 4)]
+    )
+
+    first_page = patients.get_patients_page(fk_employee_id=1, limit=2)
+    second_page = patients.get_patients_page(fk_employee_id=1, after_patient_id=first_page[-1]["patient_id"], limit=2)
+
+    assert [p["patient_id"] for p in first_page] == [2, 4]
+    assert [p["patient_id"] for p in second_page] == [5]
+    assert patients.get_patients_page(fk_employee_id=3) == []
@@ -0,0 +1,158 @@
+# test_service_dashboard.py
+
+import os
+from datetime import date, timedelta
+import pytest
+from controllers.database_controller import DatabaseController
+from services.dashboard_service import DashboardService
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "database", "schema_projekt_inz_used_v2.sql"
+)
+
+TODAY = date.today().strftime("%Y-%m-%d")
+TOMORROW = (date.today() + timedelta(days=1)).strftime("%Y-%m-%d")
+YESTERDAY = (date.today() - timedelta(days=1)).strftime("%Y-%m-%d")
+
+
+@pytest.fixture(name="setup_database")
+def setup_database_fixture():
+    """
+    Tworzy testową bazę danych w pamięci ze schematem v2 i danymi jednego pracownika.
+
+    Pracownik o employee_id = 2 ma konto user_id = 1 (ID celowo różne), dwóch przypisanych
+    pacjentów, cztery wizyty (wczoraj, dziś x2, jutro) i dwa spotkania (wczoraj, jutro).
+    """
+    db_controller = DatabaseController()
+    db_controller.connect_to_database()
+    connection = db_controller.connection
+    with open(SCHEMA_PATH, encoding="utf-8") as schema_file:
+        connection.executescript(schema_file.read())
+
+    connection.executescript(f"""
+        INSERT INTO roles (role_id, role_name) VALUES (3, 'Psychiatra');
+        INSERT INTO employees (employee_id, first_name, last_name, email, phone, profession, is_medical_staff)
+        VALUES (1, 'Adam', 'Inny', 'adam@example.com', '500000001', 'Psycholog kliniczny', 1),
+               (2, 'anna', 'nowak', 'anna@example.com', '500000002', 'Psychiatra', 1);
+        INSERT INTO users_accounts (user_id, employee_id, role_id, username, password_hash, is_active, created_at)
+        VALUES (1, 2, 3, 'anna.nowak', 'hash', 1, '2025-01-01 10:00');
+        INSERT INTO specialties (specialty_id, specialty_name) VALUES (1, 'Psychiatria'), (2, 'Psychoterapia');
+        INSERT INTO employee_specialties (employee_id, specialty_id) VALUES (2, 2), (2, 1);
+        INSERT INTO patients (patient_id, first_name, last_name, pesel, phone, email, date_of_birth)
+        VALUES (1, 'Jan', 'Kowalski', '90010100001', '600000001', 'jan@example.com', '1990-01-01'),
+               (2, 'Ewa', 'Zielinska', '90010100002', '600000002', 'ewa@example.com', '1990-01-01');
+        INSERT INTO assigned_patients (assignment_id, fk_patient_id, fk_employee_id)
+        VALUES (1, 1, 2), (2, 2, 2), (3, 2, 1);
+        INSERT INTO room_types (room_type_id, room_type) VALUES (1, 'Gabinet');
+        INSERT INTO rooms (room_id, room_number, floor, fk_room_type_id) VALUES (1, 12, 1, 1);
+        INSERT INTO room_reservations (reservation_id, fk_room_id, reservation_date, reservation_time)
+        VALUES (1, 1, '{TODAY}', '09:00-10:00');
+        INSERT INTO appointments (fk_assignment_id, fk_reservation_id, appointment_date, appointment_status)
+        VALUES (1, NULL, '{YESTERDAY} 09:00-10:00', 'Zrealizowana'),
+               (2, NULL, '{TODAY} 12:00-13:00', 'Zaplanowana'),
+               (1, 1, '{TODAY} 09:00-10:00', 'Zaplanowana'),
+               (2, NULL, '{TOMORROW} 09:00-10:00', 'Zaplanowana'),
+               (3, NULL, '{TODAY} 11:00-12:00', 'Zaplanowana');
+        INSERT INTO meeting_types (meeting_type_id, meeting_type) VALUES (1, 'Superwizja');
+        INSERT INTO internal_meetings (meeting_id, fk_meeting_type_id, fk_reservation_id, meeting_date, internal_meeting_status)
+        VALUES (1, 1, NULL, '{YESTERDAY} 14:00-15:00', 'Zrealizowana'),
+               (2, 1, 1, '{TOMORROW} 14:00-15:00', 'Zaplanowana');
+        INSERT INTO meeting_participants (fk_meeting_id, fk_employee_id, participant_role, attendance)
+        VALUES (1, 2, 'Uczestnik', 'Obecny'), (2, 2, 'Organizator', 'Obecny');
+    """)
+
+    yield db_controller
+
+    db_controller.close_connection()
+
+
+# +-+-+-+- Testy migawki dashboardu +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_get_snapshot_returns_dashboard_data(setup_database):
+    """
+    Testuje, czy migawka zawiera dane pracownika powiązanego z kontem (a nie pracownika o ID = user_id).
+    """
+    snapshot = DashboardService(None, setup_database).get_snapshot(1)
+
+    assert snapshot["employee_id"] == 2
+    assert snapshot["role_id"] == 3
+    assert snapshot["formatted_username"] == "Anna Nowak"
+    assert snapshot["role_name"] == "Psychiatra"
+    assert snapshot["specialties"] == ["Psychoterapia", "Psychiatria"]
+    assert snapshot["date"] == TODAY
+    assert snapshot["todays_appointments_count"] == 2
+    assert snapshot["appointments_count"] == 4
+
+
+def test_get_snapshot_upcoming_appointments_and_meetings(setup_database):
+    """
+    Testuje kolejność, limit i dane pokoju najbliższych wizyt i spotkań.
+    """
+    snapshot = DashboardService(None, setup_database).get_snapshot(1, limit=2)
+
+    assert snapshot["upcoming_appointments"] == [
+        {"appointment_date": f"{TODAY} 09:00-10:00", "patient_name": "Jan Kowalski", "room_number": 12},
+        {"appointment_date": f"{TODAY} 12:00-13:00", "patient_name": "Ewa Zielinska", "room_number": "Brak pokoju"},
+    ]
+    assert snapshot["meetings"] == [
+        {"meeting_date": f"{TOMORROW} 14:00-15:00", "meeting_type": "Superwizja", "room_number": 12},
+    ]
+
+
+def test_get_snapshot_uses_fixed_number_of_queries(setup_database):
+    """
+    Testuje, czy liczba zapytań nie zależy od liczby wizyt i spotkań pracownika.
+    """
+    db_controller = setup_database
+    service = DashboardService(None, db_controller)
+    statements = []
+    db_controller.connection.set_trace_callback(statements.append)
+
+    service.get_snapshot(1)
+    queries_before = len(statements)
+
+    db_controller.connection.executemany(
+        "INSERT INTO appointments (fk_assignment_id, appointment_date, appointment_status) VALUES (?, ?, 'Zaplanowana')",
+        [(1, f"{TOMORROW} {hour:02d}:00-{hour:02d}:30") for hour in range(10, 20)]
+    )
+    statements.clear()
+    service.get_snapshot(1)
+
+    db_controller.connection.set_trace_callback(None)
+    assert len(statements) == queries_before
+
+
+def test_get_snapshot_unknown_user(setup_database):
+    """
+    Testuje zgłoszenie błędu dla nieistniejącego użytkownika.
+    """
+    with pytest.raises(ValueError, match="Nie znaleziono użytkownika"):
+        DashboardService(None, setup_database).get_snapshot(99)
+
+
+# +-+-+-+- Testy liczników wizyt +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_appointment_counters_read_single_row(setup_database):
+    """
+    Testuje, czy liczniki wizyt pracownika są odczytem jednego wiersza tabel liczników.
+    """
+    db_controller = setup_database
+    service = DashboardService(None, db_controller)
+    statements = []
+    db_controller.connection.set_trace_callback(statements.append)
+
+    todays_count = service.get_todays_appointment_count_by_employee_id(2)
+    tomorrows_count = service.get_todays_appointment_count_by_employee_id(2, date_offset=1)
+    count_text = service.get_appointment_count_by_employee_id(2)
+
+    db_controller.connection.set_trace_callback(None)
+    assert (todays_count, tomorrows_count) == (2, 1)
+    assert count_text == "Liczba przypisanych wizyt: 4"
+    assert len(statements) == 3
+    assert all("appointments a" not in statement for statement in statements)
+    assert service.get_appointment_count_by_employee_id(99) == "Brak przypisanych wizyt."
@@ -0,0 +1,81 @@
+# test_service_patients.py
+
+import os
+from types import SimpleNamespace
+import pytest
+from controllers.database_controller import DatabaseController
+from models.permissions import Permissions
+from models.role_permissions import RolePermissions
+from services.patients_service import PatientsService
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "database", "schema_projekt_inz_used_v2.sql"
+)
+
+
+@pytest.fixture(name="setup_database")
+def setup_database_fixture():
+    """
+    Tworzy testową bazę danych w pamięci ze schematem v2, tabelami uprawnień i danymi:
+    pracownik 1 (rola 3 - Psychiatra), pracownik 2 (rola 4 - Psycholog kliniczny) i pracownik 3
+    (rola 1 - Administrator, recepty całej placówki), po jednej wizycie.
+    """
+    db_controller = DatabaseController()
+    db_controller.connect_to_database()
+    connection = db_controller.connection
+    with open(SCHEMA_PATH, encoding="utf-8") as schema_file:
+        connection.executescript(schema_file.read())
+    Permissions(db_controller).create_table()
+    RolePermissions(db_controller).create_table()
+
+    connection.executescript("""
+        INSERT INTO roles (role_id, role_name) VALUES (1, 'Administrator'), (3, 'Psychiatra'), (4, 'Psycholog kliniczny');
+        INSERT INTO employees (employee_id, first_name, last_name, email, phone, profession, is_medical_staff)
+        VALUES (1, 'Anna', 'Nowak', 'anna@example.com', '500000001', 'Psychiatra', 1),
+               (2, 'Adam', 'Inny', 'adam@example.com', '500000002', 'Psycholog kliniczny', 1),
+               (3, 'Ewa', 'Admin', 'ewa@example.com', '500000003', 'Informatyk', 0);
+        INSERT INTO users_accounts (user_id, employee_id, role_id, username, password_hash, is_active, created_at)
+        VALUES (1, 1, 3, 'anna.nowak', 'hash', 1, '2025-01-01 10:00'),
+               (2, 2, 4, 'adam.inny', 'hash', 1, '2025-01-01 10:00'),
+               (3, 3, 1, 'ewa.admin', 'hash', 1, '2025-01-01 10:00');
+        INSERT INTO patients (patient_id, first_name, last_name, pesel, phone, email, date_of_birth)
+        VALUES (1, 'Jan', 'Kowalski', '90010100001', '600000001', 'jan@example.com', '1990-01-01');
+        INSERT INTO assigned_patients (assignment_id, fk_patient_id, fk_employee_id) VALUES (1, 1, 1), (2, 1, 2), (3, 1, 3);
+        INSERT INTO appointments (appointment_id, fk_assignment_id, appointment_date, appointment_status)
+        VALUES (1, 1, '2030-01-07 09:00-10:00', 'Zaplanowana'),
+               (2, 2, '2030-01-08 09:00-10:00', 'Zaplanowana'),
+               (3, 3, '2030-01-09 09:00-10:00', 'Zaplanowana');
+        INSERT INTO system_permissions (permission_id, permission_name)
+        VALUES (1, 'przegladaj_recepty'), (2, 'zarzadzaj_receptami'), (3, 'edytuj_przypisanych_pacjentow');
+    """)
+
+    yield db_controller
+
+    db_controller.close_connection()
+
+
+# +-+-+-+- Testy wizyt pracowników wystawiających recepty +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_prescriber_appointments_follow_permissions(setup_database):
+    """
+    Testuje wybór wizyt według uprawnienia do wystawiania recept (reguła ("issue", "prescriptions"))
+    zamiast stałego role_id = 3 - role zarządzające receptami całej placówki nie wystawiają recept.
+    """
+    service = PatientsService(SimpleNamespace(db_controller=setup_database))
+
+    # Uprawnienia domyślne - recepty wystawia tylko rola 3 (jak dotychczasowe role_id = 3), bez roli 1
+    assert service.get_appointment_id_by_user_id() == [1]
+
+    # Rola 4 otrzymuje uprawnienie do recept w tabeli `role_permissions`
+    role_permissions = RolePermissions(setup_database)
+    for permission_id in (1, 2, 3):
+        role_permissions.add_role_permission_by_ids(4, permission_id)
+    assert service.get_appointment_id_by_user_id() == [1, 2]
+
+    # Rola 3 skonfigurowana w tabeli bez uprawnień do recept
+    role_permissions.add_role_permission_by_ids(3, 3)
+    assert service.get_appointment_id_by_user_id() == [2]
@@ -0,0 +1,107 @@
+# test_service_search.py
+
+import os
+from types import SimpleNamespace
+import pytest
+from services.search_service import SNIPPET_END, SNIPPET_START, SearchService
+from services.session_service import SessionService
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+
+@pytest.fixture(name="setup_search")
+def setup_search_fixture(clone_database):
+    """
+    Tworzy bazę z pełnym schematem (szablon "empty", indeksy FTS5 i wyzwalacze) oraz danymi:
+    user_id = 1 - administrator (dostęp do wszystkich pacjentów),
+    user_id = 2 - psychiatra (employee_id = 2) z jednym przypisanym pacjentem (Jan Kowalski).
+    """
+    db_controller = clone_database("empty")
+    db_controller.connection.executescript("""
+        INSERT INTO roles (role_id, role_name) VALUES (1, 'Administrator'), (3, 'Psychiatra');
+        INSERT INTO employees (employee_id, first_name, last_name, email, phone, profession, is_medical_staff)
+        VALUES (1, 'Adam', 'Admin', 'adam@example.com', '500000001', 'Informatyk', 0),
+               (2, 'Anna', 'Lekarz', 'anna@example.com', '500000002', 'Psychiatra', 1);
+        INSERT INTO users_accounts (user_id, employee_id, role_id, username, password_hash, is_active, created_at)
+        VALUES (1, 1, 1, 'admin', 'hash', 1, '2025-01-01 10:00'),
+               (2, 2, 3, 'anna.lekarz', 'hash', 1, '2025-01-01 10:00');
+        INSERT INTO patients (patient_id, first_name, last_name, pesel, phone, email, date_of_birth)
+        VALUES (1, 'Jan', 'Kowalski', '90010100001', '600000001', 'jan@example.com', '1990-01-01'),
+               (2, 'Jakub', 'Kowalczyk', '85051500002', '600000002', 'jakub@example.com', '1985-05-15');
+        INSERT INTO assigned_patients (assignment_id, fk_patient_id, fk_employee_id) VALUES (1, 1, 2), (2, 2, 1);
+        INSERT INTO appointments (appointment_id, fk_assignment_id, appointment_date, appointment_status, notes)
+        VALUES (1, 1, '2025-02-03 10:00-11:00', 'Zrealizowana', 'Pacjent zgłasza bezsenność od dwóch tygodni'),
+               (2, 2, '2025-02-04 10:00-11:00', 'Zrealizowana', 'Kontrola po zmianie leczenia');
+        INSERT INTO diagnoses (fk_appointment_id, description, icd11_code)
+        VALUES (1, 'Zaburzenia snu', '7A00'), (2, 'Epizod depresyjny', '6A70.1');
+        INSERT INTO prescriptions (fk_appointment_id, medicine_name, dosage, medicine_price, prescription_code)
+        VALUES (1, 'Melatonina', 3, 20, '1234'), (2, 'Sertralina', 50, 35, '5678');
+        INSERT INTO meeting_types (meeting_type_id, meeting_type) VALUES (1, 'Superwizja');
+        INSERT INTO internal_meetings (meeting_id, fk_meeting_type_id, meeting_date, notes, internal_meeting_status)
+        VALUES (1, 1, '2025-02-05 12:00-13:00', 'Omówienie leczenia bezsenności', 'Zrealizowana');
+        INSERT INTO meeting_participants (fk_meeting_id, fk_employee_id, participant_role, attendance)
+        VALUES (1, 1, 'Organizator', 'Obecny');
+    """)
+    main_controller = SimpleNamespace(db_controller=db_controller, session_service=SessionService(db_controller))
+
+    yield SearchService(main_controller)
+
+
+# +-+-+-+- Testy wyszukiwania +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_search_patients_by_prefix(setup_search):
+    """
+    Testuje wyszukiwanie pacjentów po prefiksach nazwiska i PESEL-u.
+    """
+    search_service = setup_search
+
+    results = search_service.search(1, "kowal")
+    assert sorted(patient["patient_id"] for patient in results["patients"]) == [1, 2]
+
+    results = search_service.search(1, "Kowal 8505")
+    assert [patient["patient_id"] for patient in results["patients"]] == [2]
+
+
+def test_search_respects_row_scope(setup_search):
+    """
+    Testuje, czy psychiatra widzi tylko dane przypisanego pacjenta, a administrator - wszystkie.
+    """
+    search_service = setup_search
+
+    staff_results = search_service.search(2, "kowal")
+    assert [patient["patient_id"] for patient in staff_results["patients"]] == [1]
+
+    assert [d["patient_id"] for d in search_service.search(2, "epizod")["diagnoses"]] == []
+    assert [d["patient_id"] for d in search_service.search(1, "epizod")["diagnoses"]] == [2]
+    assert [p["prescription_id"] for p in search_service.search(2, "sertr")["prescriptions"]] == []
+
+    # Nieznany użytkownik nie widzi niczego
+    assert search_service.search(99, "kowal")["patients"] == []
+
+
+def test_search_diagnoses_prescriptions_and_notes(setup_search):
+    """
+    Testuje wyszukiwanie po kodzie ICD-11, nazwie leku oraz w notatkach wizyt i spotkań.
+    """
+    search_service = setup_search
+
+    assert [d["icd11_code"] for d in search_service.search(1, "6A70.1")["diagnoses"]] == ["6A70.1"]
+    assert [p["medicine_name"] for p in search_service.search(2, "melat")["prescriptions"]] == ["Melatonina"]
+
+    notes = search_service.search(1, "bezsen")["notes"]
+    assert sorted(note["source"] for note in notes) == ["appointment", "meeting"]
+    assert all(SNIPPET_START in note["snippet"] and SNIPPET_END in note["snippet"] for note in notes)
+
+    # Psychiatra nie uczestniczył w spotkaniu
+    assert [note["source"] for note in search_service.search(2, "bezsen")["notes"]] == ["appointment"]
+
+
+def test_search_empty_text(setup_search):
+    """
+    Testuje pusty wynik dla tekstu bez słów.
+    """
+    results = setup_search.search(1, "  ")
+
+    assert results == {"query": "  ", "patients": [], "diagnoses": [], "prescriptions": [], "notes": []}
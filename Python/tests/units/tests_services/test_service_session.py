@@ -0,0 +1,148 @@
+# test_service_session.py
+
+import os
+import pytest
+from controllers.database_controller import DatabaseController
+from models.permissions import Permissions
+from models.role_permissions import RolePermissions
+from services.session_service import SessionService
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "database", "schema_projekt_inz_used_v2.sql"
+)
+
+
+@pytest.fixture(name="setup_database")
+def setup_database_fixture():
+    """
+    Tworzy testową bazę danych w pamięci ze schematem v2, tabelami uprawnień i dwoma użytkownikami.
+
+    Użytkownik user_id = 1 (pracownik employee_id = 2, rola 3) ma dwie specjalizacje,
+    dwóch przypisanych pacjentów i dwa uprawnienia; user_id = 2 to administrator bez pracy klinicznej.
+    """
+    db_controller = DatabaseController()
+    db_controller.connect_to_database()
+    connection = db_controller.connection
+    with open(SCHEMA_PATH, encoding="utf-8") as schema_file:
+        connection.executescript(schema_file.read())
+    Permissions(db_controller).create_table()
+    RolePermissions(db_controller).create_table()
+
+    connection.executescript("""
+        INSERT INTO roles (role_id, role_name) VALUES (1, 'Administrator'), (3, 'Psychiatra');
+        INSERT INTO employees (employee_id, first_name, last_name, email, phone, profession, is_medical_staff)
+        VALUES (1, 'Adam', 'Inny', 'adam@example.com', '500000001', 'Psycholog kliniczny', 1),
+               (2, 'Anna', 'Nowak', 'anna@example.com', '500000002', 'Psychiatra', 1);
+        INSERT INTO users_accounts (user_id, employee_id, role_id, username, password_hash, is_active, created_at)
+        VALUES (1, 2, 3, 'anna.nowak', 'hash', 1, '2025-01-01 10:00'),
+               (2, 1, 1, 'admin', 'hash', 1, '2025-01-01 10:00');
+        INSERT INTO specialties (specialty_id, specialty_name) VALUES (1, 'Psychiatria'), (2, 'Psychoterapia');
+        INSERT INTO employee_specialties (employee_id, specialty_id) VALUES (2, 2), (2, 1);
+        INSERT INTO patients (patient_id, first_name, last_name, pesel, phone, email, date_of_birth)
+        VALUES (1, 'Jan', 'Kowalski', '90010100001', '600000001', 'jan@example.com', '1990-01-01'),
+               (2, 'Ewa', 'Zielinska', '90010100002', '600000002', 'ewa@example.com', '1990-01-01'),
+               (3, 'Piotr', 'Lis', '90010100003', '600000003', 'piotr@example.com', '1990-01-01');
+        INSERT INTO assigned_patients (fk_patient_id, fk_employee_id) VALUES (1, 2), (2, 2), (3, 1);
+        INSERT INTO system_permissions (permission_id, permission_name)
+        VALUES (1, 'przegladaj_przypisanych_pacjentow'), (2, 'zarzadzaj_swoimi_wizytami'), (3, 'zarzadzaj_pracownikami');
+        INSERT INTO role_permissions (role_id, permission_id) VALUES (3, 1), (3, 2), (1, 3);
+    """)
+
+    yield db_controller
+
+    db_controller.close_connection()
+
+
+# +-+-+-+- Testy kontekstu sesji +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_get_session_loads_user_context(setup_database):
+    """
+    Testuje wczytanie roli, pracownika, specjalizacji, przypisanych pacjentów i uprawnień użytkownika.
+    """
+    session = SessionService(setup_database).get_session(1)
+
+    assert (session.user_id, session.username, session.employee_id) == (1, "anna.nowak", 2)
+    assert (session.role_id, session.role_name) == (3, "Psychiatra")
+    assert session.specialties == ("Psychoterapia", "Psychiatria")
+    assert session.is_assigned_patient(2)
+    assert not session.is_assigned_patient(3)
+    assert session.has_permission("zarzadzaj_swoimi_wizytami")
+    assert not session.has_permission("zarzadzaj_pracownikami")
+
+
+def test_session_is_immutable(setup_database):
+    """
+    Testuje, czy kontekstu sesji nie można zmodyfikować.
+    """
+    session = SessionService(setup_database).get_session(1)
+
+    with pytest.raises(AttributeError):
+        session.role_id = 1
+    with pytest.raises(AttributeError):
+        del session.employee_id
+
+
+def test_get_session_is_cached_until_invalidated(setup_database):
+    """
+    Testuje, czy kontekst jest zwracany z pamięci bez zapytań, a po unieważnieniu wczytywany ponownie.
+    """
+    session_service = SessionService(setup_database)
+    session = session_service.get_session(1)
+
+    setup_database.connection.execute("UPDATE users_accounts SET role_id = 1 WHERE user_id = 1")
+    assert session_service.get_session(1) is session
+
+    session_service.invalidate_user(1)
+    assert session_service.get_session(1).role_id == 1
+
+
+def test_targeted_invalidation(setup_database):
+    """
+    Testuje, czy unieważniane są wyłącznie konteksty, których dotyczy zmiana.
+    """
+    session_service = SessionService(setup_database)
+    user_session = session_service.get_session(1)
+    admin_session = session_service.get_session(2)
+
+    session_service.invalidate_employee(2)
+    assert session_service.get_session(1) is not user_session
+    assert session_service.get_session(2) is admin_session
+
+    admin_session = session_service.get_session(2)
+    user_session = session_service.get_session(1)
+    session_service.invalidate_role(1)
+    session_service.invalidate_specialty("Psychoterapia")
+    assert session_service.get_session(2) is not admin_session
+    assert session_service.get_session(1) is not user_session
+
+
+def test_start_session_uses_login_permissions(setup_database):
+    """
+    Testuje, czy kontekst tworzony przy logowaniu używa uprawnień pobranych przez `LoginController`.
+    """
+    session_service = SessionService(setup_database)
+    session = session_service.start_session({"user_id": 1, "permissions": ["przegladaj_przypisanych_pacjentow"]})
+
+    assert session.permissions == frozenset({"przegladaj_przypisanych_pacjentow"})
+    assert session_service.get_session(1) is session
+
+    with pytest.raises(ValueError):
+        session_service.get_session(99)
+    with pytest.raises(ValueError):
+        session_service.get_session(None)
+
+
+def test_session_without_permission_tables(setup_database):
+    """
+    Testuje wczytanie kontekstu w bazie bez tabel uprawnień (schemat v2) - pusta lista uprawnień zamiast błędu.
+    """
+    setup_database.connection.executescript("DROP TABLE role_permissions; DROP TABLE system_permissions;")
+
+    session = SessionService(setup_database).get_session(1)
+
+    assert session.role_id == 3
+    assert session.permissions == frozenset()
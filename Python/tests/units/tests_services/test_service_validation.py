@@ -0,0 +1,159 @@
+# test_service_validation.py
+
+import os
+from types import SimpleNamespace
+import pytest
+from controllers.database_controller import DatabaseController
+from services.validation_service import ExistsProbe, ValidationService
+
+# Ustawienie środowiska testowego
+os.environ["APP_ENV"] = "test"
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "database", "schema_projekt_inz_used_v2.sql"
+)
+
+
+@pytest.fixture(name="setup_database")
+def setup_database_fixture():
+    """
+    Tworzy testową bazę danych w pamięci ze schematem v2, pokojami, rezerwacjami i jedną wizytą.
+    """
+    db_controller = DatabaseController()
+    db_controller.connect_to_database()
+    connection = db_controller.connection
+    with open(SCHEMA_PATH, encoding="utf-8") as schema_file:
+        connection.executescript(schema_file.read())
+
+    connection.executescript("""
+        INSERT INTO room_types (room_type_id, room_type) VALUES (1, 'Gabinet'), (2, 'Sala');
+        INSERT INTO rooms (room_id, room_number, floor, fk_room_type_id) VALUES (1, 10, 1, 1), (2, 11, 1, 2);
+        INSERT INTO room_reservations (reservation_id, fk_room_id, reservation_date, reservation_time)
+        VALUES (1, 1, '2030-01-07', '09:00-10:00'), (2, 2, '2030-01-07', '09:00-10:00');
+        INSERT INTO employees (employee_id, first_name, last_name, email, phone, profession, is_medical_staff)
+        VALUES (1, 'Anna', 'Nowak', 'anna@example.com', '500000001', 'Psychiatra', 1);
+        INSERT INTO patients (patient_id, first_name, last_name, pesel, phone, email, date_of_birth)
+        VALUES (1, 'Jan', 'Kowalski', '90010100001', '600000001', 'jan@example.com', '1990-01-01');
+        INSERT INTO assigned_patients (assignment_id, fk_patient_id, fk_employee_id) VALUES (1, 1, 1);
+        INSERT INTO appointments (fk_assignment_id, fk_reservation_id, appointment_date, appointment_status)
+        VALUES (1, 1, '2030-01-07 09:00-10:00', 'Zaplanowana');
+    """)
+
+    yield db_controller
+
+    db_controller.close_connection()
+
+
+@pytest.fixture(name="validation_service")
+def validation_service_fixture(setup_database):
+    """
+    Tworzy serwis walidacji korzystający z testowej bazy danych.
+    """
+    return ValidationService(SimpleNamespace(db_controller=setup_database))
+
+
+# +-+-+-+- Testy sprawdzania istnienia +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_exists_and_exists_where(validation_service):
+    """
+    Testuje sprawdzanie istnienia rekordu po jednej kolumnie i po kilku kolumnach.
+    """
+    assert validation_service.exists("rooms", "room_id", 1)
+    assert not validation_service.exists("rooms", "room_id", 99)
+    assert validation_service.exists_where("assigned_patients", {"assignment_id": 1, "fk_employee_id": 1})
+    assert not validation_service.exists_where("assigned_patients", {"assignment_id": 1, "fk_employee_id": 2})
+
+
+def test_is_unique_ignores_case_and_excluded_record(validation_service):
+    """
+    Testuje unikalność z uwzględnieniem COLLATE NOCASE kolumny i pominięciem aktualizowanego rekordu.
+    """
+    assert not validation_service.is_unique("room_types", "room_type", "GABINET")
+    assert validation_service.is_unique("room_types", "room_type", "Poczekalnia")
+    assert validation_service.is_unique("room_types", "room_type", "Gabinet", exclude=("room_type_id", 1))
+    assert not validation_service.is_unique("room_types", "room_type", "Gabinet", exclude=("room_type_id", 2))
+
+
+def test_get_referencing_tables(validation_service):
+    """
+    Testuje wyszukiwanie tabel, w których rezerwacja jest używana.
+    """
+    references = [("appointments", "fk_reservation_id"), ("internal_meetings", "fk_reservation_id")]
+
+    assert validation_service.get_referencing_tables(1, references) == ["appointments"]
+    assert not validation_service.is_referenced(2, references)
+
+
+def test_check_runs_single_query(setup_database, validation_service):
+    """
+    Testuje, czy kilka sprawdzeń jest wykonywanych jednym zapytaniem.
+    """
+    # Wczytanie katalogu schematu przed śledzeniem zapytań
+    validation_service.exists("rooms", "room_id", 1)
+    statements = []
+    setup_database.connection.set_trace_callback(statements.append)
+
+    results = validation_service.check(
+        ExistsProbe("rooms", {"room_number": 10}),
+        ExistsProbe("room_types", {"room_type_id": 3}),
+        ExistsProbe("appointments", {"fk_reservation_id": 2}),
+    )
+
+    setup_database.connection.set_trace_callback(None)
+    assert results == [True, False, False]
+    assert len(statements) == 1
+
+
+def test_invalid_identifier_is_rejected(validation_service):
+    """
+    Testuje odrzucenie nieistniejącej tabeli lub kolumny (identyfikatory nie trafiają do zapytania).
+    """
+    with pytest.raises(ValueError):
+        validation_service.exists("rooms", "room_id; DROP TABLE rooms", 1)
+    with pytest.raises(ValueError):
+        validation_service.exists("no_such_table", "id", 1)
+
+
+# +-+-+-+- Testy sprawdzania wizyt i recept +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+
+def test_prescriber_appointment_and_prescription(setup_database, validation_service):
+    """
+    Testuje sprawdzenie wizyty pracownika uprawnionego do wystawiania recept (uprawnienia domyślne ról)
+    oraz recepty wystawionej na wizycie pacjenta pracownika - jednym zapytaniem, bez list ID.
+    """
+    connection = setup_database.connection
+    connection.executescript("""
+        INSERT INTO roles (role_id, role_name) VALUES (1, 'Administrator'), (3, 'Psychiatra'), (4, 'Psycholog kliniczny');
+        INSERT INTO employees (employee_id, first_name, last_name, email, phone, profession, is_medical_staff)
+        VALUES (2, 'Adam', 'Inny', 'adam@example.com', '500000002', 'Psycholog kliniczny', 1),
+               (3, 'Ewa', 'Admin', 'ewa@example.com', '500000003', 'Informatyk', 0);
+        INSERT INTO users_accounts (user_id, employee_id, role_id, username, password_hash, is_active, created_at)
+        VALUES (1, 1, 3, 'anna.nowak', 'hash', 1, '2025-01-01 10:00'),
+               (2, 2, 4, 'adam.inny', 'hash', 1, '2025-01-01 10:00'),
+               (3, 3, 1, 'ewa.admin', 'hash', 1, '2025-01-01 10:00');
+        INSERT INTO assigned_patients (assignment_id, fk_patient_id, fk_employee_id) VALUES (2, 1, 2), (3, 1, 3);
+        INSERT INTO appointments (appointment_id, fk_assignment_id, appointment_date, appointment_status)
+        VALUES (2, 2, '2030-01-08 09:00-10:00', 'Zaplanowana'),
+               (3, 3, '2030-01-09 09:00-10:00', 'Zaplanowana');
+        INSERT INTO prescriptions (prescription_id, fk_appointment_id, medicine_name, dosage, medicine_price, prescription_code)
+        VALUES (1, 1, 'Sertralina', 50, 20, '1234');
+    """)
+
+    setup_database.permission_engine.load()  # Uprawnienia ról kompilowane przy starcie aplikacji
+    statements = []
+    connection.set_trace_callback(statements.append)
+    assert validation_service.is_prescriber_appointment(1)
+    connection.set_trace_callback(None)
+    assert len(statements) == 1
+
+    assert validation_service.is_prescriber_appointment(1, employee_id=1)
+    assert not validation_service.is_prescriber_appointment(1, employee_id=2)
+    assert not validation_service.is_prescriber_appointment(2)  # Rola 4 nie wystawia recept
+    assert not validation_service.is_prescriber_appointment(3)  # Rola 1 zarządza receptami, ale ich nie wystawia
+    assert not validation_service.is_prescriber_appointment(99)
+
+    assert validation_service.is_employee_prescription(1, 1)
+    assert not validation_service.is_employee_prescription(1, 2)
+    assert not validation_service.is_employee_prescription(99, 1)